@@ -1,4 +1,4 @@
-import os
+import time
 
 import click
 
@@ -11,29 +11,167 @@ def cli():
 def mm_xing(): ...
 
 @mm_xing.command()
-@click.argument('task', type=click.Choice(['create_pydantic_model', 'create_msgspec_model_for_websocket']))
+@click.argument('task', type=click.Choice(['create_pydantic_model', 'create_msgspec_model_for_rest', 'create_msgspec_model_for_websocket', 'create_feed_layout', 'create_orm_tables']))
 @click.option('--path', default='./res', help='The default xing api res file path.')
-def res_converter(task, path):
+@click.option('--output', default=None, help='Output directory of the generated mm_xing.block/mm_xing.block_struct package (output file for create_msgspec_model_for_websocket and create_orm_tables).')
+@click.option('--workers', default=None, type=int, help='Processes parsing changed .res files (default: CPU count, 1 for serial).')
+@click.option('--no-cache', is_flag=True, default=False, help='Re-parse every .res file instead of reusing cached specs.')
+@click.option('--tr-code', 'tr_codes', multiple=True, help='create_orm_tables: TR code or OutBlock name to add a table for, repeatable.')
+@click.option('--drop', 'drop', multiple=True, help='create_orm_tables: TR code or OutBlock name to drop the table of, repeatable.')
+@click.option('--key', 'keys', multiple=True, help='create_orm_tables: natural key of a block, repeatable, e.g. t8412OutBlock1=date,time.')
+@click.option('--message', default=None, help='create_orm_tables: Alembic revision message.')
+def res_converter(task, path, output, workers, no_cache, tr_codes, drop, keys, message):
     """Perform tasks related to res conversion."""
-    from mm_xing.res_converter import (create_msgspec_model_for_websocket,
-                                       create_pydantic_model,
-                                       create_res_file_mapping, parse_res)
+    from mm_xing.constant import XING_RES_CACHE_PATH
+    from mm_xing.res_converter import (create_feed_layout,
+                                       create_msgspec_model_for_rest,
+                                       create_msgspec_model_for_websocket,
+                                       create_orm_tables, create_pydantic_model,
+                                       load_res_infos)
 
-    res_file_paths = [
-        os.path.join(path, file_name)
-        for file_name in os.listdir(path)
-        if os.path.isfile(os.path.join(path, file_name)) and "_" not in file_name
-    ]
-    res_rows = [parse_res(path) for path in res_file_paths]
-    res_map = create_res_file_mapping(res_rows)
-
-    res_code = sorted(res_map.keys())
-    res_infos = [res_map[name] for name in res_code]
+    start = time.perf_counter()
+    res_infos, parsed = load_res_infos(path, cache_path=None if no_cache else XING_RES_CACHE_PATH, workers=workers)
+    print(f"{len(res_infos)} TR specs ({parsed} parsed, {len(res_infos) - parsed} cached) in {time.perf_counter() - start:.2f}s")
 
     if task == "create_pydantic_model":
-        create_pydantic_model(res_infos=res_infos)
+        if output:
+            written = create_pydantic_model(res_infos=res_infos, output_dir=output)
+        else:
+            written = create_pydantic_model(res_infos=res_infos)
+    elif task == "create_msgspec_model_for_rest":
+        if output:
+            written = create_msgspec_model_for_rest(res_infos=res_infos, output_dir=output)
+        else:
+            written = create_msgspec_model_for_rest(res_infos=res_infos)
     elif task == "create_msgspec_model_for_websocket":
-        create_msgspec_model_for_websocket(res_infos=res_infos)
+        if output:
+            written = [create_msgspec_model_for_websocket(res_infos=res_infos, output_path=output)]
+        else:
+            written = [create_msgspec_model_for_websocket(res_infos=res_infos)]
+    elif task == "create_feed_layout":
+        if output:
+            written = [create_feed_layout(res_infos=res_infos, output_dir=output)]
+        else:
+            written = [create_feed_layout(res_infos=res_infos)]
+    elif task == "create_orm_tables":
+        natural_keys = {block: tuple(columns.split(",")) for block, columns in (key.split("=", 1) for key in keys)}
+        options = dict(names=list(tr_codes), drop=list(drop), natural_keys=natural_keys, message=message)
+        if output:
+            written = create_orm_tables(res_infos=res_infos, output_path=output, **options)
+        else:
+            written = create_orm_tables(res_infos=res_infos, **options)
+    written = [path for path in written if path]
+    for written_path in written:
+        print(f"  wrote {written_path}")
+    print(f"{len(written)} file(s) written in {time.perf_counter() - start:.2f}s")
+
+@mm_xing.command()
+@click.option('--tr-code', 'tr_codes', multiple=True, help='Master TR code to refresh, repeatable (default: all).')
+@click.option('--dry-run', is_flag=True, default=False, help='Fetch without persisting.')
+def snapshot(tr_codes, dry_run):
+    """Fetch every master TR concurrently and persist today's snapshot."""
+    import asyncio
+
+    from mm_xing.metrics import XING_METRICS
+    from mm_xing.tasks.snapshot import run_snapshot
+
+    start = time.perf_counter()
+    results = asyncio.run(run_snapshot(tr_codes or None, persist=not dry_run))
+    print(f"{'tr_code':<8} {'rows':>6} {'fetch(s)':>9} {'persist(s)':>11}  error")
+    for result in results:
+        print(
+            f"{result.tr_code:<8} {result.rows:>6} {result.fetch_sec:>9.2f} "
+            f"{result.persist_sec:>11.2f}  {result.error or ''}"
+        )
+    print(f"Snapshot of {len(results)} TRs finished in {time.perf_counter() - start:.2f}s")
+    print("\n".join(XING_METRICS.summary_lines()))
+    if any(result.error for result in results):
+        raise SystemExit(1)
+
+@mm_xing.command()
+@click.option('--symbol', 'symbols', multiple=True, help='shcode to backfill, repeatable (default: every t8436 shcode).')
+@click.option('--sdate', default=None, help='Oldest date to fetch, YYYYMMDD (default: 19900101).')
+@click.option('--edate', default=None, help='Newest date to fetch, YYYYMMDD (default: today).')
+@click.option('--concurrency', default=None, type=int, help='Symbols paged at the same time.')
+@click.option('--restart', is_flag=True, default=False, help='Discard checkpoints and start over.')
+def backfill(symbols, sdate, edate, concurrency, restart):
+    """Backfill t8410 daily bars into the bar store, resuming from checkpoints."""
+    import asyncio
+    import logging
+
+    from mm_xing.constant import XING_BACKFILL_CONCURRENCY, XING_BACKFILL_START_DATE
+    from mm_xing.metrics import XING_METRICS
+    from mm_xing.tasks.backfill import run_backfill
+
+    # Progress and failed symbols are reported through mm_xing.tasks.backfill's logger.
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    stats = asyncio.run(run_backfill(
+        symbols or None,
+        sdate=sdate or XING_BACKFILL_START_DATE,
+        edate=edate,
+        concurrency=concurrency or XING_BACKFILL_CONCURRENCY,
+        restart=restart,
+    ))
+    print(f"Backfill finished in {stats.elapsed_sec:.1f}s: {stats.line()}")
+    print("\n".join(XING_METRICS.summary_lines()))
+    if stats.failed:
+        raise SystemExit(1)
+
+@mm_xing.command()
+@click.option('--subscribe', 'subscriptions', multiple=True, required=True, help='TR_CODE:TR_KEY to record, repeatable, e.g. FC0:101V3000.')
+def record(subscriptions):
+    """Record the realtime feed into today's tick log until interrupted."""
+    import asyncio
+
+    from mm_xing.realtime import XingRealtimeClient
+    from mm_xing.tick_log import TickLogWriter
+
+    async def run():
+        client = XingRealtimeClient()
+        for subscription in subscriptions:
+            await client.subscribe(*subscription.split(":", 1))
+        with TickLogWriter() as log:
+            try:
+                async for message in client:
+                    log.append_message(message)
+                    if log.written % 10_000 == 0:
+                        log.flush()
+            finally:
+                print(f"Recorded {log.written:,} messages into {log.directory}")
+                await client.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+@mm_xing.command()
+@click.option('--date', 'day', required=True, help='Session to replay, YYYYMMDD.')
+@click.option('--speed', default=None, type=float, help='Multiple of real time (default: as fast as possible).')
+@click.option('--tr-code', 'tr_codes', multiple=True, help='TR code to replay, repeatable (default: all).')
+@click.option('--tr-key', 'tr_keys', multiple=True, help='tr_key to replay, repeatable (default: all).')
+def replay(day, speed, tr_codes, tr_keys):
+    """Replay a recorded day of the tick log through the tick store, order books and bar aggregator."""
+    import asyncio
+    from datetime import datetime
+
+    from mm_xing.bar_aggregator import BarAggregator
+    from mm_xing.order_book import OrderBookEngine
+    from mm_xing.tick_log import TickLogReplay, run_backtest
+    from mm_xing.tick_store import TickStore
+
+    session_date = datetime.strptime(day, "%Y%m%d").date()
+    ticks = TickStore(session_date=session_date)
+    books = OrderBookEngine()
+    bars = BarAggregator(persist=False, session_date=session_date)
+    source = TickLogReplay(day, speed=speed, tr_codes=tr_codes or None, tr_keys=tr_keys or None)
+
+    start = time.perf_counter()
+    count = asyncio.run(run_backtest(source, [ticks.append_message, books.apply_message, bars.add_message]))
+    bars.close_until(2**62)
+    elapsed = time.perf_counter() - start
+    print(f"Replayed {count:,} messages of {day} in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} messages/sec)")
+    print(f"tick symbols {len(ticks)}, books {len(books.books)} ({books.events:,} top-of-book events), bars {bars.closed:,}")
 
 @cli.group()
 def mm_llm(): ...
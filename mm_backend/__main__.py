@@ -7,15 +7,18 @@ from fastapi.middleware.cors import CORSMiddleware
 from mm_backend.config import settings
 from mm_backend.database.session import init_db
 from mm_backend.routers.api import router
+from mm_xing.tasks.master import close_shared_client
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
-    Initializes the database tables when the application starts up.
+    Initializes the database tables when the application starts up and
+    closes the shared Xing API client on shutdown.
     """
     init_db()
     yield
+    await close_shared_client()
 
 def get_app() -> FastAPI:
     app = FastAPI(lifespan=lifespan)
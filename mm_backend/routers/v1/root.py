@@ -1,8 +1,10 @@
 from datetime import datetime
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 
 from mm_backend.schemas import HealthCheck
+from mm_xing.metrics import XING_METRICS
 
 router = APIRouter(
     prefix="",
@@ -33,3 +35,13 @@ async def health_check() -> HealthCheck:
         status="healthy",
         timestamp=datetime.now()
     )
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Xing 클라이언트 지표 (Prometheus)",
+    description="TR별 호출 지연, 응답 크기, 행 수, rsp_cd별 오류, 호출 제한 대기 시간을 Prometheus 텍스트 형식으로 반환합니다.",
+)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(XING_METRICS.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
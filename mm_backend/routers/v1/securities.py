@@ -1,11 +1,14 @@
-from datetime import datetime
+import asyncio
+from datetime import date, datetime
 from typing import Dict, List, Optional, Type, Union
 from dataclasses import dataclass
 from enum import Enum
 
+import msgspec
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
+from mm_backend.schemas import SecuritySymbol
 from mm_xing.database.models import (
     RountineTaskOrm,
     o3101OutBlockOrm,
@@ -21,6 +24,7 @@ from mm_xing.database.models import (
     t9944OutBlockOrm,
 )
 from mm_xing.database.session import get_db
+from mm_xing.database.writer import upsert_rows
 from mm_xing.block import (
     o3101OutBlock,
     t1764OutBlock,
@@ -32,7 +36,8 @@ from mm_xing.block import (
     t9943OutBlock,
     t9944OutBlock,
 )
-from mm_xing.constant import TR_CODE_TO_TYPE
+from mm_xing.constant import TR_CODE_TO_TYPE, XING_SYMBOL_SEARCH_LIMIT
+from mm_xing.symbol_index import SymbolIndex
 from mm_xing.tasks.master import fetch_market_data, get_data_config, initialize_client
 
 router = APIRouter(prefix="/securities", tags=["securities"])
@@ -151,8 +156,8 @@ async def fetch_code_data(
 ):
     """Fetch market data for a given TR code (Enum-based)."""
 
-    # Convert Enum ➜ str for internal usage
-    tr_code_str = str(tr_code)
+    # Convert Enum ➜ str for internal usage (str() of a str-Enum is "TRCode.t8436" on 3.11+)
+    tr_code_str = tr_code.value
 
     # 오늘 날짜의 시작 시간
     today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -194,9 +199,7 @@ async def fetch_code_data(
                 )
 
             # 데이터 저장
-            db.add_all(
-                [orm_model(**row.model_dump()) for row in data if row is not None]
-            )
+            upsert_rows(db, orm_model, [row for row in data if row is not None])
             db.add(RountineTaskOrm(task_name=tr_code_str, status="done"))
             db.commit()
             return data[:limit]
@@ -204,8 +207,6 @@ async def fetch_code_data(
             db.rollback()
             # {'detail': '"Response does not contain expected outblock data: {\'rsp_cd\': \'00000\', \'rsp_msg\': \'해당자료가 없습니다.\'}"'}
             raise HTTPException(status_code=500, detail=str(e))
-        finally:
-            client.close()
     else:
         # 캐시된 데이터 반환
         orm_model = get_orm_model_for_tr_code(tr_code_str)
@@ -216,7 +217,7 @@ async def fetch_code_data(
         cached_data = (
             db.query(orm_model)
             .filter(
-                orm_model.created_at >= today_start  # type: ignore
+                orm_model.updated_at >= today_start  # type: ignore
             )
             .limit(limit)
             .all()
@@ -224,6 +225,47 @@ async def fetch_code_data(
         return cached_data
 
 
+_symbol_index: Optional[SymbolIndex] = None
+_symbol_index_lock = asyncio.Lock()
+
+
+async def get_symbol_index(db: Session) -> SymbolIndex:
+    """Return the t8436 symbol index, rebuilt from today's rows on the first search of the day."""
+    global _symbol_index
+    if _symbol_index is None or _symbol_index.built_on != date.today():
+        async with _symbol_index_lock:
+            if _symbol_index is None or _symbol_index.built_on != date.today():
+                # Stores today's t8436 rows first if /code has not fetched them yet.
+                await fetch_code_data(tr_code=TRCode.t8436, limit=0, db=db)
+                today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                rows = db.query(t8436OutBlockOrm).filter(t8436OutBlockOrm.updated_at >= today_start).all()
+                _symbol_index = SymbolIndex.from_rows(rows)
+    return _symbol_index
+
+
+@router.get(
+    "/search",
+    response_model=List[SecuritySymbol],
+    summary="Search Securities by Name or Code",
+    description=(
+        "Search the t8436 symbol master by code prefix (shcode/expcode), name prefix "
+        "(an unfinished last syllable matches, e.g. '삼성저') or initial consonants "
+        "(e.g. 'ㅅㅅㅈㅈ'). An empty query lists every symbol. The index is built in "
+        "memory once a day."
+    ),
+)
+async def search_securities(
+    q: str = Query("", description="Code, name or chosung prefix."),
+    limit: int = Query(XING_SYMBOL_SEARCH_LIMIT, ge=1, description="The maximum number of symbols to return."),
+    gubun: Optional[str] = Query(None, description="Market: 1 KOSPI, 2 KOSDAQ."),
+    etfgubun: Optional[str] = Query(None, description="ETF flag: 0 stock, 1 ETF, 2 ETN."),
+    db: Session = Depends(get_db),
+):
+    """Search securities by code, name or chosung prefix."""
+    index = await get_symbol_index(db)
+    return [msgspec.structs.asdict(symbol) for symbol in index.search(q, limit=limit, gubun=gubun, etfgubun=etfgubun)]
+
+
 def get_orm_model_for_tr_code(tr_code: str):
     """Return the ORM model associated with the given TR code."""
     pair = TR_MODEL_REGISTRY.get(tr_code)
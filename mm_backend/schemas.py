@@ -29,3 +29,11 @@ class ChatRequest(BaseModel):
 class ChatCompletionResponse(BaseModel):
     role: RoleEnum
     content: str
+
+class SecuritySymbol(BaseModel):
+    shcode: str
+    hname: str
+    expcode: str
+    gubun: str  # 1: KOSPI, 2: KOSDAQ
+    etfgubun: str  # 1: ETF, 2: ETN
+    spac_gubun: str
@@ -87,7 +87,7 @@ class NaverNewsArticleList(scrapy.Spider):
         yield self._create_next_page_request(meta, current_page)
 
     def _fetch_tickers(self, limit:int = 5000) -> list:
-        response = requests.get(f"http://127.0.0.1:8080/api/securities/code?tr_code=t8436&limit={limit}")
+        response = requests.get(f"http://127.0.0.1:8080/api/securities/search?limit={limit}")
         return [ticker['shcode'] for ticker in response.json() if not ticker['shcode'].endswith('K')]
 
     def _create_request(self, ticker: str) -> scrapy.Request:
@@ -0,0 +1,68 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+# this is the Alembic Config object, which provides
+# access to the values within the .ini file in use.
+config = context.config
+
+# Interpret the config file for Python logging.
+# This line sets up loggers basically.
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# The hand-written tables plus the ones res_converter generates into
+# mm_xing.database.tr_tables (create_orm_tables), which also writes the
+# revisions of the latter into versions/.
+import mm_xing.database.tr_tables  # noqa: F401
+from mm_xing.database.models import Base
+
+target_metadata = Base.metadata
+
+# Same database as mm_xing.database.session; its own version table so it can
+# share a database with the mm_crawler migrations.
+from mm_xing.config import settings
+
+VERSION_TABLE = "alembic_version_xing"
+config.set_section_option(
+    config.config_ini_section, "sqlalchemy.url", str(settings.SQLALCHEMY_DATABASE_URL).replace("%", "%%")
+)
+
+
+def run_migrations_offline() -> None:
+    """Run migrations in 'offline' mode, emitting the SQL instead of executing it."""
+    url = config.get_section_option(config.config_ini_section, "sqlalchemy.url")
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        version_table=VERSION_TABLE,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode against an Engine's connection."""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection, target_metadata=target_metadata, version_table=VERSION_TABLE
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,254 @@
+"""adopt the hand-written xing tables: natural keys, t8401 basecode
+
+Revision ID: fe409de92c67
+Revises: 
+Create Date: 2026-10-18 21:05:12.417380
+
+Databases set up before Alembic managed mm_xing hold these tables as
+``init_db`` (``create_all``) made them: several rows per code (one per
+daily refresh), no ``uq_*`` unique constraints for ``upsert_rows`` to
+conflict on, and ``xing_t8401_outblock.BaseOrmcode`` instead of
+``basecode``. Missing tables are created; existing ones keep the newest row
+(highest id) per natural key, then get the constraint and the rename.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fe409de92c67'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> natural key column (mm_xing.database.models ``__natural_key__``)
+NATURAL_KEYS = {
+    'xing_t1764_outblock': 'tradno',
+    'xing_t8424_outblock': 'upcode',
+    'xing_t8425_outblock': 'tmcode',
+    'xing_t8436_outblock': 'shcode',
+    'xing_t8401_outblock': 'shcode',
+    'xing_t8426_outblock': 'shcode',
+    'xing_t9943V_outblock': 'shcode',
+    'xing_t9943S_outblock': 'shcode',
+    'xing_t9943_outblock': 'shcode',
+    'xing_t9944_outblock': 'shcode',
+    'xing_o3101_outblock': 'Symbol',
+}
+T8401_TABLE = 'xing_t8401_outblock'
+
+
+def _constraint_name(table: str, column: str) -> str:
+    return f'uq_{table}_{column}'
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if context.is_offline_mode():
+        # No database to inspect: emit the SQL for tables as init_db created them.
+        existing = set(NATURAL_KEYS)
+        unique = {table: set() for table in NATURAL_KEYS}
+        t8401_columns = {'BaseOrmcode'}
+    else:
+        inspector = sa.inspect(bind)
+        existing = set(inspector.get_table_names())
+        unique = {
+            table: {constraint['name'] for constraint in inspector.get_unique_constraints(table)}
+            for table in NATURAL_KEYS if table in existing
+        }
+        t8401_columns = (
+            {column['name'] for column in inspector.get_columns(T8401_TABLE)} if T8401_TABLE in existing else set()
+        )
+
+    quote = bind.dialect.identifier_preparer.quote
+    for table, column in NATURAL_KEYS.items():
+        if table not in existing:
+            continue
+        name = _constraint_name(table, column)
+        rename = table == T8401_TABLE and 'BaseOrmcode' in t8401_columns and 'basecode' not in t8401_columns
+        if name in unique[table] and not rename:
+            continue
+        if name not in unique[table]:
+            op.execute(
+                f'DELETE FROM {quote(table)} WHERE id NOT IN '
+                f'(SELECT max(id) FROM {quote(table)} GROUP BY {quote(column)})'
+            )
+        with op.batch_alter_table(table) as batch:
+            if rename:
+                batch.alter_column('BaseOrmcode', new_column_name='basecode')
+            if name not in unique[table]:
+                batch.create_unique_constraint(name, [column])
+
+    if 'routine_tasks' not in existing:
+        op.create_table('routine_tasks',
+        sa.Column('task_name', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'xing_t1764_outblock' not in existing:
+        op.create_table('xing_t1764_outblock',
+        sa.Column('rank', sa.Integer(), nullable=False, comment='순위'),
+        sa.Column('tradno', sa.String(), nullable=False, comment='거래원번호'),
+        sa.Column('tradname', sa.String(), nullable=False, comment='거래원이름'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('tradno', name='uq_xing_t1764_outblock_tradno')
+        )
+    if 'xing_t8424_outblock' not in existing:
+        op.create_table('xing_t8424_outblock',
+        sa.Column('hname', sa.String(), nullable=False, comment='업종명'),
+        sa.Column('upcode', sa.String(), nullable=False, comment='업종코드'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('upcode', name='uq_xing_t8424_outblock_upcode')
+        )
+    if 'xing_t8425_outblock' not in existing:
+        op.create_table('xing_t8425_outblock',
+        sa.Column('tmname', sa.String(), nullable=False, comment='테마명'),
+        sa.Column('tmcode', sa.String(), nullable=False, comment='테마코드'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('tmcode', name='uq_xing_t8425_outblock_tmcode')
+        )
+    if 'xing_t8436_outblock' not in existing:
+        op.create_table('xing_t8436_outblock',
+        sa.Column('hname', sa.String(), nullable=False, comment='종목명'),
+        sa.Column('shcode', sa.String(), nullable=False, comment='단축코드'),
+        sa.Column('expcode', sa.String(), nullable=False, comment='확장코드'),
+        sa.Column('etfgubun', sa.String(), nullable=False, comment='ETF구분(1:ETF2:ETN)'),
+        sa.Column('uplmtprice', sa.Integer(), nullable=False, comment='상한가'),
+        sa.Column('dnlmtprice', sa.Integer(), nullable=False, comment='하한가'),
+        sa.Column('jnilclose', sa.Integer(), nullable=False, comment='전일가'),
+        sa.Column('memedan', sa.String(), nullable=False, comment='주문수량단위'),
+        sa.Column('recprice', sa.Integer(), nullable=False, comment='기준가'),
+        sa.Column('gubun', sa.String(), nullable=False, comment='구분(1:코스피2:코스닥)'),
+        sa.Column('bu12gubun', sa.String(), nullable=False, comment='증권그룹'),
+        sa.Column('spac_gubun', sa.String(), nullable=False, comment='기업인수목적회사여부(Y/N)'),
+        sa.Column('filler', sa.String(), nullable=False, comment='filler(미사용)'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('shcode', name='uq_xing_t8436_outblock_shcode')
+        )
+    if 'xing_t8401_outblock' not in existing:
+        op.create_table('xing_t8401_outblock',
+        sa.Column('hname', sa.String(), nullable=False, comment='종목명'),
+        sa.Column('shcode', sa.String(), nullable=False, comment='단축코드'),
+        sa.Column('expcode', sa.String(), nullable=False, comment='확장코드'),
+        sa.Column('basecode', sa.String(), nullable=False, comment='기초자산코드'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('shcode', name='uq_xing_t8401_outblock_shcode')
+        )
+    if 'xing_t8426_outblock' not in existing:
+        op.create_table('xing_t8426_outblock',
+        sa.Column('hname', sa.String(), nullable=False, comment='종목명'),
+        sa.Column('shcode', sa.String(), nullable=False, comment='단축코드'),
+        sa.Column('expcode', sa.String(), nullable=False, comment='확장코드'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('shcode', name='uq_xing_t8426_outblock_shcode')
+        )
+    if 'xing_t9943V_outblock' not in existing:
+        op.create_table('xing_t9943V_outblock',
+        sa.Column('hname', sa.String(), nullable=False, comment='종목명'),
+        sa.Column('shcode', sa.String(), nullable=False, comment='단축코드'),
+        sa.Column('expcode', sa.String(), nullable=False, comment='확장코드'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('shcode', name='uq_xing_t9943V_outblock_shcode')
+        )
+    if 'xing_t9943S_outblock' not in existing:
+        op.create_table('xing_t9943S_outblock',
+        sa.Column('hname', sa.String(), nullable=False, comment='종목명'),
+        sa.Column('shcode', sa.String(), nullable=False, comment='단축코드'),
+        sa.Column('expcode', sa.String(), nullable=False, comment='확장코드'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('shcode', name='uq_xing_t9943S_outblock_shcode')
+        )
+    if 'xing_t9943_outblock' not in existing:
+        op.create_table('xing_t9943_outblock',
+        sa.Column('hname', sa.String(), nullable=False, comment='종목명'),
+        sa.Column('shcode', sa.String(), nullable=False, comment='단축코드'),
+        sa.Column('expcode', sa.String(), nullable=False, comment='확장코드'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('shcode', name='uq_xing_t9943_outblock_shcode')
+        )
+    if 'xing_t9944_outblock' not in existing:
+        op.create_table('xing_t9944_outblock',
+        sa.Column('hname', sa.String(), nullable=False, comment='종목명'),
+        sa.Column('shcode', sa.String(), nullable=False, comment='단축코드'),
+        sa.Column('expcode', sa.String(), nullable=False, comment='확장코드'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('shcode', name='uq_xing_t9944_outblock_shcode')
+        )
+    if 'xing_o3101_outblock' not in existing:
+        op.create_table('xing_o3101_outblock',
+        sa.Column('Symbol', sa.String(), nullable=False, comment='종목코드'),
+        sa.Column('SymbolNm', sa.String(), nullable=False, comment='종목명'),
+        sa.Column('ApplDate', sa.String(), nullable=False, comment='종목배치수신일(한국일자)'),
+        sa.Column('BscGdsCd', sa.String(), nullable=False, comment='기초상품코드'),
+        sa.Column('BscGdsNm', sa.String(), nullable=False, comment='기초상품명'),
+        sa.Column('ExchCd', sa.String(), nullable=False, comment='거래소코드'),
+        sa.Column('ExchNm', sa.String(), nullable=False, comment='거래소명'),
+        sa.Column('CrncyCd', sa.String(), nullable=False, comment='기준통화코드'),
+        sa.Column('NotaCd', sa.String(), nullable=False, comment='진법구분코드'),
+        sa.Column('UntPrc', sa.Float(), nullable=False, comment='호가단위가격'),
+        sa.Column('MnChgAmt', sa.Float(), nullable=False, comment='최소가격변동금액'),
+        sa.Column('RgltFctr', sa.Float(), nullable=False, comment='가격조정계수'),
+        sa.Column('CtrtPrAmt', sa.Float(), nullable=False, comment='계약당금액'),
+        sa.Column('GdsCd', sa.String(), nullable=False, comment='상품구분코드'),
+        sa.Column('LstngYr', sa.String(), nullable=False, comment='월물(년)'),
+        sa.Column('LstngM', sa.String(), nullable=False, comment='월물(월)'),
+        sa.Column('EcPrc', sa.Float(), nullable=False, comment='정산가격'),
+        sa.Column('DlStrtTm', sa.String(), nullable=False, comment='거래시작시간'),
+        sa.Column('DlEndTm', sa.String(), nullable=False, comment='거래종료시간'),
+        sa.Column('DlPsblCd', sa.String(), nullable=False, comment='거래가능구분코드'),
+        sa.Column('MgnCltCd', sa.String(), nullable=False, comment='증거금징수구분코드'),
+        sa.Column('OpngMgn', sa.Float(), nullable=False, comment='개시증거금'),
+        sa.Column('MntncMgn', sa.Float(), nullable=False, comment='유지증거금'),
+        sa.Column('OpngMgnR', sa.Float(), nullable=False, comment='개시증거금율'),
+        sa.Column('MntncMgnR', sa.Float(), nullable=False, comment='유지증거금율'),
+        sa.Column('DotGb', sa.Integer(), nullable=False, comment='유효소수점자리수'),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('Symbol', name='uq_xing_o3101_outblock_Symbol')
+        )
+
+
+def downgrade() -> None:
+    # The tables themselves predate this revision (init_db) and are kept.
+    for table, column in NATURAL_KEYS.items():
+        with op.batch_alter_table(table) as batch:
+            batch.drop_constraint(_constraint_name(table, column), type_='unique')
+            if table == T8401_TABLE:
+                batch.alter_column('basecode', new_column_name='BaseOrmcode')
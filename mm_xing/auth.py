@@ -1,7 +1,34 @@
-from httpx import Client
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Callable, Optional
 
-from mm_xing.constant import XING_AUTH_URL
-from mm_xing.schemas import XingAuthHeaders, XingAuthParams
+from diskcache import Cache
+from httpx import AsyncClient, Client, Response
+
+from mm_xing.constant import (XING_AUTH_URL, XING_TOKEN_CACHE_DIR,
+                              XING_TOKEN_DEFAULT_TTL_SEC,
+                              XING_TOKEN_LOCK_TIMEOUT_SEC,
+                              XING_TOKEN_REFRESH_MARGIN_FRACTION,
+                              XING_TOKEN_REFRESH_MARGIN_SEC,
+                              XING_TOKEN_RETRY_SEC)
+from mm_xing.schemas import XingAuthHeaders, XingAuthParams, XingToken
+
+logger = logging.getLogger(__name__)
+
+
+class XingTokenRejected(Exception):
+    """The API refused a TR call's bearer token (HTTP 401 or ``IGW00121``).
+
+    Args:
+        authorization: The ``authorization`` header of the rejected call
+    """
+
+    def __init__(self, authorization: str):
+        super().__init__("Xing bearer token rejected")
+        self.authorization = authorization
 
 
 def get_access_token(
@@ -23,3 +50,172 @@ def get_access_token(
 
     data = response.json()
     return data["access_token"]
+
+
+def parse_token_response(response: Response) -> XingToken:
+    data = response.json()
+    if 'error_code' in data:
+        raise Exception(data)
+    expires_in = float(data.get("expires_in") or XING_TOKEN_DEFAULT_TTL_SEC)
+    issued_at = time.time()
+    return XingToken(access_token=data["access_token"], expires_at=issued_at + expires_in, issued_at=issued_at)
+
+
+async def async_issue_token(
+    client: AsyncClient,
+    app_key: str | None,
+    app_secret: str | None
+) -> XingToken:
+    if not app_key or not app_secret:
+        raise ValueError("app_key and app_secret must be provided")
+
+    response = await client.post(
+        url=XING_AUTH_URL,
+        headers=XingAuthHeaders().model_dump(by_alias=True),
+        params=XingAuthParams(appkey=app_key, appsecretkey=app_secret).model_dump()
+    )
+    return parse_token_response(response)
+
+
+async def async_get_access_token(
+    client: AsyncClient,
+    app_key: str | None,
+    app_secret: str | None
+):
+    token = await async_issue_token(client, app_key, app_secret)
+    return token.access_token
+
+
+class XingTokenManager:
+    """Caches the bearer token of one app key and refreshes it before it expires.
+
+    The token is kept in-process and in a ``diskcache`` store shared by every
+    process on the host (uvicorn workers, scrapy workers, CLI jobs), so the
+    OAuth endpoint is hit once per token lifetime rather than once per process
+    or request. Concurrent refreshes are coalesced by an ``asyncio.Lock``
+    in-process and by an atomic ``Cache.add`` lock across processes; the
+    store is file I/O, so it is only touched from a worker thread.
+
+    A token is refreshed ``refresh_margin_sec`` before it expires, but never
+    earlier than ``XING_TOKEN_REFRESH_MARGIN_FRACTION`` of its lifetime
+    before, so a token issued for less than the margin is still used.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], AsyncClient],
+        app_key: str | None,
+        app_secret: str | None,
+        cache_directory: str = XING_TOKEN_CACHE_DIR,
+        refresh_margin_sec: float = XING_TOKEN_REFRESH_MARGIN_SEC,
+    ):
+        if not app_key or not app_secret:
+            raise ValueError("app_key and app_secret must be provided")
+        self._client_factory = client_factory
+        self._app_key = app_key
+        self._app_secret = app_secret
+        self._refresh_margin_sec = refresh_margin_sec
+        self._cache = Cache(directory=cache_directory)
+        # Never persist the app key itself.
+        self._key = f"token:{hashlib.sha256(app_key.encode()).hexdigest()[:16]}"
+        self._lock_key = f"{self._key}:lock"
+        self._token: Optional[XingToken] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.issued = 0  # tokens issued by this process, for diagnostics
+
+    async def get_access_token(self) -> str:
+        token = self._token
+        if token is not None and token.is_fresh(self._margin(token)):
+            return token.access_token
+        if token is not None and token.is_fresh() and self._refresh_task is not None and not self._refresh_task.done():
+            # Still valid and a background refresh is already under way.
+            return token.access_token
+        token = await self._refresh()
+        return token.access_token
+
+    async def invalidate(self, access_token: Optional[str] = None) -> None:
+        """Drop a token the API rejected so the next call issues a new one.
+
+        Args:
+            access_token: The rejected token; if given, a newer token that
+                replaced it meanwhile is kept
+        """
+        if access_token is not None and self._token is not None and self._token.access_token != access_token:
+            return
+        self._token = None
+        await asyncio.to_thread(self._delete_shared, access_token)
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        self._cache.close()
+
+    def _margin(self, token: XingToken) -> float:
+        ttl = token.ttl
+        return min(self._refresh_margin_sec, ttl * XING_TOKEN_REFRESH_MARGIN_FRACTION) if ttl else self._refresh_margin_sec
+
+    def _load_shared(self) -> Optional[XingToken]:
+        data = self._cache.get(self._key)
+        return XingToken(**data) if data else None
+
+    def _delete_shared(self, access_token: Optional[str]) -> None:
+        # Another process may already have published the replacement.
+        shared = self._load_shared()
+        if shared is not None and (access_token is None or shared.access_token == access_token):
+            self._cache.delete(self._key)
+
+    async def _refresh(self) -> XingToken:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # Whoever waited on the lock reuses the token the first caller fetched.
+            token = self._token
+            if token is not None and token.is_fresh(self._margin(token)):
+                return token
+            token = await self._acquire_shared()
+            self._token = token
+            self._schedule_refresh(token.expires_at - self._margin(token) - time.time())
+            return token
+
+    async def _acquire_shared(self) -> XingToken:
+        """Take the host-wide token, issuing a new one only if no process has a fresh one."""
+        deadline = time.monotonic() + XING_TOKEN_LOCK_TIMEOUT_SEC
+        while True:
+            shared = await asyncio.to_thread(self._load_shared)
+            if shared is not None and shared.is_fresh(self._margin(shared)):
+                return shared
+            if await asyncio.to_thread(self._cache.add, self._lock_key, os.getpid(),
+                                       expire=XING_TOKEN_LOCK_TIMEOUT_SEC):
+                try:
+                    token = await async_issue_token(self._client_factory(), self._app_key, self._app_secret)
+                    self.issued += 1
+                    await asyncio.to_thread(self._cache.set, self._key, token.model_dump(),
+                                            expire=max(token.expires_at - time.time(), 1))
+                    return token
+                finally:
+                    await asyncio.to_thread(self._cache.delete, self._lock_key)
+            if time.monotonic() > deadline:
+                raise TimeoutError("Timed out waiting for another process to refresh the Xing token")
+            # Another process is refreshing; wait for it to publish the token.
+            await asyncio.sleep(0.05)
+
+    def _schedule_refresh(self, delay: float) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = self._refresh_task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        self._refresh_task = loop.create_task(self._refresh_later(max(delay, 0)))
+
+    async def _refresh_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self._refresh()
+        except Exception:
+            # The current token is still usable until it expires; try again shortly.
+            logger.exception("Background refresh of the Xing token failed")
+            self._schedule_refresh(XING_TOKEN_RETRY_SEC)
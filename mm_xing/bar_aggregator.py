@@ -0,0 +1,240 @@
+"""Streaming OHLCV bars from realtime trade messages.
+
+``BarAggregator`` folds trade ticks (FC0/OC0/JC0/EC0/OVC, see
+``tick_store.TRADE_FIELDS``) into bars per symbol as they arrive:
+
+* time bars: ``1s``, ``1m``, ``5m``, ... (``<n>s``/``<n>m``/``<n>h``)
+* volume bars: ``v<n>``, closed once ``n`` contracts traded
+* tick bars: ``t<n>``, closed every ``n`` trades
+
+Closed bars go to the subscribers and, for time bars, to a ``BarStore`` under
+the same interval name, so intraday charts read the store instead of
+polling t8412/t8418. A time bar closes when the first tick of a later bar
+arrives or when ``close_until`` passes its end (call it on a timer so quiet
+symbols still publish their last minute). Times are KST wall clock on the
+current KST day (``mm_xing.session_clock``), whatever the host's time zone.
+"""
+import asyncio
+import threading
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import msgspec
+import numpy as np
+
+from mm_xing.bar_store import BarStore, Bars
+from mm_xing.session_clock import SessionClock, exchange_now
+from mm_xing.tick_store import TRADE_FIELDS
+
+TIME = "time"
+VOLUME = "volume"
+TICKS = "ticks"
+
+UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600}
+
+DEFAULT_BAR_SPECS = ("1s", "1m", "5m")
+
+
+class ClosedBar(msgspec.Struct, frozen=True, gc=False):
+    symbol: str
+    interval: str
+    ts: int  # bar start, seconds since epoch (exchange wall clock)
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+    value: int
+    ticks: int
+
+
+def parse_bar_spec(spec: str) -> Tuple[str, int]:
+    """``"5m"`` -> (TIME, 300), ``"v1000"`` -> (VOLUME, 1000), ``"t100"`` -> (TICKS, 100)."""
+    if spec[0] == "v":
+        return VOLUME, int(spec[1:])
+    if spec[0] == "t":
+        return TICKS, int(spec[1:])
+    if spec[-1] in UNIT_SECONDS:
+        return TIME, int(spec[:-1]) * UNIT_SECONDS[spec[-1]]
+    raise ValueError(f"Unknown bar spec: {spec}")
+
+
+class _OpenBar:
+    __slots__ = ("start", "end", "open", "high", "low", "close", "volume", "value", "ticks")
+
+    def __init__(self, start: int, end: int, price: float):
+        self.start, self.end = start, end
+        self.open = self.high = self.low = self.close = price
+        self.volume = self.value = self.ticks = 0
+
+    def add(self, price: float, volume: int) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        self.value += int(price * volume)
+        self.ticks += 1
+
+
+class BarSink:
+    """Buffers closed time bars and appends them to a ``BarStore`` in batches.
+
+    Calling the sink only buffers, so feeding it never blocks on file I/O.
+    ``pending`` belongs to the thread feeding the sink (the event loop): take
+    the pending bars there with ``take()`` and pass them to ``write`` in a
+    worker (``aggregate_feed`` does so every second). Appends to one
+    partition are serialized by a lock, because ``BarStore`` assumes a single
+    writer per partition.
+    """
+
+    def __init__(self, store: Optional[BarStore] = None):
+        self.store = store or BarStore()
+        self.pending: Dict[Tuple[str, str], List[ClosedBar]] = {}
+        self.written = 0
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def __call__(self, bar: ClosedBar) -> None:
+        self.pending.setdefault((bar.symbol, bar.interval), []).append(bar)
+
+    def flush(self) -> None:
+        self.write(self.take())
+
+    def take(self) -> Dict[Tuple[str, str], List[ClosedBar]]:
+        """Hand over the pending bars, leaving the sink an empty buffer."""
+        pending, self.pending = self.pending, {}
+        return pending
+
+    def write(self, pending: Dict[Tuple[str, str], List[ClosedBar]]) -> None:
+        """Append bars taken with ``take``; safe to run in a worker thread."""
+        for (symbol, interval), bars in pending.items():
+            self._append(symbol, interval, bars)
+
+    def _append(self, symbol: str, interval: str, bars: List[ClosedBar]) -> None:
+        columns = {
+            name: np.fromiter((getattr(bar, name) for bar in bars), dtype, len(bars))
+            for name, dtype in (("ts", np.int64), ("open", np.float64), ("high", np.float64), ("low", np.float64),
+                                ("close", np.float64), ("volume", np.int64), ("value", np.int64))
+        }
+        with self._locks_lock:
+            lock = self._locks.setdefault((symbol, interval), threading.Lock())
+        with lock:
+            written = self.store.append(symbol, interval, Bars(**columns))
+        with self._locks_lock:
+            self.written += written
+
+
+class BarAggregator:
+    """Incremental bars for every (symbol, spec) of the trade messages it is fed.
+
+    Example:
+        >>> aggregator = BarAggregator(("1m", "5m", "t100"))
+        >>> aggregator.subscribe(lambda bar: print(bar.symbol, bar.interval, bar.close))
+        >>> await aggregate_feed(client, aggregator)  # XingRealtimeClient
+
+    Args:
+        specs: Bar specs, e.g. ``("1s", "1m", "5m", "v1000", "t100")``
+        sink: Where closed time bars are persisted (default: a ``BarSink``
+            over the default ``BarStore``)
+        persist: False to only publish bars to subscribers
+        session_date: Day the feed's ``HHMMSS`` times belong to (default: the
+            current KST day, rolling over at KST midnight)
+    """
+
+    def __init__(
+        self,
+        specs: Iterable[str] = DEFAULT_BAR_SPECS,
+        sink: Optional[BarSink] = None,
+        persist: bool = True,
+        session_date: Optional[date] = None,
+    ):
+        self.specs = [(spec, *parse_bar_spec(spec)) for spec in specs]
+        self.sink = (sink or BarSink()) if persist else None
+        self.listeners: List[Callable[[ClosedBar], None]] = []
+        self.bars: Dict[Tuple[str, str], _OpenBar] = {}
+        self.closed = 0
+        self.clock = SessionClock(session_date)
+
+    def subscribe(self, listener: Callable[[ClosedBar], None]) -> None:
+        self.listeners.append(listener)
+
+    def _emit(self, symbol: str, spec: str, kind: str, bar: _OpenBar) -> None:
+        closed = ClosedBar(symbol, spec, bar.start, bar.open, bar.high, bar.low, bar.close,
+                           bar.volume, bar.value, bar.ticks)
+        self.closed += 1
+        if kind == TIME and self.sink is not None:
+            self.sink(closed)
+        for listener in self.listeners:
+            listener(closed)
+
+    def add_tick(self, symbol: str, ts: int, price: float, volume: int) -> None:
+        """Fold one trade (``ts`` in seconds) into every bar spec of ``symbol``."""
+        bars = self.bars
+        for spec, kind, size in self.specs:
+            key = (symbol, spec)
+            bar = bars.get(key)
+            if kind == TIME:
+                if bar is not None and ts >= bar.end:
+                    self._emit(symbol, spec, kind, bar)
+                    bar = None
+                if bar is None:
+                    start = ts - ts % size
+                    bar = bars[key] = _OpenBar(start, start + size, price)
+                bar.add(price, volume)
+            else:
+                if bar is None:
+                    bar = bars[key] = _OpenBar(ts, ts, price)
+                bar.add(price, volume)
+                if (bar.volume if kind == VOLUME else bar.ticks) >= size:
+                    self._emit(symbol, spec, kind, bar)
+                    del bars[key]
+
+    def add_message(self, message) -> bool:
+        """Fold a trade ``RealtimeMessage``; returns False for TRs that are not trades."""
+        fields = TRADE_FIELDS.get(message.tr_code)
+        if fields is None:
+            return False
+        body = message.body
+        time_field, price_field, volume_field, _ = fields
+        ts = self.clock.ts(getattr(body, time_field))
+        self.add_tick(message.tr_key, ts, getattr(body, price_field), getattr(body, volume_field))
+        return True
+
+    def close_until(self, ts: int) -> int:
+        """Close every time bar that ended at or before ``ts``; returns how many closed."""
+        # Volume/tick bars have end == start and never close on time.
+        ended = [key for key, bar in self.bars.items() if bar.start < bar.end <= ts]
+        for symbol, spec in ended:
+            self._emit(symbol, spec, TIME, self.bars.pop((symbol, spec)))
+        return len(ended)
+
+    def flush(self) -> None:
+        """Persist buffered closed bars (open bars stay open)."""
+        if self.sink is not None:
+            self.sink.flush()
+
+
+async def aggregate_feed(client, aggregator: BarAggregator, close_every_sec: float = 1.0) -> None:
+    """Feed ``client``'s (``XingRealtimeClient``) trades into ``aggregator`` until cancelled.
+
+    Time bars of quiet symbols are closed and buffered bars persisted every
+    ``close_every_sec``.
+    """
+    async def close_periodically():
+        while True:
+            await asyncio.sleep(close_every_sec)
+            aggregator.close_until(exchange_now())
+            if aggregator.sink is not None:
+                # BarStore appends are file I/O; keep the feed flowing. The bars are
+                # taken on the loop, which keeps buffering new ones meanwhile.
+                await asyncio.to_thread(aggregator.sink.write, aggregator.sink.take())
+
+    closer = asyncio.create_task(close_periodically())
+    try:
+        async for message in client:
+            aggregator.add_message(message)
+    finally:
+        closer.cancel()
+        aggregator.flush()
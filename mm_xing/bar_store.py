@@ -0,0 +1,314 @@
+"""Columnar OHLCV store for the chart TRs (t8410/t8412/t8418/t8419).
+
+Bars are partitioned per interval and symbol, one append-only binary file per
+column::
+
+    <root>/<interval>/<symbol>/{ts,open,high,low,close,volume,value}.bin
+
+``ts`` (seconds since epoch of the exchange wall clock, ascending and unique)
+is the row count of record. Reads memory-map the files, so a date-range read
+is two binary searches on ``ts`` plus slicing; the returned arrays are views
+on the page cache, never copies. The store assumes a single writer per
+(symbol, interval). Bars are at most one per second, so tick charts (t8411,
+several trades a second) are not stored here.
+
+Appends after the tail write ``ts`` last, so an interrupted one is cut back
+to ``ts``; rows already stored are never changed in place. A merge that
+changes stored rows (a refetched, still-forming last bar, or an older
+backfill page) writes every column into a new generation directory,
+``<symbol>/g<n>/``, and then switches ``<symbol>/CURRENT`` to it with one
+``os.replace``: a crash leaves either the old or the new partition, never a
+mix. Superseded generations are deleted; readers still mapping them keep
+their views (POSIX unlink).
+"""
+import os
+import shutil
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from mm_xing.constant import T8410, T8411, T8412, T8418, T8419, XING_BAR_STORE_DIR
+
+BAR_COLUMNS: Dict[str, np.dtype] = {
+    "ts": np.dtype(np.int64),
+    "open": np.dtype(np.float64),
+    "high": np.dtype(np.float64),
+    "low": np.dtype(np.float64),
+    "close": np.dtype(np.float64),
+    "volume": np.dtype(np.int64),
+    "value": np.dtype(np.int64),
+}
+
+# "ts" is written last so that it never counts rows another column is missing.
+WRITE_ORDER = [name for name in BAR_COLUMNS if name != "ts"] + ["ts"]
+
+# Bar column -> chart OutBlock1 field holding it (``ts`` is built from date/time)
+CHART_FIELDS = {"open": "open", "high": "high", "low": "low", "close": "close", "volume": "jdiff_vol", "value": "value"}
+
+# File in a partition naming its live generation directory; without it the
+# columns live in the partition directory itself (never rewritten).
+CURRENT = "CURRENT"
+GENERATION_PREFIX = "g"
+
+PERIOD_INTERVALS = {"2": "1d", "3": "1w", "4": "1mo", "5": "1y"}
+
+DateLike = Union[str, date, datetime, np.datetime64, int]
+
+
+@dataclass(eq=False)
+class Bars:
+    """Columns of a run of bars; every field is a 1-d array of the same length."""
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    value: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "Bars":
+        return Bars(**{name: column[index] for name, column in self.columns().items()})
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @property
+    def datetimes(self) -> np.ndarray:
+        """``ts`` as ``datetime64[s]`` (a view, no copy)."""
+        return self.ts.view("datetime64[s]")
+
+    @classmethod
+    def empty(cls) -> "Bars":
+        return cls(**{name: np.empty(0, dtype) for name, dtype in BAR_COLUMNS.items()})
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any]) -> "Bars":
+        """Build sorted, de-duplicated bars from chart OutBlock1 rows (msgspec or pydantic).
+
+        Rows without ``time`` (daily and longer charts) are stamped at midnight;
+        rows without ``value`` get 0. Of two rows with the same timestamp the
+        later one wins.
+
+        Raises:
+            ValueError: For t8411 tick-chart rows, whose bars share seconds
+        """
+        n = len(rows)
+        if not n:
+            return cls.empty()
+        if type(rows[0]).__name__.startswith(T8411):
+            raise ValueError("Tick-chart (t8411) bars share seconds; they cannot be stored as second bars")
+        has_time = hasattr(rows[0], "time")
+        stamps = [
+            f"{r.date[:4]}-{r.date[4:6]}-{r.date[6:8]}"
+            + (f"T{r.time[:2]}:{r.time[2:4]}:{r.time[4:6] or '00'}" if has_time else "")
+            for r in rows
+        ]
+        columns = {"ts": np.array(stamps, dtype="datetime64[s]").astype(np.int64)}
+        for name, field_name in CHART_FIELDS.items():
+            if hasattr(rows[0], field_name):
+                columns[name] = np.fromiter((getattr(r, field_name) for r in rows), BAR_COLUMNS[name], n)
+            else:
+                columns[name] = np.zeros(n, BAR_COLUMNS[name])
+        return cls(**columns).normalized()
+
+    @classmethod
+    def concat(cls, runs: Iterable["Bars"]) -> "Bars":
+        runs = list(runs)
+        return cls(**{name: np.concatenate([getattr(run, name) for run in runs]) for name in BAR_COLUMNS})
+
+    def normalized(self) -> "Bars":
+        """Sort by ``ts`` and keep the last of duplicate timestamps."""
+        if len(self) < 2 or (np.diff(self.ts) > 0).all():
+            return self
+        order = np.argsort(self.ts, kind="stable")
+        ts = self.ts[order]
+        last = np.append(ts[1:] != ts[:-1], True)
+        return self[order[last]]
+
+    def to_arrow(self):
+        """Return a ``pyarrow.Table`` over the same buffers (requires pyarrow)."""
+        import pyarrow as pa
+
+        columns = self.columns()
+        columns["ts"] = self.datetimes
+        return pa.Table.from_arrays([pa.array(c) for c in columns.values()], names=list(columns))
+
+    def to_pandas(self):
+        import pandas as pd
+
+        columns = self.columns()
+        columns["ts"] = self.datetimes
+        return pd.DataFrame(columns, copy=False)
+
+
+def chart_interval(tr_code: str, inblock: Any) -> str:
+    """Partition name of a chart request, e.g. ``1d`` for t8410 gubun=2 or ``5m`` for t8412 ncnt=5.
+
+    Tick charts (t8411) have none: their bars are not one per second.
+    """
+    if tr_code in (T8410, T8419):
+        return PERIOD_INTERVALS[inblock.gubun]
+    if tr_code in (T8412, T8418):
+        return f"{inblock.ncnt}m" if inblock.ncnt else "30s"
+    raise KeyError(f"Not a second-resolution chart TR: {tr_code}")
+
+
+def to_ts(value: DateLike, end: bool = False) -> int:
+    """Convert a bound of a range read to ``ts`` seconds.
+
+    ``YYYYMMDD`` strings and ``date`` objects mean whole days: as an ``end``
+    bound they include every bar of that day.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.strptime(value, "%Y%m%d").date()
+    if isinstance(value, np.datetime64):
+        return int(value.astype("datetime64[s]").astype(np.int64))
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day) + (timedelta(days=1, seconds=-1) if end else timedelta())
+    return int(np.datetime64(value.replace(tzinfo=None), "s").astype(np.int64))
+
+
+class BarStore:
+    """Per-(interval, symbol) columnar bar files under ``root``."""
+
+    def __init__(self, root: str = XING_BAR_STORE_DIR):
+        self.root = root
+
+    def directory(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, interval, symbol)
+
+    def generation(self, symbol: str, interval: str) -> str:
+        """Directory holding the partition's live column files."""
+        directory = self.directory(symbol, interval)
+        try:
+            with open(os.path.join(directory, CURRENT)) as f:
+                return os.path.join(directory, f.read().strip())
+        except FileNotFoundError:
+            return directory
+
+    @staticmethod
+    def _file(columns: str, column: str) -> str:
+        return os.path.join(columns, f"{column}.bin")
+
+    def intervals(self) -> List[str]:
+        return sorted(os.listdir(self.root)) if os.path.isdir(self.root) else []
+
+    def symbols(self, interval: str) -> List[str]:
+        directory = os.path.join(self.root, interval)
+        return sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+
+    def length(self, symbol: str, interval: str) -> int:
+        return self._length(self.generation(symbol, interval))
+
+    @staticmethod
+    def _length(columns: str) -> int:
+        path = BarStore._file(columns, "ts")
+        return os.path.getsize(path) // BAR_COLUMNS["ts"].itemsize if os.path.exists(path) else 0
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> Bars:
+        """Bars with ``start <= ts <= end`` as read-only memory-mapped views."""
+        bars = self._map(self.generation(symbol, interval))
+        n = len(bars)
+        lo = 0 if start is None else int(np.searchsorted(bars.ts, to_ts(start), "left"))
+        hi = n if end is None else int(np.searchsorted(bars.ts, to_ts(end, end=True), "right"))
+        return bars[lo:hi]
+
+    def _map(self, columns: str) -> Bars:
+        n = self._length(columns)
+        if not n:
+            return Bars.empty()
+        return Bars(**{
+            name: np.memmap(self._file(columns, name), dtype=dtype, mode="r", shape=(n,))
+            for name, dtype in BAR_COLUMNS.items()
+        })
+
+    def last_ts(self, symbol: str, interval: str) -> Optional[int]:
+        bars = self.read(symbol, interval)
+        return int(bars.ts[-1]) if len(bars) else None
+
+    def append(self, symbol: str, interval: str, bars: Bars) -> int:
+        """Merge ``bars`` into the store; returns the number of bars written.
+
+        Bars after the stored tail (the common case: a new day) are appended
+        past it, as are bars that only repeat stored rows unchanged. Bars that
+        change stored rows, e.g. a refetch of the still-forming last bar or an
+        older backfill page, rewrite the partition into a new generation:
+        readers may be mapping the live files, so they are never cut back.
+        """
+        bars = bars.normalized()
+        if not len(bars):
+            return 0
+        directory = self.directory(symbol, interval)
+        os.makedirs(directory, exist_ok=True)
+        columns = self.generation(symbol, interval)
+        n = self._repair(columns)
+        existing = self._map(columns)
+        keep = int(np.searchsorted(existing.ts, bars.ts[0], "left"))
+        if keep == n or self._repeats(existing[keep:], bars):
+            new = bars if keep == n else bars[bars.ts > existing.ts[-1]]
+            del existing
+            for name in WRITE_ORDER:
+                with open(self._file(columns, name), "ab") as f:
+                    getattr(new, name).astype(BAR_COLUMNS[name], copy=False).tofile(f)
+        else:
+            merged = Bars.concat([existing, bars]).normalized()
+            merged = Bars(**{name: np.array(column) for name, column in merged.columns().items()})
+            del existing
+            self._rewrite(directory, merged)
+        return len(bars)
+
+    @staticmethod
+    def _repeats(stored: Bars, bars: Bars) -> bool:
+        """Whether every one of the ``stored`` rows is in ``bars`` unchanged."""
+        at = np.searchsorted(bars.ts, stored.ts)
+        if (at >= len(bars)).any():
+            return False
+        return all(np.array_equal(column, getattr(bars, name)[at]) for name, column in stored.columns().items())
+
+    def _rewrite(self, directory: str, bars: Bars) -> None:
+        """Write ``bars`` as a new generation of the partition and make it the live one."""
+        generations = [
+            int(name[len(GENERATION_PREFIX):]) for name in os.listdir(directory)
+            if name.startswith(GENERATION_PREFIX) and name[len(GENERATION_PREFIX):].isdigit()
+        ]
+        generation = f"{GENERATION_PREFIX}{max(generations, default=0) + 1:06d}"
+        columns = os.path.join(directory, generation)
+        os.makedirs(columns)
+        for name in WRITE_ORDER:
+            getattr(bars, name).astype(BAR_COLUMNS[name], copy=False).tofile(self._file(columns, name))
+        current = os.path.join(directory, CURRENT)
+        with open(current + ".tmp", "w") as f:
+            f.write(generation)
+        os.replace(current + ".tmp", current)
+        # Everything but the new generation is garbage now, including leftovers of interrupted rewrites.
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if name.startswith(GENERATION_PREFIX) and name != generation and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif name.endswith(".bin"):
+                os.remove(path)
+
+    def _truncate(self, columns: str, rows: int) -> None:
+        for name, dtype in BAR_COLUMNS.items():
+            path = self._file(columns, name)
+            if os.path.exists(path):
+                os.truncate(path, rows * dtype.itemsize)
+
+    def _repair(self, columns: str) -> int:
+        """Cut columns left longer than ``ts`` by an interrupted append."""
+        n = self._length(columns)
+        self._truncate(columns, n)
+        return n
@@ -0,0 +1,71 @@
+"""Bar store benchmark: range reads and full scans over years of minute bars.
+
+Writes ``--years`` of synthetic 1-minute bars (381 per trading day) for one
+symbol into a temporary BarStore and times appends, a one-month range read
+and a full scan of ``close``.
+
+    python -m mm_xing.benchmarks.bar_store --years 10
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from mm_xing.bar_store import BarStore, Bars
+
+MINUTES_PER_DAY = 381  # 09:00 ~ 15:20 plus the closing auction bar
+TRADING_DAYS_PER_YEAR = 250
+
+
+def make_bars(years: int) -> Bars:
+    days = np.datetime64("2015-01-02") + np.arange(years * 365)
+    days = days[np.is_busday(days)][: years * TRADING_DAYS_PER_YEAR]
+    ts = (
+        days.astype("datetime64[s]").astype(np.int64)[:, None]
+        + 9 * 3600 + 60 * np.arange(MINUTES_PER_DAY)[None, :]
+    ).ravel()
+    n = len(ts)
+    close = 70000 + np.cumsum(np.random.default_rng(0).integers(-100, 101, n)).astype(np.float64)
+    return Bars(ts=ts, open=close, high=close + 50, low=close - 50, close=close,
+                volume=np.full(n, 1000, np.int64), value=np.full(n, 70_000_000, np.int64))
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bars = make_bars(args.years)
+    with tempfile.TemporaryDirectory() as root:
+        store = BarStore(root)
+        days = len(bars) // MINUTES_PER_DAY
+        start = time.perf_counter()
+        for day in range(days):  # one append per trading day, as a daily job would
+            store.append("005930", "1m", bars[day * MINUTES_PER_DAY:(day + 1) * MINUTES_PER_DAY])
+        append_ms = (time.perf_counter() - start) * 1000
+
+        mid = str(bars.datetimes[len(bars) // 2].astype("datetime64[D]")).replace("-", "")
+        month_end = str((bars.datetimes[len(bars) // 2] + np.timedelta64(30, "D")).astype("datetime64[D]")).replace("-", "")
+        month = store.read("005930", "1m", mid, month_end)
+        read_ms = best_of(lambda: store.read("005930", "1m", mid, month_end), args.repeat)
+        scan_ms = best_of(lambda: store.read("005930", "1m").close.mean(), args.repeat)
+
+    print(f"bars stored            {len(bars):>12,}")
+    print(f"daily appends          {append_ms / days:>10.3f} ms/append ({days} appends)")
+    print(f"1-month range read     {read_ms:>10.3f} ms ({len(month):,} bars)")
+    print(f"full scan close.mean() {scan_ms:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
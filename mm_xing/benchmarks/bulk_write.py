@@ -0,0 +1,65 @@
+"""Bulk write benchmark: ORM add_all vs. INSERT ... ON CONFLICT vs. COPY upsert.
+
+Writes ``--rows`` synthetic t8436 rows with each method, every run inside a
+transaction that is rolled back, and prints rows/sec. COPY needs PostgreSQL.
+
+    python -m mm_xing.benchmarks.bulk_write --rows 20000 --url postgresql://user:pw@localhost/db
+"""
+import argparse
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from mm_xing.block_struct import t8436OutBlock
+from mm_xing.database.models import Base, t8436OutBlockOrm
+from mm_xing.database.writer import COPY, INSERT, upsert_rows
+
+SAMPLE_VALUES = {str: "1", int: 71000, float: 1.25}
+
+
+def make_rows(rows: int) -> list:
+    template = {
+        name: SAMPLE_VALUES[field_type]
+        for name, field_type in zip(t8436OutBlock.__struct_fields__, t8436OutBlock.__annotations__.values())
+    }
+    return [t8436OutBlock(**{**template, "shcode": f"{i:06d}", "hname": f"종목{i}"}) for i in range(rows)]
+
+
+def orm_add_all(db: Session, rows: list) -> None:
+    db.add_all([t8436OutBlockOrm(**{name: getattr(row, name) for name in row.__struct_fields__}) for row in rows])
+    db.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--url", default=None, help="database URL (default: the configured SQLALCHEMY_DATABASE_URL)")
+    args = parser.parse_args()
+
+    if args.url is None:
+        from mm_xing.config import settings
+        args.url = str(settings.SQLALCHEMY_DATABASE_URL)
+    engine = create_engine(args.url)
+    Base.metadata.create_all(bind=engine, tables=[t8436OutBlockOrm.__table__])
+    rows = make_rows(args.rows)
+
+    methods = {
+        "orm add_all": orm_add_all,
+        "insert upsert": lambda db, rows: upsert_rows(db, t8436OutBlockOrm, rows, method=INSERT),
+    }
+    if engine.dialect.name == "postgresql":
+        methods["copy upsert"] = lambda db, rows: upsert_rows(db, t8436OutBlockOrm, rows, method=COPY)
+
+    print(f"{'method':<14} {'rows':>7} {'sec':>8} {'rows/sec':>10}")
+    for name, write in methods.items():
+        with Session(engine) as db:
+            start = time.perf_counter()
+            write(db, rows)
+            elapsed = time.perf_counter() - start
+            db.rollback()
+        print(f"{name:<14} {args.rows:>7} {elapsed:>8.3f} {args.rows / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
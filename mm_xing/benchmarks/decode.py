@@ -0,0 +1,108 @@
+"""REST OutBlock decode benchmark: pydantic handler vs. msgspec struct handler.
+
+Builds a synthetic response of ``--rows`` OutBlock rows per TR and times the
+full ``cb_handler`` call (bytes -> list of typed rows) for both decoders.
+
+A second table times getting columns (numpy arrays for numeric fields, lists
+for char fields) out of the same responses: msgspec rows read out field by
+field, as consumers of row objects do (e.g. ``Bars.from_rows``), against
+COLUMNAR_DECODER's one-pass transpose (``mm_xing.columnar``). The msgspec
+rows column is the floor either path starts from.
+
+    python -m mm_xing.benchmarks.decode --rows 4000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+import numpy as np
+from httpx import Response
+
+from mm_xing.block import QUERY_MAP as PYDANTIC_QUERY_MAP
+from mm_xing.schemas import XingDataConfig
+from mm_xing.columnar import COLUMN_DTYPES
+from mm_xing.tasks.master import (ColumnarOutBlockHandler, SingleOutBlockHandler,
+                                  StructOutBlockHandler)
+
+# (tr_code, OutBlock holding the rows)
+TARGETS = [
+    ("t8436", "t8436OutBlock"),
+    ("t8410", "t8410OutBlock1"),
+    ("o3101", "o3101OutBlock"),
+]
+
+SAMPLE_VALUES = {str: "005930", int: 71000, float: 1.25}
+
+
+class FieldByFieldHandler(StructOutBlockHandler):
+    """msgspec rows turned into columns afterwards, one pass over the rows per field."""
+
+    def __call__(self, response, config):
+        rows = super().__call__(response, config)
+        columns = {}
+        for name, annotation in type(rows[0]).__annotations__.items():
+            if annotation in COLUMN_DTYPES:
+                columns[name] = np.fromiter((getattr(row, name) for row in rows), COLUMN_DTYPES[annotation], len(rows))
+            else:
+                columns[name] = [getattr(row, name) for row in rows]
+        return columns
+
+
+def make_response(outblock_cls, outblock_name: str, rows: int) -> Response:
+    row = {name: SAMPLE_VALUES[field.annotation] for name, field in outblock_cls.model_fields.items()}
+    body = {"rsp_cd": "00000", "rsp_msg": "정상적으로 조회가 완료되었습니다.", outblock_name: [row] * rows}
+    return Response(200, content=json.dumps(body, ensure_ascii=False).encode("utf-8"))
+
+
+def timeit(handler, response: Response, config: XingDataConfig, repeat: int) -> tuple[float, int]:
+    handler(response, config)  # warm up (decoder construction, module import)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        handler(response, config)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    rows = handler(response, config)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return best * 1000, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    msgspec_ms = {}
+    print(f"{'outblock':<16} {'rows':>6} {'pydantic ms':>12} {'msgspec ms':>11} {'speedup':>8} {'peak MiB (pyd/msg)':>20}")
+    for tr_code, outblock_name in TARGETS:
+        outblock_cls = getattr(PYDANTIC_QUERY_MAP.load_tr(tr_code), outblock_name)
+        response = make_response(outblock_cls, outblock_name, args.rows)
+        config = XingDataConfig(path="", tr_code=tr_code, inblock=outblock_cls())
+        pyd_ms, pyd_peak = timeit(SingleOutBlockHandler(outblock_cls), response, config, args.repeat)
+        msg_ms, msg_peak = timeit(StructOutBlockHandler(outblock_name), response, config, args.repeat)
+        msgspec_ms[outblock_name] = msg_ms
+        print(
+            f"{outblock_name:<16} {args.rows:>6} {pyd_ms:>12.2f} {msg_ms:>11.2f} {pyd_ms / msg_ms:>7.1f}x"
+            f" {pyd_peak / 2**20:>9.2f} / {msg_peak / 2**20:<8.2f}"
+        )
+
+    print()
+    print(f"{'outblock':<16} {'rows':>6} {'msgspec rows ms':>16} {'field by field ms':>18} {'columnar ms':>12} {'speedup':>8}")
+    for tr_code, outblock_name in TARGETS:
+        outblock_cls = getattr(PYDANTIC_QUERY_MAP.load_tr(tr_code), outblock_name)
+        response = make_response(outblock_cls, outblock_name, args.rows)
+        config = XingDataConfig(path="", tr_code=tr_code, inblock=outblock_cls())
+        fields_ms, _ = timeit(FieldByFieldHandler(outblock_name), response, config, args.repeat)
+        col_ms, _ = timeit(ColumnarOutBlockHandler(outblock_name), response, config, args.repeat)
+        print(
+            f"{outblock_name:<16} {args.rows:>6} {msgspec_ms[outblock_name]:>16.2f} {fields_ms:>18.2f}"
+            f" {col_ms:>12.2f} {fields_ms / col_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
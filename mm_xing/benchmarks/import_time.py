@@ -0,0 +1,50 @@
+"""Cold-start benchmark for the lazily loaded ``mm_xing.block`` registry.
+
+Every sample runs in a fresh interpreter so nothing is shared through
+``sys.modules``. The ``eager`` scenario materializes every TR module, which is
+what importing the former single-file ``block.py`` cost.
+
+    python -m mm_xing.benchmarks.import_time --repeat 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "lazy (t8436OutBlock)": "from mm_xing.block import t8436OutBlock",
+    "lazy (QUERY_MAP['t8410'])": "from mm_xing.block import QUERY_MAP; QUERY_MAP['t8410']",
+    "lazy (mm_xing.constant)": "import mm_xing.constant",
+    "eager (all TRs)": "import mm_xing.block; mm_xing.block.load_all()",
+}
+
+TIMER = """
+import time
+_t0 = time.perf_counter()
+{stmt}
+print(time.perf_counter() - _t0)
+"""
+
+
+def measure(stmt: str, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", TIMER.format(stmt=stmt)], text=True)
+        samples.append(float(output.strip()) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {name: statistics.median(measure(stmt, args.repeat)) for name, stmt in SCENARIOS.items()}
+    eager = results["eager (all TRs)"]
+    print(f"{'scenario':<28} {'median ms':>10} {'speedup':>8}")
+    for name, ms in results.items():
+        print(f"{name:<28} {ms:>10.1f} {eager / ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
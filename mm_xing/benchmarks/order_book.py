@@ -0,0 +1,82 @@
+"""Order book benchmark on a replayed quote stream.
+
+Replays FH0 quote frames (``--frames``: one raw frame per line, as recorded by
+``XingRealtimeClient(record=...)``; synthesized by default) through
+``decode_frame`` and ``OrderBookEngine.apply_message`` and reports updates/sec
+and how many updates moved the top of book.
+
+    python -m mm_xing.benchmarks.order_book --messages 500000
+"""
+import argparse
+import json
+import random
+import time
+
+from mm_xing.order_book import QUOTE_LEVELS, OrderBookEngine
+from mm_xing.realtime import RealtimeMessage, decode_frame
+
+
+def synthesize_frames(count: int, symbols: int, tick: float = 0.05) -> list:
+    """Random-walk 5-level FH0 snapshots; most updates only touch deeper levels."""
+    rng = random.Random(0)
+    mids = [350.0] * symbols
+    frames = []
+    for i in range(count):
+        s = i % symbols
+        if rng.random() < 0.2:
+            mids[s] += rng.choice((-tick, tick))
+        body = {"hotime": f"{9 + i // 3_600_000 % 6:02d}{i // 60_000 % 60:02d}{i // 1000 % 60:02d}",
+                "futcode": f"101V{s:04d}"}
+        for level in range(1, QUOTE_LEVELS + 1):
+            body[f"offerho{level}"] = f"{mids[s] + tick * level:.2f}"
+            body[f"bidho{level}"] = f"{mids[s] - tick * level:.2f}"
+            top = level == 1 and rng.random() < 0.1
+            body[f"offerrem{level}"] = str(10 * level + (rng.randrange(5) if top or level > 1 else 0))
+            body[f"bidrem{level}"] = str(10 * level + (rng.randrange(5) if level > 1 else 0))
+        frames.append(json.dumps({"header": {"tr_cd": "FH0", "tr_key": body["futcode"]}, "body": body}))
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500_000)
+    parser.add_argument("--symbols", type=int, default=20)
+    parser.add_argument("--frames", default=None, help="recorded frames, one per line")
+    args = parser.parse_args()
+
+    if args.frames:
+        with open(args.frames, encoding="utf-8") as f:
+            frames = [line.rstrip("\n") for line in f if line.strip()]
+    else:
+        frames = synthesize_frames(args.messages, args.symbols)
+    messages = []
+    for frame in frames:
+        header, body = decode_frame(frame)
+        if body is not None:
+            messages.append(RealtimeMessage(header.tr_cd, header.tr_key, body))
+
+    engine = OrderBookEngine()
+    start = time.perf_counter()
+    for message in messages:
+        engine.apply_message(message)
+    apply_sec = time.perf_counter() - start
+
+    replay = OrderBookEngine()
+    start = time.perf_counter()
+    for frame in frames:
+        header, body = decode_frame(frame)
+        if body is not None:
+            replay.apply_message(RealtimeMessage(header.tr_cd, header.tr_key, body))
+    replay_sec = time.perf_counter() - start
+
+    book = next(iter(engine.books.values()))
+    print(f"quote updates        {len(messages):,} over {len(engine.books)} books")
+    print(f"top-of-book events   {engine.events:,} ({engine.events / len(messages):.0%} of updates)")
+    print(f"apply                {len(messages) / apply_sec:>12,.0f} updates/sec")
+    print(f"decode + apply       {len(frames) / replay_sec:>12,.0f} frames/sec")
+    print(f"e.g. {book.symbol}: bid {book.bid} ask {book.ask} mid {book.mid:.3f} "
+          f"microprice {book.microprice:.3f} imbalance {book.imbalance():+.3f}")
+
+
+if __name__ == "__main__":
+    main()
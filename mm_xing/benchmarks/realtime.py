@@ -0,0 +1,145 @@
+"""Realtime feed benchmark against a local stand-in websocket server.
+
+The stand-in server (run in its own process, so it does not share the
+client's core) acknowledges subscriptions like the Xing gateway and then
+replays recorded frames of the subscribed (tr_cd, tr_key) pairs as fast as the
+socket takes them. Frames come from ``--frames`` (one raw frame per line, as
+written by ``XingRealtimeClient(record=...)``) or are synthesized for
+FH0/FC0. The client decodes every frame into its block_struct OutBlock and
+the benchmark reports messages/sec.
+
+    python -m mm_xing.benchmarks.realtime --messages 200000
+    python -m mm_xing.benchmarks.realtime --frames recorded.jsonl
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import time
+from typing import List
+
+import websockets
+
+from mm_xing.block_struct import load_tr
+from mm_xing.realtime import XingRealtimeClient, decode_frame, frame_tr_code
+
+SAMPLE_VALUES = {str: "090001", int: "1200", float: "352.15"}
+SYNTHETIC = [("FH0", "101V3000"), ("FC0", "101V3000")]
+
+
+def synthesize_frames(count: int) -> List[str]:
+    frames = []
+    for tr_code, tr_key in SYNTHETIC:
+        outblock = getattr(load_tr(tr_code), f"{tr_code}OutBlock")
+        body = {
+            name: SAMPLE_VALUES[field_type]
+            for name, field_type in zip(outblock.__struct_fields__, outblock.__annotations__.values())
+        }
+        frames.append(json.dumps({"header": {"tr_cd": tr_code, "tr_key": tr_key}, "body": body}, ensure_ascii=False))
+    return [frames[i % len(frames)] for i in range(count)]
+
+
+async def serve(frames: List[str], port: int, ready) -> None:
+    """Xing-like websocket stand-in: ack every (un)subscribe, replay the subscribed frames in a loop."""
+    by_key = {}
+    for frame in frames:
+        header = json.loads(frame)["header"]
+        by_key.setdefault((header["tr_cd"], header["tr_key"]), []).append(frame)
+
+    async def handler(ws):
+        subscribed = set()
+        replay = None
+
+        async def pump():
+            while True:
+                selected = [frame for key in sorted(subscribed) for frame in by_key.get(key, ())]
+                if not selected:
+                    await asyncio.sleep(0.01)
+                for frame in selected:
+                    await ws.send(frame)
+
+        try:
+            async for request in ws:
+                request = json.loads(request)
+                key = (request["body"]["tr_cd"], request["body"]["tr_key"])
+                tr_type = request["header"]["tr_type"]
+                (subscribed.add if tr_type == "3" else subscribed.discard)(key)
+                await ws.send(json.dumps({
+                    "header": {"tr_cd": key[0], "tr_key": key[1], "tr_type": tr_type,
+                               "rsp_cd": "00000" if key in by_key or tr_type != "3" else "IGW00121",
+                               "rsp_msg": "정상처리되었습니다"},
+                    "body": None,
+                }, ensure_ascii=False))
+                if replay is None and subscribed:
+                    replay = asyncio.create_task(pump())
+        finally:
+            if replay is not None:
+                replay.cancel()
+                # The pump may already have stopped on the closed connection.
+                with contextlib.suppress(asyncio.CancelledError, websockets.ConnectionClosed):
+                    await replay
+
+    async with websockets.serve(handler, "127.0.0.1", port, max_size=None, compression=None):
+        ready.set()
+        await asyncio.Future()
+
+
+def run_server(frames: List[str], port: int, ready) -> None:
+    asyncio.run(serve(frames, port, ready))
+
+
+async def consume(url: str, keys, messages: int) -> tuple:
+    async def token():
+        return "stand-in"
+
+    client = XingRealtimeClient(token_provider=token, url=url)
+    for tr_code, tr_key in keys:
+        await client.subscribe(tr_code, tr_key)
+    start = time.perf_counter()
+    async for _ in client:
+        if client.received >= messages:
+            break
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return client.received, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--frames", default=None, help="recorded frames, one per line")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.frames:
+        with open(args.frames, encoding="utf-8") as f:
+            frames = [line.rstrip("\n") for line in f if line.strip()]
+        frames = [f for f in frames if json.loads(f).get("body")]
+    else:
+        frames = synthesize_frames(1000)
+    keys = sorted({(frame_tr_code(f), json.loads(f)["header"]["tr_key"]) for f in frames})
+
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=run_server, args=(frames, args.port, ready), daemon=True)
+    server.start()
+    try:
+        ready.wait(10)
+        received, elapsed = asyncio.run(consume(f"ws://127.0.0.1:{args.port}", keys, args.messages))
+    finally:
+        server.terminate()
+
+    start = time.perf_counter()
+    for frame in frames * max(1, 100_000 // len(frames)):
+        decode_frame(frame)
+    decode_rate = len(frames) * max(1, 100_000 // len(frames)) / (time.perf_counter() - start)
+
+    print(f"subscriptions  {len(keys)}: {', '.join(f'{c}/{k}' for c, k in keys)}")
+    print(f"messages       {received:,}")
+    print(f"elapsed        {elapsed:.2f} s")
+    print(f"throughput     {received / elapsed:,.0f} messages/sec (socket + decode)")
+    print(f"decode only    {decode_rate:,.0f} frames/sec")
+
+
+if __name__ == "__main__":
+    main()
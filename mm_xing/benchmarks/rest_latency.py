@@ -0,0 +1,196 @@
+"""REST latency harness against the offline Xing stand-in (``mm_xing.standin``).
+
+Drives the client path (token issue, ``fetch_market_data`` of master TRs and
+``stream_market_data`` continuation paging) concurrently and reports latency
+percentiles per TR. By default the stand-in runs in-process behind
+``httpx.ASGITransport``; ``--url`` targets a served one instead
+(``python -m mm_xing.standin``). ``--backend-url`` additionally drives
+``/api/securities/code`` of a running backend started with
+``XING_REST_URL`` pointing at the stand-in.
+
+The client's own rate limiter is used as configured unless ``--unthrottled``
+is given, in which case the stand-in's rate-limit errors show up as errors.
+``--app-keys N`` spreads the calls over a ``XingCredentialPool`` of N app keys,
+each with its own token and rate budget (the stand-in limits per app key), to
+compare throughput against a single key. Identical concurrent calls are
+coalesced into one (``mm_xing.single_flight``) unless ``--no-coalesce`` is
+given; ``--cache`` also serves repeated calls from the response cache
+(``mm_xing.response_cache``), which is bypassed by default.
+
+    python -m mm_xing.benchmarks.rest_latency --requests 200 --concurrency 16 --unthrottled
+    python -m mm_xing.benchmarks.rest_latency --requests 100 --app-keys 4
+    python -m mm_xing.benchmarks.rest_latency --url http://127.0.0.1:8081
+    python -m mm_xing.benchmarks.rest_latency --url http://127.0.0.1:8081 --backend-url http://127.0.0.1:8080
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+from httpx import ASGITransport, AsyncClient
+
+from mm_xing.auth import XingTokenManager
+from mm_xing.block import t8410InBlock
+from mm_xing.constant import MSGSPEC_DECODER, PRIORITY_BATCH, T8410, TR_CODE_TO_TYPE
+from mm_xing.credential_pool import XingCredentialPool
+from mm_xing.metrics import XING_METRICS
+from mm_xing.rate_limit import XingRateLimiter
+from mm_xing.schemas import XingTrHeaders
+from mm_xing.standin import LatencyModel, StandinXingApp
+from mm_xing.tasks.master import (create_async_client, fetch_market_data,
+                                  get_data_config, get_tr_config,
+                                  stream_market_data)
+
+DEFAULT_TRS = ("t1764", "t8424", "t8425", "t8436", "o3101")
+
+
+class Latencies:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.elapsed = 0.0
+
+    async def measure(self, name: str, call: Callable[[], Awaitable]) -> None:
+        start = time.perf_counter()
+        try:
+            await call()
+        except Exception:
+            self.errors[name] += 1
+        else:
+            self.samples[name].append(time.perf_counter() - start)
+
+    def report(self, title: str) -> None:
+        print(f"{title}")
+        print(f"  {'name':<22} {'ok':>6} {'err':>5} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for name in sorted(set(self.samples) | set(self.errors)):
+            samples = np.array(self.samples.get(name, [0.0])) * 1000
+            p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+            print(f"  {name:<22} {len(self.samples.get(name, [])):>6} {self.errors.get(name, 0):>5} "
+                  f"{p50:>8.1f} {p90:>8.1f} {p99:>8.1f} {samples.max():>8.1f}")
+
+
+async def bounded(calls: List[Callable[[], Awaitable]], concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call):
+        async with semaphore:
+            await call()
+
+    await asyncio.gather(*(run(call) for call in calls))
+
+
+async def drive_client(client: AsyncClient, args, cache_directory: str) -> Latencies:
+    latencies = Latencies()
+    limits = {tr_code: 1e6 for tr_code in (*args.tr, T8410)} if args.unthrottled else None
+    pool = None
+    if args.app_keys:
+        app_keys = {f"standin-{i}": "standin" for i in range(args.app_keys)}
+        pool = XingCredentialPool.from_app_keys(lambda: client, app_keys, tr_limits=limits, cache_directory=cache_directory)
+        tokens = pool.credentials[0].token_manager
+        rate_limiter = None
+    else:
+        tokens = XingTokenManager(lambda: client, "standin", "standin", cache_directory=cache_directory)
+        rate_limiter = XingRateLimiter(tr_limits=limits)
+    await latencies.measure("oauth2/token", tokens.get_access_token)
+    headers = XingTrHeaders.update_access_token(await tokens.get_access_token())
+
+    def fetch(tr_code):
+        config = get_data_config(TR_CODE_TO_TYPE[tr_code], tr_code, decoder=MSGSPEC_DECODER)
+        return lambda: latencies.measure(
+            tr_code, lambda: fetch_market_data(client, headers, config, rate_limiter=rate_limiter, pool=pool,
+                                        coalesce=not args.no_coalesce, cache=args.cache),
+        )
+
+    def page_through(shcode):
+        config = get_tr_config(T8410, t8410InBlock(
+            shcode=shcode, gubun="2", qrycnt=500, sdate="20000101", edate="99999999", comp_yn="N", sujung="Y",
+        ), decoder=MSGSPEC_DECODER)
+
+        async def pages():
+            async for _ in stream_market_data(client, headers, config, priority=PRIORITY_BATCH,
+                                              rate_limiter=rate_limiter, pool=pool,
+                                              coalesce=not args.no_coalesce, cache=args.cache):
+                pass
+        return lambda: latencies.measure(f"{T8410} x{args.pages} pages", pages)
+
+    calls = [fetch(args.tr[i % len(args.tr)]) for i in range(args.requests)]
+    calls += [page_through(f"{i:06d}") for i in range(args.paged)]
+    start = time.perf_counter()
+    await bounded(calls, args.concurrency)
+    latencies.elapsed = time.perf_counter() - start
+    if pool is not None:
+        print(f"requests per app key ({len(pool)} keys):")
+        for row in pool.summary():
+            print(f"  {row['credential']:<14} {row['tr_code']:<8} {row['requests']:>6}")
+        await pool.close()
+    else:
+        await tokens.close()
+    return latencies
+
+
+async def drive_backend(url: str, args) -> Latencies:
+    latencies = Latencies()
+    async with AsyncClient(base_url=url, timeout=60.0) as backend:
+        async def get(tr_code):
+            response = await backend.get("/api/securities/code", params={"tr_code": tr_code, "limit": 10})
+            response.raise_for_status()
+
+        calls = [
+            (lambda tr_code=args.tr[i % len(args.tr)]: latencies.measure(f"/code {tr_code}", lambda: get(tr_code)))
+            for i in range(args.requests)
+        ]
+        await bounded(calls, args.concurrency)
+    return latencies
+
+
+async def run(args, app: Optional[StandinXingApp]) -> None:
+    if app is not None:
+        client = create_async_client(base_url="http://standin", transport=ASGITransport(app=app))
+    else:
+        client = create_async_client(base_url=args.url)
+    async with client:
+        with tempfile.TemporaryDirectory() as cache_directory:
+            latencies = await drive_client(client, args, cache_directory)
+    latencies.report(f"client -> stand-in: {args.requests} requests + {args.paged} paged t8410 in {latencies.elapsed:.2f}s "
+                     f"({args.requests / latencies.elapsed:.1f} req/s)")
+    print("client metrics (mm_xing.metrics):")
+    for line in XING_METRICS.summary_lines():
+        print(f"  {line}")
+    if args.backend_url:
+        (await drive_backend(args.backend_url, args)).report("backend /api/securities/code")
+    if app is not None:
+        print("stand-in responses (tr_code, rsp_cd, count):")
+        for tr_code, rsp_cd, count in app.summary():
+            print(f"  {tr_code:<10} {rsp_cd:<9} {count:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="served stand-in base URL (default: in-process)")
+    parser.add_argument("--backend-url", default=None, help="also drive this running backend")
+    parser.add_argument("--tr", action="append", default=None, help=f"master TR to request (default: {', '.join(DEFAULT_TRS)})")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--paged", type=int, default=4, help="t8410 continuation streams to page through")
+    parser.add_argument("--pages", type=int, default=5, help="pages of each in-process stand-in response")
+    parser.add_argument("--rows", type=int, default=500, help="rows per in-process stand-in occurs block")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.4)
+    parser.add_argument("--unthrottled", action="store_true", help="bypass the client rate limiter")
+    parser.add_argument("--no-coalesce", action="store_true", help="issue identical concurrent calls separately")
+    parser.add_argument("--cache", action="store_true", help="serve repeated calls from the response cache")
+    parser.add_argument("--app-keys", type=int, default=0, help="spread calls over a credential pool of this many app keys")
+    args = parser.parse_args()
+    args.tr = args.tr or list(DEFAULT_TRS)
+
+    app = None
+    if args.url is None:
+        app = StandinXingApp(latency=LatencyModel(args.latency_ms, args.latency_sigma), rows=args.rows, pages=args.pages)
+    asyncio.run(run(args, app))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Symbol index benchmark: build time, memory and search latency of mm_xing.symbol_index.
+
+Indexes ``--symbols`` synthesized t8436 rows (Hangul names, a share of ETFs
+named like "KODEX ...") and times code, name, unfinished-syllable and chosung
+prefix searches, with and without a market filter, against a linear scan of
+the rows with ``str.startswith``.
+
+    python -m mm_xing.benchmarks.symbol_index --symbols 4000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+import numpy as np
+
+from mm_xing.symbol_index import SymbolIndex, normalize, to_chosung
+
+SYLLABLES = "삼성전자현대차기아화학에너지솔루션바이오로직스제약건설중공업금융지주엘지카카오네이버셀트리온한국전력통신"
+ETF_BRANDS = ("KODEX", "TIGER", "KBSTAR", "ARIRANG", "HANARO")
+
+
+def make_rows(symbols: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(symbols):
+        etf = i % 5 == 0
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 8)))
+        rows.append({
+            "shcode": f"{i * 7 % 1_000_000:06d}",
+            "hname": f"{rng.choice(ETF_BRANDS)} {name}" if etf else name,
+            "expcode": f"KR7{i * 7 % 1_000_000:06d}00{i % 10}",
+            "gubun": "1" if i % 3 else "2",
+            "etfgubun": "1" if etf else "0",
+        })
+    return rows
+
+
+def queries(rows: list, rng: random.Random) -> dict:
+    names = [row["hname"] for row in rows if row["etfgubun"] == "0"]
+    picks = [rng.choice(names) for _ in range(200)]
+    return {
+        "code prefix": [rng.choice(rows)["shcode"][:3] for _ in range(200)],
+        "name prefix": [name[:2] for name in picks],
+        "unfinished syllable": [name[:1] + "ㅈ" for name in picks],
+        "chosung": [to_chosung(name)[:3] for name in picks],
+        "etf brand": [rng.choice(ETF_BRANDS)[:3].lower() for _ in range(200)],
+    }
+
+
+def time_searches(search, qs: list, repeat: int = 5) -> np.ndarray:
+    samples = []
+    for _ in range(repeat):
+        for q in qs:
+            start = time.perf_counter()
+            search(q)
+            samples.append(time.perf_counter() - start)
+    return np.array(samples) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=4000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.symbols)
+    start = time.perf_counter()
+    index = SymbolIndex.from_rows(rows)
+    build_sec = time.perf_counter() - start
+    tracemalloc.start()
+    sized = SymbolIndex.from_rows(rows)
+    index_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sized
+    print(f"{len(index)} symbols: built in {build_sec * 1000:.1f} ms, {index_bytes / 2**20:.1f} MB")
+
+    def scan(q):
+        q = normalize(q)
+        return [row for row in rows if row["shcode"].startswith(q) or normalize(row["hname"]).startswith(q)][:args.limit]
+
+    print(f"{'query':<22} {'p50 us':>8} {'p99 us':>8} {'gubun=1 p50':>12} {'scan p50':>10}")
+    for name, qs in queries(rows, random.Random(1)).items():
+        plain = time_searches(lambda q: index.search(q, limit=args.limit), qs)
+        filtered = time_searches(lambda q: index.search(q, limit=args.limit, gubun="1"), qs)
+        scanned = time_searches(scan, qs, repeat=1)
+        p50, p99 = np.percentile(plain, [50, 99])
+        print(f"{name:<22} {p50:>8.1f} {p99:>8.1f} {np.percentile(filtered, 50):>12.1f} {np.percentile(scanned, 50):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Tick store benchmark: ring buffers vs. keeping decoded structs per tick.
+
+Feeds ``--ticks`` FC0 trade messages for ``--symbols`` symbols into a
+TickStore and into plain per-symbol lists of the decoded structs, and prints
+append rate, memory and the cost of reading the last N ticks.
+
+    python -m mm_xing.benchmarks.tick_store --ticks 1000000
+"""
+import argparse
+import time
+import tracemalloc
+
+from mm_xing.block_struct import FC0OutBlock
+from mm_xing.realtime import RealtimeMessage
+from mm_xing.tick_store import TickStore
+
+
+def make_messages(ticks: int, symbols: int) -> list:
+    return [
+        RealtimeMessage(
+            "FC0", f"101V{i % symbols:04d}",
+            FC0OutBlock(chetime=f"09{(i // 60) % 60:02d}{i % 60:02d}", price=350 + i % 100 / 20,
+                        cvolume=1 + i % 7, cgubun="+-"[i % 2], futcode=f"101V{i % symbols:04d}"),
+        )
+        for i in range(ticks)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--window", type=int, default=1000)
+    args = parser.parse_args()
+
+    messages = make_messages(args.ticks, args.symbols)
+
+    store = TickStore()
+    start = time.perf_counter()
+    for message in messages:
+        store.append_message(message)
+    ring_sec = time.perf_counter() - start
+
+    tracemalloc.start()
+    sized = TickStore()
+    for message in messages:
+        sized.append_message(message)
+    ring_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sized
+
+    del messages  # the struct baseline below builds its own
+    tracemalloc.start()
+    kept = {}
+    for message in make_messages(args.ticks, args.symbols):
+        kept.setdefault(message.tr_key, []).append(message.body)
+    struct_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    symbol = next(iter(store.rings))
+    start = time.perf_counter()
+    for _ in range(1000):
+        store.last(symbol, args.window).price.mean()
+    ring_read_us = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    for _ in range(1000):
+        sum(tick.price for tick in kept[symbol][-args.window:]) / args.window
+    struct_read_us = (time.perf_counter() - start) * 1000
+
+    print(f"ticks {args.ticks:,} over {args.symbols} symbols (ring capacity {store.capacity:,})")
+    print(f"ring append          {args.ticks / ring_sec:>12,.0f} ticks/sec")
+    print(f"memory ring/structs  {ring_bytes / 2**20:>8.1f} MiB / {struct_bytes / 2**20:.1f} MiB")
+    print(f"mean of last {args.window:<6}  {ring_read_us:>8.1f} us (ring view) / {struct_read_us:.1f} us (struct list)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Watchlist polling benchmark: t8407 refresh rounds of mm_xing.watchlist against the stand-in.
+
+Polls ``--symbols`` codes through an in-process stand-in (``mm_xing.standin``,
+which quotes every requested code and moves about a tenth of the prices each
+second) with a ``XingCredentialPool`` of ``--app-keys`` keys, and reports per
+round the time until every batch was written, the calls made and the symbols
+whose quote changed, then the snapshot's size and the cost of writing one
+batch into it. ``--batch-size 1`` shows the same watchlist polled one code
+per call.
+
+    python -m mm_xing.benchmarks.watchlist --symbols 1000 --rounds 3
+    python -m mm_xing.benchmarks.watchlist --symbols 1000 --rounds 3 --app-keys 4
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+
+from httpx import ASGITransport
+
+from mm_xing.block_struct import t8407OutBlock1
+from mm_xing.columnar import to_columns
+from mm_xing.constant import T8407
+from mm_xing.credential_pool import XingCredentialPool
+from mm_xing.metrics import XING_METRICS
+from mm_xing.schemas import XingTrHeaders
+from mm_xing.standin import LatencyModel, StandinXingApp, synthesize_quotes
+from mm_xing.tasks.master import create_async_client, get_struct_decoder
+from mm_xing.watchlist import QuoteSnapshot, WatchlistPoller
+
+
+def update_cost_us(shcodes: list, batch_size: int, repeat: int = 200) -> float:
+    snapshot = QuoteSnapshot(shcodes)
+    decoder = get_struct_decoder(T8407)
+    batches = [
+        to_columns(t8407OutBlock1, decoder.decode(synthesize_quotes(shcodes[i:i + batch_size], tick)).outblock1)
+        for tick, i in enumerate(range(0, len(shcodes), batch_size))
+    ]
+    start = time.perf_counter()
+    for n in range(repeat):
+        snapshot.update(batches[n % len(batches)])
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+async def run(args) -> None:
+    app = StandinXingApp(latency=LatencyModel(args.latency_ms, args.latency_sigma))
+    shcodes = [f"{i * 7 % 1_000_000:06d}" for i in range(args.symbols)]
+    async with create_async_client(base_url="http://standin", transport=ASGITransport(app=app)) as client:
+        with tempfile.TemporaryDirectory() as cache_directory:
+            app_keys = {f"standin-{i}": "standin" for i in range(args.app_keys)}
+            pool = XingCredentialPool.from_app_keys(lambda: client, app_keys, cache_directory=cache_directory)
+            headers = XingTrHeaders.update_access_token(await pool.credentials[0].token_manager.get_access_token())
+            poller = WatchlistPoller(
+                client, headers, shcodes, pool=pool, interval_sec=args.interval, batch_size=args.batch_size,
+            )
+            print(f"{len(poller.snapshot)} symbols in {len(poller.configs)} t8407 calls a round, {args.app_keys} app key(s)")
+            print(f"{'round':>5} {'sec':>7} {'changed':>8} {'failed':>7}")
+            async for changed in poller.rounds(args.rounds):
+                print(f"{poller.snapshot.round - 1:>5} {poller.last_round_sec:>7.2f} {len(changed):>8} {poller.failures:>7}")
+            await pool.close()
+    print(f"snapshot: {poller.snapshot.nbytes / 2**10:.1f} KB of columns; "
+          f"writing a {args.batch_size}-code batch takes {update_cost_us(shcodes, args.batch_size):.1f} us")
+    print("client metrics (mm_xing.metrics):")
+    for line in XING_METRICS.summary_lines():
+        print(f"  {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--app-keys", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=50, help="codes per t8407 call")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between round starts")
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.4)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
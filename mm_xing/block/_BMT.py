@@ -0,0 +1,110 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <BMT - 시간대별투자자매매추이(BMT)>
+class BMTInBlock(BaseModel):
+    upcode: str = Field(description="업종코드", default="")
+
+
+class BMTOutBlock(BaseModel):
+    tjjtime: str = Field(description="수신시간", default="")
+    tjjcode1: str = Field(description="투자자코드1(개인)", default="")
+    msvolume1: int = Field(description="매수 거래량1", default=0)
+    mdvolume1: int = Field(description="매도 거래량1", default=0)
+    msvol1: int = Field(description="거래량 순매수1", default=0)
+    msvalue1: int = Field(description="매수 거래대금1", default=0)
+    mdvalue1: int = Field(description="매도 거래대금1", default=0)
+    msval1: int = Field(description="거래대금 순매수1", default=0)
+    tjjcode2: str = Field(description="투자자코드2(외국인)", default="")
+    msvolume2: int = Field(description="매수 거래량2", default=0)
+    mdvolume2: int = Field(description="매도 거래량2", default=0)
+    msvol2: int = Field(description="거래량 순매수2", default=0)
+    msvalue2: int = Field(description="매수 거래대금2", default=0)
+    mdvalue2: int = Field(description="매도 거래대금2", default=0)
+    msval2: int = Field(description="거래대금 순매수2", default=0)
+    tjjcode3: str = Field(description="투자자코드3(기관계)", default="")
+    msvolume3: int = Field(description="매수 거래량3", default=0)
+    mdvolume3: int = Field(description="매도 거래량3", default=0)
+    msvol3: int = Field(description="거래량 순매수3", default=0)
+    msvalue3: int = Field(description="매수 거래대금3", default=0)
+    mdvalue3: int = Field(description="매도 거래대금3", default=0)
+    msval3: int = Field(description="거래대금 순매수3", default=0)
+    tjjcode4: str = Field(description="투자자코드4(증권)", default="")
+    msvolume4: int = Field(description="매수 거래량4", default=0)
+    mdvolume4: int = Field(description="매도 거래량4", default=0)
+    msvol4: int = Field(description="거래량 순매수4", default=0)
+    msvalue4: int = Field(description="매수 거래대금4", default=0)
+    mdvalue4: int = Field(description="매도 거래대금4", default=0)
+    msval4: int = Field(description="거래대금 순매수4", default=0)
+    tjjcode5: str = Field(description="투자자코드5(투신)", default="")
+    msvolume5: int = Field(description="매수 거래량5", default=0)
+    mdvolume5: int = Field(description="매도 거래량5", default=0)
+    msvol5: int = Field(description="거래량 순매수5", default=0)
+    msvalue5: int = Field(description="매수 거래대금5", default=0)
+    mdvalue5: int = Field(description="매도 거래대금5", default=0)
+    msval5: int = Field(description="거래대금 순매수5", default=0)
+    tjjcode6: str = Field(description="투자자코드6(은행)", default="")
+    msvolume6: int = Field(description="매수 거래량6", default=0)
+    mdvolume6: int = Field(description="매도 거래량6", default=0)
+    msvol6: int = Field(description="거래량 순매수6", default=0)
+    msvalue6: int = Field(description="매수 거래대금6", default=0)
+    mdvalue6: int = Field(description="매도 거래대금6", default=0)
+    msval6: int = Field(description="거래대금 순매수6", default=0)
+    tjjcode7: str = Field(description="투자자코드7(보험)", default="")
+    msvolume7: int = Field(description="매수 거래량7", default=0)
+    mdvolume7: int = Field(description="매도 거래량7", default=0)
+    msvol7: int = Field(description="거래량 순매수7", default=0)
+    msvalue7: int = Field(description="매수 거래대금7", default=0)
+    mdvalue7: int = Field(description="매도 거래대금7", default=0)
+    msval7: int = Field(description="거래대금 순매수7", default=0)
+    tjjcode8: str = Field(description="투자자코드8(종금)", default="")
+    msvolume8: int = Field(description="매수 거래량8", default=0)
+    mdvolume8: int = Field(description="매도 거래량8", default=0)
+    msvol8: int = Field(description="거래량 순매수8", default=0)
+    msvalue8: int = Field(description="매수 거래대금8", default=0)
+    mdvalue8: int = Field(description="매도 거래대금8", default=0)
+    msval8: int = Field(description="거래대금 순매수8", default=0)
+    tjjcode9: str = Field(description="투자자코드9(기금)", default="")
+    msvolume9: int = Field(description="매수 거래량9", default=0)
+    mdvolume9: int = Field(description="매도 거래량9", default=0)
+    msvol9: int = Field(description="거래량 순매수9", default=0)
+    msvalue9: int = Field(description="매수 거래대금9", default=0)
+    mdvalue9: int = Field(description="매도 거래대금9", default=0)
+    msval9: int = Field(description="거래대금 순매수9", default=0)
+    tjjcode10: str = Field(description="투자자코드10(선물업자)", default="")
+    msvolume10: int = Field(description="매수 거래량10", default=0)
+    mdvolume10: int = Field(description="매도 거래량10", default=0)
+    msvol10: int = Field(description="거래량 순매수10", default=0)
+    msvalue10: int = Field(description="매수 거래대금10", default=0)
+    mdvalue10: int = Field(description="매도 거래대금10", default=0)
+    msval10: int = Field(description="거래대금 순매수10", default=0)
+    tjjcode11: str = Field(description="투자자코드11(기타)", default="")
+    msvolume11: int = Field(description="매수 거래량11", default=0)
+    mdvolume11: int = Field(description="매도 거래량11", default=0)
+    msvol11: int = Field(description="거래량 순매수11", default=0)
+    msvalue11: int = Field(description="매수 거래대금11", default=0)
+    mdvalue11: int = Field(description="매도 거래대금11", default=0)
+    msval11: int = Field(description="거래대금 순매수11", default=0)
+    upcode: str = Field(description="업종코드", default="")
+    tjjcode0: str = Field(description="투자자코드0(사모펀드)", default="")
+    msvolume0: int = Field(description="매수 거래량0", default=0)
+    mdvolume0: int = Field(description="매도 거래량0", default=0)
+    msvol0: int = Field(description="거래량 순매수0", default=0)
+    msvalue0: int = Field(description="매수 거래대금0", default=0)
+    mdvalue0: int = Field(description="매도 거래대금0", default=0)
+    msval0: int = Field(description="거래대금 순매수0", default=0)
+
+
+# 시간대별투자자매매추이(BMT)
+class BMT(BaseModel):
+    inblock: BMTInBlock = Field(description="BMTInBlock")
+    outblock: BMTOutBlock = Field(description="BMTOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for BMT",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
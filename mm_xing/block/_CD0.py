@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CD0 - 상품선물실시간상하한가(D0)>
+class CD0InBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class CD0OutBlock(BaseModel):
+    gubun: str = Field(description="접속매매여부", default="")
+    dy_gubun: str = Field(description="실시간가격제한여부", default="")
+    dy_uplmtprice: float = Field(description="실시간상한가", default=0.0)
+    dy_dnlmtprice: float = Field(description="실시간하한가", default=0.0)
+    futcode: str = Field(description="단축코드", default="")
+
+
+# 상품선물실시간상하한가(D0)
+class CD0(BaseModel):
+    inblock: CD0InBlock = Field(description="CD0InBlock")
+    outblock: CD0OutBlock = Field(description="CD0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for CD0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,162 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CDPCQ04700 - 계좌 거래내역>
+class CDPCQ04700InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    QryTp: str = Field(description="조회구분", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    SrtNo: int = Field(description="시작번호", default=0)
+    PdptnCode: str = Field(description="상품유형코드", default="")
+    IsuLgclssCode: str = Field(description="종목대분류코드", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+
+
+class CDPCQ04700OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    QryTp: str = Field(description="조회구분", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    SrtNo: int = Field(description="시작번호", default=0)
+    PdptnCode: str = Field(description="상품유형코드", default="")
+    IsuLgclssCode: str = Field(description="종목대분류코드", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+
+
+class CDPCQ04700OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+
+
+class CDPCQ04700OutBlock3(BaseModel):
+    AcntNo: str = Field(description="계좌번호", default="")
+    TrdDt: str = Field(description="거래일자", default="")
+    TrdNo: int = Field(description="거래번호", default=0)
+    TpCodeNm: str = Field(description="구분코드명", default="")
+    SmryNo: str = Field(description="적요번호", default="")
+    SmryNm: str = Field(description="적요명", default="")
+    CancTpNm: str = Field(description="취소구분", default="")
+    TrdQty: int = Field(description="거래수량", default=0)
+    Trtax: int = Field(description="거래세", default=0)
+    FcurrAdjstAmt: float = Field(description="외화정산금액", default=0.0)
+    AdjstAmt: int = Field(description="정산금액", default=0)
+    OvdSum: int = Field(description="연체합", default=0)
+    DpsBfbalAmt: int = Field(description="예수금전잔금액", default=0)
+    SellPldgRfundAmt: int = Field(description="매도담보상환금", default=0)
+    DpspdgLoanBfbalAmt: int = Field(description="예탁담보대출전잔금액", default=0)
+    TrdmdaNm: str = Field(description="거래매체명", default="")
+    OrgTrdNo: int = Field(description="원거래번호", default=0)
+    IsuNm: str = Field(description="종목명", default="")
+    TrdUprc: float = Field(description="거래단가", default=0.0)
+    CmsnAmt: int = Field(description="수수료", default=0)
+    FcurrCmsnAmt: float = Field(description="외화수수료금액", default=0.0)
+    RfundDiffAmt: int = Field(description="상환차이금액", default=0)
+    RepayAmtSum: int = Field(description="변제금합계", default=0)
+    SecCrbalQty: int = Field(description="유가증권금잔수량", default=0)
+    CslLoanRfundIntrstAmt: int = Field(description="매도대금담보대출상환이자금액", default=0)
+    DpspdgLoanCrbalAmt: int = Field(description="예탁담보대출금잔금액", default=0)
+    TrxTime: str = Field(description="처리시각", default="")
+    Inouno: int = Field(description="출납번호", default=0)
+    IsuNo: str = Field(description="종목번호", default="")
+    TrdAmt: int = Field(description="거래금액", default=0)
+    ChckAmt: int = Field(description="수표금액", default=0)
+    TaxSumAmt: int = Field(description="세금합계금액", default=0)
+    FcurrTaxSumAmt: float = Field(description="외화세금합계금액", default=0.0)
+    IntrstUtlfee: int = Field(description="이자이용료", default=0)
+    MnyDvdAmt: int = Field(description="배당금액", default=0)
+    RcvblOcrAmt: int = Field(description="미수발생금액", default=0)
+    TrxBrnNo: str = Field(description="처리지점번호", default="")
+    TrxBrnNm: str = Field(description="처리지점명", default="")
+    DpspdgLoanAmt: int = Field(description="예탁담보대출금액", default=0)
+    DpspdgLoanRfundAmt: int = Field(description="예탁담보대출상환금액", default=0)
+    BasePrc: float = Field(description="기준가", default=0.0)
+    DpsCrbalAmt: int = Field(description="예수금금잔금액", default=0)
+    BoaAmt: int = Field(description="과표", default=0)
+    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
+    BcrLoanOcrAmt: int = Field(description="수익증권담보대출발생금", default=0)
+    BcrLoanBfbalAmt: int = Field(description="수익증권담보대출전잔금", default=0)
+    BnsBasePrc: float = Field(description="매매기준가", default=0.0)
+    TaxchrBasePrc: float = Field(description="과세기준가", default=0.0)
+    TrdUnit: int = Field(description="거래좌수", default=0)
+    BalUnit: int = Field(description="잔고좌수", default=0)
+    EvrTax: int = Field(description="제세금", default=0)
+    EvalAmt: int = Field(description="평가금액", default=0)
+    BcrLoanRfundAmt: int = Field(description="수익증권담보대출상환금", default=0)
+    BcrLoanCrbalAmt: int = Field(description="수익증권담보대출금잔금", default=0)
+    AddMgnOcrTotamt: int = Field(description="추가증거금발생총액", default=0)
+    AddMnyMgnOcrAmt: int = Field(description="추가현금증거금발생금액", default=0)
+    AddMgnDfryTotamt: int = Field(description="추가증거금납부총액", default=0)
+    AddMnyMgnDfryAmt: int = Field(description="추가현금증거금납부금액", default=0)
+    BnsplAmt: int = Field(description="매매손익금액", default=0)
+    Ictax: int = Field(description="소득세", default=0)
+    Ihtax: int = Field(description="주민세", default=0)
+    LoanDt: str = Field(description="대출일", default="")
+    CrcyCode: str = Field(description="통화코드", default="")
+    FcurrAmt: float = Field(description="외화금액", default=0.0)
+    FcurrTrdAmt: float = Field(description="외화거래금액", default=0.0)
+    FcurrDps: float = Field(description="외화예수금", default=0.0)
+    FcurrDpsBfbalAmt: float = Field(description="외화예수금전잔금액", default=0.0)
+    OppAcntNm: str = Field(description="상대계좌명", default="")
+    OppAcntNo: str = Field(description="상대계좌번호", default="")
+    LoanRfundAmt: int = Field(description="대출상환금액", default=0)
+    LoanIntrstAmt: int = Field(description="대출이자금액", default=0)
+    AskpsnNm: str = Field(description="의뢰인명", default="")
+    OrdDt: str = Field(description="주문일자", default="")
+    TrdXchrat: float = Field(description="거래환율", default=0.0)
+    RdctCmsn: float = Field(description="감면수수료", default=0.0)
+    FcurrStmpTx: float = Field(description="외화인지세", default=0.0)
+    FcurrElecfnTrtax: float = Field(description="외화전자금융거래세", default=0.0)
+    FcstckTrtax: float = Field(description="외화증권거래세", default=0.0)
+
+
+class CDPCQ04700OutBlock4(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    PnlSumAmt: int = Field(description="손익합계금액", default=0)
+    CtrctAsm: int = Field(description="약정누계", default=0)
+    CmsnAmtSumAmt: int = Field(description="수수료합계금액", default=0)
+
+
+class CDPCQ04700OutBlock5(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    MnyinAmt: int = Field(description="입금금액", default=0)
+    SecinAmt: int = Field(description="입고금액", default=0)
+    MnyoutAmt: int = Field(description="출금금액", default=0)
+    SecoutAmt: int = Field(description="출고금액", default=0)
+    DiffAmt: int = Field(description="차이금액", default=0)
+    DiffAmt0: int = Field(description="차이금액0", default=0)
+    SellQty: int = Field(description="매도수량", default=0)
+    SellAmt: int = Field(description="매도금액", default=0)
+    SellCmsn: int = Field(description="매도수수료", default=0)
+    EvrTax: int = Field(description="제세금", default=0)
+    FcurrSellAdjstAmt: float = Field(description="외화매도정산금액", default=0.0)
+    BuyQty: int = Field(description="매수수량", default=0)
+    BuyAmt: int = Field(description="매수금액", default=0)
+    BuyCmsn: int = Field(description="매수수수료", default=0)
+    ExecTax: int = Field(description="체결세금", default=0)
+    FcurrBuyAdjstAmt: float = Field(description="외화매수정산금액", default=0.0)
+
+
+# 계좌 거래내역
+class CDPCQ04700(BaseModel):
+    inblock1: CDPCQ04700InBlock1 = Field(description="CDPCQ04700InBlock1")
+    outblock1: CDPCQ04700OutBlock1 = Field(description="CDPCQ04700OutBlock1")
+    outblock2: CDPCQ04700OutBlock2 = Field(description="CDPCQ04700OutBlock2")
+    outblock3: List[CDPCQ04700OutBlock3] = Field(description="CDPCQ04700OutBlock3")
+    outblock4: CDPCQ04700OutBlock4 = Field(description="CDPCQ04700OutBlock4")
+    outblock5: CDPCQ04700OutBlock5 = Field(description="CDPCQ04700OutBlock5")
+    metadata: dict = Field(
+        description="The metadata information for CDPCQ04700",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
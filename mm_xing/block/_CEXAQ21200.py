@@ -0,0 +1,58 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CEXAQ21200 - 유렉스 주문가능 수량/금액 조회>
+class CEXAQ21200InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QryTp: str = Field(description="조회구분", default="")
+    OrdAmt: int = Field(description="주문금액", default=0)
+    RatVal: float = Field(description="비율값", default=0.0)
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
+
+
+class CEXAQ21200OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QryTp: str = Field(description="조회구분", default="")
+    OrdAmt: int = Field(description="주문금액", default=0)
+    RatVal: float = Field(description="비율값", default=0.0)
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
+
+
+class CEXAQ21200OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    QryDt: str = Field(description="조회일", default="")
+    NowPrc: float = Field(description="현재가", default=0.0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+    NewOrdAbleQty: int = Field(description="신규주문가능수량", default=0)
+    LqdtOrdAbleQty: int = Field(description="청산주문가능수량", default=0)
+    UsePreargMgn: int = Field(description="사용예정증거금액", default=0)
+    UsePreargMnyMgn: int = Field(description="사용예정현금증거금액", default=0)
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+
+
+# 유렉스 주문가능 수량/금액 조회
+class CEXAQ21200(BaseModel):
+    inblock1: CEXAQ21200InBlock1 = Field(description="CEXAQ21200InBlock1")
+    outblock1: CEXAQ21200OutBlock1 = Field(description="CEXAQ21200OutBlock1")
+    outblock2: CEXAQ21200OutBlock2 = Field(description="CEXAQ21200OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CEXAQ21200",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,67 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CEXAQ31100 - 유렉스 야간장잔고및 평가현황>
+class CEXAQ31100InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    IsuCode: str = Field(description="종목코드", default="")
+    BalEvalTp: str = Field(description="잔고평가구분", default="")
+    FutsPrcEvalTp: str = Field(description="선물가격평가구분", default="")
+
+
+class CEXAQ31100OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    IsuCode: str = Field(description="종목코드", default="")
+    BalEvalTp: str = Field(description="잔고평가구분", default="")
+    FutsPrcEvalTp: str = Field(description="선물가격평가구분", default="")
+
+
+class CEXAQ31100OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    BnsplAmt: int = Field(description="매매손익금액", default=0)
+    AdjstDfamt: int = Field(description="정산차금", default=0)
+    TotEvalAmt: int = Field(description="총평가금액", default=0)
+    TotPnlAmt: int = Field(description="총손익금액", default=0)
+
+
+class CEXAQ31100OutBlock3(BaseModel):
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    BnsTpNm: str = Field(description="매매구분", default="")
+    UnsttQty: int = Field(description="미결제수량", default=0)
+    LqdtAbleQty: int = Field(description="청산가능수량", default=0)
+    FnoAvrPrc: float = Field(description="평균가", default=0.0)
+    BasePrc: float = Field(description="기준가", default=0.0)
+    NowPrc: float = Field(description="현재가", default=0.0)
+    CmpPrc: float = Field(description="대비가", default=0.0)
+    EvalAmt: int = Field(description="평가금액", default=0)
+    EvalPnl: int = Field(description="평가손익", default=0)
+    PnlRat: float = Field(description="손익률", default=0.0)
+    UnsttAmt: int = Field(description="미결제금액", default=0)
+    BnsplAmt: int = Field(description="매매손익금액", default=0)
+
+
+# 유렉스 야간장잔고및 평가현황
+class CEXAQ31100(BaseModel):
+    inblock1: CEXAQ31100InBlock1 = Field(description="CEXAQ31100InBlock1")
+    outblock1: CEXAQ31100OutBlock1 = Field(description="CEXAQ31100OutBlock1")
+    outblock2: CEXAQ31100OutBlock2 = Field(description="CEXAQ31100OutBlock2")
+    outblock3: List[CEXAQ31100OutBlock3] = Field(description="CEXAQ31100OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CEXAQ31100",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
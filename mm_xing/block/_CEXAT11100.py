@@ -0,0 +1,54 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CEXAT11100 - 유렉스 매수/매도주문>
+class CEXAT11100InBlock1(BaseModel):
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
+    OrdPrc: float = Field(description="주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+
+
+class CEXAT11100OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
+    OrdPrc: float = Field(description="주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CEXAT11100OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdNo: int = Field(description="주문번호", default=0)
+    BrnNm: str = Field(description="지점명", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    OrdMgn: int = Field(description="주문증거금", default=0)
+    MnyOrdMgn: int = Field(description="현금주문증거금", default=0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+
+
+# 유렉스 매수/매도주문
+class CEXAT11100(BaseModel):
+    inblock1: CEXAT11100InBlock1 = Field(description="CEXAT11100InBlock1")
+    outblock1: CEXAT11100OutBlock1 = Field(description="CEXAT11100OutBlock1")
+    outblock2: CEXAT11100OutBlock2 = Field(description="CEXAT11100OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CEXAT11100",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,58 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CFOAQ10100 - 선물옵션 주문가능수량조회>
+class CFOAQ10100InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QryTp: str = Field(description="조회구분", default="")
+    OrdAmt: int = Field(description="주문금액", default=0)
+    RatVal: float = Field(description="비율값", default=0.0)
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
+    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
+
+
+class CFOAQ10100OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QryTp: str = Field(description="조회구분", default="")
+    OrdAmt: int = Field(description="주문금액", default=0)
+    RatVal: float = Field(description="비율값", default=0.0)
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
+    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
+
+
+class CFOAQ10100OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    QryDt: str = Field(description="조회일", default="")
+    FnoNowPrc: float = Field(description="선물옵션현재가", default=0.0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+    NewOrdAbleQty: int = Field(description="신규주문가능수량", default=0)
+    LqdtOrdAbleQty: int = Field(description="청산주문가능수량", default=0)
+    UsePreargMgn: int = Field(description="사용예정증거금액", default=0)
+    UsePreargMnyMgn: int = Field(description="사용예정현금증거금액", default=0)
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+
+
+# 선물옵션 주문가능수량조회
+class CFOAQ10100(BaseModel):
+    inblock1: CFOAQ10100InBlock1 = Field(description="CFOAQ10100InBlock1")
+    outblock1: CFOAQ10100OutBlock1 = Field(description="CFOAQ10100OutBlock1")
+    outblock2: CFOAQ10100OutBlock2 = Field(description="CFOAQ10100OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CFOAQ10100",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
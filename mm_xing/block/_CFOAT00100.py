@@ -0,0 +1,67 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CFOAT00100 - 선물옵션 정상주문>
+class CFOAT00100InBlock1(BaseModel):
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
+    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+
+
+class CFOAT00100OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdMktCode: str = Field(description="주문시장코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    FnoOrdPtnCode: str = Field(description="선물옵션주문유형코드", default="")
+    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
+    FnoTrdPtnCode: str = Field(description="선물옵션거래유형코드", default="")
+    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+    DscusBnsCmpltTime: str = Field(description="협의매매완료시각", default="")
+    GrpId: str = Field(description="그룹ID", default="")
+    OrdSeqno: int = Field(description="주문일련번호", default=0)
+    PtflNo: int = Field(description="포트폴리오번호", default=0)
+    BskNo: int = Field(description="바스켓번호", default=0)
+    TrchNo: int = Field(description="트렌치번호", default=0)
+    ItemNo: int = Field(description="항목번호", default=0)
+    OpDrtnNo: str = Field(description="운용지시번호", default="")
+    MgempNo: str = Field(description="관리사원번호", default="")
+    FundId: str = Field(description="펀드ID", default="")
+    FundOrdNo: int = Field(description="펀드주문번호", default=0)
+
+
+class CFOAT00100OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdNo: int = Field(description="주문번호", default=0)
+    BrnNm: str = Field(description="지점명", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    OrdMgn: int = Field(description="주문증거금", default=0)
+    MnyOrdMgn: int = Field(description="현금주문증거금", default=0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+
+
+# 선물옵션 정상주문
+class CFOAT00100(BaseModel):
+    inblock1: CFOAT00100InBlock1 = Field(description="CFOAT00100InBlock1")
+    outblock1: CFOAT00100OutBlock1 = Field(description="CFOAT00100OutBlock1")
+    outblock2: CFOAT00100OutBlock2 = Field(description="CFOAT00100OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CFOAT00100",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
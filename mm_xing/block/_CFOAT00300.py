@@ -0,0 +1,62 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CFOAT00300 - 선물옵션 취소주문>
+class CFOAT00300InBlock1(BaseModel):
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    CancQty: int = Field(description="취소수량", default=0)
+
+
+class CFOAT00300OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdMktCode: str = Field(description="주문시장코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    FnoOrdPtnCode: str = Field(description="선물옵션주문유형코드", default="")
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    CancQty: int = Field(description="취소수량", default=0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+    DscusBnsCmpltTime: str = Field(description="협의매매완료시각", default="")
+    GrpId: str = Field(description="그룹ID", default="")
+    OrdSeqno: int = Field(description="주문일련번호", default=0)
+    PtflNo: int = Field(description="포트폴리오번호", default=0)
+    BskNo: int = Field(description="바스켓번호", default=0)
+    TrchNo: int = Field(description="트렌치번호", default=0)
+    ItemNo: int = Field(description="아이템번호", default=0)
+    MgempNo: str = Field(description="관리사원번호", default="")
+    FundId: str = Field(description="펀드ID", default="")
+    FundOrgOrdNo: int = Field(description="펀드원주문번호", default=0)
+    FundOrdNo: int = Field(description="펀드주문번호", default=0)
+
+
+class CFOAT00300OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdNo: int = Field(description="주문번호", default=0)
+    BrnNm: str = Field(description="지점명", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    OrdMgn: int = Field(description="주문증거금액", default=0)
+    MnyOrdMgn: int = Field(description="현금주문증거금액", default=0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+
+
+# 선물옵션 취소주문
+class CFOAT00300(BaseModel):
+    inblock1: CFOAT00300InBlock1 = Field(description="CFOAT00300InBlock1")
+    outblock1: CFOAT00300OutBlock1 = Field(description="CFOAT00300OutBlock1")
+    outblock2: CFOAT00300OutBlock2 = Field(description="CFOAT00300OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CFOAT00300",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
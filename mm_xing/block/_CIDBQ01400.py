@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CIDBQ01400 - 해외선물 체결내역개별 조회>
+class CIDBQ01400InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    QryTpCode: str = Field(description="조회구분코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
+    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
+
+
+class CIDBQ01400OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    QryTpCode: str = Field(description="조회구분코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
+    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
+
+
+class CIDBQ01400OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+
+
+# 해외선물 체결내역개별 조회
+class CIDBQ01400(BaseModel):
+    inblock1: CIDBQ01400InBlock1 = Field(description="CIDBQ01400InBlock1")
+    outblock1: CIDBQ01400OutBlock1 = Field(description="CIDBQ01400OutBlock1")
+    outblock2: CIDBQ01400OutBlock2 = Field(description="CIDBQ01400OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDBQ01400",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
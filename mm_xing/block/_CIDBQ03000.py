@@ -0,0 +1,56 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CIDBQ03000 - 해외선물 예수금/잔고현황>
+class CIDBQ03000InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntTpCode: str = Field(description="계좌구분코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    AcntPwd: str = Field(description="계좌비밀번호", default="")
+    TrdDt: str = Field(description="거래일자", default="")
+
+
+class CIDBQ03000OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntTpCode: str = Field(description="계좌구분코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    AcntPwd: str = Field(description="계좌비밀번호", default="")
+    TrdDt: str = Field(description="거래일자", default="")
+
+
+class CIDBQ03000OutBlock2(BaseModel):
+    AcntNo: str = Field(description="계좌번호", default="")
+    TrdDt: str = Field(description="거래일자", default="")
+    CrcyObjCode: str = Field(description="통화대상코드", default="")
+    OvrsFutsDps: float = Field(description="해외선물예수금", default=0.0)
+    CustmMnyioAmt: float = Field(description="고객입출금금액", default=0.0)
+    AbrdFutsLqdtPnlAmt: float = Field(description="해외선물청산손익금액", default=0.0)
+    AbrdFutsCmsnAmt: float = Field(description="해외선물수수료금액", default=0.0)
+    PrexchDps: float = Field(description="가환전예수금", default=0.0)
+    EvalAssetAmt: float = Field(description="평가자산금액", default=0.0)
+    AbrdFutsCsgnMgn: float = Field(description="해외선물위탁증거금액", default=0.0)
+    AbrdFutsAddMgn: float = Field(description="해외선물추가증거금액", default=0.0)
+    AbrdFutsWthdwAbleAmt: float = Field(description="해외선물인출가능금액", default=0.0)
+    AbrdFutsOrdAbleAmt: float = Field(description="해외선물주문가능금액", default=0.0)
+    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
+    LastSettPnlAmt: float = Field(description="최종결제손익금액", default=0.0)
+    OvrsOptSettAmt: float = Field(description="해외옵션결제금액", default=0.0)
+    OvrsOptBalEvalAmt: float = Field(description="해외옵션잔고평가금액", default=0.0)
+
+
+# 해외선물 예수금/잔고현황
+class CIDBQ03000(BaseModel):
+    inblock1: CIDBQ03000InBlock1 = Field(description="CIDBQ03000InBlock1")
+    outblock1: CIDBQ03000OutBlock1 = Field(description="CIDBQ03000OutBlock1")
+    outblock2: List[CIDBQ03000OutBlock2] = Field(description="CIDBQ03000OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDBQ03000",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,62 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CIDBT00100 - 해외선물신규주문>
+class CIDBT00100InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdDt: str = Field(description="주문일자", default="")
+    BrnCode: str = Field(description="지점코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
+    CrcyCode: str = Field(description="통화코드", default="")
+    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
+    CndiOrdPrc: float = Field(description="조건주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    PrdtCode: str = Field(description="상품코드", default="")
+    DueYymm: str = Field(description="만기년월", default="")
+    ExchCode: str = Field(description="거래소코드", default="")
+
+
+class CIDBT00100OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdDt: str = Field(description="주문일자", default="")
+    BrnCode: str = Field(description="지점코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
+    CrcyCode: str = Field(description="통화코드", default="")
+    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
+    CndiOrdPrc: float = Field(description="조건주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    PrdtCode: str = Field(description="상품코드", default="")
+    DueYymm: str = Field(description="만기년월", default="")
+    ExchCode: str = Field(description="거래소코드", default="")
+
+
+class CIDBT00100OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
+
+
+# 해외선물신규주문
+class CIDBT00100(BaseModel):
+    inblock1: CIDBT00100InBlock1 = Field(description="CIDBT00100InBlock1")
+    outblock1: CIDBT00100OutBlock1 = Field(description="CIDBT00100OutBlock1")
+    outblock2: CIDBT00100OutBlock2 = Field(description="CIDBT00100OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDBT00100",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
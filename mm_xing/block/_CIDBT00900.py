@@ -0,0 +1,65 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CIDBT00900 - 해외선물정정주문>
+class CIDBT00900InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdDt: str = Field(description="주문일자", default="")
+    RegBrnNo: str = Field(description="등록지점번호", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    FutsOrdPtnCode: str = Field(description="선물주문유형코드", default="")
+    CrcyCodeVal: str = Field(description="통화코드값", default="")
+    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
+    CndiOrdPrc: float = Field(description="조건주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    OvrsDrvtPrdtCode: str = Field(description="해외파생상품코드", default="")
+    DueYymm: str = Field(description="만기년월", default="")
+    ExchCode: str = Field(description="거래소코드", default="")
+
+
+class CIDBT00900OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdDt: str = Field(description="주문일자", default="")
+    RegBrnNo: str = Field(description="등록지점번호", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    FutsOrdPtnCode: str = Field(description="선물주문유형코드", default="")
+    CrcyCodeVal: str = Field(description="통화코드값", default="")
+    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
+    CndiOrdPrc: float = Field(description="조건주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    OvrsDrvtPrdtCode: str = Field(description="해외파생상품코드", default="")
+    DueYymm: str = Field(description="만기년월", default="")
+    ExchCode: str = Field(description="거래소코드", default="")
+
+
+class CIDBT00900OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
+    InnerMsgCnts: str = Field(description="내부메시지내용", default="")
+
+
+# 해외선물정정주문
+class CIDBT00900(BaseModel):
+    inblock1: CIDBT00900InBlock1 = Field(description="CIDBT00900InBlock1")
+    outblock1: CIDBT00900OutBlock1 = Field(description="CIDBT00900OutBlock1")
+    outblock2: CIDBT00900OutBlock2 = Field(description="CIDBT00900OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDBT00900",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,54 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CIDEQ00800 - 일자별 미결제 잔고내역>
+class CIDEQ00800InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    AcntPwd: str = Field(description="계좌비밀번호", default="")
+    TrdDt: str = Field(description="거래일자", default="")
+
+
+class CIDEQ00800OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    AcntPwd: str = Field(description="계좌비밀번호", default="")
+    TrdDt: str = Field(description="거래일자", default="")
+
+
+class CIDEQ00800OutBlock2(BaseModel):
+    AcntNo: str = Field(description="계좌번호", default="")
+    TrdDt: str = Field(description="거래일자", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    BnsTpNm: str = Field(description="매매구분명", default="")
+    BalQty: int = Field(description="잔고수량", default=0)
+    LqdtAbleQty: int = Field(description="청산가능수량", default=0)
+    PchsPrc: float = Field(description="매입가격", default=0.0)
+    OvrsDrvtNowPrc: float = Field(description="해외파생현재가", default=0.0)
+    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
+    CustmBalAmt: float = Field(description="고객잔고금액", default=0.0)
+    FcurrEvalAmt: float = Field(description="외화평가금액", default=0.0)
+    IsuNm: str = Field(description="종목명", default="")
+    CrcyCodeVal: str = Field(description="통화코드값", default="")
+    OvrsDrvtPrdtCode: str = Field(description="해외파생상품코드", default="")
+    DueDt: str = Field(description="만기일자", default="")
+    PrcntrAmt: float = Field(description="계약당금액", default=0.0)
+    FcurrEvalPnlAmt: float = Field(description="외화평가손익금액", default=0.0)
+
+
+# 일자별 미결제 잔고내역
+class CIDEQ00800(BaseModel):
+    inblock1: CIDEQ00800InBlock1 = Field(description="CIDEQ00800InBlock1")
+    outblock1: CIDEQ00800OutBlock1 = Field(description="CIDEQ00800OutBlock1")
+    outblock2: List[CIDEQ00800OutBlock2] = Field(description="CIDEQ00800OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDEQ00800",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,97 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CSPAQ13700 - 현물계좌주문체결내역조회>
+class CSPAQ13700InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    OrdMktCode: str = Field(description="주문시장코드", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    ExecYn: str = Field(description="체결여부", default="")
+    OrdDt: str = Field(description="주문일", default="")
+    SrtOrdNo2: int = Field(description="시작주문번호2", default=0)
+    BkseqTpCode: str = Field(description="역순구분", default="")
+    OrdPtnCode: str = Field(description="주문유형코드", default="")
+
+
+class CSPAQ13700OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    OrdMktCode: str = Field(description="주문시장코드", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    ExecYn: str = Field(description="체결여부", default="")
+    OrdDt: str = Field(description="주문일", default="")
+    SrtOrdNo2: int = Field(description="시작주문번호2", default=0)
+    BkseqTpCode: str = Field(description="역순구분", default="")
+    OrdPtnCode: str = Field(description="주문유형코드", default="")
+
+
+class CSPAQ13700OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    SellExecAmt: int = Field(description="매도체결금액", default=0)
+    BuyExecAmt: int = Field(description="매수체결금액", default=0)
+    SellExecQty: int = Field(description="매도체결수량", default=0)
+    BuyExecQty: int = Field(description="매수체결수량", default=0)
+    SellOrdQty: int = Field(description="매도주문수량", default=0)
+    BuyOrdQty: int = Field(description="매수주문수량", default=0)
+
+
+class CSPAQ13700OutBlock3(BaseModel):
+    OrdDt: str = Field(description="주문일", default="")
+    MgmtBrnNo: str = Field(description="관리지점번호", default="")
+    OrdMktCode: str = Field(description="주문시장코드", default="")
+    OrdNo: int = Field(description="주문번호", default=0)
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    IsuNo: str = Field(description="종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    BnsTpNm: str = Field(description="매매구분", default="")
+    OrdPtnCode: str = Field(description="주문유형코드", default="")
+    OrdPtnNm: str = Field(description="주문유형명", default="")
+    OrdTrxPtnCode: int = Field(description="주문처리유형코드", default=0)
+    OrdTrxPtnNm: str = Field(description="주문처리유형명", default="")
+    MrcTpCode: str = Field(description="정정취소구분", default="")
+    MrcTpNm: str = Field(description="정정취소구분명", default="")
+    MrcQty: int = Field(description="정정취소수량", default=0)
+    MrcAbleQty: int = Field(description="정정취소가능수량", default=0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    OrdPrc: float = Field(description="주문가격", default=0.0)
+    ExecQty: int = Field(description="체결수량", default=0)
+    ExecPrc: float = Field(description="체결가", default=0.0)
+    ExecTrxTime: str = Field(description="체결처리시각", default="")
+    LastExecTime: str = Field(description="최종체결시각", default="")
+    OrdprcPtnCode: str = Field(description="호가유형코드", default="")
+    OrdprcPtnNm: str = Field(description="호가유형명", default="")
+    OrdCndiTpCode: str = Field(description="주문조건구분", default="")
+    AllExecQty: int = Field(description="전체체결수량", default=0)
+    RegCommdaCode: str = Field(description="통신매체코드", default="")
+    CommdaNm: str = Field(description="통신매체명", default="")
+    MbrNo: str = Field(description="회원번호", default="")
+    RsvOrdYn: str = Field(description="예약주문여부", default="")
+    LoanDt: str = Field(description="대출일", default="")
+    OrdTime: str = Field(description="주문시각", default="")
+    OpDrtnNo: str = Field(description="운용지시번호", default="")
+    OdrrId: str = Field(description="주문자ID", default="")
+
+
+# 현물계좌주문체결내역조회
+class CSPAQ13700(BaseModel):
+    inblock1: CSPAQ13700InBlock1 = Field(description="CSPAQ13700InBlock1")
+    outblock1: CSPAQ13700OutBlock1 = Field(description="CSPAQ13700OutBlock1")
+    outblock2: CSPAQ13700OutBlock2 = Field(description="CSPAQ13700OutBlock2")
+    outblock3: List[CSPAQ13700OutBlock3] = Field(description="CSPAQ13700OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CSPAQ13700",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
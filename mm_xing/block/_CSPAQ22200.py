@@ -0,0 +1,74 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CSPAQ22200 - 현물계좌예수금 주문가능금액 총평가2>
+class CSPAQ22200InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    MgmtBrnNo: str = Field(description="관리지점번호", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    BalCreTp: str = Field(description="잔고생성구분", default="")
+
+
+class CSPAQ22200OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    MgmtBrnNo: str = Field(description="관리지점번호", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    BalCreTp: str = Field(description="잔고생성구분", default="")
+
+
+class CSPAQ22200OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    BrnNm: str = Field(description="지점명", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    SubstOrdAbleAmt: int = Field(description="대용주문가능금액", default=0)
+    SeOrdAbleAmt: int = Field(description="거래소금액", default=0)
+    KdqOrdAbleAmt: int = Field(description="코스닥금액", default=0)
+    CrdtPldgOrdAmt: int = Field(description="신용담보주문금액", default=0)
+    MgnRat100pctOrdAbleAmt: int = Field(description="증거금률100퍼센트주문가능금액", default=0)
+    MgnRat35ordAbleAmt: int = Field(description="증거금률35%주문가능금액", default=0)
+    MgnRat50ordAbleAmt: int = Field(description="증거금률50%주문가능금액", default=0)
+    CrdtOrdAbleAmt: int = Field(description="신용주문가능금액", default=0)
+    Dps: int = Field(description="예수금", default=0)
+    SubstAmt: int = Field(description="대용금액", default=0)
+    MgnMny: int = Field(description="증거금현금", default=0)
+    MgnSubst: int = Field(description="증거금대용", default=0)
+    D1Dps: int = Field(description="D1예수금", default=0)
+    D2Dps: int = Field(description="D2예수금", default=0)
+    RcvblAmt: int = Field(description="미수금액", default=0)
+    D1ovdRepayRqrdAmt: int = Field(description="D1연체변제소요금액", default=0)
+    D2ovdRepayRqrdAmt: int = Field(description="D2연체변제소요금액", default=0)
+    MloanAmt: int = Field(description="융자금액", default=0)
+    ChgAfPldgRat: float = Field(description="변경후담보비율", default=0.0)
+    RqrdPldgAmt: int = Field(description="소요담보금액", default=0)
+    PdlckAmt: int = Field(description="담보부족금액", default=0)
+    OrgPldgSumAmt: int = Field(description="원담보합계금액", default=0)
+    SubPldgSumAmt: int = Field(description="부담보합계금액", default=0)
+    CrdtPldgAmtMny: int = Field(description="신용담보금현금", default=0)
+    CrdtPldgSubstAmt: int = Field(description="신용담보대용금액", default=0)
+    Imreq: int = Field(description="신용설정보증금", default=0)
+    CrdtPldgRuseAmt: int = Field(description="신용담보재사용금액", default=0)
+    DpslRestrcAmt: int = Field(description="처분제한금액", default=0)
+    PrdaySellAdjstAmt: int = Field(description="전일매도정산금액", default=0)
+    PrdayBuyAdjstAmt: int = Field(description="전일매수정산금액", default=0)
+    CrdaySellAdjstAmt: int = Field(description="금일매도정산금액", default=0)
+    CrdayBuyAdjstAmt: int = Field(description="금일매수정산금액", default=0)
+    CslLoanAmtdt1: int = Field(description="매도대금담보대출금액", default=0)
+
+
+# 현물계좌예수금 주문가능금액 총평가2
+class CSPAQ22200(BaseModel):
+    inblock1: CSPAQ22200InBlock1 = Field(description="CSPAQ22200InBlock1")
+    outblock1: CSPAQ22200OutBlock1 = Field(description="CSPAQ22200OutBlock1")
+    outblock2: CSPAQ22200OutBlock2 = Field(description="CSPAQ22200OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CSPAQ22200",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
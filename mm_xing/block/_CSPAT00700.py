@@ -0,0 +1,77 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CSPAT00700 - 현물정정주문>
+class CSPAT00700InBlock1(BaseModel):
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    OrdQty: int = Field(description="주문수량", default=0)
+    OrdprcPtnCode: str = Field(description="호가유형코드", default="")
+    OrdCndiTpCode: str = Field(description="주문조건구분", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+
+
+class CSPAT00700OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    OrdQty: int = Field(description="주문수량", default=0)
+    OrdprcPtnCode: str = Field(description="호가유형코드", default="")
+    OrdCndiTpCode: str = Field(description="주문조건구분", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+    StrtgCode: str = Field(description="전략코드", default="")
+    GrpId: str = Field(description="그룹ID", default="")
+    OrdSeqNo: int = Field(description="주문회차", default=0)
+    PtflNo: int = Field(description="포트폴리오번호", default=0)
+    BskNo: int = Field(description="바스켓번호", default=0)
+    TrchNo: int = Field(description="트렌치번호", default=0)
+    ItemNo: int = Field(description="아이템번호", default=0)
+
+
+class CSPAT00700OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdNo: int = Field(description="주문번호", default=0)
+    PrntOrdNo: int = Field(description="모주문번호", default=0)
+    OrdTime: str = Field(description="주문시각", default="")
+    OrdMktCode: str = Field(description="주문시장코드", default="")
+    OrdPtnCode: str = Field(description="주문유형코드", default="")
+    ShtnIsuNo: str = Field(description="단축종목번호", default="")
+    PrgmOrdprcPtnCode: str = Field(description="프로그램호가유형코드", default="")
+    StslOrdprcTpCode: str = Field(description="공매도호가구분", default="")
+    StslAbleYn: str = Field(description="공매도가능여부", default="")
+    MgntrnCode: str = Field(description="신용거래코드", default="")
+    LoanDt: str = Field(description="대출일", default="")
+    CvrgOrdTp: str = Field(description="반대매매주문구분", default="")
+    LpYn: str = Field(description="유동성공급자여부", default="")
+    MgempNo: str = Field(description="관리사원번호", default="")
+    OrdAmt: int = Field(description="주문금액", default=0)
+    BnsTpCode: str = Field(description="매매구분", default="")
+    SpareOrdNo: int = Field(description="예비주문번호", default=0)
+    CvrgSeqno: int = Field(description="반대매매일련번호", default=0)
+    RsvOrdNo: int = Field(description="예약주문번호", default=0)
+    MnyOrdAmt: int = Field(description="현금주문금액", default=0)
+    SubstOrdAmt: int = Field(description="대용주문금액", default=0)
+    RuseOrdAmt: int = Field(description="재사용주문금액", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    IsuNm: str = Field(description="종목명", default="")
+
+
+# 현물정정주문
+class CSPAT00700(BaseModel):
+    inblock1: CSPAT00700InBlock1 = Field(description="CSPAT00700InBlock1")
+    outblock1: CSPAT00700OutBlock1 = Field(description="CSPAT00700OutBlock1")
+    outblock2: CSPAT00700OutBlock2 = Field(description="CSPAT00700OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CSPAT00700",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,83 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CSPBQ00200 - 현물계좌증거금률별주문가능수량조회>
+class CSPBQ00200InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    BnsTpCode: str = Field(description="매매구분", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    OrdPrc: float = Field(description="주문가격", default=0.0)
+    RegCommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CSPBQ00200OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    BnsTpCode: str = Field(description="매매구분", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    OrdPrc: float = Field(description="주문가격", default=0.0)
+    RegCommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CSPBQ00200OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    Dps: int = Field(description="예수금", default=0)
+    SubstAmt: int = Field(description="대용금액", default=0)
+    CrdtPldgRuseAmt: int = Field(description="신용담보재사용금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    SubstOrdAbleAmt: int = Field(description="대용주문가능금액", default=0)
+    MnyMgn: int = Field(description="현금증거금액", default=0)
+    SubstMgn: int = Field(description="대용증거금액", default=0)
+    SeOrdAbleAmt: int = Field(description="거래소금액", default=0)
+    KdqOrdAbleAmt: int = Field(description="코스닥금액", default=0)
+    PrsmptDpsD1: int = Field(description="추정예수금(D+1)", default=0)
+    PrsmptDpsD2: int = Field(description="추정예수금(D+2)", default=0)
+    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
+    RcvblAmt: int = Field(description="미수금액", default=0)
+    CmsnRat: float = Field(description="수수료율", default=0.0)
+    AddLevyAmt: int = Field(description="추가징수금액", default=0)
+    RuseObjAmt: int = Field(description="재사용대상금액", default=0)
+    MnyRuseObjAmt: int = Field(description="현금재사용대상금액", default=0)
+    FirmMgnRat: float = Field(description="이용사증거금률", default=0.0)
+    SubstRuseObjAmt: int = Field(description="대용재사용대상금액", default=0)
+    IsuMgnRat: float = Field(description="종목증거금률", default=0.0)
+    AcntMgnRat: float = Field(description="계좌증거금률", default=0.0)
+    TrdMgnrt: float = Field(description="거래증거금률", default=0.0)
+    Cmsn: int = Field(description="수수료", default=0)
+    MgnRat20pctOrdAbleAmt: int = Field(description="증거금률20퍼센트주문가능금액", default=0)
+    MgnRat20OrdAbleQty: int = Field(description="증거금률100퍼센트현금주문가능수량?", default=0)
+    MgnRat30pctOrdAbleAmt: int = Field(description="증거금률30퍼센트주문가능금액", default=0)
+    MgnRat30OrdAbleQty: int = Field(description="증거금률30퍼센트주문가능수량??", default=0)
+    MgnRat40pctOrdAbleAmt: int = Field(description="증거금률40퍼센트주문가능금액", default=0)
+    MgnRat40OrdAbleQty: int = Field(description="증거금률40퍼센트주문가능수량??", default=0)
+    MgnRat100pctOrdAbleAmt: int = Field(description="증거금률100퍼센트주문가능금액", default=0)
+    MgnRat100OrdAbleQty: int = Field(description="증거금률100퍼센트주문가능수량??", default=0)
+    MgnRat100MnyOrdAbleAmt: int = Field(description="증거금률100퍼센트현금주문가능금액?", default=0)
+    MgnRat100MnyOrdAbleQty: int = Field(description="증거금률100퍼센트현금주문가능수량", default=0)
+    MgnRat20pctRuseAbleAmt: int = Field(description="증거금률20퍼센트재사용가능금액", default=0)
+    MgnRat30pctRuseAbleAmt: int = Field(description="증거금률30퍼센트재사용가능금액", default=0)
+    MgnRat40pctRuseAbleAmt: int = Field(description="증거금률40퍼센트재사용가능금액", default=0)
+    MgnRat100pctRuseAbleAmt: int = Field(description="증거금률100퍼센트재사용가능금액", default=0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+
+
+# 현물계좌증거금률별주문가능수량조회
+class CSPBQ00200(BaseModel):
+    inblock1: CSPBQ00200InBlock1 = Field(description="CSPBQ00200InBlock1")
+    outblock1: CSPBQ00200OutBlock1 = Field(description="CSPBQ00200OutBlock1")
+    outblock2: CSPBQ00200OutBlock2 = Field(description="CSPBQ00200OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CSPBQ00200",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
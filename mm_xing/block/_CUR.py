@@ -0,0 +1,36 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CUR - 현물정보 USD 실시간(CUR)>
+class CURInBlock(BaseModel):
+    base_id: str = Field(description="기초자산ID", default="")
+
+
+class CUROutBlock(BaseModel):
+    time: str = Field(description="전송시간", default="")
+    offer: float = Field(description="매도호가", default=0.0)
+    bid: float = Field(description="매수호가", default=0.0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    price: float = Field(description="체결가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    drate: float = Field(description="등락율", default=0.0)
+    ctime: str = Field(description="데이타 발생시간", default="")
+    base_id: str = Field(description="기초자산ID", default="")
+
+
+# 현물정보 USD 실시간(CUR)
+class CUR(BaseModel):
+    inblock: CURInBlock = Field(description="CURInBlock")
+    outblock: CUROutBlock = Field(description="CUROutBlock")
+    metadata: dict = Field(
+        description="The metadata information for CUR",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,68 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <DH1 - KOSPI시간외단일가호가잔량(DH1)>
+class DH1InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class DH1OutBlock(BaseModel):
+    dan_hotime: str = Field(description="시간외단일가호가시간", default="")
+    dan_hstatus: str = Field(description="시간외단일가장구분", default="")
+    dan_offerho1: int = Field(description="시간외단일가매도호가1", default=0)
+    dan_bidho1: int = Field(description="시간외단일가매수호가1", default=0)
+    dan_offerrem1: int = Field(description="시간외단일가매도호가잔량1", default=0)
+    dan_bidrem1: int = Field(description="시간외단일가매수호가잔량1", default=0)
+    dan_preoffercha1: int = Field(description="시간외단일가직전매도대비수량1", default=0)
+    dan_prebidcha1: int = Field(description="시간외단일가직전매수대비수량1", default=0)
+    dan_offerho2: int = Field(description="시간외단일가매도호가2", default=0)
+    dan_bidho2: int = Field(description="시간외단일가매수호가2", default=0)
+    dan_offerrem2: int = Field(description="시간외단일가매도호가잔량2", default=0)
+    dan_bidrem2: int = Field(description="시간외단일가매수호가잔량2", default=0)
+    dan_preoffercha2: int = Field(description="시간외단일가직전매도대비수량2", default=0)
+    dan_prebidcha2: int = Field(description="시간외단일가직전매수대비수량2", default=0)
+    dan_offerho3: int = Field(description="시간외단일가매도호가3", default=0)
+    dan_bidho3: int = Field(description="시간외단일가매수호가3", default=0)
+    dan_offerrem3: int = Field(description="시간외단일가매도호가잔량3", default=0)
+    dan_bidrem3: int = Field(description="시간외단일가매수호가잔량3", default=0)
+    dan_preoffercha3: int = Field(description="시간외단일가직전매도대비수량3", default=0)
+    dan_prebidcha3: int = Field(description="시간외단일가직전매수대비수량3", default=0)
+    dan_offerho4: int = Field(description="시간외단일가매도호가4", default=0)
+    dan_bidho4: int = Field(description="시간외단일가매수호가4", default=0)
+    dan_offerrem4: int = Field(description="시간외단일가매도호가잔량4", default=0)
+    dan_bidrem4: int = Field(description="시간외단일가매수호가잔량4", default=0)
+    dan_preoffercha4: int = Field(description="시간외단일가직전매도대비수량4", default=0)
+    dan_prebidcha4: int = Field(description="시간외단일가직전매수대비수량4", default=0)
+    dan_offerho5: int = Field(description="시간외단일가매도호가5", default=0)
+    dan_bidho5: int = Field(description="시간외단일가매수호가5", default=0)
+    dan_offerrem5: int = Field(description="시간외단일가매도호가잔량5", default=0)
+    dan_bidrem5: int = Field(description="시간외단일가매수호가잔량5", default=0)
+    dan_preoffercha5: int = Field(description="시간외단일가직전매도대비수량5", default=0)
+    dan_prebidcha5: int = Field(description="시간외단일가직전매수대비수량5", default=0)
+    dan_totofferrem: int = Field(description="시간외단일가총매도호가잔량", default=0)
+    dan_totbidrem: int = Field(description="시간외단일가총매수호가잔량", default=0)
+    dan_preoffercha: int = Field(description="시간외단일가직전매도호가총대비수량", default=0)
+    dan_prebidcha: int = Field(description="시간외단일가직전매수호가총대비수량", default=0)
+    dan_yeprice: int = Field(description="시간외단일가예상체결가격", default=0)
+    dan_yevolume: int = Field(description="시간외단일가예상체결수량", default=0)
+    dan_preysign: str = Field(description="시간외단일가예상가직전가대비구분", default="")
+    dan_preychange: int = Field(description="시간외단일가예상가직전가대비", default=0)
+    dan_jnilysign: str = Field(description="시간외단일가예상가전일가대비구분", default="")
+    dan_jnilychange: int = Field(description="시간외단일가예상가전일가대비", default=0)
+    shcode: str = Field(description="단축코드", default="")
+    volume: int = Field(description="누적거래량", default=0)
+
+
+# KOSPI시간외단일가호가잔량(DH1)
+class DH1(BaseModel):
+    inblock: DH1InBlock = Field(description="DH1InBlock")
+    outblock: DH1OutBlock = Field(description="DH1OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for DH1",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
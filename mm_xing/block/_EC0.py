@@ -0,0 +1,54 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <EC0 - EUREX연계KP200지수옵션선물체결(EC0)>
+class EC0InBlock(BaseModel):
+    optcode: str = Field(description="단축코드", default="")
+
+
+class EC0OutBlock(BaseModel):
+    chetime: str = Field(description="체결시간(24시간)", default="")
+    chetime1: str = Field(description="체결시간(36시간)", default="")
+    sign: str = Field(description="정규장종가대비구분", default="")
+    change: float = Field(description="정규장종가대비", default=0.0)
+    drate: float = Field(description="정규장종가기준등락율", default=0.0)
+    price: float = Field(description="현재가", default=0.0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    cgubun: str = Field(description="체결구분", default="")
+    cvolume: int = Field(description="체결량", default=0)
+    volume: int = Field(description="누적거래량", default=0)
+    value: int = Field(description="누적거래대금(미제공)", default=0)
+    mdvolume: int = Field(description="매도누적체결량", default=0)
+    mdchecnt: int = Field(description="매도누적체결건수(미제공)", default=0)
+    msvolume: int = Field(description="매수누적체결량", default=0)
+    mschecnt: int = Field(description="매수누적체결건수(미제공)", default=0)
+    cpower: float = Field(description="체결강도", default=0.0)
+    offerho1: float = Field(description="매도호가1", default=0.0)
+    bidho1: float = Field(description="매수호가1", default=0.0)
+    openyak: int = Field(description="미결제약정수량", default=0)
+    k200jisu: float = Field(description="KOSPI200지수", default=0.0)
+    eqva: float = Field(description="KOSPI등가", default=0.0)
+    theoryprice: float = Field(description="이론가", default=0.0)
+    impv: float = Field(description="내재변동성", default=0.0)
+    openyakcha: int = Field(description="미결제약정증감", default=0)
+    timevalue: float = Field(description="시간가치", default=0.0)
+    jgubun: str = Field(description="장운영정보", default="")
+    jnilvolume: int = Field(description="전일동시간대거래량", default=0)
+    optcode: str = Field(description="단축코드", default="")
+
+
+# EUREX연계KP200지수옵션선물체결(EC0)
+class EC0(BaseModel):
+    inblock: EC0InBlock = Field(description="EC0InBlock")
+    outblock: EC0OutBlock = Field(description="EC0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for EC0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,63 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <FOCCQ33600 - 주식계좌 기간별수익률 상세>
+class FOCCQ33600InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    TermTp: str = Field(description="기간구분", default="")
+
+
+class FOCCQ33600OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    TermTp: str = Field(description="기간구분", default="")
+
+
+class FOCCQ33600OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    BnsctrAmt: int = Field(description="매매약정금액", default=0)
+    MnyinAmt: int = Field(description="입금금액", default=0)
+    MnyoutAmt: int = Field(description="출금금액", default=0)
+    InvstAvrbalPramt: int = Field(description="투자원금평잔금액", default=0)
+    InvstPlAmt: int = Field(description="투자손익금액", default=0)
+    InvstErnrat: float = Field(description="투자수익률", default=0.0)
+
+
+class FOCCQ33600OutBlock3(BaseModel):
+    BaseDt: str = Field(description="기준일", default="")
+    FdEvalAmt: int = Field(description="기초평가금액", default=0)
+    EotEvalAmt: int = Field(description="기말평가금액", default=0)
+    InvstAvrbalPramt: int = Field(description="투자원금평잔금액", default=0)
+    BnsctrAmt: int = Field(description="매매약정금액", default=0)
+    MnyinSecinAmt: int = Field(description="입금고액", default=0)
+    MnyoutSecoutAmt: int = Field(description="출금고액", default=0)
+    EvalPnlAmt: int = Field(description="평가손익금액", default=0)
+    TermErnrat: float = Field(description="기간수익률", default=0.0)
+    Idx: float = Field(description="지수", default=0.0)
+
+
+# 주식계좌 기간별수익률 상세
+class FOCCQ33600(BaseModel):
+    inblock1: FOCCQ33600InBlock1 = Field(description="FOCCQ33600InBlock1")
+    outblock1: FOCCQ33600OutBlock1 = Field(description="FOCCQ33600OutBlock1")
+    outblock2: FOCCQ33600OutBlock2 = Field(description="FOCCQ33600OutBlock2")
+    outblock3: List[FOCCQ33600OutBlock3] = Field(description="FOCCQ33600OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for FOCCQ33600",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
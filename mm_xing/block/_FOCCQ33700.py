@@ -0,0 +1,75 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <FOCCQ33700 - 선물옵션 기간별 계좌 수익률 현황>
+class FOCCQ33700InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    QryTp: str = Field(description="조회구분", default="")
+    BaseAmtTp: str = Field(description="기준금액구분", default="")
+    QryTermTp: str = Field(description="조회기간구분", default="")
+    PnlCalcTpCode: str = Field(description="손익산출구분코드", default="")
+
+
+class FOCCQ33700OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    QryTp: str = Field(description="조회구분", default="")
+    BaseAmtTp: str = Field(description="기준금액구분", default="")
+    QryTermTp: str = Field(description="조회기간구분", default="")
+    PnlCalcTpCode: str = Field(description="손익산출구분코드", default="")
+
+
+class FOCCQ33700OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    InAmt: int = Field(description="입금액", default=0)
+    OutAmt: int = Field(description="출금액", default=0)
+    FnoCtrctAmt: int = Field(description="선물옵션약정금액", default=0)
+    InvstPramtAvrbalAmt: int = Field(description="투자원금평잔금액", default=0)
+    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
+    OptBsnPnlAmt: int = Field(description="옵션매매손익금액", default=0)
+    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
+    InvstPlAmt: int = Field(description="투자손익금액", default=0)
+    ErnRat: float = Field(description="수익률", default=0.0)
+
+
+class FOCCQ33700OutBlock3(BaseModel):
+    TrdDt: str = Field(description="거래일", default="")
+    FdDpsastAmt: int = Field(description="기초예탁자산금액", default=0)
+    EotDpsastAmt: int = Field(description="기말예탁자산금액", default=0)
+    InAmt: int = Field(description="입금액", default=0)
+    OutAmt: int = Field(description="출금액", default=0)
+    InvstAvrbalPramt: int = Field(description="투자원금평잔금액", default=0)
+    InvstPlAmt: int = Field(description="투자손익금액", default=0)
+    Ernrat: float = Field(description="수익률", default=0.0)
+    FnoCtrctAmt: int = Field(description="선물옵션약정금액", default=0)
+    Trnrat: float = Field(description="회전율", default=0.0)
+    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
+    OptBsnPnlAmt: int = Field(description="옵션매매손익금액", default=0)
+    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
+
+
+# 선물옵션 기간별 계좌 수익률 현황
+class FOCCQ33700(BaseModel):
+    inblock1: FOCCQ33700InBlock1 = Field(description="FOCCQ33700InBlock1")
+    outblock1: FOCCQ33700OutBlock1 = Field(description="FOCCQ33700OutBlock1")
+    outblock2: FOCCQ33700OutBlock2 = Field(description="FOCCQ33700OutBlock2")
+    outblock3: List[FOCCQ33700OutBlock3] = Field(description="FOCCQ33700OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for FOCCQ33700",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,92 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <JH0 - 주식선물호가(JH0)>
+class JH0InBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class JH0OutBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+    hotime: str = Field(description="호가시간", default="")
+    offerho1: int = Field(description="매도호가1", default=0)
+    bidho1: int = Field(description="매수호가1", default=0)
+    offerrem1: int = Field(description="매도호가수량1", default=0)
+    bidrem1: int = Field(description="매수호가수량1", default=0)
+    offercnt1: int = Field(description="매도호가건수1", default=0)
+    bidcnt1: int = Field(description="매수호가건수1", default=0)
+    offerho2: int = Field(description="매도호가2", default=0)
+    bidho2: int = Field(description="매수호가2", default=0)
+    offerrem2: int = Field(description="매도호가수량2", default=0)
+    bidrem2: int = Field(description="매수호가수량2", default=0)
+    offercnt2: int = Field(description="매도호가건수2", default=0)
+    bidcnt2: int = Field(description="매수호가건수2", default=0)
+    offerho3: int = Field(description="매도호가3", default=0)
+    bidho3: int = Field(description="매수호가3", default=0)
+    offerrem3: int = Field(description="매도호가수량3", default=0)
+    bidrem3: int = Field(description="매수호가수량3", default=0)
+    offercnt3: int = Field(description="매도호가건수3", default=0)
+    bidcnt3: int = Field(description="매수호가건수3", default=0)
+    offerho4: int = Field(description="매도호가4", default=0)
+    bidho4: int = Field(description="매수호가4", default=0)
+    offerrem4: int = Field(description="매도호가수량4", default=0)
+    bidrem4: int = Field(description="매수호가수량4", default=0)
+    offercnt4: int = Field(description="매도호가건수4", default=0)
+    bidcnt4: int = Field(description="매수호가건수4", default=0)
+    offerho5: int = Field(description="매도호가5", default=0)
+    bidho5: int = Field(description="매수호가5", default=0)
+    offerrem5: int = Field(description="매도호가수량5", default=0)
+    bidrem5: int = Field(description="매수호가수량5", default=0)
+    offercnt5: int = Field(description="매도호가건수5", default=0)
+    bidcnt5: int = Field(description="매수호가건수5", default=0)
+    offerho6: int = Field(description="매도호가6", default=0)
+    bidho6: int = Field(description="매수호가6", default=0)
+    offerrem6: int = Field(description="매도호가수량6", default=0)
+    bidrem6: int = Field(description="매수호가수량6", default=0)
+    offercnt6: int = Field(description="매도호가건수6", default=0)
+    bidcnt6: int = Field(description="매수호가건수6", default=0)
+    offerho7: int = Field(description="매도호가7", default=0)
+    bidho7: int = Field(description="매수호가7", default=0)
+    offerrem7: int = Field(description="매도호가수량7", default=0)
+    bidrem7: int = Field(description="매수호가수량7", default=0)
+    offercnt7: int = Field(description="매도호가건수7", default=0)
+    bidcnt7: int = Field(description="매수호가건수7", default=0)
+    offerho8: int = Field(description="매도호가8", default=0)
+    bidho8: int = Field(description="매수호가8", default=0)
+    offerrem8: int = Field(description="매도호가수량8", default=0)
+    bidrem8: int = Field(description="매수호가수량8", default=0)
+    offercnt8: int = Field(description="매도호가건수8", default=0)
+    bidcnt8: int = Field(description="매수호가건수8", default=0)
+    offerho9: int = Field(description="매도호가9", default=0)
+    bidho9: int = Field(description="매수호가9", default=0)
+    offerrem9: int = Field(description="매도호가수량9", default=0)
+    bidrem9: int = Field(description="매수호가수량9", default=0)
+    offercnt9: int = Field(description="매도호가건수9", default=0)
+    bidcnt9: int = Field(description="매수호가건수9", default=0)
+    offerho10: int = Field(description="매도호가10", default=0)
+    bidho10: int = Field(description="매수호가10", default=0)
+    offerrem10: int = Field(description="매도호가수량10", default=0)
+    bidrem10: int = Field(description="매수호가수량10", default=0)
+    offercnt10: int = Field(description="매도호가건수10", default=0)
+    bidcnt10: int = Field(description="매수호가건수10", default=0)
+    totofferrem: int = Field(description="매도호가총수량", default=0)
+    totbidrem: int = Field(description="매수호가총수량", default=0)
+    totoffercnt: int = Field(description="매도호가총건수", default=0)
+    totbidcnt: int = Field(description="매수호가총건수", default=0)
+    danhochk: str = Field(description="단일가호가여부", default="")
+    alloc_gubun: str = Field(description="배분적용구분", default="")
+
+
+# 주식선물호가(JH0)
+class JH0(BaseModel):
+    inblock: JH0InBlock = Field(description="JH0InBlock")
+    outblock: JH0OutBlock = Field(description="JH0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for JH0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
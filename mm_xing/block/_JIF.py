@@ -0,0 +1,26 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <JIF - 장운영정보(JIF)>
+class JIFInBlock(BaseModel):
+    jangubun: str = Field(description="장구분", default="")
+
+
+class JIFOutBlock(BaseModel):
+    jangubun: str = Field(description="장구분", default="")
+    jstatus: str = Field(description="장상태", default="")
+
+
+# 장운영정보(JIF)
+class JIF(BaseModel):
+    inblock: JIFInBlock = Field(description="JIFInBlock")
+    outblock: JIFOutBlock = Field(description="JIFOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for JIF",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <NWS - 실시간 뉴스 제목 패킷(NWS)>
+class NWSInBlock(BaseModel):
+    nwcode: str = Field(description="뉴스코드", default="")
+
+
+class NWSOutBlock(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+    id: str = Field(description="뉴스구분자", default="")
+    realkey: str = Field(description="키값", default="")
+    title: str = Field(description="제목", default="")
+    code: str = Field(description="단축종목코드", default="")
+    bodysize: int = Field(description="BODY길이", default=0)
+
+
+# 실시간 뉴스 제목 패킷(NWS)
+class NWS(BaseModel):
+    inblock: NWSInBlock = Field(description="NWSInBlock")
+    outblock: NWSOutBlock = Field(description="NWSOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for NWS",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
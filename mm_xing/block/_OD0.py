@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <OD0 - KOSPI200옵션실시간상하한가(D0)>
+class OD0InBlock(BaseModel):
+    optcode: str = Field(description="단축코드", default="")
+
+
+class OD0OutBlock(BaseModel):
+    gubun: str = Field(description="접속매매여부", default="")
+    dy_gubun: str = Field(description="실시간가격제한여부", default="")
+    dy_uplmtprice: float = Field(description="실시간상한가", default=0.0)
+    dy_dnlmtprice: float = Field(description="실시간하한가", default=0.0)
+    opttcode: str = Field(description="단축코드", default="")
+
+
+# KOSPI200옵션실시간상하한가(D0)
+class OD0(BaseModel):
+    inblock: OD0InBlock = Field(description="OD0InBlock")
+    outblock: OD0OutBlock = Field(description="OD0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for OD0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
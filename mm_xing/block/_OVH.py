@@ -0,0 +1,60 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <OVH - 해외선물 호가(OVH)>
+class OVHInBlock(BaseModel):
+    symbol: str = Field(description="종목코드", default="")
+
+
+class OVHOutBlock(BaseModel):
+    symbol: str = Field(description="종목코드", default="")
+    hotime: str = Field(description="호가시간", default="")
+    offerho1: float = Field(description="매도호가 1", default=0.0)
+    bidho1: float = Field(description="매수호가 1", default=0.0)
+    offerrem1: int = Field(description="매도호가 잔량 1", default=0)
+    bidrem1: int = Field(description="매수호가 잔량 1", default=0)
+    offerno1: int = Field(description="매도호가 건수 1", default=0)
+    bidno1: int = Field(description="매수호가 건수 1", default=0)
+    offerho2: float = Field(description="매도호가 2", default=0.0)
+    bidho2: float = Field(description="매수호가 2", default=0.0)
+    offerrem2: int = Field(description="매도호가 잔량 2", default=0)
+    bidrem2: int = Field(description="매수호가 잔량 2", default=0)
+    offerno2: int = Field(description="매도호가 건수 2", default=0)
+    bidno2: int = Field(description="매수호가 건수 2", default=0)
+    offerho3: float = Field(description="매도호가 3", default=0.0)
+    bidho3: float = Field(description="매수호가 3", default=0.0)
+    offerrem3: int = Field(description="매도호가 잔량 3", default=0)
+    bidrem3: int = Field(description="매수호가 잔량 3", default=0)
+    offerno3: int = Field(description="매도호가 건수 3", default=0)
+    bidno3: int = Field(description="매수호가 건수 3", default=0)
+    offerho4: float = Field(description="매도호가 4", default=0.0)
+    bidho4: float = Field(description="매수호가 4", default=0.0)
+    offerrem4: int = Field(description="매도호가 잔량 4", default=0)
+    bidrem4: int = Field(description="매수호가 잔량 4", default=0)
+    offerno4: int = Field(description="매도호가 건수 4", default=0)
+    bidno4: int = Field(description="매수호가 건수 4", default=0)
+    offerho5: float = Field(description="매도호가 5", default=0.0)
+    bidho5: float = Field(description="매수호가 5", default=0.0)
+    offerrem5: int = Field(description="매도호가 잔량 5", default=0)
+    bidrem5: int = Field(description="매수호가 잔량 5", default=0)
+    offerno5: int = Field(description="매도호가 건수 5", default=0)
+    bidno5: int = Field(description="매수호가 건수 5", default=0)
+    totoffercnt: int = Field(description="매도호가총건수", default=0)
+    totbidcnt: int = Field(description="매수호가총건수", default=0)
+    totofferrem: int = Field(description="매도호가총수량", default=0)
+    totbidrem: int = Field(description="매수호가총수량", default=0)
+
+
+# 해외선물 호가(OVH)
+class OVH(BaseModel):
+    inblock: OVHInBlock = Field(description="OVHInBlock")
+    outblock: OVHOutBlock = Field(description="OVHOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for OVH",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
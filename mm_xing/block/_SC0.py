@@ -0,0 +1,132 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <SC0 - 주식주문접수>
+class SC0OutBlock(BaseModel):
+    lineseq: int = Field(description="라인일련번호", default=0)
+    accno: str = Field(description="계좌번호", default="")
+    user: str = Field(description="조작자ID", default="")
+    len: int = Field(description="헤더길이", default=0)
+    gubun: str = Field(description="헤더구분", default="")
+    compress: str = Field(description="압축구분", default="")
+    encrypt: str = Field(description="암호구분", default="")
+    offset: int = Field(description="공통시작지점", default=0)
+    trcode: str = Field(description="TRCODE", default="")
+    comid: str = Field(description="이용사번호", default="")
+    userid: str = Field(description="사용자ID", default="")
+    media: str = Field(description="접속매체", default="")
+    ifid: str = Field(description="I/F일련번호", default="")
+    seq: str = Field(description="전문일련번호", default="")
+    trid: str = Field(description="TR추적ID", default="")
+    pubip: str = Field(description="공인IP", default="")
+    prvip: str = Field(description="사설IP", default="")
+    pcbpno: str = Field(description="처리지점번호", default="")
+    bpno: str = Field(description="지점번호", default="")
+    termno: str = Field(description="단말번호", default="")
+    lang: str = Field(description="언어구분", default="")
+    proctm: int = Field(description="AP처리시간", default=0)
+    msgcode: str = Field(description="메세지코드", default="")
+    outgu: str = Field(description="메세지출력구분", default="")
+    compreq: str = Field(description="압축요청구분", default="")
+    funckey: str = Field(description="기능키", default="")
+    reqcnt: int = Field(description="요청레코드개수", default=0)
+    filler: str = Field(description="예비영역", default="")
+    cont: str = Field(description="연속구분", default="")
+    contkey: str = Field(description="연속키값", default="")
+    varlen: int = Field(description="가변시스템길이", default=0)
+    varhdlen: int = Field(description="가변해더길이", default=0)
+    varmsglen: int = Field(description="가변메시지길이", default=0)
+    trsrc: str = Field(description="조회발원지", default="")
+    eventid: str = Field(description="I/F이벤트ID", default="")
+    ifinfo: str = Field(description="I/F정보", default="")
+    filler1: str = Field(description="예비영역", default="")
+    ordchegb: str = Field(description="주문체결구분", default="")
+    marketgb: str = Field(description="시장구분", default="")
+    ordgb: str = Field(description="주문구분", default="")
+    orgordno: int = Field(description="원주문번호", default=0)
+    accno1: str = Field(description="계좌번호", default="")
+    accno2: str = Field(description="계좌번호", default="")
+    passwd: str = Field(description="비밀번호", default="")
+    expcode: str = Field(description="종목번호", default="")
+    shtcode: str = Field(description="단축종목번호", default="")
+    hname: str = Field(description="종목명", default="")
+    ordqty: int = Field(description="주문수량", default=0)
+    ordprice: int = Field(description="주문가격", default=0)
+    hogagb: str = Field(description="주문조건", default="")
+    etfhogagb: str = Field(description="호가유형코드", default="")
+    pgmtype: int = Field(description="프로그램호가구분", default=0)
+    gmhogagb: int = Field(description="공매도호가구분", default=0)
+    gmhogayn: int = Field(description="공매도가능여부", default=0)
+    singb: str = Field(description="신용구분", default="")
+    loandt: str = Field(description="대출일", default="")
+    cvrgordtp: str = Field(description="반대매매주문구분", default="")
+    strtgcode: str = Field(description="전략코드", default="")
+    groupid: str = Field(description="그룹ID", default="")
+    ordseqno: int = Field(description="주문회차", default=0)
+    prtno: int = Field(description="포트폴리오번호", default=0)
+    basketno: int = Field(description="바스켓번호", default=0)
+    trchno: int = Field(description="트렌치번호", default=0)
+    itemno: int = Field(description="아아템번호", default=0)
+    brwmgmyn: int = Field(description="차입구분", default=0)
+    mbrno: int = Field(description="회원사번호", default=0)
+    procgb: str = Field(description="처리구분", default="")
+    admbrchno: str = Field(description="관리지점번호", default="")
+    futaccno: str = Field(description="선물계좌번호", default="")
+    futmarketgb: str = Field(description="선물상품구분", default="")
+    tongsingb: str = Field(description="통신매체구분", default="")
+    lpgb: str = Field(description="유동성공급자구분", default="")
+    dummy: str = Field(description="DUMMY", default="")
+    ordno: int = Field(description="주문번호", default=0)
+    ordtm: str = Field(description="주문시각", default="")
+    prntordno: int = Field(description="모주문번호", default=0)
+    mgempno: str = Field(description="관리사원번호", default="")
+    orgordundrqty: int = Field(description="원주문미체결수량", default=0)
+    orgordmdfyqty: int = Field(description="원주문정정수량", default=0)
+    ordordcancelqty: int = Field(description="원주문취소수량", default=0)
+    nmcpysndno: int = Field(description="비회원사송신번호", default=0)
+    ordamt: int = Field(description="주문금액", default=0)
+    bnstp: str = Field(description="매매구분", default="")
+    spareordno: int = Field(description="예비주문번호", default=0)
+    cvrgseqno: int = Field(description="반대매매일련번호", default=0)
+    rsvordno: int = Field(description="예약주문번호", default=0)
+    mtordseqno: int = Field(description="복수주문일련번호", default=0)
+    spareordqty: int = Field(description="예비주문수량", default=0)
+    orduserid: str = Field(description="주문사원번호", default="")
+    spotordqty: int = Field(description="실물주문수량", default=0)
+    ordruseqty: int = Field(description="재사용주문수량", default=0)
+    mnyordamt: int = Field(description="현금주문금액", default=0)
+    ordsubstamt: int = Field(description="주문대용금액", default=0)
+    ruseordamt: int = Field(description="재사용주문금액", default=0)
+    ordcmsnamt: int = Field(description="수수료주문금액", default=0)
+    crdtuseamt: int = Field(description="사용신용담보재사용금", default=0)
+    secbalqty: int = Field(description="잔고수량", default=0)
+    spotordableqty: int = Field(description="실물가능수량", default=0)
+    ordableruseqty: int = Field(description="재사용가능수량(매도)", default=0)
+    flctqty: int = Field(description="변동수량", default=0)
+    secbalqtyd2: int = Field(description="잔고수량(D2)", default=0)
+    sellableqty: int = Field(description="매도주문가능수량", default=0)
+    unercsellordqty: int = Field(description="미체결매도주문수량", default=0)
+    avrpchsprc: int = Field(description="평균매입가", default=0)
+    pchsamt: int = Field(description="매입금액", default=0)
+    deposit: int = Field(description="예수금", default=0)
+    substamt: int = Field(description="대용금", default=0)
+    csgnmnymgn: int = Field(description="위탁증거금현금", default=0)
+    csgnsubstmgn: int = Field(description="위탁증거금대용", default=0)
+    crdtpldgruseamt: int = Field(description="신용담보재사용금", default=0)
+    ordablemny: int = Field(description="주문가능현금", default=0)
+    ordablesubstamt: int = Field(description="주문가능대용", default=0)
+    ruseableamt: int = Field(description="재사용가능금액", default=0)
+
+
+# 주식주문접수
+class SC0(BaseModel):
+    outblock: SC0OutBlock = Field(description="SC0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for SC0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <SHC - 상/하한가근접진입(SHC)>
+class SHCInBlock(BaseModel):
+    updnlmtgubun: str = Field(description="상/하한구분", default="")
+
+
+class SHCOutBlock(BaseModel):
+    sijanggubun: str = Field(description="거래소/코스닥구분", default="")
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    drate: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    volincrate: float = Field(description="거래증가율", default=0.0)
+    updnlmtprice: int = Field(description="상/하한가", default=0)
+    updnlmtdrate: float = Field(description="상/하한가대비율", default=0.0)
+    jnilvolume: int = Field(description="전일거래량", default=0)
+    shcode: str = Field(description="단축코드", default="")
+    gwangubun: str = Field(description="관리구분", default="")
+    undergubun: str = Field(description="이상급등구분", default="")
+    tgubun: str = Field(description="투자유의구분", default="")
+    wgubun: str = Field(description="우선주구분", default="")
+    dishonest: str = Field(description="불성실구분", default="")
+    jkrate: str = Field(description="증거금률", default="")
+    updnlmtdaycnt: int = Field(description="상한가/하한가연속일수", default=0)
+
+
+# 상/하한가근접진입(SHC)
+class SHC(BaseModel):
+    inblock: SHCInBlock = Field(description="SHCInBlock")
+    outblock: SHCOutBlock = Field(description="SHCOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for SHC",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,30 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <YOC - 지수옵션예상체결(YOC)>
+class YOCInBlock(BaseModel):
+    optcode: str = Field(description="단축코드", default="")
+
+
+class YOCOutBlock(BaseModel):
+    ychetime: str = Field(description="예상체결시간", default="")
+    yeprice: float = Field(description="예상체결가격", default=0.0)
+    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
+    jnilchange: float = Field(description="예상체결가전일종가대비", default=0.0)
+    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
+    optcode: str = Field(description="단축코드", default="")
+
+
+# 지수옵션예상체결(YOC)
+class YOC(BaseModel):
+    inblock: YOCInBlock = Field(description="YOCInBlock")
+    outblock: YOCOutBlock = Field(description="YOCOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for YOC",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,28 @@
+"""Lazily-resolved registry of the Xing TR pydantic models.
+
+Every TR lives in its own generated ``_<tr_code>`` module (see
+``res_converter.create_pydantic_model``). Nothing but the small name index is
+imported up front; ``from mm_xing.block import t8436OutBlock`` or
+``QUERY_MAP["t8436"]`` imports only the module that defines the requested TR.
+"""
+from typing import Any
+
+from mm_xing.block._index import BLOCK_INDEX, QUERY_DESC, QUERY_OUTBLOCK_MAP
+from mm_xing.commons import LazyQueryMap
+
+__all__ = ["QUERY_MAP", "QUERY_OUTBLOCK_MAP", "QUERY_DESC", "load_tr", "load_all"]
+
+QUERY_MAP = LazyQueryMap(__name__, QUERY_DESC, BLOCK_INDEX)
+load_tr = QUERY_MAP.load_tr
+load_all = QUERY_MAP.load_all
+
+
+def __getattr__(name: str) -> Any:
+    value = QUERY_MAP.resolve(name)
+    # Cache on the package so later lookups bypass __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(BLOCK_INDEX))
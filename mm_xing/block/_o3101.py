@@ -0,0 +1,55 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3101 - 해외선물마스터조회(o3101)-API용>
+class o3101InBlock(BaseModel):
+    gubun: str = Field(description="입력구분(예비)", default="")
+
+
+class o3101OutBlock(BaseModel):
+    Symbol: str = Field(description="종목코드", default="")
+    SymbolNm: str = Field(description="종목명", default="")
+    ApplDate: str = Field(description="종목배치수신일(한국일자)", default="")
+    BscGdsCd: str = Field(description="기초상품코드", default="")
+    BscGdsNm: str = Field(description="기초상품명", default="")
+    ExchCd: str = Field(description="거래소코드", default="")
+    ExchNm: str = Field(description="거래소명", default="")
+    CrncyCd: str = Field(description="기준통화코드", default="")
+    NotaCd: str = Field(description="진법구분코드", default="")
+    UntPrc: float = Field(description="호가단위가격", default=0.0)
+    MnChgAmt: float = Field(description="최소가격변동금액", default=0.0)
+    RgltFctr: float = Field(description="가격조정계수", default=0.0)
+    CtrtPrAmt: float = Field(description="계약당금액", default=0.0)
+    GdsCd: str = Field(description="상품구분코드", default="")
+    LstngYr: str = Field(description="월물(년)", default="")
+    LstngM: str = Field(description="월물(월)", default="")
+    EcPrc: float = Field(description="정산가격", default=0.0)
+    DlStrtTm: str = Field(description="거래시작시간", default="")
+    DlEndTm: str = Field(description="거래종료시간", default="")
+    DlPsblCd: str = Field(description="거래가능구분코드", default="")
+    MgnCltCd: str = Field(description="증거금징수구분코드", default="")
+    OpngMgn: float = Field(description="개시증거금", default=0.0)
+    MntncMgn: float = Field(description="유지증거금", default=0.0)
+    OpngMgnR: float = Field(description="개시증거금율", default=0.0)
+    MntncMgnR: float = Field(description="유지증거금율", default=0.0)
+    DotGb: int = Field(description="유효소수점자리수", default=0)
+
+    class Config:
+        from_attributes = True
+
+
+# 해외선물마스터조회(o3101)-API용
+class o3101(BaseModel):
+    inblock: o3101InBlock = Field(description="o3101InBlock")
+    outblock: List[o3101OutBlock] = Field(description="o3101OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for o3101",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3103 - 해외선물차트(분)(o3103)-API용>
+class o3103InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    ncnt: int = Field(description="N분주기", default=0)
+    readcnt: int = Field(description="조회건수", default=0)
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+
+
+class o3103OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    timediff: int = Field(description="시차", default=0)
+    readcnt: int = Field(description="조회건수", default=0)
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+
+
+class o3103OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="현지시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+
+
+# 해외선물차트(분)(o3103)-API용
+class o3103(BaseModel):
+    inblock: o3103InBlock = Field(description="o3103InBlock")
+    outblock: o3103OutBlock = Field(description="o3103OutBlock")
+    outblock1: List[o3103OutBlock1] = Field(description="o3103OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for o3103",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3123 - 해외선물옵션차트(분)(o3123)-API용>
+class o3123InBlock(BaseModel):
+    mktgb: str = Field(description="시장구분", default="")
+    shcode: str = Field(description="단축코드", default="")
+    ncnt: int = Field(description="N분주기", default=0)
+    readcnt: int = Field(description="조회건수", default=0)
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+
+
+class o3123OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    timediff: int = Field(description="시차", default=0)
+    readcnt: int = Field(description="조회건수", default=0)
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+
+
+class o3123OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="현지시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+
+
+# 해외선물옵션차트(분)(o3123)-API용
+class o3123(BaseModel):
+    inblock: o3123InBlock = Field(description="o3123InBlock")
+    outblock: o3123OutBlock = Field(description="o3123OutBlock")
+    outblock1: List[o3123OutBlock1] = Field(description="o3123OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for o3123",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3136 - 해외선물옵션시간대별(Tick)체결(o3136)-API용>
+class o3136InBlock(BaseModel):
+    gubun: str = Field(description="조회구분(0:당일1:전일)", default="")
+    mktgb: str = Field(description="시장구분", default="")
+    shcode: str = Field(description="단축코드", default="")
+    readcnt: int = Field(description="조회갯수", default=0)
+    cts_seq: int = Field(description="순번CTS", default=0)
+
+
+class o3136OutBlock(BaseModel):
+    cts_seq: int = Field(description="순번CTS", default=0)
+
+
+class o3136OutBlock1(BaseModel):
+    ovsdate: str = Field(description="현지일자", default="")
+    ovstime: str = Field(description="현지시간", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    cvolume: int = Field(description="체결수량", default=0)
+    volume: int = Field(description="누적거래량", default=0)
+
+
+# 해외선물옵션시간대별(Tick)체결(o3136)-API용
+class o3136(BaseModel):
+    inblock: o3136InBlock = Field(description="o3136InBlock")
+    outblock: o3136OutBlock = Field(description="o3136OutBlock")
+    outblock1: List[o3136OutBlock1] = Field(description="o3136OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for o3136",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
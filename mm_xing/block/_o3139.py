@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3139 - 해외선물옵션차트용NTick(고정형)(o3139)-API용>
+class o3139InBlock(BaseModel):
+    mktgb: str = Field(description="시장구분", default="")
+    shcode: str = Field(description="단축코드", default="")
+    ncnt: int = Field(description="단위", default=0)
+    qrycnt: int = Field(description="건수", default=0)
+    cts_seq: str = Field(description="연속시간", default="")
+    cts_daygb: str = Field(description="연속당일구분", default="")
+
+
+class o3139OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    rec_count: int = Field(description="레코드카운트", default=0)
+    cts_seq: str = Field(description="연속시간", default="")
+    cts_daygb: str = Field(description="연속당일구분", default="")
+    last_count: int = Field(description="마지막Tick건수", default=0)
+
+
+class o3139OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+
+
+# 해외선물옵션차트용NTick(고정형)(o3139)-API용
+class o3139(BaseModel):
+    inblock: o3139InBlock = Field(description="o3139InBlock")
+    outblock: o3139OutBlock = Field(description="o3139OutBlock")
+    outblock1: List[o3139OutBlock1] = Field(description="o3139OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for o3139",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
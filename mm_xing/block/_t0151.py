@@ -0,0 +1,68 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t0151 - 주식당일매매일지/수수료(전일)(t0151)>
+class t0151InBlock(BaseModel):
+    date: str = Field(description="일자", default="")
+    accno: str = Field(description="계좌번호", default="")
+    cts_medosu: str = Field(description="CTS_매매구분", default="")
+    cts_expcode: str = Field(description="CTS_종목번호", default="")
+    cts_price: str = Field(description="CTS_단가", default="")
+    cts_middiv: str = Field(description="CTS_매체", default="")
+
+
+class t0151OutBlock(BaseModel):
+    mdqty: int = Field(description="매도수량", default=0)
+    mdamt: int = Field(description="매도약정금액", default=0)
+    mdfee: int = Field(description="매도수수료", default=0)
+    mdtax: int = Field(description="매도거래세", default=0)
+    mdargtax: int = Field(description="매도농특세", default=0)
+    tmdtax: int = Field(description="매도제비용합", default=0)
+    mdadjamt: int = Field(description="매도정산금액", default=0)
+    msqty: int = Field(description="매수수량", default=0)
+    msamt: int = Field(description="매수약정금액", default=0)
+    msfee: int = Field(description="매수수수료", default=0)
+    tmstax: int = Field(description="매수제비용합", default=0)
+    msadjamt: int = Field(description="매수정산금액", default=0)
+    tqty: int = Field(description="합계수량", default=0)
+    tamt: int = Field(description="합계약정금액", default=0)
+    tfee: int = Field(description="합계수수료", default=0)
+    tottax: int = Field(description="합계거래세", default=0)
+    targtax: int = Field(description="합계농특세", default=0)
+    ttax: int = Field(description="합계제비용합", default=0)
+    tadjamt: int = Field(description="합계정산금액", default=0)
+    cts_medosu: str = Field(description="CTS_매매구분", default="")
+    cts_expcode: str = Field(description="CTS_종목번호", default="")
+    cts_price: str = Field(description="CTS_단가", default="")
+    cts_middiv: str = Field(description="CTS_매체", default="")
+
+
+class t0151OutBlock1(BaseModel):
+    medosu: str = Field(description="매매구분", default="")
+    expcode: str = Field(description="종목번호", default="")
+    qty: int = Field(description="수량", default=0)
+    price: int = Field(description="단가", default=0)
+    amt: int = Field(description="약정금액", default=0)
+    fee: int = Field(description="수수료", default=0)
+    tax: int = Field(description="거래세", default=0)
+    argtax: int = Field(description="농특세", default=0)
+    adjamt: int = Field(description="정산금액", default=0)
+    middiv: str = Field(description="매체", default="")
+
+
+# 주식당일매매일지/수수료(전일)(t0151)
+class t0151(BaseModel):
+    inblock: t0151InBlock = Field(description="t0151InBlock")
+    outblock: t0151OutBlock = Field(description="t0151OutBlock")
+    outblock1: List[t0151OutBlock1] = Field(description="t0151OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t0151",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
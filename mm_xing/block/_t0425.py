@@ -0,0 +1,65 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t0425 - 주식체결/미체결(t0425)>
+class t0425InBlock(BaseModel):
+    accno: str = Field(description="계좌번호", default="")
+    passwd: str = Field(description="비밀번호", default="")
+    expcode: str = Field(description="종목번호", default="")
+    chegb: str = Field(description="체결구분", default="")
+    medosu: str = Field(description="매매구분", default="")
+    sortgb: str = Field(description="정렬순서", default="")
+    cts_ordno: str = Field(description="주문번호", default="")
+
+
+class t0425OutBlock(BaseModel):
+    tqty: int = Field(description="총주문수량", default=0)
+    tcheqty: int = Field(description="총체결수량", default=0)
+    tordrem: int = Field(description="총미체결수량", default=0)
+    cmss: int = Field(description="추정수수료", default=0)
+    tamt: int = Field(description="총주문금액", default=0)
+    tmdamt: int = Field(description="총매도체결금액", default=0)
+    tmsamt: int = Field(description="총매수체결금액", default=0)
+    tax: int = Field(description="추정제세금", default=0)
+    cts_ordno: str = Field(description="주문번호", default="")
+
+
+class t0425OutBlock1(BaseModel):
+    ordno: int = Field(description="주문번호", default=0)
+    expcode: str = Field(description="종목번호", default="")
+    medosu: str = Field(description="구분", default="")
+    qty: int = Field(description="주문수량", default=0)
+    price: int = Field(description="주문가격", default=0)
+    cheqty: int = Field(description="체결수량", default=0)
+    cheprice: int = Field(description="체결가격", default=0)
+    ordrem: int = Field(description="미체결잔량", default=0)
+    cfmqty: int = Field(description="확인수량", default=0)
+    status: str = Field(description="상태", default="")
+    orgordno: int = Field(description="원주문번호", default=0)
+    ordgb: str = Field(description="유형", default="")
+    ordtime: str = Field(description="주문시간", default="")
+    ordermtd: str = Field(description="주문매체", default="")
+    sysprocseq: int = Field(description="처리순번", default=0)
+    hogagb: str = Field(description="호가유형", default="")
+    price1: int = Field(description="현재가", default=0)
+    orggb: str = Field(description="주문구분", default="")
+    singb: str = Field(description="신용구분", default="")
+    loandt: str = Field(description="대출일자", default="")
+
+
+# 주식체결/미체결(t0425)
+class t0425(BaseModel):
+    inblock: t0425InBlock = Field(description="t0425InBlock")
+    outblock: t0425OutBlock = Field(description="t0425OutBlock")
+    outblock1: List[t0425OutBlock1] = Field(description="t0425OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t0425",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
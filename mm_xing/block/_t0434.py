@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t0434 - 선물/옵션체결/미체결(t0434)>
+class t0434InBlock(BaseModel):
+    accno: str = Field(description="계좌번호", default="")
+    passwd: str = Field(description="비밀번호", default="")
+    expcode: str = Field(description="종목번호", default="")
+    chegb: str = Field(description="체결구분", default="")
+    sortgb: str = Field(description="정렬순서", default="")
+    cts_ordno: str = Field(description="CTS_주문번호", default="")
+
+
+class t0434OutBlock(BaseModel):
+    cts_ordno: str = Field(description="CTS_주문번호", default="")
+
+
+class t0434OutBlock1(BaseModel):
+    ordno: int = Field(description="주문번호", default=0)
+    orgordno: int = Field(description="원주문번호", default=0)
+    medosu: str = Field(description="구분", default="")
+    ordgb: str = Field(description="유형", default="")
+    qty: int = Field(description="주문수량", default=0)
+    price: float = Field(description="주문가격", default=0.0)
+    cheqty: int = Field(description="체결수량", default=0)
+    cheprice: float = Field(description="체결가격", default=0.0)
+    ordrem: int = Field(description="미체결잔량", default=0)
+    status: str = Field(description="상태", default="")
+    ordtime: str = Field(description="주문시간", default="")
+    ordermtd: str = Field(description="주문매체", default="")
+    expcode: str = Field(description="종목번호", default="")
+    rtcode: str = Field(description="사유코드", default="")
+    sysprocseq: int = Field(description="처리순번", default=0)
+    hogatype: str = Field(description="호가타입", default="")
+
+
+# 선물/옵션체결/미체결(t0434)
+class t0434(BaseModel):
+    inblock: t0434InBlock = Field(description="t0434InBlock")
+    outblock: t0434OutBlock = Field(description="t0434OutBlock")
+    outblock1: List[t0434OutBlock1] = Field(description="t0434OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t0434",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1104 - 주식현재가시세메모(t1104)>
+class t1104InBlock(BaseModel):
+    code: str = Field(description="종목코드", default="")
+    nrec: str = Field(description="건수", default="")
+
+
+class t1104InBlock1(BaseModel):
+    indx: str = Field(description="인덱스", default="")
+    gubn: str = Field(description="조건구분", default="")
+    dat1: str = Field(description="데이타1", default="")
+    dat2: str = Field(description="데이타2", default="")
+
+
+class t1104OutBlock(BaseModel):
+    nrec: str = Field(description="출력건수", default="")
+
+
+class t1104OutBlock1(BaseModel):
+    indx: str = Field(description="인덱스", default="")
+    gubn: str = Field(description="조건구분", default="")
+    vals: str = Field(description="출력값", default="")
+
+
+# 주식현재가시세메모(t1104)
+class t1104(BaseModel):
+    inblock: t1104InBlock = Field(description="t1104InBlock")
+    inblock1: t1104InBlock1 = Field(description="t1104InBlock1")
+    outblock: t1104OutBlock = Field(description="t1104OutBlock")
+    outblock1: List[t1104OutBlock1] = Field(description="t1104OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1104",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
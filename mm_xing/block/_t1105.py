@@ -0,0 +1,33 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1105 - 주식피못/디마크조회(t1105)>
+class t1105InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class t1105OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    pbot: int = Field(description="피봇", default=0)
+    offer1: int = Field(description="1차저항", default=0)
+    supp1: int = Field(description="1차지지", default=0)
+    offer2: int = Field(description="2차저항", default=0)
+    supp2: int = Field(description="2차지지", default=0)
+    stdprc: int = Field(description="기준가격", default=0)
+    offerd: int = Field(description="D저항", default=0)
+    suppd: int = Field(description="D지지", default=0)
+
+
+# 주식피못/디마크조회(t1105)
+class t1105(BaseModel):
+    inblock: t1105InBlock = Field(description="t1105InBlock")
+    outblock: t1105OutBlock = Field(description="t1105OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1105",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1109 - 시간외체결량(t1109)>
+class t1109InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    dan_chetime: str = Field(description="체결cts", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1109OutBlock(BaseModel):
+    ctsshcode: str = Field(description="종목cts", default="")
+    ctschetime: str = Field(description="체결cts", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1109OutBlock1(BaseModel):
+    dan_chetime: str = Field(description="시간", default="")
+    dan_price: int = Field(description="현재가", default=0)
+    dan_sign: str = Field(description="전일대비구분", default="")
+    dan_change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    dan_cvolume: int = Field(description="체결량", default=0)
+    chdegree: float = Field(description="체결강도", default=0.0)
+    dan_volume: int = Field(description="누적거래량", default=0)
+
+
+# 시간외체결량(t1109)
+class t1109(BaseModel):
+    inblock: t1109InBlock = Field(description="t1109InBlock")
+    outblock: t1109OutBlock = Field(description="t1109OutBlock")
+    outblock1: List[t1109OutBlock1] = Field(description="t1109OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1109",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1301 - 주식시간대별체결조회(t1301)>
+class t1301InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    cvolume: int = Field(description="특이거래량", default=0)
+    starttime: str = Field(description="시작시간", default="")
+    endtime: str = Field(description="종료시간", default="")
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t1301OutBlock(BaseModel):
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t1301OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    cvolume: int = Field(description="체결수량", default=0)
+    chdegree: float = Field(description="체결강도", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    mdvolume: int = Field(description="매도체결수량", default=0)
+    mdchecnt: int = Field(description="매도체결건수", default=0)
+    msvolume: int = Field(description="매수체결수량", default=0)
+    mschecnt: int = Field(description="매수체결건수", default=0)
+    revolume: int = Field(description="순체결량", default=0)
+    rechecnt: int = Field(description="순체결건수", default=0)
+
+
+# 주식시간대별체결조회(t1301)
+class t1301(BaseModel):
+    inblock: t1301InBlock = Field(description="t1301InBlock")
+    outblock: t1301OutBlock = Field(description="t1301OutBlock")
+    outblock1: List[t1301OutBlock1] = Field(description="t1301OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1301",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
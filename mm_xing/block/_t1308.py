@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1308 - 주식시간대별체결조회챠트(t1308)>
+class t1308InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    starttime: str = Field(description="시작시간", default="")
+    endtime: str = Field(description="종료시간", default="")
+    bun_term: str = Field(description="분간격", default="")
+
+
+class t1308OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    cvolume: int = Field(description="체결수량", default=0)
+    chdegvol: float = Field(description="체결강도(거래량)", default=0.0)
+    chdegcnt: float = Field(description="체결강도(건수)", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    mdvolume: int = Field(description="매도체결수량", default=0)
+    mdchecnt: int = Field(description="매도체결건수", default=0)
+    msvolume: int = Field(description="매수체결수량", default=0)
+    mschecnt: int = Field(description="매수체결건수", default=0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+
+
+# 주식시간대별체결조회챠트(t1308)
+class t1308(BaseModel):
+    inblock: t1308InBlock = Field(description="t1308InBlock")
+    outblock1: List[t1308OutBlock1] = Field(description="t1308OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1308",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
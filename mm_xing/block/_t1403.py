@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1403 - 신규상장종목조회(t1403)>
+class t1403InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    styymm: str = Field(description="시작상장월", default="")
+    enyymm: str = Field(description="종료상장월", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1403OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1403OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    kmprice: int = Field(description="공모가", default=0)
+    date: str = Field(description="등록일", default="")
+    recprice: int = Field(description="등록일기준가", default=0)
+    kmdiff: float = Field(description="기준가등락율", default=0.0)
+    close: int = Field(description="등록일종가", default=0)
+    recdiff: float = Field(description="등록일등락율", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 신규상장종목조회(t1403)
+class t1403(BaseModel):
+    inblock: t1403InBlock = Field(description="t1403InBlock")
+    outblock: t1403OutBlock = Field(description="t1403OutBlock")
+    outblock1: List[t1403OutBlock1] = Field(description="t1403OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1403",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1404 - 관리/불성실/투자유의조회(t1404)>
+class t1404InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    jongchk: str = Field(description="종목체크", default="")
+    cts_shcode: str = Field(description="종목코드_CTS", default="")
+
+
+class t1404OutBlock(BaseModel):
+    cts_shcode: str = Field(description="종목코드_CTS", default="")
+
+
+class t1404OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    date: str = Field(description="지정일", default="")
+    tprice: int = Field(description="지정일주가", default=0)
+    tchange: int = Field(description="지정일대비", default=0)
+    tdiff: float = Field(description="대비율", default=0.0)
+    reason: str = Field(description="사유", default="")
+    shcode: str = Field(description="종목코드", default="")
+    edate: str = Field(description="해제일", default="")
+
+
+# 관리/불성실/투자유의조회(t1404)
+class t1404(BaseModel):
+    inblock: t1404InBlock = Field(description="t1404InBlock")
+    outblock: t1404OutBlock = Field(description="t1404OutBlock")
+    outblock1: List[t1404OutBlock1] = Field(description="t1404OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1404",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
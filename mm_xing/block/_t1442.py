@@ -0,0 +1,51 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1442 - 신고/신저가(t1442)>
+class t1442InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    type1: str = Field(description="신고신저", default="")
+    type2: str = Field(description="기간", default="")
+    type3: str = Field(description="유지여부", default="")
+    jc_num: int = Field(description="대상제외", default=0)
+    sprice: int = Field(description="시작가격", default=0)
+    eprice: int = Field(description="종료가격", default=0)
+    volume: int = Field(description="거래량", default=0)
+    idx: int = Field(description="IDX", default=0)
+    jc_num2: int = Field(description="대상제외2", default=0)
+
+
+class t1442OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1442OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    pastprice: int = Field(description="이전가", default=0)
+    pastsign: str = Field(description="이전가대비구분", default="")
+    pastchange: int = Field(description="이전가대비", default=0)
+    pastdiff: float = Field(description="이전가대비율", default=0.0)
+
+
+# 신고/신저가(t1442)
+class t1442(BaseModel):
+    inblock: t1442InBlock = Field(description="t1442InBlock")
+    outblock: t1442OutBlock = Field(description="t1442OutBlock")
+    outblock1: List[t1442OutBlock1] = Field(description="t1442OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1442",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
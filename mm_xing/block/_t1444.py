@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1444 - 시가총액상위(t1444)>
+class t1444InBlock(BaseModel):
+    upcode: str = Field(description="업종코드", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1444OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1444OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    vol_rate: float = Field(description="거래비중", default=0.0)
+    total: int = Field(description="시가총액", default=0)
+    rate: float = Field(description="비중", default=0.0)
+    for_rate: float = Field(description="외인비중", default=0.0)
+
+
+# 시가총액상위(t1444)
+class t1444(BaseModel):
+    inblock: t1444InBlock = Field(description="t1444InBlock")
+    outblock: t1444OutBlock = Field(description="t1444OutBlock")
+    outblock1: List[t1444OutBlock1] = Field(description="t1444OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1444",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1452 - 거래량상위(t1452)>
+class t1452InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    jnilgubun: str = Field(description="전일구분", default="")
+    sdiff: int = Field(description="시작등락율", default=0)
+    ediff: int = Field(description="종료등락율", default=0)
+    jc_num: int = Field(description="대상제외", default=0)
+    sprice: int = Field(description="시작가격", default=0)
+    eprice: int = Field(description="종료가격", default=0)
+    volume: int = Field(description="거래량", default=0)
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1452OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1452OutBlock1(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    vol: float = Field(description="회전율", default=0.0)
+    jnilvolume: int = Field(description="전일거래량", default=0)
+    bef_diff: float = Field(description="전일비", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 거래량상위(t1452)
+class t1452(BaseModel):
+    inblock: t1452InBlock = Field(description="t1452InBlock")
+    outblock: t1452OutBlock = Field(description="t1452OutBlock")
+    outblock1: List[t1452OutBlock1] = Field(description="t1452OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1452",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
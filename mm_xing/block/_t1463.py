@@ -0,0 +1,50 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1463 - 거래대금상위(t1463)>
+class t1463InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    jnilgubun: str = Field(description="전일구분", default="")
+    jc_num: int = Field(description="대상제외", default=0)
+    sprice: int = Field(description="시작가격", default=0)
+    eprice: int = Field(description="종료가격", default=0)
+    volume: int = Field(description="거래량", default=0)
+    idx: int = Field(description="IDX", default=0)
+    jc_num2: int = Field(description="대상제외2", default=0)
+
+
+class t1463OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1463OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+    jnilvalue: int = Field(description="전일거래대금", default=0)
+    bef_diff: float = Field(description="전일비", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+    filler: str = Field(description="filler", default="")
+    jnilvolume: int = Field(description="전일거래량", default=0)
+
+
+# 거래대금상위(t1463)
+class t1463(BaseModel):
+    inblock: t1463InBlock = Field(description="t1463InBlock")
+    outblock: t1463OutBlock = Field(description="t1463OutBlock")
+    outblock1: List[t1463OutBlock1] = Field(description="t1463OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1463",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,51 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1471 - 시간대별호가잔량추이(t1471)>
+class t1471InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    gubun: str = Field(description="분구분", default="")
+    time: str = Field(description="시간", default="")
+    cnt: str = Field(description="자료개수", default="")
+
+
+class t1471OutBlock(BaseModel):
+    time: str = Field(description="시간CTS", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+
+
+class t1471OutBlock1(BaseModel):
+    time: str = Field(description="체결시간", default="")
+    preoffercha1: int = Field(description="메도증감", default=0)
+    offerrem1: int = Field(description="매도우선잔량", default=0)
+    offerho1: int = Field(description="매도우선호가", default=0)
+    bidho1: int = Field(description="매수우선호가", default=0)
+    bidrem1: int = Field(description="매수우선잔량", default=0)
+    prebidcha1: int = Field(description="매수증감", default=0)
+    totofferrem: int = Field(description="총매도", default=0)
+    totbidrem: int = Field(description="총매수", default=0)
+    totsun: int = Field(description="순매수", default=0)
+    msrate: float = Field(description="매수비율", default=0.0)
+    close: int = Field(description="종가", default=0)
+
+
+# 시간대별호가잔량추이(t1471)
+class t1471(BaseModel):
+    inblock: t1471InBlock = Field(description="t1471InBlock")
+    outblock: t1471OutBlock = Field(description="t1471OutBlock")
+    outblock1: List[t1471OutBlock1] = Field(description="t1471OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1471",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1486 - 시간별예상체결가(t1486)>
+class t1486InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    cts_time: str = Field(description="시간CTS", default="")
+    cnt: str = Field(description="조회건수", default="")
+
+
+class t1486OutBlock(BaseModel):
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t1486OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    price: int = Field(description="예상체결가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    cvolume: int = Field(description="예상체결량", default=0)
+    offerho1: int = Field(description="매도호가", default=0)
+    bidho1: int = Field(description="매수호가", default=0)
+    offerrem1: int = Field(description="매도잔량", default=0)
+    bidrem1: int = Field(description="매수잔량", default=0)
+
+
+# 시간별예상체결가(t1486)
+class t1486(BaseModel):
+    inblock: t1486InBlock = Field(description="t1486InBlock")
+    outblock: t1486OutBlock = Field(description="t1486OutBlock")
+    outblock1: List[t1486OutBlock1] = Field(description="t1486OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1486",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,53 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1488 - 예상체결가등락율상위조회(t1488)>
+class t1488InBlock(BaseModel):
+    gubun: str = Field(description="거래소구분", default="")
+    sign: str = Field(description="상하락구분", default="")
+    jgubun: str = Field(description="장구분", default="")
+    jongchk: str = Field(description="종목체크", default="")
+    idx: int = Field(description="IDX", default=0)
+    volume: str = Field(description="거래량", default="")
+    yesprice: int = Field(description="예상체결시작가격", default=0)
+    yeeprice: int = Field(description="예상체결종료가격", default=0)
+    yevolume: int = Field(description="예상체결량", default=0)
+
+
+class t1488OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1488OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    offerrem: int = Field(description="매도잔량", default=0)
+    offerho: int = Field(description="매도호가", default=0)
+    bidho: int = Field(description="매수호가", default=0)
+    bidrem: int = Field(description="매수잔량", default=0)
+    cnt: int = Field(description="연속일수", default=0)
+    shcode: str = Field(description="종목코드", default="")
+    jkrate: str = Field(description="증거금율", default="")
+    jnilvolume: int = Field(description="전일거래량", default=0)
+
+
+# 예상체결가등락율상위조회(t1488)
+class t1488(BaseModel):
+    inblock: t1488InBlock = Field(description="t1488InBlock")
+    outblock: t1488OutBlock = Field(description="t1488OutBlock")
+    outblock1: List[t1488OutBlock1] = Field(description="t1488OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1488",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1489 - 예상체결량상위조회(t1489)>
+class t1489InBlock(BaseModel):
+    gubun: str = Field(description="거래소구분", default="")
+    jgubun: str = Field(description="장구분", default="")
+    jongchk: str = Field(description="종목체크", default="")
+    idx: int = Field(description="IDX", default=0)
+    yesprice: int = Field(description="예상체결시작가격", default=0)
+    yeeprice: int = Field(description="예상체결종료가격", default=0)
+    yevolume: int = Field(description="예상체결량", default=0)
+
+
+class t1489OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1489OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="예상거래량", default=0)
+    offerho: int = Field(description="매도호가", default=0)
+    bidho: int = Field(description="매수호가", default=0)
+    shcode: str = Field(description="종목코드", default="")
+    jnilvolume: int = Field(description="전일거래량", default=0)
+
+
+# 예상체결량상위조회(t1489)
+class t1489(BaseModel):
+    inblock: t1489InBlock = Field(description="t1489InBlock")
+    outblock: t1489OutBlock = Field(description="t1489OutBlock")
+    outblock1: List[t1489OutBlock1] = Field(description="t1489OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1489",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1492 - 단일가예상등락율상위(t1492)>
+class t1492InBlock(BaseModel):
+    gubun1: str = Field(description="구분", default="")
+    gubun2: str = Field(description="상승하락", default="")
+    jongchk: str = Field(description="종목체크", default="")
+    volume: str = Field(description="거래량", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1492OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1492OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="예상체결가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    yevolume: int = Field(description="예상체결량", default=0)
+    volume: int = Field(description="누적거래량", default=0)
+    offerrem1: int = Field(description="매도잔량", default=0)
+    bidrem1: int = Field(description="매수잔량", default=0)
+    offerho1: int = Field(description="매도호가", default=0)
+    bidho1: int = Field(description="매수호가", default=0)
+    shcode: str = Field(description="종목코드", default="")
+    value: int = Field(description="누적거래대금", default=0)
+
+
+# 단일가예상등락율상위(t1492)
+class t1492(BaseModel):
+    inblock: t1492InBlock = Field(description="t1492InBlock")
+    outblock: t1492OutBlock = Field(description="t1492OutBlock")
+    outblock1: List[t1492OutBlock1] = Field(description="t1492OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1492",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,89 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1511 - 업종현재가(t1511)>
+class t1511InBlock(BaseModel):
+    upcode: str = Field(description="업종코드", default="")
+
+
+class t1511OutBlock(BaseModel):
+    gubun: str = Field(description="업종구분", default="")
+    hname: str = Field(description="업종명", default="")
+    pricejisu: float = Field(description="현재지수", default=0.0)
+    jniljisu: float = Field(description="전일지수", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diffjisu: float = Field(description="지수등락율", default=0.0)
+    jnilvolume: int = Field(description="전일거래량", default=0)
+    volume: int = Field(description="당일거래량", default=0)
+    volumechange: int = Field(description="거래량전일대비", default=0)
+    volumerate: float = Field(description="거래량비율", default=0.0)
+    jnilvalue: int = Field(description="전일거래대금", default=0)
+    value: int = Field(description="당일거래대금", default=0)
+    valuechange: int = Field(description="거래대금전일대비", default=0)
+    valuerate: float = Field(description="거래대금비율", default=0.0)
+    openjisu: float = Field(description="시가지수", default=0.0)
+    opendiff: float = Field(description="시가등락율", default=0.0)
+    opentime: str = Field(description="시가시간", default="")
+    highjisu: float = Field(description="고가지수", default=0.0)
+    highdiff: float = Field(description="고가등락율", default=0.0)
+    hightime: str = Field(description="고가시간", default="")
+    lowjisu: float = Field(description="저가지수", default=0.0)
+    lowdiff: float = Field(description="저가등락율", default=0.0)
+    lowtime: str = Field(description="저가시간", default="")
+    whjisu: float = Field(description="52주최고지수", default=0.0)
+    whchange: float = Field(description="52주최고현재가대비", default=0.0)
+    whjday: str = Field(description="52주최고지수일자", default="")
+    wljisu: float = Field(description="52주최저지수", default=0.0)
+    wlchange: float = Field(description="52주최저현재가대비", default=0.0)
+    wljday: str = Field(description="52주최저지수일자", default="")
+    yhjisu: float = Field(description="연중최고지수", default=0.0)
+    yhchange: float = Field(description="연중최고현재가대비", default=0.0)
+    yhjday: str = Field(description="연중최고지수일자", default="")
+    yljisu: float = Field(description="연중최저지수", default=0.0)
+    ylchange: float = Field(description="연중최저현재가대비", default=0.0)
+    yljday: str = Field(description="연중최저지수일자", default="")
+    firstjcode: str = Field(description="첫번째지수코드", default="")
+    firstjname: str = Field(description="첫번째지수명", default="")
+    firstjisu: float = Field(description="첫번째지수", default=0.0)
+    firsign: str = Field(description="첫번째대비구분", default="")
+    firchange: float = Field(description="첫번째전일대비", default=0.0)
+    firdiff: float = Field(description="첫번째등락율", default=0.0)
+    secondjcode: str = Field(description="두번째지수코드", default="")
+    secondjname: str = Field(description="두번째지수명", default="")
+    secondjisu: float = Field(description="두번째지수", default=0.0)
+    secsign: str = Field(description="두번째대비구분", default="")
+    secchange: float = Field(description="두번째전일대비", default=0.0)
+    secdiff: float = Field(description="두번째등락율", default=0.0)
+    thirdjcode: str = Field(description="세번째지수코드", default="")
+    thirdjname: str = Field(description="세번째지수명", default="")
+    thirdjisu: float = Field(description="세번째지수", default=0.0)
+    thrsign: str = Field(description="세번째대비구분", default="")
+    thrchange: float = Field(description="세번째전일대비", default=0.0)
+    thrdiff: float = Field(description="세번째등락율", default=0.0)
+    fourthjcode: str = Field(description="네번째지수코드", default="")
+    fourthjname: str = Field(description="네번째지수명", default="")
+    fourthjisu: float = Field(description="네번째지수", default=0.0)
+    forsign: str = Field(description="네번째대비구분", default="")
+    forchange: float = Field(description="네번째전일대비", default=0.0)
+    fordiff: float = Field(description="네번째등락율", default=0.0)
+    highjo: int = Field(description="상승종목수", default=0)
+    upjo: int = Field(description="상한종목수", default=0)
+    unchgjo: int = Field(description="보합종목수", default=0)
+    lowjo: int = Field(description="하락종목수", default=0)
+    downjo: int = Field(description="하한종목수", default=0)
+
+
+# 업종현재가(t1511)
+class t1511(BaseModel):
+    inblock: t1511InBlock = Field(description="t1511InBlock")
+    outblock: t1511OutBlock = Field(description="t1511OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1511",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,60 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1514 - 업종기간별추이(t1514)>
+class t1514InBlock(BaseModel):
+    upcode: str = Field(description="업종코드", default="")
+    gubun1: str = Field(description="구분1", default="")
+    gubun2: str = Field(description="구분2", default="")
+    cts_date: str = Field(description="CTS_일자", default="")
+    cnt: str = Field(description="조회건수", default="")
+    rate_gbn: str = Field(description="비중구분", default="")
+
+
+class t1514OutBlock(BaseModel):
+    cts_date: str = Field(description="CTS_일자", default="")
+
+
+class t1514OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    jisu: float = Field(description="지수", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+    value1: int = Field(description="거래대금1", default=0)
+    high: int = Field(description="상승", default=0)
+    unchg: int = Field(description="보합", default=0)
+    low: int = Field(description="하락", default=0)
+    uprate: float = Field(description="상승종목비율", default=0.0)
+    frgsvolume: int = Field(description="외인순매수", default=0)
+    openjisu: float = Field(description="시가", default=0.0)
+    highjisu: float = Field(description="고가", default=0.0)
+    lowjisu: float = Field(description="저가", default=0.0)
+    value2: int = Field(description="거래대금2", default=0)
+    up: int = Field(description="상한", default=0)
+    down: int = Field(description="하한", default=0)
+    totjo: int = Field(description="종목수", default=0)
+    orgsvolume: int = Field(description="기관순매수", default=0)
+    upcode: str = Field(description="업종코드", default="")
+    rate: float = Field(description="거래비중", default=0.0)
+    divrate: float = Field(description="업종배당수익률", default=0.0)
+
+
+# 업종기간별추이(t1514)
+class t1514(BaseModel):
+    inblock: t1514InBlock = Field(description="t1514InBlock")
+    outblock: t1514OutBlock = Field(description="t1514OutBlock")
+    outblock1: List[t1514OutBlock1] = Field(description="t1514OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1514",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
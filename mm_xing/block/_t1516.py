@@ -0,0 +1,55 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1516 - 업종별종목시세(t1516)>
+class t1516InBlock(BaseModel):
+    upcode: str = Field(description="업종코드", default="")
+    gubun: str = Field(description="구분", default="")
+    shcode: str = Field(description="종목코드", default="")
+
+
+class t1516OutBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    pricejisu: float = Field(description="지수", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    jdiff: float = Field(description="등락율", default=0.0)
+
+
+class t1516OutBlock1(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    sojinrate: float = Field(description="소진율", default=0.0)
+    beta: float = Field(description="베타계수", default=0.0)
+    perx: float = Field(description="PER", default=0.0)
+    frgsvolume: int = Field(description="외인순매수", default=0)
+    orgsvolume: int = Field(description="기관순매수", default=0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+    total: int = Field(description="시가총액", default=0)
+    value: int = Field(description="거래대금", default=0)
+
+
+# 업종별종목시세(t1516)
+class t1516(BaseModel):
+    inblock: t1516InBlock = Field(description="t1516InBlock")
+    outblock: t1516OutBlock = Field(description="t1516OutBlock")
+    outblock1: List[t1516OutBlock1] = Field(description="t1516OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1516",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1537 - 테마종목별시세조회(t1537)>
+class t1537InBlock(BaseModel):
+    tmcode: str = Field(description="테마코드", default="")
+
+
+class t1537OutBlock(BaseModel):
+    upcnt: int = Field(description="상승종목수", default=0)
+    tmcnt: int = Field(description="테마종목수", default=0)
+    uprate: int = Field(description="상승종목비율", default=0)
+    tmname: str = Field(description="테마명", default="")
+
+
+class t1537OutBlock1(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    jniltime: float = Field(description="전일동시간", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+    yeprice: int = Field(description="예상체결가", default=0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    value: int = Field(description="누적거래대금(단위:백만)", default=0)
+    marketcap: int = Field(description="시가총액(단위:백만)", default=0)
+
+
+# 테마종목별시세조회(t1537)
+class t1537(BaseModel):
+    inblock: t1537InBlock = Field(description="t1537InBlock")
+    outblock: t1537OutBlock = Field(description="t1537OutBlock")
+    outblock1: List[t1537OutBlock1] = Field(description="t1537OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1537",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
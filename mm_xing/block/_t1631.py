@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1631 - 프로그램매매종합조회(t1631)>
+class t1631InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    dgubun: str = Field(description="일자구분", default="")
+    sdate: str = Field(description="시작일자", default="")
+    edate: str = Field(description="종료일자", default="")
+
+
+class t1631OutBlock(BaseModel):
+    cdhrem: int = Field(description="매도차익미체결잔량", default=0)
+    bdhrem: int = Field(description="매도비차익미체결잔량", default=0)
+    tcdrem: int = Field(description="매도차익주문수량", default=0)
+    tbdrem: int = Field(description="매도비차익주문수량", default=0)
+    cshrem: int = Field(description="매수차익미체결잔량", default=0)
+    bshrem: int = Field(description="매수비차익미체결잔량", default=0)
+    tcsrem: int = Field(description="매수차익주문수량", default=0)
+    tbsrem: int = Field(description="매수비차익주문수량", default=0)
+
+
+class t1631OutBlock1(BaseModel):
+    offervolume: int = Field(description="매도수량", default=0)
+    offervalue: int = Field(description="매도금액", default=0)
+    bidvolume: int = Field(description="매수수량", default=0)
+    bidvalue: int = Field(description="매수금액", default=0)
+    volume: int = Field(description="순매수수량", default=0)
+    value: int = Field(description="순매수금액", default=0)
+
+
+# 프로그램매매종합조회(t1631)
+class t1631(BaseModel):
+    inblock: t1631InBlock = Field(description="t1631InBlock")
+    outblock: t1631OutBlock = Field(description="t1631OutBlock")
+    outblock1: List[t1631OutBlock1] = Field(description="t1631OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1631",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,53 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1633 - 기간별프로그램매매추이(t1633)>
+class t1633InBlock(BaseModel):
+    gubun: str = Field(description="시장구분", default="")
+    gubun1: str = Field(description="금액수량구분", default="")
+    gubun2: str = Field(description="수치누적구분", default="")
+    gubun3: str = Field(description="일주월구분", default="")
+    fdate: str = Field(description="from일자", default="")
+    tdate: str = Field(description="to일자", default="")
+    gubun4: str = Field(description="직전대비증감구분", default="")
+    date: str = Field(description="날짜", default="")
+
+
+class t1633OutBlock(BaseModel):
+    date: str = Field(description="날짜", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1633OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    jisu: float = Field(description="KP200", default=0.0)
+    sign: str = Field(description="대비구분", default="")
+    change: float = Field(description="대비", default=0.0)
+    tot3: int = Field(description="전체순매수", default=0)
+    tot1: int = Field(description="전체매수", default=0)
+    tot2: int = Field(description="전체매도", default=0)
+    cha3: int = Field(description="차익순매수", default=0)
+    cha1: int = Field(description="차익매수", default=0)
+    cha2: int = Field(description="차익매도", default=0)
+    bcha3: int = Field(description="비차익순매수", default=0)
+    bcha1: int = Field(description="비차익매수", default=0)
+    bcha2: int = Field(description="비차익매도", default=0)
+    volume: int = Field(description="거래량", default=0)
+
+
+# 기간별프로그램매매추이(t1633)
+class t1633(BaseModel):
+    inblock: t1633InBlock = Field(description="t1633InBlock")
+    outblock: t1633OutBlock = Field(description="t1633OutBlock")
+    outblock1: List[t1633OutBlock1] = Field(description="t1633OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1633",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,51 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1636 - 종목별프로그램매매동향(t1636)>
+class t1636InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    gubun1: str = Field(description="금액수량구분", default="")
+    gubun2: str = Field(description="정렬기준", default="")
+    shcode: str = Field(description="종목코드", default="")
+    cts_idx: int = Field(description="IDXCTS", default=0)
+
+
+class t1636OutBlock(BaseModel):
+    cts_idx: int = Field(description="IDXCTS", default=0)
+
+
+class t1636OutBlock1(BaseModel):
+    rank: int = Field(description="순위", default=0)
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="대비구분", default="")
+    change: int = Field(description="대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    svalue: int = Field(description="순매수금액", default=0)
+    offervalue: int = Field(description="매도금액", default=0)
+    stksvalue: int = Field(description="매수금액", default=0)
+    svolume: int = Field(description="순매수수량", default=0)
+    offervolume: int = Field(description="매도수량", default=0)
+    stksvolume: int = Field(description="매수수량", default=0)
+    sgta: int = Field(description="시가총액", default=0)
+    rate: float = Field(description="비중", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 종목별프로그램매매동향(t1636)
+class t1636(BaseModel):
+    inblock: t1636InBlock = Field(description="t1636InBlock")
+    outblock: t1636OutBlock = Field(description="t1636OutBlock")
+    outblock1: List[t1636OutBlock1] = Field(description="t1636OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1636",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
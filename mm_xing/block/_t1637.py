@@ -0,0 +1,50 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1637 - 종목별프로그램매매추이(t1637)>
+class t1637InBlock(BaseModel):
+    gubun1: str = Field(description="수량금액구분(0:수량1:금액)", default="")
+    gubun2: str = Field(description="시간일별구분(0:시간1:일자)", default="")
+    shcode: str = Field(description="종목코드", default="")
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+    cts_idx: int = Field(description="IDXCTS(9999:차트)", default=0)
+
+
+class t1637OutBlock(BaseModel):
+    cts_idx: int = Field(description="IDXCTS", default=0)
+
+
+class t1637OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="대비구분", default="")
+    change: int = Field(description="대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    svalue: int = Field(description="순매수금액", default=0)
+    offervalue: int = Field(description="매도금액", default=0)
+    stksvalue: int = Field(description="매수금액", default=0)
+    svolume: int = Field(description="순매수수량", default=0)
+    offervolume: int = Field(description="매도수량", default=0)
+    stksvolume: int = Field(description="매수수량", default=0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 종목별프로그램매매추이(t1637)
+class t1637(BaseModel):
+    inblock: t1637InBlock = Field(description="t1637InBlock")
+    outblock: t1637OutBlock = Field(description="t1637OutBlock")
+    outblock1: List[t1637OutBlock1] = Field(description="t1637OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1637",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
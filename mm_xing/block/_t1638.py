@@ -0,0 +1,42 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1638 - 종목별잔량/사전공시(t1638)>
+class t1638InBlock(BaseModel):
+    gubun1: str = Field(description="구분", default="")
+    shcode: str = Field(description="종목코드", default="")
+    gubun2: str = Field(description="정렬", default="")
+
+
+class t1638OutBlock(BaseModel):
+    rank: int = Field(description="순위", default=0)
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    sigatotrt: float = Field(description="시총비중", default=0.0)
+    obuyvol: int = Field(description="순매수잔량", default=0)
+    buyrem: int = Field(description="매수잔량", default=0)
+    psgvolume: int = Field(description="매수공시수량", default=0)
+    sellrem: int = Field(description="매도잔량", default=0)
+    pdgvolume: int = Field(description="매도공시수량", default=0)
+    sigatot: int = Field(description="시가총액", default=0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 종목별잔량/사전공시(t1638)
+class t1638(BaseModel):
+    inblock: t1638InBlock = Field(description="t1638InBlock")
+    outblock: List[t1638OutBlock] = Field(description="t1638OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1638",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1662 - 시간대별프로그램매매추이(차트)(t1662)>
+class t1662InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    gubun1: str = Field(description="금액수량구분", default="")
+    gubun3: str = Field(description="전일구분", default="")
+
+
+class t1662OutBlock(BaseModel):
+    time: str = Field(description="시간", default="")
+    k200jisu: float = Field(description="KP200", default=0.0)
+    sign: str = Field(description="대비구분", default="")
+    change: float = Field(description="대비", default=0.0)
+    k200basis: float = Field(description="BASIS", default=0.0)
+    tot3: int = Field(description="전체순매수", default=0)
+    tot1: int = Field(description="전체매수", default=0)
+    tot2: int = Field(description="전체매도", default=0)
+    cha3: int = Field(description="차익순매수", default=0)
+    cha1: int = Field(description="차익매수", default=0)
+    cha2: int = Field(description="차익매도", default=0)
+    bcha3: int = Field(description="비차익순매수", default=0)
+    bcha1: int = Field(description="비차익매수", default=0)
+    bcha2: int = Field(description="비차익매도", default=0)
+    volume: int = Field(description="거래량", default=0)
+
+
+# 시간대별프로그램매매추이(차트)(t1662)
+class t1662(BaseModel):
+    inblock: t1662InBlock = Field(description="t1662InBlock")
+    outblock: List[t1662OutBlock] = Field(description="t1662OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1662",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
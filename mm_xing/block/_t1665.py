@@ -0,0 +1,72 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1665 - 기간별투자자매매추이(챠트)>
+class t1665InBlock(BaseModel):
+    market: str = Field(
+        description="시장구분(1:kospi2:kp2003:kosdaq4:선물5:풋옵션6:콜옵션)",
+        default="",
+    )
+    upcode: str = Field(description="업종코드", default="")
+    gubun2: str = Field(description="수치구분(1:수치2:누적)", default="")
+    gubun3: str = Field(description="단위구분(1:일2:주3:월)", default="")
+    from_date: str = Field(description="시작날짜", default="")
+    to_date: str = Field(description="종료날짜", default="")
+
+
+class t1665OutBlock(BaseModel):
+    mcode: str = Field(description="시장코드", default="")
+    mname: str = Field(description="시장명", default="")
+
+
+class t1665OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    sv_08: int = Field(description="개인수량", default=0)
+    sv_17: int = Field(description="외인계수량(등록+미등록)", default=0)
+    sv_18: int = Field(description="기관계수량", default=0)
+    sv_01: int = Field(description="증권수량", default=0)
+    sv_03: int = Field(description="투신수량", default=0)
+    sv_04: int = Field(description="은행수량", default=0)
+    sv_02: int = Field(description="보험수량", default=0)
+    sv_05: int = Field(description="종금수량", default=0)
+    sv_06: int = Field(description="기금수량", default=0)
+    sv_07: int = Field(description="기타수량", default=0)
+    sv_00: int = Field(description="사모펀드수량", default=0)
+    sv_09: int = Field(description="등록외국인수량", default=0)
+    sv_10: int = Field(description="미등록외국인수량", default=0)
+    sv_11: int = Field(description="국가수량", default=0)
+    sv_99: int = Field(description="기타계수량(기타+국가)", default=0)
+    sa_08: float = Field(description="개인금액", default=0.0)
+    sa_17: float = Field(description="외인계금액(등록+미등록)", default=0.0)
+    sa_18: float = Field(description="기관계금액", default=0.0)
+    sa_01: float = Field(description="증권금액", default=0.0)
+    sa_03: float = Field(description="투신금액", default=0.0)
+    sa_04: float = Field(description="은행금액", default=0.0)
+    sa_02: float = Field(description="보험금액", default=0.0)
+    sa_05: float = Field(description="종금금액", default=0.0)
+    sa_06: float = Field(description="기금금액", default=0.0)
+    sa_07: float = Field(description="기타금액", default=0.0)
+    sa_00: float = Field(description="사모펀드금액", default=0.0)
+    sa_09: float = Field(description="등록외국인금액", default=0.0)
+    sa_10: float = Field(description="미등록외국인금액", default=0.0)
+    sa_11: float = Field(description="국가금액", default=0.0)
+    sa_99: float = Field(description="기타계금액(기타+국가)", default=0.0)
+    jisu: float = Field(description="시장지수", default=0.0)
+
+
+# 기간별투자자매매추이(챠트)
+class t1665(BaseModel):
+    inblock: t1665InBlock = Field(description="t1665InBlock")
+    outblock: t1665OutBlock = Field(description="t1665OutBlock")
+    outblock1: List[t1665OutBlock1] = Field(description="t1665OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1665",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
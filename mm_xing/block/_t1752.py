@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1752 - 종목별상위회원사(t1752)>
+class t1752InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    traddate1: str = Field(description="조회날짜1", default="")
+    traddate2: str = Field(description="조회날짜2", default="")
+    fwgubun1: str = Field(description="외국계구분", default="")
+    cts_idx: int = Field(description="CTSIDX", default=0)
+
+
+class t1752OutBlock(BaseModel):
+    fwdvl: int = Field(description="외국계매도", default=0)
+    fwsvl: int = Field(description="외국계매수", default=0)
+    cts_idx: int = Field(description="CTSIDX", default=0)
+
+
+class t1752OutBlock1(BaseModel):
+    tradname: str = Field(description="회원사", default="")
+    tradmdvol: int = Field(description="매도수량", default=0)
+    tradmsvol: int = Field(description="매수수량", default=0)
+    tradmssvol: int = Field(description="순매수", default=0)
+    wintrd: int = Field(description="창구거래", default=0)
+    winrat: float = Field(description="비중", default=0.0)
+    tradno: str = Field(description="회원사코드", default="")
+    wgubun: str = Field(description="외국계여부", default="")
+    swinrat: float = Field(description="순비중", default=0.0)
+
+
+# 종목별상위회원사(t1752)
+class t1752(BaseModel):
+    inblock: t1752InBlock = Field(description="t1752InBlock")
+    outblock: t1752OutBlock = Field(description="t1752OutBlock")
+    outblock1: List[t1752OutBlock1] = Field(description="t1752OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1752",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
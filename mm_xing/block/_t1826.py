@@ -0,0 +1,28 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1826 - 종목Q클릭검색리스트조회(씽큐스마트)(t1826)>
+class t1826InBlock(BaseModel):
+    search_gb: str = Field(description="검색구분(0:핵심검색1:지표검색2:시세동향3:투자자동향)", default="")
+
+
+class t1826OutBlock(BaseModel):
+    search_cd: str = Field(description="검색코드", default="")
+    search_nm: str = Field(description="검색명", default="")
+
+
+# 종목Q클릭검색리스트조회(씽큐스마트)(t1826)
+class t1826(BaseModel):
+    inblock: t1826InBlock = Field(description="t1826InBlock")
+    outblock: List[t1826OutBlock] = Field(description="t1826OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1826",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
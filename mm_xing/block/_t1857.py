@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1857 - e종목검색(신버전API용)>
+class t1857InBlock(BaseModel):
+    sRealFlag: str = Field(description="실시간구분(0:조회 1:실시간)", default="")
+    sSearchFlag: str = Field(description="종목검색구분(F:파일 S:서버)", default="")
+    query_index: str = Field(description="종목검색입력값", default="")
+
+
+class t1857OutBlock(BaseModel):
+    result_count: int = Field(description="검색종목수", default=0)
+    result_time: str = Field(description="포착시간", default="")
+    AlertNum: str = Field(description="실시간키", default="")
+
+
+class t1857OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    JobFlag: str = Field(description="종목상태(N:진입 R:재진입 O:이탈)", default="")
+
+
+# e종목검색(신버전API용)
+class t1857(BaseModel):
+    inblock: t1857InBlock = Field(description="t1857InBlock")
+    outblock: t1857OutBlock = Field(description="t1857OutBlock")
+    outblock1: List[t1857OutBlock1] = Field(description="t1857OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1857",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,158 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1901 - ETF현재가(시세)조회(t1901)>
+class t1901InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class t1901OutBlock(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: float = Field(description="누적거래량", default=0.0)
+    recprice: int = Field(description="기준가", default=0)
+    avg: int = Field(description="가중평균", default=0)
+    uplmtprice: int = Field(description="상한가", default=0)
+    dnlmtprice: int = Field(description="하한가", default=0)
+    jnilvolume: float = Field(description="전일거래량", default=0.0)
+    volumediff: int = Field(description="거래량차", default=0)
+    open: int = Field(description="시가", default=0)
+    opentime: str = Field(description="시가시간", default="")
+    high: int = Field(description="고가", default=0)
+    hightime: str = Field(description="고가시간", default="")
+    low: int = Field(description="저가", default=0)
+    lowtime: str = Field(description="저가시간", default="")
+    high52w: int = Field(description="52최고가", default=0)
+    high52wdate: str = Field(description="52최고가일", default="")
+    low52w: int = Field(description="52최저가", default=0)
+    low52wdate: str = Field(description="52최저가일", default="")
+    exhratio: float = Field(description="소진율", default=0.0)
+    flmtvol: float = Field(description="외국인보유수량", default=0.0)
+    per: float = Field(description="PER", default=0.0)
+    listing: int = Field(description="상장주식수(천)", default=0)
+    jkrate: int = Field(description="증거금율", default=0)
+    vol: float = Field(description="회전율", default=0.0)
+    shcode: str = Field(description="단축코드", default="")
+    value: int = Field(description="누적거래대금", default=0)
+    highyear: int = Field(description="연중최고가", default=0)
+    highyeardate: str = Field(description="연중최고일자", default="")
+    lowyear: int = Field(description="연중최저가", default=0)
+    lowyeardate: str = Field(description="연중최저일자", default="")
+    upname: str = Field(description="업종명", default="")
+    upcode: str = Field(description="업종코드", default="")
+    upprice: float = Field(description="업종현재가", default=0.0)
+    upsign: str = Field(description="업종전일비구분", default="")
+    upchange: float = Field(description="업종전일대비", default=0.0)
+    updiff: float = Field(description="업종등락율", default=0.0)
+    futname: str = Field(description="선물최근월물명", default="")
+    futcode: str = Field(description="선물최근월물코드", default="")
+    futprice: float = Field(description="선물현재가", default=0.0)
+    futsign: str = Field(description="선물전일비구분", default="")
+    futchange: float = Field(description="선물전일대비", default=0.0)
+    futdiff: float = Field(description="선물등락율", default=0.0)
+    nav: float = Field(description="NAV", default=0.0)
+    navsign: str = Field(description="NAV전일대비구분", default="")
+    navchange: float = Field(description="NAV전일대비", default=0.0)
+    navdiff: float = Field(description="NAV등락율", default=0.0)
+    cocrate: float = Field(description="추적오차율", default=0.0)
+    kasis: float = Field(description="괴리율", default=0.0)
+    subprice: int = Field(description="대용가", default=0)
+    offerno1: str = Field(description="매도증권사코드1", default="")
+    bidno1: str = Field(description="매수증권사코드1", default="")
+    dvol1: int = Field(description="총매도수량1", default=0)
+    svol1: int = Field(description="총매수수량1", default=0)
+    dcha1: int = Field(description="매도증감1", default=0)
+    scha1: int = Field(description="매수증감1", default=0)
+    ddiff1: float = Field(description="매도비율1", default=0.0)
+    sdiff1: float = Field(description="매수비율1", default=0.0)
+    offerno2: str = Field(description="매도증권사코드2", default="")
+    bidno2: str = Field(description="매수증권사코드2", default="")
+    dvol2: int = Field(description="총매도수량2", default=0)
+    svol2: int = Field(description="총매수수량2", default=0)
+    dcha2: int = Field(description="매도증감2", default=0)
+    scha2: int = Field(description="매수증감2", default=0)
+    ddiff2: float = Field(description="매도비율2", default=0.0)
+    sdiff2: float = Field(description="매수비율2", default=0.0)
+    offerno3: str = Field(description="매도증권사코드3", default="")
+    bidno3: str = Field(description="매수증권사코드3", default="")
+    dvol3: int = Field(description="총매도수량3", default=0)
+    svol3: int = Field(description="총매수수량3", default=0)
+    dcha3: int = Field(description="매도증감3", default=0)
+    scha3: int = Field(description="매수증감3", default=0)
+    ddiff3: float = Field(description="매도비율3", default=0.0)
+    sdiff3: float = Field(description="매수비율3", default=0.0)
+    offerno4: str = Field(description="매도증권사코드4", default="")
+    bidno4: str = Field(description="매수증권사코드4", default="")
+    dvol4: int = Field(description="총매도수량4", default=0)
+    svol4: int = Field(description="총매수수량4", default=0)
+    dcha4: int = Field(description="매도증감4", default=0)
+    scha4: int = Field(description="매수증감4", default=0)
+    ddiff4: float = Field(description="매도비율4", default=0.0)
+    sdiff4: float = Field(description="매수비율4", default=0.0)
+    offerno5: str = Field(description="매도증권사코드5", default="")
+    bidno5: str = Field(description="매수증권사코드5", default="")
+    dvol5: int = Field(description="총매도수량5", default=0)
+    svol5: int = Field(description="총매수수량5", default=0)
+    dcha5: int = Field(description="매도증감5", default=0)
+    scha5: int = Field(description="매수증감5", default=0)
+    ddiff5: float = Field(description="매도비율5", default=0.0)
+    sdiff5: float = Field(description="매수비율5", default=0.0)
+    fwdvl: int = Field(description="외국계매도합계수량", default=0)
+    ftradmdcha: int = Field(description="외국계매도직전대비", default=0)
+    ftradmddiff: float = Field(description="외국계매도비율", default=0.0)
+    fwsvl: int = Field(description="외국계매수합계수량", default=0)
+    ftradmscha: int = Field(description="외국계매수직전대비", default=0)
+    ftradmsdiff: float = Field(description="외국계매수비율", default=0.0)
+    upname2: str = Field(description="참고지수명", default="")
+    upcode2: str = Field(description="참고지수코드", default="")
+    upprice2: float = Field(description="참고지수현재가", default=0.0)
+    jnilnav: float = Field(description="전일NAV", default=0.0)
+    jnilnavsign: str = Field(description="전일NAV전일대비구분", default="")
+    jnilnavchange: float = Field(description="전일NAV전일대비", default=0.0)
+    jnilnavdiff: float = Field(description="전일NAV등락율", default=0.0)
+    etftotcap: int = Field(description="순자산총액(억원)", default=0)
+    spread: float = Field(description="스프레드", default=0.0)
+    leverage: int = Field(description="레버리지", default=0)
+    taxgubun: str = Field(description="과세구분", default="")
+    opcom_nmk: str = Field(description="운용사", default="")
+    lp_nm1: str = Field(description="LP1", default="")
+    lp_nm2: str = Field(description="LP2", default="")
+    lp_nm3: str = Field(description="LP3", default="")
+    lp_nm4: str = Field(description="LP4", default="")
+    lp_nm5: str = Field(description="LP5", default="")
+    etf_cp: str = Field(description="복제방법", default="")
+    etf_kind: str = Field(description="상품유형(Filler)", default="")
+    vi_gubun: str = Field(description="VI발동해제", default="")
+    etn_kind_cd: str = Field(description="ETN상품분류", default="")
+    lastymd: str = Field(description="ETN만기일", default="")
+    payday: str = Field(description="ETN지급일", default="")
+    lastdate: str = Field(description="ETN최종거래일", default="")
+    issuernmk: str = Field(description="ETN발행시장참가자", default="")
+    last_sdate: str = Field(description="ETN만기상환가격결정시작일", default="")
+    last_edate: str = Field(description="ETN만기상환가격결정종료일", default="")
+    lp_holdvol: str = Field(description="ETNLP보유수량", default="")
+    listdate: str = Field(description="상장일", default="")
+    etp_gb: str = Field(description="ETP상품구분코드", default="")
+    etn_elback_yn: str = Field(description="ETN조기상환가능여부", default="")
+    settletype: str = Field(description="최종결제", default="")
+    idx_asset_class1: str = Field(description="지수자산분류코드(대분류)", default="")
+    ty_text: str = Field(description="ETF/ETN투자유의", default="")
+    leverage2: float = Field(description="추적수익률배수", default=0.0)
+
+
+# ETF현재가(시세)조회(t1901)
+class t1901(BaseModel):
+    inblock: t1901InBlock = Field(description="t1901InBlock")
+    outblock: t1901OutBlock = Field(description="t1901OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1901",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
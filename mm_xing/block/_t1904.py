@@ -0,0 +1,84 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1904 - ETF구성종목조회(t1904)>
+class t1904InBlock(BaseModel):
+    shcode: str = Field(description="ETF단축코드", default="")
+    date: str = Field(description="PDF적용일자", default="")
+    sgb: str = Field(description="정렬기준(1:평가금액2:증권수)", default="")
+
+
+class t1904OutBlock(BaseModel):
+    chk_tday: str = Field(description="당일구분", default="")
+    date: str = Field(description="PDF적용일자", default="")
+    price: int = Field(description="ETF현재가", default=0)
+    sign: str = Field(description="ETF전일대비구분", default="")
+    change: int = Field(description="ETF전일대비", default=0)
+    diff: float = Field(description="ETF등락율", default=0.0)
+    volume: int = Field(description="ETF누적거래량", default=0)
+    nav: float = Field(description="NAV", default=0.0)
+    navsign: str = Field(description="NAV전일대비구분", default="")
+    navchange: float = Field(description="NAV전일대비", default=0.0)
+    navdiff: float = Field(description="NAV등락율", default=0.0)
+    jnilnav: float = Field(description="전일NAV", default=0.0)
+    jnilnavsign: str = Field(description="전일NAV전일대비구분", default="")
+    jnilnavchange: float = Field(description="전일NAV전일대비", default=0.0)
+    jnilnavdiff: float = Field(description="전일NAV등락율", default=0.0)
+    upname: str = Field(description="업종명", default="")
+    upcode: str = Field(description="업종코드", default="")
+    upprice: float = Field(description="업종현재가", default=0.0)
+    upsign: str = Field(description="업종전일비구분", default="")
+    upchange: float = Field(description="업종전일대비", default=0.0)
+    updiff: float = Field(description="업종등락율", default=0.0)
+    futname: str = Field(description="선물최근월물명", default="")
+    futcode: str = Field(description="선물최근월물코드", default="")
+    futprice: float = Field(description="선물현재가", default=0.0)
+    futsign: str = Field(description="선물전일비구분", default="")
+    futchange: float = Field(description="선물전일대비", default=0.0)
+    futdiff: float = Field(description="선물등락율", default=0.0)
+    upname2: str = Field(description="참고지수명", default="")
+    upcode2: str = Field(description="참고지수코드", default="")
+    upprice2: float = Field(description="참고지수현재가", default=0.0)
+    etftotcap: int = Field(description="순자산총액(단위:억)", default=0)
+    etfnum: int = Field(description="구성종목수", default=0)
+    etfcunum: int = Field(description="CU주식수", default=0)
+    cash: int = Field(description="현금", default=0)
+    opcom_nmk: str = Field(description="운용사명", default="")
+    tot_pval: int = Field(description="전종목평가금액합", default=0)
+    tot_sigatval: int = Field(description="전종목구성시가총액합", default=0)
+
+
+class t1904OutBlock1(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    value: int = Field(description="거래대금(백만)", default=0)
+    icux: int = Field(description="단위증권수(계약수/원화현금/USD현금/창고증권)", default=0)
+    parprice: int = Field(description="액면금액/설정현금액", default=0)
+    pvalue: int = Field(description="평가금액", default=0)
+    sigatvalue: int = Field(description="구성시가총액", default=0)
+    profitdate: str = Field(description="PDF적용일자", default="")
+    weight: float = Field(description="비중(평가금액)", default=0.0)
+    diff2: float = Field(description="ETF종목과등락차", default=0.0)
+
+
+# ETF구성종목조회(t1904)
+class t1904(BaseModel):
+    inblock: t1904InBlock = Field(description="t1904InBlock")
+    outblock: t1904OutBlock = Field(description="t1904OutBlock")
+    outblock1: List[t1904OutBlock1] = Field(description="t1904OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1904",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1921 - 신용거래동향(t1921)>
+class t1921InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    gubun: str = Field(description="융자대주구분", default="")
+    date: str = Field(description="날짜", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1921OutBlock(BaseModel):
+    cnt: int = Field(description="CNT", default=0)
+    date: str = Field(description="날짜", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1921OutBlock1(BaseModel):
+    mmdate: str = Field(description="날짜", default="")
+    close: int = Field(description="종가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    jchange: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    nvolume: int = Field(description="신규", default=0)
+    svolume: int = Field(description="상환", default=0)
+    jvolume: int = Field(description="잔고", default=0)
+    price: int = Field(description="금액", default=0)
+    change: int = Field(description="대비", default=0)
+    gyrate: float = Field(description="공여율", default=0.0)
+    jkrate: float = Field(description="잔고율", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 신용거래동향(t1921)
+class t1921(BaseModel):
+    inblock: t1921InBlock = Field(description="t1921InBlock")
+    outblock: t1921OutBlock = Field(description="t1921OutBlock")
+    outblock1: List[t1921OutBlock1] = Field(description="t1921OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1921",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
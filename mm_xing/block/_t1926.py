@@ -0,0 +1,54 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1926 - 종목별신용정보(t1926)>
+class t1926InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+
+
+class t1926OutBlock(BaseModel):
+    ynvolume: int = Field(description="융자신규수량", default=0)
+    ysvolume: int = Field(description="융자상환수량", default=0)
+    yjvolume: int = Field(description="융자잔고수량", default=0)
+    yvchange: int = Field(description="융자수량대비", default=0)
+    ygrate: float = Field(description="융자공여율", default=0.0)
+    yjrate: float = Field(description="융자잔고율", default=0.0)
+    ynprice: int = Field(description="융자신규금액", default=0)
+    ysprice: int = Field(description="융자상환금액", default=0)
+    yjprice: int = Field(description="융자잔고금액", default=0)
+    yachange: int = Field(description="융자금액대비", default=0)
+    dnvolume: int = Field(description="대주신규수량", default=0)
+    dsvolume: int = Field(description="대주상환수량", default=0)
+    djvolume: int = Field(description="대주잔고수량", default=0)
+    dvchange: int = Field(description="대주수량대비", default=0)
+    dgrate: float = Field(description="대주공여율", default=0.0)
+    djrate: float = Field(description="대주잔고율", default=0.0)
+    dnprice: int = Field(description="대주신규금액", default=0)
+    dsprice: int = Field(description="대주상환금액", default=0)
+    djprice: int = Field(description="대주잔고금액", default=0)
+    dachange: int = Field(description="대주금액대비", default=0)
+    mmdate: str = Field(description="결제일", default="")
+    close: int = Field(description="결제일종가", default=0)
+    volume: int = Field(description="결제일거래량", default=0)
+    value: int = Field(description="결제일거래대금", default=0)
+    pr5days: float = Field(description="주가5일증가율", default=0.0)
+    pr20days: float = Field(description="주가20일증가율", default=0.0)
+    yj5days: float = Field(description="융자5일증가율", default=0.0)
+    yj20days: float = Field(description="융자20일증가율", default=0.0)
+    dj5days: float = Field(description="대주5일증가율", default=0.0)
+    dj20days: float = Field(description="대주20일증가율", default=0.0)
+
+
+# 종목별신용정보(t1926)
+class t1926(BaseModel):
+    inblock: t1926InBlock = Field(description="t1926InBlock")
+    outblock: t1926OutBlock = Field(description="t1926OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1926",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
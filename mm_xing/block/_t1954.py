@@ -0,0 +1,59 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1954 - ELW일별주가(t1954)>
+class t1954InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    date: str = Field(description="날짜", default="")
+    cnt: int = Field(description="건수", default=0)
+
+
+class t1954OutBlock(BaseModel):
+    date: str = Field(description="날짜", default="")
+    bsjgubun: str = Field(description="기초자산구분", default="")
+    bscode: str = Field(description="기초자산코드(현물)", default="")
+    bjcode: str = Field(description="기초자산코드(지수)", default="")
+
+
+class t1954OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    close: int = Field(description="종가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: float = Field(description="거래량", default=0.0)
+    bsprice: int = Field(description="기초자산(현물)", default=0)
+    bjprice: float = Field(description="기초자산(지수)", default=0.0)
+    bsign: str = Field(description="전일대비구분", default="")
+    bschange: int = Field(description="전일대비(현물)", default=0)
+    bjchange: float = Field(description="전일대비(지수)", default=0.0)
+    bdiff: float = Field(description="등락율", default=0.0)
+    bvolume: float = Field(description="기초자산거래량", default=0.0)
+    parity: float = Field(description="패리티", default=0.0)
+    egearing: float = Field(description="e.기어링", default=0.0)
+    premium: float = Field(description="프리미엄", default=0.0)
+    berate: float = Field(description="손익분기", default=0.0)
+    capt: float = Field(description="자본지지", default=0.0)
+    gearing: float = Field(description="기어링", default=0.0)
+    mness: str = Field(description="Moneyness", default="")
+
+
+# ELW일별주가(t1954)
+class t1954(BaseModel):
+    inblock: t1954InBlock = Field(description="t1954InBlock")
+    outblock: t1954OutBlock = Field(description="t1954OutBlock")
+    outblock1: List[t1954OutBlock1] = Field(description="t1954OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1954",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,99 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1958 - ELW종목비교(t1958)>
+class t1958InBlock(BaseModel):
+    shcode1: str = Field(description="종목코드1", default="")
+    shcode2: str = Field(description="종목코드2", default="")
+
+
+class t1958OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    item1: str = Field(description="기초자산", default="")
+    issuernmk: str = Field(description="발행사", default="")
+    elwopt: str = Field(description="콜풋구분", default="")
+    elwtype: str = Field(description="행사방식", default="")
+    settletype: str = Field(description="결제방법", default="")
+    elwexec: float = Field(description="행사가", default=0.0)
+    convrate: float = Field(description="전환비율", default=0.0)
+    listing: float = Field(description="발행수량", default=0.0)
+    mmsdate: str = Field(description="행사개시일", default="")
+    lastdate: str = Field(description="최종거래일", default="")
+    nofdays: int = Field(description="거래잔존일수", default=0)
+    payday: str = Field(description="지급일", default="")
+    parity: float = Field(description="패리티", default=0.0)
+    premium: float = Field(description="프리미엄", default=0.0)
+    berate: float = Field(description="손익분기", default=0.0)
+    capt: float = Field(description="자본지지", default=0.0)
+    gearing: float = Field(description="기어링", default=0.0)
+    egearing: float = Field(description="e.기어링", default=0.0)
+    price: int = Field(description="가격", default=0)
+    volume: float = Field(description="거래량", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+
+
+class t1958OutBlock1(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    item1: str = Field(description="기초자산", default="")
+    issuernmk: str = Field(description="발행사", default="")
+    elwopt: str = Field(description="콜풋구분", default="")
+    elwtype: str = Field(description="행사방식", default="")
+    settletype: str = Field(description="결제방법", default="")
+    elwexec: float = Field(description="행사가", default=0.0)
+    convrate: float = Field(description="전환비율", default=0.0)
+    listing: float = Field(description="발행수량", default=0.0)
+    mmsdate: str = Field(description="행사개시일", default="")
+    lastdate: str = Field(description="최종거래일", default="")
+    nofdays: int = Field(description="거래잔존일수", default=0)
+    payday: str = Field(description="지급일", default="")
+    parity: float = Field(description="패리티", default=0.0)
+    premium: float = Field(description="프리미엄", default=0.0)
+    berate: float = Field(description="손익분기", default=0.0)
+    capt: float = Field(description="자본지지", default=0.0)
+    gearing: float = Field(description="기어링", default=0.0)
+    egearing: float = Field(description="e.기어링", default=0.0)
+    price: int = Field(description="가격", default=0)
+    volume: float = Field(description="거래량", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+
+
+class t1958OutBlock2(BaseModel):
+    hnamecmp: str = Field(description="종목명비교", default="")
+    item1cmp: str = Field(description="기초자산비교", default="")
+    issuernmkcmp: str = Field(description="발행사비교", default="")
+    elwoptcmp: str = Field(description="콜풋구분비교", default="")
+    elwtypecmp: str = Field(description="행사방식비교", default="")
+    settlecmp: str = Field(description="결제방법비교", default="")
+    elwexeccmp: float = Field(description="행사가비교", default=0.0)
+    convcmp: float = Field(description="전환비율비교", default=0.0)
+    listingcmp: float = Field(description="발행수량비교", default=0.0)
+    mmsdatecmp: str = Field(description="행사개시일비교", default="")
+    lastdatecmp: str = Field(description="최종거래일비교", default="")
+    nofdayscmp: str = Field(description="거래잔존일수비교", default="")
+    paydaycmp: str = Field(description="지급일비교", default="")
+    paritycmp: float = Field(description="패리티비교", default=0.0)
+    premiumcmp: float = Field(description="프리미엄비교", default=0.0)
+    beratecmp: float = Field(description="손익분기비교", default=0.0)
+    captcmp: float = Field(description="자본지지비교", default=0.0)
+    gearingcmp: float = Field(description="기어링비교", default=0.0)
+    egearingcmp: float = Field(description="e.기어링비교", default=0.0)
+    pricecmp: int = Field(description="가격비교", default=0)
+    volumecmp: float = Field(description="거래량비교", default=0.0)
+    diffcmp: float = Field(description="등락율비교", default=0.0)
+
+
+# ELW종목비교(t1958)
+class t1958(BaseModel):
+    inblock: t1958InBlock = Field(description="t1958InBlock")
+    outblock: t1958OutBlock = Field(description="t1958OutBlock")
+    outblock1: t1958OutBlock1 = Field(description="t1958OutBlock1")
+    outblock2: t1958OutBlock2 = Field(description="t1958OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for t1958",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,44 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1959 - LP대상종목정보조회(t1959)>
+class t1959InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+
+
+class t1959OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    price: str = Field(description="현재가", default="")
+    sign: str = Field(description="부호", default="")
+    change: str = Field(description="대비", default="")
+    rate: float = Field(description="등락율", default=0.0)
+    volume: str = Field(description="누적거래량", default="")
+    value: str = Field(description="누적거래대금", default="")
+    lp_gb: str = Field(description="LP주문가능여부", default="")
+    lp_mem_nm1: str = Field(description="LP회원사명1", default="")
+    lp_mem_nm2: str = Field(description="LP회원사명2", default="")
+    lp_mem_nm3: str = Field(description="LP회원사명3", default="")
+    lp_mem_nm4: str = Field(description="LP회원사명4", default="")
+    lp_mem_nm5: str = Field(description="LP회원사명5", default="")
+    lp_min_qty: str = Field(description="LP최소호가수량", default="")
+    lp_st_date: str = Field(description="LP시작일", default="")
+    lp_end_date: str = Field(description="LP종료일", default="")
+    lp_spread: float = Field(description="LP스프레드", default=0.0)
+
+
+# LP대상종목정보조회(t1959)
+class t1959(BaseModel):
+    inblock: t1959InBlock = Field(description="t1959InBlock")
+    outblock1: List[t1959OutBlock1] = Field(description="t1959OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1959",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,73 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1964 - ELW전광판(t1964)>
+class t1964InBlock(BaseModel):
+    item: str = Field(description="기초자산코드", default="")
+    issuercd: str = Field(description="발행사", default="")
+    lastmonth: str = Field(description="만기월물", default="")
+    elwopt: str = Field(description="콜풋구분", default="")
+    atmgubun: str = Field(description="머니구분", default="")
+    elwtype: str = Field(description="권리행사방식", default="")
+    settletype: str = Field(description="결제방법", default="")
+    elwexecgubun: str = Field(description="행사기초자산구분", default="")
+    fromrat: str = Field(description="시작비율", default="")
+    torat: str = Field(description="종료비율", default="")
+    volume: str = Field(description="거래량", default="")
+
+
+class t1964OutBlock1(BaseModel):
+    shcode: str = Field(description="ELW코드", default="")
+    hname: str = Field(description="종목명", default="")
+    item1: str = Field(description="기초자산코드", default="")
+    itemnm: str = Field(description="기초자산명", default="")
+    issuernmk: str = Field(description="발행사", default="")
+    elwopt: str = Field(description="콜풋구분", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    elwexec: float = Field(description="행사가", default=0.0)
+    jandatecnt: int = Field(description="잔존일수", default=0)
+    convrate: float = Field(description="전환비율", default=0.0)
+    lastdate: str = Field(description="최종거래일", default="")
+    mmsdate: str = Field(description="행사개시일", default="")
+    payday: str = Field(description="지급일", default="")
+    listing: int = Field(description="발행수량", default=0)
+    atmgbnm: str = Field(description="머니구분", default="")
+    parity: float = Field(description="패리티", default=0.0)
+    preminum: float = Field(description="프리미엄", default=0.0)
+    spread: float = Field(description="스프래드", default=0.0)
+    berate: float = Field(description="손익분기율", default=0.0)
+    capt: float = Field(description="자본지지율", default=0.0)
+    gearing: float = Field(description="기어링", default=0.0)
+    egearing: float = Field(description="e기어링", default=0.0)
+    itemprice: int = Field(description="기초자산현재가", default=0)
+    itemsign: str = Field(description="기초자산전일대비구분", default="")
+    itemchange: int = Field(description="기초자산전일대비", default=0)
+    itemdiff: float = Field(description="기초자산등락율", default=0.0)
+    itemvolume: int = Field(description="기초자산거래량", default=0)
+    jnilvolume: int = Field(description="전일거래량", default=0)
+    theoryprice: float = Field(description="이론가", default=0.0)
+    lp_rate: float = Field(description="LP보유비율", default=0.0)
+    impv: float = Field(description="내재변동성", default=0.0)
+    delta: float = Field(description="델타", default=0.0)
+    theta: float = Field(description="쎄타", default=0.0)
+
+
+# ELW전광판(t1964)
+class t1964(BaseModel):
+    inblock: t1964InBlock = Field(description="t1964InBlock")
+    outblock1: List[t1964OutBlock1] = Field(description="t1964OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1964",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
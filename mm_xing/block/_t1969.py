@@ -0,0 +1,118 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1969 - ELW지표검색(t1969)>
+class t1969InBlock(BaseModel):
+    chkitem: str = Field(description="기초자산chk구분", default="")
+    cbitem: str = Field(description="기초자산코드", default="")
+    chkissuer: str = Field(description="발행사chk구분", default="")
+    cbissuer: str = Field(description="발행사", default="")
+    chkcallput: str = Field(description="권리chk구분", default="")
+    cbcallput: str = Field(description="권리(call:01.put:02)", default="")
+    chkexec: str = Field(description="행사가chk구분", default="")
+    cbexec: str = Field(description="행사가(>=:1.<=:2)", default="")
+    chktype: str = Field(description="행사방식chk구분", default="")
+    cbtype: str = Field(description="행사방식", default="")
+    chksettle: str = Field(description="결제방법chk구분", default="")
+    cbsettle: str = Field(description="결제방법", default="")
+    chklast: str = Field(description="만기chk구분", default="")
+    cblast: str = Field(description="만기월별", default="")
+    chkelwexec: str = Field(description="행사가격chk구분", default="")
+    elwexecs: float = Field(description="행사가이상", default=0.0)
+    elwexece: float = Field(description="행사가이하", default=0.0)
+    chkvolume: str = Field(description="거래량chk구분", default="")
+    volumes: float = Field(description="거래량이상", default=0.0)
+    volumee: float = Field(description="거래량이하", default=0.0)
+    chkrate: str = Field(description="등락율chk구분", default="")
+    rates: float = Field(description="등락율이상", default=0.0)
+    ratee: float = Field(description="등락율이하", default=0.0)
+    chkpremium: str = Field(description="프리미엄chk구분", default="")
+    premiums: float = Field(description="프리미엄이상", default=0.0)
+    premiume: float = Field(description="프리미엄이하", default=0.0)
+    chkparity: str = Field(description="패리티chk구분", default="")
+    paritys: float = Field(description="패리티이상", default=0.0)
+    paritye: float = Field(description="패리티이하", default=0.0)
+    chkberate: str = Field(description="손익분기chk구분", default="")
+    berates: float = Field(description="손익분기이상", default=0.0)
+    beratee: float = Field(description="손익분기이하", default=0.0)
+    chkcapt: str = Field(description="자본지지chk구분", default="")
+    capts: float = Field(description="자본지지이상", default=0.0)
+    capte: float = Field(description="자본지지이하", default=0.0)
+    chkegearing: str = Field(description="e.기어링chk구분", default="")
+    egearings: float = Field(description="e.기어링이상", default=0.0)
+    egearinge: float = Field(description="e.기어링이하", default=0.0)
+    chkgearing: str = Field(description="기어링chk구분", default="")
+    gearings: float = Field(description="기어링이상", default=0.0)
+    gearinge: float = Field(description="기어링이하", default=0.0)
+    chkdelta: str = Field(description="델타chk구분", default="")
+    deltas: float = Field(description="델타이상", default=0.0)
+    deltae: float = Field(description="델타이하", default=0.0)
+    chktheta: str = Field(description="쎄타chk구분", default="")
+    thetas: float = Field(description="쎄타이상", default=0.0)
+    thetae: float = Field(description="쎄타이하", default=0.0)
+    chkduedate: str = Field(description="최종거래일chk구분", default="")
+    duedates: str = Field(description="최종거래일이상", default="")
+    duedatee: str = Field(description="최종거래일이하", default="")
+    onetickgubun: str = Field(description="LP갭1틱", default="")
+    lp_liquidity: str = Field(description="LP유동성공급", default="")
+    chklp_code: str = Field(description="LPchk구분", default="")
+    lp_code: str = Field(description="LP회원사코드", default="")
+    chkkoba: str = Field(description="조기종료chk구분", default="")
+    cbkoba: str = Field(description="조기종료(0:전체1:KOBA2:KOBA제외)", default="")
+
+
+class t1969OutBlock(BaseModel):
+    cnt: int = Field(description="종목갯수", default=0)
+
+
+class t1969OutBlock1(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="종목코드", default="")
+    issuernmk: str = Field(description="발행사", default="")
+    itemcode: str = Field(description="기초자산코드", default="")
+    cpgubun: str = Field(description="콜/풋구분", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: float = Field(description="거래량", default=0.0)
+    jnilvolume: float = Field(description="전일거래량", default=0.0)
+    elwexec: float = Field(description="행사가", default=0.0)
+    item: str = Field(description="기초자산명", default="")
+    bprice: float = Field(description="기초자산가", default=0.0)
+    bsign: str = Field(description="기초전일대비구분", default="")
+    bchange: float = Field(description="기초전일대비", default=0.0)
+    bdiff: float = Field(description="기초등락율", default=0.0)
+    premium: float = Field(description="프리미엄", default=0.0)
+    parity: float = Field(description="패리티", default=0.0)
+    berate: float = Field(description="손익분기", default=0.0)
+    capt: float = Field(description="자본지지", default=0.0)
+    egearing: float = Field(description="e.기어링", default=0.0)
+    gearing: float = Field(description="기어링", default=0.0)
+    lastdate: str = Field(description="최종거래일", default="")
+    delta: float = Field(description="델타", default=0.0)
+    theta: float = Field(description="쎄타", default=0.0)
+    lpname: str = Field(description="LP회원사", default="")
+    lphold: float = Field(description="LP보유율", default=0.0)
+    bjandatecnt: int = Field(description="잔존일수", default=0)
+    convrate: float = Field(description="전환비율", default=0.0)
+    tickvalue: float = Field(description="1틱환산", default=0.0)
+    kasis: float = Field(description="괴리율", default=0.0)
+
+
+# ELW지표검색(t1969)
+class t1969(BaseModel):
+    inblock: t1969InBlock = Field(description="t1969InBlock")
+    outblock: t1969OutBlock = Field(description="t1969OutBlock")
+    outblock1: List[t1969OutBlock1] = Field(description="t1969OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1969",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
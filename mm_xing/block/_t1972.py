@@ -0,0 +1,73 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1972 - ELW현재가(거래원)조회(t1972)>
+class t1972InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class t1972OutBlock(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    expcode: str = Field(description="표준코드", default="")
+    shcode: str = Field(description="단축코드", default="")
+    offerno1: str = Field(description="매도증권사코드1", default="")
+    bidno1: str = Field(description="매수증권사코드1", default="")
+    dvol1: int = Field(description="총매도수량1", default=0)
+    svol1: int = Field(description="총매수수량1", default=0)
+    dcha1: int = Field(description="매도증감1", default=0)
+    scha1: int = Field(description="매수증감1", default=0)
+    ddiff1: float = Field(description="매도비율1", default=0.0)
+    sdiff1: float = Field(description="매수비율1", default=0.0)
+    offerno2: str = Field(description="매도증권사코드2", default="")
+    bidno2: str = Field(description="매수증권사코드2", default="")
+    dvol2: int = Field(description="총매도수량2", default=0)
+    svol2: int = Field(description="총매수수량2", default=0)
+    dcha2: int = Field(description="매도증감2", default=0)
+    scha2: int = Field(description="매수증감2", default=0)
+    ddiff2: float = Field(description="매도비율2", default=0.0)
+    sdiff2: float = Field(description="매수비율2", default=0.0)
+    offerno3: str = Field(description="매도증권사코드3", default="")
+    bidno3: str = Field(description="매수증권사코드3", default="")
+    dvol3: int = Field(description="총매도수량3", default=0)
+    svol3: int = Field(description="총매수수량3", default=0)
+    dcha3: int = Field(description="매도증감3", default=0)
+    scha3: int = Field(description="매수증감3", default=0)
+    ddiff3: float = Field(description="매도비율3", default=0.0)
+    sdiff3: float = Field(description="매수비율3", default=0.0)
+    offerno4: str = Field(description="매도증권사코드4", default="")
+    bidno4: str = Field(description="매수증권사코드4", default="")
+    dvol4: int = Field(description="총매도수량4", default=0)
+    svol4: int = Field(description="총매수수량4", default=0)
+    dcha4: int = Field(description="매도증감4", default=0)
+    scha4: int = Field(description="매수증감4", default=0)
+    ddiff4: float = Field(description="매도비율4", default=0.0)
+    sdiff4: float = Field(description="매수비율4", default=0.0)
+    offerno5: str = Field(description="매도증권사코드5", default="")
+    bidno5: str = Field(description="매수증권사코드5", default="")
+    dvol5: int = Field(description="총매도수량5", default=0)
+    svol5: int = Field(description="총매수수량5", default=0)
+    dcha5: int = Field(description="매도증감5", default=0)
+    scha5: int = Field(description="매수증감5", default=0)
+    ddiff5: float = Field(description="매도비율5", default=0.0)
+    sdiff5: float = Field(description="매수비율5", default=0.0)
+    fwdvl: int = Field(description="외국계매도합계수량", default=0)
+    fwsvl: int = Field(description="외국계매수합계수량", default=0)
+    ftradmdcha: int = Field(description="외국계매도직전대비", default=0)
+    ftradmscha: int = Field(description="외국계매수직전대비", default=0)
+    fwddiff: float = Field(description="외국계매도합계비율", default=0.0)
+    fwsdiff: float = Field(description="외국계매수합계비율", default=0.0)
+
+
+# ELW현재가(거래원)조회(t1972)
+class t1972(BaseModel):
+    inblock: t1972InBlock = Field(description="t1972InBlock")
+    outblock: t1972OutBlock = Field(description="t1972OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1972",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,41 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1973 - ELW시간대별예상체결조회(t1973)>
+class t1973InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t1973OutBlock(BaseModel):
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t1973OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    yeprice: int = Field(description="예상체결가격", default=0)
+    yegubun: str = Field(description="예상체결구분", default="")
+    jnilysign: str = Field(description="전일종가대비구분", default="")
+    jnilychange: int = Field(description="전일종가대비", default=0)
+    yediff: float = Field(description="예상체결등락율", default=0.0)
+    yevolume: int = Field(description="예상체결량", default=0)
+    ymdvolume: int = Field(description="예상매도체결량", default=0)
+    ymsvolume: int = Field(description="예상매수체결량", default=0)
+
+
+# ELW시간대별예상체결조회(t1973)
+class t1973(BaseModel):
+    inblock: t1973InBlock = Field(description="t1973InBlock")
+    outblock: t1973OutBlock = Field(description="t1973OutBlock")
+    outblock1: List[t1973OutBlock1] = Field(description="t1973OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1973",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2106 - 선물/옵션현재가시세메모(t2106)>
+class t2106InBlock(BaseModel):
+    code: str = Field(description="종목코드", default="")
+    nrec: str = Field(description="건수", default="")
+
+
+class t2106InBlock1(BaseModel):
+    indx: str = Field(description="인덱스", default="")
+    gubn: str = Field(description="조건구분", default="")
+    dat1: str = Field(description="데이타1", default="")
+    dat2: str = Field(description="데이타2", default="")
+
+
+class t2106OutBlock(BaseModel):
+    nrec: str = Field(description="출력건수", default="")
+
+
+class t2106OutBlock1(BaseModel):
+    indx: str = Field(description="인덱스", default="")
+    gubn: str = Field(description="조건구분", default="")
+    vals: str = Field(description="출력값", default="")
+
+
+# 선물/옵션현재가시세메모(t2106)
+class t2106(BaseModel):
+    inblock: t2106InBlock = Field(description="t2106InBlock")
+    inblock1: t2106InBlock1 = Field(description="t2106InBlock1")
+    outblock: t2106OutBlock = Field(description="t2106OutBlock")
+    outblock1: List[t2106OutBlock1] = Field(description="t2106OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t2106",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t2210 - 선물옵션시간대별체결조회(단일출력용)>
+class t2210InBlock(BaseModel):
+    focode: str = Field(description="단축코드", default="")
+    cvolume: int = Field(description="특이거래량", default=0)
+    stime: str = Field(description="시작시간", default="")
+    etime: str = Field(description="종료시간", default="")
+
+
+class t2210OutBlock(BaseModel):
+    mdvolume: int = Field(description="매도체결수량", default=0)
+    mdchecnt: int = Field(description="매도체결건수", default=0)
+    msvolume: int = Field(description="매수체결수량", default=0)
+    mschecnt: int = Field(description="매수체결건수", default=0)
+
+
+# 선물옵션시간대별체결조회(단일출력용)
+class t2210(BaseModel):
+    inblock: t2210InBlock = Field(description="t2210InBlock")
+    outblock: t2210OutBlock = Field(description="t2210OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t2210",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
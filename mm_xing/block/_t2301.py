@@ -0,0 +1,109 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2301 - 옵션전광판(t2301)>
+class t2301InBlock(BaseModel):
+    yyyymm: str = Field(description="월물", default="")
+    gubun: str = Field(description="미니구분(M:미니G:정규)", default="")
+
+
+class t2301OutBlock(BaseModel):
+    histimpv: int = Field(description="역사적변동성", default=0)
+    jandatecnt: int = Field(description="옵션잔존일", default=0)
+    cimpv: float = Field(description="콜옵션대표IV", default=0.0)
+    pimpv: float = Field(description="풋옵션대표IV", default=0.0)
+    gmprice: float = Field(description="근월물현재가", default=0.0)
+    gmsign: str = Field(description="근월물전일대비구분", default="")
+    gmchange: float = Field(description="근월물전일대비", default=0.0)
+    gmdiff: float = Field(description="근월물등락율", default=0.0)
+    gmvolume: int = Field(description="근월물거래량", default=0)
+    gmshcode: str = Field(description="근월물선물코드", default="")
+
+
+class t2301OutBlock1(BaseModel):
+    actprice: float = Field(description="행사가", default=0.0)
+    optcode: str = Field(description="콜옵션코드", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    iv: float = Field(description="IV", default=0.0)
+    mgjv: int = Field(description="미결제약정", default=0)
+    mgjvupdn: int = Field(description="미결제약정증감", default=0)
+    offerho1: float = Field(description="매도호가", default=0.0)
+    bidho1: float = Field(description="매수호가", default=0.0)
+    cvolume: int = Field(description="체결량", default=0)
+    delt: float = Field(description="델타", default=0.0)
+    gama: float = Field(description="감마", default=0.0)
+    vega: float = Field(description="베가", default=0.0)
+    ceta: float = Field(description="쎄타", default=0.0)
+    rhox: float = Field(description="로우", default=0.0)
+    theoryprice: float = Field(description="이론가", default=0.0)
+    impv: float = Field(description="내재가치", default=0.0)
+    timevl: float = Field(description="시간가치", default=0.0)
+    jvolume: int = Field(description="잔고수량", default=0)
+    parpl: int = Field(description="평가손익", default=0)
+    jngo: int = Field(description="청산가능수량", default=0)
+    offerrem1: int = Field(description="매도잔량", default=0)
+    bidrem1: int = Field(description="매수잔량", default=0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    atmgubun: str = Field(description="ATM구분", default="")
+    jisuconv: float = Field(description="지수환산", default=0.0)
+    value: float = Field(description="거래대금", default=0.0)
+
+
+class t2301OutBlock2(BaseModel):
+    actprice: float = Field(description="행사가", default=0.0)
+    optcode: str = Field(description="풋옵션코드", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    iv: float = Field(description="IV", default=0.0)
+    mgjv: int = Field(description="미결제약정", default=0)
+    mgjvupdn: int = Field(description="미결제약정증감", default=0)
+    offerho1: float = Field(description="매도호가", default=0.0)
+    bidho1: float = Field(description="매수호가", default=0.0)
+    cvolume: int = Field(description="체결량", default=0)
+    delt: float = Field(description="델타", default=0.0)
+    gama: float = Field(description="감마", default=0.0)
+    vega: float = Field(description="베가", default=0.0)
+    ceta: float = Field(description="쎄타", default=0.0)
+    rhox: float = Field(description="로우", default=0.0)
+    theoryprice: float = Field(description="이론가", default=0.0)
+    impv: float = Field(description="내재가치", default=0.0)
+    timevl: float = Field(description="시간가치", default=0.0)
+    jvolume: int = Field(description="잔고수량", default=0)
+    parpl: int = Field(description="평가손익", default=0)
+    jngo: int = Field(description="청산가능수량", default=0)
+    offerrem1: int = Field(description="매도잔량", default=0)
+    bidrem1: int = Field(description="매수잔량", default=0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    atmgubun: str = Field(description="ATM구분", default="")
+    jisuconv: float = Field(description="지수환산", default=0.0)
+    value: float = Field(description="거래대금", default=0.0)
+
+
+# 옵션전광판(t2301)
+class t2301(BaseModel):
+    inblock: t2301InBlock = Field(description="t2301InBlock")
+    outblock: t2301OutBlock = Field(description="t2301OutBlock")
+    outblock1: List[t2301OutBlock1] = Field(description="t2301OutBlock1")
+    outblock2: List[t2301OutBlock2] = Field(description="t2301OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for t2301",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
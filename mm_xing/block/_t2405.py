@@ -0,0 +1,61 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2405 - 선물옵션호가잔량비율챠트(t2405)>
+class t2405InBlock(BaseModel):
+    focode: str = Field(description="단축코드", default="")
+    bgubun: str = Field(description="분구분", default="")
+    nmin: str = Field(description="N분", default="")
+    etime: str = Field(description="종료시간", default="")
+    hgubun: str = Field(description="호가구분", default="")
+    cnt: str = Field(description="조회건수", default="")
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t2405OutBlock(BaseModel):
+    mdvolume: float = Field(description="매도체결수량", default=0.0)
+    mdchecnt: int = Field(description="매도체결건수", default=0)
+    msvolume: float = Field(description="매수체결수량", default=0.0)
+    mschecnt: int = Field(description="매수체결건수", default=0)
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t2405OutBlock1(BaseModel):
+    time: str = Field(description="시간", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    volume: float = Field(description="누적거래량", default=0.0)
+    cvolume: int = Field(description="체결수량", default=0)
+    offerho1: float = Field(description="매도1호가", default=0.0)
+    bidho1: float = Field(description="매수1호가", default=0.0)
+    offerrem: int = Field(description="매도수량", default=0)
+    bidrem: int = Field(description="매수수량", default=0)
+    offercnt: int = Field(description="매도건수", default=0)
+    bidcnt: int = Field(description="매수건수", default=0)
+    c_offerrem: int = Field(description="매도증감수량", default=0)
+    c_bidrem: int = Field(description="매수증감수량", default=0)
+    c_offercnt: int = Field(description="매도증감건수", default=0)
+    c_bidcnt: int = Field(description="매수증감건수", default=0)
+    r_bidrem: float = Field(description="매수수량비율", default=0.0)
+    r_bidcnt: float = Field(description="매수건수비율", default=0.0)
+    r_sign: str = Field(description="매수비율구분", default="")
+    date: str = Field(description="일자", default="")
+
+
+# 선물옵션호가잔량비율챠트(t2405)
+class t2405(BaseModel):
+    inblock: t2405InBlock = Field(description="t2405InBlock")
+    outblock: t2405OutBlock = Field(description="t2405OutBlock")
+    outblock1: List[t2405OutBlock1] = Field(description="t2405OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t2405",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,51 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2421 - 미결제약정추이(t2421)>
+class t2421InBlock(BaseModel):
+    focode: str = Field(description="종목코드", default="")
+    bdgubun: str = Field(description="분일구분", default="")
+    nmin: str = Field(description="N분", default="")
+    tcgubun: str = Field(description="당일연결구분", default="")
+    cnt: str = Field(description="조회건수", default="")
+
+
+class t2421OutBlock(BaseModel):
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    cvolume: int = Field(description="체결수량", default=0)
+    volume: float = Field(description="누적거래량", default=0.0)
+    openyak: int = Field(description="미결제수량", default=0)
+
+
+class t2421OutBlock1(BaseModel):
+    dt: str = Field(description="일자시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    openopenyak: int = Field(description="미결제시량", default=0)
+    highopenyak: int = Field(description="미결제고량", default=0)
+    lowopenyak: int = Field(description="미결제저량", default=0)
+    closeopenyak: int = Field(description="미결제종량", default=0)
+    openupdn: int = Field(description="미결증감", default=0)
+
+
+# 미결제약정추이(t2421)
+class t2421(BaseModel):
+    inblock: t2421InBlock = Field(description="t2421InBlock")
+    outblock: t2421OutBlock = Field(description="t2421OutBlock")
+    outblock1: List[t2421OutBlock1] = Field(description="t2421OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t2421",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,82 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2545 - 상품선물투자자매매동향(챠트용)>
+class t2545InBlock(BaseModel):
+    eitem: str = Field(description="상품ID", default="")
+    sgubun: str = Field(description="시장구분", default="")
+    upcode: str = Field(description="업종코드", default="")
+    nmin: str = Field(description="N분", default="")
+    cnt: str = Field(description="조회건수", default="")
+    bgubun: str = Field(description="전일분", default="")
+
+
+class t2545OutBlock(BaseModel):
+    eitem: str = Field(description="상품ID", default="")
+    sgubun: str = Field(description="시장구분", default="")
+    indcode: str = Field(description="개인투자자코드", default="")
+    forcode: str = Field(description="외국인투자자코드", default="")
+    syscode: str = Field(description="기관계투자자코드", default="")
+    stocode: str = Field(description="증권투자자코드", default="")
+    invcode: str = Field(description="투신투자자코드", default="")
+    bancode: str = Field(description="은행투자자코드", default="")
+    inscode: str = Field(description="보험투자자코드", default="")
+    fincode: str = Field(description="종금투자자코드", default="")
+    moncode: str = Field(description="기금투자자코드", default="")
+    etccode: str = Field(description="기타투자자코드", default="")
+    natcode: str = Field(description="국가투자자코드", default="")
+    pefcode: str = Field(description="사모펀드투자자코드", default="")
+    jisucd: str = Field(description="기준지수코드", default="")
+    jisunm: str = Field(description="기준지수명", default="")
+
+
+class t2545OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+    datetime: str = Field(description="일자시간", default="")
+    indmsvol: int = Field(description="개인순매수거래량", default=0)
+    indmsamt: float = Field(description="개인순매수거래대금", default=0.0)
+    formsvol: int = Field(description="외국인순매수거래량", default=0)
+    formsamt: float = Field(description="외국인순매수거래대금", default=0.0)
+    sysmsvol: int = Field(description="기관계순매수거래량", default=0)
+    sysmsamt: float = Field(description="기관계순매수거래대금", default=0.0)
+    stomsvol: int = Field(description="증권순매수거래량", default=0)
+    stomsamt: float = Field(description="증권순매수거래대금", default=0.0)
+    invmsvol: int = Field(description="투신순매수거래량", default=0)
+    invmsamt: float = Field(description="투신순매수거래대금", default=0.0)
+    banmsvol: int = Field(description="은행순매수거래량", default=0)
+    banmsamt: float = Field(description="은행순매수거래대금", default=0.0)
+    insmsvol: int = Field(description="보험순매수거래량", default=0)
+    insmsamt: float = Field(description="보험순매수거래대금", default=0.0)
+    finmsvol: int = Field(description="종금순매수거래량", default=0)
+    finmsamt: float = Field(description="종금순매수거래대금", default=0.0)
+    monmsvol: int = Field(description="기금순매수거래량", default=0)
+    monmsamt: float = Field(description="기금순매수거래대금", default=0.0)
+    etcmsvol: int = Field(description="기타순매수거래량", default=0)
+    etcmsamt: float = Field(description="기타순매수거래대금", default=0.0)
+    natmsvol: int = Field(description="국가순매수거래량", default=0)
+    natmsamt: float = Field(description="국가순매수거래대금", default=0.0)
+    pefmsvol: int = Field(description="사모펀드순매수거래량", default=0)
+    pefmsamt: float = Field(description="사모펀드순매수거래대금", default=0.0)
+    upclose: float = Field(description="기준지수", default=0.0)
+    upcvolume: int = Field(description="기준체결거래량", default=0)
+    upvolume: float = Field(description="기준누적거래량", default=0.0)
+    upvalue: float = Field(description="기준거래대금", default=0.0)
+
+
+# 상품선물투자자매매동향(챠트용)
+class t2545(BaseModel):
+    inblock: t2545InBlock = Field(description="t2545InBlock")
+    outblock: t2545OutBlock = Field(description="t2545OutBlock")
+    outblock1: List[t2545OutBlock1] = Field(description="t2545OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t2545",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,61 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t2830 - EUREXKOSPI200옵션선물현재가(시세)조회(t2830)>
+class t2830InBlock(BaseModel):
+    focode: str = Field(description="단축코드", default="")
+
+
+class t2830OutBlock(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    jnilclose: float = Field(description="전일종가", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    recprice: float = Field(description="기준가", default=0.0)
+    theoryprice: float = Field(description="이론가", default=0.0)
+    actprice: float = Field(description="행사가", default=0.0)
+    impv: float = Field(description="내재가치", default=0.0)
+    timevl: float = Field(description="시간가치", default=0.0)
+    kospijisu: float = Field(description="KOSPI200지수", default=0.0)
+    kospisign: str = Field(description="KOSPI200전일대비구분", default="")
+    kospichange: float = Field(description="KOSPI200전일대비", default=0.0)
+    kospidiff: float = Field(description="KOSPI200등락율", default=0.0)
+    cmeprice: float = Field(description="CME야간선물현재가", default=0.0)
+    cmesign: str = Field(description="CME야간선물전일대비구분", default="")
+    cmechange: float = Field(description="CME야간선물전일대비", default=0.0)
+    cmediff: float = Field(description="CME야간선물등락율", default=0.0)
+    cmefocode: str = Field(description="CME야간선물종목코드", default="")
+    uplmtprice: float = Field(description="정규장적용상한가", default=0.0)
+    dnlmtprice: float = Field(description="정규장적용하한가", default=0.0)
+    focode: str = Field(description="단축코드", default="")
+    yeprice: float = Field(description="예상체결가", default=0.0)
+    ysign: str = Field(description="전일대비구분", default="")
+    ychange: float = Field(description="전일대비", default=0.0)
+    ydiff: float = Field(description="등락율", default=0.0)
+    danhochk: str = Field(description="단일가호가여부", default="")
+    jnilvolume: int = Field(description="전일거래량", default=0)
+    jnilvalue: int = Field(description="전일거래대금", default=0)
+    uplmtprice_3rd: float = Field(description="정규장3단계상한가", default=0.0)
+    dnlmtprice_3rd: float = Field(description="정규장3단계하한가", default=0.0)
+
+
+# EUREXKOSPI200옵션선물현재가(시세)조회(t2830)
+class t2830(BaseModel):
+    inblock: t2830InBlock = Field(description="t2830InBlock")
+    outblock: t2830OutBlock = Field(description="t2830OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t2830",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,67 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t2831 - EUREXKOSPI200옵션선물호가조회(t2831)>
+class t2831InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class t2831OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    jnilclose: float = Field(description="전일종가", default=0.0)
+    offerho1: float = Field(description="매도호가1", default=0.0)
+    bidho1: float = Field(description="매수호가1", default=0.0)
+    offerrem1: int = Field(description="매도호가수량1", default=0)
+    bidrem1: int = Field(description="매수호가수량1", default=0)
+    dcnt1: int = Field(description="매도호가건수1", default=0)
+    scnt1: int = Field(description="매수호가건수1", default=0)
+    offerho2: float = Field(description="매도호가2", default=0.0)
+    bidho2: float = Field(description="매수호가2", default=0.0)
+    offerrem2: int = Field(description="매도호가수량2", default=0)
+    bidrem2: int = Field(description="매수호가수량2", default=0)
+    dcnt2: int = Field(description="매도호가건수2", default=0)
+    scnt2: int = Field(description="매수호가건수2", default=0)
+    offerho3: float = Field(description="매도호가3", default=0.0)
+    bidho3: float = Field(description="매수호가3", default=0.0)
+    offerrem3: int = Field(description="매도호가수량3", default=0)
+    bidrem3: int = Field(description="매수호가수량3", default=0)
+    dcnt3: int = Field(description="매도호가건수3", default=0)
+    scnt3: int = Field(description="매수호가건수3", default=0)
+    offerho4: float = Field(description="매도호가4", default=0.0)
+    bidho4: float = Field(description="매수호가4", default=0.0)
+    offerrem4: int = Field(description="매도호가수량4", default=0)
+    bidrem4: int = Field(description="매수호가수량4", default=0)
+    dcnt4: int = Field(description="매도호가건수4", default=0)
+    scnt4: int = Field(description="매수호가건수4", default=0)
+    offerho5: float = Field(description="매도호가5", default=0.0)
+    bidho5: float = Field(description="매수호가5", default=0.0)
+    offerrem5: int = Field(description="매도호가수량5", default=0)
+    bidrem5: int = Field(description="매수호가수량5", default=0)
+    dcnt5: int = Field(description="매도호가건수5", default=0)
+    scnt5: int = Field(description="매수호가건수5", default=0)
+    dvol: int = Field(description="매도호가총수량", default=0)
+    svol: int = Field(description="매수호가총수량", default=0)
+    toffernum: int = Field(description="총매도호가건수", default=0)
+    tbidnum: int = Field(description="총매수호가건수", default=0)
+    time: str = Field(description="수신시간", default="")
+    shcode: str = Field(description="단축코드", default="")
+
+
+# EUREXKOSPI200옵션선물호가조회(t2831)
+class t2831(BaseModel):
+    inblock: t2831InBlock = Field(description="t2831InBlock")
+    outblock: t2831OutBlock = Field(description="t2831OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t2831",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
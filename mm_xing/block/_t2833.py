@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2833 - EUREX야간옵션선물기간별추이(t2833)>
+class t2833InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    futcheck: str = Field(description="선물최근월물", default="")
+    date: str = Field(description="날짜", default="")
+    cts_code: str = Field(description="CTS종목코드", default="")
+    lastdate: str = Field(description="전종목만기일", default="")
+    cnt: str = Field(description="조회요청건수", default="")
+
+
+class t2833OutBlock(BaseModel):
+    date: str = Field(description="날짜", default="")
+    cts_code: str = Field(description="CTS종목코드", default="")
+    lastdate: str = Field(description="전종목만기일", default="")
+    nowfutyn: str = Field(description="최근월선물여부", default="")
+
+
+class t2833OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+
+
+# EUREX야간옵션선물기간별추이(t2833)
+class t2833(BaseModel):
+    inblock: t2833InBlock = Field(description="t2833InBlock")
+    outblock: t2833OutBlock = Field(description="t2833OutBlock")
+    outblock1: List[t2833OutBlock1] = Field(description="t2833OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t2833",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,79 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2835 - EUREX옵션선물시세전광판(t2835)>
+class t2835InBlock(BaseModel):
+    yyyymm: str = Field(description="월물(혹은주물WN)", default="")
+    gubun: str = Field(description="구분(G:원지수W:위클리)", default="")
+
+
+class t2835OutBlock(BaseModel):
+    gmprice: float = Field(description="근월물현재가", default=0.0)
+    gmsign: str = Field(description="근월물전일대비구분", default="")
+    gmchange: float = Field(description="근월물전일대비", default=0.0)
+    gmdiff: float = Field(description="근월물등락율", default=0.0)
+    gmvolume: int = Field(description="근월물거래량", default=0)
+    gmshcode: str = Field(description="근월물선물코드", default="")
+
+
+class t2835OutBlock1(BaseModel):
+    actprice: float = Field(description="행사가", default=0.0)
+    optcode: str = Field(description="콜옵션코드", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    offerho1: float = Field(description="매도호가", default=0.0)
+    bidho1: float = Field(description="매수호가", default=0.0)
+    cvolume: int = Field(description="체결량", default=0)
+    impv: float = Field(description="내재가치", default=0.0)
+    timevl: float = Field(description="시간가치", default=0.0)
+    offerrem1: int = Field(description="매도잔량", default=0)
+    bidrem1: int = Field(description="매수잔량", default=0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    atmgubun: str = Field(description="ATM구분", default="")
+    jisuconv: float = Field(description="지수환산", default=0.0)
+
+
+class t2835OutBlock2(BaseModel):
+    actprice: float = Field(description="행사가", default=0.0)
+    optcode: str = Field(description="풋옵션코드", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    offerho1: float = Field(description="매도호가", default=0.0)
+    bidho1: float = Field(description="매수호가", default=0.0)
+    cvolume: int = Field(description="체결량", default=0)
+    impv: float = Field(description="내재가치", default=0.0)
+    timevl: float = Field(description="시간가치", default=0.0)
+    offerrem1: int = Field(description="매도잔량", default=0)
+    bidrem1: int = Field(description="매수잔량", default=0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    atmgubun: str = Field(description="ATM구분", default="")
+    jisuconv: float = Field(description="지수환산", default=0.0)
+
+
+# EUREX옵션선물시세전광판(t2835)
+class t2835(BaseModel):
+    inblock: t2835InBlock = Field(description="t2835InBlock")
+    outblock: t2835OutBlock = Field(description="t2835OutBlock")
+    outblock1: List[t2835OutBlock1] = Field(description="t2835OutBlock1")
+    outblock2: List[t2835OutBlock2] = Field(description="t2835OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for t2835",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
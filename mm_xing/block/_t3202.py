@@ -0,0 +1,34 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t3202 - 종목별증시일정(t3202)>
+class t3202InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    date: str = Field(description="조회일자", default="")
+
+
+class t3202OutBlock(BaseModel):
+    recdt: str = Field(description="기준일", default="")
+    tableid: str = Field(description="테이블아이디", default="")
+    upgu: str = Field(description="업무구분", default="")
+    custno: str = Field(description="발행체번호", default="")
+    custnm: str = Field(description="발행회사명", default="")
+    shcode: str = Field(description="종목코드", default="")
+    upunm: str = Field(description="업무명", default="")
+
+
+# 종목별증시일정(t3202)
+class t3202(BaseModel):
+    inblock: t3202InBlock = Field(description="t3202InBlock")
+    outblock: List[t3202OutBlock] = Field(description="t3202OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t3202",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,71 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t3320 - FNG_요약(t3320)>
+class t3320InBlock(BaseModel):
+    gicode: str = Field(description="종목코드", default="")
+
+
+class t3320OutBlock(BaseModel):
+    upgubunnm: str = Field(description="업종구분명", default="")
+    sijangcd: str = Field(description="시장구분", default="")
+    marketnm: str = Field(description="시장구분명", default="")
+    company: str = Field(description="한글기업명", default="")
+    baddress: str = Field(description="본사주소", default="")
+    btelno: str = Field(description="본사전화번호", default="")
+    gsyyyy: str = Field(description="최근결산년도", default="")
+    gsmm: str = Field(description="결산월", default="")
+    gsym: str = Field(description="최근결산년월", default="")
+    lstprice: int = Field(description="주당액면가", default=0)
+    gstock: int = Field(description="주식수", default=0)
+    homeurl: str = Field(description="Homepage", default="")
+    grdnm: str = Field(description="그룹명", default="")
+    foreignratio: float = Field(description="외국인", default=0.0)
+    irtel: str = Field(description="주담전화", default="")
+    capital: float = Field(description="자본금", default=0.0)
+    sigavalue: float = Field(description="시가총액", default=0.0)
+    cashsis: float = Field(description="배당금", default=0.0)
+    cashrate: float = Field(description="배당수익율", default=0.0)
+    price: int = Field(description="현재가", default=0)
+    jnilclose: int = Field(description="전일종가", default=0)
+    notice1: str = Field(description="위험고지구분1_정리매매", default="")
+    notice2: str = Field(description="위험고지구분2_투자위험", default="")
+    notice3: str = Field(description="위험고지구분3_단기과열", default="")
+
+
+class t3320OutBlock1(BaseModel):
+    gicode: str = Field(description="기업코드", default="")
+    gsym: str = Field(description="결산년월", default="")
+    gsgb: str = Field(description="결산구분", default="")
+    per: float = Field(description="PER", default=0.0)
+    eps: float = Field(description="EPS", default=0.0)
+    pbr: float = Field(description="PBR", default=0.0)
+    roa: float = Field(description="ROA", default=0.0)
+    roe: float = Field(description="ROE", default=0.0)
+    ebitda: float = Field(description="EBITDA", default=0.0)
+    evebitda: float = Field(description="EVEBITDA", default=0.0)
+    par: float = Field(description="액면가", default=0.0)
+    sps: float = Field(description="SPS", default=0.0)
+    cps: float = Field(description="CPS", default=0.0)
+    bps: float = Field(description="BPS", default=0.0)
+    t_per: float = Field(description="T.PER", default=0.0)
+    t_eps: float = Field(description="T.EPS", default=0.0)
+    peg: float = Field(description="PEG", default=0.0)
+    t_peg: float = Field(description="T.PEG", default=0.0)
+    t_gsym: str = Field(description="최근분기년도", default="")
+
+
+# FNG_요약(t3320)
+class t3320(BaseModel):
+    inblock: t3320InBlock = Field(description="t3320InBlock")
+    outblock: t3320OutBlock = Field(description="t3320OutBlock")
+    outblock1: t3320OutBlock1 = Field(description="t3320OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t3320",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
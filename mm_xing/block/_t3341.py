@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t3341 - 재무순위종합(t3341)>
+class t3341InBlock(BaseModel):
+    gubun: str = Field(description="시장구분", default="")
+    gubun1: str = Field(
+        description="순위구분(1:매출액증가율2:영업이익증가율3:세전계속이익증가율4:부채비율5:유보율6:EPS7:BPS8:ROE9:PERa:PBRb:PEG)",
+        default="",
+    )
+    gubun2: str = Field(description="대비구분", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t3341OutBlock(BaseModel):
+    cnt: int = Field(description="CNT", default=0)
+    idx: int = Field(description="IDX", default=0)
+
+
+class t3341OutBlock1(BaseModel):
+    rank: int = Field(description="순위", default=0)
+    hname: str = Field(description="기업명", default="")
+    salesgrowth: int = Field(description="매출액증가율", default=0)
+    operatingincomegrowt: int = Field(description="영업이익증가율", default=0)
+    ordinaryincomegrowth: int = Field(description="경상이익증가율", default=0)
+    liabilitytoequity: int = Field(description="부채비율", default=0)
+    enterpriseratio: int = Field(description="유보율", default=0)
+    eps: int = Field(description="EPS", default=0)
+    bps: int = Field(description="BPS", default=0)
+    roe: int = Field(description="ROE", default=0)
+    shcode: str = Field(description="종목코드", default="")
+    per: float = Field(description="PER", default=0.0)
+    pbr: float = Field(description="PBR", default=0.0)
+    peg: float = Field(description="PEG", default=0.0)
+
+
+# 재무순위종합(t3341)
+class t3341(BaseModel):
+    inblock: t3341InBlock = Field(description="t3341InBlock")
+    outblock: t3341OutBlock = Field(description="t3341OutBlock")
+    outblock1: List[t3341OutBlock1] = Field(description="t3341OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t3341",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
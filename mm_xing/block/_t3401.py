@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t3401 - 투자의견(t3401)>
+class t3401InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    gubun1: str = Field(description="구분", default="")
+    tradno: str = Field(description="회원사코드", default="")
+    cts_date: str = Field(description="IDXDATE", default="")
+
+
+class t3401OutBlock(BaseModel):
+    cts_date: str = Field(description="IDXDATE", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="대비속성", default="")
+    change: int = Field(description="대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+
+
+class t3401OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    tradno: str = Field(description="회원사코드", default="")
+    date: str = Field(description="의견일자", default="")
+    tradname: str = Field(description="회원사명", default="")
+    bopn: str = Field(description="투자의견변경후", default="")
+    nopn: str = Field(description="투자의견변경전", default="")
+    boga: int = Field(description="목표가변경전", default=0)
+    noga: int = Field(description="목표가변경후", default=0)
+    close: int = Field(description="의견일종가", default=0)
+
+
+# 투자의견(t3401)
+class t3401(BaseModel):
+    inblock: t3401InBlock = Field(description="t3401InBlock")
+    outblock: t3401OutBlock = Field(description="t3401OutBlock")
+    outblock1: List[t3401OutBlock1] = Field(description="t3401OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t3401",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
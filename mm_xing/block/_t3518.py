@@ -0,0 +1,57 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t3518 - 해외실시간지수(t3518)>
+class t3518InBlock(BaseModel):
+    kind: str = Field(description="종목종류", default="")
+    symbol: str = Field(description="SYMBOL", default="")
+    cnt: int = Field(description="입력건수", default=0)
+    jgbn: str = Field(description="조회구분", default="")
+    nmin: int = Field(description="N분", default=0)
+    cts_date: str = Field(description="CTS_DATE", default="")
+    cts_time: str = Field(description="CTS_TIME", default="")
+
+
+class t3518OutBlock(BaseModel):
+    cts_date: str = Field(description="CTS_DATE", default="")
+    cts_time: str = Field(description="CTS_TIME", default="")
+
+
+class t3518OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    uprate: float = Field(description="등락율", default=0.0)
+    volume: float = Field(description="누적거래량", default=0.0)
+    bidho: float = Field(description="매수호가", default=0.0)
+    offerho: float = Field(description="매도호가", default=0.0)
+    bidrem: float = Field(description="매수잔량", default=0.0)
+    offerrem: float = Field(description="매도잔량", default=0.0)
+    kind: str = Field(description="종목종류", default="")
+    symbol: str = Field(description="SYMBOL", default="")
+    exid: str = Field(description="EXID", default="")
+    kodate: str = Field(description="한국일자", default="")
+    kotime: str = Field(description="한국시간", default="")
+
+
+# 해외실시간지수(t3518)
+class t3518(BaseModel):
+    inblock: t3518InBlock = Field(description="t3518InBlock")
+    outblock: t3518OutBlock = Field(description="t3518OutBlock")
+    outblock1: List[t3518OutBlock1] = Field(description="t3518OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t3518",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,33 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8401 - 주식선물마스터조회(API용)(t8401)>
+class t8401InBlock(BaseModel):
+    dummy: str = Field(description="Dummy", default="")
+
+
+class t8401OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+    basecode: str = Field(description="기초자산코드", default="")
+
+    class Config:
+        from_attributes = True
+
+
+# 주식선물마스터조회(API용)(t8401)
+class t8401(BaseModel):
+    inblock: t8401InBlock = Field(description="t8401InBlock")
+    outblock: List[t8401OutBlock] = Field(description="t8401OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8401",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,92 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t8402 - 주식선물현재가조회(API용)(t8402)>
+class t8402InBlock(BaseModel):
+    focode: str = Field(description="단축코드", default="")
+
+
+class t8402OutBlock(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    jnilclose: int = Field(description="전일종가", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    stimeqrt: float = Field(description="거래량전일동시간비율", default=0.0)
+    value: int = Field(description="거래대금", default=0)
+    mgjv: int = Field(description="미결제량", default=0)
+    mgjvdiff: int = Field(description="미결제증감", default=0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    uplmtprice: int = Field(description="상한가", default=0)
+    dnlmtprice: int = Field(description="하한가", default=0)
+    high52w: int = Field(description="52최고가", default=0)
+    low52w: int = Field(description="52최저가", default=0)
+    basis: float = Field(description="베이시스", default=0.0)
+    recprice: int = Field(description="기준가", default=0)
+    theoryprice: int = Field(description="이론가", default=0)
+    glyl: float = Field(description="괴리율", default=0.0)
+    lastmonth: str = Field(description="만기일", default="")
+    jandatecnt: int = Field(description="잔여일", default=0)
+    pricejisu: float = Field(description="종합지수", default=0.0)
+    jisusign: str = Field(description="종합지수전일대비구분", default="")
+    jisuchange: float = Field(description="종합지수전일대비", default=0.0)
+    jisudiff: float = Field(description="종합지수등락율", default=0.0)
+    kospijisu: float = Field(description="KOSPI200지수", default=0.0)
+    kospisign: str = Field(description="KOSPI200전일대비구분", default="")
+    kospichange: float = Field(description="KOSPI200전일대비", default=0.0)
+    kospidiff: float = Field(description="KOSPI200등락율", default=0.0)
+    listhprice: int = Field(description="상장최고가", default=0)
+    listlprice: int = Field(description="상장최저가", default=0)
+    delt: float = Field(description="델타", default=0.0)
+    gama: float = Field(description="감마", default=0.0)
+    ceta: float = Field(description="세타", default=0.0)
+    vega: float = Field(description="베가", default=0.0)
+    rhox: float = Field(description="로우", default=0.0)
+    gmprice: int = Field(description="근월물현재가", default=0)
+    gmsign: str = Field(description="근월물전일대비구분", default="")
+    gmchange: int = Field(description="근월물전일대비", default=0)
+    gmdiff: float = Field(description="근월물등락율", default=0.0)
+    theorypriceg: int = Field(description="이론가", default=0)
+    histimpv: float = Field(description="역사적변동성", default=0.0)
+    impv: float = Field(description="내재변동성", default=0.0)
+    sbasis: int = Field(description="시장BASIS", default=0)
+    ibasis: int = Field(description="이론BASIS", default=0)
+    gmfutcode: str = Field(description="근월물종목코드", default="")
+    actprice: int = Field(description="행사가", default=0)
+    shcode: str = Field(description="기초자산단축코드", default="")
+    basehname: str = Field(description="기초자산한글명", default="")
+    baseprice: int = Field(description="기초자산현재가", default=0)
+    basesign: str = Field(description="기초자산현재가대비구분", default="")
+    basechange: int = Field(description="기초자산현재가전일대비", default=0)
+    basediff: float = Field(description="기초자산등락률", default=0.0)
+    basevol: int = Field(description="기초자산거래량", default=0)
+    baseprevol: int = Field(description="기초자산전일거래량", default=0)
+    basebidprc: int = Field(description="기초자산매수호가", default=0)
+    baseaskprc: int = Field(description="기초자산매도호가", default=0)
+    basefornetbid: int = Field(description="기초자산외국계회원사순매수", default=0)
+    prodgrp: str = Field(description="상품군", default="")
+    mulcnt: float = Field(description="승수", default=0.0)
+    danhochk: str = Field(description="단일가호가여부", default="")
+    yeprice: int = Field(description="예상체결가", default=0)
+    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
+    jnilychange: int = Field(description="예상체결가전일종가대비", default=0)
+    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
+
+
+# 주식선물현재가조회(API용)(t8402)
+class t8402(BaseModel):
+    inblock: t8402InBlock = Field(description="t8402InBlock")
+    outblock: t8402OutBlock = Field(description="t8402OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8402",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,57 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8404 - 주식선물시간대별체결조회(API용)(t8404)>
+class t8404InBlock(BaseModel):
+    focode: str = Field(description="단축코드", default="")
+    cvolume: int = Field(description="특이거래량", default=0)
+    stime: str = Field(description="시작시간", default="")
+    etime: str = Field(description="종료시간", default="")
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t8404OutBlock(BaseModel):
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t8404OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    cvolume: int = Field(description="체결수량", default=0)
+    chdegree: float = Field(description="체결강도", default=0.0)
+    offerho: int = Field(description="매도호가", default=0)
+    bidho: int = Field(description="매수호가", default=0)
+    volume: float = Field(description="거래량", default=0.0)
+    openyak: int = Field(description="미결수량", default=0)
+    jnilopenupdn: int = Field(description="미결전일증감", default=0)
+    ibasis: int = Field(description="이론BASIS", default=0)
+    sbasis: int = Field(description="시장BASIS", default=0)
+    kasis: float = Field(description="괴리율", default=0.0)
+    value: float = Field(description="거래대금", default=0.0)
+    j_openupdn: int = Field(description="미결직전증감", default=0)
+    n_msvolume: float = Field(description="누적매수체결량", default=0.0)
+    n_mdvolume: float = Field(description="누적매도체결량", default=0.0)
+    s_msvolume: float = Field(description="누적순매수체결량", default=0.0)
+    n_mschecnt: int = Field(description="누적매수체결건수", default=0)
+    n_mdchecnt: int = Field(description="누적매도체결건수", default=0)
+    s_mschecnt: int = Field(description="누적순매수체결건수", default=0)
+
+
+# 주식선물시간대별체결조회(API용)(t8404)
+class t8404(BaseModel):
+    inblock: t8404InBlock = Field(description="t8404InBlock")
+    outblock: t8404OutBlock = Field(description="t8404OutBlock")
+    outblock1: List[t8404OutBlock1] = Field(description="t8404OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8404",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8405 - 주식선물기간별주가(API용)(t8405)>
+class t8405InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    futcheck: str = Field(description="선물최근월물", default="")
+    date: str = Field(description="날짜", default="")
+    cts_code: str = Field(description="CTS종목코드", default="")
+    lastdate: str = Field(description="전종목만기일", default="")
+    cnt: str = Field(description="조회요청건수", default="")
+
+
+class t8405OutBlock(BaseModel):
+    date: str = Field(description="날짜", default="")
+    cts_code: str = Field(description="CTS종목코드", default="")
+    lastdate: str = Field(description="전종목만기일", default="")
+    nowfutyn: str = Field(description="최근월선물여부", default="")
+
+
+class t8405OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    close: int = Field(description="종가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+    openyak: int = Field(description="미결수량", default=0)
+    openyakupdn: int = Field(description="미결증감", default=0)
+    value: float = Field(description="거래대금", default=0.0)
+
+
+# 주식선물기간별주가(API용)(t8405)
+class t8405(BaseModel):
+    inblock: t8405InBlock = Field(description="t8405InBlock")
+    outblock: t8405OutBlock = Field(description="t8405OutBlock")
+    outblock1: List[t8405OutBlock1] = Field(description="t8405OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8405",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
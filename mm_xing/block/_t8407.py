@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8407 - API용주식멀티현재가조회(t8407)>
+class t8407InBlock(BaseModel):
+    nrec: int = Field(description="건수", default=0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+class t8407OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    offerho: int = Field(description="매도호가", default=0)
+    bidho: int = Field(description="매수호가", default=0)
+    cvolume: int = Field(description="체결수량", default=0)
+    chdegree: float = Field(description="체결강도", default=0.0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    value: int = Field(description="거래대금(백만)", default=0)
+    offerrem: int = Field(description="우선매도잔량", default=0)
+    bidrem: int = Field(description="우선매수잔량", default=0)
+    totofferrem: int = Field(description="총매도잔량", default=0)
+    totbidrem: int = Field(description="총매수잔량", default=0)
+    jnilclose: int = Field(description="전일종가", default=0)
+    uplmtprice: int = Field(description="상한가", default=0)
+    dnlmtprice: int = Field(description="하한가", default=0)
+
+
+# API용주식멀티현재가조회(t8407)
+class t8407(BaseModel):
+    inblock: t8407InBlock = Field(description="t8407InBlock")
+    outblock1: List[t8407OutBlock1] = Field(description="t8407OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8407",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,68 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8410 - API전용주식챠트(일주월년)(t8410)>
+class t8410InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    gubun: str = Field(description="주기구분(2:일3:주4:월5:년)", default="")
+    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
+    sdate: str = Field(description="시작일자", default="")
+    edate: str = Field(description="종료일자", default="")
+    cts_date: str = Field(description="연속일자", default="")
+    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
+    sujung: str = Field(description="수정주가여부(Y:적용N:비적용)", default="")
+
+
+class t8410OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    jisiga: int = Field(description="전일시가", default=0)
+    jihigh: int = Field(description="전일고가", default=0)
+    jilow: int = Field(description="전일저가", default=0)
+    jiclose: int = Field(description="전일종가", default=0)
+    jivolume: int = Field(description="전일거래량", default=0)
+    disiga: int = Field(description="당일시가", default=0)
+    dihigh: int = Field(description="당일고가", default=0)
+    dilow: int = Field(description="당일저가", default=0)
+    diclose: int = Field(description="당일종가", default=0)
+    highend: int = Field(description="상한가", default=0)
+    lowend: int = Field(description="하한가", default=0)
+    cts_date: str = Field(description="연속일자", default="")
+    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
+    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
+    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
+    rec_count: int = Field(description="레코드카운트", default=0)
+    svi_uplmtprice: int = Field(description="정적VI상한가", default=0)
+    svi_dnlmtprice: int = Field(description="정적VI하한가", default=0)
+
+
+class t8410OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    close: int = Field(description="종가", default=0)
+    jdiff_vol: int = Field(description="거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+    jongchk: int = Field(description="수정구분", default=0)
+    rate: float = Field(description="수정비율", default=0.0)
+    pricechk: int = Field(description="수정주가반영항목", default=0)
+    ratevalue: int = Field(description="수정비율반영거래대금", default=0)
+    sign: str = Field(description="종가등락구분(1:상한2:상승3:보합4:하한5:하락주식일만사용)", default="")
+
+
+# API전용주식챠트(일주월년)(t8410)
+class t8410(BaseModel):
+    inblock: t8410InBlock = Field(description="t8410InBlock")
+    outblock: t8410OutBlock = Field(description="t8410OutBlock")
+    outblock1: List[t8410OutBlock1] = Field(description="t8410OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8410",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
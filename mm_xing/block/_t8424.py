@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8424 - 전체업종(t8424)>
+class t8424InBlock(BaseModel):
+    gubun1: str = Field(description="구분1", default="")
+
+
+class t8424OutBlock(BaseModel):
+    hname: str = Field(description="업종명", default="")
+    upcode: str = Field(description="업종코드", default="")
+
+    class Config:
+        from_attributes = True
+
+
+# 전체업종(t8424)
+class t8424(BaseModel):
+    inblock: t8424InBlock = Field(description="t8424InBlock")
+    outblock: List[t8424OutBlock] = Field(description="t8424OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8424",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,32 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8426 - 상품선물마스터조회(API용)(t8426)>
+class t8426InBlock(BaseModel):
+    dummy: str = Field(description="Dummy", default="")
+
+
+class t8426OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+
+    class Config:
+        from_attributes = True
+
+
+# 상품선물마스터조회(API용)(t8426)
+class t8426(BaseModel):
+    inblock: t8426InBlock = Field(description="t8426InBlock")
+    outblock: List[t8426OutBlock] = Field(description="t8426OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8426",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
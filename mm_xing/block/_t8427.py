@@ -0,0 +1,56 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8427 - 과거데이터시간대별조회(t8427)>
+class t8427InBlock(BaseModel):
+    fo_gbn: str = Field(description="선물옵션구분", default="")
+    yyyy: str = Field(description="조회년도", default="")
+    mm: str = Field(description="조회월", default="")
+    cp_gbn: str = Field(description="옵션콜풋구분", default="")
+    actprice: float = Field(description="옵션행사가", default=0.0)
+    focode: str = Field(description="선물옵션코드", default="")
+    dt_gbn: str = Field(description="일분구분", default="")
+    min_term: str = Field(description="분간격", default="")
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+
+
+class t8427OutBlock(BaseModel):
+    focode: str = Field(description="선물옵션코드", default="")
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+
+
+class t8427OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+    openyak: int = Field(description="미결수량", default=0)
+    openyakupdn: int = Field(description="미결증감", default=0)
+    value: float = Field(description="거래대금", default=0.0)
+
+
+# 과거데이터시간대별조회(t8427)
+class t8427(BaseModel):
+    inblock: t8427InBlock = Field(description="t8427InBlock")
+    outblock: t8427OutBlock = Field(description="t8427OutBlock")
+    outblock1: List[t8427OutBlock1] = Field(description="t8427OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8427",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
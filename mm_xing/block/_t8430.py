@@ -0,0 +1,36 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8430 - 주식종목조회(t8430)>
+class t8430InBlock(BaseModel):
+    gubun: str = Field(description="구분(0:전체1:코스피2:코스닥)", default="")
+
+
+class t8430OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+    etfgubun: str = Field(description="ETF구분(1:ETF)", default="")
+    uplmtprice: int = Field(description="상한가", default=0)
+    dnlmtprice: int = Field(description="하한가", default=0)
+    jnilclose: int = Field(description="전일가", default=0)
+    memedan: str = Field(description="주문수량단위", default="")
+    recprice: int = Field(description="기준가", default=0)
+    gubun: str = Field(description="구분(1:코스피2:코스닥)", default="")
+
+
+# 주식종목조회(t8430)
+class t8430(BaseModel):
+    inblock: t8430InBlock = Field(description="t8430InBlock")
+    outblock: List[t8430OutBlock] = Field(description="t8430OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8430",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
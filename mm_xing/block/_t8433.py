@@ -0,0 +1,35 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8433 - 지수옵션마스터조회API용(t8433)>
+class t8433InBlock(BaseModel):
+    dummy: str = Field(description="Dummy", default="")
+
+
+class t8433OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+    hprice: float = Field(description="상한가", default=0.0)
+    lprice: float = Field(description="하한가", default=0.0)
+    jnilclose: float = Field(description="전일종가", default=0.0)
+    jnilhigh: float = Field(description="전일고가", default=0.0)
+    jnillow: float = Field(description="전일저가", default=0.0)
+    recprice: float = Field(description="기준가", default=0.0)
+
+
+# 지수옵션마스터조회API용(t8433)
+class t8433(BaseModel):
+    inblock: t8433InBlock = Field(description="t8433InBlock")
+    outblock: List[t8433OutBlock] = Field(description="t8433OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8433",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
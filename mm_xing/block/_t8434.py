@@ -0,0 +1,35 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8434 - 선물/옵션멀티현재가조회(t8434)>
+class t8434InBlock(BaseModel):
+    qrycnt: int = Field(description="건수", default=0)
+    focode: str = Field(description="단축코드", default="")
+
+
+class t8434OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    checnt: int = Field(description="체결건수", default=0)
+    focode: str = Field(description="단축코드", default="")
+
+
+# 선물/옵션멀티현재가조회(t8434)
+class t8434(BaseModel):
+    inblock: t8434InBlock = Field(description="t8434InBlock")
+    outblock1: List[t8434OutBlock1] = Field(description="t8434OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8434",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
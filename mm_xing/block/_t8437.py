@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8437 - CME/EUREX마스터조회(API용)(t8437)>
+class t8437InBlock(BaseModel):
+    gubun: str = Field(description="구분(NF/NC/NM/NO)", default="")
+
+
+class t8437OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="종목코드", default="")
+    expcode: str = Field(description="표준코드", default="")
+    tradeunit: float = Field(description="거래승수", default=0.0)
+    atmgb: str = Field(description="ATM구분(1:ATM2:ITM3:OTM)", default="")
+
+
+# CME/EUREX마스터조회(API용)(t8437)
+class t8437(BaseModel):
+    inblock: t8437InBlock = Field(description="t8437InBlock")
+    outblock: List[t8437OutBlock] = Field(description="t8437OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8437",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t9905 - 기초자산리스트조회(t9905)>
+class t9905InBlock(BaseModel):
+    dummy: str = Field(description="DUMMY", default="")
+
+
+class t9905OutBlock1(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="표준코드", default="")
+    hname: str = Field(description="종목명", default="")
+
+
+# 기초자산리스트조회(t9905)
+class t9905(BaseModel):
+    inblock: t9905InBlock = Field(description="t9905InBlock")
+    outblock1: List[t9905OutBlock1] = Field(description="t9905OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t9905",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t9942 - ELW마스터조회API용(t9942)>
+class t9942InBlock(BaseModel):
+    dummy: str = Field(description="Dummy", default="")
+
+
+class t9942OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+
+
+# ELW마스터조회API용(t9942)
+class t9942(BaseModel):
+    inblock: t9942InBlock = Field(description="t9942InBlock")
+    outblock: List[t9942OutBlock] = Field(description="t9942OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t9942",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t9945 - 주식마스터조회API용-종목명40bytes(t9945)>
+class t9945InBlock(BaseModel):
+    gubun: str = Field(description="구분(KSP:1KSD:2)", default="")
+
+
+class t9945OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+    etfchk: str = Field(description="ETF구분", default="")
+    filler: str = Field(description="filler", default="")
+
+
+# 주식마스터조회API용-종목명40bytes(t9945)
+class t9945(BaseModel):
+    inblock: t9945InBlock = Field(description="t9945InBlock")
+    outblock: List[t9945OutBlock] = Field(description="t9945OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t9945",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,108 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <BMT - 시간대별투자자매매추이(BMT)>
+class BMTInBlock(msgspec.Struct, frozen=True, gc=False):
+    upcode: str = '' # 업종코드
+
+
+class BMTOutBlock(msgspec.Struct, frozen=True, gc=False):
+    tjjtime: str = '' # 수신시간
+    tjjcode1: str = '' # 투자자코드1(개인)
+    msvolume1: int = 0 # 매수 거래량1
+    mdvolume1: int = 0 # 매도 거래량1
+    msvol1: int = 0 # 거래량 순매수1
+    msvalue1: int = 0 # 매수 거래대금1
+    mdvalue1: int = 0 # 매도 거래대금1
+    msval1: int = 0 # 거래대금 순매수1
+    tjjcode2: str = '' # 투자자코드2(외국인)
+    msvolume2: int = 0 # 매수 거래량2
+    mdvolume2: int = 0 # 매도 거래량2
+    msvol2: int = 0 # 거래량 순매수2
+    msvalue2: int = 0 # 매수 거래대금2
+    mdvalue2: int = 0 # 매도 거래대금2
+    msval2: int = 0 # 거래대금 순매수2
+    tjjcode3: str = '' # 투자자코드3(기관계)
+    msvolume3: int = 0 # 매수 거래량3
+    mdvolume3: int = 0 # 매도 거래량3
+    msvol3: int = 0 # 거래량 순매수3
+    msvalue3: int = 0 # 매수 거래대금3
+    mdvalue3: int = 0 # 매도 거래대금3
+    msval3: int = 0 # 거래대금 순매수3
+    tjjcode4: str = '' # 투자자코드4(증권)
+    msvolume4: int = 0 # 매수 거래량4
+    mdvolume4: int = 0 # 매도 거래량4
+    msvol4: int = 0 # 거래량 순매수4
+    msvalue4: int = 0 # 매수 거래대금4
+    mdvalue4: int = 0 # 매도 거래대금4
+    msval4: int = 0 # 거래대금 순매수4
+    tjjcode5: str = '' # 투자자코드5(투신)
+    msvolume5: int = 0 # 매수 거래량5
+    mdvolume5: int = 0 # 매도 거래량5
+    msvol5: int = 0 # 거래량 순매수5
+    msvalue5: int = 0 # 매수 거래대금5
+    mdvalue5: int = 0 # 매도 거래대금5
+    msval5: int = 0 # 거래대금 순매수5
+    tjjcode6: str = '' # 투자자코드6(은행)
+    msvolume6: int = 0 # 매수 거래량6
+    mdvolume6: int = 0 # 매도 거래량6
+    msvol6: int = 0 # 거래량 순매수6
+    msvalue6: int = 0 # 매수 거래대금6
+    mdvalue6: int = 0 # 매도 거래대금6
+    msval6: int = 0 # 거래대금 순매수6
+    tjjcode7: str = '' # 투자자코드7(보험)
+    msvolume7: int = 0 # 매수 거래량7
+    mdvolume7: int = 0 # 매도 거래량7
+    msvol7: int = 0 # 거래량 순매수7
+    msvalue7: int = 0 # 매수 거래대금7
+    mdvalue7: int = 0 # 매도 거래대금7
+    msval7: int = 0 # 거래대금 순매수7
+    tjjcode8: str = '' # 투자자코드8(종금)
+    msvolume8: int = 0 # 매수 거래량8
+    mdvolume8: int = 0 # 매도 거래량8
+    msvol8: int = 0 # 거래량 순매수8
+    msvalue8: int = 0 # 매수 거래대금8
+    mdvalue8: int = 0 # 매도 거래대금8
+    msval8: int = 0 # 거래대금 순매수8
+    tjjcode9: str = '' # 투자자코드9(기금)
+    msvolume9: int = 0 # 매수 거래량9
+    mdvolume9: int = 0 # 매도 거래량9
+    msvol9: int = 0 # 거래량 순매수9
+    msvalue9: int = 0 # 매수 거래대금9
+    mdvalue9: int = 0 # 매도 거래대금9
+    msval9: int = 0 # 거래대금 순매수9
+    tjjcode10: str = '' # 투자자코드10(선물업자)
+    msvolume10: int = 0 # 매수 거래량10
+    mdvolume10: int = 0 # 매도 거래량10
+    msvol10: int = 0 # 거래량 순매수10
+    msvalue10: int = 0 # 매수 거래대금10
+    mdvalue10: int = 0 # 매도 거래대금10
+    msval10: int = 0 # 거래대금 순매수10
+    tjjcode11: str = '' # 투자자코드11(기타)
+    msvolume11: int = 0 # 매수 거래량11
+    mdvolume11: int = 0 # 매도 거래량11
+    msvol11: int = 0 # 거래량 순매수11
+    msvalue11: int = 0 # 매수 거래대금11
+    mdvalue11: int = 0 # 매도 거래대금11
+    msval11: int = 0 # 거래대금 순매수11
+    upcode: str = '' # 업종코드
+    tjjcode0: str = '' # 투자자코드0(사모펀드)
+    msvolume0: int = 0 # 매수 거래량0
+    mdvolume0: int = 0 # 매도 거래량0
+    msvol0: int = 0 # 거래량 순매수0
+    msvalue0: int = 0 # 매수 거래대금0
+    mdvalue0: int = 0 # 매도 거래대금0
+    msval0: int = 0 # 거래대금 순매수0
+
+
+
+# 시간대별투자자매매추이(BMT) 
+class BMT(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[BMTOutBlock] = msgspec.field(default=None, name='BMTOutBlock')
+# endregion
@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <C01 - 선물주문체결>
+class C01OutBlock(msgspec.Struct, frozen=True, gc=False):
+    lineseq: int = 0 # 라인일련번호
+    accno: str = '' # 계좌번호
+    user: str = '' # 조작자ID
+    seq: int = 0 # 일련번호
+    trcode: str = '' # trcode
+    megrpno: str = '' # 매칭그룹번호
+    boardid: str = '' # 보드ID
+    memberno: str = '' # 회원번호
+    bpno: str = '' # 지점번호
+    ordno: str = '' # 주문번호
+    ordordno: str = '' # 원주문번호
+    expcode: str = '' # 종목코드
+    yakseq: str = '' # 약정번호
+    cheprice: float = 0.0 # 체결가격
+    chevol: int = 0 # 체결수량
+    sessionid: str = '' # 세션ID
+    chedate: str = '' # 체결일자
+    chetime: str = '' # 체결시각
+    spdprc1: float = 0.0 # 최근월체결가격
+    spdprc2: float = 0.0 # 차근월체결가격
+    dosugb: str = '' # 매도수구분
+    accno1: str = '' # 계좌번호1
+    sihogagb: str = '' # 시장조성호가구분
+    jakino: str = '' # 위탁사번호
+    daeyong: str = '' # 대용주권계좌번호
+    mem_filler: str = '' # mem_filler
+    mem_accno: str = '' # mem_accno
+    mem_filler1: str = '' # mem_filler1
+
+
+
+# 선물주문체결 
+class C01(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[C01OutBlock] = msgspec.field(default=None, name='C01OutBlock')
+# endregion
@@ -0,0 +1,158 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CDPCQ04700 - 계좌 거래내역>
+class CDPCQ04700InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    QryTp: str = '' # 조회구분
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    SrtNo: int = 0 # 시작번호
+    PdptnCode: str = '' # 상품유형코드
+    IsuLgclssCode: str = '' # 종목대분류코드
+    IsuNo: str = '' # 종목번호
+
+
+class CDPCQ04700OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    QryTp: str = '' # 조회구분
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    SrtNo: int = 0 # 시작번호
+    PdptnCode: str = '' # 상품유형코드
+    IsuLgclssCode: str = '' # 종목대분류코드
+    IsuNo: str = '' # 종목번호
+
+
+class CDPCQ04700OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+
+
+class CDPCQ04700OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    AcntNo: str = '' # 계좌번호
+    TrdDt: str = '' # 거래일자
+    TrdNo: int = 0 # 거래번호
+    TpCodeNm: str = '' # 구분코드명
+    SmryNo: str = '' # 적요번호
+    SmryNm: str = '' # 적요명
+    CancTpNm: str = '' # 취소구분
+    TrdQty: int = 0 # 거래수량
+    Trtax: int = 0 # 거래세
+    FcurrAdjstAmt: float = 0.0 # 외화정산금액
+    AdjstAmt: int = 0 # 정산금액
+    OvdSum: int = 0 # 연체합
+    DpsBfbalAmt: int = 0 # 예수금전잔금액
+    SellPldgRfundAmt: int = 0 # 매도담보상환금
+    DpspdgLoanBfbalAmt: int = 0 # 예탁담보대출전잔금액
+    TrdmdaNm: str = '' # 거래매체명
+    OrgTrdNo: int = 0 # 원거래번호
+    IsuNm: str = '' # 종목명
+    TrdUprc: float = 0.0 # 거래단가
+    CmsnAmt: int = 0 # 수수료
+    FcurrCmsnAmt: float = 0.0 # 외화수수료금액
+    RfundDiffAmt: int = 0 # 상환차이금액
+    RepayAmtSum: int = 0 # 변제금합계
+    SecCrbalQty: int = 0 # 유가증권금잔수량
+    CslLoanRfundIntrstAmt: int = 0 # 매도대금담보대출상환이자금액
+    DpspdgLoanCrbalAmt: int = 0 # 예탁담보대출금잔금액
+    TrxTime: str = '' # 처리시각
+    Inouno: int = 0 # 출납번호
+    IsuNo: str = '' # 종목번호
+    TrdAmt: int = 0 # 거래금액
+    ChckAmt: int = 0 # 수표금액
+    TaxSumAmt: int = 0 # 세금합계금액
+    FcurrTaxSumAmt: float = 0.0 # 외화세금합계금액
+    IntrstUtlfee: int = 0 # 이자이용료
+    MnyDvdAmt: int = 0 # 배당금액
+    RcvblOcrAmt: int = 0 # 미수발생금액
+    TrxBrnNo: str = '' # 처리지점번호
+    TrxBrnNm: str = '' # 처리지점명
+    DpspdgLoanAmt: int = 0 # 예탁담보대출금액
+    DpspdgLoanRfundAmt: int = 0 # 예탁담보대출상환금액
+    BasePrc: float = 0.0 # 기준가
+    DpsCrbalAmt: int = 0 # 예수금금잔금액
+    BoaAmt: int = 0 # 과표
+    MnyoutAbleAmt: int = 0 # 출금가능금액
+    BcrLoanOcrAmt: int = 0 # 수익증권담보대출발생금
+    BcrLoanBfbalAmt: int = 0 # 수익증권담보대출전잔금
+    BnsBasePrc: float = 0.0 # 매매기준가
+    TaxchrBasePrc: float = 0.0 # 과세기준가
+    TrdUnit: int = 0 # 거래좌수
+    BalUnit: int = 0 # 잔고좌수
+    EvrTax: int = 0 # 제세금
+    EvalAmt: int = 0 # 평가금액
+    BcrLoanRfundAmt: int = 0 # 수익증권담보대출상환금
+    BcrLoanCrbalAmt: int = 0 # 수익증권담보대출금잔금
+    AddMgnOcrTotamt: int = 0 # 추가증거금발생총액
+    AddMnyMgnOcrAmt: int = 0 # 추가현금증거금발생금액
+    AddMgnDfryTotamt: int = 0 # 추가증거금납부총액
+    AddMnyMgnDfryAmt: int = 0 # 추가현금증거금납부금액
+    BnsplAmt: int = 0 # 매매손익금액
+    Ictax: int = 0 # 소득세
+    Ihtax: int = 0 # 주민세
+    LoanDt: str = '' # 대출일
+    CrcyCode: str = '' # 통화코드
+    FcurrAmt: float = 0.0 # 외화금액
+    FcurrTrdAmt: float = 0.0 # 외화거래금액
+    FcurrDps: float = 0.0 # 외화예수금
+    FcurrDpsBfbalAmt: float = 0.0 # 외화예수금전잔금액
+    OppAcntNm: str = '' # 상대계좌명
+    OppAcntNo: str = '' # 상대계좌번호
+    LoanRfundAmt: int = 0 # 대출상환금액
+    LoanIntrstAmt: int = 0 # 대출이자금액
+    AskpsnNm: str = '' # 의뢰인명
+    OrdDt: str = '' # 주문일자
+    TrdXchrat: float = 0.0 # 거래환율
+    RdctCmsn: float = 0.0 # 감면수수료
+    FcurrStmpTx: float = 0.0 # 외화인지세
+    FcurrElecfnTrtax: float = 0.0 # 외화전자금융거래세
+    FcstckTrtax: float = 0.0 # 외화증권거래세
+
+
+class CDPCQ04700OutBlock4(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    PnlSumAmt: int = 0 # 손익합계금액
+    CtrctAsm: int = 0 # 약정누계
+    CmsnAmtSumAmt: int = 0 # 수수료합계금액
+
+
+class CDPCQ04700OutBlock5(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    MnyinAmt: int = 0 # 입금금액
+    SecinAmt: int = 0 # 입고금액
+    MnyoutAmt: int = 0 # 출금금액
+    SecoutAmt: int = 0 # 출고금액
+    DiffAmt: int = 0 # 차이금액
+    DiffAmt0: int = 0 # 차이금액0
+    SellQty: int = 0 # 매도수량
+    SellAmt: int = 0 # 매도금액
+    SellCmsn: int = 0 # 매도수수료
+    EvrTax: int = 0 # 제세금
+    FcurrSellAdjstAmt: float = 0.0 # 외화매도정산금액
+    BuyQty: int = 0 # 매수수량
+    BuyAmt: int = 0 # 매수금액
+    BuyCmsn: int = 0 # 매수수수료
+    ExecTax: int = 0 # 체결세금
+    FcurrBuyAdjstAmt: float = 0.0 # 외화매수정산금액
+
+
+
+# 계좌 거래내역 
+class CDPCQ04700(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CDPCQ04700OutBlock1] = msgspec.field(default=None, name='CDPCQ04700OutBlock1')
+    outblock2: Optional[CDPCQ04700OutBlock2] = msgspec.field(default=None, name='CDPCQ04700OutBlock2')
+    outblock3: Optional[List[CDPCQ04700OutBlock3]] = msgspec.field(default=None, name='CDPCQ04700OutBlock3')
+    outblock4: Optional[CDPCQ04700OutBlock4] = msgspec.field(default=None, name='CDPCQ04700OutBlock4')
+    outblock5: Optional[CDPCQ04700OutBlock5] = msgspec.field(default=None, name='CDPCQ04700OutBlock5')
+# endregion
@@ -0,0 +1,66 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CEXAQ21100 - 유렉스 주문체결내역조회>
+class CEXAQ21100InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    ChoicInptTpCode: str = '' # 선택입력구분
+    AcntNo: str = '' # 지점번호
+    Pwd: str = '' # 비밀번호
+    PrdtExecTpCode: str = '' # 체결구분
+    StnlnSeqTp: str = '' # 정렬순서구분
+
+
+class CEXAQ21100OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    ChoicInptTpCode: str = '' # 선택입력구분
+    AcntNo: str = '' # 지점번호
+    Pwd: str = '' # 비밀번호
+    PrdtExecTpCode: str = '' # 체결구분
+    StnlnSeqTp: str = '' # 정렬순서구분
+
+
+class CEXAQ21100OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    OrdQty: int = 0 # 주문수량
+    ExecQty: int = 0 # 체결수량
+
+
+class CEXAQ21100OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    AcntNo1: str = '' # 계좌번호1
+    OrdDt: str = '' # 주문일
+    OrdNo: int = 0 # 주문번호
+    OrgOrdNo: int = 0 # 원주문번호
+    OrdTime: str = '' # 주문시각
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    IsuNm: str = '' # 종목명
+    BnsTpNm: str = '' # 매매구분
+    BnsTpCode: str = '' # 매매구분
+    MrcTpNm: str = '' # 정정취소구분명
+    ErxPrcCndiTpCode: str = '' # 유렉스가격조건구분코드
+    FnoOrdprcPtnNm: str = '' # 선물옵션호가유형명
+    OrdCndiPrc: float = 0.0 # 주문조건가격
+    OrdPrc: float = 0.0 # 주문가
+    OrdQty: int = 0 # 주문수량
+    OrdTpNm: str = '' # 주문구분명
+    ExecPrc: float = 0.0 # 체결가
+    ExecQty: int = 0 # 체결수량
+    UnercQty: int = 0 # 미체결수량
+    CommdaCode: str = '' # 통신매체코드
+    CommdaNm: str = '' # 통신매체명
+
+
+
+# 유렉스 주문체결내역조회 
+class CEXAQ21100(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CEXAQ21100OutBlock1] = msgspec.field(default=None, name='CEXAQ21100OutBlock1')
+    outblock2: Optional[CEXAQ21100OutBlock2] = msgspec.field(default=None, name='CEXAQ21100OutBlock2')
+    outblock3: Optional[List[CEXAQ21100OutBlock3]] = msgspec.field(default=None, name='CEXAQ21100OutBlock3')
+# endregion
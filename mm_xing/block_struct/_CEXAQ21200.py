@@ -0,0 +1,56 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CEXAQ21200 - 유렉스 주문가능 수량/금액 조회>
+class CEXAQ21200InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QryTp: str = '' # 조회구분
+    OrdAmt: int = 0 # 주문금액
+    RatVal: float = 0.0 # 비율값
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분
+    OrdPrc: float = 0.0 # 주문가
+    ErxPrcCndiTpCode: str = '' # 유렉스가격조건구분코드
+
+
+class CEXAQ21200OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QryTp: str = '' # 조회구분
+    OrdAmt: int = 0 # 주문금액
+    RatVal: float = 0.0 # 비율값
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분
+    OrdPrc: float = 0.0 # 주문가
+    ErxPrcCndiTpCode: str = '' # 유렉스가격조건구분코드
+
+
+class CEXAQ21200OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    QryDt: str = '' # 조회일
+    NowPrc: float = 0.0 # 현재가
+    OrdAbleQty: int = 0 # 주문가능수량
+    NewOrdAbleQty: int = 0 # 신규주문가능수량
+    LqdtOrdAbleQty: int = 0 # 청산주문가능수량
+    UsePreargMgn: int = 0 # 사용예정증거금액
+    UsePreargMnyMgn: int = 0 # 사용예정현금증거금액
+    OrdAbleAmt: int = 0 # 주문가능금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+
+
+
+# 유렉스 주문가능 수량/금액 조회 
+class CEXAQ21200(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CEXAQ21200OutBlock1] = msgspec.field(default=None, name='CEXAQ21200OutBlock1')
+    outblock2: Optional[CEXAQ21200OutBlock2] = msgspec.field(default=None, name='CEXAQ21200OutBlock2')
+# endregion
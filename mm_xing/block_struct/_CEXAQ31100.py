@@ -0,0 +1,63 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CEXAQ31100 - 유렉스 야간장잔고및 평가현황>
+class CEXAQ31100InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    IsuCode: str = '' # 종목코드
+    BalEvalTp: str = '' # 잔고평가구분
+    FutsPrcEvalTp: str = '' # 선물가격평가구분
+
+
+class CEXAQ31100OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    IsuCode: str = '' # 종목코드
+    BalEvalTp: str = '' # 잔고평가구분
+    FutsPrcEvalTp: str = '' # 선물가격평가구분
+
+
+class CEXAQ31100OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    AcntNm: str = '' # 계좌명
+    BnsplAmt: int = 0 # 매매손익금액
+    AdjstDfamt: int = 0 # 정산차금
+    TotEvalAmt: int = 0 # 총평가금액
+    TotPnlAmt: int = 0 # 총손익금액
+
+
+class CEXAQ31100OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    IsuNm: str = '' # 종목명
+    BnsTpCode: str = '' # 매매구분
+    BnsTpNm: str = '' # 매매구분
+    UnsttQty: int = 0 # 미결제수량
+    LqdtAbleQty: int = 0 # 청산가능수량
+    FnoAvrPrc: float = 0.0 # 평균가
+    BasePrc: float = 0.0 # 기준가
+    NowPrc: float = 0.0 # 현재가
+    CmpPrc: float = 0.0 # 대비가
+    EvalAmt: int = 0 # 평가금액
+    EvalPnl: int = 0 # 평가손익
+    PnlRat: float = 0.0 # 손익률
+    UnsttAmt: int = 0 # 미결제금액
+    BnsplAmt: int = 0 # 매매손익금액
+
+
+
+# 유렉스 야간장잔고및 평가현황 
+class CEXAQ31100(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CEXAQ31100OutBlock1] = msgspec.field(default=None, name='CEXAQ31100OutBlock1')
+    outblock2: Optional[CEXAQ31100OutBlock2] = msgspec.field(default=None, name='CEXAQ31100OutBlock2')
+    outblock3: Optional[List[CEXAQ31100OutBlock3]] = msgspec.field(default=None, name='CEXAQ31100OutBlock3')
+# endregion
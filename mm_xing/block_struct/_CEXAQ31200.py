@@ -0,0 +1,78 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CEXAQ31200 - 유렉스 예탁금 및 통합잔고조회>
+class CEXAQ31200InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    BalEvalTp: str = '' # 잔고평가구분
+    FutsPrcEvalTp: str = '' # 선물가격평가구분
+
+
+class CEXAQ31200OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    BalEvalTp: str = '' # 잔고평가구분
+    FutsPrcEvalTp: str = '' # 선물가격평가구분
+
+
+class CEXAQ31200OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    AcntNm: str = '' # 계좌명
+    EvalDpsamtTotamt: int = 0 # 평가예탁금총액
+    MnyEvalDpstgAmt: int = 0 # 현금평가예탁금액
+    DpsamtTotamt: int = 0 # 예탁금총액
+    DpstgMny: int = 0 # 예탁현금
+    PsnOutAbleTotAmt: int = 0 # 인출가능총금액
+    PsnOutAbleCurAmt: int = 0 # 인출가능현금액
+    OrdAbleTotAmt: int = 0 # 주문가능총금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    CsgnMgnTotamt: int = 0 # 위탁증거금총액
+    MnyCsgnMgn: int = 0 # 현금위탁증거금액
+    AddMgnTotamt: int = 0 # 추가증거금총액
+    MnyAddMgn: int = 0 # 현금추가증거금액
+    CmsnAmt: int = 0 # 수수료
+    FutsEvalPnlAmt: int = 0 # 선물평가손익금액
+    OptEvalPnlAmt: int = 0 # 옵션평가손익금액
+    OptEvalAmt: int = 0 # 옵션평가금액
+    OptBnsplAmt: int = 0 # 옵션매매손익금액
+    FutsAdjstDfamt: int = 0 # 선물정산차금
+    TotPnlAmt: int = 0 # 총손익금액
+    NetPnlAmt: int = 0 # 순손익금액
+    TotEvalAmt: int = 0 # 총평가금액
+    MnyinAmt: int = 0 # 입금금액
+    MnyoutAmt: int = 0 # 출금금액
+    FutsCmsnAmt: int = 0 # 선물수수료금액
+
+
+class CEXAQ31200OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    IsuNm: str = '' # 종목명
+    BnsTpCode: str = '' # 매매구분
+    BnsTpNm: str = '' # 매매구분
+    UnsttQty: int = 0 # 미결제수량
+    FnoAvrPrc: float = 0.0 # 평균가
+    NowPrc: float = 0.0 # 현재가
+    CmpPrc: float = 0.0 # 대비가
+    EvalPnl: int = 0 # 평가손익
+    PnlRat: float = 0.0 # 손익률
+    EvalAmt: int = 0 # 평가금액
+    LqdtAbleQty: int = 0 # 청산가능수량
+
+
+
+# 유렉스 예탁금 및 통합잔고조회 
+class CEXAQ31200(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CEXAQ31200OutBlock1] = msgspec.field(default=None, name='CEXAQ31200OutBlock1')
+    outblock2: Optional[CEXAQ31200OutBlock2] = msgspec.field(default=None, name='CEXAQ31200OutBlock2')
+    outblock3: Optional[List[CEXAQ31200OutBlock3]] = msgspec.field(default=None, name='CEXAQ31200OutBlock3')
+# endregion
@@ -0,0 +1,86 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CEXAQ44200 - EUREX 야간옵션 기간주문체결조회>
+class CEXAQ44200InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    ChoicInptTpCode: str = '' # 선택입력구분
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    PrdtExecTpCode: str = '' # 체결구분
+    FnoTrdPtnCode: str = '' # 선물옵션거래유형코드
+    SrtOrdNo2: int = 0 # 시작주문번호2
+    StnlnSeqTp: str = '' # 정렬순서구분
+
+
+class CEXAQ44200OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    ChoicInptTpCode: str = '' # 선택입력구분
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    PrdtExecTpCode: str = '' # 체결구분
+    FnoTrdPtnCode: str = '' # 선물옵션거래유형코드
+    SrtOrdNo2: int = 0 # 시작주문번호2
+    StnlnSeqTp: str = '' # 정렬순서구분
+
+
+class CEXAQ44200OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdQty: int = 0 # 주문수량
+    ExecQty: int = 0 # 체결수량
+    UnercQty: int = 0 # 미체결수량
+    ExecPrc: float = 0.0 # 체결가
+
+
+class CEXAQ44200OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    AcntNo1: str = '' # 계좌번호1
+    AcntNm: str = '' # 계좌명
+    OrdDt: str = '' # 주문일
+    OrdNo: int = 0 # 주문번호
+    OrgOrdNo: int = 0 # 원주문번호
+    OrdTime: str = '' # 주문시각
+    IsuNo: str = '' # 종목번호
+    IsuNm: str = '' # 종목명
+    BnsTpNm: str = '' # 매매구분
+    BnsTpCode: str = '' # 매매구분
+    ErxOrdprcTpCode: str = '' # 유렉스호가구분코드
+    MrcTpNm: str = '' # 정정취소구분명
+    ErxPrcCndiTpCode: str = '' # 유렉스가격조건구분코드
+    CodeNm: str = '' # 코드명
+    OrdPrc: float = 0.0 # 주문가
+    OrdQty: int = 0 # 주문수량
+    FnoRjtRsnCode: str = '' # 선물옵션거부사유코드
+    OrdTpNm: str = '' # 주문구분명
+    ExecTpNm: str = '' # 체결구분명
+    ExecPrc: float = 0.0 # 체결가
+    ExecQty: int = 0 # 체결수량
+    ExecTime: str = '' # 체결시각
+    ExecNo: int = 0 # 체결번호
+    UnercQty: int = 0 # 미체결수량
+    UserId: str = '' # 사용자ID
+    CommdaCode: str = '' # 통신매체코드
+    CommdaCodeNm: str = '' # 통신매체코드명
+    IpAddr: str = '' # IP주소
+    TrdPtnTpNm: str = '' # 거래유형구분
+    ErxOrdStatCode: str = '' # 유렉스주문상태코드
+    CodeNm0: str = '' # 코드명0
+    ExchRcptTime: str = '' # 거래소접수시각
+
+
+
+# EUREX 야간옵션 기간주문체결조회 
+class CEXAQ44200(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CEXAQ44200OutBlock1] = msgspec.field(default=None, name='CEXAQ44200OutBlock1')
+    outblock2: Optional[CEXAQ44200OutBlock2] = msgspec.field(default=None, name='CEXAQ44200OutBlock2')
+    outblock3: Optional[List[CEXAQ44200OutBlock3]] = msgspec.field(default=None, name='CEXAQ44200OutBlock3')
+# endregion
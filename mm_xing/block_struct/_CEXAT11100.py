@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CEXAT11100 - 유렉스 매수/매도주문>
+class CEXAT11100InBlock1(msgspec.Struct, frozen=True, gc=False):
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분
+    ErxPrcCndiTpCode: str = '' # 유렉스가격조건구분코드
+    OrdPrc: float = 0.0 # 주문가격
+    OrdQty: int = 0 # 주문수량
+
+
+class CEXAT11100OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분
+    ErxPrcCndiTpCode: str = '' # 유렉스가격조건구분코드
+    OrdPrc: float = 0.0 # 주문가격
+    OrdQty: int = 0 # 주문수량
+    OrdCndiPrc: float = 0.0 # 주문조건가격
+    CommdaCode: str = '' # 통신매체코드
+
+
+class CEXAT11100OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdNo: int = 0 # 주문번호
+    BrnNm: str = '' # 지점명
+    AcntNm: str = '' # 계좌명
+    IsuNm: str = '' # 종목명
+    OrdAbleAmt: int = 0 # 주문가능금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    OrdMgn: int = 0 # 주문증거금
+    MnyOrdMgn: int = 0 # 현금주문증거금
+    OrdAbleQty: int = 0 # 주문가능수량
+
+
+
+# 유렉스 매수/매도주문 
+class CEXAT11100(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CEXAT11100OutBlock1] = msgspec.field(default=None, name='CEXAT11100OutBlock1')
+    outblock2: Optional[CEXAT11100OutBlock2] = msgspec.field(default=None, name='CEXAT11100OutBlock2')
+# endregion
@@ -0,0 +1,51 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CEXAT11200 - 유렉스 정정주문>
+class CEXAT11200InBlock1(msgspec.Struct, frozen=True, gc=False):
+    OrgOrdNo: int = 0 # 원주문번호
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    OrdPrc: float = 0.0 # 주문가격
+
+
+class CEXAT11200OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrgOrdNo: int = 0 # 원주문번호
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분코드
+    ErxPrcCndiTpCode: str = '' # 유렉스가격조건구분코드
+    OrdPrc: float = 0.0 # 주문가격
+    MdfyQty: int = 0 # 정정수량
+    OrdCndiPrc: float = 0.0 # 주문조건가격
+    CommdaCode: str = '' # 통신매체코드
+
+
+class CEXAT11200OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdNo: int = 0 # 주문번호
+    BrnNm: str = '' # 지점명
+    AcntNm: str = '' # 계좌명
+    IsuNm: str = '' # 종목명
+    OrdAbleAmt: int = 0 # 주문가능금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    OrdMgn: int = 0 # 주문증거금액
+    MnyOrdMgn: int = 0 # 현금주문증거금액
+    OrdAbleQty: int = 0 # 주문가능수량
+
+
+
+# 유렉스 정정주문 
+class CEXAT11200(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CEXAT11200OutBlock1] = msgspec.field(default=None, name='CEXAT11200OutBlock1')
+    outblock2: Optional[CEXAT11200OutBlock2] = msgspec.field(default=None, name='CEXAT11200OutBlock2')
+# endregion
@@ -0,0 +1,79 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CFOAQ00600 - 선물옵션 계좌주문체결내역조회>
+class CFOAQ00600InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    FnoClssCode: str = '' # 선물옵션분류코드
+    PrdgrpCode: str = '' # 상품군코드
+    PrdtExecTpCode: str = '' # 체결구분
+    StnlnSeqTp: str = '' # 정렬순서구분
+    CommdaCode: str = '' # 통신매체코드
+
+
+class CFOAQ00600OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    FnoClssCode: str = '' # 선물옵션분류코드
+    PrdgrpCode: str = '' # 상품군코드
+    PrdtExecTpCode: str = '' # 체결구분
+    StnlnSeqTp: str = '' # 정렬순서구분
+    CommdaCode: str = '' # 통신매체코드
+
+
+class CFOAQ00600OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    FutsOrdQty: int = 0 # 선물주문수량
+    FutsExecQty: int = 0 # 선물체결수량
+    OptOrdQty: int = 0 # 옵션주문수량
+    OptExecQty: int = 0 # 옵션체결수량
+
+
+class CFOAQ00600OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    OrdDt: str = '' # 주문일
+    OrdNo: int = 0 # 주문번호
+    OrgOrdNo: int = 0 # 원주문번호
+    OrdTime: str = '' # 주문시각
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    IsuNm: str = '' # 종목명
+    BnsTpNm: str = '' # 매매구분
+    MrcTpNm: str = '' # 정정취소구분명
+    FnoOrdprcPtnCode: str = '' # 선물옵션호가유형코드
+    FnoOrdprcPtnNm: str = '' # 선물옵션호가유형명
+    OrdPrc: float = 0.0 # 주문가
+    OrdQty: int = 0 # 주문수량
+    OrdTpNm: str = '' # 주문구분명
+    ExecTpNm: str = '' # 체결구분명
+    ExecPrc: float = 0.0 # 체결가
+    ExecQty: int = 0 # 체결수량
+    CtrctTime: str = '' # 약정시각
+    CtrctNo: int = 0 # 약정번호
+    ExecNo: int = 0 # 체결번호
+    BnsplAmt: int = 0 # 매매손익금액
+    UnercQty: int = 0 # 미체결수량
+    UserId: str = '' # 사용자ID
+    CommdaCode: str = '' # 통신매체코드
+    CommdaCodeNm: str = '' # 통신매체코드명
+
+
+
+# 선물옵션 계좌주문체결내역조회 
+class CFOAQ00600(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CFOAQ00600OutBlock1] = msgspec.field(default=None, name='CFOAQ00600OutBlock1')
+    outblock2: Optional[CFOAQ00600OutBlock2] = msgspec.field(default=None, name='CFOAQ00600OutBlock2')
+    outblock3: Optional[List[CFOAQ00600OutBlock3]] = msgspec.field(default=None, name='CFOAQ00600OutBlock3')
+# endregion
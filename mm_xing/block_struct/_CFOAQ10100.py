@@ -0,0 +1,56 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CFOAQ10100 - 선물옵션 주문가능수량조회>
+class CFOAQ10100InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QryTp: str = '' # 조회구분
+    OrdAmt: int = 0 # 주문금액
+    RatVal: float = 0.0 # 비율값
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분
+    FnoOrdPrc: float = 0.0 # 선물옵션주문가격
+    FnoOrdprcPtnCode: str = '' # 선물옵션호가유형코드
+
+
+class CFOAQ10100OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QryTp: str = '' # 조회구분
+    OrdAmt: int = 0 # 주문금액
+    RatVal: float = 0.0 # 비율값
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분
+    FnoOrdPrc: float = 0.0 # 선물옵션주문가격
+    FnoOrdprcPtnCode: str = '' # 선물옵션호가유형코드
+
+
+class CFOAQ10100OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    QryDt: str = '' # 조회일
+    FnoNowPrc: float = 0.0 # 선물옵션현재가
+    OrdAbleQty: int = 0 # 주문가능수량
+    NewOrdAbleQty: int = 0 # 신규주문가능수량
+    LqdtOrdAbleQty: int = 0 # 청산주문가능수량
+    UsePreargMgn: int = 0 # 사용예정증거금액
+    UsePreargMnyMgn: int = 0 # 사용예정현금증거금액
+    OrdAbleAmt: int = 0 # 주문가능금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+
+
+
+# 선물옵션 주문가능수량조회 
+class CFOAQ10100(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CFOAQ10100OutBlock1] = msgspec.field(default=None, name='CFOAQ10100OutBlock1')
+    outblock2: Optional[CFOAQ10100OutBlock2] = msgspec.field(default=None, name='CFOAQ10100OutBlock2')
+# endregion
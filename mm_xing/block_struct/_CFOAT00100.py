@@ -0,0 +1,65 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CFOAT00100 - 선물옵션 정상주문>
+class CFOAT00100InBlock1(msgspec.Struct, frozen=True, gc=False):
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분
+    FnoOrdprcPtnCode: str = '' # 선물옵션호가유형코드
+    FnoOrdPrc: float = 0.0 # 선물옵션주문가격
+    OrdQty: int = 0 # 주문수량
+
+
+class CFOAT00100OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdMktCode: str = '' # 주문시장코드
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    BnsTpCode: str = '' # 매매구분
+    FnoOrdPtnCode: str = '' # 선물옵션주문유형코드
+    FnoOrdprcPtnCode: str = '' # 선물옵션호가유형코드
+    FnoTrdPtnCode: str = '' # 선물옵션거래유형코드
+    FnoOrdPrc: float = 0.0 # 선물옵션주문가격
+    OrdQty: int = 0 # 주문수량
+    CommdaCode: str = '' # 통신매체코드
+    DscusBnsCmpltTime: str = '' # 협의매매완료시각
+    GrpId: str = '' # 그룹ID
+    OrdSeqno: int = 0 # 주문일련번호
+    PtflNo: int = 0 # 포트폴리오번호
+    BskNo: int = 0 # 바스켓번호
+    TrchNo: int = 0 # 트렌치번호
+    ItemNo: int = 0 # 항목번호
+    OpDrtnNo: str = '' # 운용지시번호
+    MgempNo: str = '' # 관리사원번호
+    FundId: str = '' # 펀드ID
+    FundOrdNo: int = 0 # 펀드주문번호
+
+
+class CFOAT00100OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdNo: int = 0 # 주문번호
+    BrnNm: str = '' # 지점명
+    AcntNm: str = '' # 계좌명
+    IsuNm: str = '' # 종목명
+    OrdAbleAmt: int = 0 # 주문가능금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    OrdMgn: int = 0 # 주문증거금
+    MnyOrdMgn: int = 0 # 현금주문증거금
+    OrdAbleQty: int = 0 # 주문가능수량
+
+
+
+# 선물옵션 정상주문 
+class CFOAT00100(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CFOAT00100OutBlock1] = msgspec.field(default=None, name='CFOAT00100OutBlock1')
+    outblock2: Optional[CFOAT00100OutBlock2] = msgspec.field(default=None, name='CFOAT00100OutBlock2')
+# endregion
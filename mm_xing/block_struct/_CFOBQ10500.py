@@ -0,0 +1,77 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CFOBQ10500 - 선물옵션 계좌예탁금증거금조회>
+class CFOBQ10500InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+
+
+class CFOBQ10500OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+
+
+class CFOBQ10500OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    DpsamtTotamt: int = 0 # 예탁금총액
+    Dps: int = 0 # 예수금
+    SubstAmt: int = 0 # 대용금액
+    FilupDpsamtTotamt: int = 0 # 충당예탁금총액
+    FilupDps: int = 0 # 충당예수금
+    FutsPnlAmt: int = 0 # 선물손익금액
+    WthdwAbleAmt: int = 0 # 인출가능금액
+    PsnOutAbleCurAmt: int = 0 # 인출가능현금액
+    PsnOutAbleSubstAmt: int = 0 # 인출가능대용금액
+    Mgn: int = 0 # 증거금액
+    MnyMgn: int = 0 # 현금증거금액
+    OrdAbleAmt: int = 0 # 주문가능금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    AddMgn: int = 0 # 추가증거금액
+    MnyAddMgn: int = 0 # 현금추가증거금액
+    AmtPrdayChckInAmt: int = 0 # 금전일수표입금액
+    FnoPrdaySubstSellAmt: int = 0 # 선물옵션전일대용매도금액
+    FnoCrdaySubstSellAmt: int = 0 # 선물옵션금일대용매도금액
+    FnoPrdayFdamt: int = 0 # 선물옵션전일가입금액
+    FnoCrdayFdamt: int = 0 # 선물옵션금일가입금액
+    FcurrSubstAmt: int = 0 # 외화대용금액
+    FnoAcntAfmgnNm: str = '' # 선물옵션계좌사후증거금명
+
+
+class CFOBQ10500OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    PdGrpCodeNm: str = '' # 상품군코드명
+    NetRiskMgn: int = 0 # 순위험증거금액
+    PrcMgn: int = 0 # 가격증거금액
+    SprdMgn: int = 0 # 스프레드증거금액
+    PrcFlctMgn: int = 0 # 가격변동증거금액
+    MinMgn: int = 0 # 최소증거금액
+    OrdMgn: int = 0 # 주문증거금액
+    OptNetBuyAmt: int = 0 # 옵션순매수금액
+    CsgnMgn: int = 0 # 위탁증거금액
+    MaintMgn: int = 0 # 유지증거금액
+    FutsBuyExecAmt: int = 0 # 선물매수체결금액
+    FutsSellExecAmt: int = 0 # 선물매도체결금액
+    OptBuyExecAmt: int = 0 # 옵션매수체결금액
+    OptSellExecAmt: int = 0 # 옵션매도체결금액
+    FutsPnlAmt: int = 0 # 선물손익금액
+    TotRiskCsgnMgn: int = 0 # 총위험위탁증거금
+    UndCsgnMgn: int = 0 # 인수도위탁증거금
+    MgnRdctAmt: int = 0 # 증거금감면금액
+
+
+
+# 선물옵션 계좌예탁금증거금조회 
+class CFOBQ10500(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CFOBQ10500OutBlock1] = msgspec.field(default=None, name='CFOBQ10500OutBlock1')
+    outblock2: Optional[CFOBQ10500OutBlock2] = msgspec.field(default=None, name='CFOBQ10500OutBlock2')
+    outblock3: Optional[List[CFOBQ10500OutBlock3]] = msgspec.field(default=None, name='CFOBQ10500OutBlock3')
+# endregion
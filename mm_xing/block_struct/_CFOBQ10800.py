@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CFOBQ10800 - 선물옵션 옵션매도시 주문증거금조회>
+class CFOBQ10800InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    IsuMdclssCode: str = '' # 종목중분류코드
+    IsuSmclssCode: str = '' # 종목소분류코드
+    DueYymm: str = '' # 만기년월
+    SettWklyCnt: str = '' # 결제주간수
+    SpclDtPtnCode: str = '' # 특별일자유형코드
+
+
+class CFOBQ10800OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    IsuMdclssCode: str = '' # 종목중분류코드
+    IsuSmclssCode: str = '' # 종목소분류코드
+    DueYymm: str = '' # 만기년월
+    SettWklyCnt: str = '' # 결제주간수
+    SpclDtPtnCode: str = '' # 특별일자유형코드
+
+
+class CFOBQ10800OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    ElwXrcPrc: float = 0.0 # 행사가
+    FnoIsuNo: str = '' # 선물옵션종목번호
+    HanglIsuNm1: str = '' # 한글종목명1
+    TpNm1: str = '' # 구분명1
+    UpOptRegulThrprc: float = 0.0 # 상승옵션조정이론가
+    Thrprc1: float = 0.0 # 이론가1
+    BasePrc1: float = 0.0 # 기준가1
+    OrdMgn1: int = 0 # 주문증거금액1
+    FnoIsuNo0: str = '' # 선물옵션종목번호0
+    HanglIsuNm2: str = '' # 한글종목명2
+    TpNm2: str = '' # 구분명2
+    DownOptRegulThrprc: float = 0.0 # 하락옵션조정이론가
+    Thrprc2: float = 0.0 # 이론가2
+    BasePrc2: float = 0.0 # 기준가2
+    OrdMgn2: int = 0 # 주문증거금액2
+
+
+
+# 선물옵션 옵션매도시 주문증거금조회 
+class CFOBQ10800(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CFOBQ10800OutBlock1] = msgspec.field(default=None, name='CFOBQ10800OutBlock1')
+    outblock2: Optional[List[CFOBQ10800OutBlock2]] = msgspec.field(default=None, name='CFOBQ10800OutBlock2')
+# endregion
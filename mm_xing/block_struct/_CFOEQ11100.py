@@ -0,0 +1,132 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CFOEQ11100 - 선물옵션가정산예탁금상세>
+class CFOEQ11100InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    BnsDt: str = '' # 매매일
+
+
+class CFOEQ11100OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    BnsDt: str = '' # 매매일
+
+
+class CFOEQ11100OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    OpnmkDpsamtTotamt: int = 0 # 개장시예탁금총액
+    OpnmkDps: int = 0 # 개장시예수금
+    OpnmkMnyrclAmt: int = 0 # 개장시현금미수금
+    OpnmkSubstAmt: int = 0 # 개장시대용금액
+    TotAmt: int = 0 # 총금액
+    Dps: int = 0 # 예수금
+    MnyrclAmt: int = 0 # 현금미수금액
+    SubstDsgnAmt: int = 0 # 대용지정금액
+    CsgnMgn: int = 0 # 위탁증거금액
+    MnyCsgnMgn: int = 0 # 현금위탁증거금액
+    MaintMgn: int = 0 # 유지증거금액
+    MnyMaintMgn: int = 0 # 현금유지증거금액
+    OutAbleAmt: int = 0 # 출금가능총액
+    MnyoutAbleAmt: int = 0 # 출금가능금액
+    SubstOutAbleAmt: int = 0 # 출금가능대용
+    OrdAbleAmt: int = 0 # 주문가능금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    AddMgnOcrTpCode: str = '' # 추가증거금구분
+    AddMgn: int = 0 # 추가증거금액
+    MnyAddMgn: int = 0 # 현금추가증거금액
+    NtdayTotAmt: int = 0 # 익일예탁총액
+    NtdayDps: int = 0 # 익일예탁현금
+    NtdayMnyrclAmt: int = 0 # 익일미수금
+    NtdaySubstAmt: int = 0 # 익일예탁대용
+    NtdayCsgnMgn: int = 0 # 익일위탁증거금
+    NtdayMnyCsgnMgn: int = 0 # 익일위탁증거금현금
+    NtdayMaintMgn: int = 0 # 익일유지증거금
+    NtdayMnyMaintMgn: int = 0 # 익일유지증거금현금
+    NtdayOutAbleAmt: int = 0 # 익일인출가능금액
+    NtdayMnyoutAbleAmt: int = 0 # 익일인출가능금액
+    NtdaySubstOutAbleAmt: int = 0 # 익일인출가능대용
+    NtdayOrdAbleAmt: int = 0 # 익일주문가능금액
+    NtdayMnyOrdAbleAmt: int = 0 # 익일주문가능현금
+    NtdayAddMgnTp: str = '' # 익일추가증거금구분
+    NtdayAddMgn: int = 0 # 익일추가증거금
+    NtdayMnyAddMgn: int = 0 # 익일추가증거금현금
+    NtdaySettAmt: int = 0 # 익일결제금액
+    EvalDpsamtTotamt: int = 0 # 평가예탁금총액
+    MnyEvalDpstgAmt: int = 0 # 현금평가예탁금액
+    DpsamtUtlfeeGivPrergAmt: int = 0 # 예탁금이용료지급예정금액
+    TaxAmt: int = 0 # 세금
+    CsgnMgnrat: float = 0.0 # 위탁증거금 비율
+    CsgnMnyMgnrat: float = 0.0 # 위탁증거금현금비율
+    DpstgTotamtLackAmt: int = 0 # 예탁총액부족금액(위탁증거금기준)
+    DpstgMnyLackAmt: int = 0 # 예탁현금부족금액(위탁증거금기준)
+    RealInAmt: int = 0 # 실입금액
+    InAmt: int = 0 # 입금액
+    OutAmt: int = 0 # 출금액
+    FutsAdjstDfamt: int = 0 # 선물정산차금
+    FutsThdayDfamt: int = 0 # 선물당일차금
+    FutsUpdtDfamt: int = 0 # 선물갱신차금
+    FutsLastSettDfamt: int = 0 # 선물최종결제차금
+    OptSettDfamt: int = 0 # 옵션결제차금
+    OptBuyAmt: int = 0 # 옵션매수금액
+    OptSellAmt: int = 0 # 옵션매도금액
+    OptXrcDfamt: int = 0 # 옵션행사차금
+    OptAsgnDfamt: int = 0 # 옵션배정차금
+    RealGdsUndAmt: int = 0 # 실물인수도금액
+    RealGdsUndAsgnAmt: int = 0 # 실물인수도배정대금
+    RealGdsUndXrcAmt: int = 0 # 실물인수도행사대금
+    CmsnAmt: int = 0 # 수수료
+    FutsCmsn: int = 0 # 선물수수료
+    OptCmsn: int = 0 # 옵션수수료
+    FutsCtrctQty: int = 0 # 선물약정수량
+    FutsCtrctAmt: int = 0 # 선물약정금액
+    OptCtrctQty: int = 0 # 옵션약정수량
+    OptCtrctAmt: int = 0 # 옵션약정금액
+    FutsUnsttQty: int = 0 # 선물미결제수량
+    FutsUnsttAmt: int = 0 # 선물미결제금액
+    OptUnsttQty: int = 0 # 옵션미결제수량
+    OptUnsttAmt: int = 0 # 옵션미결제금액
+    FutsBuyUnsttQty: int = 0 # 선물매수미결제수량
+    FutsBuyUnsttAmt: int = 0 # 선물매수미결제금액
+    FutsSellUnsttQty: int = 0 # 선물매도미결제수량
+    FutsSellUnsttAmt: int = 0 # 선물매도미결제금액
+    OptBuyUnsttQty: int = 0 # 옵션매수미결제수량
+    OptBuyUnsttAmt: int = 0 # 옵션매수미결제금액
+    OptSellUnsttQty: int = 0 # 옵션매도미결제수량
+    OptSellUnsttAmt: int = 0 # 옵션매도미결제금액
+    FutsBuyctrQty: int = 0 # 선물매수약정수량
+    FutsBuyctrAmt: int = 0 # 선물매수약정금액
+    FutsSlctrQty: int = 0 # 선물매도약정수량
+    FutsSlctrAmt: int = 0 # 선물매도약정금액
+    OptBuyctrQty: int = 0 # 옵션매수약정수량
+    OptBuyctrAmt: int = 0 # 옵션매수약정금액
+    OptSlctrQty: int = 0 # 옵션매도약정수량
+    OptSlctrAmt: int = 0 # 옵션매도약정금액
+    FutsBnsplAmt: int = 0 # 선물매매손익금액
+    OptBnsplAmt: int = 0 # 옵션매매손익금액
+    FutsEvalPnlAmt: int = 0 # 선물평가손익금액
+    OptEvalPnlAmt: int = 0 # 옵션평가손익금액
+    FutsEvalAmt: int = 0 # 선물평가금액
+    OptEvalAmt: int = 0 # 옵션평가금액
+    MktEndAfMnyInAmt: int = 0 # 장종료후현금입금금액
+    MktEndAfMnyOutAmt: int = 0 # 장종료후현금출금금액
+    MktEndAfSubstDsgnAmt: int = 0 # 장종료후대용지정금액
+    MktEndAfSubstAbndAmt: int = 0 # 장종료후대용해지금액
+
+
+
+# 선물옵션가정산예탁금상세 
+class CFOEQ11100(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CFOEQ11100OutBlock1] = msgspec.field(default=None, name='CFOEQ11100OutBlock1')
+    outblock2: Optional[CFOEQ11100OutBlock2] = msgspec.field(default=None, name='CFOEQ11100OutBlock2')
+# endregion
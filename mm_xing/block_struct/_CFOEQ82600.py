@@ -0,0 +1,73 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CFOEQ82600 - 선물옵션 일별 계좌손익내역>
+class CFOEQ82600InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    QryTp: str = '' # 조회구분
+    StnlnSeqTp: str = '' # 정렬순서구분
+    FnoBalEvalTpCode: str = '' # 선물옵션잔고평가구분코드
+
+
+class CFOEQ82600OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    QryTp: str = '' # 조회구분
+    StnlnSeqTp: str = '' # 정렬순서구분
+    FnoBalEvalTpCode: str = '' # 선물옵션잔고평가구분코드
+
+
+class CFOEQ82600OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    FutsAdjstDfamt: int = 0 # 선물정산차금
+    OptBnsplAmt: int = 0 # 옵션매매손익금액
+    FnoCmsnAmt: int = 0 # 선물옵션수수료
+    PnlSumAmt: int = 0 # 손익합계금액
+    MnyinSumAmt: int = 0 # 입금합계금액
+    MnyoutSumAmt: int = 0 # 출금합계금액
+    AcntNm: str = '' # 계좌명
+
+
+class CFOEQ82600OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    QryDt: str = '' # 조회일
+    DpstgTotamt: int = 0 # 예탁총액
+    DpstgMny: int = 0 # 예탁현금
+    FnoMgn: int = 0 # 선물옵션증거금액
+    FutsPnlAmt: int = 0 # 선물손익금액
+    OptBsnPnlAmt: int = 0 # 옵션매매손익금액
+    OptEvalPnlAmt: int = 0 # 옵션평가손익금액
+    CmsnAmt: int = 0 # 수수료
+    SumAmt1: int = 0 # 합계금액1
+    SumAmt2: int = 0 # 합계금액
+    PnlSumAmt: int = 0 # 손익합계금액
+    FutsBuyAmt: int = 0 # 선물매수금액
+    FutsSellAmt: int = 0 # 선물매도금액
+    OptBuyAmt: int = 0 # 옵션매수금액
+    OptSellAmt: int = 0 # 옵션매도금액
+    InAmt: int = 0 # 입금액
+    OutAmt: int = 0 # 출금액
+    EvalAmt: int = 0 # 평가금액
+    AddupEvalAmt: int = 0 # 합산평가금액
+    Amt2: int = 0 # 금액2
+
+
+
+# 선물옵션 일별 계좌손익내역 
+class CFOEQ82600(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CFOEQ82600OutBlock1] = msgspec.field(default=None, name='CFOEQ82600OutBlock1')
+    outblock2: Optional[CFOEQ82600OutBlock2] = msgspec.field(default=None, name='CFOEQ82600OutBlock2')
+    outblock3: Optional[List[CFOEQ82600OutBlock3]] = msgspec.field(default=None, name='CFOEQ82600OutBlock3')
+# endregion
@@ -0,0 +1,88 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CFOFQ02400 - 계좌 미결제 약정현황(평균가)>
+class CFOFQ02400InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    RegMktCode: str = '' # 등록시장코드
+    BuyDt: str = '' # 매수일자
+
+
+class CFOFQ02400OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    RegMktCode: str = '' # 등록시장코드
+    BuyDt: str = '' # 매수일자
+
+
+class CFOFQ02400OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    FutsCtrctQty: int = 0 # 선물약정수량
+    OptCtrctQty: int = 0 # 옵션약정수량
+    CtrctQty: int = 0 # 약정수량
+    FutsCtrctAmt: int = 0 # 선물약정금액
+    FutsBuyctrAmt: int = 0 # 선물매수약정금액
+    FutsSlctrAmt: int = 0 # 선물매도약정금액
+    CalloptCtrctAmt: int = 0 # 콜옵션약정금액
+    CallBuyAmt: int = 0 # 콜매수금액
+    CallSellAmt: int = 0 # 콜매도금액
+    PutoptCtrctAmt: int = 0 # 풋옵션약정금액
+    PutBuyAmt: int = 0 # 풋매수금액
+    PutSellAmt: int = 0 # 풋매도금액
+    AllCtrctAmt: int = 0 # 전체약정금액
+    BuyctrAsmAmt: int = 0 # 매수약정누계금액
+    SlctrAsmAmt: int = 0 # 매도약정누계금액
+    FutsPnlSum: int = 0 # 선물손익합계
+    OptPnlSum: int = 0 # 옵션손익합계
+    AllPnlSum: int = 0 # 전체손익합계
+
+
+class CFOFQ02400OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    FnoClssCode: str = '' # 선물옵션품목구분
+    FutsSellQty: int = 0 # 선물매도수량
+    FutsSellPnl: int = 0 # 선물매도손익
+    FutsBuyQty: int = 0 # 선물매수수량
+    FutsBuyPnl: int = 0 # 선물매수손익
+    CallSellQty: int = 0 # 콜매도수량
+    CallSellPnl: int = 0 # 콜매도손익
+    CallBuyQty: int = 0 # 콜매수수량
+    CallBuyPnl: int = 0 # 콜매수손익
+    PutSellQty: int = 0 # 풋매도수량
+    PutSellPnl: int = 0 # 풋매도손익
+    PutBuyQty: int = 0 # 풋매수수량
+    PutBuyPnl: int = 0 # 풋매수손익
+
+
+class CFOFQ02400OutBlock4(msgspec.Struct, frozen=True, gc=False):
+    IsuNo: str = '' # 종목번호
+    IsuNm: str = '' # 종목명
+    BnsTpCode: str = '' # 매매구분
+    BnsTpNm: str = '' # 매매구분
+    BalQty: int = 0 # 잔고수량
+    FnoAvrPrc: float = 0.0 # 평균가
+    BgnAmt: int = 0 # 당초금액
+    ThdayLqdtQty: int = 0 # 당일청산수량
+    Curprc: float = 0.0 # 현재가
+    EvalAmt: int = 0 # 평가금액
+    EvalPnlAmt: int = 0 # 평가손익금액
+    EvalErnrat: float = 0.0 # 평가수익률
+
+
+
+# 계좌 미결제 약정현황(평균가) 
+class CFOFQ02400(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CFOFQ02400OutBlock1] = msgspec.field(default=None, name='CFOFQ02400OutBlock1')
+    outblock2: Optional[CFOFQ02400OutBlock2] = msgspec.field(default=None, name='CFOFQ02400OutBlock2')
+    outblock3: Optional[List[CFOFQ02400OutBlock3]] = msgspec.field(default=None, name='CFOFQ02400OutBlock3')
+    outblock4: Optional[List[CFOFQ02400OutBlock4]] = msgspec.field(default=None, name='CFOFQ02400OutBlock4')
+# endregion
@@ -0,0 +1,41 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CIDBQ01400 - 해외선물 체결내역개별 조회>
+class CIDBQ01400InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    QryTpCode: str = '' # 조회구분코드
+    AcntNo: str = '' # 계좌번호
+    IsuCodeVal: str = '' # 종목코드값
+    BnsTpCode: str = '' # 매매구분코드
+    OvrsDrvtOrdPrc: float = 0.0 # 해외파생주문가격
+    AbrdFutsOrdPtnCode: str = '' # 해외선물주문유형코드
+
+
+class CIDBQ01400OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    QryTpCode: str = '' # 조회구분코드
+    AcntNo: str = '' # 계좌번호
+    IsuCodeVal: str = '' # 종목코드값
+    BnsTpCode: str = '' # 매매구분코드
+    OvrsDrvtOrdPrc: float = 0.0 # 해외파생주문가격
+    AbrdFutsOrdPtnCode: str = '' # 해외선물주문유형코드
+
+
+class CIDBQ01400OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdAbleQty: int = 0 # 주문가능수량
+
+
+
+# 해외선물 체결내역개별 조회 
+class CIDBQ01400(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDBQ01400OutBlock1] = msgspec.field(default=None, name='CIDBQ01400OutBlock1')
+    outblock2: Optional[CIDBQ01400OutBlock2] = msgspec.field(default=None, name='CIDBQ01400OutBlock2')
+# endregion
@@ -0,0 +1,70 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CIDBQ01500 - 해외선물 미결제 잔고내역>
+class CIDBQ01500InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntTpCode: str = '' # 계좌구분코드
+    AcntNo: str = '' # 계좌번호
+    FcmAcntNo: str = '' # FCM계좌번호
+    Pwd: str = '' # 비밀번호
+    QryDt: str = '' # 조회일자
+    BalTpCode: str = '' # 잔고구분코드
+
+
+class CIDBQ01500OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntTpCode: str = '' # 계좌구분코드
+    AcntNo: str = '' # 계좌번호
+    FcmAcntNo: str = '' # FCM계좌번호
+    Pwd: str = '' # 비밀번호
+    QryDt: str = '' # 조회일자
+    BalTpCode: str = '' # 잔고구분코드
+
+
+class CIDBQ01500OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    BaseDt: str = '' # 기준일자
+    Dps: int = 0 # 예수금
+    LpnlAmt: float = 0.0 # 청산손익금액
+    FutsDueBfLpnlAmt: float = 0.0 # 선물만기전청산손익금액
+    FutsDueBfCmsn: float = 0.0 # 선물만기전수수료
+    CsgnMgn: int = 0 # 위탁증거금액
+    MaintMgn: int = 0 # 유지증거금
+    CtlmtAmt: float = 0.0 # 신용한도금액
+    AddMgn: int = 0 # 추가증거금액
+    MgnclRat: float = 0.0 # 마진콜율
+    OrdAbleAmt: int = 0 # 주문가능금액
+    WthdwAbleAmt: int = 0 # 인출가능금액
+    AcntNo: str = '' # 계좌번호
+    IsuCodeVal: str = '' # 종목코드값
+    IsuNm: str = '' # 종목명
+    CrcyCodeVal: str = '' # 통화코드값
+    OvrsDrvtPrdtCode: str = '' # 해외파생상품코드
+    OvrsDrvtOptTpCode: str = '' # 해외파생옵션구분코드
+    DueDt: str = '' # 만기일자
+    OvrsDrvtXrcPrc: float = 0.0 # 해외파생행사가격
+    BnsTpCode: str = '' # 매매구분코드
+    CmnCodeNm: str = '' # 공통코드명
+    TpCodeNm: str = '' # 구분코드명
+    BalQty: int = 0 # 잔고수량
+    PchsPrc: float = 0.0 # 매입가격
+    OvrsDrvtNowPrc: float = 0.0 # 해외파생현재가
+    AbrdFutsEvalPnlAmt: float = 0.0 # 해외선물평가손익금액
+    CsgnCmsn: float = 0.0 # 위탁수수료
+    PosNo: str = '' # 포지션번호
+    EufOneCmsnAmt: float = 0.0 # 거래소비용1수수료금액
+    EufTwoCmsnAmt: float = 0.0 # 거래소비용2수수료금액
+
+
+
+# 해외선물 미결제 잔고내역 
+class CIDBQ01500(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDBQ01500OutBlock1] = msgspec.field(default=None, name='CIDBQ01500OutBlock1')
+    outblock2: Optional[List[CIDBQ01500OutBlock2]] = msgspec.field(default=None, name='CIDBQ01500OutBlock2')
+# endregion
@@ -0,0 +1,94 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CIDBQ01800 - 해외선물 주문체결내역 조회>
+class CIDBQ01800InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    IsuCodeVal: str = '' # 종목코드값
+    OrdDt: str = '' # 주문일자
+    ThdayTpCode: str = '' # 당일구분코드
+    OrdStatCode: str = '' # 주문상태코드
+    BnsTpCode: str = '' # 매매구분코드
+    QryTpCode: str = '' # 조회구분코드
+    OrdPtnCode: str = '' # 주문유형코드
+    OvrsDrvtFnoTpCode: str = '' # 해외파생선물옵션구분코드
+
+
+class CIDBQ01800OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    IsuCodeVal: str = '' # 종목코드값
+    OrdDt: str = '' # 주문일자
+    ThdayTpCode: str = '' # 당일구분코드
+    OrdStatCode: str = '' # 주문상태코드
+    BnsTpCode: str = '' # 매매구분코드
+    QryTpCode: str = '' # 조회구분코드
+    OrdPtnCode: str = '' # 주문유형코드
+    OvrsDrvtFnoTpCode: str = '' # 해외파생선물옵션구분코드
+
+
+class CIDBQ01800OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    OvrsFutsOrdNo: str = '' # 해외선물주문번호
+    OvrsFutsOrgOrdNo: str = '' # 해외선물원주문번호
+    FcmOrdNo: str = '' # FCM주문번호
+    IsuCodeVal: str = '' # 종목코드값
+    IsuNm: str = '' # 종목명
+    AbrdFutsXrcPrc: float = 0.0 # 해외선물행사가격
+    FcmAcntNo: str = '' # FCM계좌번호
+    BnsTpCode: str = '' # 매매구분코드
+    BnsTpNm: str = '' # 매매구분명
+    FutsOrdStatCode: str = '' # 선물주문상태코드
+    TpCodeNm: str = '' # 구분코드명
+    FutsOrdTpCode: str = '' # 선물주문구분코드
+    TrdTpNm: str = '' # 거래구분명
+    AbrdFutsOrdPtnCode: str = '' # 해외선물주문유형코드
+    OrdPtnNm: str = '' # 주문유형명
+    OrdPtnTermTpCode: str = '' # 주문유형기간구분코드
+    CmnCodeNm: str = '' # 공통코드명
+    AppSrtDt: str = '' # 적용시작일자
+    AppEndDt: str = '' # 적용종료일자
+    OvrsDrvtOrdPrc: float = 0.0 # 해외파생주문가격
+    OrdQty: int = 0 # 주문수량
+    OvrsDrvtExecIsuCode: str = '' # 해외파생체결종목코드
+    ExecIsuNm: str = '' # 체결종목명
+    ExecBnsTpCode: str = '' # 체결매매구분코드
+    ExecBnsTpNm: str = '' # 체결매매구분명
+    AbrdFutsExecPrc: float = 0.0 # 해외선물체결가격
+    ExecQty: int = 0 # 체결수량
+    OrdCndiPrc: float = 0.0 # 주문조건가격
+    OvrsDrvtNowPrc: float = 0.0 # 해외파생현재가
+    MdfyQty: int = 0 # 정정수량
+    CancQty: int = 0 # 취소수량
+    RjtQty: int = 0 # 거부수량
+    CnfQty: int = 0 # 확인수량
+    UnercQty: int = 0 # 미체결수량
+    CvrgYn: str = '' # 반대매매여부
+    RegTmnlNo: str = '' # 등록단말번호
+    RegBrnNo: str = '' # 등록지점번호
+    RegUserId: str = '' # 등록사용자ID
+    OrdDt: str = '' # 주문일자
+    OrdTime: str = '' # 주문시각
+    OvrsOptXrcRsvTpCode: str = '' # 해외옵션행사예약구분코드
+    OvrsDrvtOptTpCode: str = '' # 해외파생옵션구분코드
+    SprdBaseIsuYn: str = '' # 스프레드기준종목여부
+    OvrsFutsOrdDt: str = '' # 해외선물주문일자
+    OvrsFutsOrdNo2: str = '' # 해외선물주문번호2
+    OvrsFutsOrgOrdNo2: str = '' # 해외선물원주문번호2
+    OvrsDrvtIsuCode2: str = '' # 해외파생종목코드2
+
+
+
+# 해외선물 주문체결내역 조회 
+class CIDBQ01800(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDBQ01800OutBlock1] = msgspec.field(default=None, name='CIDBQ01800OutBlock1')
+    outblock2: Optional[List[CIDBQ01800OutBlock2]] = msgspec.field(default=None, name='CIDBQ01800OutBlock2')
+# endregion
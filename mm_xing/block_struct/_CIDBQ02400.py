@@ -0,0 +1,111 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CIDBQ02400 - 해외선물 주문체결내역 상세 조회>
+class CIDBQ02400InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    IsuCodeVal: str = '' # 종목코드값
+    QrySrtDt: str = '' # 조회시작일자
+    QryEndDt: str = '' # 조회종료일자
+    ThdayTpCode: str = '' # 당일구분코드
+    OrdStatCode: str = '' # 주문상태코드
+    BnsTpCode: str = '' # 매매구분코드
+    QryTpCode: str = '' # 조회구분코드
+    OrdPtnCode: str = '' # 주문유형코드
+    OvrsDrvtFnoTpCode: str = '' # 해외파생선물옵션구분코드
+
+
+class CIDBQ02400OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    IsuCodeVal: str = '' # 종목코드값
+    QrySrtDt: str = '' # 조회시작일자
+    QryEndDt: str = '' # 조회종료일자
+    ThdayTpCode: str = '' # 당일구분코드
+    OrdStatCode: str = '' # 주문상태코드
+    BnsTpCode: str = '' # 매매구분코드
+    QryTpCode: str = '' # 조회구분코드
+    OrdPtnCode: str = '' # 주문유형코드
+    OvrsDrvtFnoTpCode: str = '' # 해외파생선물옵션구분코드
+
+
+class CIDBQ02400OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    OrdDt: str = '' # 주문일자
+    OvrsFutsOrdNo: str = '' # 해외선물주문번호
+    OvrsFutsOrgOrdNo: str = '' # 해외선물원주문번호
+    FcmOrdNo: str = '' # FCM주문번호
+    ExecDt: str = '' # 체결일자
+    OvrsFutsExecNo: str = '' # 해외선물체결번호
+    FcmAcntNo: str = '' # FCM계좌번호
+    IsuCodeVal: str = '' # 종목코드값
+    IsuNm: str = '' # 종목명
+    AbrdFutsXrcPrc: float = 0.0 # 해외선물행사가격
+    BnsTpCode: str = '' # 매매구분코드
+    BnsTpNm: str = '' # 매매구분명
+    FutsOrdStatCode: str = '' # 선물주문상태코드
+    TpCodeNm: str = '' # 구분코드명
+    FutsOrdTpCode: str = '' # 선물주문구분코드
+    TrdTpNm: str = '' # 거래구분명
+    AbrdFutsOrdPtnCode: str = '' # 해외선물주문유형코드
+    OrdPtnNm: str = '' # 주문유형명
+    OrdPtnTermTpCode: str = '' # 주문유형기간구분코드
+    CmnCodeNm: str = '' # 공통코드명
+    AppSrtDt: str = '' # 적용시작일자
+    AppEndDt: str = '' # 적용종료일자
+    OrdQty: int = 0 # 주문수량
+    OvrsDrvtOrdPrc: float = 0.0 # 해외파생주문가격
+    OvrsDrvtExecIsuCode: str = '' # 해외파생체결종목코드
+    ExecIsuNm: str = '' # 체결종목명
+    ExecBnsTpCode: str = '' # 체결매매구분코드
+    ExecBnsTpNm: str = '' # 체결매매구분명
+    ExecQty: int = 0 # 체결수량
+    AbrdFutsExecPrc: float = 0.0 # 해외선물체결가격
+    OrdCndiPrc: float = 0.0 # 주문조건가격
+    OvrsDrvtNowPrc: float = 0.0 # 해외파생현재가
+    UnercQty: int = 0 # 미체결수량
+    TrxStatCode: str = '' # 처리상태코드
+    TrxStatCodeNm: str = '' # 처리상태코드명
+    CsgnCmsn: float = 0.0 # 위탁수수료
+    FcmCmsn: float = 0.0 # FCM수수료
+    ThcoCmsn: float = 0.0 # 당사수수료
+    MdaCode: str = '' # 매체코드
+    MdaCodeNm: str = '' # 매체코드명
+    RegTmnlNo: str = '' # 등록단말번호
+    RegUserId: str = '' # 등록사용자ID
+    OrdSndDttm: str = '' # 주문발송일시
+    ExecDttm: str = '' # 체결일시
+    EufOneCmsnAmt: float = 0.0 # 거래소비용1수수료금액
+    EufTwoCmsnAmt: float = 0.0 # 거래소비용2수수료금액
+    LchOneCmsnAmt: float = 0.0 # 런던청산소1수수료금액
+    LchTwoCmsnAmt: float = 0.0 # 런던청산소2수수료금액
+    TrdOneCmsnAmt: float = 0.0 # 거래1수수료금액
+    TrdTwoCmsnAmt: float = 0.0 # 거래2수수료금액
+    TrdThreeCmsnAmt: float = 0.0 # 거래3수수료금액
+    StrmOneCmsnAmt: float = 0.0 # 단기1수수료금액
+    StrmTwoCmsnAmt: float = 0.0 # 단기2수수료금액
+    StrmThreeCmsnAmt: float = 0.0 # 단기3수수료금액
+    TransOneCmsnAmt: float = 0.0 # 전달1수수료금액
+    TransTwoCmsnAmt: float = 0.0 # 전달2수수료금액
+    TransThreeCmsnAmt: float = 0.0 # 전달3수수료금액
+    TransFourCmsnAmt: float = 0.0 # 전달4수수료금액
+    OvrsOptXrcRsvTpCode: str = '' # 해외옵션행사예약구분코드
+    OvrsDrvtOptTpCode: str = '' # 해외파생옵션구분코드
+    SprdBaseIsuYn: str = '' # 스프레드기준종목여부
+    OvrsDrvtIsuCode2: str = '' # 해외파생종목코드2
+
+
+
+# 해외선물 주문체결내역 상세 조회 
+class CIDBQ02400(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDBQ02400OutBlock1] = msgspec.field(default=None, name='CIDBQ02400OutBlock1')
+    outblock2: Optional[List[CIDBQ02400OutBlock2]] = msgspec.field(default=None, name='CIDBQ02400OutBlock2')
+# endregion
@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CIDBQ03000 - 해외선물 예수금/잔고현황>
+class CIDBQ03000InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntTpCode: str = '' # 계좌구분코드
+    AcntNo: str = '' # 계좌번호
+    AcntPwd: str = '' # 계좌비밀번호
+    TrdDt: str = '' # 거래일자
+
+
+class CIDBQ03000OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntTpCode: str = '' # 계좌구분코드
+    AcntNo: str = '' # 계좌번호
+    AcntPwd: str = '' # 계좌비밀번호
+    TrdDt: str = '' # 거래일자
+
+
+class CIDBQ03000OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    AcntNo: str = '' # 계좌번호
+    TrdDt: str = '' # 거래일자
+    CrcyObjCode: str = '' # 통화대상코드
+    OvrsFutsDps: float = 0.0 # 해외선물예수금
+    CustmMnyioAmt: float = 0.0 # 고객입출금금액
+    AbrdFutsLqdtPnlAmt: float = 0.0 # 해외선물청산손익금액
+    AbrdFutsCmsnAmt: float = 0.0 # 해외선물수수료금액
+    PrexchDps: float = 0.0 # 가환전예수금
+    EvalAssetAmt: float = 0.0 # 평가자산금액
+    AbrdFutsCsgnMgn: float = 0.0 # 해외선물위탁증거금액
+    AbrdFutsAddMgn: float = 0.0 # 해외선물추가증거금액
+    AbrdFutsWthdwAbleAmt: float = 0.0 # 해외선물인출가능금액
+    AbrdFutsOrdAbleAmt: float = 0.0 # 해외선물주문가능금액
+    AbrdFutsEvalPnlAmt: float = 0.0 # 해외선물평가손익금액
+    LastSettPnlAmt: float = 0.0 # 최종결제손익금액
+    OvrsOptSettAmt: float = 0.0 # 해외옵션결제금액
+    OvrsOptBalEvalAmt: float = 0.0 # 해외옵션잔고평가금액
+
+
+
+# 해외선물 예수금/잔고현황 
+class CIDBQ03000(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDBQ03000OutBlock1] = msgspec.field(default=None, name='CIDBQ03000OutBlock1')
+    outblock2: Optional[List[CIDBQ03000OutBlock2]] = msgspec.field(default=None, name='CIDBQ03000OutBlock2')
+# endregion
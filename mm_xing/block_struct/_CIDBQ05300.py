@@ -0,0 +1,86 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CIDBQ05300 - 해외선물 계좌예탁자산조회>
+class CIDBQ05300InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OvrsAcntTpCode: str = '' # 해외계좌구분코드
+    FcmAcntNo: str = '' # FCM계좌번호
+    AcntNo: str = '' # 계좌번호
+    AcntPwd: str = '' # 계좌비밀번호
+    CrcyCode: str = '' # 통화코드
+
+
+class CIDBQ05300OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OvrsAcntTpCode: str = '' # 해외계좌구분코드
+    FcmAcntNo: str = '' # FCM계좌번호
+    AcntNo: str = '' # 계좌번호
+    AcntPwd: str = '' # 계좌비밀번호
+    CrcyCode: str = '' # 통화코드
+
+
+class CIDBQ05300OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    AcntNo: str = '' # 계좌번호
+    CrcyCode: str = '' # 통화코드
+    OvrsFutsDps: float = 0.0 # 해외선물예수금
+    AbrdFutsCsgnMgn: float = 0.0 # 해외선물위탁증거금액
+    OvrsFutsSplmMgn: float = 0.0 # 해외선물추가증거금
+    CustmLpnlAmt: float = 0.0 # 고객청산손익금액
+    AbrdFutsEvalPnlAmt: float = 0.0 # 해외선물평가손익금액
+    AbrdFutsCmsnAmt: float = 0.0 # 해외선물수수료금액
+    AbrdFutsEvalDpstgTotAmt: float = 0.0 # 해외선물평가예탁총금액
+    Xchrat: float = 0.0 # 환율
+    FcurrRealMxchgAmt: float = 0.0 # 외화실환전금액
+    AbrdFutsWthdwAbleAmt: float = 0.0 # 해외선물인출가능금액
+    AbrdFutsOrdAbleAmt: float = 0.0 # 해외선물주문가능금액
+    FutsDueNarrvLqdtPnlAmt: float = 0.0 # 선물만기미도래청산손익금액
+    FutsDueNarrvCmsn: float = 0.0 # 선물만기미도래수수료
+    AbrdFutsLqdtPnlAmt: float = 0.0 # 해외선물청산손익금액
+    OvrsFutsDueCmsn: float = 0.0 # 해외선물만기수수료
+    OvrsFutsOptBuyAmt: float = 0.0 # 해외선물옵션매수금액
+    OvrsFutsOptSellAmt: float = 0.0 # 해외선물옵션매도금액
+    OptBuyMktWrthAmt: float = 0.0 # 옵션매수시장가치금액
+    OptSellMktWrthAmt: float = 0.0 # 옵션매도시장가치금액
+
+
+class CIDBQ05300OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OvrsFutsDps: float = 0.0 # 해외선물예수금
+    AbrdFutsLqdtPnlAmt: float = 0.0 # 해외선물청산손익금액
+    FutsDueNarrvLqdtPnlAmt: float = 0.0 # 선물만기미도래청산손익금액
+    AbrdFutsEvalPnlAmt: float = 0.0 # 해외선물평가손익금액
+    AbrdFutsEvalDpstgTotAmt: float = 0.0 # 해외선물평가예탁총금액
+    CustmLpnlAmt: float = 0.0 # 고객청산손익금액
+    OvrsFutsDueCmsn: float = 0.0 # 해외선물만기수수료
+    FcurrRealMxchgAmt: float = 0.0 # 외화실환전금액
+    AbrdFutsCmsnAmt: float = 0.0 # 해외선물수수료금액
+    FutsDueNarrvCmsn: float = 0.0 # 선물만기미도래수수료
+    AbrdFutsCsgnMgn: float = 0.0 # 해외선물위탁증거금액
+    OvrsFutsMaintMgn: float = 0.0 # 해외선물유지증거금
+    OvrsFutsOptBuyAmt: float = 0.0 # 해외선물옵션매수금액
+    OvrsFutsOptSellAmt: float = 0.0 # 해외선물옵션매도금액
+    CtlmtAmt: float = 0.0 # 신용한도금액
+    OvrsFutsSplmMgn: float = 0.0 # 해외선물추가증거금
+    MgnclRat: float = 0.0 # 마진콜율
+    AbrdFutsOrdAbleAmt: float = 0.0 # 해외선물주문가능금액
+    AbrdFutsWthdwAbleAmt: float = 0.0 # 해외선물인출가능금액
+    OptBuyMktWrthAmt: float = 0.0 # 옵션매수시장가치금액
+    OptSellMktWrthAmt: float = 0.0 # 옵션매도시장가치금액
+    OvrsOptSettAmt: float = 0.0 # 해외옵션결제금액
+    OvrsOptBalEvalAmt: float = 0.0 # 해외옵션잔고평가금액
+
+
+
+# 해외선물 계좌예탁자산조회 
+class CIDBQ05300(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDBQ05300OutBlock1] = msgspec.field(default=None, name='CIDBQ05300OutBlock1')
+    outblock2: Optional[List[CIDBQ05300OutBlock2]] = msgspec.field(default=None, name='CIDBQ05300OutBlock2')
+    outblock3: Optional[CIDBQ05300OutBlock3] = msgspec.field(default=None, name='CIDBQ05300OutBlock3')
+# endregion
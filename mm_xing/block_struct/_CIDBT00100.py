@@ -0,0 +1,60 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CIDBT00100 - 해외선물신규주문>
+class CIDBT00100InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdDt: str = '' # 주문일자
+    BrnCode: str = '' # 지점코드
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    IsuCodeVal: str = '' # 종목코드값
+    FutsOrdTpCode: str = '' # 선물주문구분코드
+    BnsTpCode: str = '' # 매매구분코드
+    AbrdFutsOrdPtnCode: str = '' # 해외선물주문유형코드
+    CrcyCode: str = '' # 통화코드
+    OvrsDrvtOrdPrc: float = 0.0 # 해외파생주문가격
+    CndiOrdPrc: float = 0.0 # 조건주문가격
+    OrdQty: int = 0 # 주문수량
+    PrdtCode: str = '' # 상품코드
+    DueYymm: str = '' # 만기년월
+    ExchCode: str = '' # 거래소코드
+
+
+class CIDBT00100OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdDt: str = '' # 주문일자
+    BrnCode: str = '' # 지점코드
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    IsuCodeVal: str = '' # 종목코드값
+    FutsOrdTpCode: str = '' # 선물주문구분코드
+    BnsTpCode: str = '' # 매매구분코드
+    AbrdFutsOrdPtnCode: str = '' # 해외선물주문유형코드
+    CrcyCode: str = '' # 통화코드
+    OvrsDrvtOrdPrc: float = 0.0 # 해외파생주문가격
+    CndiOrdPrc: float = 0.0 # 조건주문가격
+    OrdQty: int = 0 # 주문수량
+    PrdtCode: str = '' # 상품코드
+    DueYymm: str = '' # 만기년월
+    ExchCode: str = '' # 거래소코드
+
+
+class CIDBT00100OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    OvrsFutsOrdNo: str = '' # 해외선물주문번호
+
+
+
+# 해외선물신규주문 
+class CIDBT00100(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDBT00100OutBlock1] = msgspec.field(default=None, name='CIDBT00100OutBlock1')
+    outblock2: Optional[CIDBT00100OutBlock2] = msgspec.field(default=None, name='CIDBT00100OutBlock2')
+# endregion
@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CIDBT01000 - 해외선물취소주문>
+class CIDBT01000InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdDt: str = '' # 주문일자
+    BrnNo: str = '' # 지점번호
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    IsuCodeVal: str = '' # 종목코드값
+    OvrsFutsOrgOrdNo: str = '' # 해외선물원주문번호
+    FutsOrdTpCode: str = '' # 선물주문구분코드
+    PrdtTpCode: str = '' # 상품구분코드
+    ExchCode: str = '' # 거래소코드
+
+
+class CIDBT01000OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdDt: str = '' # 주문일자
+    BrnNo: str = '' # 지점번호
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    IsuCodeVal: str = '' # 종목코드값
+    OvrsFutsOrgOrdNo: str = '' # 해외선물원주문번호
+    FutsOrdTpCode: str = '' # 선물주문구분코드
+    PrdtTpCode: str = '' # 상품구분코드
+    ExchCode: str = '' # 거래소코드
+
+
+class CIDBT01000OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    OvrsFutsOrdNo: str = '' # 해외선물주문번호
+    InnerMsgCnts: str = '' # 내부메시지내용
+
+
+
+# 해외선물취소주문 
+class CIDBT01000(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDBT01000OutBlock1] = msgspec.field(default=None, name='CIDBT01000OutBlock1')
+    outblock2: Optional[CIDBT01000OutBlock2] = msgspec.field(default=None, name='CIDBT01000OutBlock2')
+# endregion
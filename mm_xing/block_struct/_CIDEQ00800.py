@@ -0,0 +1,50 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CIDEQ00800 - 일자별 미결제 잔고내역>
+class CIDEQ00800InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    AcntPwd: str = '' # 계좌비밀번호
+    TrdDt: str = '' # 거래일자
+
+
+class CIDEQ00800OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    AcntPwd: str = '' # 계좌비밀번호
+    TrdDt: str = '' # 거래일자
+
+
+class CIDEQ00800OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    AcntNo: str = '' # 계좌번호
+    TrdDt: str = '' # 거래일자
+    IsuCodeVal: str = '' # 종목코드값
+    BnsTpNm: str = '' # 매매구분명
+    BalQty: int = 0 # 잔고수량
+    LqdtAbleQty: int = 0 # 청산가능수량
+    PchsPrc: float = 0.0 # 매입가격
+    OvrsDrvtNowPrc: float = 0.0 # 해외파생현재가
+    AbrdFutsEvalPnlAmt: float = 0.0 # 해외선물평가손익금액
+    CustmBalAmt: float = 0.0 # 고객잔고금액
+    FcurrEvalAmt: float = 0.0 # 외화평가금액
+    IsuNm: str = '' # 종목명
+    CrcyCodeVal: str = '' # 통화코드값
+    OvrsDrvtPrdtCode: str = '' # 해외파생상품코드
+    DueDt: str = '' # 만기일자
+    PrcntrAmt: float = 0.0 # 계약당금액
+    FcurrEvalPnlAmt: float = 0.0 # 외화평가손익금액
+
+
+
+# 일자별 미결제 잔고내역 
+class CIDEQ00800(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CIDEQ00800OutBlock1] = msgspec.field(default=None, name='CIDEQ00800OutBlock1')
+    outblock2: Optional[List[CIDEQ00800OutBlock2]] = msgspec.field(default=None, name='CIDEQ00800OutBlock2')
+# endregion
@@ -0,0 +1,64 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CLNAQ00100 - 예탁담보융자가능종목현황조회>
+class CLNAQ00100InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    QryTp: str = '' # 조회구분
+    IsuNo: str = '' # 종목번호
+    SecTpCode: str = '' # 유가증권구분
+    LoanIntrstGrdCode: str = '' # 대출이자등급코드
+    LoanTp: str = '' # 대출구분
+
+
+class CLNAQ00100OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    QryTp: str = '' # 조회구분
+    IsuNo: str = '' # 종목번호
+    SecTpCode: str = '' # 유가증권구분
+    LoanIntrstGrdCode: str = '' # 대출이자등급코드
+    LoanTp: str = '' # 대출구분
+
+
+class CLNAQ00100OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    IsuNo: str = '' # 종목번호
+    IsuNm: str = '' # 종목명
+    Parprc: float = 0.0 # 액면가
+    PrdayCprc: float = 0.0 # 전일종가
+    RatVal: float = 0.0 # 비율값
+    SubstPrc: float = 0.0 # 대용가
+    RegTpNm: str = '' # 등록구분
+    SpotMgnLevyClssNm: str = '' # 현물증거금징수분류명
+    FnoTrdStopRsnCnts: str = '' # 거래정지사유
+    DgrsPtnNm: str = '' # 요주의유형명
+    AcdPtnNm: str = '' # 사고유형
+    MktTpNm: str = '' # 시장구분
+    LmtVal: int = 0 # 한도값
+    AcntLmtVal: int = 0 # 계좌한도값
+    LoanGrdCode: str = '' # 대출등급코드
+    LoanAmt: int = 0 # 대출금액
+    LoanAbleRat: float = 0.0 # 대출가능율
+    LoanIntrat1: float = 0.0 # 대출이율1
+    RegPsnId: str = '' # 등록자ID
+    Rat01: float = 0.0 # 비율값
+    Rat02: float = 0.0 # 비율값
+
+
+class CLNAQ00100OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    LrgMnyoutSumAmt: int = 0 # 대출금합계금액
+
+
+
+# 예탁담보융자가능종목현황조회 
+class CLNAQ00100(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CLNAQ00100OutBlock1] = msgspec.field(default=None, name='CLNAQ00100OutBlock1')
+    outblock2: Optional[List[CLNAQ00100OutBlock2]] = msgspec.field(default=None, name='CLNAQ00100OutBlock2')
+    outblock3: Optional[CLNAQ00100OutBlock3] = msgspec.field(default=None, name='CLNAQ00100OutBlock3')
+# endregion
@@ -0,0 +1,72 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CSPAQ00600 - 계좌별신용한도조회>
+class CSPAQ00600InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    LoanDtlClssCode: str = '' # 대출상세분류코드
+    IsuNo: str = '' # 종목번호
+    OrdPrc: float = 0.0 # 주문가
+    CommdaCode: str = '' # 통신매체코드
+
+
+class CSPAQ00600OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    LoanDtlClssCode: str = '' # 대출상세분류코드
+    IsuNo: str = '' # 종목번호
+    OrdPrc: float = 0.0 # 주문가
+    CommdaCode: str = '' # 통신매체코드
+
+
+class CSPAQ00600OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    OrdPrc: float = 0.0 # 주문가
+    SloanLmtAmt: int = 0 # 대주한도
+    SloanAmtSum: int = 0 # 대주금액합계
+    SloanNewAmt: int = 0 # 대주신규금액
+    SloanRfundAmt: int = 0 # 대주상환금액
+    MktcplMloanLmtAmt: int = 0 # 유통융자한도금액
+    MktcplMloanAmtSum: int = 0 # 유통융자금액합계
+    MktcplMloanNewAmt: int = 0 # 유통융자신규금액
+    MktcplMloanRfundAmt: int = 0 # 유통융자상환금액
+    SfaccMloanLmtAmt: int = 0 # 자기융자한도금액
+    SfaccMloanAmtSum: int = 0 # 자기융자금액합계
+    SfaccMloanNewAmt: int = 0 # 자기융자신규금액
+    SfaccMloanRfundAmt: int = 0 # 자기융자상환금액
+    BrnMktcplMloanLmtAmt: int = 0 # 지점유통융자한도금액
+    BrnMktcplMloanNewAmt: int = 0 # 지점유통융자신규금액
+    BrnMktcplMloanRfundAmt: int = 0 # 지점유통융자상환금액
+    BrnMktcplMloanUseAmt: int = 0 # 지점유통융자사용금액
+    BrnSfaccMloanLmtAmt: int = 0 # 지점자기융자한도금액
+    BrnSfaccMloanNewAmt: int = 0 # 지점자기융자신규금액
+    BrnSfaccMloanRfundAmt: int = 0 # 지점자기융자상환금액
+    BrnSfaccMloanUseAmt: int = 0 # 지점자기융자사용금액
+    FirmMloanLmtMgmtYn: str = '' # 이용사융자한도관리여부
+    FirmCrdtIsuRestrcTp: str = '' # 이용사신용종목제한구분
+    PldgMaintRat: float = 0.0 # 담보유지비율
+    FirmNm: str = '' # 이용사명
+    PldgRat: float = 0.0 # 담보비율
+    DpsastSum: int = 0 # 예탁자산합계
+    LmtChgAbleAmt: int = 0 # 한도변경가능금액
+    OrdAbleAmt: int = 0 # 주문가능금액
+    OrdAbleQty: int = 0 # 주문가능수량
+    RcvblUablOrdAbleQty: int = 0 # 미수불가주문가능수량
+
+
+
+# 계좌별신용한도조회 
+class CSPAQ00600(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CSPAQ00600OutBlock1] = msgspec.field(default=None, name='CSPAQ00600OutBlock1')
+    outblock2: Optional[CSPAQ00600OutBlock2] = msgspec.field(default=None, name='CSPAQ00600OutBlock2')
+# endregion
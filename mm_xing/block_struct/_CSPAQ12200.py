@@ -0,0 +1,93 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CSPAQ12200 - 현물계좌예수금 주문가능금액 총평가 조회>
+class CSPAQ12200InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    MgmtBrnNo: str = '' # 관리지점번호
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    BalCreTp: str = '' # 잔고생성구분
+
+
+class CSPAQ12200OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    MgmtBrnNo: str = '' # 관리지점번호
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    BalCreTp: str = '' # 잔고생성구분
+
+
+class CSPAQ12200OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    BrnNm: str = '' # 지점명
+    AcntNm: str = '' # 계좌명
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    MnyoutAbleAmt: int = 0 # 출금가능금액
+    SeOrdAbleAmt: int = 0 # 거래소금액
+    KdqOrdAbleAmt: int = 0 # 코스닥금액
+    BalEvalAmt: int = 0 # 잔고평가금액
+    RcvblAmt: int = 0 # 미수금액
+    DpsastTotamt: int = 0 # 예탁자산총액
+    PnlRat: float = 0.0 # 손익율
+    InvstOrgAmt: int = 0 # 투자원금
+    InvstPlAmt: int = 0 # 투자손익금액
+    CrdtPldgOrdAmt: int = 0 # 신용담보주문금액
+    Dps: int = 0 # 예수금
+    SubstAmt: int = 0 # 대용금액
+    D1Dps: int = 0 # D1예수금
+    D2Dps: int = 0 # D2예수금
+    MnyrclAmt: int = 0 # 현금미수금액
+    MgnMny: int = 0 # 증거금현금
+    MgnSubst: int = 0 # 증거금대용
+    ChckAmt: int = 0 # 수표금액
+    SubstOrdAbleAmt: int = 0 # 대용주문가능금액
+    MgnRat100pctOrdAbleAmt: int = 0 # 증거금률100퍼센트주문가능금액
+    MgnRat35ordAbleAmt: int = 0 # 증거금률35%주문가능금액
+    MgnRat50ordAbleAmt: int = 0 # 증거금률50%주문가능금액
+    PrdaySellAdjstAmt: int = 0 # 전일매도정산금액
+    PrdayBuyAdjstAmt: int = 0 # 전일매수정산금액
+    CrdaySellAdjstAmt: int = 0 # 금일매도정산금액
+    CrdayBuyAdjstAmt: int = 0 # 금일매수정산금액
+    D1ovdRepayRqrdAmt: int = 0 # D1연체변제소요금액
+    D2ovdRepayRqrdAmt: int = 0 # D2연체변제소요금액
+    D1PrsmptWthdwAbleAmt: int = 0 # D1추정인출가능금액
+    D2PrsmptWthdwAbleAmt: int = 0 # D2추정인출가능금액
+    DpspdgLoanAmt: int = 0 # 예탁담보대출금액
+    Imreq: int = 0 # 신용설정보증금
+    MloanAmt: int = 0 # 융자금액
+    ChgAfPldgRat: float = 0.0 # 변경후담보비율
+    OrgPldgAmt: int = 0 # 원담보금액
+    SubPldgAmt: int = 0 # 부담보금액
+    RqrdPldgAmt: int = 0 # 소요담보금액
+    OrgPdlckAmt: int = 0 # 원담보부족금액
+    PdlckAmt: int = 0 # 담보부족금액
+    AddPldgMny: int = 0 # 추가담보현금
+    D1OrdAbleAmt: int = 0 # D1주문가능금액
+    CrdtIntdltAmt: int = 0 # 신용이자미납금액
+    EtclndAmt: int = 0 # 기타대여금액
+    NtdayPrsmptCvrgAmt: int = 0 # 익일추정반대매매금액
+    OrgPldgSumAmt: int = 0 # 원담보합계금액
+    CrdtOrdAbleAmt: int = 0 # 신용주문가능금액
+    SubPldgSumAmt: int = 0 # 부담보합계금액
+    CrdtPldgAmtMny: int = 0 # 신용담보금현금
+    CrdtPldgSubstAmt: int = 0 # 신용담보대용금액
+    AddCrdtPldgMny: int = 0 # 추가신용담보현금
+    CrdtPldgRuseAmt: int = 0 # 신용담보재사용금액
+    AddCrdtPldgSubst: int = 0 # 추가신용담보대용
+    CslLoanAmtdt1: int = 0 # 매도대금담보대출금액
+    DpslRestrcAmt: int = 0 # 처분제한금액
+
+
+
+# 현물계좌예수금 주문가능금액 총평가 조회 
+class CSPAQ12200(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CSPAQ12200OutBlock1] = msgspec.field(default=None, name='CSPAQ12200OutBlock1')
+    outblock2: Optional[CSPAQ12200OutBlock2] = msgspec.field(default=None, name='CSPAQ12200OutBlock2')
+# endregion
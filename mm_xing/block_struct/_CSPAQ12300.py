@@ -0,0 +1,154 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CSPAQ12300 - BEP단가조회>
+class CSPAQ12300InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    BalCreTp: str = '' # 잔고생성구분
+    CmsnAppTpCode: str = '' # 수수료적용구분
+    D2balBaseQryTp: str = '' # D2잔고기준조회구분
+    UprcTpCode: str = '' # 단가구분
+
+
+class CSPAQ12300OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    BalCreTp: str = '' # 잔고생성구분
+    CmsnAppTpCode: str = '' # 수수료적용구분
+    D2balBaseQryTp: str = '' # D2잔고기준조회구분
+    UprcTpCode: str = '' # 단가구분
+
+
+class CSPAQ12300OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    BrnNm: str = '' # 지점명
+    AcntNm: str = '' # 계좌명
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    MnyoutAbleAmt: int = 0 # 출금가능금액
+    SeOrdAbleAmt: int = 0 # 거래소금액
+    KdqOrdAbleAmt: int = 0 # 코스닥금액
+    HtsOrdAbleAmt: int = 0 # HTS주문가능금액
+    MgnRat100pctOrdAbleAmt: int = 0 # 증거금률100퍼센트주문가능금액
+    BalEvalAmt: int = 0 # 잔고평가금액
+    PchsAmt: int = 0 # 매입금액
+    RcvblAmt: int = 0 # 미수금액
+    PnlRat: float = 0.0 # 손익율
+    InvstOrgAmt: int = 0 # 투자원금
+    InvstPlAmt: int = 0 # 투자손익금액
+    CrdtPldgOrdAmt: int = 0 # 신용담보주문금액
+    Dps: int = 0 # 예수금
+    D1Dps: int = 0 # D1예수금
+    D2Dps: int = 0 # D2예수금
+    OrdDt: str = '' # 주문일
+    MnyMgn: int = 0 # 현금증거금액
+    SubstMgn: int = 0 # 대용증거금액
+    SubstAmt: int = 0 # 대용금액
+    PrdayBuyExecAmt: int = 0 # 전일매수체결금액
+    PrdaySellExecAmt: int = 0 # 전일매도체결금액
+    CrdayBuyExecAmt: int = 0 # 금일매수체결금액
+    CrdaySellExecAmt: int = 0 # 금일매도체결금액
+    EvalPnlSum: int = 0 # 평가손익합계
+    DpsastTotamt: int = 0 # 예탁자산총액
+    Evrprc: int = 0 # 제비용
+    RuseAmt: int = 0 # 재사용금액
+    EtclndAmt: int = 0 # 기타대여금액
+    PrcAdjstAmt: int = 0 # 가정산금액
+    D1CmsnAmt: int = 0 # D1수수료
+    D2CmsnAmt: int = 0 # D2수수료
+    D1EvrTax: int = 0 # D1제세금
+    D2EvrTax: int = 0 # D2제세금
+    D1SettPrergAmt: int = 0 # D1결제예정금액
+    D2SettPrergAmt: int = 0 # D2결제예정금액
+    PrdayKseMnyMgn: int = 0 # 전일KSE현금증거금
+    PrdayKseSubstMgn: int = 0 # 전일KSE대용증거금
+    PrdayKseCrdtMnyMgn: int = 0 # 전일KSE신용현금증거금
+    PrdayKseCrdtSubstMgn: int = 0 # 전일KSE신용대용증거금
+    CrdayKseMnyMgn: int = 0 # 금일KSE현금증거금
+    CrdayKseSubstMgn: int = 0 # 금일KSE대용증거금
+    CrdayKseCrdtMnyMgn: int = 0 # 금일KSE신용현금증거금
+    CrdayKseCrdtSubstMgn: int = 0 # 금일KSE신용대용증거금
+    PrdayKdqMnyMgn: int = 0 # 전일코스닥현금증거금
+    PrdayKdqSubstMgn: int = 0 # 전일코스닥대용증거금
+    PrdayKdqCrdtMnyMgn: int = 0 # 전일코스닥신용현금증거금
+    PrdayKdqCrdtSubstMgn: int = 0 # 전일코스닥신용대용증거금
+    CrdayKdqMnyMgn: int = 0 # 금일코스닥현금증거금
+    CrdayKdqSubstMgn: int = 0 # 금일코스닥대용증거금
+    CrdayKdqCrdtMnyMgn: int = 0 # 금일코스닥신용현금증거금
+    CrdayKdqCrdtSubstMgn: int = 0 # 금일코스닥신용대용증거금
+    PrdayFrbrdMnyMgn: int = 0 # 전일프리보드현금증거금
+    PrdayFrbrdSubstMgn: int = 0 # 전일프리보드대용증거금
+    CrdayFrbrdMnyMgn: int = 0 # 금일프리보드현금증거금
+    CrdayFrbrdSubstMgn: int = 0 # 금일프리보드대용증거금
+    PrdayCrbmkMnyMgn: int = 0 # 전일장외현금증거금
+    PrdayCrbmkSubstMgn: int = 0 # 전일장외대용증거금
+    CrdayCrbmkMnyMgn: int = 0 # 금일장외현금증거금
+    CrdayCrbmkSubstMgn: int = 0 # 금일장외대용증거금
+    DpspdgQty: int = 0 # 예탁담보수량
+    BuyAdjstAmtD2: int = 0 # 매수정산금(D+2)
+    SellAdjstAmtD2: int = 0 # 매도정산금(D+2)
+    RepayRqrdAmtD1: int = 0 # 변제소요금(D+1)
+    RepayRqrdAmtD2: int = 0 # 변제소요금(D+2)
+    LoanAmt: int = 0 # 대출금액
+
+
+class CSPAQ12300OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    IsuNo: str = '' # 종목번호
+    IsuNm: str = '' # 종목명
+    SecBalPtnCode: str = '' # 유가증권잔고유형코드
+    SecBalPtnNm: str = '' # 유가증권잔고유형명
+    BalQty: int = 0 # 잔고수량
+    BnsBaseBalQty: int = 0 # 매매기준잔고수량
+    CrdayBuyExecQty: int = 0 # 금일매수체결수량
+    CrdaySellExecQty: int = 0 # 금일매도체결수량
+    SellPrc: float = 0.0 # 매도가
+    BuyPrc: float = 0.0 # 매수가
+    SellPnlAmt: int = 0 # 매도손익금액
+    PnlRat: float = 0.0 # 손익율
+    NowPrc: float = 0.0 # 현재가
+    CrdtAmt: int = 0 # 신용금액
+    DueDt: str = '' # 만기일
+    PrdaySellExecPrc: float = 0.0 # 전일매도체결가
+    PrdaySellQty: int = 0 # 전일매도수량
+    PrdayBuyExecPrc: float = 0.0 # 전일매수체결가
+    PrdayBuyQty: int = 0 # 전일매수수량
+    LoanDt: str = '' # 대출일
+    AvrUprc: float = 0.0 # 평균단가
+    SellAbleQty: int = 0 # 매도가능수량
+    SellOrdQty: int = 0 # 매도주문수량
+    CrdayBuyExecAmt: int = 0 # 금일매수체결금액
+    CrdaySellExecAmt: int = 0 # 금일매도체결금액
+    PrdayBuyExecAmt: int = 0 # 전일매수체결금액
+    PrdaySellExecAmt: int = 0 # 전일매도체결금액
+    BalEvalAmt: int = 0 # 잔고평가금액
+    EvalPnl: int = 0 # 평가손익
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    OrdAbleAmt: int = 0 # 주문가능금액
+    SellUnercQty: int = 0 # 매도미체결수량
+    SellUnsttQty: int = 0 # 매도미결제수량
+    BuyUnercQty: int = 0 # 매수미체결수량
+    BuyUnsttQty: int = 0 # 매수미결제수량
+    UnsttQty: int = 0 # 미결제수량
+    UnercQty: int = 0 # 미체결수량
+    PrdayCprc: float = 0.0 # 전일종가
+    PchsAmt: int = 0 # 매입금액
+    RegMktCode: str = '' # 등록시장코드
+    LoanDtlClssCode: str = '' # 대출상세분류코드
+    DpspdgLoanQty: int = 0 # 예탁담보대출수량
+
+
+
+# BEP단가조회 
+class CSPAQ12300(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CSPAQ12300OutBlock1] = msgspec.field(default=None, name='CSPAQ12300OutBlock1')
+    outblock2: Optional[CSPAQ12300OutBlock2] = msgspec.field(default=None, name='CSPAQ12300OutBlock2')
+    outblock3: Optional[List[CSPAQ12300OutBlock3]] = msgspec.field(default=None, name='CSPAQ12300OutBlock3')
+# endregion
@@ -0,0 +1,93 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <CSPAQ13700 - 현물계좌주문체결내역조회>
+class CSPAQ13700InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    OrdMktCode: str = '' # 주문시장코드
+    BnsTpCode: str = '' # 매매구분
+    IsuNo: str = '' # 종목번호
+    ExecYn: str = '' # 체결여부
+    OrdDt: str = '' # 주문일
+    SrtOrdNo2: int = 0 # 시작주문번호2
+    BkseqTpCode: str = '' # 역순구분
+    OrdPtnCode: str = '' # 주문유형코드
+
+
+class CSPAQ13700OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    OrdMktCode: str = '' # 주문시장코드
+    BnsTpCode: str = '' # 매매구분
+    IsuNo: str = '' # 종목번호
+    ExecYn: str = '' # 체결여부
+    OrdDt: str = '' # 주문일
+    SrtOrdNo2: int = 0 # 시작주문번호2
+    BkseqTpCode: str = '' # 역순구분
+    OrdPtnCode: str = '' # 주문유형코드
+
+
+class CSPAQ13700OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    SellExecAmt: int = 0 # 매도체결금액
+    BuyExecAmt: int = 0 # 매수체결금액
+    SellExecQty: int = 0 # 매도체결수량
+    BuyExecQty: int = 0 # 매수체결수량
+    SellOrdQty: int = 0 # 매도주문수량
+    BuyOrdQty: int = 0 # 매수주문수량
+
+
+class CSPAQ13700OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    OrdDt: str = '' # 주문일
+    MgmtBrnNo: str = '' # 관리지점번호
+    OrdMktCode: str = '' # 주문시장코드
+    OrdNo: int = 0 # 주문번호
+    OrgOrdNo: int = 0 # 원주문번호
+    IsuNo: str = '' # 종목번호
+    IsuNm: str = '' # 종목명
+    BnsTpCode: str = '' # 매매구분
+    BnsTpNm: str = '' # 매매구분
+    OrdPtnCode: str = '' # 주문유형코드
+    OrdPtnNm: str = '' # 주문유형명
+    OrdTrxPtnCode: int = 0 # 주문처리유형코드
+    OrdTrxPtnNm: str = '' # 주문처리유형명
+    MrcTpCode: str = '' # 정정취소구분
+    MrcTpNm: str = '' # 정정취소구분명
+    MrcQty: int = 0 # 정정취소수량
+    MrcAbleQty: int = 0 # 정정취소가능수량
+    OrdQty: int = 0 # 주문수량
+    OrdPrc: float = 0.0 # 주문가격
+    ExecQty: int = 0 # 체결수량
+    ExecPrc: float = 0.0 # 체결가
+    ExecTrxTime: str = '' # 체결처리시각
+    LastExecTime: str = '' # 최종체결시각
+    OrdprcPtnCode: str = '' # 호가유형코드
+    OrdprcPtnNm: str = '' # 호가유형명
+    OrdCndiTpCode: str = '' # 주문조건구분
+    AllExecQty: int = 0 # 전체체결수량
+    RegCommdaCode: str = '' # 통신매체코드
+    CommdaNm: str = '' # 통신매체명
+    MbrNo: str = '' # 회원번호
+    RsvOrdYn: str = '' # 예약주문여부
+    LoanDt: str = '' # 대출일
+    OrdTime: str = '' # 주문시각
+    OpDrtnNo: str = '' # 운용지시번호
+    OdrrId: str = '' # 주문자ID
+
+
+
+# 현물계좌주문체결내역조회 
+class CSPAQ13700(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CSPAQ13700OutBlock1] = msgspec.field(default=None, name='CSPAQ13700OutBlock1')
+    outblock2: Optional[CSPAQ13700OutBlock2] = msgspec.field(default=None, name='CSPAQ13700OutBlock2')
+    outblock3: Optional[List[CSPAQ13700OutBlock3]] = msgspec.field(default=None, name='CSPAQ13700OutBlock3')
+# endregion
@@ -0,0 +1,65 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CSPAT00800 - 현물취소주문>
+class CSPAT00800InBlock1(msgspec.Struct, frozen=True, gc=False):
+    OrgOrdNo: int = 0 # 원주문번호
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    IsuNo: str = '' # 종목번호
+    OrdQty: int = 0 # 주문수량
+
+
+class CSPAT00800OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrgOrdNo: int = 0 # 원주문번호
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    IsuNo: str = '' # 종목번호
+    OrdQty: int = 0 # 주문수량
+    CommdaCode: str = '' # 통신매체코드
+    GrpId: str = '' # 그룹ID
+    StrtgCode: str = '' # 전략코드
+    OrdSeqNo: int = 0 # 주문회차
+    PtflNo: int = 0 # 포트폴리오번호
+    BskNo: int = 0 # 바스켓번호
+    TrchNo: int = 0 # 트렌치번호
+    ItemNo: int = 0 # 아이템번호
+
+
+class CSPAT00800OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    OrdNo: int = 0 # 주문번호
+    PrntOrdNo: int = 0 # 모주문번호
+    OrdTime: str = '' # 주문시각
+    OrdMktCode: str = '' # 주문시장코드
+    OrdPtnCode: str = '' # 주문유형코드
+    ShtnIsuNo: str = '' # 단축종목번호
+    PrgmOrdprcPtnCode: str = '' # 프로그램호가유형코드
+    StslOrdprcTpCode: str = '' # 공매도호가구분
+    StslAbleYn: str = '' # 공매도가능여부
+    MgntrnCode: str = '' # 신용거래코드
+    LoanDt: str = '' # 대출일
+    CvrgOrdTp: str = '' # 반대매매주문구분
+    LpYn: str = '' # 유동성공급자여부
+    MgempNo: str = '' # 관리사원번호
+    BnsTpCode: str = '' # 매매구분
+    SpareOrdNo: int = 0 # 예비주문번호
+    CvrgSeqno: int = 0 # 반대매매일련번호
+    RsvOrdNo: int = 0 # 예약주문번호
+    AcntNm: str = '' # 계좌명
+    IsuNm: str = '' # 종목명
+
+
+
+# 현물취소주문 
+class CSPAT00800(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CSPAT00800OutBlock1] = msgspec.field(default=None, name='CSPAT00800OutBlock1')
+    outblock2: Optional[CSPAT00800OutBlock2] = msgspec.field(default=None, name='CSPAT00800OutBlock2')
+# endregion
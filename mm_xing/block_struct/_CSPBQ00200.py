@@ -0,0 +1,81 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CSPBQ00200 - 현물계좌증거금률별주문가능수량조회>
+class CSPBQ00200InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    BnsTpCode: str = '' # 매매구분
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    IsuNo: str = '' # 종목번호
+    OrdPrc: float = 0.0 # 주문가격
+    RegCommdaCode: str = '' # 통신매체코드
+
+
+class CSPBQ00200OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    BnsTpCode: str = '' # 매매구분
+    AcntNo: str = '' # 계좌번호
+    InptPwd: str = '' # 입력비밀번호
+    IsuNo: str = '' # 종목번호
+    OrdPrc: float = 0.0 # 주문가격
+    RegCommdaCode: str = '' # 통신매체코드
+
+
+class CSPBQ00200OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    IsuNm: str = '' # 종목명
+    Dps: int = 0 # 예수금
+    SubstAmt: int = 0 # 대용금액
+    CrdtPldgRuseAmt: int = 0 # 신용담보재사용금액
+    MnyOrdAbleAmt: int = 0 # 현금주문가능금액
+    SubstOrdAbleAmt: int = 0 # 대용주문가능금액
+    MnyMgn: int = 0 # 현금증거금액
+    SubstMgn: int = 0 # 대용증거금액
+    SeOrdAbleAmt: int = 0 # 거래소금액
+    KdqOrdAbleAmt: int = 0 # 코스닥금액
+    PrsmptDpsD1: int = 0 # 추정예수금(D+1)
+    PrsmptDpsD2: int = 0 # 추정예수금(D+2)
+    MnyoutAbleAmt: int = 0 # 출금가능금액
+    RcvblAmt: int = 0 # 미수금액
+    CmsnRat: float = 0.0 # 수수료율
+    AddLevyAmt: int = 0 # 추가징수금액
+    RuseObjAmt: int = 0 # 재사용대상금액
+    MnyRuseObjAmt: int = 0 # 현금재사용대상금액
+    FirmMgnRat: float = 0.0 # 이용사증거금률
+    SubstRuseObjAmt: int = 0 # 대용재사용대상금액
+    IsuMgnRat: float = 0.0 # 종목증거금률
+    AcntMgnRat: float = 0.0 # 계좌증거금률
+    TrdMgnrt: float = 0.0 # 거래증거금률
+    Cmsn: int = 0 # 수수료
+    MgnRat20pctOrdAbleAmt: int = 0 # 증거금률20퍼센트주문가능금액
+    MgnRat20OrdAbleQty: int = 0 # 증거금률100퍼센트현금주문가능수량?
+    MgnRat30pctOrdAbleAmt: int = 0 # 증거금률30퍼센트주문가능금액
+    MgnRat30OrdAbleQty: int = 0 # 증거금률30퍼센트주문가능수량??
+    MgnRat40pctOrdAbleAmt: int = 0 # 증거금률40퍼센트주문가능금액
+    MgnRat40OrdAbleQty: int = 0 # 증거금률40퍼센트주문가능수량??
+    MgnRat100pctOrdAbleAmt: int = 0 # 증거금률100퍼센트주문가능금액
+    MgnRat100OrdAbleQty: int = 0 # 증거금률100퍼센트주문가능수량??
+    MgnRat100MnyOrdAbleAmt: int = 0 # 증거금률100퍼센트현금주문가능금액?
+    MgnRat100MnyOrdAbleQty: int = 0 # 증거금률100퍼센트현금주문가능수량
+    MgnRat20pctRuseAbleAmt: int = 0 # 증거금률20퍼센트재사용가능금액
+    MgnRat30pctRuseAbleAmt: int = 0 # 증거금률30퍼센트재사용가능금액
+    MgnRat40pctRuseAbleAmt: int = 0 # 증거금률40퍼센트재사용가능금액
+    MgnRat100pctRuseAbleAmt: int = 0 # 증거금률100퍼센트재사용가능금액
+    OrdAbleQty: int = 0 # 주문가능수량
+    OrdAbleAmt: int = 0 # 주문가능금액
+
+
+
+# 현물계좌증거금률별주문가능수량조회 
+class CSPBQ00200(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[CSPBQ00200OutBlock1] = msgspec.field(default=None, name='CSPBQ00200OutBlock1')
+    outblock2: Optional[CSPBQ00200OutBlock2] = msgspec.field(default=None, name='CSPBQ00200OutBlock2')
+# endregion
@@ -0,0 +1,34 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <CUR - 현물정보 USD 실시간(CUR)>
+class CURInBlock(msgspec.Struct, frozen=True, gc=False):
+    base_id: str = '' # 기초자산ID
+
+
+class CUROutBlock(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 전송시간
+    offer: float = 0.0 # 매도호가
+    bid: float = 0.0 # 매수호가
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    price: float = 0.0 # 체결가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    drate: float = 0.0 # 등락율
+    ctime: str = '' # 데이타 발생시간
+    base_id: str = '' # 기초자산ID
+
+
+
+# 현물정보 USD 실시간(CUR) 
+class CUR(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[CUROutBlock] = msgspec.field(default=None, name='CUROutBlock')
+# endregion
@@ -0,0 +1,51 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <ChartExcel - 챠트엑셀데이터조회>
+class ChartExcelInBlock(msgspec.Struct, frozen=True, gc=False):
+    indexid: int = 0 # 지표ID
+    indexname: str = '' # 지표명
+    indexparam: str = '' # 지표조건설정
+    indexouttype: str = '' # 결과데이터 구분
+    market: str = '' # 시장구분
+    period: str = '' # 주기구분
+    shcode: str = '' # 단축코드
+    isexcelout: str = '' # 결과 지표데이터 엑셀표시 여부
+    excelfilename: str = '' # 엑셀데이터 파일명
+    IsReal: str = '' # 실시간 데이터수신 자동등록 여부
+
+
+class ChartExcelOutBlock(msgspec.Struct, frozen=True, gc=False):
+    indexid: int = 0 # 지표ID
+    rec_cnt: int = 0 # 레코드갯수
+    validdata_cnt: int = 0 # 유효 데이터 컬럼 갯수
+
+
+class ChartExcelOutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    time: str = '' # 시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    volume: float = 0.0 # 거래량
+    value1: float = 0.0 # 지표값1
+    value2: float = 0.0 # 지표값2
+    value3: float = 0.0 # 지표값3
+    value4: float = 0.0 # 지표값4
+    value5: float = 0.0 # 지표값5
+    pos: int = 0 # 위치
+
+
+
+# 챠트엑셀데이터조회 
+class ChartExcel(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[ChartExcelOutBlock] = msgspec.field(default=None, name='ChartExcelOutBlock')
+    outblock1: Optional[List[ChartExcelOutBlock1]] = msgspec.field(default=None, name='ChartExcelOutBlock1')
+# endregion
@@ -0,0 +1,66 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <DH1 - KOSPI시간외단일가호가잔량(DH1)>
+class DH1InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class DH1OutBlock(msgspec.Struct, frozen=True, gc=False):
+    dan_hotime: str = '' # 시간외단일가호가시간
+    dan_hstatus: str = '' # 시간외단일가장구분
+    dan_offerho1: int = 0 # 시간외단일가매도호가1
+    dan_bidho1: int = 0 # 시간외단일가매수호가1
+    dan_offerrem1: int = 0 # 시간외단일가매도호가잔량1
+    dan_bidrem1: int = 0 # 시간외단일가매수호가잔량1
+    dan_preoffercha1: int = 0 # 시간외단일가직전매도대비수량1
+    dan_prebidcha1: int = 0 # 시간외단일가직전매수대비수량1
+    dan_offerho2: int = 0 # 시간외단일가매도호가2
+    dan_bidho2: int = 0 # 시간외단일가매수호가2
+    dan_offerrem2: int = 0 # 시간외단일가매도호가잔량2
+    dan_bidrem2: int = 0 # 시간외단일가매수호가잔량2
+    dan_preoffercha2: int = 0 # 시간외단일가직전매도대비수량2
+    dan_prebidcha2: int = 0 # 시간외단일가직전매수대비수량2
+    dan_offerho3: int = 0 # 시간외단일가매도호가3
+    dan_bidho3: int = 0 # 시간외단일가매수호가3
+    dan_offerrem3: int = 0 # 시간외단일가매도호가잔량3
+    dan_bidrem3: int = 0 # 시간외단일가매수호가잔량3
+    dan_preoffercha3: int = 0 # 시간외단일가직전매도대비수량3
+    dan_prebidcha3: int = 0 # 시간외단일가직전매수대비수량3
+    dan_offerho4: int = 0 # 시간외단일가매도호가4
+    dan_bidho4: int = 0 # 시간외단일가매수호가4
+    dan_offerrem4: int = 0 # 시간외단일가매도호가잔량4
+    dan_bidrem4: int = 0 # 시간외단일가매수호가잔량4
+    dan_preoffercha4: int = 0 # 시간외단일가직전매도대비수량4
+    dan_prebidcha4: int = 0 # 시간외단일가직전매수대비수량4
+    dan_offerho5: int = 0 # 시간외단일가매도호가5
+    dan_bidho5: int = 0 # 시간외단일가매수호가5
+    dan_offerrem5: int = 0 # 시간외단일가매도호가잔량5
+    dan_bidrem5: int = 0 # 시간외단일가매수호가잔량5
+    dan_preoffercha5: int = 0 # 시간외단일가직전매도대비수량5
+    dan_prebidcha5: int = 0 # 시간외단일가직전매수대비수량5
+    dan_totofferrem: int = 0 # 시간외단일가총매도호가잔량
+    dan_totbidrem: int = 0 # 시간외단일가총매수호가잔량
+    dan_preoffercha: int = 0 # 시간외단일가직전매도호가총대비수량
+    dan_prebidcha: int = 0 # 시간외단일가직전매수호가총대비수량
+    dan_yeprice: int = 0 # 시간외단일가예상체결가격
+    dan_yevolume: int = 0 # 시간외단일가예상체결수량
+    dan_preysign: str = '' # 시간외단일가예상가직전가대비구분
+    dan_preychange: int = 0 # 시간외단일가예상가직전가대비
+    dan_jnilysign: str = '' # 시간외단일가예상가전일가대비구분
+    dan_jnilychange: int = 0 # 시간외단일가예상가전일가대비
+    shcode: str = '' # 단축코드
+    volume: int = 0 # 누적거래량
+
+
+
+# KOSPI시간외단일가호가잔량(DH1) 
+class DH1(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[DH1OutBlock] = msgspec.field(default=None, name='DH1OutBlock')
+# endregion
@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <DS3 - KOSPI시간외단일가체결(DS3)>
+class DS3InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class DS3OutBlock(msgspec.Struct, frozen=True, gc=False):
+    dan_chetime: str = '' # 시간외단일가체결시간
+    dan_sign: str = '' # 시간외단일가전일대비구분
+    dan_change: int = 0 # 시간외단일가전일대비
+    dan_drate: float = 0.0 # 시간외단일가등락율
+    dan_price: int = 0 # 시간외단일가현재가
+    dan_opentime: str = '' # 시간외단일가시가시간
+    dan_open: int = 0 # 시간외단일가시가
+    dan_hightime: str = '' # 시간외단일가고가시간
+    dan_high: int = 0 # 시간외단일가고가
+    dan_lowtime: str = '' # 시간외단일가저가시간
+    dan_low: int = 0 # 시간외단일가저가
+    dan_cgubun: str = '' # 시간외단일가체결구분
+    dan_cvolume: int = 0 # 시간외단일가체결량
+    dan_volume: int = 0 # 시간외단일가누적거래량
+    dan_value: int = 0 # 시간외단일가누적거래대금
+    dan_mdvolume: int = 0 # 시간외단일가매도누적체결량
+    dan_mdchecnt: int = 0 # 시간외단일가매도누적체결건수
+    dan_msvolume: int = 0 # 시간외단일가매수누적체결량
+    dan_mschecnt: int = 0 # 시간외단일가매수누적체결건수
+    dan_prevolume: int = 0 # 시간외단일가직전거래량
+    dan_precvolume: int = 0 # 시간외단일가직전체결수량
+    dan_cpower: float = 0.0 # 시간외단일가체결강도
+    dan_status: str = '' # 시간외단일가장정보
+    shcode: str = '' # 단축코드
+
+
+
+# KOSPI시간외단일가체결(DS3) 
+class DS3(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[DS3OutBlock] = msgspec.field(default=None, name='DS3OutBlock')
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <DVI - 시간외단일가VI발동해제(DVI)>
+class DVIInBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드(KEY)
+
+
+class DVIOutBlock(msgspec.Struct, frozen=True, gc=False):
+    vi_gubun: str = '' # 구분(0:해제 1:정적발동 2:동적발동 3:정적&동적)
+    svi_recprice: int = 0 # 정적VI발동기준가격
+    dvi_recprice: int = 0 # 동적VI발동기준가격
+    vi_trgprice: int = 0 # VI발동가격
+    shcode: str = '' # 단축코드(KEY)
+    ref_shcode: str = '' # 참조코드(미사용)
+    time: str = '' # 시간
+
+
+
+# 시간외단일가VI발동해제(DVI) 
+class DVI(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[DVIOutBlock] = msgspec.field(default=None, name='DVIOutBlock')
+# endregion
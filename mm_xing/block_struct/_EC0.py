@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <EC0 - EUREX연계KP200지수옵션선물체결(EC0)>
+class EC0InBlock(msgspec.Struct, frozen=True, gc=False):
+    optcode: str = '' # 단축코드
+
+
+class EC0OutBlock(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 체결시간(24시간)
+    chetime1: str = '' # 체결시간(36시간)
+    sign: str = '' # 정규장종가대비구분
+    change: float = 0.0 # 정규장종가대비
+    drate: float = 0.0 # 정규장종가기준등락율
+    price: float = 0.0 # 현재가
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    cgubun: str = '' # 체결구분
+    cvolume: int = 0 # 체결량
+    volume: int = 0 # 누적거래량
+    value: int = 0 # 누적거래대금(미제공)
+    mdvolume: int = 0 # 매도누적체결량
+    mdchecnt: int = 0 # 매도누적체결건수(미제공)
+    msvolume: int = 0 # 매수누적체결량
+    mschecnt: int = 0 # 매수누적체결건수(미제공)
+    cpower: float = 0.0 # 체결강도
+    offerho1: float = 0.0 # 매도호가1
+    bidho1: float = 0.0 # 매수호가1
+    openyak: int = 0 # 미결제약정수량
+    k200jisu: float = 0.0 # KOSPI200지수
+    eqva: float = 0.0 # KOSPI등가
+    theoryprice: float = 0.0 # 이론가
+    impv: float = 0.0 # 내재변동성
+    openyakcha: int = 0 # 미결제약정증감
+    timevalue: float = 0.0 # 시간가치
+    jgubun: str = '' # 장운영정보
+    jnilvolume: int = 0 # 전일동시간대거래량
+    optcode: str = '' # 단축코드
+
+
+
+# EUREX연계KP200지수옵션선물체결(EC0) 
+class EC0(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[EC0OutBlock] = msgspec.field(default=None, name='EC0OutBlock')
+# endregion
@@ -0,0 +1,38 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <ESN - 뉴ELW투자지표민감도(ESN)>
+class ESNInBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class ESNOutBlock(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 시간
+    theoryprice: float = 0.0 # 장중이론가
+    delt: float = 0.0 # 델타
+    gama: float = 0.0 # 감마
+    ceta: float = 0.0 # 세타
+    vega: float = 0.0 # 베가
+    rhox: float = 0.0 # 로우
+    impv: float = 0.0 # 내재변동성
+    egearing: float = 0.0 # E.기어링
+    shcode: str = '' # 단축코드
+    elwclose: int = 0 # ELW현재가
+    sign: str = '' # ELW전일대비구분
+    change: int = 0 # ELW전일대비
+    date: str = '' # 일자
+    tickvalue: float = 0.0 # 틱환산
+    lp_impv: float = 0.0 # LP내재변동성
+
+
+
+# 뉴ELW투자지표민감도(ESN) 
+class ESN(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[ESNOutBlock] = msgspec.field(default=None, name='ESNOutBlock')
+# endregion
@@ -0,0 +1,60 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <FH0 - KOSPI200선물호가(H0)>
+class FH0InBlock(msgspec.Struct, frozen=True, gc=False):
+    futcode: str = '' # 단축코드
+
+
+class FH0OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hotime: str = '' # 호가시간
+    offerho1: float = 0.0 # 매도호가1
+    bidho1: float = 0.0 # 매수호가1
+    offerrem1: int = 0 # 매도호가수량1
+    bidrem1: int = 0 # 매수호가수량1
+    offercnt1: int = 0 # 매도호가건수1
+    bidcnt1: int = 0 # 매수호가건수1
+    offerho2: float = 0.0 # 매도호가2
+    bidho2: float = 0.0 # 매수호가2
+    offerrem2: int = 0 # 매도호가수량2
+    bidrem2: int = 0 # 매수호가수량2
+    offercnt2: int = 0 # 매도호가건수2
+    bidcnt2: int = 0 # 매수호가건수2
+    offerho3: float = 0.0 # 매도호가3
+    bidho3: float = 0.0 # 매수호가3
+    offerrem3: int = 0 # 매도호가수량3
+    bidrem3: int = 0 # 매수호가수량3
+    offercnt3: int = 0 # 매도호가건수3
+    bidcnt3: int = 0 # 매수호가건수3
+    offerho4: float = 0.0 # 매도호가4
+    bidho4: float = 0.0 # 매수호가4
+    offerrem4: int = 0 # 매도호가수량4
+    bidrem4: int = 0 # 매수호가수량4
+    offercnt4: int = 0 # 매도호가건수4
+    bidcnt4: int = 0 # 매수호가건수4
+    offerho5: float = 0.0 # 매도호가5
+    bidho5: float = 0.0 # 매수호가5
+    offerrem5: int = 0 # 매도호가수량5
+    bidrem5: int = 0 # 매수호가수량5
+    offercnt5: int = 0 # 매도호가건수5
+    bidcnt5: int = 0 # 매수호가건수5
+    totofferrem: int = 0 # 매도호가총수량
+    totbidrem: int = 0 # 매수호가총수량
+    totoffercnt: int = 0 # 매도호가총건수
+    totbidcnt: int = 0 # 매수호가총건수
+    futcode: str = '' # 단축코드
+    danhochk: str = '' # 단일가호가여부
+    alloc_gubun: str = '' # 배분적용구분
+
+
+
+# KOSPI200선물호가(H0) 
+class FH0(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[FH0OutBlock] = msgspec.field(default=None, name='FH0OutBlock')
+# endregion
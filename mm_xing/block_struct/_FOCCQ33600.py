@@ -0,0 +1,59 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <FOCCQ33600 - 주식계좌 기간별수익률 상세>
+class FOCCQ33600InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    TermTp: str = '' # 기간구분
+
+
+class FOCCQ33600OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    TermTp: str = '' # 기간구분
+
+
+class FOCCQ33600OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    BnsctrAmt: int = 0 # 매매약정금액
+    MnyinAmt: int = 0 # 입금금액
+    MnyoutAmt: int = 0 # 출금금액
+    InvstAvrbalPramt: int = 0 # 투자원금평잔금액
+    InvstPlAmt: int = 0 # 투자손익금액
+    InvstErnrat: float = 0.0 # 투자수익률
+
+
+class FOCCQ33600OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    BaseDt: str = '' # 기준일
+    FdEvalAmt: int = 0 # 기초평가금액
+    EotEvalAmt: int = 0 # 기말평가금액
+    InvstAvrbalPramt: int = 0 # 투자원금평잔금액
+    BnsctrAmt: int = 0 # 매매약정금액
+    MnyinSecinAmt: int = 0 # 입금고액
+    MnyoutSecoutAmt: int = 0 # 출금고액
+    EvalPnlAmt: int = 0 # 평가손익금액
+    TermErnrat: float = 0.0 # 기간수익률
+    Idx: float = 0.0 # 지수
+
+
+
+# 주식계좌 기간별수익률 상세 
+class FOCCQ33600(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[FOCCQ33600OutBlock1] = msgspec.field(default=None, name='FOCCQ33600OutBlock1')
+    outblock2: Optional[FOCCQ33600OutBlock2] = msgspec.field(default=None, name='FOCCQ33600OutBlock2')
+    outblock3: Optional[List[FOCCQ33600OutBlock3]] = msgspec.field(default=None, name='FOCCQ33600OutBlock3')
+# endregion
@@ -0,0 +1,71 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <FOCCQ33700 - 선물옵션 기간별 계좌 수익률 현황>
+class FOCCQ33700InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    QryTp: str = '' # 조회구분
+    BaseAmtTp: str = '' # 기준금액구분
+    QryTermTp: str = '' # 조회기간구분
+    PnlCalcTpCode: str = '' # 손익산출구분코드
+
+
+class FOCCQ33700OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNo: str = '' # 계좌번호
+    Pwd: str = '' # 비밀번호
+    QrySrtDt: str = '' # 조회시작일
+    QryEndDt: str = '' # 조회종료일
+    QryTp: str = '' # 조회구분
+    BaseAmtTp: str = '' # 기준금액구분
+    QryTermTp: str = '' # 조회기간구분
+    PnlCalcTpCode: str = '' # 손익산출구분코드
+
+
+class FOCCQ33700OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    AcntNm: str = '' # 계좌명
+    InAmt: int = 0 # 입금액
+    OutAmt: int = 0 # 출금액
+    FnoCtrctAmt: int = 0 # 선물옵션약정금액
+    InvstPramtAvrbalAmt: int = 0 # 투자원금평잔금액
+    FutsAdjstDfamt: int = 0 # 선물정산차금
+    OptBsnPnlAmt: int = 0 # 옵션매매손익금액
+    OptEvalPnlAmt: int = 0 # 옵션평가손익금액
+    InvstPlAmt: int = 0 # 투자손익금액
+    ErnRat: float = 0.0 # 수익률
+
+
+class FOCCQ33700OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    TrdDt: str = '' # 거래일
+    FdDpsastAmt: int = 0 # 기초예탁자산금액
+    EotDpsastAmt: int = 0 # 기말예탁자산금액
+    InAmt: int = 0 # 입금액
+    OutAmt: int = 0 # 출금액
+    InvstAvrbalPramt: int = 0 # 투자원금평잔금액
+    InvstPlAmt: int = 0 # 투자손익금액
+    Ernrat: float = 0.0 # 수익률
+    FnoCtrctAmt: int = 0 # 선물옵션약정금액
+    Trnrat: float = 0.0 # 회전율
+    FutsAdjstDfamt: int = 0 # 선물정산차금
+    OptBsnPnlAmt: int = 0 # 옵션매매손익금액
+    OptEvalPnlAmt: int = 0 # 옵션평가손익금액
+
+
+
+# 선물옵션 기간별 계좌 수익률 현황 
+class FOCCQ33700(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[FOCCQ33700OutBlock1] = msgspec.field(default=None, name='FOCCQ33700OutBlock1')
+    outblock2: Optional[FOCCQ33700OutBlock2] = msgspec.field(default=None, name='FOCCQ33700OutBlock2')
+    outblock3: Optional[List[FOCCQ33700OutBlock3]] = msgspec.field(default=None, name='FOCCQ33700OutBlock3')
+# endregion
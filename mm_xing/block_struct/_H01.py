@@ -0,0 +1,64 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <H01 - 선물주문정정취소>
+class H01OutBlock(msgspec.Struct, frozen=True, gc=False):
+    lineseq: int = 0 # 라인일련번호
+    accno: str = '' # 계좌번호
+    user: str = '' # 조작자ID
+    seq: int = 0 # 일련번호
+    trcode: str = '' # trcode
+    megrpno: str = '' # 매칭그룹번호
+    boardid: str = '' # 보드ID
+    memberno: str = '' # 회원번호
+    bpno: str = '' # 지점번호
+    ordno: str = '' # 주문번호
+    ordordno: str = '' # 원주문번호
+    expcode: str = '' # 종목코드
+    dosugb: str = '' # 매도수구분
+    mocagb: str = '' # 정정취소구분
+    accno1: str = '' # 계좌번호1
+    qty2: int = 0 # 호가수량
+    price: float = 0.0 # 호가가격
+    ordgb: str = '' # 주문유형
+    hogagb: str = '' # 호가구분
+    sihogagb: str = '' # 시장조성호가구분
+    treaid: str = '' # 자사주신고서ID
+    treacode: str = '' # 자사주매매방법
+    askcode: str = '' # 매도유형코드
+    creditcode: str = '' # 신용구분코드
+    jakigb: str = '' # 위탁자기구분
+    trustnum: str = '' # 위탁사번호
+    ptgb: str = '' # 프로그램구분
+    substocnum: str = '' # 대용주권계좌번호
+    accgb: str = '' # 계좌구분코드
+    accmarggb: str = '' # 계좌증거금코드
+    nationcode: str = '' # 국가코드
+    investgb: str = '' # 투자자구분
+    forecode: str = '' # 외국인코드
+    medcode: str = '' # 주문매체구분
+    ordid: str = '' # 주문식별자번호
+    macid: str = '' # MAC주소
+    orddate: str = '' # 호가일자
+    rcvtime: str = '' # 회원사주문시각
+    mem_filler: str = '' # mem_filler
+    mem_accno: str = '' # mem_accno
+    mem_filler1: str = '' # mem_filler1
+    ordacpttm: str = '' # 매칭접수시간
+    qty: int = 0 # 실정정취소수량
+    autogb: str = '' # 자동취소구분
+    rejcode: str = '' # 거부사유
+    prgordde: str = '' # 프로그램호가신고
+
+
+
+# 선물주문정정취소 
+class H01(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[H01OutBlock] = msgspec.field(default=None, name='H01OutBlock')
+# endregion
@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <JC0 - 주식선물체결(JC0)>
+class JC0InBlock(msgspec.Struct, frozen=True, gc=False):
+    futcode: str = '' # 단축코드
+
+
+class JC0OutBlock(msgspec.Struct, frozen=True, gc=False):
+    futcode: str = '' # 단축코드
+    chetime: str = '' # 체결시간
+    sign: str = '' # 대비기호
+    change: int = 0 # 전일대비
+    drate: float = 0.0 # 등락율
+    price: int = 0 # 현재가
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    cgubun: str = '' # 체결구분
+    cvolume: int = 0 # 체결량
+    volume: int = 0 # 누적거래량
+    value: int = 0 # 누적거래대금
+    mdvolume: int = 0 # 매도누적체결량
+    mdchecnt: int = 0 # 매도누적체결건수
+    msvolume: int = 0 # 매수누적체결량
+    mschecnt: int = 0 # 매수누적체결건수
+    cpower: float = 0.0 # 체결강도
+    offerho1: int = 0 # 매도호가1
+    bidho1: int = 0 # 매수호가1
+    openyak: int = 0 # 미결제약정수량
+    k200jisu: float = 0.0 # KOSPI200지수
+    theoryprice: int = 0 # 이론가
+    kasis: float = 0.0 # 괴리율
+    sbasis: int = 0 # 시장BASIS
+    ibasis: int = 0 # 이론BASIS
+    openyakcha: int = 0 # 미결제약정증감
+    jgubun: str = '' # 장운영정보
+    jnilvolume: int = 0 # 전일동시간대거래량
+    basprice: int = 0 # 기초자산현재가
+
+
+
+# 주식선물체결(JC0) 
+class JC0(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[JC0OutBlock] = msgspec.field(default=None, name='JC0OutBlock')
+# endregion
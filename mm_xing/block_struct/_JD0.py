@@ -0,0 +1,27 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <JD0 - 주식선물실시간상하한가(JD0)>
+class JD0InBlock(msgspec.Struct, frozen=True, gc=False):
+    futcode: str = '' # 단축코드
+
+
+class JD0OutBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 접속매매여부
+    dy_gubun: str = '' # 실시간가격제한여부
+    dy_uplmtprice: int = 0 # 실시간상한가
+    dy_dnlmtprice: int = 0 # 실시간하한가
+    futcode: str = '' # 단축코드
+
+
+
+# 주식선물실시간상하한가(JD0) 
+class JD0(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[JD0OutBlock] = msgspec.field(default=None, name='JD0OutBlock')
+# endregion
@@ -0,0 +1,90 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <JH0 - 주식선물호가(JH0)>
+class JH0InBlock(msgspec.Struct, frozen=True, gc=False):
+    futcode: str = '' # 단축코드
+
+
+class JH0OutBlock(msgspec.Struct, frozen=True, gc=False):
+    futcode: str = '' # 단축코드
+    hotime: str = '' # 호가시간
+    offerho1: int = 0 # 매도호가1
+    bidho1: int = 0 # 매수호가1
+    offerrem1: int = 0 # 매도호가수량1
+    bidrem1: int = 0 # 매수호가수량1
+    offercnt1: int = 0 # 매도호가건수1
+    bidcnt1: int = 0 # 매수호가건수1
+    offerho2: int = 0 # 매도호가2
+    bidho2: int = 0 # 매수호가2
+    offerrem2: int = 0 # 매도호가수량2
+    bidrem2: int = 0 # 매수호가수량2
+    offercnt2: int = 0 # 매도호가건수2
+    bidcnt2: int = 0 # 매수호가건수2
+    offerho3: int = 0 # 매도호가3
+    bidho3: int = 0 # 매수호가3
+    offerrem3: int = 0 # 매도호가수량3
+    bidrem3: int = 0 # 매수호가수량3
+    offercnt3: int = 0 # 매도호가건수3
+    bidcnt3: int = 0 # 매수호가건수3
+    offerho4: int = 0 # 매도호가4
+    bidho4: int = 0 # 매수호가4
+    offerrem4: int = 0 # 매도호가수량4
+    bidrem4: int = 0 # 매수호가수량4
+    offercnt4: int = 0 # 매도호가건수4
+    bidcnt4: int = 0 # 매수호가건수4
+    offerho5: int = 0 # 매도호가5
+    bidho5: int = 0 # 매수호가5
+    offerrem5: int = 0 # 매도호가수량5
+    bidrem5: int = 0 # 매수호가수량5
+    offercnt5: int = 0 # 매도호가건수5
+    bidcnt5: int = 0 # 매수호가건수5
+    offerho6: int = 0 # 매도호가6
+    bidho6: int = 0 # 매수호가6
+    offerrem6: int = 0 # 매도호가수량6
+    bidrem6: int = 0 # 매수호가수량6
+    offercnt6: int = 0 # 매도호가건수6
+    bidcnt6: int = 0 # 매수호가건수6
+    offerho7: int = 0 # 매도호가7
+    bidho7: int = 0 # 매수호가7
+    offerrem7: int = 0 # 매도호가수량7
+    bidrem7: int = 0 # 매수호가수량7
+    offercnt7: int = 0 # 매도호가건수7
+    bidcnt7: int = 0 # 매수호가건수7
+    offerho8: int = 0 # 매도호가8
+    bidho8: int = 0 # 매수호가8
+    offerrem8: int = 0 # 매도호가수량8
+    bidrem8: int = 0 # 매수호가수량8
+    offercnt8: int = 0 # 매도호가건수8
+    bidcnt8: int = 0 # 매수호가건수8
+    offerho9: int = 0 # 매도호가9
+    bidho9: int = 0 # 매수호가9
+    offerrem9: int = 0 # 매도호가수량9
+    bidrem9: int = 0 # 매수호가수량9
+    offercnt9: int = 0 # 매도호가건수9
+    bidcnt9: int = 0 # 매수호가건수9
+    offerho10: int = 0 # 매도호가10
+    bidho10: int = 0 # 매수호가10
+    offerrem10: int = 0 # 매도호가수량10
+    bidrem10: int = 0 # 매수호가수량10
+    offercnt10: int = 0 # 매도호가건수10
+    bidcnt10: int = 0 # 매수호가건수10
+    totofferrem: int = 0 # 매도호가총수량
+    totbidrem: int = 0 # 매수호가총수량
+    totoffercnt: int = 0 # 매도호가총건수
+    totbidcnt: int = 0 # 매수호가총건수
+    danhochk: str = '' # 단일가호가여부
+    alloc_gubun: str = '' # 배분적용구분
+
+
+
+# 주식선물호가(JH0) 
+class JH0(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[JH0OutBlock] = msgspec.field(default=None, name='JH0OutBlock')
+# endregion
@@ -0,0 +1,24 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <JIF - 장운영정보(JIF)>
+class JIFInBlock(msgspec.Struct, frozen=True, gc=False):
+    jangubun: str = '' # 장구분
+
+
+class JIFOutBlock(msgspec.Struct, frozen=True, gc=False):
+    jangubun: str = '' # 장구분
+    jstatus: str = '' # 장상태
+
+
+
+# 장운영정보(JIF) 
+class JIF(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[JIFOutBlock] = msgspec.field(default=None, name='JIFOutBlock')
+# endregion
@@ -0,0 +1,40 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <MK2 - US지수(MK2)>
+class MK2InBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 심볼코드
+
+
+class MK2OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    time: str = '' # 시간
+    kodate: str = '' # 한국일자
+    kotime: str = '' # 한국시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    uprate: float = 0.0 # 등락율
+    bidho: float = 0.0 # 매수호가
+    bidrem: int = 0 # 매수잔량
+    offerho: float = 0.0 # 매도호가
+    offerrem: int = 0 # 매도잔량
+    volume: float = 0.0 # 누적거래량
+    xsymbol: str = '' # 심벌
+    cvolume: float = 0.0 # 체결거래량
+
+
+
+# US지수(MK2) 
+class MK2(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[MK2OutBlock] = msgspec.field(default=None, name='MK2OutBlock')
+# endregion
@@ -0,0 +1,41 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <MMDAQ91200 - 파생상품증거금율조회>
+class MMDAQ91200InBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    IsuLgclssCode: str = '' # 종목대분류코드
+    IsuMdclssCode: str = '' # 종목중분류코드
+
+
+class MMDAQ91200OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    RecCnt: int = 0 # 레코드갯수
+    IsuLgclssCode: str = '' # 종목대분류코드
+    IsuMdclssCode: str = '' # 종목중분류코드
+
+
+class MMDAQ91200OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    IsuSmclssCode: str = '' # 종목소분류코드
+    IsuMdclssCode: str = '' # 종목중분류코드
+    IsuLrgMdclssNm: str = '' # 종목대중분류명
+    IsuLrgMidSmclssNm: str = '' # 종목대중소분류명
+    ShtnHanglIsuNm: str = '' # 단축한글종목명
+    CsgnMgnrt: float = 0.0 # 위탁증거금율
+    MaintMgnrt: float = 0.0 # 유지증거금율
+    MnyMgnrt: float = 0.0 # 현금증거금율
+    RmndDays: int = 0 # 잔여일수
+    OnePrcntrOrdMgn: int = 0 # 1계약당주문증거금
+
+
+
+# 파생상품증거금율조회 
+class MMDAQ91200(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[MMDAQ91200OutBlock1] = msgspec.field(default=None, name='MMDAQ91200OutBlock1')
+    outblock2: Optional[List[MMDAQ91200OutBlock2]] = msgspec.field(default=None, name='MMDAQ91200OutBlock2')
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <NWS - 실시간 뉴스 제목 패킷(NWS)>
+class NWSInBlock(msgspec.Struct, frozen=True, gc=False):
+    nwcode: str = '' # 뉴스코드
+
+
+class NWSOutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    time: str = '' # 시간
+    id: str = '' # 뉴스구분자
+    realkey: str = '' # 키값
+    title: str = '' # 제목
+    code: str = '' # 단축종목코드
+    bodysize: int = 0 # BODY길이
+
+
+
+# 실시간 뉴스 제목 패킷(NWS) 
+class NWS(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[NWSOutBlock] = msgspec.field(default=None, name='NWSOutBlock')
+# endregion
@@ -0,0 +1,137 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <O01 - 선물접수>
+class O01OutBlock(msgspec.Struct, frozen=True, gc=False):
+    lineseq: int = 0 # 라인일련번호
+    accno: str = '' # 계좌번호
+    user: str = '' # 조작자ID
+    len: int = 0 # 헤더길이
+    gubun: str = '' # 헤더구분
+    compress: str = '' # 압축구분
+    encrypt: str = '' # 암호구분
+    offset: int = 0 # 공통시작지점
+    trcode: str = '' # TRCODE
+    comid: str = '' # 이용사번호
+    userid: str = '' # 사용자ID
+    media: str = '' # 접속매체
+    ifid: str = '' # I/F일련번호
+    seq: str = '' # 전문일련번호
+    trid: str = '' # TR추적ID
+    pubip: str = '' # 공인IP
+    prvip: str = '' # 사설IP
+    pcbpno: str = '' # 처리지점번호
+    bpno: str = '' # 지점번호
+    termno: str = '' # 단말번호
+    lang: str = '' # 언어구분
+    proctm: int = 0 # AP처리시간
+    msgcode: str = '' # 메세지코드
+    outgu: str = '' # 메세지출력구분
+    compreq: str = '' # 압축요청구분
+    funckey: str = '' # 기능키
+    reqcnt: int = 0 # 요청레코드개수
+    filler: str = '' # 예비영역
+    cont: str = '' # 연속구분
+    contkey: str = '' # 연속키값
+    varlen: int = 0 # 가변시스템길이
+    varhdlen: int = 0 # 가변해더길이
+    varmsglen: int = 0 # 가변메시지길이
+    trsrc: str = '' # 조회발원지
+    eventid: str = '' # I/F이벤트ID
+    ifinfo: str = '' # I/F정보
+    filler1: str = '' # 예비영역
+    trcode1: str = '' # tr코드
+    firmno: str = '' # 회사번호
+    acntno: str = '' # 계좌번호
+    acntno1: str = '' # 계좌번호
+    acntnm: str = '' # 계좌명
+    brnno: str = '' # 지점번호
+    ordmktcode: str = '' # 주문시장코드
+    ordno1: str = '' # 주문번호
+    ordno: int = 0 # 주문번호
+    orgordno1: str = '' # 원주문번호
+    orgordno: int = 0 # 원주문번호
+    prntordno: str = '' # 모주문번호
+    prntordno1: int = 0 # 모주문번호
+    isuno: str = '' # 종목번호
+    fnoIsuno: str = '' # 선물옵션종목번호
+    fnoIsunm: str = '' # 선물옵션종목명
+    pdgrpcode: str = '' # 상품군분류코드
+    fnoIsuptntp: str = '' # 선물옵션종목유형구분
+    bnstp: str = '' # 매매구분
+    mrctp: str = '' # 정정취소구분
+    ordqty: int = 0 # 주문수량
+    hogatype: str = '' # 호가유형코드
+    mmgb: str = '' # 거래유형코드
+    ordprc: float = 0.0 # 주문가격
+    unercqty: int = 0 # 미체결수량
+    commdacode: str = '' # 통신매체
+    peeamtcode: str = '' # 수수료합산코드
+    mgempno: str = '' # 관리사원
+    fnotrdunitamt: float = 0.0 # 선물옵션거래단위금액
+    trxtime: str = '' # 처리시각
+    strtgcode: str = '' # 전략코드
+    grpId: str = '' # 그룹Id
+    ordseqno: str = '' # 주문회차
+    ptflno: str = '' # 포트폴리오 번호
+    bskno: str = '' # 바스켓번호
+    trchno: str = '' # 트렌치번호
+    Itemno: str = '' # 아이템번호
+    userId: str = '' # 주문자Id
+    opdrtnno: str = '' # 운영지시번호
+    rjtcode: str = '' # 부적격코드
+    mrccnfqty: int = 0 # 정정취소확인수량
+    orgordunercqty: int = 0 # 원주문미체결수량
+    orgordmrcqty: int = 0 # 원주문정정취소수량
+    ctrcttime: str = '' # 약정시각(체결시각)
+    ctrctno: str = '' # 약정번호
+    execprc: float = 0.0 # 체결가격
+    execqty: int = 0 # 체결수량
+    newqty: int = 0 # 신규체결수량
+    qdtqty: int = 0 # 청산체결수량
+    lastqty: int = 0 # 최종결제수량
+    lallexecqty: int = 0 # 전체체결수량
+    allexecamt: int = 0 # 전체체결금액
+    fnobalevaltp: str = '' # 잔고평가구분
+    bnsplamt: int = 0 # 매매손익금액
+    fnoIsuno1: str = '' # 선물옵션종목번호1
+    bnstp1: str = '' # 매매구분1
+    execprc1: float = 0.0 # 체결가1
+    newqty1: int = 0 # 신규체결수량1
+    qdtqty1: int = 0 # 청산체결수량1
+    allexecamt1: int = 0 # 전체체결금액1
+    fnoIsuno2: str = '' # 선물옵션종목번호2
+    bnstp2: str = '' # 매매구분2
+    execprc2: float = 0.0 # 체결가2
+    newqty2: int = 0 # 신규체결수량2
+    lqdtqty2: int = 0 # 청산체결수량2
+    allexecamt2: int = 0 # 전체체결금액2
+    dps: int = 0 # 예수금
+    ftsubtdsgnamt: int = 0 # 선물대용지정금액
+    mgn: int = 0 # 증거금
+    mnymgn: int = 0 # 증거금현금
+    ordableamt: int = 0 # 주문가능금액
+    mnyordableamt: int = 0 # 주문가능현금액
+    fnoIsuno_1: str = '' # 잔고 종목번호1
+    bnstp_1: str = '' # 잔고 매매구분1
+    unsttqty_1: int = 0 # 미결제수량1
+    lqdtableqty_1: int = 0 # 주문가능수량1
+    avrprc_1: float = 0.0 # 평균가1
+    fnoIsuno_2: str = '' # 잔고 종목번호2
+    bnstp_2: str = '' # 잔고 매매구분2
+    unsttqty_2: int = 0 # 미결제수량2
+    lqdtableqty_2: int = 0 # 주문가능수량2
+    avrprc_2: float = 0.0 # 평균가2
+
+
+
+# 선물접수 
+class O01(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[O01OutBlock] = msgspec.field(default=None, name='O01OutBlock')
+# endregion
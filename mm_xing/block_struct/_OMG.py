@@ -0,0 +1,39 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <OMG - KOSPI200옵션민감도(MG)>
+class OMGInBlock(msgspec.Struct, frozen=True, gc=False):
+    optcode: str = '' # 옵션코드
+
+
+class OMGOutBlock(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 체결시간
+    actprice: float = 0.0 # 행사가
+    k200jisu: float = 0.0 # KOSPI200지수
+    fut200jisu: float = 0.0 # 선물가격
+    price: float = 0.0 # 현재가
+    capimpv: float = 0.0 # 대표내재변동성
+    impv: float = 0.0 # 내재변동성
+    delt: float = 0.0 # 델타(블랙숄즈)
+    gama: float = 0.0 # 감마(블랙숄즈)
+    ceta: float = 0.0 # 세타(블랙숄즈)
+    vega: float = 0.0 # 베가(블랙숄즈)
+    rhox: float = 0.0 # 로우(블랙숄즈)
+    theoryprice: float = 0.0 # 이론가(블랙숄즈)
+    bimpv: float = 0.0 # 전일가내재변동성
+    offerimpv: float = 0.0 # 매도가내재변동성
+    bidimpv: float = 0.0 # 매수가내재변동성
+    optcode: str = '' # 옵션코드
+
+
+
+# KOSPI200옵션민감도(MG) 
+class OMG(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[OMGOutBlock] = msgspec.field(default=None, name='OMGOutBlock')
+# endregion
@@ -0,0 +1,40 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <OVC - 해외선물 현재가체결(OVC)>
+class OVCInBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 종목코드
+
+
+class OVCOutBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 종목코드
+    ovsdate: str = '' # 체결일자(현지)
+    kordate: str = '' # 체결일자(한국)
+    trdtm: str = '' # 체결시간(현지)
+    kortm: str = '' # 체결시간(한국)
+    curpr: float = 0.0 # 체결가격
+    ydiffpr: float = 0.0 # 전일대비
+    ydiffSign: str = '' # 전일대비기호
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    chgrate: float = 0.0 # 등락율
+    trdq: int = 0 # 건별체결수량
+    totq: str = '' # 누적체결수량
+    cgubun: str = '' # 체결구분
+    mdvolume: str = '' # 매도누적체결수량
+    msvolume: str = '' # 매수누적체결수량
+    ovsmkend: str = '' # 장마감일
+
+
+
+# 해외선물 현재가체결(OVC) 
+class OVC(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[OVCOutBlock] = msgspec.field(default=None, name='OVCOutBlock')
+# endregion
@@ -0,0 +1,27 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <OX0 - KOSPI200옵션가격제한폭확대(X0)>
+class OX0InBlock(msgspec.Struct, frozen=True, gc=False):
+    optcode: str = '' # 단축코드
+
+
+class OX0OutBlock(msgspec.Struct, frozen=True, gc=False):
+    upstep: str = '' # 적용 상한단계
+    dnstep: str = '' # 적용 하한단계
+    uplmtprice: float = 0.0 # 적용 상한가
+    dnlmtprice: float = 0.0 # 적용 하한가
+    opttcode: str = '' # 단축코드
+
+
+
+# KOSPI200옵션가격제한폭확대(X0) 
+class OX0(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[OX0OutBlock] = msgspec.field(default=None, name='OX0OutBlock')
+# endregion
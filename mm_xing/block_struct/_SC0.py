@@ -0,0 +1,131 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <SC0 - 주식주문접수>
+class SC0OutBlock(msgspec.Struct, frozen=True, gc=False):
+    lineseq: int = 0 # 라인일련번호
+    accno: str = '' # 계좌번호
+    user: str = '' # 조작자ID
+    len: int = 0 # 헤더길이
+    gubun: str = '' # 헤더구분
+    compress: str = '' # 압축구분
+    encrypt: str = '' # 암호구분
+    offset: int = 0 # 공통시작지점
+    trcode: str = '' # TRCODE
+    comid: str = '' # 이용사번호
+    userid: str = '' # 사용자ID
+    media: str = '' # 접속매체
+    ifid: str = '' # I/F일련번호
+    seq: str = '' # 전문일련번호
+    trid: str = '' # TR추적ID
+    pubip: str = '' # 공인IP
+    prvip: str = '' # 사설IP
+    pcbpno: str = '' # 처리지점번호
+    bpno: str = '' # 지점번호
+    termno: str = '' # 단말번호
+    lang: str = '' # 언어구분
+    proctm: int = 0 # AP처리시간
+    msgcode: str = '' # 메세지코드
+    outgu: str = '' # 메세지출력구분
+    compreq: str = '' # 압축요청구분
+    funckey: str = '' # 기능키
+    reqcnt: int = 0 # 요청레코드개수
+    filler: str = '' # 예비영역
+    cont: str = '' # 연속구분
+    contkey: str = '' # 연속키값
+    varlen: int = 0 # 가변시스템길이
+    varhdlen: int = 0 # 가변해더길이
+    varmsglen: int = 0 # 가변메시지길이
+    trsrc: str = '' # 조회발원지
+    eventid: str = '' # I/F이벤트ID
+    ifinfo: str = '' # I/F정보
+    filler1: str = '' # 예비영역
+    ordchegb: str = '' # 주문체결구분
+    marketgb: str = '' # 시장구분
+    ordgb: str = '' # 주문구분
+    orgordno: int = 0 # 원주문번호
+    accno1: str = '' # 계좌번호
+    accno2: str = '' # 계좌번호
+    passwd: str = '' # 비밀번호
+    expcode: str = '' # 종목번호
+    shtcode: str = '' # 단축종목번호
+    hname: str = '' # 종목명
+    ordqty: int = 0 # 주문수량
+    ordprice: int = 0 # 주문가격
+    hogagb: str = '' # 주문조건
+    etfhogagb: str = '' # 호가유형코드
+    pgmtype: int = 0 # 프로그램호가구분
+    gmhogagb: int = 0 # 공매도호가구분
+    gmhogayn: int = 0 # 공매도가능여부
+    singb: str = '' # 신용구분
+    loandt: str = '' # 대출일
+    cvrgordtp: str = '' # 반대매매주문구분
+    strtgcode: str = '' # 전략코드
+    groupid: str = '' # 그룹ID
+    ordseqno: int = 0 # 주문회차
+    prtno: int = 0 # 포트폴리오번호
+    basketno: int = 0 # 바스켓번호
+    trchno: int = 0 # 트렌치번호
+    itemno: int = 0 # 아아템번호
+    brwmgmyn: int = 0 # 차입구분
+    mbrno: int = 0 # 회원사번호
+    procgb: str = '' # 처리구분
+    admbrchno: str = '' # 관리지점번호
+    futaccno: str = '' # 선물계좌번호
+    futmarketgb: str = '' # 선물상품구분
+    tongsingb: str = '' # 통신매체구분
+    lpgb: str = '' # 유동성공급자구분
+    dummy: str = '' # DUMMY
+    ordno: int = 0 # 주문번호
+    ordtm: str = '' # 주문시각
+    prntordno: int = 0 # 모주문번호
+    mgempno: str = '' # 관리사원번호
+    orgordundrqty: int = 0 # 원주문미체결수량
+    orgordmdfyqty: int = 0 # 원주문정정수량
+    ordordcancelqty: int = 0 # 원주문취소수량
+    nmcpysndno: int = 0 # 비회원사송신번호
+    ordamt: int = 0 # 주문금액
+    bnstp: str = '' # 매매구분
+    spareordno: int = 0 # 예비주문번호
+    cvrgseqno: int = 0 # 반대매매일련번호
+    rsvordno: int = 0 # 예약주문번호
+    mtordseqno: int = 0 # 복수주문일련번호
+    spareordqty: int = 0 # 예비주문수량
+    orduserid: str = '' # 주문사원번호
+    spotordqty: int = 0 # 실물주문수량
+    ordruseqty: int = 0 # 재사용주문수량
+    mnyordamt: int = 0 # 현금주문금액
+    ordsubstamt: int = 0 # 주문대용금액
+    ruseordamt: int = 0 # 재사용주문금액
+    ordcmsnamt: int = 0 # 수수료주문금액
+    crdtuseamt: int = 0 # 사용신용담보재사용금
+    secbalqty: int = 0 # 잔고수량
+    spotordableqty: int = 0 # 실물가능수량
+    ordableruseqty: int = 0 # 재사용가능수량(매도)
+    flctqty: int = 0 # 변동수량
+    secbalqtyd2: int = 0 # 잔고수량(D2)
+    sellableqty: int = 0 # 매도주문가능수량
+    unercsellordqty: int = 0 # 미체결매도주문수량
+    avrpchsprc: int = 0 # 평균매입가
+    pchsamt: int = 0 # 매입금액
+    deposit: int = 0 # 예수금
+    substamt: int = 0 # 대용금
+    csgnmnymgn: int = 0 # 위탁증거금현금
+    csgnsubstmgn: int = 0 # 위탁증거금대용
+    crdtpldgruseamt: int = 0 # 신용담보재사용금
+    ordablemny: int = 0 # 주문가능현금
+    ordablesubstamt: int = 0 # 주문가능대용
+    ruseableamt: int = 0 # 재사용가능금액
+
+
+
+# 주식주문접수 
+class SC0(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[SC0OutBlock] = msgspec.field(default=None, name='SC0OutBlock')
+# endregion
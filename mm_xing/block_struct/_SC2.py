@@ -0,0 +1,148 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <SC2 - 주식주문정정>
+class SC2OutBlock(msgspec.Struct, frozen=True, gc=False):
+    lineseq: int = 0 # 라인일련번호
+    accno: str = '' # 계좌번호
+    user: str = '' # 조작자ID
+    len: int = 0 # 헤더길이
+    gubun: str = '' # 헤더구분
+    compress: str = '' # 압축구분
+    encrypt: str = '' # 암호구분
+    offset: int = 0 # 공통시작지점
+    trcode: str = '' # TRCODE
+    comid: str = '' # 이용사번호
+    userid: str = '' # 사용자ID
+    media: str = '' # 접속매체
+    ifid: str = '' # I/F일련번호
+    seq: str = '' # 전문일련번호
+    trid: str = '' # TR추적ID
+    pubip: str = '' # 공인IP
+    prvip: str = '' # 사설IP
+    pcbpno: str = '' # 처리지점번호
+    bpno: str = '' # 지점번호
+    termno: str = '' # 단말번호
+    lang: str = '' # 언어구분
+    proctm: int = 0 # AP처리시간
+    msgcode: str = '' # 메세지코드
+    outgu: str = '' # 메세지출력구분
+    compreq: str = '' # 압축요청구분
+    funckey: str = '' # 기능키
+    reqcnt: int = 0 # 요청레코드개수
+    filler: str = '' # 예비영역
+    cont: str = '' # 연속구분
+    contkey: str = '' # 연속키값
+    varlen: int = 0 # 가변시스템길이
+    varhdlen: int = 0 # 가변해더길이
+    varmsglen: int = 0 # 가변메시지길이
+    trsrc: str = '' # 조회발원지
+    eventid: str = '' # I/F이벤트ID
+    ifinfo: str = '' # I/F정보
+    filler1: str = '' # 예비영역
+    ordxctptncode: str = '' # 주문체결유형코드
+    ordmktcode: str = '' # 주문시장코드
+    ordptncode: str = '' # 주문유형코드
+    mgmtbrnno: str = '' # 관리지점번호
+    accno1: str = '' # 계좌번호
+    accno2: str = '' # 계좌번호
+    acntnm: str = '' # 계좌명
+    Isuno: str = '' # 종목번호
+    Isunm: str = '' # 종목명
+    ordno: int = 0 # 주문번호
+    orgordno: int = 0 # 원주문번호
+    execno: int = 0 # 체결번호
+    ordqty: int = 0 # 주문수량
+    ordprc: int = 0 # 주문가격
+    execqty: int = 0 # 체결수량
+    execprc: int = 0 # 체결가격
+    mdfycnfqty: int = 0 # 정정확인수량
+    mdfycnfprc: int = 0 # 정정확인가격
+    canccnfqty: int = 0 # 취소확인수량
+    rjtqty: int = 0 # 거부수량
+    ordtrxptncode: int = 0 # 주문처리유형코드
+    mtiordseqno: int = 0 # 복수주문일련번호
+    ordcndi: str = '' # 주문조건
+    ordprcptncode: str = '' # 호가유형코드
+    nsavtrdqty: int = 0 # 비저축체결수량
+    shtnIsuno: str = '' # 단축종목번호
+    opdrtnno: str = '' # 운용지시번호
+    cvrgordtp: str = '' # 반대매매주문구분
+    unercqty: int = 0 # 미체결수량(주문)
+    orgordunercqty: int = 0 # 원주문미체결수량
+    orgordmdfyqty: int = 0 # 원주문정정수량
+    orgordcancqty: int = 0 # 원주문취소수량
+    ordavrexecprc: int = 0 # 주문평균체결가격
+    ordamt: int = 0 # 주문금액
+    stdIsuno: str = '' # 표준종목번호
+    bfstdIsuno: str = '' # 전표준종목번호
+    bnstp: str = '' # 매매구분
+    ordtrdptncode: str = '' # 주문거래유형코드
+    mgntrncode: str = '' # 신용거래코드
+    adduptp: str = '' # 수수료합산코드
+    commdacode: str = '' # 통신매체코드
+    Loandt: str = '' # 대출일
+    mbrnmbrno: int = 0 # 회원/비회원사번호
+    ordacntno: str = '' # 주문계좌번호
+    agrgbrnno: str = '' # 집계지점번호
+    mgempno: str = '' # 관리사원번호
+    futsLnkbrnno: str = '' # 선물연계지점번호
+    futsLnkacntno: str = '' # 선물연계계좌번호
+    futsmkttp: str = '' # 선물시장구분
+    regmktcode: str = '' # 등록시장코드
+    mnymgnrat: int = 0 # 현금증거금률
+    substmgnrat: int = 0 # 대용증거금률
+    mnyexecamt: int = 0 # 현금체결금액
+    ubstexecamt: int = 0 # 대용체결금액
+    cmsnamtexecamt: int = 0 # 수수료체결금액
+    crdtpldgexecamt: int = 0 # 신용담보체결금액
+    crdtexecamt: int = 0 # 신용체결금액
+    prdayruseexecval: int = 0 # 전일재사용체결금액
+    crdayruseexecval: int = 0 # 금일재사용체결금액
+    spotexecqty: int = 0 # 실물체결수량
+    stslexecqty: int = 0 # 공매도체결수량
+    strtgcode: str = '' # 전략코드
+    grpId: str = '' # 그룹Id
+    ordseqno: int = 0 # 주문회차
+    ptflno: int = 0 # 포트폴리오번호
+    bskno: int = 0 # 바스켓번호
+    trchno: int = 0 # 트렌치번호
+    itemno: int = 0 # 아이템번호
+    orduserId: str = '' # 주문자Id
+    brwmgmtYn: int = 0 # 차입관리여부
+    frgrunqno: str = '' # 외국인고유번호
+    trtzxLevytp: str = '' # 거래세징수구분
+    lptp: str = '' # 유동성공급자구분
+    exectime: str = '' # 체결시각
+    rcptexectime: str = '' # 거래소수신체결시각
+    rmndLoanamt: int = 0 # 잔여대출금액
+    secbalqty: int = 0 # 잔고수량
+    spotordableqty: int = 0 # 실물가능수량
+    ordableruseqty: int = 0 # 재사용가능수량(매도)
+    flctqty: int = 0 # 변동수량
+    secbalqtyd2: int = 0 # 잔고수량(d2)
+    sellableqty: int = 0 # 매도주문가능수량
+    unercsellordqty: int = 0 # 미체결매도주문수량
+    avrpchsprc: int = 0 # 평균매입가
+    pchsant: int = 0 # 매입금액
+    deposit: int = 0 # 예수금
+    substamt: int = 0 # 대용금
+    csgnmnymgn: int = 0 # 위탁증거금현금
+    csgnsubstmgn: int = 0 # 위탁증거금대용
+    crdtpldgruseamt: int = 0 # 신용담보재사용금
+    ordablemny: int = 0 # 주문가능현금
+    ordablesubstamt: int = 0 # 주문가능대용
+    ruseableamt: int = 0 # 재사용가능금액
+
+
+
+# 주식주문정정 
+class SC2(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[SC2OutBlock] = msgspec.field(default=None, name='SC2OutBlock')
+# endregion
@@ -0,0 +1,42 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <SHI - 상/하한가진입(SHI)>
+class SHIInBlock(msgspec.Struct, frozen=True, gc=False):
+    updnlmtgubun: str = '' # 상/하한구분
+
+
+class SHIOutBlock(msgspec.Struct, frozen=True, gc=False):
+    sijanggubun: str = '' # 거래소/코스닥구분
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    drate: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    volincrate: float = 0.0 # 거래증가율
+    totofferrem: int = 0 # 매도호가총수량
+    totbidrem: int = 0 # 매수호가총수량
+    updnlmtstime: str = '' # 상한가/하한가최종진입시간
+    updnlmtdaycnt: int = 0 # 상한가/하한가연속일수
+    jnilvolume: int = 0 # 전일거래량
+    shcode: str = '' # 단축코드
+    gwangubun: str = '' # 관리구분
+    undergubun: str = '' # 이상급등구분
+    tgubun: str = '' # 투자유의구분
+    wgubun: str = '' # 우선주구분
+    dishonest: str = '' # 불성실구분
+    jkrate: str = '' # 증거금률
+
+
+
+# 상/하한가진입(SHI) 
+class SHI(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[SHIOutBlock] = msgspec.field(default=None, name='SHIOutBlock')
+# endregion
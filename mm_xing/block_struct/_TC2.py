@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <TC2 - 해외선물응답>
+class TC2OutBlock(msgspec.Struct, frozen=True, gc=False):
+    lineseq: int = 0 # 라인일련번호
+    key: str = '' # KEY
+    user: str = '' # 조작자ID
+    svc_id: str = '' # 서비스ID
+    ordr_dt: str = '' # 주문일자
+    brn_cd: str = '' # 지점번호
+    ordr_no: int = 0 # 주문번호
+    orgn_ordr_no: int = 0 # 원주문번호
+    mthr_ordr_no: int = 0 # 모주문번호
+    ac_no: str = '' # 계좌번호
+    is_cd: str = '' # 종목코드
+    s_b_ccd: str = '' # 매도매수유형
+    ordr_ccd: str = '' # 정정취소유형
+    ordr_typ_cd: str = '' # 주문유형코드
+    ordr_typ_prd_ccd: str = '' # 주문기간코드
+    ordr_aplc_strt_dt: str = '' # 주문적용시작일자
+    ordr_aplc_end_dt: str = '' # 주문적용종료일자
+    ordr_prc: float = 0.0 # 주문가격
+    cndt_ordr_prc: float = 0.0 # 주문조건가격
+    ordr_q: int = 0 # 주문수량
+    ordr_tm: str = '' # 주문시간
+    cnfr_q: int = 0 # 호가확인수량
+    rfsl_cd: str = '' # 호가거부사유코드
+    text: str = '' # 호가거부사유코드명
+    user_id: str = '' # 사용자ID
+
+
+
+# 해외선물응답 
+class TC2(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[TC2OutBlock] = msgspec.field(default=None, name='TC2OutBlock')
+# endregion
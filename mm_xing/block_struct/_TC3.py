@@ -0,0 +1,55 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <TC3 - 해외선물체결>
+class TC3OutBlock(msgspec.Struct, frozen=True, gc=False):
+    lineseq: int = 0 # 라인일련번호
+    key: str = '' # KEY
+    user: str = '' # 조작자ID
+    svc_id: str = '' # 서비스ID
+    ordr_dt: str = '' # 주문일자
+    brn_cd: str = '' # 지점번호
+    ordr_no: int = 0 # 주문번호
+    orgn_ordr_no: int = 0 # 원주문번호
+    mthr_ordr_no: int = 0 # 모주문번호
+    ac_no: str = '' # 계좌번호
+    is_cd: str = '' # 종목코드
+    s_b_ccd: str = '' # 매도매수유형
+    ordr_ccd: str = '' # 정정취소유형
+    ccls_q: int = 0 # 체결수량
+    ccls_prc: float = 0.0 # 체결가격
+    ccls_no: str = '' # 체결번호
+    ccls_tm: str = '' # 체결시간
+    avg_byng_uprc: float = 0.0 # 매입평균단가
+    byug_amt: float = 0.0 # 매입금액
+    clr_pl_amt: float = 0.0 # 청산손익
+    ent_fee: float = 0.0 # 위탁수수료
+    fcm_fee: int = 0 # 매입잔고수량
+    userid: str = '' # 사용자ID
+    now_prc: float = 0.0 # 현재가격
+    crncy_cd: str = '' # 통화코드
+    mtrt_dt: str = '' # 만기일자
+    ord_prdt_tp_code: str = '' # 주문상품구분코드
+    exec_prdt_tp_code: str = '' # 주문상품구분코드
+    sprd_base_isu_yn: str = '' # 스프레드종목여부
+    ccls_dt: str = '' # 체결일자
+    filler2: str = '' # FILLER2
+    sprd_is_cd: str = '' # 스프레드종목코드
+    lme_prdt_ccd: str = '' # LME상품유형
+    lme_sprd_prc: float = 0.0 # LME스프레드가격
+    last_now_prc: float = 0.0 # 최종현재가격
+    bf_mtrt_dt: str = '' # 이전만기일자
+    clr_q: int = 0 # 청산수량
+
+
+
+# 해외선물체결 
+class TC3(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[TC3OutBlock] = msgspec.field(default=None, name='TC3OutBlock')
+# endregion
@@ -0,0 +1,58 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <WOH - 해외옵션 호가(WOH)>
+class WOHInBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 종목코드
+
+
+class WOHOutBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 종목코드
+    hotime: str = '' # 호가시간
+    offerho1: float = 0.0 # 매도호가 1
+    bidho1: float = 0.0 # 매수호가 1
+    offerrem1: int = 0 # 매도호가 잔량 1
+    bidrem1: int = 0 # 매수호가 잔량 1
+    offerno1: int = 0 # 매도호가 건수 1
+    bidno1: int = 0 # 매수호가 건수 1
+    offerho2: float = 0.0 # 매도호가 2
+    bidho2: float = 0.0 # 매수호가 2
+    offerrem2: int = 0 # 매도호가 잔량 2
+    bidrem2: int = 0 # 매수호가 잔량 2
+    offerno2: int = 0 # 매도호가 건수 2
+    bidno2: int = 0 # 매수호가 건수 2
+    offerho3: float = 0.0 # 매도호가 3
+    bidho3: float = 0.0 # 매수호가 3
+    offerrem3: int = 0 # 매도호가 잔량 3
+    bidrem3: int = 0 # 매수호가 잔량 3
+    offerno3: int = 0 # 매도호가 건수 3
+    bidno3: int = 0 # 매수호가 건수 3
+    offerho4: float = 0.0 # 매도호가 4
+    bidho4: float = 0.0 # 매수호가 4
+    offerrem4: int = 0 # 매도호가 잔량 4
+    bidrem4: int = 0 # 매수호가 잔량 4
+    offerno4: int = 0 # 매도호가 건수 4
+    bidno4: int = 0 # 매수호가 건수 4
+    offerho5: float = 0.0 # 매도호가 5
+    bidho5: float = 0.0 # 매수호가 5
+    offerrem5: int = 0 # 매도호가 잔량 5
+    bidrem5: int = 0 # 매수호가 잔량 5
+    offerno5: int = 0 # 매도호가 건수 5
+    bidno5: int = 0 # 매수호가 건수 5
+    totoffercnt: int = 0 # 매도호가총건수
+    totbidcnt: int = 0 # 매수호가총건수
+    totofferrem: int = 0 # 매도호가총수량
+    totbidrem: int = 0 # 매수호가총수량
+
+
+
+# 해외옵션 호가(WOH) 
+class WOH(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[WOHOutBlock] = msgspec.field(default=None, name='WOHOutBlock')
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <YC3 - 상품선물예상체결(YC3)>
+class YC3InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class YC3OutBlock(msgspec.Struct, frozen=True, gc=False):
+    ychetime: str = '' # 예상체결시간
+    yeprice: float = 0.0 # 예상체결가격
+    yevolume: int = 0 # 예상체결수량
+    jnilysign: str = '' # 예상체결가전일종가대비구분
+    jnilchange: float = 0.0 # 예상체결가전일종가대비
+    jnilydrate: float = 0.0 # 예상체결가전일종가등락율
+    shcode: str = '' # 단축코드
+
+
+
+# 상품선물예상체결(YC3) 
+class YC3(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[YC3OutBlock] = msgspec.field(default=None, name='YC3OutBlock')
+# endregion
@@ -0,0 +1,28 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <YFC - 지수선물예상체결(YFC)>
+class YFCInBlock(msgspec.Struct, frozen=True, gc=False):
+    futcode: str = '' # 단축코드
+
+
+class YFCOutBlock(msgspec.Struct, frozen=True, gc=False):
+    ychetime: str = '' # 예상체결시간
+    yeprice: float = 0.0 # 예상체결가격
+    jnilysign: str = '' # 예상체결가전일종가대비구분
+    jnilchange: float = 0.0 # 예상체결가전일종가대비
+    jnilydrate: float = 0.0 # 예상체결가전일종가등락율
+    futcode: str = '' # 단축코드
+
+
+
+# 지수선물예상체결(YFC) 
+class YFC(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[YFCOutBlock] = msgspec.field(default=None, name='YFCOutBlock')
+# endregion
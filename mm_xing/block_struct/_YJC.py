@@ -0,0 +1,28 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <YJC - 주식선물예상체결(YJC)>
+class YJCInBlock(msgspec.Struct, frozen=True, gc=False):
+    futcode: str = '' # 단축코드
+
+
+class YJCOutBlock(msgspec.Struct, frozen=True, gc=False):
+    ychetime: str = '' # 예상체결시간
+    yeprice: int = 0 # 예상체결가격
+    jnilysign: str = '' # 예상체결가전일종가대비구분
+    jnilchange: int = 0 # 예상체결가전일종가대비
+    jnilydrate: float = 0.0 # 예상체결가전일종가등락율
+    futcode: str = '' # 단축코드
+
+
+
+# 주식선물예상체결(YJC) 
+class YJC(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[YJCOutBlock] = msgspec.field(default=None, name='YJCOutBlock')
+# endregion
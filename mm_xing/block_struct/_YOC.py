@@ -0,0 +1,28 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <YOC - 지수옵션예상체결(YOC)>
+class YOCInBlock(msgspec.Struct, frozen=True, gc=False):
+    optcode: str = '' # 단축코드
+
+
+class YOCOutBlock(msgspec.Struct, frozen=True, gc=False):
+    ychetime: str = '' # 예상체결시간
+    yeprice: float = 0.0 # 예상체결가격
+    jnilysign: str = '' # 예상체결가전일종가대비구분
+    jnilchange: float = 0.0 # 예상체결가전일종가대비
+    jnilydrate: float = 0.0 # 예상체결가전일종가등락율
+    optcode: str = '' # 단축코드
+
+
+
+# 지수옵션예상체결(YOC) 
+class YOC(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[YOCOutBlock] = msgspec.field(default=None, name='YOCOutBlock')
+# endregion
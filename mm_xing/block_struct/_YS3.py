@@ -0,0 +1,33 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <YS3 - KOSPI예상체결(YS3)>
+class YS3InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class YS3OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hotime: str = '' # 호가시간
+    yeprice: int = 0 # 예상체결가격
+    yevolume: int = 0 # 예상체결수량
+    jnilysign: str = '' # 예상체결가전일종가대비구분
+    jnilchange: int = 0 # 예상체결가전일종가대비
+    jnilydrate: float = 0.0 # 예상체결가전일종가등락율
+    yofferho0: int = 0 # 예상매도호가
+    ybidho0: int = 0 # 예상매수호가
+    yofferrem0: int = 0 # 예상매도호가수량
+    ybidrem0: int = 0 # 예상매수호가수량
+    shcode: str = '' # 단축코드
+
+
+
+# KOSPI예상체결(YS3) 
+class YS3(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[YS3OutBlock] = msgspec.field(default=None, name='YS3OutBlock')
+# endregion
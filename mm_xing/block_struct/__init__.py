@@ -0,0 +1,28 @@
+"""Lazily-resolved registry of the Xing TR msgspec structs.
+
+msgspec counterpart of ``mm_xing.block`` generated by
+``res_converter.create_msgspec_model_for_rest``. The TR-level struct (e.g.
+``t8436``) mirrors the REST response envelope, so a raw response body decodes
+into typed OutBlock rows in a single ``msgspec.json.Decoder.decode`` call.
+"""
+from typing import Any
+
+from mm_xing.block_struct._index import BLOCK_INDEX, QUERY_DESC, QUERY_OUTBLOCK_MAP
+from mm_xing.commons import LazyQueryMap
+
+__all__ = ["QUERY_MAP", "QUERY_OUTBLOCK_MAP", "QUERY_DESC", "load_tr", "load_all"]
+
+QUERY_MAP = LazyQueryMap(__name__, QUERY_DESC, BLOCK_INDEX)
+load_tr = QUERY_MAP.load_tr
+load_all = QUERY_MAP.load_all
+
+
+def __getattr__(name: str) -> Any:
+    value = QUERY_MAP.resolve(name)
+    # Cache on the package so later lookups bypass __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(BLOCK_INDEX))
@@ -0,0 +1,1569 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:37:23.752290
+
+QUERY_DESC = {
+    'BMT': '시간대별투자자매매추이(BMT)',
+    'C01': '선물주문체결',
+    'CD0': '상품선물실시간상하한가(D0)',
+    'CDPCQ04700': '계좌 거래내역',
+    'CEXAQ21100': '유렉스 주문체결내역조회',
+    'CEXAQ21200': '유렉스 주문가능 수량/금액 조회',
+    'CEXAQ31100': '유렉스 야간장잔고및 평가현황',
+    'CEXAQ31200': '유렉스 예탁금 및 통합잔고조회',
+    'CEXAQ44200': 'EUREX 야간옵션 기간주문체결조회',
+    'CEXAT11100': '유렉스 매수/매도주문',
+    'CEXAT11200': '유렉스 정정주문',
+    'CEXAT11300': '유렉스 취소주문',
+    'CFOAQ00600': '선물옵션 계좌주문체결내역조회',
+    'CFOAQ10100': '선물옵션 주문가능수량조회',
+    'CFOAT00100': '선물옵션 정상주문',
+    'CFOAT00200': '선물옵션 정정주문',
+    'CFOAT00300': '선물옵션 취소주문',
+    'CFOBQ10500': '선물옵션 계좌예탁금증거금조회',
+    'CFOBQ10800': '선물옵션 옵션매도시 주문증거금조회',
+    'CFOEQ11100': '선물옵션가정산예탁금상세',
+    'CFOEQ82600': '선물옵션 일별 계좌손익내역',
+    'CFOFQ02400': '계좌 미결제 약정현황(평균가)',
+    'CIDBQ01400': '해외선물 체결내역개별 조회',
+    'CIDBQ01500': '해외선물 미결제 잔고내역',
+    'CIDBQ01800': '해외선물 주문체결내역 조회',
+    'CIDBQ02400': '해외선물 주문체결내역 상세 조회',
+    'CIDBQ03000': '해외선물 예수금/잔고현황',
+    'CIDBQ05300': '해외선물 계좌예탁자산조회',
+    'CIDBT00100': '해외선물신규주문',
+    'CIDBT00900': '해외선물정정주문',
+    'CIDBT01000': '해외선물취소주문',
+    'CIDEQ00800': '일자별 미결제 잔고내역',
+    'CLNAQ00100': '예탁담보융자가능종목현황조회',
+    'CSPAQ00600': '계좌별신용한도조회',
+    'CSPAQ12200': '현물계좌예수금 주문가능금액 총평가 조회',
+    'CSPAQ12300': 'BEP단가조회',
+    'CSPAQ13700': '현물계좌주문체결내역조회',
+    'CSPAQ22200': '현물계좌예수금 주문가능금액 총평가2',
+    'CSPAT00600': '현물주문',
+    'CSPAT00700': '현물정정주문',
+    'CSPAT00800': '현물취소주문',
+    'CSPBQ00200': '현물계좌증거금률별주문가능수량조회',
+    'CUR': '현물정보 USD 실시간(CUR)',
+    'ChartExcel': '챠트엑셀데이터조회',
+    'ChartIndex': '챠트지표데이터조회',
+    'DH1': 'KOSPI시간외단일가호가잔량(DH1)',
+    'DHA': 'KOSDAQ시간외단일가호가잔량(DHA)',
+    'DK3': 'KOSDAQ시간외단일가체결(DK3)',
+    'DS3': 'KOSPI시간외단일가체결(DS3)',
+    'DVI': '시간외단일가VI발동해제(DVI)',
+    'EC0': 'EUREX연계KP200지수옵션선물체결(EC0)',
+    'EH0': 'EUREX연계KP200지수옵션선물호가(EH0)',
+    'ESN': '뉴ELW투자지표민감도(ESN)',
+    'EU0': 'EUX접수',
+    'EU1': 'EUX체결',
+    'EU2': 'EUX확인',
+    'FC0': 'KOSPI200선물체결(C0)',
+    'FD0': 'KOSPI200선물실시간상하한가(D0)',
+    'FH0': 'KOSPI200선물호가(H0)',
+    'FOCCQ33600': '주식계좌 기간별수익률 상세',
+    'FOCCQ33700': '선물옵션 기간별 계좌 수익률 현황',
+    'FX0': 'KOSPI200선물가격제한폭확대(X0)',
+    'H01': '선물주문정정취소',
+    'JC0': '주식선물체결(JC0)',
+    'JD0': '주식선물실시간상하한가(JD0)',
+    'JH0': '주식선물호가(JH0)',
+    'JIF': '장운영정보(JIF)',
+    'JX0': '주식선물가격제한폭확대(JX0)',
+    'MK2': 'US지수(MK2)',
+    'MMDAQ91200': '파생상품증거금율조회',
+    'NWS': '실시간 뉴스 제목 패킷(NWS)',
+    'O01': '선물접수',
+    'OC0': 'KOSPI200옵션체결(C0)',
+    'OD0': 'KOSPI200옵션실시간상하한가(D0)',
+    'OH0': 'KOSPI200옵션호가(H0)',
+    'OMG': 'KOSPI200옵션민감도(MG)',
+    'OVC': '해외선물 현재가체결(OVC)',
+    'OVH': '해외선물 호가(OVH)',
+    'OX0': 'KOSPI200옵션가격제한폭확대(X0)',
+    'SC0': '주식주문접수',
+    'SC1': '주식주문체결',
+    'SC2': '주식주문정정',
+    'SC3': '주식주문취소',
+    'SC4': '주식주문거부',
+    'SHC': '상/하한가근접진입(SHC)',
+    'SHD': '상/하한가근접이탈(SHD)',
+    'SHI': '상/하한가진입(SHI)',
+    'SHO': '상/하한가이탈(SHO)',
+    'TC1': '해외선물주문',
+    'TC2': '해외선물응답',
+    'TC3': '해외선물체결',
+    'WOC': '해외옵션 현재가체결(WOC)',
+    'WOH': '해외옵션 호가(WOH)',
+    'YC3': '상품선물예상체결(YC3)',
+    'YFC': '지수선물예상체결(YFC)',
+    'YJC': '주식선물예상체결(YJC)',
+    'YK3': 'KOSDAQ예상체결(YK3)',
+    'YOC': '지수옵션예상체결(YOC)',
+    'YS3': 'KOSPI예상체결(YS3)',
+    'o3101': '해외선물마스터조회(o3101)-API용',
+    'o3103': '해외선물차트(분)(o3103)-API용',
+    'o3104': '해외선물일별체결조회(o3104)-API용',
+    'o3105': '해외선물현재가(종목정보)조회(o3105)-API용',
+    'o3106': '해외선물현재가호가조회(o3106)-API용',
+    'o3107': '해외선물관심종목조회(o3107)-API용',
+    'o3108': '해외선물차트(일주월)(o3108)-API용',
+    'o3116': '해외선물시간대별(Tick)체결(o3116)-API용',
+    'o3117': '해외선물차트용NTick(o3117)-API용',
+    'o3121': '해외선물옵션마스터조회(o3121)-API용',
+    'o3123': '해외선물옵션차트(분)(o3123)-API용',
+    'o3125': '해외선물옵션현재가(종목정보)조회(o3125)-API용',
+    'o3126': '해외선물옵션현재가호가조회(o3126)-API용',
+    'o3127': '해외선물옵션관심종목조회(o3127)-API용',
+    'o3128': '해외선물옵션차트일주월(o3128)-API용',
+    'o3136': '해외선물옵션시간대별(Tick)체결(o3136)-API용',
+    'o3137': '해외선물옵션차트용NTick(o3137)-API용',
+    'o3139': '해외선물옵션차트용NTick(고정형)(o3139)-API용',
+    't0150': '주식당일매매일지/수수료(t0150)',
+    't0151': '주식당일매매일지/수수료(전일)(t0151)',
+    't0167': '서버시간조회(t0167)',
+    't0424': '주식잔고2(t0424)',
+    't0425': '주식체결/미체결(t0425)',
+    't0434': '선물/옵션체결/미체결(t0434)',
+    't0441': '선물/옵션잔고평가(이동평균)(t0441)',
+    't1101': '주식현재가호가조회(t1101)',
+    't1102': '주식현재가(시세)조회(t1102)',
+    't1104': '주식현재가시세메모(t1104)',
+    't1105': '주식피못/디마크조회(t1105)',
+    't1109': '시간외체결량(t1109)',
+    't1301': '주식시간대별체결조회(t1301)',
+    't1302': '주식분별주가조회(t1302)',
+    't1305': '기간별주가(t1305)',
+    't1308': '주식시간대별체결조회챠트(t1308)',
+    't1310': '주식당일전일분틱조회(t1310)',
+    't1403': '신규상장종목조회(t1403)',
+    't1404': '관리/불성실/투자유의조회(t1404)',
+    't1405': '투자경고/매매정지/정리매매조회(t1405)',
+    't1410': '초저유동성조회(t1410)',
+    't1411': '증거금율별종목조회(t1411)',
+    't1422': '상/하한(t1422)',
+    't1427': '상/하한가직전(t1427)',
+    't1441': '등락율상위(t1441)',
+    't1442': '신고/신저가(t1442)',
+    't1444': '시가총액상위(t1444)',
+    't1449': '가격대별매매비중조회(t1449)',
+    't1452': '거래량상위(t1452)',
+    't1463': '거래대금상위(t1463)',
+    't1466': '전일동시간대비거래급증(t1466)',
+    't1471': '시간대별호가잔량추이(t1471)',
+    't1475': '체결강도추이(t1475)',
+    't1481': '시간외등락율상위(t1481)',
+    't1482': '시간외거래량상위(t1482)',
+    't1485': '예상지수(t1485)',
+    't1486': '시간별예상체결가(t1486)',
+    't1488': '예상체결가등락율상위조회(t1488)',
+    't1489': '예상체결량상위조회(t1489)',
+    't1492': '단일가예상등락율상위(t1492)',
+    't1511': '업종현재가(t1511)',
+    't1514': '업종기간별추이(t1514)',
+    't1516': '업종별종목시세(t1516)',
+    't1531': '테마별종목(t1531)',
+    't1532': '종목별테마(t1532)',
+    't1533': '특이테마(t1533)',
+    't1537': '테마종목별시세조회(t1537)',
+    't1601': '투자자별종합(t1601)',
+    't1602': '시간대별투자자매매추이(t1602)',
+    't1603': '시간대별투자자매매추이상세(t1603)',
+    't1615': '투자자매매종합1(t1615)',
+    't1617': '투자자매매종합2(t1617)',
+    't1621': '업종별분별투자자매매동향(챠트용)',
+    't1631': '프로그램매매종합조회(t1631)',
+    't1632': '시간대별프로그램매매추이(t1632)',
+    't1633': '기간별프로그램매매추이(t1633)',
+    't1636': '종목별프로그램매매동향(t1636)',
+    't1637': '종목별프로그램매매추이(t1637)',
+    't1638': '종목별잔량/사전공시(t1638)',
+    't1640': '프로그램매매종합조회(미니)(t1640)',
+    't1662': '시간대별프로그램매매추이(차트)(t1662)',
+    't1664': '투자자매매종합(챠트)',
+    't1665': '기간별투자자매매추이(챠트)',
+    't1702': '외인기관종목별동향(t1702)',
+    't1716': '외인기관종목별동향(t1716)',
+    't1717': '외인기관종목별동향(t1717)',
+    't1752': '종목별상위회원사(t1752)',
+    't1764': '회원사리스트(t1764)',
+    't1771': '종목별회원사추이(t1771)',
+    't1809': '신호조회(t1809)',
+    't1825': '종목Q클릭검색(씽큐스마트)(t1825)',
+    't1826': '종목Q클릭검색리스트조회(씽큐스마트)(t1826)',
+    't1857': 'e종목검색(신버전API용)',
+    't1866': '서버저장조건리스트조회(API)(t1866)',
+    't1901': 'ETF현재가(시세)조회(t1901)',
+    't1902': 'ETF시간별추이(t1902)',
+    't1903': 'ETF일별추이(t1903)',
+    't1904': 'ETF구성종목조회(t1904)',
+    't1906': 'ETFLP호가(t1906)',
+    't1921': '신용거래동향(t1921)',
+    't1926': '종목별신용정보(t1926)',
+    't1927': '공매도일별추이(t1927)',
+    't1941': '종목별대차거래일간추이(t1941)',
+    't1950': 'ELW현재가(시세)조회(t1950)',
+    't1951': 'ELW시간대별체결조회(t1951)',
+    't1954': 'ELW일별주가(t1954)',
+    't1956': 'ELW현재가(확정지급액)조회(t1956)',
+    't1958': 'ELW종목비교(t1958)',
+    't1959': 'LP대상종목정보조회(t1959)',
+    't1960': 'ELW등락율상위(t1960)',
+    't1961': 'ELW거래량상위(t1961)',
+    't1964': 'ELW전광판(t1964)',
+    't1966': 'ELW거래대금상위(t1966)',
+    't1969': 'ELW지표검색(t1969)',
+    't1971': 'ELW현재가호가조회(t1971)',
+    't1972': 'ELW현재가(거래원)조회(t1972)',
+    't1973': 'ELW시간대별예상체결조회(t1973)',
+    't1974': 'ELW기초자산동일종목(t1974)',
+    't1988': '기초자산리스트조회(t1988)',
+    't2101': '선물/옵션현재가(시세)조회(t2101)',
+    't2105': '선물/옵션현재가호가조회(t2105)',
+    't2106': '선물/옵션현재가시세메모(t2106)',
+    't2201': '선물옵션시간대별체결조회(t2201)',
+    't2203': '기간별주가(t2203)',
+    't2209': '선물옵션틱분별체결조회챠트(t2209)',
+    't2210': '선물옵션시간대별체결조회(단일출력용)',
+    't2301': '옵션전광판(t2301)',
+    't2405': '선물옵션호가잔량비율챠트(t2405)',
+    't2421': '미결제약정추이(t2421)',
+    't2541': '상품선물투자자매매동향(실시간)(t2541)',
+    't2545': '상품선물투자자매매동향(챠트용)',
+    't2830': 'EUREXKOSPI200옵션선물현재가(시세)조회(t2830)',
+    't2831': 'EUREXKOSPI200옵션선물호가조회(t2831)',
+    't2832': 'EUREX야간옵션선물시간대별체결조회(t2832)',
+    't2833': 'EUREX야간옵션선물기간별추이(t2833)',
+    't2835': 'EUREX옵션선물시세전광판(t2835)',
+    't3102': '뉴스본문(t3102)',
+    't3202': '종목별증시일정(t3202)',
+    't3320': 'FNG_요약(t3320)',
+    't3341': '재무순위종합(t3341)',
+    't3401': '투자의견(t3401)',
+    't3518': '해외실시간지수(t3518)',
+    't3521': '해외지수조회(API용)(t3521)',
+    't4203': '업종챠트(종합)(t4203)',
+    't8401': '주식선물마스터조회(API용)(t8401)',
+    't8402': '주식선물현재가조회(API용)(t8402)',
+    't8403': '주식선물호가조회(API용)(t8403)',
+    't8404': '주식선물시간대별체결조회(API용)(t8404)',
+    't8405': '주식선물기간별주가(API용)(t8405)',
+    't8406': '주식선물틱분별체결조회(API용)(t8406)',
+    't8407': 'API용주식멀티현재가조회(t8407)',
+    't8410': 'API전용주식챠트(일주월년)(t8410)',
+    't8411': '주식챠트(틱/n틱)(t8411)',
+    't8412': '주식챠트(N분)(t8412)',
+    't8414': '선물옵션차트(틱/n틱)(t8414)',
+    't8415': '선물/옵션챠트(N분)(t8415)',
+    't8416': '선물/옵션챠트(일주월)(t8416)',
+    't8417': '업종차트(틱/n틱)(t8417)',
+    't8418': '업종챠트(N분)(t8418)',
+    't8419': '업종챠트(일주월)(t8419)',
+    't8424': '전체업종(t8424)',
+    't8425': '전체테마(t8425)',
+    't8426': '상품선물마스터조회(API용)(t8426)',
+    't8427': '과거데이터시간대별조회(t8427)',
+    't8428': '증시주변자금추이(t8428)',
+    't8429': 'EUREX야간옵션선물틱분별체결조회챠트(t8429)',
+    't8430': '주식종목조회(t8430)',
+    't8431': 'ELW종목조회(t8431)',
+    't8432': '지수선물마스터조회API용(t8432)',
+    't8433': '지수옵션마스터조회API용(t8433)',
+    't8434': '선물/옵션멀티현재가조회(t8434)',
+    't8435': '파생종목마스터조회API용(t8435)',
+    't8436': '주식종목조회 API용(t8436)',
+    't8437': 'CME/EUREX마스터조회(API용)(t8437)',
+    't9905': '기초자산리스트조회(t9905)',
+    't9907': '만기월조회(t9907)',
+    't9942': 'ELW마스터조회API용(t9942)',
+    't9943': '지수선물마스터조회API용(t9943)',
+    't9944': '지수옵션마스터조회API용(t9944)',
+    't9945': '주식마스터조회API용-종목명40bytes(t9945)',
+}
+
+BLOCK_INDEX = {
+    'BMTInBlock': 'BMT',
+    'BMTOutBlock': 'BMT',
+    'BMT': 'BMT',
+    'C01OutBlock': 'C01',
+    'C01': 'C01',
+    'CD0InBlock': 'CD0',
+    'CD0OutBlock': 'CD0',
+    'CD0': 'CD0',
+    'CDPCQ04700InBlock1': 'CDPCQ04700',
+    'CDPCQ04700OutBlock1': 'CDPCQ04700',
+    'CDPCQ04700OutBlock2': 'CDPCQ04700',
+    'CDPCQ04700OutBlock3': 'CDPCQ04700',
+    'CDPCQ04700OutBlock4': 'CDPCQ04700',
+    'CDPCQ04700OutBlock5': 'CDPCQ04700',
+    'CDPCQ04700': 'CDPCQ04700',
+    'CEXAQ21100InBlock1': 'CEXAQ21100',
+    'CEXAQ21100OutBlock1': 'CEXAQ21100',
+    'CEXAQ21100OutBlock2': 'CEXAQ21100',
+    'CEXAQ21100OutBlock3': 'CEXAQ21100',
+    'CEXAQ21100': 'CEXAQ21100',
+    'CEXAQ21200InBlock1': 'CEXAQ21200',
+    'CEXAQ21200OutBlock1': 'CEXAQ21200',
+    'CEXAQ21200OutBlock2': 'CEXAQ21200',
+    'CEXAQ21200': 'CEXAQ21200',
+    'CEXAQ31100InBlock1': 'CEXAQ31100',
+    'CEXAQ31100OutBlock1': 'CEXAQ31100',
+    'CEXAQ31100OutBlock2': 'CEXAQ31100',
+    'CEXAQ31100OutBlock3': 'CEXAQ31100',
+    'CEXAQ31100': 'CEXAQ31100',
+    'CEXAQ31200InBlock1': 'CEXAQ31200',
+    'CEXAQ31200OutBlock1': 'CEXAQ31200',
+    'CEXAQ31200OutBlock2': 'CEXAQ31200',
+    'CEXAQ31200OutBlock3': 'CEXAQ31200',
+    'CEXAQ31200': 'CEXAQ31200',
+    'CEXAQ44200InBlock1': 'CEXAQ44200',
+    'CEXAQ44200OutBlock1': 'CEXAQ44200',
+    'CEXAQ44200OutBlock2': 'CEXAQ44200',
+    'CEXAQ44200OutBlock3': 'CEXAQ44200',
+    'CEXAQ44200': 'CEXAQ44200',
+    'CEXAT11100InBlock1': 'CEXAT11100',
+    'CEXAT11100OutBlock1': 'CEXAT11100',
+    'CEXAT11100OutBlock2': 'CEXAT11100',
+    'CEXAT11100': 'CEXAT11100',
+    'CEXAT11200InBlock1': 'CEXAT11200',
+    'CEXAT11200OutBlock1': 'CEXAT11200',
+    'CEXAT11200OutBlock2': 'CEXAT11200',
+    'CEXAT11200': 'CEXAT11200',
+    'CEXAT11300InBlock1': 'CEXAT11300',
+    'CEXAT11300OutBlock1': 'CEXAT11300',
+    'CEXAT11300OutBlock2': 'CEXAT11300',
+    'CEXAT11300': 'CEXAT11300',
+    'CFOAQ00600InBlock1': 'CFOAQ00600',
+    'CFOAQ00600OutBlock1': 'CFOAQ00600',
+    'CFOAQ00600OutBlock2': 'CFOAQ00600',
+    'CFOAQ00600OutBlock3': 'CFOAQ00600',
+    'CFOAQ00600': 'CFOAQ00600',
+    'CFOAQ10100InBlock1': 'CFOAQ10100',
+    'CFOAQ10100OutBlock1': 'CFOAQ10100',
+    'CFOAQ10100OutBlock2': 'CFOAQ10100',
+    'CFOAQ10100': 'CFOAQ10100',
+    'CFOAT00100InBlock1': 'CFOAT00100',
+    'CFOAT00100OutBlock1': 'CFOAT00100',
+    'CFOAT00100OutBlock2': 'CFOAT00100',
+    'CFOAT00100': 'CFOAT00100',
+    'CFOAT00200InBlock1': 'CFOAT00200',
+    'CFOAT00200OutBlock1': 'CFOAT00200',
+    'CFOAT00200OutBlock2': 'CFOAT00200',
+    'CFOAT00200': 'CFOAT00200',
+    'CFOAT00300InBlock1': 'CFOAT00300',
+    'CFOAT00300OutBlock1': 'CFOAT00300',
+    'CFOAT00300OutBlock2': 'CFOAT00300',
+    'CFOAT00300': 'CFOAT00300',
+    'CFOBQ10500InBlock1': 'CFOBQ10500',
+    'CFOBQ10500OutBlock1': 'CFOBQ10500',
+    'CFOBQ10500OutBlock2': 'CFOBQ10500',
+    'CFOBQ10500OutBlock3': 'CFOBQ10500',
+    'CFOBQ10500': 'CFOBQ10500',
+    'CFOBQ10800InBlock1': 'CFOBQ10800',
+    'CFOBQ10800OutBlock1': 'CFOBQ10800',
+    'CFOBQ10800OutBlock2': 'CFOBQ10800',
+    'CFOBQ10800': 'CFOBQ10800',
+    'CFOEQ11100InBlock1': 'CFOEQ11100',
+    'CFOEQ11100OutBlock1': 'CFOEQ11100',
+    'CFOEQ11100OutBlock2': 'CFOEQ11100',
+    'CFOEQ11100': 'CFOEQ11100',
+    'CFOEQ82600InBlock1': 'CFOEQ82600',
+    'CFOEQ82600OutBlock1': 'CFOEQ82600',
+    'CFOEQ82600OutBlock2': 'CFOEQ82600',
+    'CFOEQ82600OutBlock3': 'CFOEQ82600',
+    'CFOEQ82600': 'CFOEQ82600',
+    'CFOFQ02400InBlock1': 'CFOFQ02400',
+    'CFOFQ02400OutBlock1': 'CFOFQ02400',
+    'CFOFQ02400OutBlock2': 'CFOFQ02400',
+    'CFOFQ02400OutBlock3': 'CFOFQ02400',
+    'CFOFQ02400OutBlock4': 'CFOFQ02400',
+    'CFOFQ02400': 'CFOFQ02400',
+    'CIDBQ01400InBlock1': 'CIDBQ01400',
+    'CIDBQ01400OutBlock1': 'CIDBQ01400',
+    'CIDBQ01400OutBlock2': 'CIDBQ01400',
+    'CIDBQ01400': 'CIDBQ01400',
+    'CIDBQ01500InBlock1': 'CIDBQ01500',
+    'CIDBQ01500OutBlock1': 'CIDBQ01500',
+    'CIDBQ01500OutBlock2': 'CIDBQ01500',
+    'CIDBQ01500': 'CIDBQ01500',
+    'CIDBQ01800InBlock1': 'CIDBQ01800',
+    'CIDBQ01800OutBlock1': 'CIDBQ01800',
+    'CIDBQ01800OutBlock2': 'CIDBQ01800',
+    'CIDBQ01800': 'CIDBQ01800',
+    'CIDBQ02400InBlock1': 'CIDBQ02400',
+    'CIDBQ02400OutBlock1': 'CIDBQ02400',
+    'CIDBQ02400OutBlock2': 'CIDBQ02400',
+    'CIDBQ02400': 'CIDBQ02400',
+    'CIDBQ03000InBlock1': 'CIDBQ03000',
+    'CIDBQ03000OutBlock1': 'CIDBQ03000',
+    'CIDBQ03000OutBlock2': 'CIDBQ03000',
+    'CIDBQ03000': 'CIDBQ03000',
+    'CIDBQ05300InBlock1': 'CIDBQ05300',
+    'CIDBQ05300OutBlock1': 'CIDBQ05300',
+    'CIDBQ05300OutBlock2': 'CIDBQ05300',
+    'CIDBQ05300OutBlock3': 'CIDBQ05300',
+    'CIDBQ05300': 'CIDBQ05300',
+    'CIDBT00100InBlock1': 'CIDBT00100',
+    'CIDBT00100OutBlock1': 'CIDBT00100',
+    'CIDBT00100OutBlock2': 'CIDBT00100',
+    'CIDBT00100': 'CIDBT00100',
+    'CIDBT00900InBlock1': 'CIDBT00900',
+    'CIDBT00900OutBlock1': 'CIDBT00900',
+    'CIDBT00900OutBlock2': 'CIDBT00900',
+    'CIDBT00900': 'CIDBT00900',
+    'CIDBT01000InBlock1': 'CIDBT01000',
+    'CIDBT01000OutBlock1': 'CIDBT01000',
+    'CIDBT01000OutBlock2': 'CIDBT01000',
+    'CIDBT01000': 'CIDBT01000',
+    'CIDEQ00800InBlock1': 'CIDEQ00800',
+    'CIDEQ00800OutBlock1': 'CIDEQ00800',
+    'CIDEQ00800OutBlock2': 'CIDEQ00800',
+    'CIDEQ00800': 'CIDEQ00800',
+    'CLNAQ00100InBlock1': 'CLNAQ00100',
+    'CLNAQ00100OutBlock1': 'CLNAQ00100',
+    'CLNAQ00100OutBlock2': 'CLNAQ00100',
+    'CLNAQ00100OutBlock3': 'CLNAQ00100',
+    'CLNAQ00100': 'CLNAQ00100',
+    'CSPAQ00600InBlock1': 'CSPAQ00600',
+    'CSPAQ00600OutBlock1': 'CSPAQ00600',
+    'CSPAQ00600OutBlock2': 'CSPAQ00600',
+    'CSPAQ00600': 'CSPAQ00600',
+    'CSPAQ12200InBlock1': 'CSPAQ12200',
+    'CSPAQ12200OutBlock1': 'CSPAQ12200',
+    'CSPAQ12200OutBlock2': 'CSPAQ12200',
+    'CSPAQ12200': 'CSPAQ12200',
+    'CSPAQ12300InBlock1': 'CSPAQ12300',
+    'CSPAQ12300OutBlock1': 'CSPAQ12300',
+    'CSPAQ12300OutBlock2': 'CSPAQ12300',
+    'CSPAQ12300OutBlock3': 'CSPAQ12300',
+    'CSPAQ12300': 'CSPAQ12300',
+    'CSPAQ13700InBlock1': 'CSPAQ13700',
+    'CSPAQ13700OutBlock1': 'CSPAQ13700',
+    'CSPAQ13700OutBlock2': 'CSPAQ13700',
+    'CSPAQ13700OutBlock3': 'CSPAQ13700',
+    'CSPAQ13700': 'CSPAQ13700',
+    'CSPAQ22200InBlock1': 'CSPAQ22200',
+    'CSPAQ22200OutBlock1': 'CSPAQ22200',
+    'CSPAQ22200OutBlock2': 'CSPAQ22200',
+    'CSPAQ22200': 'CSPAQ22200',
+    'CSPAT00600InBlock1': 'CSPAT00600',
+    'CSPAT00600OutBlock1': 'CSPAT00600',
+    'CSPAT00600OutBlock2': 'CSPAT00600',
+    'CSPAT00600': 'CSPAT00600',
+    'CSPAT00700InBlock1': 'CSPAT00700',
+    'CSPAT00700OutBlock1': 'CSPAT00700',
+    'CSPAT00700OutBlock2': 'CSPAT00700',
+    'CSPAT00700': 'CSPAT00700',
+    'CSPAT00800InBlock1': 'CSPAT00800',
+    'CSPAT00800OutBlock1': 'CSPAT00800',
+    'CSPAT00800OutBlock2': 'CSPAT00800',
+    'CSPAT00800': 'CSPAT00800',
+    'CSPBQ00200InBlock1': 'CSPBQ00200',
+    'CSPBQ00200OutBlock1': 'CSPBQ00200',
+    'CSPBQ00200OutBlock2': 'CSPBQ00200',
+    'CSPBQ00200': 'CSPBQ00200',
+    'CURInBlock': 'CUR',
+    'CUROutBlock': 'CUR',
+    'CUR': 'CUR',
+    'ChartExcelInBlock': 'ChartExcel',
+    'ChartExcelOutBlock': 'ChartExcel',
+    'ChartExcelOutBlock1': 'ChartExcel',
+    'ChartExcel': 'ChartExcel',
+    'ChartIndexInBlock': 'ChartIndex',
+    'ChartIndexOutBlock': 'ChartIndex',
+    'ChartIndexOutBlock1': 'ChartIndex',
+    'ChartIndex': 'ChartIndex',
+    'DH1InBlock': 'DH1',
+    'DH1OutBlock': 'DH1',
+    'DH1': 'DH1',
+    'DHAInBlock': 'DHA',
+    'DHAOutBlock': 'DHA',
+    'DHA': 'DHA',
+    'DK3InBlock': 'DK3',
+    'DK3OutBlock': 'DK3',
+    'DK3': 'DK3',
+    'DS3InBlock': 'DS3',
+    'DS3OutBlock': 'DS3',
+    'DS3': 'DS3',
+    'DVIInBlock': 'DVI',
+    'DVIOutBlock': 'DVI',
+    'DVI': 'DVI',
+    'EC0InBlock': 'EC0',
+    'EC0OutBlock': 'EC0',
+    'EC0': 'EC0',
+    'EH0InBlock': 'EH0',
+    'EH0OutBlock': 'EH0',
+    'EH0': 'EH0',
+    'ESNInBlock': 'ESN',
+    'ESNOutBlock': 'ESN',
+    'ESN': 'ESN',
+    'EU0OutBlock': 'EU0',
+    'EU0': 'EU0',
+    'EU1OutBlock': 'EU1',
+    'EU1': 'EU1',
+    'EU2OutBlock': 'EU2',
+    'EU2': 'EU2',
+    'FC0InBlock': 'FC0',
+    'FC0OutBlock': 'FC0',
+    'FC0': 'FC0',
+    'FD0InBlock': 'FD0',
+    'FD0OutBlock': 'FD0',
+    'FD0': 'FD0',
+    'FH0InBlock': 'FH0',
+    'FH0OutBlock': 'FH0',
+    'FH0': 'FH0',
+    'FOCCQ33600InBlock1': 'FOCCQ33600',
+    'FOCCQ33600OutBlock1': 'FOCCQ33600',
+    'FOCCQ33600OutBlock2': 'FOCCQ33600',
+    'FOCCQ33600OutBlock3': 'FOCCQ33600',
+    'FOCCQ33600': 'FOCCQ33600',
+    'FOCCQ33700InBlock1': 'FOCCQ33700',
+    'FOCCQ33700OutBlock1': 'FOCCQ33700',
+    'FOCCQ33700OutBlock2': 'FOCCQ33700',
+    'FOCCQ33700OutBlock3': 'FOCCQ33700',
+    'FOCCQ33700': 'FOCCQ33700',
+    'FX0InBlock': 'FX0',
+    'FX0OutBlock': 'FX0',
+    'FX0': 'FX0',
+    'H01OutBlock': 'H01',
+    'H01': 'H01',
+    'JC0InBlock': 'JC0',
+    'JC0OutBlock': 'JC0',
+    'JC0': 'JC0',
+    'JD0InBlock': 'JD0',
+    'JD0OutBlock': 'JD0',
+    'JD0': 'JD0',
+    'JH0InBlock': 'JH0',
+    'JH0OutBlock': 'JH0',
+    'JH0': 'JH0',
+    'JIFInBlock': 'JIF',
+    'JIFOutBlock': 'JIF',
+    'JIF': 'JIF',
+    'JX0InBlock': 'JX0',
+    'JX0OutBlock': 'JX0',
+    'JX0': 'JX0',
+    'MK2InBlock': 'MK2',
+    'MK2OutBlock': 'MK2',
+    'MK2': 'MK2',
+    'MMDAQ91200InBlock1': 'MMDAQ91200',
+    'MMDAQ91200OutBlock1': 'MMDAQ91200',
+    'MMDAQ91200OutBlock2': 'MMDAQ91200',
+    'MMDAQ91200': 'MMDAQ91200',
+    'NWSInBlock': 'NWS',
+    'NWSOutBlock': 'NWS',
+    'NWS': 'NWS',
+    'O01OutBlock': 'O01',
+    'O01': 'O01',
+    'OC0InBlock': 'OC0',
+    'OC0OutBlock': 'OC0',
+    'OC0': 'OC0',
+    'OD0InBlock': 'OD0',
+    'OD0OutBlock': 'OD0',
+    'OD0': 'OD0',
+    'OH0InBlock': 'OH0',
+    'OH0OutBlock': 'OH0',
+    'OH0': 'OH0',
+    'OMGInBlock': 'OMG',
+    'OMGOutBlock': 'OMG',
+    'OMG': 'OMG',
+    'OVCInBlock': 'OVC',
+    'OVCOutBlock': 'OVC',
+    'OVC': 'OVC',
+    'OVHInBlock': 'OVH',
+    'OVHOutBlock': 'OVH',
+    'OVH': 'OVH',
+    'OX0InBlock': 'OX0',
+    'OX0OutBlock': 'OX0',
+    'OX0': 'OX0',
+    'SC0OutBlock': 'SC0',
+    'SC0': 'SC0',
+    'SC1OutBlock': 'SC1',
+    'SC1': 'SC1',
+    'SC2OutBlock': 'SC2',
+    'SC2': 'SC2',
+    'SC3OutBlock': 'SC3',
+    'SC3': 'SC3',
+    'SC4OutBlock': 'SC4',
+    'SC4': 'SC4',
+    'SHCInBlock': 'SHC',
+    'SHCOutBlock': 'SHC',
+    'SHC': 'SHC',
+    'SHDInBlock': 'SHD',
+    'SHDOutBlock': 'SHD',
+    'SHD': 'SHD',
+    'SHIInBlock': 'SHI',
+    'SHIOutBlock': 'SHI',
+    'SHI': 'SHI',
+    'SHOInBlock': 'SHO',
+    'SHOOutBlock': 'SHO',
+    'SHO': 'SHO',
+    'TC1OutBlock': 'TC1',
+    'TC1': 'TC1',
+    'TC2OutBlock': 'TC2',
+    'TC2': 'TC2',
+    'TC3OutBlock': 'TC3',
+    'TC3': 'TC3',
+    'WOCInBlock': 'WOC',
+    'WOCOutBlock': 'WOC',
+    'WOC': 'WOC',
+    'WOHInBlock': 'WOH',
+    'WOHOutBlock': 'WOH',
+    'WOH': 'WOH',
+    'YC3InBlock': 'YC3',
+    'YC3OutBlock': 'YC3',
+    'YC3': 'YC3',
+    'YFCInBlock': 'YFC',
+    'YFCOutBlock': 'YFC',
+    'YFC': 'YFC',
+    'YJCInBlock': 'YJC',
+    'YJCOutBlock': 'YJC',
+    'YJC': 'YJC',
+    'YK3InBlock': 'YK3',
+    'YK3OutBlock': 'YK3',
+    'YK3': 'YK3',
+    'YOCInBlock': 'YOC',
+    'YOCOutBlock': 'YOC',
+    'YOC': 'YOC',
+    'YS3InBlock': 'YS3',
+    'YS3OutBlock': 'YS3',
+    'YS3': 'YS3',
+    'o3101InBlock': 'o3101',
+    'o3101OutBlock': 'o3101',
+    'o3101': 'o3101',
+    'o3103InBlock': 'o3103',
+    'o3103OutBlock': 'o3103',
+    'o3103OutBlock1': 'o3103',
+    'o3103': 'o3103',
+    'o3104InBlock': 'o3104',
+    'o3104OutBlock1': 'o3104',
+    'o3104': 'o3104',
+    'o3105InBlock': 'o3105',
+    'o3105OutBlock': 'o3105',
+    'o3105': 'o3105',
+    'o3106InBlock': 'o3106',
+    'o3106OutBlock': 'o3106',
+    'o3106': 'o3106',
+    'o3107InBlock': 'o3107',
+    'o3107OutBlock': 'o3107',
+    'o3107': 'o3107',
+    'o3108InBlock': 'o3108',
+    'o3108OutBlock': 'o3108',
+    'o3108OutBlock1': 'o3108',
+    'o3108': 'o3108',
+    'o3116InBlock': 'o3116',
+    'o3116OutBlock': 'o3116',
+    'o3116OutBlock1': 'o3116',
+    'o3116': 'o3116',
+    'o3117InBlock': 'o3117',
+    'o3117OutBlock': 'o3117',
+    'o3117OutBlock1': 'o3117',
+    'o3117': 'o3117',
+    'o3121InBlock': 'o3121',
+    'o3121OutBlock': 'o3121',
+    'o3121': 'o3121',
+    'o3123InBlock': 'o3123',
+    'o3123OutBlock': 'o3123',
+    'o3123OutBlock1': 'o3123',
+    'o3123': 'o3123',
+    'o3125InBlock': 'o3125',
+    'o3125OutBlock': 'o3125',
+    'o3125': 'o3125',
+    'o3126InBlock': 'o3126',
+    'o3126OutBlock': 'o3126',
+    'o3126': 'o3126',
+    'o3127InBlock': 'o3127',
+    'o3127InBlock1': 'o3127',
+    'o3127OutBlock': 'o3127',
+    'o3127': 'o3127',
+    'o3128InBlock': 'o3128',
+    'o3128OutBlock': 'o3128',
+    'o3128OutBlock1': 'o3128',
+    'o3128': 'o3128',
+    'o3136InBlock': 'o3136',
+    'o3136OutBlock': 'o3136',
+    'o3136OutBlock1': 'o3136',
+    'o3136': 'o3136',
+    'o3137InBlock': 'o3137',
+    'o3137OutBlock': 'o3137',
+    'o3137OutBlock1': 'o3137',
+    'o3137': 'o3137',
+    'o3139InBlock': 'o3139',
+    'o3139OutBlock': 'o3139',
+    'o3139OutBlock1': 'o3139',
+    'o3139': 'o3139',
+    't0150InBlock': 't0150',
+    't0150OutBlock': 't0150',
+    't0150OutBlock1': 't0150',
+    't0150': 't0150',
+    't0151InBlock': 't0151',
+    't0151OutBlock': 't0151',
+    't0151OutBlock1': 't0151',
+    't0151': 't0151',
+    't0167InBlock': 't0167',
+    't0167OutBlock': 't0167',
+    't0167': 't0167',
+    't0424InBlock': 't0424',
+    't0424OutBlock': 't0424',
+    't0424OutBlock1': 't0424',
+    't0424': 't0424',
+    't0425InBlock': 't0425',
+    't0425OutBlock': 't0425',
+    't0425OutBlock1': 't0425',
+    't0425': 't0425',
+    't0434InBlock': 't0434',
+    't0434OutBlock': 't0434',
+    't0434OutBlock1': 't0434',
+    't0434': 't0434',
+    't0441InBlock': 't0441',
+    't0441OutBlock': 't0441',
+    't0441OutBlock1': 't0441',
+    't0441': 't0441',
+    't1101InBlock': 't1101',
+    't1101OutBlock': 't1101',
+    't1101': 't1101',
+    't1102InBlock': 't1102',
+    't1102OutBlock': 't1102',
+    't1102': 't1102',
+    't1104InBlock': 't1104',
+    't1104InBlock1': 't1104',
+    't1104OutBlock': 't1104',
+    't1104OutBlock1': 't1104',
+    't1104': 't1104',
+    't1105InBlock': 't1105',
+    't1105OutBlock': 't1105',
+    't1105': 't1105',
+    't1109InBlock': 't1109',
+    't1109OutBlock': 't1109',
+    't1109OutBlock1': 't1109',
+    't1109': 't1109',
+    't1301InBlock': 't1301',
+    't1301OutBlock': 't1301',
+    't1301OutBlock1': 't1301',
+    't1301': 't1301',
+    't1302InBlock': 't1302',
+    't1302OutBlock': 't1302',
+    't1302OutBlock1': 't1302',
+    't1302': 't1302',
+    't1305InBlock': 't1305',
+    't1305OutBlock': 't1305',
+    't1305OutBlock1': 't1305',
+    't1305': 't1305',
+    't1308InBlock': 't1308',
+    't1308OutBlock1': 't1308',
+    't1308': 't1308',
+    't1310InBlock': 't1310',
+    't1310OutBlock': 't1310',
+    't1310OutBlock1': 't1310',
+    't1310': 't1310',
+    't1403InBlock': 't1403',
+    't1403OutBlock': 't1403',
+    't1403OutBlock1': 't1403',
+    't1403': 't1403',
+    't1404InBlock': 't1404',
+    't1404OutBlock': 't1404',
+    't1404OutBlock1': 't1404',
+    't1404': 't1404',
+    't1405InBlock': 't1405',
+    't1405OutBlock': 't1405',
+    't1405OutBlock1': 't1405',
+    't1405': 't1405',
+    't1410InBlock': 't1410',
+    't1410OutBlock': 't1410',
+    't1410OutBlock1': 't1410',
+    't1410': 't1410',
+    't1411InBlock': 't1411',
+    't1411OutBlock': 't1411',
+    't1411OutBlock1': 't1411',
+    't1411': 't1411',
+    't1422InBlock': 't1422',
+    't1422OutBlock': 't1422',
+    't1422OutBlock1': 't1422',
+    't1422': 't1422',
+    't1427InBlock': 't1427',
+    't1427OutBlock': 't1427',
+    't1427OutBlock1': 't1427',
+    't1427': 't1427',
+    't1441InBlock': 't1441',
+    't1441OutBlock': 't1441',
+    't1441OutBlock1': 't1441',
+    't1441': 't1441',
+    't1442InBlock': 't1442',
+    't1442OutBlock': 't1442',
+    't1442OutBlock1': 't1442',
+    't1442': 't1442',
+    't1444InBlock': 't1444',
+    't1444OutBlock': 't1444',
+    't1444OutBlock1': 't1444',
+    't1444': 't1444',
+    't1449InBlock': 't1449',
+    't1449OutBlock': 't1449',
+    't1449OutBlock1': 't1449',
+    't1449': 't1449',
+    't1452InBlock': 't1452',
+    't1452OutBlock': 't1452',
+    't1452OutBlock1': 't1452',
+    't1452': 't1452',
+    't1463InBlock': 't1463',
+    't1463OutBlock': 't1463',
+    't1463OutBlock1': 't1463',
+    't1463': 't1463',
+    't1466InBlock': 't1466',
+    't1466OutBlock': 't1466',
+    't1466OutBlock1': 't1466',
+    't1466': 't1466',
+    't1471InBlock': 't1471',
+    't1471OutBlock': 't1471',
+    't1471OutBlock1': 't1471',
+    't1471': 't1471',
+    't1475InBlock': 't1475',
+    't1475OutBlock': 't1475',
+    't1475OutBlock1': 't1475',
+    't1475': 't1475',
+    't1481InBlock': 't1481',
+    't1481OutBlock': 't1481',
+    't1481OutBlock1': 't1481',
+    't1481': 't1481',
+    't1482InBlock': 't1482',
+    't1482OutBlock': 't1482',
+    't1482OutBlock1': 't1482',
+    't1482': 't1482',
+    't1485InBlock': 't1485',
+    't1485OutBlock': 't1485',
+    't1485OutBlock1': 't1485',
+    't1485': 't1485',
+    't1486InBlock': 't1486',
+    't1486OutBlock': 't1486',
+    't1486OutBlock1': 't1486',
+    't1486': 't1486',
+    't1488InBlock': 't1488',
+    't1488OutBlock': 't1488',
+    't1488OutBlock1': 't1488',
+    't1488': 't1488',
+    't1489InBlock': 't1489',
+    't1489OutBlock': 't1489',
+    't1489OutBlock1': 't1489',
+    't1489': 't1489',
+    't1492InBlock': 't1492',
+    't1492OutBlock': 't1492',
+    't1492OutBlock1': 't1492',
+    't1492': 't1492',
+    't1511InBlock': 't1511',
+    't1511OutBlock': 't1511',
+    't1511': 't1511',
+    't1514InBlock': 't1514',
+    't1514OutBlock': 't1514',
+    't1514OutBlock1': 't1514',
+    't1514': 't1514',
+    't1516InBlock': 't1516',
+    't1516OutBlock': 't1516',
+    't1516OutBlock1': 't1516',
+    't1516': 't1516',
+    't1531InBlock': 't1531',
+    't1531OutBlock': 't1531',
+    't1531': 't1531',
+    't1532InBlock': 't1532',
+    't1532OutBlock': 't1532',
+    't1532': 't1532',
+    't1533InBlock': 't1533',
+    't1533OutBlock': 't1533',
+    't1533OutBlock1': 't1533',
+    't1533': 't1533',
+    't1537InBlock': 't1537',
+    't1537OutBlock': 't1537',
+    't1537OutBlock1': 't1537',
+    't1537': 't1537',
+    't1601InBlock': 't1601',
+    't1601OutBlock1': 't1601',
+    't1601OutBlock2': 't1601',
+    't1601OutBlock3': 't1601',
+    't1601OutBlock4': 't1601',
+    't1601OutBlock5': 't1601',
+    't1601OutBlock6': 't1601',
+    't1601': 't1601',
+    't1602InBlock': 't1602',
+    't1602OutBlock': 't1602',
+    't1602OutBlock1': 't1602',
+    't1602': 't1602',
+    't1603InBlock': 't1603',
+    't1603OutBlock': 't1603',
+    't1603OutBlock1': 't1603',
+    't1603': 't1603',
+    't1615InBlock': 't1615',
+    't1615OutBlock': 't1615',
+    't1615OutBlock1': 't1615',
+    't1615': 't1615',
+    't1617InBlock': 't1617',
+    't1617OutBlock': 't1617',
+    't1617OutBlock1': 't1617',
+    't1617': 't1617',
+    't1621InBlock': 't1621',
+    't1621OutBlock': 't1621',
+    't1621OutBlock1': 't1621',
+    't1621': 't1621',
+    't1631InBlock': 't1631',
+    't1631OutBlock': 't1631',
+    't1631OutBlock1': 't1631',
+    't1631': 't1631',
+    't1632InBlock': 't1632',
+    't1632OutBlock': 't1632',
+    't1632OutBlock1': 't1632',
+    't1632': 't1632',
+    't1633InBlock': 't1633',
+    't1633OutBlock': 't1633',
+    't1633OutBlock1': 't1633',
+    't1633': 't1633',
+    't1636InBlock': 't1636',
+    't1636OutBlock': 't1636',
+    't1636OutBlock1': 't1636',
+    't1636': 't1636',
+    't1637InBlock': 't1637',
+    't1637OutBlock': 't1637',
+    't1637OutBlock1': 't1637',
+    't1637': 't1637',
+    't1638InBlock': 't1638',
+    't1638OutBlock': 't1638',
+    't1638': 't1638',
+    't1640InBlock': 't1640',
+    't1640OutBlock': 't1640',
+    't1640': 't1640',
+    't1662InBlock': 't1662',
+    't1662OutBlock': 't1662',
+    't1662': 't1662',
+    't1664InBlock': 't1664',
+    't1664OutBlock1': 't1664',
+    't1664': 't1664',
+    't1665InBlock': 't1665',
+    't1665OutBlock': 't1665',
+    't1665OutBlock1': 't1665',
+    't1665': 't1665',
+    't1702InBlock': 't1702',
+    't1702OutBlock': 't1702',
+    't1702OutBlock1': 't1702',
+    't1702': 't1702',
+    't1716InBlock': 't1716',
+    't1716OutBlock': 't1716',
+    't1716': 't1716',
+    't1717InBlock': 't1717',
+    't1717OutBlock': 't1717',
+    't1717': 't1717',
+    't1752InBlock': 't1752',
+    't1752OutBlock': 't1752',
+    't1752OutBlock1': 't1752',
+    't1752': 't1752',
+    't1764InBlock': 't1764',
+    't1764OutBlock': 't1764',
+    't1764': 't1764',
+    't1771InBlock': 't1771',
+    't1771OutBlock': 't1771',
+    't1771OutBlock2': 't1771',
+    't1771': 't1771',
+    't1809InBlock': 't1809',
+    't1809OutBlock': 't1809',
+    't1809OutBlock1': 't1809',
+    't1809': 't1809',
+    't1825InBlock': 't1825',
+    't1825OutBlock': 't1825',
+    't1825OutBlock1': 't1825',
+    't1825': 't1825',
+    't1826InBlock': 't1826',
+    't1826OutBlock': 't1826',
+    't1826': 't1826',
+    't1857InBlock': 't1857',
+    't1857OutBlock': 't1857',
+    't1857OutBlock1': 't1857',
+    't1857': 't1857',
+    't1866InBlock': 't1866',
+    't1866OutBlock': 't1866',
+    't1866OutBlock1': 't1866',
+    't1866': 't1866',
+    't1901InBlock': 't1901',
+    't1901OutBlock': 't1901',
+    't1901': 't1901',
+    't1902InBlock': 't1902',
+    't1902OutBlock': 't1902',
+    't1902OutBlock1': 't1902',
+    't1902': 't1902',
+    't1903InBlock': 't1903',
+    't1903OutBlock': 't1903',
+    't1903OutBlock1': 't1903',
+    't1903': 't1903',
+    't1904InBlock': 't1904',
+    't1904OutBlock': 't1904',
+    't1904OutBlock1': 't1904',
+    't1904': 't1904',
+    't1906InBlock': 't1906',
+    't1906OutBlock': 't1906',
+    't1906': 't1906',
+    't1921InBlock': 't1921',
+    't1921OutBlock': 't1921',
+    't1921OutBlock1': 't1921',
+    't1921': 't1921',
+    't1926InBlock': 't1926',
+    't1926OutBlock': 't1926',
+    't1926': 't1926',
+    't1927InBlock': 't1927',
+    't1927OutBlock': 't1927',
+    't1927OutBlock1': 't1927',
+    't1927': 't1927',
+    't1941InBlock': 't1941',
+    't1941OutBlock1': 't1941',
+    't1941': 't1941',
+    't1950InBlock': 't1950',
+    't1950OutBlock': 't1950',
+    't1950OutBlock1': 't1950',
+    't1950': 't1950',
+    't1951InBlock': 't1951',
+    't1951OutBlock': 't1951',
+    't1951OutBlock1': 't1951',
+    't1951': 't1951',
+    't1954InBlock': 't1954',
+    't1954OutBlock': 't1954',
+    't1954OutBlock1': 't1954',
+    't1954': 't1954',
+    't1956InBlock': 't1956',
+    't1956OutBlock': 't1956',
+    't1956OutBlock1': 't1956',
+    't1956': 't1956',
+    't1958InBlock': 't1958',
+    't1958OutBlock': 't1958',
+    't1958OutBlock1': 't1958',
+    't1958OutBlock2': 't1958',
+    't1958': 't1958',
+    't1959InBlock': 't1959',
+    't1959OutBlock1': 't1959',
+    't1959': 't1959',
+    't1960InBlock': 't1960',
+    't1960OutBlock': 't1960',
+    't1960OutBlock1': 't1960',
+    't1960': 't1960',
+    't1961InBlock': 't1961',
+    't1961OutBlock': 't1961',
+    't1961OutBlock1': 't1961',
+    't1961': 't1961',
+    't1964InBlock': 't1964',
+    't1964OutBlock1': 't1964',
+    't1964': 't1964',
+    't1966InBlock': 't1966',
+    't1966OutBlock': 't1966',
+    't1966OutBlock1': 't1966',
+    't1966': 't1966',
+    't1969InBlock': 't1969',
+    't1969OutBlock': 't1969',
+    't1969OutBlock1': 't1969',
+    't1969': 't1969',
+    't1971InBlock': 't1971',
+    't1971OutBlock': 't1971',
+    't1971': 't1971',
+    't1972InBlock': 't1972',
+    't1972OutBlock': 't1972',
+    't1972': 't1972',
+    't1973InBlock': 't1973',
+    't1973OutBlock': 't1973',
+    't1973OutBlock1': 't1973',
+    't1973': 't1973',
+    't1974InBlock': 't1974',
+    't1974OutBlock': 't1974',
+    't1974OutBlock1': 't1974',
+    't1974': 't1974',
+    't1988InBlock': 't1988',
+    't1988OutBlock': 't1988',
+    't1988OutBlock1': 't1988',
+    't1988': 't1988',
+    't2101InBlock': 't2101',
+    't2101OutBlock': 't2101',
+    't2101': 't2101',
+    't2105InBlock': 't2105',
+    't2105OutBlock': 't2105',
+    't2105': 't2105',
+    't2106InBlock': 't2106',
+    't2106InBlock1': 't2106',
+    't2106OutBlock': 't2106',
+    't2106OutBlock1': 't2106',
+    't2106': 't2106',
+    't2201InBlock': 't2201',
+    't2201OutBlock': 't2201',
+    't2201OutBlock1': 't2201',
+    't2201': 't2201',
+    't2203InBlock': 't2203',
+    't2203OutBlock': 't2203',
+    't2203OutBlock1': 't2203',
+    't2203': 't2203',
+    't2209InBlock': 't2209',
+    't2209OutBlock1': 't2209',
+    't2209': 't2209',
+    't2210InBlock': 't2210',
+    't2210OutBlock': 't2210',
+    't2210': 't2210',
+    't2301InBlock': 't2301',
+    't2301OutBlock': 't2301',
+    't2301OutBlock1': 't2301',
+    't2301OutBlock2': 't2301',
+    't2301': 't2301',
+    't2405InBlock': 't2405',
+    't2405OutBlock': 't2405',
+    't2405OutBlock1': 't2405',
+    't2405': 't2405',
+    't2421InBlock': 't2421',
+    't2421OutBlock': 't2421',
+    't2421OutBlock1': 't2421',
+    't2421': 't2421',
+    't2541InBlock': 't2541',
+    't2541OutBlock': 't2541',
+    't2541OutBlock1': 't2541',
+    't2541': 't2541',
+    't2545InBlock': 't2545',
+    't2545OutBlock': 't2545',
+    't2545OutBlock1': 't2545',
+    't2545': 't2545',
+    't2830InBlock': 't2830',
+    't2830OutBlock': 't2830',
+    't2830': 't2830',
+    't2831InBlock': 't2831',
+    't2831OutBlock': 't2831',
+    't2831': 't2831',
+    't2832InBlock': 't2832',
+    't2832OutBlock': 't2832',
+    't2832OutBlock1': 't2832',
+    't2832': 't2832',
+    't2833InBlock': 't2833',
+    't2833OutBlock': 't2833',
+    't2833OutBlock1': 't2833',
+    't2833': 't2833',
+    't2835InBlock': 't2835',
+    't2835OutBlock': 't2835',
+    't2835OutBlock1': 't2835',
+    't2835OutBlock2': 't2835',
+    't2835': 't2835',
+    't3102InBlock': 't3102',
+    't3102OutBlock': 't3102',
+    't3102OutBlock1': 't3102',
+    't3102OutBlock2': 't3102',
+    't3102': 't3102',
+    't3202InBlock': 't3202',
+    't3202OutBlock': 't3202',
+    't3202': 't3202',
+    't3320InBlock': 't3320',
+    't3320OutBlock': 't3320',
+    't3320OutBlock1': 't3320',
+    't3320': 't3320',
+    't3341InBlock': 't3341',
+    't3341OutBlock': 't3341',
+    't3341OutBlock1': 't3341',
+    't3341': 't3341',
+    't3401InBlock': 't3401',
+    't3401OutBlock': 't3401',
+    't3401OutBlock1': 't3401',
+    't3401': 't3401',
+    't3518InBlock': 't3518',
+    't3518OutBlock': 't3518',
+    't3518OutBlock1': 't3518',
+    't3518': 't3518',
+    't3521InBlock': 't3521',
+    't3521OutBlock': 't3521',
+    't3521': 't3521',
+    't4203InBlock': 't4203',
+    't4203OutBlock': 't4203',
+    't4203OutBlock1': 't4203',
+    't4203': 't4203',
+    't8401InBlock': 't8401',
+    't8401OutBlock': 't8401',
+    't8401': 't8401',
+    't8402InBlock': 't8402',
+    't8402OutBlock': 't8402',
+    't8402': 't8402',
+    't8403InBlock': 't8403',
+    't8403OutBlock': 't8403',
+    't8403': 't8403',
+    't8404InBlock': 't8404',
+    't8404OutBlock': 't8404',
+    't8404OutBlock1': 't8404',
+    't8404': 't8404',
+    't8405InBlock': 't8405',
+    't8405OutBlock': 't8405',
+    't8405OutBlock1': 't8405',
+    't8405': 't8405',
+    't8406InBlock': 't8406',
+    't8406OutBlock1': 't8406',
+    't8406': 't8406',
+    't8407InBlock': 't8407',
+    't8407OutBlock1': 't8407',
+    't8407': 't8407',
+    't8410InBlock': 't8410',
+    't8410OutBlock': 't8410',
+    't8410OutBlock1': 't8410',
+    't8410': 't8410',
+    't8411InBlock': 't8411',
+    't8411OutBlock': 't8411',
+    't8411OutBlock1': 't8411',
+    't8411': 't8411',
+    't8412InBlock': 't8412',
+    't8412OutBlock': 't8412',
+    't8412OutBlock1': 't8412',
+    't8412': 't8412',
+    't8414InBlock': 't8414',
+    't8414OutBlock': 't8414',
+    't8414OutBlock1': 't8414',
+    't8414': 't8414',
+    't8415InBlock': 't8415',
+    't8415OutBlock': 't8415',
+    't8415OutBlock1': 't8415',
+    't8415': 't8415',
+    't8416InBlock': 't8416',
+    't8416OutBlock': 't8416',
+    't8416OutBlock1': 't8416',
+    't8416': 't8416',
+    't8417InBlock': 't8417',
+    't8417OutBlock': 't8417',
+    't8417OutBlock1': 't8417',
+    't8417': 't8417',
+    't8418InBlock': 't8418',
+    't8418OutBlock': 't8418',
+    't8418OutBlock1': 't8418',
+    't8418': 't8418',
+    't8419InBlock': 't8419',
+    't8419OutBlock': 't8419',
+    't8419OutBlock1': 't8419',
+    't8419': 't8419',
+    't8424InBlock': 't8424',
+    't8424OutBlock': 't8424',
+    't8424': 't8424',
+    't8425InBlock': 't8425',
+    't8425OutBlock': 't8425',
+    't8425': 't8425',
+    't8426InBlock': 't8426',
+    't8426OutBlock': 't8426',
+    't8426': 't8426',
+    't8427InBlock': 't8427',
+    't8427OutBlock': 't8427',
+    't8427OutBlock1': 't8427',
+    't8427': 't8427',
+    't8428InBlock': 't8428',
+    't8428OutBlock': 't8428',
+    't8428OutBlock1': 't8428',
+    't8428': 't8428',
+    't8429InBlock': 't8429',
+    't8429OutBlock1': 't8429',
+    't8429': 't8429',
+    't8430InBlock': 't8430',
+    't8430OutBlock': 't8430',
+    't8430': 't8430',
+    't8431InBlock': 't8431',
+    't8431OutBlock': 't8431',
+    't8431': 't8431',
+    't8432InBlock': 't8432',
+    't8432OutBlock': 't8432',
+    't8432': 't8432',
+    't8433InBlock': 't8433',
+    't8433OutBlock': 't8433',
+    't8433': 't8433',
+    't8434InBlock': 't8434',
+    't8434OutBlock1': 't8434',
+    't8434': 't8434',
+    't8435InBlock': 't8435',
+    't8435OutBlock': 't8435',
+    't8435': 't8435',
+    't8436InBlock': 't8436',
+    't8436OutBlock': 't8436',
+    't8436': 't8436',
+    't8437InBlock': 't8437',
+    't8437OutBlock': 't8437',
+    't8437': 't8437',
+    't9905InBlock': 't9905',
+    't9905OutBlock1': 't9905',
+    't9905': 't9905',
+    't9907InBlock': 't9907',
+    't9907OutBlock1': 't9907',
+    't9907': 't9907',
+    't9942InBlock': 't9942',
+    't9942OutBlock': 't9942',
+    't9942': 't9942',
+    't9943InBlock': 't9943',
+    't9943OutBlock': 't9943',
+    't9943': 't9943',
+    't9944InBlock': 't9944',
+    't9944OutBlock': 't9944',
+    't9944': 't9944',
+    't9945InBlock': 't9945',
+    't9945OutBlock': 't9945',
+    't9945': 't9945',
+}
+
+QUERY_OUTBLOCK_MAP = {
+    'BMT': {'BMTOutBlock'},
+    'C01': {'C01OutBlock'},
+    'CD0': {'CD0OutBlock'},
+    'CDPCQ04700': {'CDPCQ04700OutBlock1', 'CDPCQ04700OutBlock2', 'CDPCQ04700OutBlock3', 'CDPCQ04700OutBlock4', 'CDPCQ04700OutBlock5'},
+    'CEXAQ21100': {'CEXAQ21100OutBlock1', 'CEXAQ21100OutBlock2', 'CEXAQ21100OutBlock3'},
+    'CEXAQ21200': {'CEXAQ21200OutBlock1', 'CEXAQ21200OutBlock2'},
+    'CEXAQ31100': {'CEXAQ31100OutBlock1', 'CEXAQ31100OutBlock2', 'CEXAQ31100OutBlock3'},
+    'CEXAQ31200': {'CEXAQ31200OutBlock1', 'CEXAQ31200OutBlock2', 'CEXAQ31200OutBlock3'},
+    'CEXAQ44200': {'CEXAQ44200OutBlock1', 'CEXAQ44200OutBlock2', 'CEXAQ44200OutBlock3'},
+    'CEXAT11100': {'CEXAT11100OutBlock1', 'CEXAT11100OutBlock2'},
+    'CEXAT11200': {'CEXAT11200OutBlock1', 'CEXAT11200OutBlock2'},
+    'CEXAT11300': {'CEXAT11300OutBlock1', 'CEXAT11300OutBlock2'},
+    'CFOAQ00600': {'CFOAQ00600OutBlock1', 'CFOAQ00600OutBlock2', 'CFOAQ00600OutBlock3'},
+    'CFOAQ10100': {'CFOAQ10100OutBlock1', 'CFOAQ10100OutBlock2'},
+    'CFOAT00100': {'CFOAT00100OutBlock1', 'CFOAT00100OutBlock2'},
+    'CFOAT00200': {'CFOAT00200OutBlock1', 'CFOAT00200OutBlock2'},
+    'CFOAT00300': {'CFOAT00300OutBlock1', 'CFOAT00300OutBlock2'},
+    'CFOBQ10500': {'CFOBQ10500OutBlock1', 'CFOBQ10500OutBlock2', 'CFOBQ10500OutBlock3'},
+    'CFOBQ10800': {'CFOBQ10800OutBlock1', 'CFOBQ10800OutBlock2'},
+    'CFOEQ11100': {'CFOEQ11100OutBlock1', 'CFOEQ11100OutBlock2'},
+    'CFOEQ82600': {'CFOEQ82600OutBlock1', 'CFOEQ82600OutBlock2', 'CFOEQ82600OutBlock3'},
+    'CFOFQ02400': {'CFOFQ02400OutBlock1', 'CFOFQ02400OutBlock2', 'CFOFQ02400OutBlock3', 'CFOFQ02400OutBlock4'},
+    'CIDBQ01400': {'CIDBQ01400OutBlock1', 'CIDBQ01400OutBlock2'},
+    'CIDBQ01500': {'CIDBQ01500OutBlock1', 'CIDBQ01500OutBlock2'},
+    'CIDBQ01800': {'CIDBQ01800OutBlock1', 'CIDBQ01800OutBlock2'},
+    'CIDBQ02400': {'CIDBQ02400OutBlock1', 'CIDBQ02400OutBlock2'},
+    'CIDBQ03000': {'CIDBQ03000OutBlock1', 'CIDBQ03000OutBlock2'},
+    'CIDBQ05300': {'CIDBQ05300OutBlock1', 'CIDBQ05300OutBlock2', 'CIDBQ05300OutBlock3'},
+    'CIDBT00100': {'CIDBT00100OutBlock1', 'CIDBT00100OutBlock2'},
+    'CIDBT00900': {'CIDBT00900OutBlock1', 'CIDBT00900OutBlock2'},
+    'CIDBT01000': {'CIDBT01000OutBlock1', 'CIDBT01000OutBlock2'},
+    'CIDEQ00800': {'CIDEQ00800OutBlock1', 'CIDEQ00800OutBlock2'},
+    'CLNAQ00100': {'CLNAQ00100OutBlock1', 'CLNAQ00100OutBlock2', 'CLNAQ00100OutBlock3'},
+    'CSPAQ00600': {'CSPAQ00600OutBlock1', 'CSPAQ00600OutBlock2'},
+    'CSPAQ12200': {'CSPAQ12200OutBlock1', 'CSPAQ12200OutBlock2'},
+    'CSPAQ12300': {'CSPAQ12300OutBlock1', 'CSPAQ12300OutBlock2', 'CSPAQ12300OutBlock3'},
+    'CSPAQ13700': {'CSPAQ13700OutBlock1', 'CSPAQ13700OutBlock2', 'CSPAQ13700OutBlock3'},
+    'CSPAQ22200': {'CSPAQ22200OutBlock1', 'CSPAQ22200OutBlock2'},
+    'CSPAT00600': {'CSPAT00600OutBlock1', 'CSPAT00600OutBlock2'},
+    'CSPAT00700': {'CSPAT00700OutBlock1', 'CSPAT00700OutBlock2'},
+    'CSPAT00800': {'CSPAT00800OutBlock1', 'CSPAT00800OutBlock2'},
+    'CSPBQ00200': {'CSPBQ00200OutBlock1', 'CSPBQ00200OutBlock2'},
+    'CUR': {'CUROutBlock'},
+    'ChartExcel': {'ChartExcelOutBlock', 'ChartExcelOutBlock1'},
+    'ChartIndex': {'ChartIndexOutBlock', 'ChartIndexOutBlock1'},
+    'DH1': {'DH1OutBlock'},
+    'DHA': {'DHAOutBlock'},
+    'DK3': {'DK3OutBlock'},
+    'DS3': {'DS3OutBlock'},
+    'DVI': {'DVIOutBlock'},
+    'EC0': {'EC0OutBlock'},
+    'EH0': {'EH0OutBlock'},
+    'ESN': {'ESNOutBlock'},
+    'EU0': {'EU0OutBlock'},
+    'EU1': {'EU1OutBlock'},
+    'EU2': {'EU2OutBlock'},
+    'FC0': {'FC0OutBlock'},
+    'FD0': {'FD0OutBlock'},
+    'FH0': {'FH0OutBlock'},
+    'FOCCQ33600': {'FOCCQ33600OutBlock1', 'FOCCQ33600OutBlock2', 'FOCCQ33600OutBlock3'},
+    'FOCCQ33700': {'FOCCQ33700OutBlock1', 'FOCCQ33700OutBlock2', 'FOCCQ33700OutBlock3'},
+    'FX0': {'FX0OutBlock'},
+    'H01': {'H01OutBlock'},
+    'JC0': {'JC0OutBlock'},
+    'JD0': {'JD0OutBlock'},
+    'JH0': {'JH0OutBlock'},
+    'JIF': {'JIFOutBlock'},
+    'JX0': {'JX0OutBlock'},
+    'MK2': {'MK2OutBlock'},
+    'MMDAQ91200': {'MMDAQ91200OutBlock1', 'MMDAQ91200OutBlock2'},
+    'NWS': {'NWSOutBlock'},
+    'O01': {'O01OutBlock'},
+    'OC0': {'OC0OutBlock'},
+    'OD0': {'OD0OutBlock'},
+    'OH0': {'OH0OutBlock'},
+    'OMG': {'OMGOutBlock'},
+    'OVC': {'OVCOutBlock'},
+    'OVH': {'OVHOutBlock'},
+    'OX0': {'OX0OutBlock'},
+    'SC0': {'SC0OutBlock'},
+    'SC1': {'SC1OutBlock'},
+    'SC2': {'SC2OutBlock'},
+    'SC3': {'SC3OutBlock'},
+    'SC4': {'SC4OutBlock'},
+    'SHC': {'SHCOutBlock'},
+    'SHD': {'SHDOutBlock'},
+    'SHI': {'SHIOutBlock'},
+    'SHO': {'SHOOutBlock'},
+    'TC1': {'TC1OutBlock'},
+    'TC2': {'TC2OutBlock'},
+    'TC3': {'TC3OutBlock'},
+    'WOC': {'WOCOutBlock'},
+    'WOH': {'WOHOutBlock'},
+    'YC3': {'YC3OutBlock'},
+    'YFC': {'YFCOutBlock'},
+    'YJC': {'YJCOutBlock'},
+    'YK3': {'YK3OutBlock'},
+    'YOC': {'YOCOutBlock'},
+    'YS3': {'YS3OutBlock'},
+    'o3101': {'o3101OutBlock'},
+    'o3103': {'o3103OutBlock', 'o3103OutBlock1'},
+    'o3104': {'o3104OutBlock1'},
+    'o3105': {'o3105OutBlock'},
+    'o3106': {'o3106OutBlock'},
+    'o3107': {'o3107OutBlock'},
+    'o3108': {'o3108OutBlock', 'o3108OutBlock1'},
+    'o3116': {'o3116OutBlock', 'o3116OutBlock1'},
+    'o3117': {'o3117OutBlock', 'o3117OutBlock1'},
+    'o3121': {'o3121OutBlock'},
+    'o3123': {'o3123OutBlock', 'o3123OutBlock1'},
+    'o3125': {'o3125OutBlock'},
+    'o3126': {'o3126OutBlock'},
+    'o3127': {'o3127OutBlock'},
+    'o3128': {'o3128OutBlock', 'o3128OutBlock1'},
+    'o3136': {'o3136OutBlock', 'o3136OutBlock1'},
+    'o3137': {'o3137OutBlock', 'o3137OutBlock1'},
+    'o3139': {'o3139OutBlock', 'o3139OutBlock1'},
+    't0150': {'t0150OutBlock', 't0150OutBlock1'},
+    't0151': {'t0151OutBlock', 't0151OutBlock1'},
+    't0167': {'t0167OutBlock'},
+    't0424': {'t0424OutBlock', 't0424OutBlock1'},
+    't0425': {'t0425OutBlock', 't0425OutBlock1'},
+    't0434': {'t0434OutBlock', 't0434OutBlock1'},
+    't0441': {'t0441OutBlock', 't0441OutBlock1'},
+    't1101': {'t1101OutBlock'},
+    't1102': {'t1102OutBlock'},
+    't1104': {'t1104OutBlock', 't1104OutBlock1'},
+    't1105': {'t1105OutBlock'},
+    't1109': {'t1109OutBlock', 't1109OutBlock1'},
+    't1301': {'t1301OutBlock', 't1301OutBlock1'},
+    't1302': {'t1302OutBlock', 't1302OutBlock1'},
+    't1305': {'t1305OutBlock', 't1305OutBlock1'},
+    't1308': {'t1308OutBlock1'},
+    't1310': {'t1310OutBlock', 't1310OutBlock1'},
+    't1403': {'t1403OutBlock', 't1403OutBlock1'},
+    't1404': {'t1404OutBlock', 't1404OutBlock1'},
+    't1405': {'t1405OutBlock', 't1405OutBlock1'},
+    't1410': {'t1410OutBlock', 't1410OutBlock1'},
+    't1411': {'t1411OutBlock', 't1411OutBlock1'},
+    't1422': {'t1422OutBlock', 't1422OutBlock1'},
+    't1427': {'t1427OutBlock', 't1427OutBlock1'},
+    't1441': {'t1441OutBlock', 't1441OutBlock1'},
+    't1442': {'t1442OutBlock', 't1442OutBlock1'},
+    't1444': {'t1444OutBlock', 't1444OutBlock1'},
+    't1449': {'t1449OutBlock', 't1449OutBlock1'},
+    't1452': {'t1452OutBlock', 't1452OutBlock1'},
+    't1463': {'t1463OutBlock', 't1463OutBlock1'},
+    't1466': {'t1466OutBlock', 't1466OutBlock1'},
+    't1471': {'t1471OutBlock', 't1471OutBlock1'},
+    't1475': {'t1475OutBlock', 't1475OutBlock1'},
+    't1481': {'t1481OutBlock', 't1481OutBlock1'},
+    't1482': {'t1482OutBlock', 't1482OutBlock1'},
+    't1485': {'t1485OutBlock', 't1485OutBlock1'},
+    't1486': {'t1486OutBlock', 't1486OutBlock1'},
+    't1488': {'t1488OutBlock', 't1488OutBlock1'},
+    't1489': {'t1489OutBlock', 't1489OutBlock1'},
+    't1492': {'t1492OutBlock', 't1492OutBlock1'},
+    't1511': {'t1511OutBlock'},
+    't1514': {'t1514OutBlock', 't1514OutBlock1'},
+    't1516': {'t1516OutBlock', 't1516OutBlock1'},
+    't1531': {'t1531OutBlock'},
+    't1532': {'t1532OutBlock'},
+    't1533': {'t1533OutBlock', 't1533OutBlock1'},
+    't1537': {'t1537OutBlock', 't1537OutBlock1'},
+    't1601': {'t1601OutBlock1', 't1601OutBlock2', 't1601OutBlock3', 't1601OutBlock4', 't1601OutBlock5', 't1601OutBlock6'},
+    't1602': {'t1602OutBlock', 't1602OutBlock1'},
+    't1603': {'t1603OutBlock', 't1603OutBlock1'},
+    't1615': {'t1615OutBlock', 't1615OutBlock1'},
+    't1617': {'t1617OutBlock', 't1617OutBlock1'},
+    't1621': {'t1621OutBlock', 't1621OutBlock1'},
+    't1631': {'t1631OutBlock', 't1631OutBlock1'},
+    't1632': {'t1632OutBlock', 't1632OutBlock1'},
+    't1633': {'t1633OutBlock', 't1633OutBlock1'},
+    't1636': {'t1636OutBlock', 't1636OutBlock1'},
+    't1637': {'t1637OutBlock', 't1637OutBlock1'},
+    't1638': {'t1638OutBlock'},
+    't1640': {'t1640OutBlock'},
+    't1662': {'t1662OutBlock'},
+    't1664': {'t1664OutBlock1'},
+    't1665': {'t1665OutBlock', 't1665OutBlock1'},
+    't1702': {'t1702OutBlock', 't1702OutBlock1'},
+    't1716': {'t1716OutBlock'},
+    't1717': {'t1717OutBlock'},
+    't1752': {'t1752OutBlock', 't1752OutBlock1'},
+    't1764': {'t1764OutBlock'},
+    't1771': {'t1771OutBlock', 't1771OutBlock2'},
+    't1809': {'t1809OutBlock', 't1809OutBlock1'},
+    't1825': {'t1825OutBlock', 't1825OutBlock1'},
+    't1826': {'t1826OutBlock'},
+    't1857': {'t1857OutBlock', 't1857OutBlock1'},
+    't1866': {'t1866OutBlock', 't1866OutBlock1'},
+    't1901': {'t1901OutBlock'},
+    't1902': {'t1902OutBlock', 't1902OutBlock1'},
+    't1903': {'t1903OutBlock', 't1903OutBlock1'},
+    't1904': {'t1904OutBlock', 't1904OutBlock1'},
+    't1906': {'t1906OutBlock'},
+    't1921': {'t1921OutBlock', 't1921OutBlock1'},
+    't1926': {'t1926OutBlock'},
+    't1927': {'t1927OutBlock', 't1927OutBlock1'},
+    't1941': {'t1941OutBlock1'},
+    't1950': {'t1950OutBlock', 't1950OutBlock1'},
+    't1951': {'t1951OutBlock', 't1951OutBlock1'},
+    't1954': {'t1954OutBlock', 't1954OutBlock1'},
+    't1956': {'t1956OutBlock', 't1956OutBlock1'},
+    't1958': {'t1958OutBlock', 't1958OutBlock1', 't1958OutBlock2'},
+    't1959': {'t1959OutBlock1'},
+    't1960': {'t1960OutBlock', 't1960OutBlock1'},
+    't1961': {'t1961OutBlock', 't1961OutBlock1'},
+    't1964': {'t1964OutBlock1'},
+    't1966': {'t1966OutBlock', 't1966OutBlock1'},
+    't1969': {'t1969OutBlock', 't1969OutBlock1'},
+    't1971': {'t1971OutBlock'},
+    't1972': {'t1972OutBlock'},
+    't1973': {'t1973OutBlock', 't1973OutBlock1'},
+    't1974': {'t1974OutBlock', 't1974OutBlock1'},
+    't1988': {'t1988OutBlock', 't1988OutBlock1'},
+    't2101': {'t2101OutBlock'},
+    't2105': {'t2105OutBlock'},
+    't2106': {'t2106OutBlock', 't2106OutBlock1'},
+    't2201': {'t2201OutBlock', 't2201OutBlock1'},
+    't2203': {'t2203OutBlock', 't2203OutBlock1'},
+    't2209': {'t2209OutBlock1'},
+    't2210': {'t2210OutBlock'},
+    't2301': {'t2301OutBlock', 't2301OutBlock1', 't2301OutBlock2'},
+    't2405': {'t2405OutBlock', 't2405OutBlock1'},
+    't2421': {'t2421OutBlock', 't2421OutBlock1'},
+    't2541': {'t2541OutBlock', 't2541OutBlock1'},
+    't2545': {'t2545OutBlock', 't2545OutBlock1'},
+    't2830': {'t2830OutBlock'},
+    't2831': {'t2831OutBlock'},
+    't2832': {'t2832OutBlock', 't2832OutBlock1'},
+    't2833': {'t2833OutBlock', 't2833OutBlock1'},
+    't2835': {'t2835OutBlock', 't2835OutBlock1', 't2835OutBlock2'},
+    't3102': {'t3102OutBlock', 't3102OutBlock1', 't3102OutBlock2'},
+    't3202': {'t3202OutBlock'},
+    't3320': {'t3320OutBlock', 't3320OutBlock1'},
+    't3341': {'t3341OutBlock', 't3341OutBlock1'},
+    't3401': {'t3401OutBlock', 't3401OutBlock1'},
+    't3518': {'t3518OutBlock', 't3518OutBlock1'},
+    't3521': {'t3521OutBlock'},
+    't4203': {'t4203OutBlock', 't4203OutBlock1'},
+    't8401': {'t8401OutBlock'},
+    't8402': {'t8402OutBlock'},
+    't8403': {'t8403OutBlock'},
+    't8404': {'t8404OutBlock', 't8404OutBlock1'},
+    't8405': {'t8405OutBlock', 't8405OutBlock1'},
+    't8406': {'t8406OutBlock1'},
+    't8407': {'t8407OutBlock1'},
+    't8410': {'t8410OutBlock', 't8410OutBlock1'},
+    't8411': {'t8411OutBlock', 't8411OutBlock1'},
+    't8412': {'t8412OutBlock', 't8412OutBlock1'},
+    't8414': {'t8414OutBlock', 't8414OutBlock1'},
+    't8415': {'t8415OutBlock', 't8415OutBlock1'},
+    't8416': {'t8416OutBlock', 't8416OutBlock1'},
+    't8417': {'t8417OutBlock', 't8417OutBlock1'},
+    't8418': {'t8418OutBlock', 't8418OutBlock1'},
+    't8419': {'t8419OutBlock', 't8419OutBlock1'},
+    't8424': {'t8424OutBlock'},
+    't8425': {'t8425OutBlock'},
+    't8426': {'t8426OutBlock'},
+    't8427': {'t8427OutBlock', 't8427OutBlock1'},
+    't8428': {'t8428OutBlock', 't8428OutBlock1'},
+    't8429': {'t8429OutBlock1'},
+    't8430': {'t8430OutBlock'},
+    't8431': {'t8431OutBlock'},
+    't8432': {'t8432OutBlock'},
+    't8433': {'t8433OutBlock'},
+    't8434': {'t8434OutBlock1'},
+    't8435': {'t8435OutBlock'},
+    't8436': {'t8436OutBlock'},
+    't8437': {'t8437OutBlock'},
+    't9905': {'t9905OutBlock1'},
+    't9907': {'t9907OutBlock1'},
+    't9942': {'t9942OutBlock'},
+    't9943': {'t9943OutBlock'},
+    't9944': {'t9944OutBlock'},
+    't9945': {'t9945OutBlock'},
+}
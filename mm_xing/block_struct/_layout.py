@@ -0,0 +1,2191 @@
+# type: ignore
+# Generated by res_converter.py - create_feed_layout  2026-10-18T18:37:24.739524
+
+FEED_LAYOUT = {'BMT': {'fields': [('tjjtime', 'char', '8'),
+                    ('tjjcode1', 'char', '4'),
+                    ('msvolume1', 'long', '8'),
+                    ('mdvolume1', 'long', '8'),
+                    ('msvol1', 'long', '8'),
+                    ('msvalue1', 'long', '6'),
+                    ('mdvalue1', 'long', '6'),
+                    ('msval1', 'long', '6'),
+                    ('tjjcode2', 'char', '4'),
+                    ('msvolume2', 'long', '8'),
+                    ('mdvolume2', 'long', '8'),
+                    ('msvol2', 'long', '8'),
+                    ('msvalue2', 'long', '6'),
+                    ('mdvalue2', 'long', '6'),
+                    ('msval2', 'long', '6'),
+                    ('tjjcode3', 'char', '4'),
+                    ('msvolume3', 'long', '8'),
+                    ('mdvolume3', 'long', '8'),
+                    ('msvol3', 'long', '8'),
+                    ('msvalue3', 'long', '6'),
+                    ('mdvalue3', 'long', '6'),
+                    ('msval3', 'long', '6'),
+                    ('tjjcode4', 'char', '4'),
+                    ('msvolume4', 'long', '8'),
+                    ('mdvolume4', 'long', '8'),
+                    ('msvol4', 'long', '8'),
+                    ('msvalue4', 'long', '6'),
+                    ('mdvalue4', 'long', '6'),
+                    ('msval4', 'long', '6'),
+                    ('tjjcode5', 'char', '4'),
+                    ('msvolume5', 'long', '8'),
+                    ('mdvolume5', 'long', '8'),
+                    ('msvol5', 'long', '8'),
+                    ('msvalue5', 'long', '6'),
+                    ('mdvalue5', 'long', '6'),
+                    ('msval5', 'long', '6'),
+                    ('tjjcode6', 'char', '4'),
+                    ('msvolume6', 'long', '8'),
+                    ('mdvolume6', 'long', '8'),
+                    ('msvol6', 'long', '8'),
+                    ('msvalue6', 'long', '6'),
+                    ('mdvalue6', 'long', '6'),
+                    ('msval6', 'long', '6'),
+                    ('tjjcode7', 'char', '4'),
+                    ('msvolume7', 'long', '8'),
+                    ('mdvolume7', 'long', '8'),
+                    ('msvol7', 'long', '8'),
+                    ('msvalue7', 'long', '6'),
+                    ('mdvalue7', 'long', '6'),
+                    ('msval7', 'long', '6'),
+                    ('tjjcode8', 'char', '4'),
+                    ('msvolume8', 'long', '8'),
+                    ('mdvolume8', 'long', '8'),
+                    ('msvol8', 'long', '8'),
+                    ('msvalue8', 'long', '6'),
+                    ('mdvalue8', 'long', '6'),
+                    ('msval8', 'long', '6'),
+                    ('tjjcode9', 'char', '4'),
+                    ('msvolume9', 'long', '8'),
+                    ('mdvolume9', 'long', '8'),
+                    ('msvol9', 'long', '8'),
+                    ('msvalue9', 'long', '6'),
+                    ('mdvalue9', 'long', '6'),
+                    ('msval9', 'long', '6'),
+                    ('tjjcode10', 'char', '4'),
+                    ('msvolume10', 'long', '8'),
+                    ('mdvolume10', 'long', '8'),
+                    ('msvol10', 'long', '8'),
+                    ('msvalue10', 'long', '6'),
+                    ('mdvalue10', 'long', '6'),
+                    ('msval10', 'long', '6'),
+                    ('tjjcode11', 'char', '4'),
+                    ('msvolume11', 'long', '8'),
+                    ('mdvolume11', 'long', '8'),
+                    ('msvol11', 'long', '8'),
+                    ('msvalue11', 'long', '6'),
+                    ('mdvalue11', 'long', '6'),
+                    ('msval11', 'long', '6'),
+                    ('upcode', 'char', '3'),
+                    ('tjjcode0', 'char', '4'),
+                    ('msvolume0', 'long', '8'),
+                    ('mdvolume0', 'long', '8'),
+                    ('msvol0', 'long', '8'),
+                    ('msvalue0', 'long', '6'),
+                    ('mdvalue0', 'long', '6'),
+                    ('msval0', 'long', '6')],
+         'key': 3},
+ 'C01': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('seq', 'long', '11'),
+                    ('trcode', 'char', '11'),
+                    ('megrpno', 'char', '2'),
+                    ('boardid', 'char', '2'),
+                    ('memberno', 'char', '5'),
+                    ('bpno', 'char', '5'),
+                    ('ordno', 'char', '10'),
+                    ('ordordno', 'char', '10'),
+                    ('expcode', 'char', '12'),
+                    ('yakseq', 'char', '11'),
+                    ('cheprice', 'float', '11.2'),
+                    ('chevol', 'long', '10'),
+                    ('sessionid', 'char', '2'),
+                    ('chedate', 'char', '8'),
+                    ('chetime', 'char', '9'),
+                    ('spdprc1', 'float', '11.2'),
+                    ('spdprc2', 'float', '11.2'),
+                    ('dosugb', 'char', '1'),
+                    ('accno1', 'char', '12'),
+                    ('sihogagb', 'char', '1'),
+                    ('jakino', 'char', '5'),
+                    ('daeyong', 'char', '12'),
+                    ('mem_filler', 'char', '7'),
+                    ('mem_accno', 'char', '11'),
+                    ('mem_filler1', 'char', '42')],
+         'key': 0},
+ 'CD0': {'fields': [('gubun', 'char', '1'),
+                    ('dy_gubun', 'char', '1'),
+                    ('dy_uplmtprice', 'float', '8.2'),
+                    ('dy_dnlmtprice', 'float', '8.2'),
+                    ('futcode', 'char', '8')],
+         'key': 8},
+ 'CUR': {'fields': [('time', 'char', '6'),
+                    ('offer', 'float', '7.2'),
+                    ('bid', 'float', '7.2'),
+                    ('open', 'float', '7.2'),
+                    ('high', 'float', '7.2'),
+                    ('low', 'float', '7.2'),
+                    ('price', 'float', '7.2'),
+                    ('sign', 'char', '1'),
+                    ('change', 'float', '7.2'),
+                    ('drate', 'float', '7.2'),
+                    ('ctime', 'char', '6'),
+                    ('base_id', 'char', '6')],
+         'key': 6},
+ 'DH1': {'fields': [('dan_hotime', 'char', '6'),
+                    ('dan_hstatus', 'char', '2'),
+                    ('dan_offerho1', 'long', '8'),
+                    ('dan_bidho1', 'long', '8'),
+                    ('dan_offerrem1', 'long', '12'),
+                    ('dan_bidrem1', 'long', '12'),
+                    ('dan_preoffercha1', 'long', '12'),
+                    ('dan_prebidcha1', 'long', '12'),
+                    ('dan_offerho2', 'long', '8'),
+                    ('dan_bidho2', 'long', '8'),
+                    ('dan_offerrem2', 'long', '12'),
+                    ('dan_bidrem2', 'long', '12'),
+                    ('dan_preoffercha2', 'long', '12'),
+                    ('dan_prebidcha2', 'long', '12'),
+                    ('dan_offerho3', 'long', '8'),
+                    ('dan_bidho3', 'long', '8'),
+                    ('dan_offerrem3', 'long', '12'),
+                    ('dan_bidrem3', 'long', '12'),
+                    ('dan_preoffercha3', 'long', '12'),
+                    ('dan_prebidcha3', 'long', '12'),
+                    ('dan_offerho4', 'long', '8'),
+                    ('dan_bidho4', 'long', '8'),
+                    ('dan_offerrem4', 'long', '12'),
+                    ('dan_bidrem4', 'long', '12'),
+                    ('dan_preoffercha4', 'long', '12'),
+                    ('dan_prebidcha4', 'long', '12'),
+                    ('dan_offerho5', 'long', '8'),
+                    ('dan_bidho5', 'long', '8'),
+                    ('dan_offerrem5', 'long', '12'),
+                    ('dan_bidrem5', 'long', '12'),
+                    ('dan_preoffercha5', 'long', '12'),
+                    ('dan_prebidcha5', 'long', '12'),
+                    ('dan_totofferrem', 'long', '12'),
+                    ('dan_totbidrem', 'long', '12'),
+                    ('dan_preoffercha', 'long', '12'),
+                    ('dan_prebidcha', 'long', '12'),
+                    ('dan_yeprice', 'long', '8'),
+                    ('dan_yevolume', 'long', '12'),
+                    ('dan_preysign', 'char', '1'),
+                    ('dan_preychange', 'long', '8'),
+                    ('dan_jnilysign', 'char', '1'),
+                    ('dan_jnilychange', 'long', '8'),
+                    ('shcode', 'char', '6'),
+                    ('volume', 'long', '12')],
+         'key': 6},
+ 'DHA': {'fields': [('dan_hotime', 'char', '6'),
+                    ('dan_hstatus', 'char', '2'),
+                    ('dan_offerho1', 'long', '8'),
+                    ('dan_bidho1', 'long', '8'),
+                    ('dan_offerrem1', 'long', '12'),
+                    ('dan_bidrem1', 'long', '12'),
+                    ('dan_preoffercha1', 'long', '12'),
+                    ('dan_prebidcha1', 'long', '12'),
+                    ('dan_offerho2', 'long', '8'),
+                    ('dan_bidho2', 'long', '8'),
+                    ('dan_offerrem2', 'long', '12'),
+                    ('dan_bidrem2', 'long', '12'),
+                    ('dan_preoffercha2', 'long', '12'),
+                    ('dan_prebidcha2', 'long', '12'),
+                    ('dan_offerho3', 'long', '8'),
+                    ('dan_bidho3', 'long', '8'),
+                    ('dan_offerrem3', 'long', '12'),
+                    ('dan_bidrem3', 'long', '12'),
+                    ('dan_preoffercha3', 'long', '12'),
+                    ('dan_prebidcha3', 'long', '12'),
+                    ('dan_offerho4', 'long', '8'),
+                    ('dan_bidho4', 'long', '8'),
+                    ('dan_offerrem4', 'long', '12'),
+                    ('dan_bidrem4', 'long', '12'),
+                    ('dan_preoffercha4', 'long', '12'),
+                    ('dan_prebidcha4', 'long', '12'),
+                    ('dan_offerho5', 'long', '8'),
+                    ('dan_bidho5', 'long', '8'),
+                    ('dan_offerrem5', 'long', '12'),
+                    ('dan_bidrem5', 'long', '12'),
+                    ('dan_preoffercha5', 'long', '12'),
+                    ('dan_prebidcha5', 'long', '12'),
+                    ('dan_totofferrem', 'long', '12'),
+                    ('dan_totbidrem', 'long', '12'),
+                    ('dan_preoffercha', 'long', '12'),
+                    ('dan_prebidcha', 'long', '12'),
+                    ('dan_yeprice', 'long', '8'),
+                    ('dan_yevolume', 'long', '12'),
+                    ('dan_preysign', 'char', '1'),
+                    ('dan_preychange', 'long', '8'),
+                    ('dan_jnilysign', 'char', '1'),
+                    ('dan_jnilychange', 'long', '8'),
+                    ('shcode', 'char', '6'),
+                    ('volume', 'long', '12')],
+         'key': 6},
+ 'DK3': {'fields': [('dan_chetime', 'char', '6'),
+                    ('dan_sign', 'char', '1'),
+                    ('dan_change', 'long', '8'),
+                    ('dan_drate', 'float', '6.2'),
+                    ('dan_price', 'long', '8'),
+                    ('dan_opentime', 'char', '6'),
+                    ('dan_open', 'long', '8'),
+                    ('dan_hightime', 'char', '6'),
+                    ('dan_high', 'long', '8'),
+                    ('dan_lowtime', 'char', '6'),
+                    ('dan_low', 'long', '8'),
+                    ('dan_cgubun', 'char', '1'),
+                    ('dan_cvolume', 'long', '8'),
+                    ('dan_volume', 'long', '12'),
+                    ('dan_value', 'long', '12'),
+                    ('dan_mdvolume', 'long', '12'),
+                    ('dan_mdchecnt', 'long', '8'),
+                    ('dan_msvolume', 'long', '12'),
+                    ('dan_mschecnt', 'long', '8'),
+                    ('dan_prevolume', 'long', '8'),
+                    ('dan_precvolume', 'long', '8'),
+                    ('dan_cpower', 'float', '9.2'),
+                    ('dan_status', 'char', '2'),
+                    ('shcode', 'char', '6')],
+         'key': 6},
+ 'DS3': {'fields': [('dan_chetime', 'char', '6'),
+                    ('dan_sign', 'char', '1'),
+                    ('dan_change', 'long', '8'),
+                    ('dan_drate', 'float', '6.2'),
+                    ('dan_price', 'long', '8'),
+                    ('dan_opentime', 'char', '6'),
+                    ('dan_open', 'long', '8'),
+                    ('dan_hightime', 'char', '6'),
+                    ('dan_high', 'long', '8'),
+                    ('dan_lowtime', 'char', '6'),
+                    ('dan_low', 'long', '8'),
+                    ('dan_cgubun', 'char', '1'),
+                    ('dan_cvolume', 'long', '8'),
+                    ('dan_volume', 'long', '12'),
+                    ('dan_value', 'long', '12'),
+                    ('dan_mdvolume', 'long', '12'),
+                    ('dan_mdchecnt', 'long', '8'),
+                    ('dan_msvolume', 'long', '12'),
+                    ('dan_mschecnt', 'long', '8'),
+                    ('dan_prevolume', 'long', '8'),
+                    ('dan_precvolume', 'long', '8'),
+                    ('dan_cpower', 'float', '9.2'),
+                    ('dan_status', 'char', '2'),
+                    ('shcode', 'char', '6')],
+         'key': 6},
+ 'DVI': {'fields': [('vi_gubun', 'char', '1'),
+                    ('svi_recprice', 'long', '8'),
+                    ('dvi_recprice', 'long', '8'),
+                    ('vi_trgprice', 'long', '8'),
+                    ('shcode', 'char', '6'),
+                    ('ref_shcode', 'char', '6'),
+                    ('time', 'char', '6')],
+         'key': 6},
+ 'EC0': {'fields': [('chetime', 'char', '6'),
+                    ('chetime1', 'char', '6'),
+                    ('sign', 'char', '1'),
+                    ('change', 'float', '6.2'),
+                    ('drate', 'float', '6.2'),
+                    ('price', 'float', '6.2'),
+                    ('open', 'float', '6.2'),
+                    ('high', 'float', '6.2'),
+                    ('low', 'float', '6.2'),
+                    ('cgubun', 'char', '1'),
+                    ('cvolume', 'long', '6'),
+                    ('volume', 'long', '12'),
+                    ('value', 'long', '12'),
+                    ('mdvolume', 'long', '12'),
+                    ('mdchecnt', 'long', '8'),
+                    ('msvolume', 'long', '12'),
+                    ('mschecnt', 'long', '8'),
+                    ('cpower', 'float', '9.2'),
+                    ('offerho1', 'float', '6.2'),
+                    ('bidho1', 'float', '6.2'),
+                    ('openyak', 'long', '8'),
+                    ('k200jisu', 'float', '6.2'),
+                    ('eqva', 'float', '7.2'),
+                    ('theoryprice', 'float', '6.2'),
+                    ('impv', 'float', '6.2'),
+                    ('openyakcha', 'long', '8'),
+                    ('timevalue', 'float', '6.2'),
+                    ('jgubun', 'char', '2'),
+                    ('jnilvolume', 'long', '12'),
+                    ('optcode', 'char', '8')],
+         'key': 8},
+ 'EH0': {'fields': [('hotime', 'char', '6'),
+                    ('hotime1', 'char', '6'),
+                    ('offerho1', 'double', '6.2'),
+                    ('bidho1', 'double', '6.2'),
+                    ('offerrem1', 'long', '7'),
+                    ('bidrem1', 'long', '7'),
+                    ('offercnt1', 'long', '5'),
+                    ('bidcnt1', 'long', '5'),
+                    ('offerho2', 'double', '6.2'),
+                    ('bidho2', 'double', '6.2'),
+                    ('offerrem2', 'long', '7'),
+                    ('bidrem2', 'long', '7'),
+                    ('offercnt2', 'long', '5'),
+                    ('bidcnt2', 'long', '5'),
+                    ('offerho3', 'double', '6.2'),
+                    ('bidho3', 'double', '6.2'),
+                    ('offerrem3', 'long', '7'),
+                    ('bidrem3', 'long', '7'),
+                    ('offercnt3', 'long', '5'),
+                    ('bidcnt3', 'long', '5'),
+                    ('offerho4', 'double', '6.2'),
+                    ('bidho4', 'double', '6.2'),
+                    ('offerrem4', 'long', '7'),
+                    ('bidrem4', 'long', '7'),
+                    ('offercnt4', 'long', '5'),
+                    ('bidcnt4', 'long', '5'),
+                    ('offerho5', 'double', '6.2'),
+                    ('bidho5', 'double', '6.2'),
+                    ('offerrem5', 'long', '7'),
+                    ('bidrem5', 'long', '7'),
+                    ('offercnt5', 'long', '5'),
+                    ('bidcnt5', 'long', '5'),
+                    ('totofferrem', 'long', '7'),
+                    ('totbidrem', 'long', '7'),
+                    ('totoffercnt', 'long', '5'),
+                    ('totbidcnt', 'long', '5'),
+                    ('optcode', 'char', '8'),
+                    ('danhochk', 'char', '1')],
+         'key': 8},
+ 'ESN': {'fields': [('time', 'char', '6'),
+                    ('theoryprice', 'float', '10.2'),
+                    ('delt', 'float', '7.6'),
+                    ('gama', 'float', '7.6'),
+                    ('ceta', 'float', '12.6'),
+                    ('vega', 'float', '12.6'),
+                    ('rhox', 'float', '12.6'),
+                    ('impv', 'float', '5.2'),
+                    ('egearing', 'float', '8.2'),
+                    ('shcode', 'char', '6'),
+                    ('elwclose', 'long', '8'),
+                    ('sign', 'char', '1'),
+                    ('change', 'long', '8'),
+                    ('date', 'char', '8'),
+                    ('tickvalue', 'float', '10.2'),
+                    ('lp_impv', 'float', '5.2')],
+         'key': 6},
+ 'EU0': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('trcode1', 'char', '4'),
+                    ('firmno', 'char', '3'),
+                    ('acntno', 'char', '11'),
+                    ('acntno1', 'char', '9'),
+                    ('acntnm', 'char', '40'),
+                    ('brnno', 'char', '3'),
+                    ('ordmktcode', 'char', '2'),
+                    ('ordno1', 'char', '3'),
+                    ('ordno', 'long', '7'),
+                    ('orgordno1', 'char', '3'),
+                    ('orgordno', 'long', '7'),
+                    ('prntordno', 'char', '3'),
+                    ('prntordno1', 'long', '7'),
+                    ('isuno', 'char', '12'),
+                    ('fnoIsuno', 'char', '8'),
+                    ('fnoIsunm', 'char', '40'),
+                    ('pdgrpcode', 'char', '2'),
+                    ('fnoIsuptntp', 'char', '1'),
+                    ('bnstp', 'char', '1'),
+                    ('mrctp', 'char', '1'),
+                    ('ordqty', 'long', '16'),
+                    ('hogatype', 'char', '2'),
+                    ('mmgb', 'char', '2'),
+                    ('ordprc', 'double', '13.2'),
+                    ('unercqty', 'long', '16'),
+                    ('commdacode', 'char', '2'),
+                    ('peeamtcode', 'char', '2'),
+                    ('mgempno', 'char', '9'),
+                    ('fnotrdunitamt', 'double', '19.8'),
+                    ('trxtime', 'char', '9'),
+                    ('strtgcode', 'char', '6'),
+                    ('grpId', 'char', '20'),
+                    ('ordseqno', 'char', '10'),
+                    ('ptflno', 'char', '10'),
+                    ('bskno', 'char', '10'),
+                    ('trchno', 'char', '10'),
+                    ('Itemno', 'char', '10'),
+                    ('OrderID', 'char', '16'),
+                    ('opdrtnno', 'char', '12'),
+                    ('rjtcode', 'char', '4'),
+                    ('mrccnfqty', 'long', '16'),
+                    ('orgordunercqty', 'long', '16'),
+                    ('orgordmrcqty', 'long', '16'),
+                    ('ctrcttime', 'char', '8'),
+                    ('ctrctno', 'char', '10'),
+                    ('execprc', 'double', '13.2'),
+                    ('execqty', 'long', '16'),
+                    ('newqty', 'long', '16'),
+                    ('qdtqty', 'long', '16'),
+                    ('lastqty', 'long', '16'),
+                    ('lallexecqty', 'long', '16'),
+                    ('allexecamt', 'long', '16'),
+                    ('fnobalevaltp', 'char', '1'),
+                    ('bnsplamt', 'long', '16'),
+                    ('fnoIsuno1', 'char', '8'),
+                    ('bnstp1', 'char', '1'),
+                    ('execprc1', 'double', '13.2'),
+                    ('newqty1', 'long', '16'),
+                    ('qdtqty1', 'long', '16'),
+                    ('allexecamt1', 'long', '16'),
+                    ('fnoIsuno2', 'char', '8'),
+                    ('bnstp2', 'char', '1'),
+                    ('execprc2', 'double', '13.2'),
+                    ('newqty2', 'long', '16'),
+                    ('lqdtqty2', 'long', '16'),
+                    ('allexecamt2', 'long', '16'),
+                    ('dps', 'long', '16'),
+                    ('ftsubtdsgnamt', 'long', '16'),
+                    ('mgn', 'long', '16'),
+                    ('mnymgn', 'long', '16'),
+                    ('ordableamt', 'long', '16'),
+                    ('mnyordableamt', 'long', '16'),
+                    ('fnoIsuno_1', 'char', '8'),
+                    ('bnstp_1', 'char', '1'),
+                    ('unsttqty_1', 'long', '16'),
+                    ('lqdtableqty_1', 'long', '16'),
+                    ('avrprc_1', 'double', '13.2'),
+                    ('fnoIsuno_2', 'char', '8'),
+                    ('bnstp_2', 'char', '1'),
+                    ('unsttqty_2', 'long', '16'),
+                    ('lqdtableqty_2', 'long', '16'),
+                    ('avrprc_2', 'double', '13.2')],
+         'key': 0},
+ 'EU1': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('trcode1', 'char', '4'),
+                    ('firmno', 'char', '3'),
+                    ('acntno', 'char', '11'),
+                    ('acntno1', 'char', '9'),
+                    ('acntnm', 'char', '40'),
+                    ('brnno', 'char', '3'),
+                    ('ordmktcode', 'char', '2'),
+                    ('ordno1', 'char', '3'),
+                    ('ordno', 'long', '7'),
+                    ('orgordno1', 'char', '3'),
+                    ('orgordno', 'long', '7'),
+                    ('prntordno', 'char', '3'),
+                    ('prntordno1', 'long', '7'),
+                    ('isuno', 'char', '12'),
+                    ('fnoIsuno', 'char', '8'),
+                    ('fnoIsunm', 'char', '40'),
+                    ('pdgrpcode', 'char', '2'),
+                    ('fnoIsuptntp', 'char', '1'),
+                    ('bnstp', 'char', '1'),
+                    ('mrctp', 'char', '1'),
+                    ('ordqty', 'long', '16'),
+                    ('hogatype', 'char', '2'),
+                    ('mmgb', 'char', '2'),
+                    ('ordprc', 'double', '13.2'),
+                    ('unercqty', 'long', '16'),
+                    ('commdacode', 'char', '2'),
+                    ('peeamtcode', 'char', '2'),
+                    ('mgempno', 'char', '9'),
+                    ('fnotrdunitamt', 'double', '19.8'),
+                    ('trxtime', 'char', '9'),
+                    ('strtgcode', 'char', '6'),
+                    ('grpId', 'char', '20'),
+                    ('ordseqno', 'char', '10'),
+                    ('ptflno', 'char', '10'),
+                    ('bskno', 'char', '10'),
+                    ('trchno', 'char', '10'),
+                    ('Itemno', 'char', '10'),
+                    ('OrderID', 'char', '16'),
+                    ('opdrtnno', 'char', '12'),
+                    ('rjtcode', 'char', '4'),
+                    ('mrccnfqty', 'long', '16'),
+                    ('orgordunercqty', 'long', '16'),
+                    ('orgordmrcqty', 'long', '16'),
+                    ('ctrcttime', 'char', '8'),
+                    ('ctrctno', 'char', '10'),
+                    ('execprc', 'double', '13.2'),
+                    ('execqty', 'long', '16'),
+                    ('newqty', 'long', '16'),
+                    ('qdtqty', 'long', '16'),
+                    ('lastqty', 'long', '16'),
+                    ('lallexecqty', 'long', '16'),
+                    ('allexecamt', 'long', '16'),
+                    ('fnobalevaltp', 'char', '1'),
+                    ('bnsplamt', 'long', '16'),
+                    ('fnoIsuno1', 'char', '8'),
+                    ('bnstp1', 'char', '1'),
+                    ('execprc1', 'double', '13.2'),
+                    ('newqty1', 'long', '16'),
+                    ('qdtqty1', 'long', '16'),
+                    ('allexecamt1', 'long', '16'),
+                    ('fnoIsuno2', 'char', '8'),
+                    ('bnstp2', 'char', '1'),
+                    ('execprc2', 'double', '13.2'),
+                    ('newqty2', 'long', '16'),
+                    ('lqdtqty2', 'long', '16'),
+                    ('allexecamt2', 'long', '16'),
+                    ('dps', 'long', '16'),
+                    ('ftsubtdsgnamt', 'long', '16'),
+                    ('mgn', 'long', '16'),
+                    ('mnymgn', 'long', '16'),
+                    ('ordableamt', 'long', '16'),
+                    ('mnyordableamt', 'long', '16'),
+                    ('fnoIsuno_1', 'char', '8'),
+                    ('bnstp_1', 'char', '1'),
+                    ('unsttqty_1', 'long', '16'),
+                    ('lqdtableqty_1', 'long', '16'),
+                    ('avrprc_1', 'double', '13.2'),
+                    ('fnoIsuno_2', 'char', '8'),
+                    ('bnstp_2', 'char', '1'),
+                    ('unsttqty_2', 'long', '16'),
+                    ('lqdtableqty_2', 'long', '16'),
+                    ('avrprc_2', 'double', '13.2')],
+         'key': 0},
+ 'EU2': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('trcode1', 'char', '4'),
+                    ('firmno', 'char', '3'),
+                    ('acntno', 'char', '11'),
+                    ('acntno1', 'char', '9'),
+                    ('acntnm', 'char', '40'),
+                    ('brnno', 'char', '3'),
+                    ('ordmktcode', 'char', '2'),
+                    ('ordno1', 'char', '3'),
+                    ('ordno', 'long', '7'),
+                    ('orgordno1', 'char', '3'),
+                    ('orgordno', 'long', '7'),
+                    ('prntordno', 'char', '3'),
+                    ('prntordno1', 'long', '7'),
+                    ('isuno', 'char', '12'),
+                    ('fnoIsuno', 'char', '8'),
+                    ('fnoIsunm', 'char', '40'),
+                    ('pdgrpcode', 'char', '2'),
+                    ('fnoIsuptntp', 'char', '1'),
+                    ('bnstp', 'char', '1'),
+                    ('mrctp', 'char', '1'),
+                    ('ordqty', 'long', '16'),
+                    ('hogatype', 'char', '2'),
+                    ('mmgb', 'char', '2'),
+                    ('ordprc', 'double', '13.2'),
+                    ('unercqty', 'long', '16'),
+                    ('commdacode', 'char', '2'),
+                    ('peeamtcode', 'char', '2'),
+                    ('mgempno', 'char', '9'),
+                    ('fnotrdunitamt', 'double', '19.8'),
+                    ('trxtime', 'char', '9'),
+                    ('strtgcode', 'char', '6'),
+                    ('grpId', 'char', '20'),
+                    ('ordseqno', 'char', '10'),
+                    ('ptflno', 'char', '10'),
+                    ('bskno', 'char', '10'),
+                    ('trchno', 'char', '10'),
+                    ('Itemno', 'char', '10'),
+                    ('OrderID', 'char', '16'),
+                    ('opdrtnno', 'char', '12'),
+                    ('rjtcode', 'char', '4'),
+                    ('mrccnfqty', 'long', '16'),
+                    ('orgordunercqty', 'long', '16'),
+                    ('orgordmrcqty', 'long', '16'),
+                    ('ctrcttime', 'char', '8'),
+                    ('ctrctno', 'char', '10'),
+                    ('execprc', 'double', '13.2'),
+                    ('execqty', 'long', '16'),
+                    ('newqty', 'long', '16'),
+                    ('qdtqty', 'long', '16'),
+                    ('lastqty', 'long', '16'),
+                    ('lallexecqty', 'long', '16'),
+                    ('allexecamt', 'long', '16'),
+                    ('fnobalevaltp', 'char', '1'),
+                    ('bnsplamt', 'long', '16'),
+                    ('fnoIsuno1', 'char', '8'),
+                    ('bnstp1', 'char', '1'),
+                    ('execprc1', 'double', '13.2'),
+                    ('newqty1', 'long', '16'),
+                    ('qdtqty1', 'long', '16'),
+                    ('allexecamt1', 'long', '16'),
+                    ('fnoIsuno2', 'char', '8'),
+                    ('bnstp2', 'char', '1'),
+                    ('execprc2', 'double', '13.2'),
+                    ('newqty2', 'long', '16'),
+                    ('lqdtqty2', 'long', '16'),
+                    ('allexecamt2', 'long', '16'),
+                    ('dps', 'long', '16'),
+                    ('ftsubtdsgnamt', 'long', '16'),
+                    ('mgn', 'long', '16'),
+                    ('mnymgn', 'long', '16'),
+                    ('ordableamt', 'long', '16'),
+                    ('mnyordableamt', 'long', '16'),
+                    ('fnoIsuno_1', 'char', '8'),
+                    ('bnstp_1', 'char', '1'),
+                    ('unsttqty_1', 'long', '16'),
+                    ('lqdtableqty_1', 'long', '16'),
+                    ('avrprc_1', 'double', '13.2'),
+                    ('fnoIsuno_2', 'char', '8'),
+                    ('bnstp_2', 'char', '1'),
+                    ('unsttqty_2', 'long', '16'),
+                    ('lqdtableqty_2', 'long', '16'),
+                    ('avrprc_2', 'double', '13.2')],
+         'key': 0},
+ 'FC0': {'fields': [('chetime', 'char', '6'),
+                    ('sign', 'char', '1'),
+                    ('change', 'float', '6.2'),
+                    ('drate', 'float', '6.2'),
+                    ('price', 'float', '6.2'),
+                    ('open', 'float', '6.2'),
+                    ('high', 'float', '6.2'),
+                    ('low', 'float', '6.2'),
+                    ('cgubun', 'char', '1'),
+                    ('cvolume', 'long', '6'),
+                    ('volume', 'long', '12'),
+                    ('value', 'long', '12'),
+                    ('mdvolume', 'long', '12'),
+                    ('mdchecnt', 'long', '8'),
+                    ('msvolume', 'long', '12'),
+                    ('mschecnt', 'long', '8'),
+                    ('cpower', 'float', '9.2'),
+                    ('offerho1', 'float', '6.2'),
+                    ('bidho1', 'float', '6.2'),
+                    ('openyak', 'long', '8'),
+                    ('k200jisu', 'float', '6.2'),
+                    ('theoryprice', 'float', '6.2'),
+                    ('kasis', 'float', '6.2'),
+                    ('sbasis', 'float', '6.2'),
+                    ('ibasis', 'float', '6.2'),
+                    ('openyakcha', 'long', '8'),
+                    ('jgubun', 'char', '2'),
+                    ('jnilvolume', 'long', '12'),
+                    ('futcode', 'char', '8')],
+         'key': 8},
+ 'FD0': {'fields': [('gubun', 'char', '1'),
+                    ('dy_gubun', 'char', '1'),
+                    ('dy_uplmtprice', 'float', '8.2'),
+                    ('dy_dnlmtprice', 'float', '8.2'),
+                    ('futcode', 'char', '8')],
+         'key': 8},
+ 'FH0': {'fields': [('hotime', 'char', '6'),
+                    ('offerho1', 'double', '6.2'),
+                    ('bidho1', 'double', '6.2'),
+                    ('offerrem1', 'long', '6'),
+                    ('bidrem1', 'long', '6'),
+                    ('offercnt1', 'long', '5'),
+                    ('bidcnt1', 'long', '5'),
+                    ('offerho2', 'double', '6.2'),
+                    ('bidho2', 'double', '6.2'),
+                    ('offerrem2', 'long', '6'),
+                    ('bidrem2', 'long', '6'),
+                    ('offercnt2', 'long', '5'),
+                    ('bidcnt2', 'long', '5'),
+                    ('offerho3', 'double', '6.2'),
+                    ('bidho3', 'double', '6.2'),
+                    ('offerrem3', 'long', '6'),
+                    ('bidrem3', 'long', '6'),
+                    ('offercnt3', 'long', '5'),
+                    ('bidcnt3', 'long', '5'),
+                    ('offerho4', 'double', '6.2'),
+                    ('bidho4', 'double', '6.2'),
+                    ('offerrem4', 'long', '6'),
+                    ('bidrem4', 'long', '6'),
+                    ('offercnt4', 'long', '5'),
+                    ('bidcnt4', 'long', '5'),
+                    ('offerho5', 'double', '6.2'),
+                    ('bidho5', 'double', '6.2'),
+                    ('offerrem5', 'long', '6'),
+                    ('bidrem5', 'long', '6'),
+                    ('offercnt5', 'long', '5'),
+                    ('bidcnt5', 'long', '5'),
+                    ('totofferrem', 'long', '6'),
+                    ('totbidrem', 'long', '6'),
+                    ('totoffercnt', 'long', '5'),
+                    ('totbidcnt', 'long', '5'),
+                    ('futcode', 'char', '8'),
+                    ('danhochk', 'char', '1'),
+                    ('alloc_gubun', 'char', '1')],
+         'key': 8},
+ 'FX0': {'fields': [('upstep', 'char', '2'),
+                    ('dnstep', 'char', '2'),
+                    ('uplmtprice', 'float', '6.2'),
+                    ('dnlmtprice', 'float', '6.2'),
+                    ('futcode', 'char', '8')],
+         'key': 8},
+ 'H01': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('seq', 'long', '11'),
+                    ('trcode', 'char', '11'),
+                    ('megrpno', 'char', '2'),
+                    ('boardid', 'char', '2'),
+                    ('memberno', 'char', '5'),
+                    ('bpno', 'char', '5'),
+                    ('ordno', 'char', '10'),
+                    ('ordordno', 'char', '10'),
+                    ('expcode', 'char', '12'),
+                    ('dosugb', 'char', '1'),
+                    ('mocagb', 'char', '1'),
+                    ('accno1', 'char', '12'),
+                    ('qty2', 'long', '10'),
+                    ('price', 'float', '11.2'),
+                    ('ordgb', 'char', '1'),
+                    ('hogagb', 'char', '1'),
+                    ('sihogagb', 'char', '11'),
+                    ('treaid', 'char', '5'),
+                    ('treacode', 'char', '1'),
+                    ('askcode', 'char', '2'),
+                    ('creditcode', 'char', '2'),
+                    ('jakigb', 'char', '2'),
+                    ('trustnum', 'char', '5'),
+                    ('ptgb', 'char', '2'),
+                    ('substocnum', 'char', '12'),
+                    ('accgb', 'char', '2'),
+                    ('accmarggb', 'char', '2'),
+                    ('nationcode', 'char', '3'),
+                    ('investgb', 'char', '4'),
+                    ('forecode', 'char', '2'),
+                    ('medcode', 'char', '1'),
+                    ('ordid', 'char', '12'),
+                    ('macid', 'char', '12'),
+                    ('orddate', 'char', '8'),
+                    ('rcvtime', 'char', '9'),
+                    ('mem_filler', 'char', '7'),
+                    ('mem_accno', 'char', '11'),
+                    ('mem_filler1', 'char', '42'),
+                    ('ordacpttm', 'char', '9'),
+                    ('qty', 'long', '10'),
+                    ('autogb', 'char', '1'),
+                    ('rejcode', 'char', '4'),
+                    ('prgordde', 'char', '1')],
+         'key': 0},
+ 'JC0': {'fields': [('futcode', 'char', '8'),
+                    ('chetime', 'char', '6'),
+                    ('sign', 'char', '1'),
+                    ('change', 'long', '10'),
+                    ('drate', 'double', '6.2'),
+                    ('price', 'long', '10'),
+                    ('open', 'long', '10'),
+                    ('high', 'long', '10'),
+                    ('low', 'long', '10'),
+                    ('cgubun', 'char', '1'),
+                    ('cvolume', 'long', '6'),
+                    ('volume', 'long', '12'),
+                    ('value', 'long', '15'),
+                    ('mdvolume', 'long', '12'),
+                    ('mdchecnt', 'long', '8'),
+                    ('msvolume', 'long', '12'),
+                    ('mschecnt', 'long', '8'),
+                    ('cpower', 'double', '9.2'),
+                    ('offerho1', 'long', '10'),
+                    ('bidho1', 'long', '10'),
+                    ('openyak', 'long', '8'),
+                    ('k200jisu', 'double', '6.2'),
+                    ('theoryprice', 'long', '8'),
+                    ('kasis', 'double', '6.3'),
+                    ('sbasis', 'long', '6'),
+                    ('ibasis', 'long', '6'),
+                    ('openyakcha', 'long', '8'),
+                    ('jgubun', 'char', '2'),
+                    ('jnilvolume', 'long', '12'),
+                    ('basprice', 'long', '8')],
+         'key': 8},
+ 'JD0': {'fields': [('gubun', 'char', '1'),
+                    ('dy_gubun', 'char', '1'),
+                    ('dy_uplmtprice', 'long', '10'),
+                    ('dy_dnlmtprice', 'long', '10'),
+                    ('futcode', 'char', '8')],
+         'key': 8},
+ 'JH0': {'fields': [('futcode', 'char', '8'),
+                    ('hotime', 'char', '6'),
+                    ('offerho1', 'long', '10'),
+                    ('bidho1', 'long', '10'),
+                    ('offerrem1', 'long', '7'),
+                    ('bidrem1', 'long', '7'),
+                    ('offercnt1', 'long', '5'),
+                    ('bidcnt1', 'long', '5'),
+                    ('offerho2', 'long', '10'),
+                    ('bidho2', 'long', '10'),
+                    ('offerrem2', 'long', '7'),
+                    ('bidrem2', 'long', '7'),
+                    ('offercnt2', 'long', '5'),
+                    ('bidcnt2', 'long', '5'),
+                    ('offerho3', 'long', '10'),
+                    ('bidho3', 'long', '10'),
+                    ('offerrem3', 'long', '7'),
+                    ('bidrem3', 'long', '7'),
+                    ('offercnt3', 'long', '5'),
+                    ('bidcnt3', 'long', '5'),
+                    ('offerho4', 'long', '10'),
+                    ('bidho4', 'long', '10'),
+                    ('offerrem4', 'long', '7'),
+                    ('bidrem4', 'long', '7'),
+                    ('offercnt4', 'long', '5'),
+                    ('bidcnt4', 'long', '5'),
+                    ('offerho5', 'long', '10'),
+                    ('bidho5', 'long', '10'),
+                    ('offerrem5', 'long', '7'),
+                    ('bidrem5', 'long', '7'),
+                    ('offercnt5', 'long', '5'),
+                    ('bidcnt5', 'long', '5'),
+                    ('offerho6', 'long', '10'),
+                    ('bidho6', 'long', '10'),
+                    ('offerrem6', 'long', '7'),
+                    ('bidrem6', 'long', '7'),
+                    ('offercnt6', 'long', '5'),
+                    ('bidcnt6', 'long', '5'),
+                    ('offerho7', 'long', '10'),
+                    ('bidho7', 'long', '10'),
+                    ('offerrem7', 'long', '7'),
+                    ('bidrem7', 'long', '7'),
+                    ('offercnt7', 'long', '5'),
+                    ('bidcnt7', 'long', '5'),
+                    ('offerho8', 'long', '10'),
+                    ('bidho8', 'long', '10'),
+                    ('offerrem8', 'long', '7'),
+                    ('bidrem8', 'long', '7'),
+                    ('offercnt8', 'long', '5'),
+                    ('bidcnt8', 'long', '5'),
+                    ('offerho9', 'long', '10'),
+                    ('bidho9', 'long', '10'),
+                    ('offerrem9', 'long', '7'),
+                    ('bidrem9', 'long', '7'),
+                    ('offercnt9', 'long', '5'),
+                    ('bidcnt9', 'long', '5'),
+                    ('offerho10', 'long', '10'),
+                    ('bidho10', 'long', '10'),
+                    ('offerrem10', 'long', '7'),
+                    ('bidrem10', 'long', '7'),
+                    ('offercnt10', 'long', '5'),
+                    ('bidcnt10', 'long', '5'),
+                    ('totofferrem', 'long', '8'),
+                    ('totbidrem', 'long', '8'),
+                    ('totoffercnt', 'long', '5'),
+                    ('totbidcnt', 'long', '5'),
+                    ('danhochk', 'char', '1'),
+                    ('alloc_gubun', 'char', '1')],
+         'key': 8},
+ 'JIF': {'fields': [('jangubun', 'char', '1'), ('jstatus', 'char', '2')], 'key': 1},
+ 'JX0': {'fields': [('upstep', 'char', '2'),
+                    ('dnstep', 'char', '2'),
+                    ('uplmtprice', 'long', '10'),
+                    ('dnlmtprice', 'long', '10'),
+                    ('futcode', 'char', '8')],
+         'key': 8},
+ 'MK2': {'fields': [('date', 'char', '8'),
+                    ('time', 'char', '6'),
+                    ('kodate', 'char', '8'),
+                    ('kotime', 'char', '6'),
+                    ('open', 'float', '9.2'),
+                    ('high', 'float', '9.2'),
+                    ('low', 'float', '9.2'),
+                    ('price', 'float', '9.2'),
+                    ('sign', 'char', '1'),
+                    ('change', 'float', '9.2'),
+                    ('uprate', 'float', '9.2'),
+                    ('bidho', 'float', '9.2'),
+                    ('bidrem', 'long', '9'),
+                    ('offerho', 'float', '9.2'),
+                    ('offerrem', 'long', '9'),
+                    ('volume', 'float', '12.0'),
+                    ('xsymbol', 'char', '16'),
+                    ('cvolume', 'float', '8.0')],
+         'key': 16},
+ 'NWS': {'fields': [('date', 'char', '8'),
+                    ('time', 'char', '6'),
+                    ('id', 'char', '2'),
+                    ('realkey', 'char', '24'),
+                    ('title', 'char', '300'),
+                    ('code', 'char', '240'),
+                    ('bodysize', 'long', '8')],
+         'key': 6},
+ 'O01': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('trcode1', 'char', '4'),
+                    ('firmno', 'char', '3'),
+                    ('acntno', 'char', '11'),
+                    ('acntno1', 'char', '9'),
+                    ('acntnm', 'char', '40'),
+                    ('brnno', 'char', '3'),
+                    ('ordmktcode', 'char', '2'),
+                    ('ordno1', 'char', '3'),
+                    ('ordno', 'long', '7'),
+                    ('orgordno1', 'char', '3'),
+                    ('orgordno', 'long', '7'),
+                    ('prntordno', 'char', '3'),
+                    ('prntordno1', 'long', '7'),
+                    ('isuno', 'char', '12'),
+                    ('fnoIsuno', 'char', '8'),
+                    ('fnoIsunm', 'char', '40'),
+                    ('pdgrpcode', 'char', '2'),
+                    ('fnoIsuptntp', 'char', '1'),
+                    ('bnstp', 'char', '1'),
+                    ('mrctp', 'char', '1'),
+                    ('ordqty', 'long', '16'),
+                    ('hogatype', 'char', '2'),
+                    ('mmgb', 'char', '2'),
+                    ('ordprc', 'double', '13.2'),
+                    ('unercqty', 'long', '16'),
+                    ('commdacode', 'char', '2'),
+                    ('peeamtcode', 'char', '2'),
+                    ('mgempno', 'char', '9'),
+                    ('fnotrdunitamt', 'double', '19.8'),
+                    ('trxtime', 'char', '9'),
+                    ('strtgcode', 'char', '6'),
+                    ('grpId', 'char', '20'),
+                    ('ordseqno', 'char', '10'),
+                    ('ptflno', 'char', '10'),
+                    ('bskno', 'char', '10'),
+                    ('trchno', 'char', '10'),
+                    ('Itemno', 'char', '10'),
+                    ('userId', 'char', '16'),
+                    ('opdrtnno', 'char', '12'),
+                    ('rjtcode', 'char', '3'),
+                    ('mrccnfqty', 'long', '16'),
+                    ('orgordunercqty', 'long', '16'),
+                    ('orgordmrcqty', 'long', '16'),
+                    ('ctrcttime', 'char', '8'),
+                    ('ctrctno', 'char', '10'),
+                    ('execprc', 'double', '13.2'),
+                    ('execqty', 'long', '16'),
+                    ('newqty', 'long', '16'),
+                    ('qdtqty', 'long', '16'),
+                    ('lastqty', 'long', '16'),
+                    ('lallexecqty', 'long', '16'),
+                    ('allexecamt', 'long', '16'),
+                    ('fnobalevaltp', 'char', '1'),
+                    ('bnsplamt', 'long', '16'),
+                    ('fnoIsuno1', 'char', '8'),
+                    ('bnstp1', 'char', '1'),
+                    ('execprc1', 'double', '13.2'),
+                    ('newqty1', 'long', '16'),
+                    ('qdtqty1', 'long', '16'),
+                    ('allexecamt1', 'long', '16'),
+                    ('fnoIsuno2', 'char', '8'),
+                    ('bnstp2', 'char', '1'),
+                    ('execprc2', 'double', '13.2'),
+                    ('newqty2', 'long', '16'),
+                    ('lqdtqty2', 'long', '16'),
+                    ('allexecamt2', 'long', '16'),
+                    ('dps', 'long', '16'),
+                    ('ftsubtdsgnamt', 'long', '16'),
+                    ('mgn', 'long', '16'),
+                    ('mnymgn', 'long', '16'),
+                    ('ordableamt', 'long', '16'),
+                    ('mnyordableamt', 'long', '16'),
+                    ('fnoIsuno_1', 'char', '8'),
+                    ('bnstp_1', 'char', '1'),
+                    ('unsttqty_1', 'long', '16'),
+                    ('lqdtableqty_1', 'long', '16'),
+                    ('avrprc_1', 'double', '13.2'),
+                    ('fnoIsuno_2', 'char', '8'),
+                    ('bnstp_2', 'char', '1'),
+                    ('unsttqty_2', 'long', '16'),
+                    ('lqdtableqty_2', 'long', '16'),
+                    ('avrprc_2', 'double', '13.2')],
+         'key': 0},
+ 'OC0': {'fields': [('chetime', 'char', '6'),
+                    ('sign', 'char', '1'),
+                    ('change', 'float', '6.2'),
+                    ('drate', 'float', '6.2'),
+                    ('price', 'float', '6.2'),
+                    ('open', 'float', '6.2'),
+                    ('high', 'float', '6.2'),
+                    ('low', 'float', '6.2'),
+                    ('cgubun', 'char', '1'),
+                    ('cvolume', 'long', '6'),
+                    ('volume', 'long', '12'),
+                    ('value', 'long', '12'),
+                    ('mdvolume', 'long', '12'),
+                    ('mdchecnt', 'long', '8'),
+                    ('msvolume', 'long', '12'),
+                    ('mschecnt', 'long', '8'),
+                    ('cpower', 'float', '9.2'),
+                    ('offerho1', 'float', '6.2'),
+                    ('bidho1', 'float', '6.2'),
+                    ('openyak', 'long', '8'),
+                    ('k200jisu', 'float', '6.2'),
+                    ('eqva', 'float', '7.2'),
+                    ('theoryprice', 'float', '6.2'),
+                    ('impv', 'float', '6.2'),
+                    ('openyakcha', 'long', '8'),
+                    ('timevalue', 'float', '6.2'),
+                    ('jgubun', 'char', '2'),
+                    ('jnilvolume', 'long', '12'),
+                    ('optcode', 'char', '8')],
+         'key': 8},
+ 'OD0': {'fields': [('gubun', 'char', '1'),
+                    ('dy_gubun', 'char', '1'),
+                    ('dy_uplmtprice', 'float', '8.2'),
+                    ('dy_dnlmtprice', 'float', '8.2'),
+                    ('opttcode', 'char', '8')],
+         'key': 8},
+ 'OH0': {'fields': [('hotime', 'char', '6'),
+                    ('offerho1', 'double', '6.2'),
+                    ('bidho1', 'double', '6.2'),
+                    ('offerrem1', 'long', '7'),
+                    ('bidrem1', 'long', '7'),
+                    ('offercnt1', 'long', '5'),
+                    ('bidcnt1', 'long', '5'),
+                    ('offerho2', 'double', '6.2'),
+                    ('bidho2', 'double', '6.2'),
+                    ('offerrem2', 'long', '7'),
+                    ('bidrem2', 'long', '7'),
+                    ('offercnt2', 'long', '5'),
+                    ('bidcnt2', 'long', '5'),
+                    ('offerho3', 'double', '6.2'),
+                    ('bidho3', 'double', '6.2'),
+                    ('offerrem3', 'long', '7'),
+                    ('bidrem3', 'long', '7'),
+                    ('offercnt3', 'long', '5'),
+                    ('bidcnt3', 'long', '5'),
+                    ('offerho4', 'double', '6.2'),
+                    ('bidho4', 'double', '6.2'),
+                    ('offerrem4', 'long', '7'),
+                    ('bidrem4', 'long', '7'),
+                    ('offercnt4', 'long', '5'),
+                    ('bidcnt4', 'long', '5'),
+                    ('offerho5', 'double', '6.2'),
+                    ('bidho5', 'double', '6.2'),
+                    ('offerrem5', 'long', '7'),
+                    ('bidrem5', 'long', '7'),
+                    ('offercnt5', 'long', '5'),
+                    ('bidcnt5', 'long', '5'),
+                    ('totofferrem', 'long', '7'),
+                    ('totbidrem', 'long', '7'),
+                    ('totoffercnt', 'long', '5'),
+                    ('totbidcnt', 'long', '5'),
+                    ('optcode', 'char', '8'),
+                    ('danhochk', 'char', '1'),
+                    ('alloc_gubun', 'char', '1')],
+         'key': 8},
+ 'OMG': {'fields': [('chetime', 'char', '6'),
+                    ('actprice', 'float', '6.2'),
+                    ('k200jisu', 'float', '6.2'),
+                    ('fut200jisu', 'float', '6.2'),
+                    ('price', 'float', '6.2'),
+                    ('capimpv', 'float', '6.2'),
+                    ('impv', 'float', '6.2'),
+                    ('delt', 'float', '7.4'),
+                    ('gama', 'float', '7.4'),
+                    ('ceta', 'float', '7.4'),
+                    ('vega', 'float', '7.4'),
+                    ('rhox', 'float', '7.4'),
+                    ('theoryprice', 'float', '6.2'),
+                    ('bimpv', 'float', '6.2'),
+                    ('offerimpv', 'float', '6.2'),
+                    ('bidimpv', 'float', '6.2'),
+                    ('optcode', 'char', '8')],
+         'key': 8},
+ 'OVC': {'fields': [('symbol', 'char', '8'),
+                    ('ovsdate', 'char', '8'),
+                    ('kordate', 'char', '8'),
+                    ('trdtm', 'char', '6'),
+                    ('kortm', 'char', '6'),
+                    ('curpr', 'double', '15.9'),
+                    ('ydiffpr', 'double', '15.9'),
+                    ('ydiffSign', 'char', '1'),
+                    ('open', 'double', '15.9'),
+                    ('high', 'double', '15.9'),
+                    ('low', 'double', '15.9'),
+                    ('chgrate', 'float', '6.2'),
+                    ('trdq', 'long', '10'),
+                    ('totq', 'char', '15'),
+                    ('cgubun', 'char', '1'),
+                    ('mdvolume', 'char', '15'),
+                    ('msvolume', 'char', '15'),
+                    ('ovsmkend', 'char', '8')],
+         'key': 8},
+ 'OVH': {'fields': [('symbol', 'char', '8'),
+                    ('hotime', 'char', '6'),
+                    ('offerho1', 'double', '15.9'),
+                    ('bidho1', 'double', '15.9'),
+                    ('offerrem1', 'long', '10'),
+                    ('bidrem1', 'long', '10'),
+                    ('offerno1', 'long', '10'),
+                    ('bidno1', 'long', '10'),
+                    ('offerho2', 'double', '15.9'),
+                    ('bidho2', 'double', '15.9'),
+                    ('offerrem2', 'long', '10'),
+                    ('bidrem2', 'long', '10'),
+                    ('offerno2', 'long', '10'),
+                    ('bidno2', 'long', '10'),
+                    ('offerho3', 'double', '15.9'),
+                    ('bidho3', 'double', '15.9'),
+                    ('offerrem3', 'long', '10'),
+                    ('bidrem3', 'long', '10'),
+                    ('offerno3', 'long', '10'),
+                    ('bidno3', 'long', '10'),
+                    ('offerho4', 'double', '15.9'),
+                    ('bidho4', 'double', '15.9'),
+                    ('offerrem4', 'long', '10'),
+                    ('bidrem4', 'long', '10'),
+                    ('offerno4', 'long', '10'),
+                    ('bidno4', 'long', '10'),
+                    ('offerho5', 'double', '15.9'),
+                    ('bidho5', 'double', '15.9'),
+                    ('offerrem5', 'long', '10'),
+                    ('bidrem5', 'long', '10'),
+                    ('offerno5', 'long', '10'),
+                    ('bidno5', 'long', '10'),
+                    ('totoffercnt', 'long', '10'),
+                    ('totbidcnt', 'long', '10'),
+                    ('totofferrem', 'long', '10'),
+                    ('totbidrem', 'long', '10')],
+         'key': 8},
+ 'OX0': {'fields': [('upstep', 'char', '2'),
+                    ('dnstep', 'char', '2'),
+                    ('uplmtprice', 'float', '6.2'),
+                    ('dnlmtprice', 'float', '6.2'),
+                    ('opttcode', 'char', '8')],
+         'key': 8},
+ 'SC0': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('ordchegb', 'char', '2'),
+                    ('marketgb', 'char', '2'),
+                    ('ordgb', 'char', '2'),
+                    ('orgordno', 'long', '10'),
+                    ('accno1', 'char', '11'),
+                    ('accno2', 'char', '9'),
+                    ('passwd', 'char', '8'),
+                    ('expcode', 'char', '12'),
+                    ('shtcode', 'char', '9'),
+                    ('hname', 'char', '40'),
+                    ('ordqty', 'long', '16'),
+                    ('ordprice', 'long', '13'),
+                    ('hogagb', 'char', '1'),
+                    ('etfhogagb', 'char', '2'),
+                    ('pgmtype', 'long', '2'),
+                    ('gmhogagb', 'long', '1'),
+                    ('gmhogayn', 'long', '1'),
+                    ('singb', 'char', '3'),
+                    ('loandt', 'char', '8'),
+                    ('cvrgordtp', 'char', '1'),
+                    ('strtgcode', 'char', '6'),
+                    ('groupid', 'char', '20'),
+                    ('ordseqno', 'long', '10'),
+                    ('prtno', 'long', '10'),
+                    ('basketno', 'long', '10'),
+                    ('trchno', 'long', '10'),
+                    ('itemno', 'long', '10'),
+                    ('brwmgmyn', 'long', '1'),
+                    ('mbrno', 'long', '3'),
+                    ('procgb', 'char', '1'),
+                    ('admbrchno', 'char', '3'),
+                    ('futaccno', 'char', '20'),
+                    ('futmarketgb', 'char', '1'),
+                    ('tongsingb', 'char', '2'),
+                    ('lpgb', 'char', '1'),
+                    ('dummy', 'char', '20'),
+                    ('ordno', 'long', '10'),
+                    ('ordtm', 'char', '9'),
+                    ('prntordno', 'long', '10'),
+                    ('mgempno', 'char', '9'),
+                    ('orgordundrqty', 'long', '16'),
+                    ('orgordmdfyqty', 'long', '16'),
+                    ('ordordcancelqty', 'long', '16'),
+                    ('nmcpysndno', 'long', '10'),
+                    ('ordamt', 'long', '16'),
+                    ('bnstp', 'char', '1'),
+                    ('spareordno', 'long', '10'),
+                    ('cvrgseqno', 'long', '10'),
+                    ('rsvordno', 'long', '10'),
+                    ('mtordseqno', 'long', '10'),
+                    ('spareordqty', 'long', '16'),
+                    ('orduserid', 'char', '16'),
+                    ('spotordqty', 'long', '16'),
+                    ('ordruseqty', 'long', '16'),
+                    ('mnyordamt', 'long', '16'),
+                    ('ordsubstamt', 'long', '16'),
+                    ('ruseordamt', 'long', '16'),
+                    ('ordcmsnamt', 'long', '16'),
+                    ('crdtuseamt', 'long', '16'),
+                    ('secbalqty', 'long', '16'),
+                    ('spotordableqty', 'long', '16'),
+                    ('ordableruseqty', 'long', '16'),
+                    ('flctqty', 'long', '16'),
+                    ('secbalqtyd2', 'long', '16'),
+                    ('sellableqty', 'long', '16'),
+                    ('unercsellordqty', 'long', '16'),
+                    ('avrpchsprc', 'long', '13'),
+                    ('pchsamt', 'long', '16'),
+                    ('deposit', 'long', '16'),
+                    ('substamt', 'long', '16'),
+                    ('csgnmnymgn', 'long', '16'),
+                    ('csgnsubstmgn', 'long', '16'),
+                    ('crdtpldgruseamt', 'long', '16'),
+                    ('ordablemny', 'long', '16'),
+                    ('ordablesubstamt', 'long', '16'),
+                    ('ruseableamt', 'long', '16')],
+         'key': 0},
+ 'SC1': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('ordxctptncode', 'char', '2'),
+                    ('ordmktcode', 'char', '2'),
+                    ('ordptncode', 'char', '2'),
+                    ('mgmtbrnno', 'char', '3'),
+                    ('accno1', 'char', '11'),
+                    ('accno2', 'char', '9'),
+                    ('acntnm', 'char', '40'),
+                    ('Isuno', 'char', '12'),
+                    ('Isunm', 'char', '40'),
+                    ('ordno', 'long', '10'),
+                    ('orgordno', 'long', '10'),
+                    ('execno', 'long', '10'),
+                    ('ordqty', 'long', '16'),
+                    ('ordprc', 'long', '13'),
+                    ('execqty', 'long', '16'),
+                    ('execprc', 'long', '13'),
+                    ('mdfycnfqty', 'long', '16'),
+                    ('mdfycnfprc', 'long', '16'),
+                    ('canccnfqty', 'long', '16'),
+                    ('rjtqty', 'long', '16'),
+                    ('ordtrxptncode', 'long', '4'),
+                    ('mtiordseqno', 'long', '10'),
+                    ('ordcndi', 'char', '1'),
+                    ('ordprcptncode', 'char', '2'),
+                    ('nsavtrdqty', 'long', '16'),
+                    ('shtnIsuno', 'char', '9'),
+                    ('opdrtnno', 'char', '12'),
+                    ('cvrgordtp', 'char', '1'),
+                    ('unercqty', 'long', '16'),
+                    ('orgordunercqty', 'long', '16'),
+                    ('orgordmdfyqty', 'long', '16'),
+                    ('orgordcancqty', 'long', '16'),
+                    ('ordavrexecprc', 'long', '13'),
+                    ('ordamt', 'long', '16'),
+                    ('stdIsuno', 'char', '12'),
+                    ('bfstdIsuno', 'char', '12'),
+                    ('bnstp', 'char', '1'),
+                    ('ordtrdptncode', 'char', '2'),
+                    ('mgntrncode', 'char', '3'),
+                    ('adduptp', 'char', '2'),
+                    ('commdacode', 'char', '2'),
+                    ('Loandt', 'char', '8'),
+                    ('mbrnmbrno', 'long', '3'),
+                    ('ordacntno', 'char', '20'),
+                    ('agrgbrnno', 'char', '3'),
+                    ('mgempno', 'char', '9'),
+                    ('futsLnkbrnno', 'char', '3'),
+                    ('futsLnkacntno', 'char', '20'),
+                    ('futsmkttp', 'char', '1'),
+                    ('regmktcode', 'char', '2'),
+                    ('mnymgnrat', 'long', '7'),
+                    ('substmgnrat', 'long', '9'),
+                    ('mnyexecamt', 'long', '16'),
+                    ('ubstexecamt', 'long', '16'),
+                    ('cmsnamtexecamt', 'long', '16'),
+                    ('crdtpldgexecamt', 'long', '16'),
+                    ('crdtexecamt', 'long', '16'),
+                    ('prdayruseexecval', 'long', '16'),
+                    ('crdayruseexecval', 'long', '16'),
+                    ('spotexecqty', 'long', '16'),
+                    ('stslexecqty', 'long', '16'),
+                    ('strtgcode', 'char', '6'),
+                    ('grpId', 'char', '20'),
+                    ('ordseqno', 'long', '10'),
+                    ('ptflno', 'long', '10'),
+                    ('bskno', 'long', '10'),
+                    ('trchno', 'long', '10'),
+                    ('itemno', 'long', '10'),
+                    ('orduserId', 'char', '16'),
+                    ('brwmgmtYn', 'long', '1'),
+                    ('frgrunqno', 'char', '6'),
+                    ('trtzxLevytp', 'char', '1'),
+                    ('lptp', 'char', '1'),
+                    ('exectime', 'char', '9'),
+                    ('rcptexectime', 'char', '9'),
+                    ('rmndLoanamt', 'long', '16'),
+                    ('secbalqty', 'long', '16'),
+                    ('spotordableqty', 'long', '16'),
+                    ('ordableruseqty', 'long', '16'),
+                    ('flctqty', 'long', '16'),
+                    ('secbalqtyd2', 'long', '16'),
+                    ('sellableqty', 'long', '16'),
+                    ('unercsellordqty', 'long', '16'),
+                    ('avrpchsprc', 'long', '13'),
+                    ('pchsant', 'long', '16'),
+                    ('deposit', 'long', '16'),
+                    ('substamt', 'long', '16'),
+                    ('csgnmnymgn', 'long', '16'),
+                    ('csgnsubstmgn', 'long', '16'),
+                    ('crdtpldgruseamt', 'long', '16'),
+                    ('ordablemny', 'long', '16'),
+                    ('ordablesubstamt', 'long', '16'),
+                    ('ruseableamt', 'long', '16')],
+         'key': 0},
+ 'SC2': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('ordxctptncode', 'char', '2'),
+                    ('ordmktcode', 'char', '2'),
+                    ('ordptncode', 'char', '2'),
+                    ('mgmtbrnno', 'char', '3'),
+                    ('accno1', 'char', '11'),
+                    ('accno2', 'char', '9'),
+                    ('acntnm', 'char', '40'),
+                    ('Isuno', 'char', '12'),
+                    ('Isunm', 'char', '40'),
+                    ('ordno', 'long', '10'),
+                    ('orgordno', 'long', '10'),
+                    ('execno', 'long', '10'),
+                    ('ordqty', 'long', '16'),
+                    ('ordprc', 'long', '13'),
+                    ('execqty', 'long', '16'),
+                    ('execprc', 'long', '13'),
+                    ('mdfycnfqty', 'long', '16'),
+                    ('mdfycnfprc', 'long', '16'),
+                    ('canccnfqty', 'long', '16'),
+                    ('rjtqty', 'long', '16'),
+                    ('ordtrxptncode', 'long', '4'),
+                    ('mtiordseqno', 'long', '10'),
+                    ('ordcndi', 'char', '1'),
+                    ('ordprcptncode', 'char', '2'),
+                    ('nsavtrdqty', 'long', '16'),
+                    ('shtnIsuno', 'char', '9'),
+                    ('opdrtnno', 'char', '12'),
+                    ('cvrgordtp', 'char', '1'),
+                    ('unercqty', 'long', '16'),
+                    ('orgordunercqty', 'long', '16'),
+                    ('orgordmdfyqty', 'long', '16'),
+                    ('orgordcancqty', 'long', '16'),
+                    ('ordavrexecprc', 'long', '13'),
+                    ('ordamt', 'long', '16'),
+                    ('stdIsuno', 'char', '12'),
+                    ('bfstdIsuno', 'char', '12'),
+                    ('bnstp', 'char', '1'),
+                    ('ordtrdptncode', 'char', '2'),
+                    ('mgntrncode', 'char', '3'),
+                    ('adduptp', 'char', '2'),
+                    ('commdacode', 'char', '2'),
+                    ('Loandt', 'char', '8'),
+                    ('mbrnmbrno', 'long', '3'),
+                    ('ordacntno', 'char', '20'),
+                    ('agrgbrnno', 'char', '3'),
+                    ('mgempno', 'char', '9'),
+                    ('futsLnkbrnno', 'char', '3'),
+                    ('futsLnkacntno', 'char', '20'),
+                    ('futsmkttp', 'char', '1'),
+                    ('regmktcode', 'char', '2'),
+                    ('mnymgnrat', 'long', '7'),
+                    ('substmgnrat', 'long', '9'),
+                    ('mnyexecamt', 'long', '16'),
+                    ('ubstexecamt', 'long', '16'),
+                    ('cmsnamtexecamt', 'long', '16'),
+                    ('crdtpldgexecamt', 'long', '16'),
+                    ('crdtexecamt', 'long', '16'),
+                    ('prdayruseexecval', 'long', '16'),
+                    ('crdayruseexecval', 'long', '16'),
+                    ('spotexecqty', 'long', '16'),
+                    ('stslexecqty', 'long', '16'),
+                    ('strtgcode', 'char', '6'),
+                    ('grpId', 'char', '20'),
+                    ('ordseqno', 'long', '10'),
+                    ('ptflno', 'long', '10'),
+                    ('bskno', 'long', '10'),
+                    ('trchno', 'long', '10'),
+                    ('itemno', 'long', '10'),
+                    ('orduserId', 'char', '16'),
+                    ('brwmgmtYn', 'long', '1'),
+                    ('frgrunqno', 'char', '6'),
+                    ('trtzxLevytp', 'char', '1'),
+                    ('lptp', 'char', '1'),
+                    ('exectime', 'char', '9'),
+                    ('rcptexectime', 'char', '9'),
+                    ('rmndLoanamt', 'long', '16'),
+                    ('secbalqty', 'long', '16'),
+                    ('spotordableqty', 'long', '16'),
+                    ('ordableruseqty', 'long', '16'),
+                    ('flctqty', 'long', '16'),
+                    ('secbalqtyd2', 'long', '16'),
+                    ('sellableqty', 'long', '16'),
+                    ('unercsellordqty', 'long', '16'),
+                    ('avrpchsprc', 'long', '13'),
+                    ('pchsant', 'long', '16'),
+                    ('deposit', 'long', '16'),
+                    ('substamt', 'long', '16'),
+                    ('csgnmnymgn', 'long', '16'),
+                    ('csgnsubstmgn', 'long', '16'),
+                    ('crdtpldgruseamt', 'long', '16'),
+                    ('ordablemny', 'long', '16'),
+                    ('ordablesubstamt', 'long', '16'),
+                    ('ruseableamt', 'long', '16')],
+         'key': 0},
+ 'SC3': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('ordxctptncode', 'char', '2'),
+                    ('ordmktcode', 'char', '2'),
+                    ('ordptncode', 'char', '2'),
+                    ('mgmtbrnno', 'char', '3'),
+                    ('accno1', 'char', '11'),
+                    ('accno2', 'char', '9'),
+                    ('acntnm', 'char', '40'),
+                    ('Isuno', 'char', '12'),
+                    ('Isunm', 'char', '40'),
+                    ('ordno', 'long', '10'),
+                    ('orgordno', 'long', '10'),
+                    ('execno', 'long', '10'),
+                    ('ordqty', 'long', '16'),
+                    ('ordprc', 'long', '13'),
+                    ('execqty', 'long', '16'),
+                    ('execprc', 'long', '13'),
+                    ('mdfycnfqty', 'long', '16'),
+                    ('mdfycnfprc', 'long', '16'),
+                    ('canccnfqty', 'long', '16'),
+                    ('rjtqty', 'long', '16'),
+                    ('ordtrxptncode', 'long', '4'),
+                    ('mtiordseqno', 'long', '10'),
+                    ('ordcndi', 'char', '1'),
+                    ('ordprcptncode', 'char', '2'),
+                    ('nsavtrdqty', 'long', '16'),
+                    ('shtnIsuno', 'char', '9'),
+                    ('opdrtnno', 'char', '12'),
+                    ('cvrgordtp', 'char', '1'),
+                    ('unercqty', 'long', '16'),
+                    ('orgordunercqty', 'long', '16'),
+                    ('orgordmdfyqty', 'long', '16'),
+                    ('orgordcancqty', 'long', '16'),
+                    ('ordavrexecprc', 'long', '13'),
+                    ('ordamt', 'long', '16'),
+                    ('stdIsuno', 'char', '12'),
+                    ('bfstdIsuno', 'char', '12'),
+                    ('bnstp', 'char', '1'),
+                    ('ordtrdptncode', 'char', '2'),
+                    ('mgntrncode', 'char', '3'),
+                    ('adduptp', 'char', '2'),
+                    ('commdacode', 'char', '2'),
+                    ('Loandt', 'char', '8'),
+                    ('mbrnmbrno', 'long', '3'),
+                    ('ordacntno', 'char', '20'),
+                    ('agrgbrnno', 'char', '3'),
+                    ('mgempno', 'char', '9'),
+                    ('futsLnkbrnno', 'char', '3'),
+                    ('futsLnkacntno', 'char', '20'),
+                    ('futsmkttp', 'char', '1'),
+                    ('regmktcode', 'char', '2'),
+                    ('mnymgnrat', 'long', '7'),
+                    ('substmgnrat', 'long', '9'),
+                    ('mnyexecamt', 'long', '16'),
+                    ('ubstexecamt', 'long', '16'),
+                    ('cmsnamtexecamt', 'long', '16'),
+                    ('crdtpldgexecamt', 'long', '16'),
+                    ('crdtexecamt', 'long', '16'),
+                    ('prdayruseexecval', 'long', '16'),
+                    ('crdayruseexecval', 'long', '16'),
+                    ('spotexecqty', 'long', '16'),
+                    ('stslexecqty', 'long', '16'),
+                    ('strtgcode', 'char', '6'),
+                    ('grpId', 'char', '20'),
+                    ('ordseqno', 'long', '10'),
+                    ('ptflno', 'long', '10'),
+                    ('bskno', 'long', '10'),
+                    ('trchno', 'long', '10'),
+                    ('itemno', 'long', '10'),
+                    ('orduserId', 'char', '16'),
+                    ('brwmgmtYn', 'long', '1'),
+                    ('frgrunqno', 'char', '6'),
+                    ('trtzxLevytp', 'char', '1'),
+                    ('lptp', 'char', '1'),
+                    ('exectime', 'char', '9'),
+                    ('rcptexectime', 'char', '9'),
+                    ('rmndLoanamt', 'long', '16'),
+                    ('secbalqty', 'long', '16'),
+                    ('spotordableqty', 'long', '16'),
+                    ('ordableruseqty', 'long', '16'),
+                    ('flctqty', 'long', '16'),
+                    ('secbalqtyd2', 'long', '16'),
+                    ('sellableqty', 'long', '16'),
+                    ('unercsellordqty', 'long', '16'),
+                    ('avrpchsprc', 'long', '13'),
+                    ('pchsant', 'long', '16'),
+                    ('deposit', 'long', '16'),
+                    ('substamt', 'long', '16'),
+                    ('csgnmnymgn', 'long', '16'),
+                    ('csgnsubstmgn', 'long', '16'),
+                    ('crdtpldgruseamt', 'long', '16'),
+                    ('ordablemny', 'long', '16'),
+                    ('ordablesubstamt', 'long', '16'),
+                    ('ruseableamt', 'long', '16')],
+         'key': 0},
+ 'SC4': {'fields': [('lineseq', 'long', '10'),
+                    ('accno', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('len', 'long', '6'),
+                    ('gubun', 'char', '1'),
+                    ('compress', 'char', '1'),
+                    ('encrypt', 'char', '1'),
+                    ('offset', 'long', '3'),
+                    ('trcode', 'char', '8'),
+                    ('comid', 'char', '3'),
+                    ('userid', 'char', '16'),
+                    ('media', 'char', '2'),
+                    ('ifid', 'char', '3'),
+                    ('seq', 'char', '9'),
+                    ('trid', 'char', '16'),
+                    ('pubip', 'char', '12'),
+                    ('prvip', 'char', '12'),
+                    ('pcbpno', 'char', '3'),
+                    ('bpno', 'char', '3'),
+                    ('termno', 'char', '8'),
+                    ('lang', 'char', '1'),
+                    ('proctm', 'long', '9'),
+                    ('msgcode', 'char', '4'),
+                    ('outgu', 'char', '1'),
+                    ('compreq', 'char', '1'),
+                    ('funckey', 'char', '4'),
+                    ('reqcnt', 'long', '4'),
+                    ('filler', 'char', '6'),
+                    ('cont', 'char', '1'),
+                    ('contkey', 'char', '18'),
+                    ('varlen', 'long', '2'),
+                    ('varhdlen', 'long', '2'),
+                    ('varmsglen', 'long', '2'),
+                    ('trsrc', 'char', '1'),
+                    ('eventid', 'char', '4'),
+                    ('ifinfo', 'char', '4'),
+                    ('filler1', 'char', '41'),
+                    ('ordxctptncode', 'char', '2'),
+                    ('ordmktcode', 'char', '2'),
+                    ('ordptncode', 'char', '2'),
+                    ('mgmtbrnno', 'char', '3'),
+                    ('accno1', 'char', '11'),
+                    ('accno2', 'char', '9'),
+                    ('acntnm', 'char', '40'),
+                    ('Isuno', 'char', '12'),
+                    ('Isunm', 'char', '40'),
+                    ('ordno', 'long', '10'),
+                    ('orgordno', 'long', '10'),
+                    ('execno', 'long', '10'),
+                    ('ordqty', 'long', '16'),
+                    ('ordprc', 'long', '13'),
+                    ('execqty', 'long', '16'),
+                    ('execprc', 'long', '13'),
+                    ('mdfycnfqty', 'long', '16'),
+                    ('mdfycnfprc', 'long', '16'),
+                    ('canccnfqty', 'long', '16'),
+                    ('rjtqty', 'long', '16'),
+                    ('ordtrxptncode', 'long', '4'),
+                    ('mtiordseqno', 'long', '10'),
+                    ('ordcndi', 'char', '1'),
+                    ('ordprcptncode', 'char', '2'),
+                    ('nsavtrdqty', 'long', '16'),
+                    ('shtnIsuno', 'char', '9'),
+                    ('opdrtnno', 'char', '12'),
+                    ('cvrgordtp', 'char', '1'),
+                    ('unercqty', 'long', '16'),
+                    ('orgordunercqty', 'long', '16'),
+                    ('orgordmdfyqty', 'long', '16'),
+                    ('orgordcancqty', 'long', '16'),
+                    ('ordavrexecprc', 'long', '13'),
+                    ('ordamt', 'long', '16'),
+                    ('stdIsuno', 'char', '12'),
+                    ('bfstdIsuno', 'char', '12'),
+                    ('bnstp', 'char', '1'),
+                    ('ordtrdptncode', 'char', '2'),
+                    ('mgntrncode', 'char', '3'),
+                    ('adduptp', 'char', '2'),
+                    ('commdacode', 'char', '2'),
+                    ('Loandt', 'char', '8'),
+                    ('mbrnmbrno', 'long', '3'),
+                    ('ordacntno', 'char', '20'),
+                    ('agrgbrnno', 'char', '3'),
+                    ('mgempno', 'char', '9'),
+                    ('futsLnkbrnno', 'char', '3'),
+                    ('futsLnkacntno', 'char', '20'),
+                    ('futsmkttp', 'char', '1'),
+                    ('regmktcode', 'char', '2'),
+                    ('mnymgnrat', 'long', '7'),
+                    ('substmgnrat', 'long', '9'),
+                    ('mnyexecamt', 'long', '16'),
+                    ('ubstexecamt', 'long', '16'),
+                    ('cmsnamtexecamt', 'long', '16'),
+                    ('crdtpldgexecamt', 'long', '16'),
+                    ('crdtexecamt', 'long', '16'),
+                    ('prdayruseexecval', 'long', '16'),
+                    ('crdayruseexecval', 'long', '16'),
+                    ('spotexecqty', 'long', '16'),
+                    ('stslexecqty', 'long', '16'),
+                    ('strtgcode', 'char', '6'),
+                    ('grpId', 'char', '20'),
+                    ('ordseqno', 'long', '10'),
+                    ('ptflno', 'long', '10'),
+                    ('bskno', 'long', '10'),
+                    ('trchno', 'long', '10'),
+                    ('itemno', 'long', '10'),
+                    ('orduserId', 'char', '16'),
+                    ('brwmgmtYn', 'long', '1'),
+                    ('frgrunqno', 'char', '6'),
+                    ('trtzxLevytp', 'char', '1'),
+                    ('lptp', 'char', '1'),
+                    ('exectime', 'char', '9'),
+                    ('rcptexectime', 'char', '9'),
+                    ('rmndLoanamt', 'long', '16'),
+                    ('secbalqty', 'long', '16'),
+                    ('spotordableqty', 'long', '16'),
+                    ('ordableruseqty', 'long', '16'),
+                    ('flctqty', 'long', '16'),
+                    ('secbalqtyd2', 'long', '16'),
+                    ('sellableqty', 'long', '16'),
+                    ('unercsellordqty', 'long', '16'),
+                    ('avrpchsprc', 'long', '13'),
+                    ('pchsant', 'long', '16'),
+                    ('deposit', 'long', '16'),
+                    ('substamt', 'long', '16'),
+                    ('csgnmnymgn', 'long', '16'),
+                    ('csgnsubstmgn', 'long', '16'),
+                    ('crdtpldgruseamt', 'long', '16'),
+                    ('ordablemny', 'long', '16'),
+                    ('ordablesubstamt', 'long', '16'),
+                    ('ruseableamt', 'long', '16')],
+         'key': 0},
+ 'SHC': {'fields': [('sijanggubun', 'char', '1'),
+                    ('hname', 'char', '20'),
+                    ('price', 'long', '8'),
+                    ('sign', 'char', '1'),
+                    ('change', 'long', '8'),
+                    ('drate', 'float', '6.2'),
+                    ('volume', 'long', '12'),
+                    ('volincrate', 'float', '12.2'),
+                    ('updnlmtprice', 'long', '8'),
+                    ('updnlmtdrate', 'float', '6.2'),
+                    ('jnilvolume', 'long', '12'),
+                    ('shcode', 'char', '6'),
+                    ('gwangubun', 'char', '1'),
+                    ('undergubun', 'char', '1'),
+                    ('tgubun', 'char', '1'),
+                    ('wgubun', 'char', '1'),
+                    ('dishonest', 'char', '1'),
+                    ('jkrate', 'char', '1'),
+                    ('updnlmtdaycnt', 'long', '3')],
+         'key': 1},
+ 'SHD': {'fields': [('sijanggubun', 'char', '1'),
+                    ('hname', 'char', '20'),
+                    ('price', 'long', '8'),
+                    ('sign', 'char', '1'),
+                    ('change', 'long', '8'),
+                    ('drate', 'float', '6.2'),
+                    ('volume', 'long', '12'),
+                    ('volincrate', 'float', '12.2'),
+                    ('updnlmtprice', 'long', '8'),
+                    ('updnlmtdrate', 'float', '6.2'),
+                    ('jnilvolume', 'long', '12'),
+                    ('shcode', 'char', '6'),
+                    ('gwangubun', 'char', '1'),
+                    ('undergubun', 'char', '1'),
+                    ('tgubun', 'char', '1'),
+                    ('wgubun', 'char', '1'),
+                    ('dishonest', 'char', '1'),
+                    ('jkrate', 'char', '1')],
+         'key': 1},
+ 'SHI': {'fields': [('sijanggubun', 'char', '1'),
+                    ('hname', 'char', '20'),
+                    ('price', 'long', '8'),
+                    ('sign', 'char', '1'),
+                    ('change', 'long', '8'),
+                    ('drate', 'float', '6.2'),
+                    ('volume', 'long', '12'),
+                    ('volincrate', 'float', '12.2'),
+                    ('totofferrem', 'long', '12'),
+                    ('totbidrem', 'long', '12'),
+                    ('updnlmtstime', 'char', '6'),
+                    ('updnlmtdaycnt', 'long', '3'),
+                    ('jnilvolume', 'long', '12'),
+                    ('shcode', 'char', '6'),
+                    ('gwangubun', 'char', '1'),
+                    ('undergubun', 'char', '1'),
+                    ('tgubun', 'char', '1'),
+                    ('wgubun', 'char', '1'),
+                    ('dishonest', 'char', '1'),
+                    ('jkrate', 'char', '1')],
+         'key': 1},
+ 'SHO': {'fields': [('sijanggubun', 'char', '1'),
+                    ('hname', 'char', '20'),
+                    ('price', 'long', '8'),
+                    ('sign', 'char', '1'),
+                    ('change', 'long', '8'),
+                    ('drate', 'float', '6.2'),
+                    ('volume', 'long', '12'),
+                    ('volincrate', 'float', '12.2'),
+                    ('updnlmtprice', 'long', '8'),
+                    ('updnlmtchange', 'long', '8'),
+                    ('updnlmtdrate', 'float', '6.2'),
+                    ('jnilvolume', 'long', '12'),
+                    ('shcode', 'char', '6'),
+                    ('gwangubun', 'char', '1'),
+                    ('undergubun', 'char', '1'),
+                    ('tgubun', 'char', '1'),
+                    ('wgubun', 'char', '1'),
+                    ('dishonest', 'char', '1'),
+                    ('jkrate', 'char', '1')],
+         'key': 1},
+ 'TC1': {'fields': [('lineseq', 'long', '10'),
+                    ('key', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('svc_id', 'char', '4'),
+                    ('ordr_dt', 'char', '8'),
+                    ('brn_cd', 'char', '3'),
+                    ('ordr_no', 'long', '10'),
+                    ('orgn_ordr_no', 'long', '10'),
+                    ('mthr_ordr_no', 'long', '10'),
+                    ('ac_no', 'char', '11'),
+                    ('is_cd', 'char', '30'),
+                    ('s_b_ccd', 'char', '1'),
+                    ('ordr_ccd', 'char', '1'),
+                    ('ordr_typ_cd', 'char', '1'),
+                    ('ordr_typ_prd_ccd', 'char', '2'),
+                    ('ordr_aplc_strt_dt', 'char', '8'),
+                    ('ordr_aplc_end_dt', 'char', '8'),
+                    ('ordr_prc', 'double', '18.11'),
+                    ('cndt_ordr_prc', 'double', '18.11'),
+                    ('ordr_q', 'long', '12'),
+                    ('ordr_tm', 'char', '9'),
+                    ('userid', 'char', '8'),
+                    ('xrc_rsv_tcp_code', 'char', '1')],
+         'key': 0},
+ 'TC2': {'fields': [('lineseq', 'long', '10'),
+                    ('key', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('svc_id', 'char', '4'),
+                    ('ordr_dt', 'char', '8'),
+                    ('brn_cd', 'char', '3'),
+                    ('ordr_no', 'long', '10'),
+                    ('orgn_ordr_no', 'long', '10'),
+                    ('mthr_ordr_no', 'long', '10'),
+                    ('ac_no', 'char', '11'),
+                    ('is_cd', 'char', '30'),
+                    ('s_b_ccd', 'char', '1'),
+                    ('ordr_ccd', 'char', '1'),
+                    ('ordr_typ_cd', 'char', '1'),
+                    ('ordr_typ_prd_ccd', 'char', '2'),
+                    ('ordr_aplc_strt_dt', 'char', '8'),
+                    ('ordr_aplc_end_dt', 'char', '8'),
+                    ('ordr_prc', 'double', '18.11'),
+                    ('cndt_ordr_prc', 'double', '18.11'),
+                    ('ordr_q', 'long', '12'),
+                    ('ordr_tm', 'char', '9'),
+                    ('cnfr_q', 'long', '12'),
+                    ('rfsl_cd', 'char', '4'),
+                    ('text', 'char', '80'),
+                    ('user_id', 'char', '8')],
+         'key': 0},
+ 'TC3': {'fields': [('lineseq', 'long', '10'),
+                    ('key', 'char', '11'),
+                    ('user', 'char', '8'),
+                    ('svc_id', 'char', '4'),
+                    ('ordr_dt', 'char', '8'),
+                    ('brn_cd', 'char', '3'),
+                    ('ordr_no', 'long', '10'),
+                    ('orgn_ordr_no', 'long', '10'),
+                    ('mthr_ordr_no', 'long', '10'),
+                    ('ac_no', 'char', '11'),
+                    ('is_cd', 'char', '30'),
+                    ('s_b_ccd', 'char', '1'),
+                    ('ordr_ccd', 'char', '1'),
+                    ('ccls_q', 'long', '15'),
+                    ('ccls_prc', 'double', '18.11'),
+                    ('ccls_no', 'char', '10'),
+                    ('ccls_tm', 'char', '9'),
+                    ('avg_byng_uprc', 'double', '18.11'),
+                    ('byug_amt', 'double', '25.8'),
+                    ('clr_pl_amt', 'double', '19.2'),
+                    ('ent_fee', 'double', '19.2'),
+                    ('fcm_fee', 'long', '19'),
+                    ('userid', 'char', '8'),
+                    ('now_prc', 'double', '18.11'),
+                    ('crncy_cd', 'char', '3'),
+                    ('mtrt_dt', 'char', '8'),
+                    ('ord_prdt_tp_code', 'char', '1'),
+                    ('exec_prdt_tp_code', 'char', '1'),
+                    ('sprd_base_isu_yn', 'char', '1'),
+                    ('ccls_dt', 'char', '8'),
+                    ('filler2', 'char', '30'),
+                    ('sprd_is_cd', 'char', '30'),
+                    ('lme_prdt_ccd', 'char', '1'),
+                    ('lme_sprd_prc', 'double', '18.11'),
+                    ('last_now_prc', 'double', '18.11'),
+                    ('bf_mtrt_dt', 'char', '8'),
+                    ('clr_q', 'long', '15')],
+         'key': 0},
+ 'WOC': {'fields': [('symbol', 'char', '16'),
+                    ('ovsdate', 'char', '8'),
+                    ('kordate', 'char', '8'),
+                    ('trdtm', 'char', '6'),
+                    ('kortm', 'char', '6'),
+                    ('curpr', 'double', '15.9'),
+                    ('ydiffpr', 'double', '15.9'),
+                    ('ydiffSign', 'char', '1'),
+                    ('open', 'double', '15.9'),
+                    ('high', 'double', '15.9'),
+                    ('low', 'double', '15.9'),
+                    ('chgrate', 'float', '6.2'),
+                    ('trdq', 'long', '10'),
+                    ('totq', 'char', '15'),
+                    ('cgubun', 'char', '1'),
+                    ('mdvolume', 'char', '15'),
+                    ('msvolume', 'char', '15'),
+                    ('ovsmkend', 'char', '8')],
+         'key': 16},
+ 'WOH': {'fields': [('symbol', 'char', '16'),
+                    ('hotime', 'char', '6'),
+                    ('offerho1', 'double', '15.9'),
+                    ('bidho1', 'double', '15.9'),
+                    ('offerrem1', 'long', '10'),
+                    ('bidrem1', 'long', '10'),
+                    ('offerno1', 'long', '10'),
+                    ('bidno1', 'long', '10'),
+                    ('offerho2', 'double', '15.9'),
+                    ('bidho2', 'double', '15.9'),
+                    ('offerrem2', 'long', '10'),
+                    ('bidrem2', 'long', '10'),
+                    ('offerno2', 'long', '10'),
+                    ('bidno2', 'long', '10'),
+                    ('offerho3', 'double', '15.9'),
+                    ('bidho3', 'double', '15.9'),
+                    ('offerrem3', 'long', '10'),
+                    ('bidrem3', 'long', '10'),
+                    ('offerno3', 'long', '10'),
+                    ('bidno3', 'long', '10'),
+                    ('offerho4', 'double', '15.9'),
+                    ('bidho4', 'double', '15.9'),
+                    ('offerrem4', 'long', '10'),
+                    ('bidrem4', 'long', '10'),
+                    ('offerno4', 'long', '10'),
+                    ('bidno4', 'long', '10'),
+                    ('offerho5', 'double', '15.9'),
+                    ('bidho5', 'double', '15.9'),
+                    ('offerrem5', 'long', '10'),
+                    ('bidrem5', 'long', '10'),
+                    ('offerno5', 'long', '10'),
+                    ('bidno5', 'long', '10'),
+                    ('totoffercnt', 'long', '10'),
+                    ('totbidcnt', 'long', '10'),
+                    ('totofferrem', 'long', '10'),
+                    ('totbidrem', 'long', '10')],
+         'key': 16},
+ 'YC3': {'fields': [('ychetime', 'char', '6'),
+                    ('yeprice', 'float', '9.2'),
+                    ('yevolume', 'long', '6'),
+                    ('jnilysign', 'char', '1'),
+                    ('jnilchange', 'float', '9.2'),
+                    ('jnilydrate', 'float', '9.2'),
+                    ('shcode', 'char', '8')],
+         'key': 8},
+ 'YFC': {'fields': [('ychetime', 'char', '6'),
+                    ('yeprice', 'float', '6.2'),
+                    ('jnilysign', 'char', '1'),
+                    ('jnilchange', 'float', '6.2'),
+                    ('jnilydrate', 'float', '6.2'),
+                    ('futcode', 'char', '8')],
+         'key': 8},
+ 'YJC': {'fields': [('ychetime', 'char', '6'),
+                    ('yeprice', 'long', '10'),
+                    ('jnilysign', 'char', '1'),
+                    ('jnilchange', 'long', '10'),
+                    ('jnilydrate', 'float', '6.2'),
+                    ('futcode', 'char', '8')],
+         'key': 8},
+ 'YK3': {'fields': [('hotime', 'char', '6'),
+                    ('yeprice', 'long', '8'),
+                    ('yevolume', 'long', '12'),
+                    ('jnilysign', 'char', '1'),
+                    ('jnilchange', 'long', '8'),
+                    ('jnilydrate', 'float', '6.2'),
+                    ('yofferho0', 'long', '8'),
+                    ('ybidho0', 'long', '8'),
+                    ('yofferrem0', 'long', '12'),
+                    ('ybidrem0', 'long', '12'),
+                    ('shcode', 'char', '6')],
+         'key': 6},
+ 'YOC': {'fields': [('ychetime', 'char', '6'),
+                    ('yeprice', 'float', '6.2'),
+                    ('jnilysign', 'char', '1'),
+                    ('jnilchange', 'float', '6.2'),
+                    ('jnilydrate', 'float', '6.2'),
+                    ('optcode', 'char', '8')],
+         'key': 8},
+ 'YS3': {'fields': [('hotime', 'char', '6'),
+                    ('yeprice', 'long', '8'),
+                    ('yevolume', 'long', '12'),
+                    ('jnilysign', 'char', '1'),
+                    ('jnilchange', 'long', '8'),
+                    ('jnilydrate', 'float', '6.2'),
+                    ('yofferho0', 'long', '8'),
+                    ('ybidho0', 'long', '8'),
+                    ('yofferrem0', 'long', '12'),
+                    ('ybidrem0', 'long', '12'),
+                    ('shcode', 'char', '6')],
+         'key': 6}}
@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3101 - 해외선물마스터조회(o3101)-API용>
+class o3101InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 입력구분(예비)
+
+
+class o3101OutBlock(msgspec.Struct, frozen=True, gc=False):
+    Symbol: str = '' # 종목코드
+    SymbolNm: str = '' # 종목명
+    ApplDate: str = '' # 종목배치수신일(한국일자)
+    BscGdsCd: str = '' # 기초상품코드
+    BscGdsNm: str = '' # 기초상품명
+    ExchCd: str = '' # 거래소코드
+    ExchNm: str = '' # 거래소명
+    CrncyCd: str = '' # 기준통화코드
+    NotaCd: str = '' # 진법구분코드
+    UntPrc: float = 0.0 # 호가단위가격
+    MnChgAmt: float = 0.0 # 최소가격변동금액
+    RgltFctr: float = 0.0 # 가격조정계수
+    CtrtPrAmt: float = 0.0 # 계약당금액
+    GdsCd: str = '' # 상품구분코드
+    LstngYr: str = '' # 월물(년)
+    LstngM: str = '' # 월물(월)
+    EcPrc: float = 0.0 # 정산가격
+    DlStrtTm: str = '' # 거래시작시간
+    DlEndTm: str = '' # 거래종료시간
+    DlPsblCd: str = '' # 거래가능구분코드
+    MgnCltCd: str = '' # 증거금징수구분코드
+    OpngMgn: float = 0.0 # 개시증거금
+    MntncMgn: float = 0.0 # 유지증거금
+    OpngMgnR: float = 0.0 # 개시증거금율
+    MntncMgnR: float = 0.0 # 유지증거금율
+    DotGb: int = 0 # 유효소수점자리수
+
+
+
+# 해외선물마스터조회(o3101)-API용 
+class o3101(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[o3101OutBlock]] = msgspec.field(default=None, name='o3101OutBlock')
+# endregion
@@ -0,0 +1,34 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3104 - 해외선물일별체결조회(o3104)-API용>
+class o3104InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 조회구분
+    shcode: str = '' # 단축코드
+    date: str = '' # 조회일자
+
+
+class o3104OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chedate: str = '' # 일자
+    price: float = 0.0 # 현재가
+    sign: str = '' # 대비구분
+    change: float = 0.0 # 대비
+    diff: float = 0.0 # 등락율
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    cgubun: str = '' # 체결구분
+    volume: int = 0 # 누적거래량
+
+
+
+# 해외선물일별체결조회(o3104)-API용 
+class o3104(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[o3104OutBlock1]] = msgspec.field(default=None, name='o3104OutBlock1')
+# endregion
@@ -0,0 +1,80 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <o3105 - 해외선물현재가(종목정보)조회(o3105)-API용>
+class o3105InBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 종목코드
+
+
+class o3105OutBlock(msgspec.Struct, frozen=True, gc=False):
+    Symbol: str = '' # 종목코드
+    SymbolNm: str = '' # 종목명
+    ApplDate: str = '' # 종목배치수신일
+    BscGdsCd: str = '' # 기초상품코드
+    BscGdsNm: str = '' # 기초상품명
+    ExchCd: str = '' # 거래소코드
+    ExchNm: str = '' # 거래소명
+    EcCd: str = '' # 정산구분코드
+    CrncyCd: str = '' # 기준통화코드
+    NotaCd: str = '' # 진법구분코드
+    UntPrc: float = 0.0 # 호가단위가격
+    MnChgAmt: float = 0.0 # 최소가격변동금액
+    RgltFctr: float = 0.0 # 가격조정계수
+    CtrtPrAmt: float = 0.0 # 계약당금액
+    LstngMCnt: int = 0 # 상장개월수
+    GdsCd: str = '' # 상품구분코드
+    MrktCd: str = '' # 시장구분코드
+    EminiCd: str = '' # Emini구분코드
+    LstngYr: str = '' # 상장년
+    LstngM: str = '' # 상장월
+    SeqNo: int = 0 # 월물순서
+    LstngDt: str = '' # 상장일자
+    MtrtDt: str = '' # 최종거래가능일
+    FnlDlDt: str = '' # 최종거래일
+    FstTrsfrDt: str = '' # 최초인도통지일자
+    EcPrc: float = 0.0 # 정산가격
+    DlDt: str = '' # 거래시작일자(한국)
+    DlStrtTm: str = '' # 거래시작시간(한국)
+    DlEndTm: str = '' # 거래종료시간(한국)
+    OvsStrDay: str = '' # 거래시작일자(현지)
+    OvsStrTm: str = '' # 거래시작시간(현지)
+    OvsEndDay: str = '' # 거래종료일자(현지)
+    OvsEndTm: str = '' # 거래종료시간(현지)
+    DlPsblCd: str = '' # 거래가능구분코드
+    MgnCltCd: str = '' # 증거금징수구분코드
+    OpngMgn: float = 0.0 # 개시증거금
+    MntncMgn: float = 0.0 # 유지증거금
+    OpngMgnR: float = 0.0 # 개시증거금율
+    MntncMgnR: float = 0.0 # 유지증거금율
+    DotGb: int = 0 # 유효소수점자리수
+    TimeDiff: int = 0 # 시차
+    OvsDate: str = '' # 현지체결일자
+    KorDate: str = '' # 한국체결일자
+    TrdTm: str = '' # 현지체결시간
+    RcvTm: str = '' # 한국체결시각
+    TrdP: float = 0.0 # 체결가격
+    TrdQ: int = 0 # 체결수량
+    TotQ: int = 0 # 누적거래량
+    TrdAmt: float = 0.0 # 체결거래대금
+    TotAmt: float = 0.0 # 누적거래대금
+    OpenP: float = 0.0 # 시가
+    HighP: float = 0.0 # 고가
+    LowP: float = 0.0 # 저가
+    CloseP: float = 0.0 # 전일종가
+    YdiffP: float = 0.0 # 전일대비
+    YdiffSign: str = '' # 전일대비구분
+    Cgubun: str = '' # 체결구분
+    Diff: float = 0.0 # 등락율
+
+
+
+# 해외선물현재가(종목정보)조회(o3105)-API용 
+class o3105(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[o3105OutBlock] = msgspec.field(default=None, name='o3105OutBlock')
+# endregion
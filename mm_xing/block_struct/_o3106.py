@@ -0,0 +1,68 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <o3106 - 해외선물현재가호가조회(o3106)-API용>
+class o3106InBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 단축코드
+
+
+class o3106OutBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 종목코드
+    symbolname: str = '' # 종목명
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    jnilclose: float = 0.0 # 전일종가
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    hotime: str = '' # 호가수신시간
+    offerho1: float = 0.0 # 매도호가1
+    bidho1: float = 0.0 # 매수호가1
+    offercnt1: int = 0 # 매도호가건수1
+    bidcnt1: int = 0 # 매수호가건수1
+    offerrem1: int = 0 # 매도호가수량1
+    bidrem1: int = 0 # 매수호가수량1
+    offerho2: float = 0.0 # 매도호가2
+    bidho2: float = 0.0 # 매수호가2
+    offercnt2: int = 0 # 매도호가건수2
+    bidcnt2: int = 0 # 매수호가건수2
+    offerrem2: int = 0 # 매도호가수량2
+    bidrem2: int = 0 # 매수호가수량2
+    offerho3: float = 0.0 # 매도호가3
+    bidho3: float = 0.0 # 매수호가3
+    offercnt3: int = 0 # 매도호가건수3
+    bidcnt3: int = 0 # 매수호가건수3
+    offerrem3: int = 0 # 매도호가수량3
+    bidrem3: int = 0 # 매수호가수량3
+    offerho4: float = 0.0 # 매도호가4
+    bidho4: float = 0.0 # 매수호가4
+    offercnt4: int = 0 # 매도호가건수4
+    bidcnt4: int = 0 # 매수호가건수4
+    offerrem4: int = 0 # 매도호가수량4
+    bidrem4: int = 0 # 매수호가수량4
+    offerho5: float = 0.0 # 매도호가5
+    bidho5: float = 0.0 # 매수호가5
+    offercnt5: int = 0 # 매도호가건수5
+    bidcnt5: int = 0 # 매수호가건수5
+    offerrem5: int = 0 # 매도호가수량5
+    bidrem5: int = 0 # 매수호가수량5
+    offercnt: int = 0 # 매도호가건수합
+    bidcnt: int = 0 # 매수호가건수합
+    offer: int = 0 # 매도호가수량합
+    bid: int = 0 # 매수호가수량합
+
+
+
+# 해외선물현재가호가조회(o3106)-API용 
+class o3106(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[o3106OutBlock] = msgspec.field(default=None, name='o3106OutBlock')
+# endregion
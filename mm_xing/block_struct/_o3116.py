@@ -0,0 +1,38 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3116 - 해외선물시간대별(Tick)체결(o3116)-API용>
+class o3116InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 조회구분(0:당일1:전일)
+    shcode: str = '' # 단축코드
+    readcnt: int = 0 # 조회갯수
+    cts_seq: int = 0 # 순번CTS
+
+
+class o3116OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_seq: int = 0 # 순번CTS
+
+
+class o3116OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    ovsdate: str = '' # 현지일자
+    ovstime: str = '' # 현지시간
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    cvolume: int = 0 # 체결수량
+    volume: int = 0 # 누적거래량
+
+
+
+# 해외선물시간대별(Tick)체결(o3116)-API용 
+class o3116(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[o3116OutBlock] = msgspec.field(default=None, name='o3116OutBlock')
+    outblock1: Optional[List[o3116OutBlock1]] = msgspec.field(default=None, name='o3116OutBlock1')
+# endregion
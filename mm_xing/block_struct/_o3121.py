@@ -0,0 +1,57 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3121 - 해외선물옵션마스터조회(o3121)-API용>
+class o3121InBlock(msgspec.Struct, frozen=True, gc=False):
+    MktGb: str = '' # 시장구분
+    BscGdsCd: str = '' # 옵션기초상품코드
+
+
+class o3121OutBlock(msgspec.Struct, frozen=True, gc=False):
+    Symbol: str = '' # 종목코드
+    SymbolNm: str = '' # 종목명
+    ApplDate: str = '' # 종목배치수신일(한국일자)
+    BscGdsCd: str = '' # 기초상품코드
+    BscGdsNm: str = '' # 기초상품명
+    ExchCd: str = '' # 거래소코드
+    ExchNm: str = '' # 거래소명
+    CrncyCd: str = '' # 기준통화코드
+    NotaCd: str = '' # 진법구분코드
+    UntPrc: float = 0.0 # 호가단위가격
+    MnChgAmt: float = 0.0 # 최소가격변동금액
+    RgltFctr: float = 0.0 # 가격조정계수
+    CtrtPrAmt: float = 0.0 # 계약당금액
+    GdsCd: str = '' # 상품구분코드
+    LstngYr: str = '' # 월물(년)
+    LstngM: str = '' # 월물(월)
+    EcPrc: float = 0.0 # 정산가격
+    DlStrtTm: str = '' # 거래시작시간
+    DlEndTm: str = '' # 거래종료시간
+    DlPsblCd: str = '' # 거래가능구분코드
+    MgnCltCd: str = '' # 증거금징수구분코드
+    OpngMgn: float = 0.0 # 개시증거금
+    MntncMgn: float = 0.0 # 유지증거금
+    OpngMgnR: float = 0.0 # 개시증거금율
+    MntncMgnR: float = 0.0 # 유지증거금율
+    DotGb: int = 0 # 유효소수점자리수
+    XrcPrc: str = '' # 옵션행사가
+    FdasBasePrc: str = '' # 기초자산기준가격
+    OptTpCode: str = '' # 옵션콜풋구분
+    RgtXrcPtnCode: str = '' # 권리행사구분코드
+    Moneyness: str = '' # ATM구분
+    LastSettPtnCode: str = '' # 해외파생기초자산종목코드
+    OptMinOrcPrc: str = '' # 해외옵션최소호가
+    OptMinBaseOrcPrc: str = '' # 해외옵션최소기준호가
+
+
+
+# 해외선물옵션마스터조회(o3121)-API용 
+class o3121(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[o3121OutBlock]] = msgspec.field(default=None, name='o3121OutBlock')
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3123 - 해외선물옵션차트(분)(o3123)-API용>
+class o3123InBlock(msgspec.Struct, frozen=True, gc=False):
+    mktgb: str = '' # 시장구분
+    shcode: str = '' # 단축코드
+    ncnt: int = 0 # N분주기
+    readcnt: int = 0 # 조회건수
+    cts_date: str = '' # 연속일자
+    cts_time: str = '' # 연속시간
+
+
+class o3123OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    timediff: int = 0 # 시차
+    readcnt: int = 0 # 조회건수
+    cts_date: str = '' # 연속일자
+    cts_time: str = '' # 연속시간
+
+
+class o3123OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    time: str = '' # 현지시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    volume: int = 0 # 거래량
+
+
+
+# 해외선물옵션차트(분)(o3123)-API용 
+class o3123(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[o3123OutBlock] = msgspec.field(default=None, name='o3123OutBlock')
+    outblock1: Optional[List[o3123OutBlock1]] = msgspec.field(default=None, name='o3123OutBlock1')
+# endregion
@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3127 - 해외선물옵션관심종목조회(o3127)-API용>
+class o3127InBlock(msgspec.Struct, frozen=True, gc=False):
+    nrec: int = 0 # 건수
+
+
+class o3127InBlock1(msgspec.Struct, frozen=True, gc=False):
+    mktgb: str = '' # 시장구분
+    symbol: str = '' # 종목심볼
+
+
+class o3127OutBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 종목코드
+    symbolname: str = '' # 종목명
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    jnilclose: float = 0.0 # 전일종가
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    offerho1: float = 0.0 # 매도호가1
+    bidho1: float = 0.0 # 매수호가1
+    offercnt1: int = 0 # 매도호가건수1
+    bidcnt1: int = 0 # 매수호가건수1
+    offerrem1: int = 0 # 매도호가수량1
+    bidrem1: int = 0 # 매수호가수량1
+    offercnt: int = 0 # 매도호가건수합
+    bidcnt: int = 0 # 매수호가건수합
+    offer: int = 0 # 매도호가수량합
+    bid: int = 0 # 매수호가수량합
+
+
+
+# 해외선물옵션관심종목조회(o3127)-API용 
+class o3127(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[o3127OutBlock]] = msgspec.field(default=None, name='o3127OutBlock')
+# endregion
@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3128 - 해외선물옵션차트일주월(o3128)-API용>
+class o3128InBlock(msgspec.Struct, frozen=True, gc=False):
+    mktgb: str = '' # 시장구분
+    shcode: str = '' # 단축코드
+    gubun: str = '' # 주기구분
+    qrycnt: int = 0 # 요청건수
+    sdate: str = '' # 시작일자
+    edate: str = '' # 종료일자
+    cts_date: str = '' # 연속일자
+
+
+class o3128OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    jisiga: float = 0.0 # 전일시가
+    jihigh: float = 0.0 # 전일고가
+    jilow: float = 0.0 # 전일저가
+    jiclose: float = 0.0 # 전일종가
+    jivolume: int = 0 # 전일거래량
+    disiga: float = 0.0 # 당일시가
+    dihigh: float = 0.0 # 당일고가
+    dilow: float = 0.0 # 당일저가
+    diclose: float = 0.0 # 당일종가
+    mk_stime: str = '' # 장시작시간
+    mk_etime: str = '' # 장마감시간
+    cts_date: str = '' # 연속일자
+    rec_count: int = 0 # 레코드카운트
+
+
+class o3128OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    volume: int = 0 # 거래량
+
+
+
+# 해외선물옵션차트일주월(o3128)-API용 
+class o3128(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[o3128OutBlock] = msgspec.field(default=None, name='o3128OutBlock')
+    outblock1: Optional[List[o3128OutBlock1]] = msgspec.field(default=None, name='o3128OutBlock1')
+# endregion
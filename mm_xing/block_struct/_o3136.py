@@ -0,0 +1,39 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3136 - 해외선물옵션시간대별(Tick)체결(o3136)-API용>
+class o3136InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 조회구분(0:당일1:전일)
+    mktgb: str = '' # 시장구분
+    shcode: str = '' # 단축코드
+    readcnt: int = 0 # 조회갯수
+    cts_seq: int = 0 # 순번CTS
+
+
+class o3136OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_seq: int = 0 # 순번CTS
+
+
+class o3136OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    ovsdate: str = '' # 현지일자
+    ovstime: str = '' # 현지시간
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    cvolume: int = 0 # 체결수량
+    volume: int = 0 # 누적거래량
+
+
+
+# 해외선물옵션시간대별(Tick)체결(o3136)-API용 
+class o3136(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[o3136OutBlock] = msgspec.field(default=None, name='o3136OutBlock')
+    outblock1: Optional[List[o3136OutBlock1]] = msgspec.field(default=None, name='o3136OutBlock1')
+# endregion
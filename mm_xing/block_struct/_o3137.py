@@ -0,0 +1,42 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3137 - 해외선물옵션차트용NTick(o3137)-API용>
+class o3137InBlock(msgspec.Struct, frozen=True, gc=False):
+    mktgb: str = '' # 시장구분
+    shcode: str = '' # 단축코드
+    ncnt: int = 0 # 단위
+    qrycnt: int = 0 # 건수
+    cts_seq: str = '' # 연속시간
+    cts_daygb: str = '' # 연속당일구분
+
+
+class o3137OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    rec_count: int = 0 # 레코드카운트
+    cts_seq: str = '' # 연속시간
+    cts_daygb: str = '' # 연속당일구분
+
+
+class o3137OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    time: str = '' # 시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    volume: int = 0 # 거래량
+
+
+
+# 해외선물옵션차트용NTick(o3137)-API용 
+class o3137(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[o3137OutBlock] = msgspec.field(default=None, name='o3137OutBlock')
+    outblock1: Optional[List[o3137OutBlock1]] = msgspec.field(default=None, name='o3137OutBlock1')
+# endregion
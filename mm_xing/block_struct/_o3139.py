@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <o3139 - 해외선물옵션차트용NTick(고정형)(o3139)-API용>
+class o3139InBlock(msgspec.Struct, frozen=True, gc=False):
+    mktgb: str = '' # 시장구분
+    shcode: str = '' # 단축코드
+    ncnt: int = 0 # 단위
+    qrycnt: int = 0 # 건수
+    cts_seq: str = '' # 연속시간
+    cts_daygb: str = '' # 연속당일구분
+
+
+class o3139OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    rec_count: int = 0 # 레코드카운트
+    cts_seq: str = '' # 연속시간
+    cts_daygb: str = '' # 연속당일구분
+    last_count: int = 0 # 마지막Tick건수
+
+
+class o3139OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    time: str = '' # 시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    volume: int = 0 # 거래량
+
+
+
+# 해외선물옵션차트용NTick(고정형)(o3139)-API용 
+class o3139(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[o3139OutBlock] = msgspec.field(default=None, name='o3139OutBlock')
+    outblock1: Optional[List[o3139OutBlock1]] = msgspec.field(default=None, name='o3139OutBlock1')
+# endregion
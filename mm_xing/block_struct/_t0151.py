@@ -0,0 +1,64 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t0151 - 주식당일매매일지/수수료(전일)(t0151)>
+class t0151InBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    accno: str = '' # 계좌번호
+    cts_medosu: str = '' # CTS_매매구분
+    cts_expcode: str = '' # CTS_종목번호
+    cts_price: str = '' # CTS_단가
+    cts_middiv: str = '' # CTS_매체
+
+
+class t0151OutBlock(msgspec.Struct, frozen=True, gc=False):
+    mdqty: int = 0 # 매도수량
+    mdamt: int = 0 # 매도약정금액
+    mdfee: int = 0 # 매도수수료
+    mdtax: int = 0 # 매도거래세
+    mdargtax: int = 0 # 매도농특세
+    tmdtax: int = 0 # 매도제비용합
+    mdadjamt: int = 0 # 매도정산금액
+    msqty: int = 0 # 매수수량
+    msamt: int = 0 # 매수약정금액
+    msfee: int = 0 # 매수수수료
+    tmstax: int = 0 # 매수제비용합
+    msadjamt: int = 0 # 매수정산금액
+    tqty: int = 0 # 합계수량
+    tamt: int = 0 # 합계약정금액
+    tfee: int = 0 # 합계수수료
+    tottax: int = 0 # 합계거래세
+    targtax: int = 0 # 합계농특세
+    ttax: int = 0 # 합계제비용합
+    tadjamt: int = 0 # 합계정산금액
+    cts_medosu: str = '' # CTS_매매구분
+    cts_expcode: str = '' # CTS_종목번호
+    cts_price: str = '' # CTS_단가
+    cts_middiv: str = '' # CTS_매체
+
+
+class t0151OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    medosu: str = '' # 매매구분
+    expcode: str = '' # 종목번호
+    qty: int = 0 # 수량
+    price: int = 0 # 단가
+    amt: int = 0 # 약정금액
+    fee: int = 0 # 수수료
+    tax: int = 0 # 거래세
+    argtax: int = 0 # 농특세
+    adjamt: int = 0 # 정산금액
+    middiv: str = '' # 매체
+
+
+
+# 주식당일매매일지/수수료(전일)(t0151) 
+class t0151(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t0151OutBlock] = msgspec.field(default=None, name='t0151OutBlock')
+    outblock1: Optional[List[t0151OutBlock1]] = msgspec.field(default=None, name='t0151OutBlock1')
+# endregion
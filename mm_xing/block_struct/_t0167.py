@@ -0,0 +1,24 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t0167 - 서버시간조회(t0167)>
+class t0167InBlock(msgspec.Struct, frozen=True, gc=False):
+    id: str = '' # id
+
+
+class t0167OutBlock(msgspec.Struct, frozen=True, gc=False):
+    dt: str = '' # 일자(YYYYMMDD)
+    time: str = '' # 시간(HHMMSSssssss)
+
+
+
+# 서버시간조회(t0167) 
+class t0167(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t0167OutBlock] = msgspec.field(default=None, name='t0167OutBlock')
+# endregion
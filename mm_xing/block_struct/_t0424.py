@@ -0,0 +1,68 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t0424 - 주식잔고2(t0424)>
+class t0424InBlock(msgspec.Struct, frozen=True, gc=False):
+    accno: str = '' # 계좌번호
+    passwd: str = '' # 비밀번호
+    prcgb: str = '' # 단가구분
+    chegb: str = '' # 체결구분
+    dangb: str = '' # 단일가구분
+    charge: str = '' # 제비용포함여부
+    cts_expcode: str = '' # CTS_종목번호
+
+
+class t0424OutBlock(msgspec.Struct, frozen=True, gc=False):
+    sunamt: int = 0 # 추정순자산
+    dtsunik: int = 0 # 실현손익
+    mamt: int = 0 # 매입금액
+    sunamt1: int = 0 # 추정D2예수금
+    cts_expcode: str = '' # CTS_종목번호
+    tappamt: int = 0 # 평가금액
+    tdtsunik: int = 0 # 평가손익
+
+
+class t0424OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    expcode: str = '' # 종목번호
+    jangb: str = '' # 잔고구분
+    janqty: int = 0 # 잔고수량
+    mdposqt: int = 0 # 매도가능수량
+    pamt: int = 0 # 평균단가
+    mamt: int = 0 # 매입금액
+    sinamt: int = 0 # 대출금액
+    lastdt: str = '' # 만기일자
+    msat: int = 0 # 당일매수금액
+    mpms: int = 0 # 당일매수단가
+    mdat: int = 0 # 당일매도금액
+    mpmd: int = 0 # 당일매도단가
+    jsat: int = 0 # 전일매수금액
+    jpms: int = 0 # 전일매수단가
+    jdat: int = 0 # 전일매도금액
+    jpmd: int = 0 # 전일매도단가
+    sysprocseq: int = 0 # 처리순번
+    loandt: str = '' # 대출일자
+    hname: str = '' # 종목명
+    marketgb: str = '' # 시장구분
+    jonggb: str = '' # 종목구분
+    janrt: float = 0.0 # 보유비중
+    price: int = 0 # 현재가
+    appamt: int = 0 # 평가금액
+    dtsunik: int = 0 # 평가손익
+    sunikrt: float = 0.0 # 수익율
+    fee: int = 0 # 수수료
+    tax: int = 0 # 제세금
+    sininter: int = 0 # 신용이자
+
+
+
+# 주식잔고2(t0424) 
+class t0424(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t0424OutBlock] = msgspec.field(default=None, name='t0424OutBlock')
+    outblock1: Optional[List[t0424OutBlock1]] = msgspec.field(default=None, name='t0424OutBlock1')
+# endregion
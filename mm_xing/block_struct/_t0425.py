@@ -0,0 +1,61 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t0425 - 주식체결/미체결(t0425)>
+class t0425InBlock(msgspec.Struct, frozen=True, gc=False):
+    accno: str = '' # 계좌번호
+    passwd: str = '' # 비밀번호
+    expcode: str = '' # 종목번호
+    chegb: str = '' # 체결구분
+    medosu: str = '' # 매매구분
+    sortgb: str = '' # 정렬순서
+    cts_ordno: str = '' # 주문번호
+
+
+class t0425OutBlock(msgspec.Struct, frozen=True, gc=False):
+    tqty: int = 0 # 총주문수량
+    tcheqty: int = 0 # 총체결수량
+    tordrem: int = 0 # 총미체결수량
+    cmss: int = 0 # 추정수수료
+    tamt: int = 0 # 총주문금액
+    tmdamt: int = 0 # 총매도체결금액
+    tmsamt: int = 0 # 총매수체결금액
+    tax: int = 0 # 추정제세금
+    cts_ordno: str = '' # 주문번호
+
+
+class t0425OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    ordno: int = 0 # 주문번호
+    expcode: str = '' # 종목번호
+    medosu: str = '' # 구분
+    qty: int = 0 # 주문수량
+    price: int = 0 # 주문가격
+    cheqty: int = 0 # 체결수량
+    cheprice: int = 0 # 체결가격
+    ordrem: int = 0 # 미체결잔량
+    cfmqty: int = 0 # 확인수량
+    status: str = '' # 상태
+    orgordno: int = 0 # 원주문번호
+    ordgb: str = '' # 유형
+    ordtime: str = '' # 주문시간
+    ordermtd: str = '' # 주문매체
+    sysprocseq: int = 0 # 처리순번
+    hogagb: str = '' # 호가유형
+    price1: int = 0 # 현재가
+    orggb: str = '' # 주문구분
+    singb: str = '' # 신용구분
+    loandt: str = '' # 대출일자
+
+
+
+# 주식체결/미체결(t0425) 
+class t0425(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t0425OutBlock] = msgspec.field(default=None, name='t0425OutBlock')
+    outblock1: Optional[List[t0425OutBlock1]] = msgspec.field(default=None, name='t0425OutBlock1')
+# endregion
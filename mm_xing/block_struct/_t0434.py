@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t0434 - 선물/옵션체결/미체결(t0434)>
+class t0434InBlock(msgspec.Struct, frozen=True, gc=False):
+    accno: str = '' # 계좌번호
+    passwd: str = '' # 비밀번호
+    expcode: str = '' # 종목번호
+    chegb: str = '' # 체결구분
+    sortgb: str = '' # 정렬순서
+    cts_ordno: str = '' # CTS_주문번호
+
+
+class t0434OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_ordno: str = '' # CTS_주문번호
+
+
+class t0434OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    ordno: int = 0 # 주문번호
+    orgordno: int = 0 # 원주문번호
+    medosu: str = '' # 구분
+    ordgb: str = '' # 유형
+    qty: int = 0 # 주문수량
+    price: float = 0.0 # 주문가격
+    cheqty: int = 0 # 체결수량
+    cheprice: float = 0.0 # 체결가격
+    ordrem: int = 0 # 미체결잔량
+    status: str = '' # 상태
+    ordtime: str = '' # 주문시간
+    ordermtd: str = '' # 주문매체
+    expcode: str = '' # 종목번호
+    rtcode: str = '' # 사유코드
+    sysprocseq: int = 0 # 처리순번
+    hogatype: str = '' # 호가타입
+
+
+
+# 선물/옵션체결/미체결(t0434) 
+class t0434(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t0434OutBlock] = msgspec.field(default=None, name='t0434OutBlock')
+    outblock1: Optional[List[t0434OutBlock1]] = msgspec.field(default=None, name='t0434OutBlock1')
+# endregion
@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t0441 - 선물/옵션잔고평가(이동평균)(t0441)>
+class t0441InBlock(msgspec.Struct, frozen=True, gc=False):
+    accno: str = '' # 계좌번호
+    passwd: str = '' # 비밀번호
+    cts_expcode: str = '' # CTS_종목번호
+    cts_medocd: str = '' # CTS_매매구분
+
+
+class t0441OutBlock(msgspec.Struct, frozen=True, gc=False):
+    tdtsunik: int = 0 # 매매손익합계
+    cts_expcode: str = '' # CTS_종목번호
+    cts_medocd: str = '' # CTS_매매구분
+    tappamt: int = 0 # 평가금액
+    tsunik: int = 0 # 평가손익
+
+
+class t0441OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    expcode: str = '' # 종목번호
+    medosu: str = '' # 구분
+    jqty: int = 0 # 잔고수량
+    cqty: int = 0 # 청산가능수량
+    pamt: float = 0.0 # 평균단가
+    mamt: int = 0 # 총매입금액
+    medocd: str = '' # 매매구분
+    dtsunik: int = 0 # 매매손익
+    sysprocseq: int = 0 # 처리순번
+    price: float = 0.0 # 현재가
+    appamt: int = 0 # 평가금액
+    dtsunik1: int = 0 # 평가손익
+    sunikrt: float = 0.0 # 수익율
+
+
+
+# 선물/옵션잔고평가(이동평균)(t0441) 
+class t0441(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t0441OutBlock] = msgspec.field(default=None, name='t0441OutBlock')
+    outblock1: Optional[List[t0441OutBlock1]] = msgspec.field(default=None, name='t0441OutBlock1')
+# endregion
@@ -0,0 +1,38 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1104 - 주식현재가시세메모(t1104)>
+class t1104InBlock(msgspec.Struct, frozen=True, gc=False):
+    code: str = '' # 종목코드
+    nrec: str = '' # 건수
+
+
+class t1104InBlock1(msgspec.Struct, frozen=True, gc=False):
+    indx: str = '' # 인덱스
+    gubn: str = '' # 조건구분
+    dat1: str = '' # 데이타1
+    dat2: str = '' # 데이타2
+
+
+class t1104OutBlock(msgspec.Struct, frozen=True, gc=False):
+    nrec: str = '' # 출력건수
+
+
+class t1104OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    indx: str = '' # 인덱스
+    gubn: str = '' # 조건구분
+    vals: str = '' # 출력값
+
+
+
+# 주식현재가시세메모(t1104) 
+class t1104(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1104OutBlock] = msgspec.field(default=None, name='t1104OutBlock')
+    outblock1: Optional[List[t1104OutBlock1]] = msgspec.field(default=None, name='t1104OutBlock1')
+# endregion
@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1105 - 주식피못/디마크조회(t1105)>
+class t1105InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class t1105OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    pbot: int = 0 # 피봇
+    offer1: int = 0 # 1차저항
+    supp1: int = 0 # 1차지지
+    offer2: int = 0 # 2차저항
+    supp2: int = 0 # 2차지지
+    stdprc: int = 0 # 기준가격
+    offerd: int = 0 # D저항
+    suppd: int = 0 # D지지
+
+
+
+# 주식피못/디마크조회(t1105) 
+class t1105(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1105OutBlock] = msgspec.field(default=None, name='t1105OutBlock')
+# endregion
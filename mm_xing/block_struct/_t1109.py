@@ -0,0 +1,39 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1109 - 시간외체결량(t1109)>
+class t1109InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    dan_chetime: str = '' # 체결cts
+    idx: int = 0 # IDX
+
+
+class t1109OutBlock(msgspec.Struct, frozen=True, gc=False):
+    ctsshcode: str = '' # 종목cts
+    ctschetime: str = '' # 체결cts
+    idx: int = 0 # IDX
+
+
+class t1109OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    dan_chetime: str = '' # 시간
+    dan_price: int = 0 # 현재가
+    dan_sign: str = '' # 전일대비구분
+    dan_change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    dan_cvolume: int = 0 # 체결량
+    chdegree: float = 0.0 # 체결강도
+    dan_volume: int = 0 # 누적거래량
+
+
+
+# 시간외체결량(t1109) 
+class t1109(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1109OutBlock] = msgspec.field(default=None, name='t1109OutBlock')
+    outblock1: Optional[List[t1109OutBlock1]] = msgspec.field(default=None, name='t1109OutBlock1')
+# endregion
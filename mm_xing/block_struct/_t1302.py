@@ -0,0 +1,53 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1302 - 주식분별주가조회(t1302)>
+class t1302InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    gubun: str = '' # 작업구분
+    time: str = '' # 시간
+    cnt: str = '' # 건수
+
+
+class t1302OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_time: str = '' # 시간CTS
+
+
+class t1302OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    close: int = 0 # 종가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    chdegree: float = 0.0 # 체결강도
+    mdvolume: int = 0 # 매도체결수량
+    msvolume: int = 0 # 매수체결수량
+    revolume: int = 0 # 순매수체결량
+    mdchecnt: int = 0 # 매도체결건수
+    mschecnt: int = 0 # 매수체결건수
+    rechecnt: int = 0 # 순체결건수
+    volume: int = 0 # 거래량
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    cvolume: int = 0 # 체결량
+    mdchecnttm: int = 0 # 매도체결건수(시간)
+    mschecnttm: int = 0 # 매수체결건수(시간)
+    totofferrem: int = 0 # 매도잔량
+    totbidrem: int = 0 # 매수잔량
+    mdvolumetm: int = 0 # 시간별매도체결량
+    msvolumetm: int = 0 # 시간별매수체결량
+
+
+
+# 주식분별주가조회(t1302) 
+class t1302(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1302OutBlock] = msgspec.field(default=None, name='t1302OutBlock')
+    outblock1: Optional[List[t1302OutBlock1]] = msgspec.field(default=None, name='t1302OutBlock1')
+# endregion
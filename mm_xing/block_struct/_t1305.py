@@ -0,0 +1,61 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1305 - 기간별주가(t1305)>
+class t1305InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    dwmcode: int = 0 # 일주월구분
+    date: str = '' # 날짜
+    idx: int = 0 # IDX
+    cnt: int = 0 # 건수
+
+
+class t1305OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cnt: int = 0 # CNT
+    date: str = '' # 날짜
+    idx: int = 0 # IDX
+
+
+class t1305OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    close: int = 0 # 종가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    diff_vol: float = 0.0 # 거래증가율
+    chdegree: float = 0.0 # 체결강도
+    sojinrate: float = 0.0 # 소진율
+    changerate: float = 0.0 # 회전율
+    fpvolume: int = 0 # 외인순매수
+    covolume: int = 0 # 기관순매수
+    shcode: str = '' # 종목코드
+    value: int = 0 # 누적거래대금(단위:백만)
+    ppvolume: int = 0 # 개인순매수
+    o_sign: str = '' # 시가대비구분
+    o_change: int = 0 # 시가대비
+    o_diff: float = 0.0 # 시가기준등락율
+    h_sign: str = '' # 고가대비구분
+    h_change: int = 0 # 고가대비
+    h_diff: float = 0.0 # 고가기준등락율
+    l_sign: str = '' # 저가대비구분
+    l_change: int = 0 # 저가대비
+    l_diff: float = 0.0 # 저가기준등락율
+    marketcap: int = 0 # 시가총액(단위:백만)
+
+
+
+# 기간별주가(t1305) 
+class t1305(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1305OutBlock] = msgspec.field(default=None, name='t1305OutBlock')
+    outblock1: Optional[List[t1305OutBlock1]] = msgspec.field(default=None, name='t1305OutBlock1')
+# endregion
@@ -0,0 +1,41 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1308 - 주식시간대별체결조회챠트(t1308)>
+class t1308InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    starttime: str = '' # 시작시간
+    endtime: str = '' # 종료시간
+    bun_term: str = '' # 분간격
+
+
+class t1308OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    cvolume: int = 0 # 체결수량
+    chdegvol: float = 0.0 # 체결강도(거래량)
+    chdegcnt: float = 0.0 # 체결강도(건수)
+    volume: int = 0 # 거래량
+    mdvolume: int = 0 # 매도체결수량
+    mdchecnt: int = 0 # 매도체결건수
+    msvolume: int = 0 # 매수체결수량
+    mschecnt: int = 0 # 매수체결건수
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+
+
+
+# 주식시간대별체결조회챠트(t1308) 
+class t1308(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t1308OutBlock1]] = msgspec.field(default=None, name='t1308OutBlock1')
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1403 - 신규상장종목조회(t1403)>
+class t1403InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    styymm: str = '' # 시작상장월
+    enyymm: str = '' # 종료상장월
+    idx: int = 0 # IDX
+
+
+class t1403OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1403OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    kmprice: int = 0 # 공모가
+    date: str = '' # 등록일
+    recprice: int = 0 # 등록일기준가
+    kmdiff: float = 0.0 # 기준가등락율
+    close: int = 0 # 등록일종가
+    recdiff: float = 0.0 # 등록일등락율
+    shcode: str = '' # 종목코드
+
+
+
+# 신규상장종목조회(t1403) 
+class t1403(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1403OutBlock] = msgspec.field(default=None, name='t1403OutBlock')
+    outblock1: Optional[List[t1403OutBlock1]] = msgspec.field(default=None, name='t1403OutBlock1')
+# endregion
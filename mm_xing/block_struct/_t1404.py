@@ -0,0 +1,42 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1404 - 관리/불성실/투자유의조회(t1404)>
+class t1404InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    jongchk: str = '' # 종목체크
+    cts_shcode: str = '' # 종목코드_CTS
+
+
+class t1404OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_shcode: str = '' # 종목코드_CTS
+
+
+class t1404OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    date: str = '' # 지정일
+    tprice: int = 0 # 지정일주가
+    tchange: int = 0 # 지정일대비
+    tdiff: float = 0.0 # 대비율
+    reason: str = '' # 사유
+    shcode: str = '' # 종목코드
+    edate: str = '' # 해제일
+
+
+
+# 관리/불성실/투자유의조회(t1404) 
+class t1404(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1404OutBlock] = msgspec.field(default=None, name='t1404OutBlock')
+    outblock1: Optional[List[t1404OutBlock1]] = msgspec.field(default=None, name='t1404OutBlock1')
+# endregion
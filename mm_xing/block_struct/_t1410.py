@@ -0,0 +1,35 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1410 - 초저유동성조회(t1410)>
+class t1410InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    cts_shcode: str = '' # 종목코드_CTS
+
+
+class t1410OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_shcode: str = '' # 종목코드_CTS
+
+
+class t1410OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    shcode: str = '' # 종목코드
+
+
+
+# 초저유동성조회(t1410) 
+class t1410(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1410OutBlock] = msgspec.field(default=None, name='t1410OutBlock')
+    outblock1: Optional[List[t1410OutBlock1]] = msgspec.field(default=None, name='t1410OutBlock1')
+# endregion
@@ -0,0 +1,44 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1411 - 증거금율별종목조회(t1411)>
+class t1411InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 시장구분
+    jongchk: str = '' # 위탁신용구분
+    jkrate: str = '' # 증거금율구분
+    shcode: str = '' # 종목코드
+    idx: int = 0 # IDX
+
+
+class t1411OutBlock(msgspec.Struct, frozen=True, gc=False):
+    jkrate: int = 0 # 위탁증거금율
+    sjkrate: int = 0 # 신용증거금율
+    idx: int = 0 # IDX
+
+
+class t1411OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    jkrate: int = 0 # 위탁증거금율
+    sjkrate: int = 0 # 신용증거금율
+    subprice: int = 0 # 대용가
+    recprice: int = 0 # 전일종가
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+
+
+
+# 증거금율별종목조회(t1411) 
+class t1411(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1411OutBlock] = msgspec.field(default=None, name='t1411OutBlock')
+    outblock1: Optional[List[t1411OutBlock1]] = msgspec.field(default=None, name='t1411OutBlock1')
+# endregion
@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1422 - 상/하한(t1422)>
+class t1422InBlock(msgspec.Struct, frozen=True, gc=False):
+    qrygb: str = '' # 조회구분
+    gubun: str = '' # 구분
+    jnilgubun: str = '' # 전일구분
+    sign: str = '' # 상하한구분
+    jc_num: int = 0 # 대상제외
+    sprice: int = 0 # 시작가격
+    eprice: int = 0 # 종료가격
+    volume: int = 0 # 거래량
+    idx: int = 0 # IDX
+
+
+class t1422OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cnt: int = 0 # CNT
+    idx: int = 0 # IDX
+
+
+class t1422OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    diff_vol: float = 0.0 # 거래증가율
+    offerrem1: int = 0 # 매도잔량
+    bidrem1: int = 0 # 매수잔량
+    last: str = '' # 최종진입
+    lmtdaycnt: int = 0 # 연속
+    jnilvolume: int = 0 # 전일거래량
+    shcode: str = '' # 종목코드
+
+
+
+# 상/하한(t1422) 
+class t1422(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1422OutBlock] = msgspec.field(default=None, name='t1422OutBlock')
+    outblock1: Optional[List[t1422OutBlock1]] = msgspec.field(default=None, name='t1422OutBlock1')
+# endregion
@@ -0,0 +1,54 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1427 - 상/하한가직전(t1427)>
+class t1427InBlock(msgspec.Struct, frozen=True, gc=False):
+    qrygb: str = '' # 조회구분
+    gubun: str = '' # 구분
+    signgubun: str = '' # 상하한가구분
+    diff: int = 0 # 등락율
+    jc_num: int = 0 # 대상제외
+    sprice: int = 0 # 시작가격
+    eprice: int = 0 # 종료가격
+    volume: int = 0 # 거래량
+    idx: int = 0 # IDX
+    jshex: str = '' # 전일상하한제외
+
+
+class t1427OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cnt: int = 0 # CNT
+    idx: int = 0 # IDX
+
+
+class t1427OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    diff_vol: float = 0.0 # 거래증가율
+    lmtprice: int = 0 # 상한가/하한가
+    rate: float = 0.0 # 대비율
+    shcode: str = '' # 종목코드
+    jnilvolume: int = 0 # 전일거래량
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    lmtdaycnt: int = 0 # 연속
+    value: int = 0 # 거래대금
+    total: int = 0 # 시가총액
+
+
+
+# 상/하한가직전(t1427) 
+class t1427(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1427OutBlock] = msgspec.field(default=None, name='t1427OutBlock')
+    outblock1: Optional[List[t1427OutBlock1]] = msgspec.field(default=None, name='t1427OutBlock1')
+# endregion
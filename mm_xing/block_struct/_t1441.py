@@ -0,0 +1,54 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1441 - 등락율상위(t1441)>
+class t1441InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 구분
+    gubun2: str = '' # 상승하락
+    gubun3: str = '' # 당일전일
+    jc_num: int = 0 # 대상제외
+    sprice: int = 0 # 시작가격
+    eprice: int = 0 # 종료가격
+    volume: int = 0 # 거래량
+    idx: int = 0 # IDX
+    jc_num2: int = 0 # 대상제외2
+
+
+class t1441OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1441OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    offerrem1: int = 0 # 매도잔량
+    offerho1: int = 0 # 매도호가
+    bidho1: int = 0 # 매수호가
+    bidrem1: int = 0 # 매수잔량
+    updaycnt: int = 0 # 연속
+    jnildiff: float = 0.0 # 전일등락율
+    shcode: str = '' # 종목코드
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    voldiff: float = 0.0 # 거래량대비율
+    value: int = 0 # 거래대금
+    total: int = 0 # 시가총액
+
+
+
+# 등락율상위(t1441) 
+class t1441(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1441OutBlock] = msgspec.field(default=None, name='t1441OutBlock')
+    outblock1: Optional[List[t1441OutBlock1]] = msgspec.field(default=None, name='t1441OutBlock1')
+# endregion
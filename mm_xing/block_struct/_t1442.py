@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1442 - 신고/신저가(t1442)>
+class t1442InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    type1: str = '' # 신고신저
+    type2: str = '' # 기간
+    type3: str = '' # 유지여부
+    jc_num: int = 0 # 대상제외
+    sprice: int = 0 # 시작가격
+    eprice: int = 0 # 종료가격
+    volume: int = 0 # 거래량
+    idx: int = 0 # IDX
+    jc_num2: int = 0 # 대상제외2
+
+
+class t1442OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1442OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    pastprice: int = 0 # 이전가
+    pastsign: str = '' # 이전가대비구분
+    pastchange: int = 0 # 이전가대비
+    pastdiff: float = 0.0 # 이전가대비율
+
+
+
+# 신고/신저가(t1442) 
+class t1442(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1442OutBlock] = msgspec.field(default=None, name='t1442OutBlock')
+    outblock1: Optional[List[t1442OutBlock1]] = msgspec.field(default=None, name='t1442OutBlock1')
+# endregion
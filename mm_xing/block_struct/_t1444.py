@@ -0,0 +1,39 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1444 - 시가총액상위(t1444)>
+class t1444InBlock(msgspec.Struct, frozen=True, gc=False):
+    upcode: str = '' # 업종코드
+    idx: int = 0 # IDX
+
+
+class t1444OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1444OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    vol_rate: float = 0.0 # 거래비중
+    total: int = 0 # 시가총액
+    rate: float = 0.0 # 비중
+    for_rate: float = 0.0 # 외인비중
+
+
+
+# 시가총액상위(t1444) 
+class t1444(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1444OutBlock] = msgspec.field(default=None, name='t1444OutBlock')
+    outblock1: Optional[List[t1444OutBlock1]] = msgspec.field(default=None, name='t1444OutBlock1')
+# endregion
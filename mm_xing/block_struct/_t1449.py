@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1449 - 가격대별매매비중조회(t1449)>
+class t1449InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    dategb: str = '' # 일자구분
+
+
+class t1449OutBlock(msgspec.Struct, frozen=True, gc=False):
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    msvolume: int = 0 # 매수체결량
+    mdvolume: int = 0 # 매도체결량
+
+
+class t1449OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    price: int = 0 # 체결가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    tickdiff: float = 0.0 # 등락율
+    cvolume: int = 0 # 체결수량
+    diff: float = 0.0 # 비중
+    mdvolume: int = 0 # 매도체결량
+    msvolume: int = 0 # 매수체결량
+    msdiff: float = 0.0 # 매수비율
+
+
+
+# 가격대별매매비중조회(t1449) 
+class t1449(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1449OutBlock] = msgspec.field(default=None, name='t1449OutBlock')
+    outblock1: Optional[List[t1449OutBlock1]] = msgspec.field(default=None, name='t1449OutBlock1')
+# endregion
@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1452 - 거래량상위(t1452)>
+class t1452InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    jnilgubun: str = '' # 전일구분
+    sdiff: int = 0 # 시작등락율
+    ediff: int = 0 # 종료등락율
+    jc_num: int = 0 # 대상제외
+    sprice: int = 0 # 시작가격
+    eprice: int = 0 # 종료가격
+    volume: int = 0 # 거래량
+    idx: int = 0 # IDX
+
+
+class t1452OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1452OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    vol: float = 0.0 # 회전율
+    jnilvolume: int = 0 # 전일거래량
+    bef_diff: float = 0.0 # 전일비
+    shcode: str = '' # 종목코드
+
+
+
+# 거래량상위(t1452) 
+class t1452(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1452OutBlock] = msgspec.field(default=None, name='t1452OutBlock')
+    outblock1: Optional[List[t1452OutBlock1]] = msgspec.field(default=None, name='t1452OutBlock1')
+# endregion
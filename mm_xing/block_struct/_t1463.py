@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1463 - 거래대금상위(t1463)>
+class t1463InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    jnilgubun: str = '' # 전일구분
+    jc_num: int = 0 # 대상제외
+    sprice: int = 0 # 시작가격
+    eprice: int = 0 # 종료가격
+    volume: int = 0 # 거래량
+    idx: int = 0 # IDX
+    jc_num2: int = 0 # 대상제외2
+
+
+class t1463OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1463OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    value: int = 0 # 거래대금
+    jnilvalue: int = 0 # 전일거래대금
+    bef_diff: float = 0.0 # 전일비
+    shcode: str = '' # 종목코드
+    filler: str = '' # filler
+    jnilvolume: int = 0 # 전일거래량
+
+
+
+# 거래대금상위(t1463) 
+class t1463(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1463OutBlock] = msgspec.field(default=None, name='t1463OutBlock')
+    outblock1: Optional[List[t1463OutBlock1]] = msgspec.field(default=None, name='t1463OutBlock1')
+# endregion
@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1466 - 전일동시간대비거래급증(t1466)>
+class t1466InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    type1: str = '' # 전일거래량
+    type2: str = '' # 거래급등율
+    jc_num: int = 0 # 대상제외
+    sprice: int = 0 # 시작가격
+    eprice: int = 0 # 종료가격
+    volume: int = 0 # 거래량
+    idx: int = 0 # IDX
+    jc_num2: int = 0 # 대상제외2
+
+
+class t1466OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hhmm: str = '' # 현재시분
+    idx: int = 0 # IDX
+
+
+class t1466OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    stdvolume: int = 0 # 전일거래량
+    volume: int = 0 # 당일거래량
+    voldiff: float = 0.0 # 거래급등율
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+
+
+
+# 전일동시간대비거래급증(t1466) 
+class t1466(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1466OutBlock] = msgspec.field(default=None, name='t1466OutBlock')
+    outblock1: Optional[List[t1466OutBlock1]] = msgspec.field(default=None, name='t1466OutBlock1')
+# endregion
@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1471 - 시간대별호가잔량추이(t1471)>
+class t1471InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    gubun: str = '' # 분구분
+    time: str = '' # 시간
+    cnt: str = '' # 자료개수
+
+
+class t1471OutBlock(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 시간CTS
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+
+
+class t1471OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 체결시간
+    preoffercha1: int = 0 # 메도증감
+    offerrem1: int = 0 # 매도우선잔량
+    offerho1: int = 0 # 매도우선호가
+    bidho1: int = 0 # 매수우선호가
+    bidrem1: int = 0 # 매수우선잔량
+    prebidcha1: int = 0 # 매수증감
+    totofferrem: int = 0 # 총매도
+    totbidrem: int = 0 # 총매수
+    totsun: int = 0 # 순매수
+    msrate: float = 0.0 # 매수비율
+    close: int = 0 # 종가
+
+
+
+# 시간대별호가잔량추이(t1471) 
+class t1471(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1471OutBlock] = msgspec.field(default=None, name='t1471OutBlock')
+    outblock1: Optional[List[t1471OutBlock1]] = msgspec.field(default=None, name='t1471OutBlock1')
+# endregion
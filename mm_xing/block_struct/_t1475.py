@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1475 - 체결강도추이(t1475)>
+class t1475InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    vptype: str = '' # 상승하락
+    datacnt: int = 0 # 데이터개수
+    date: int = 0 # 기준일자
+    time: int = 0 # 기준시간
+    rankcnt: int = 0 # 랭크카운터
+    gubun: str = '' # 조회구분
+
+
+class t1475OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: int = 0 # 기준일자
+    time: int = 0 # 기준시간
+    rankcnt: int = 0 # 랭크카운터
+
+
+class t1475OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    datetime: str = '' # 일자
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    todayvp: float = 0.0 # 당일VP
+    ma5vp: float = 0.0 # 5일MAVP
+    ma20vp: float = 0.0 # 20일MAVP
+    ma60vp: float = 0.0 # 60일MAVP
+
+
+
+# 체결강도추이(t1475) 
+class t1475(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1475OutBlock] = msgspec.field(default=None, name='t1475OutBlock')
+    outblock1: Optional[List[t1475OutBlock1]] = msgspec.field(default=None, name='t1475OutBlock1')
+# endregion
@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1481 - 시간외등락율상위(t1481)>
+class t1481InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 구분
+    gubun2: str = '' # 상승하락
+    jongchk: str = '' # 종목체크
+    volume: str = '' # 거래량
+    idx: int = 0 # IDX
+
+
+class t1481OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1481OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    offerrem1: int = 0 # 매도잔량
+    bidrem1: int = 0 # 매수잔량
+    offerho1: int = 0 # 매도호가
+    bidho1: int = 0 # 매수호가
+    shcode: str = '' # 종목코드
+    value: int = 0 # 누적거래대금
+
+
+
+# 시간외등락율상위(t1481) 
+class t1481(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1481OutBlock] = msgspec.field(default=None, name='t1481OutBlock')
+    outblock1: Optional[List[t1481OutBlock1]] = msgspec.field(default=None, name='t1481OutBlock1')
+# endregion
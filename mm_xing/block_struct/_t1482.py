@@ -0,0 +1,38 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1482 - 시간외거래량상위(t1482)>
+class t1482InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    jongchk: str = '' # 거래량
+    idx: int = 0 # IDX
+
+
+class t1482OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1482OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    vol: float = 0.0 # 회전율
+    shcode: str = '' # 종목코드
+    value: int = 0 # 누적거래대금
+
+
+
+# 시간외거래량상위(t1482) 
+class t1482(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1482OutBlock] = msgspec.field(default=None, name='t1482OutBlock')
+    outblock1: Optional[List[t1482OutBlock1]] = msgspec.field(default=None, name='t1482OutBlock1')
+# endregion
@@ -0,0 +1,44 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1485 - 예상지수(t1485)>
+class t1485InBlock(msgspec.Struct, frozen=True, gc=False):
+    upcode: str = '' # 업종코드
+    gubun: str = '' # 조회구분
+
+
+class t1485OutBlock(msgspec.Struct, frozen=True, gc=False):
+    pricejisu: float = 0.0 # 현재지수
+    sign: str = '' # 지수전일대비구분
+    change: float = 0.0 # 전일대비
+    volume: int = 0 # 거래량
+    yhighjo: int = 0 # 상승종목수
+    yupjo: int = 0 # 상한종목수
+    yunchgjo: int = 0 # 보합종목수
+    ylowjo: int = 0 # 하락종목수
+    ydownjo: int = 0 # 하한종목수
+    ytrajo: int = 0 # 거래형성수
+
+
+class t1485OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    jisu: float = 0.0 # 예상지수
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    volume: int = 0 # 예상체결량
+    volcha: int = 0 # 예상체결량직전대비
+    diff: float = 0.0 # 예상등락율
+
+
+
+# 예상지수(t1485) 
+class t1485(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1485OutBlock] = msgspec.field(default=None, name='t1485OutBlock')
+    outblock1: Optional[List[t1485OutBlock1]] = msgspec.field(default=None, name='t1485OutBlock1')
+# endregion
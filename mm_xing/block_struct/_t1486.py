@@ -0,0 +1,39 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1486 - 시간별예상체결가(t1486)>
+class t1486InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    cts_time: str = '' # 시간CTS
+    cnt: str = '' # 조회건수
+
+
+class t1486OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_time: str = '' # 시간CTS
+
+
+class t1486OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    price: int = 0 # 예상체결가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    cvolume: int = 0 # 예상체결량
+    offerho1: int = 0 # 매도호가
+    bidho1: int = 0 # 매수호가
+    offerrem1: int = 0 # 매도잔량
+    bidrem1: int = 0 # 매수잔량
+
+
+
+# 시간별예상체결가(t1486) 
+class t1486(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1486OutBlock] = msgspec.field(default=None, name='t1486OutBlock')
+    outblock1: Optional[List[t1486OutBlock1]] = msgspec.field(default=None, name='t1486OutBlock1')
+# endregion
@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1488 - 예상체결가등락율상위조회(t1488)>
+class t1488InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 거래소구분
+    sign: str = '' # 상하락구분
+    jgubun: str = '' # 장구분
+    jongchk: str = '' # 종목체크
+    idx: int = 0 # IDX
+    volume: str = '' # 거래량
+    yesprice: int = 0 # 예상체결시작가격
+    yeeprice: int = 0 # 예상체결종료가격
+    yevolume: int = 0 # 예상체결량
+
+
+class t1488OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1488OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    offerrem: int = 0 # 매도잔량
+    offerho: int = 0 # 매도호가
+    bidho: int = 0 # 매수호가
+    bidrem: int = 0 # 매수잔량
+    cnt: int = 0 # 연속일수
+    shcode: str = '' # 종목코드
+    jkrate: str = '' # 증거금율
+    jnilvolume: int = 0 # 전일거래량
+
+
+
+# 예상체결가등락율상위조회(t1488) 
+class t1488(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1488OutBlock] = msgspec.field(default=None, name='t1488OutBlock')
+    outblock1: Optional[List[t1488OutBlock1]] = msgspec.field(default=None, name='t1488OutBlock1')
+# endregion
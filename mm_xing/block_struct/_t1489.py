@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1489 - 예상체결량상위조회(t1489)>
+class t1489InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 거래소구분
+    jgubun: str = '' # 장구분
+    jongchk: str = '' # 종목체크
+    idx: int = 0 # IDX
+    yesprice: int = 0 # 예상체결시작가격
+    yeeprice: int = 0 # 예상체결종료가격
+    yevolume: int = 0 # 예상체결량
+
+
+class t1489OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1489OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 예상거래량
+    offerho: int = 0 # 매도호가
+    bidho: int = 0 # 매수호가
+    shcode: str = '' # 종목코드
+    jnilvolume: int = 0 # 전일거래량
+
+
+
+# 예상체결량상위조회(t1489) 
+class t1489(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1489OutBlock] = msgspec.field(default=None, name='t1489OutBlock')
+    outblock1: Optional[List[t1489OutBlock1]] = msgspec.field(default=None, name='t1489OutBlock1')
+# endregion
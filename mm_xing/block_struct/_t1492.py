@@ -0,0 +1,44 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1492 - 단일가예상등락율상위(t1492)>
+class t1492InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 구분
+    gubun2: str = '' # 상승하락
+    jongchk: str = '' # 종목체크
+    volume: str = '' # 거래량
+    idx: int = 0 # IDX
+
+
+class t1492OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1492OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 예상체결가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    yevolume: int = 0 # 예상체결량
+    volume: int = 0 # 누적거래량
+    offerrem1: int = 0 # 매도잔량
+    bidrem1: int = 0 # 매수잔량
+    offerho1: int = 0 # 매도호가
+    bidho1: int = 0 # 매수호가
+    shcode: str = '' # 종목코드
+    value: int = 0 # 누적거래대금
+
+
+
+# 단일가예상등락율상위(t1492) 
+class t1492(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1492OutBlock] = msgspec.field(default=None, name='t1492OutBlock')
+    outblock1: Optional[List[t1492OutBlock1]] = msgspec.field(default=None, name='t1492OutBlock1')
+# endregion
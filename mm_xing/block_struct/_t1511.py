@@ -0,0 +1,87 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1511 - 업종현재가(t1511)>
+class t1511InBlock(msgspec.Struct, frozen=True, gc=False):
+    upcode: str = '' # 업종코드
+
+
+class t1511OutBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 업종구분
+    hname: str = '' # 업종명
+    pricejisu: float = 0.0 # 현재지수
+    jniljisu: float = 0.0 # 전일지수
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diffjisu: float = 0.0 # 지수등락율
+    jnilvolume: int = 0 # 전일거래량
+    volume: int = 0 # 당일거래량
+    volumechange: int = 0 # 거래량전일대비
+    volumerate: float = 0.0 # 거래량비율
+    jnilvalue: int = 0 # 전일거래대금
+    value: int = 0 # 당일거래대금
+    valuechange: int = 0 # 거래대금전일대비
+    valuerate: float = 0.0 # 거래대금비율
+    openjisu: float = 0.0 # 시가지수
+    opendiff: float = 0.0 # 시가등락율
+    opentime: str = '' # 시가시간
+    highjisu: float = 0.0 # 고가지수
+    highdiff: float = 0.0 # 고가등락율
+    hightime: str = '' # 고가시간
+    lowjisu: float = 0.0 # 저가지수
+    lowdiff: float = 0.0 # 저가등락율
+    lowtime: str = '' # 저가시간
+    whjisu: float = 0.0 # 52주최고지수
+    whchange: float = 0.0 # 52주최고현재가대비
+    whjday: str = '' # 52주최고지수일자
+    wljisu: float = 0.0 # 52주최저지수
+    wlchange: float = 0.0 # 52주최저현재가대비
+    wljday: str = '' # 52주최저지수일자
+    yhjisu: float = 0.0 # 연중최고지수
+    yhchange: float = 0.0 # 연중최고현재가대비
+    yhjday: str = '' # 연중최고지수일자
+    yljisu: float = 0.0 # 연중최저지수
+    ylchange: float = 0.0 # 연중최저현재가대비
+    yljday: str = '' # 연중최저지수일자
+    firstjcode: str = '' # 첫번째지수코드
+    firstjname: str = '' # 첫번째지수명
+    firstjisu: float = 0.0 # 첫번째지수
+    firsign: str = '' # 첫번째대비구분
+    firchange: float = 0.0 # 첫번째전일대비
+    firdiff: float = 0.0 # 첫번째등락율
+    secondjcode: str = '' # 두번째지수코드
+    secondjname: str = '' # 두번째지수명
+    secondjisu: float = 0.0 # 두번째지수
+    secsign: str = '' # 두번째대비구분
+    secchange: float = 0.0 # 두번째전일대비
+    secdiff: float = 0.0 # 두번째등락율
+    thirdjcode: str = '' # 세번째지수코드
+    thirdjname: str = '' # 세번째지수명
+    thirdjisu: float = 0.0 # 세번째지수
+    thrsign: str = '' # 세번째대비구분
+    thrchange: float = 0.0 # 세번째전일대비
+    thrdiff: float = 0.0 # 세번째등락율
+    fourthjcode: str = '' # 네번째지수코드
+    fourthjname: str = '' # 네번째지수명
+    fourthjisu: float = 0.0 # 네번째지수
+    forsign: str = '' # 네번째대비구분
+    forchange: float = 0.0 # 네번째전일대비
+    fordiff: float = 0.0 # 네번째등락율
+    highjo: int = 0 # 상승종목수
+    upjo: int = 0 # 상한종목수
+    unchgjo: int = 0 # 보합종목수
+    lowjo: int = 0 # 하락종목수
+    downjo: int = 0 # 하한종목수
+
+
+
+# 업종현재가(t1511) 
+class t1511(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1511OutBlock] = msgspec.field(default=None, name='t1511OutBlock')
+# endregion
@@ -0,0 +1,56 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1514 - 업종기간별추이(t1514)>
+class t1514InBlock(msgspec.Struct, frozen=True, gc=False):
+    upcode: str = '' # 업종코드
+    gubun1: str = '' # 구분1
+    gubun2: str = '' # 구분2
+    cts_date: str = '' # CTS_일자
+    cnt: str = '' # 조회건수
+    rate_gbn: str = '' # 비중구분
+
+
+class t1514OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_date: str = '' # CTS_일자
+
+
+class t1514OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    jisu: float = 0.0 # 지수
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    diff_vol: float = 0.0 # 거래증가율
+    value1: int = 0 # 거래대금1
+    high: int = 0 # 상승
+    unchg: int = 0 # 보합
+    low: int = 0 # 하락
+    uprate: float = 0.0 # 상승종목비율
+    frgsvolume: int = 0 # 외인순매수
+    openjisu: float = 0.0 # 시가
+    highjisu: float = 0.0 # 고가
+    lowjisu: float = 0.0 # 저가
+    value2: int = 0 # 거래대금2
+    up: int = 0 # 상한
+    down: int = 0 # 하한
+    totjo: int = 0 # 종목수
+    orgsvolume: int = 0 # 기관순매수
+    upcode: str = '' # 업종코드
+    rate: float = 0.0 # 거래비중
+    divrate: float = 0.0 # 업종배당수익률
+
+
+
+# 업종기간별추이(t1514) 
+class t1514(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1514OutBlock] = msgspec.field(default=None, name='t1514OutBlock')
+    outblock1: Optional[List[t1514OutBlock1]] = msgspec.field(default=None, name='t1514OutBlock1')
+# endregion
@@ -0,0 +1,51 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1516 - 업종별종목시세(t1516)>
+class t1516InBlock(msgspec.Struct, frozen=True, gc=False):
+    upcode: str = '' # 업종코드
+    gubun: str = '' # 구분
+    shcode: str = '' # 종목코드
+
+
+class t1516OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    pricejisu: float = 0.0 # 지수
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    jdiff: float = 0.0 # 등락율
+
+
+class t1516OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    sojinrate: float = 0.0 # 소진율
+    beta: float = 0.0 # 베타계수
+    perx: float = 0.0 # PER
+    frgsvolume: int = 0 # 외인순매수
+    orgsvolume: int = 0 # 기관순매수
+    diff_vol: float = 0.0 # 거래증가율
+    shcode: str = '' # 종목코드
+    total: int = 0 # 시가총액
+    value: int = 0 # 거래대금
+
+
+
+# 업종별종목시세(t1516) 
+class t1516(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1516OutBlock] = msgspec.field(default=None, name='t1516OutBlock')
+    outblock1: Optional[List[t1516OutBlock1]] = msgspec.field(default=None, name='t1516OutBlock1')
+# endregion
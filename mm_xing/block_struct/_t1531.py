@@ -0,0 +1,26 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1531 - 테마별종목(t1531)>
+class t1531InBlock(msgspec.Struct, frozen=True, gc=False):
+    tmname: str = '' # 테마명
+    tmcode: str = '' # 테마코드
+
+
+class t1531OutBlock(msgspec.Struct, frozen=True, gc=False):
+    tmname: str = '' # 테마명
+    avgdiff: float = 0.0 # 평균등락율
+    tmcode: str = '' # 테마코드
+
+
+
+# 테마별종목(t1531) 
+class t1531(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t1531OutBlock]] = msgspec.field(default=None, name='t1531OutBlock')
+# endregion
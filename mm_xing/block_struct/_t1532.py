@@ -0,0 +1,25 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1532 - 종목별테마(t1532)>
+class t1532InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+
+
+class t1532OutBlock(msgspec.Struct, frozen=True, gc=False):
+    tmname: str = '' # 테마명
+    avgdiff: float = 0.0 # 평균등락율
+    tmcode: str = '' # 테마코드
+
+
+
+# 종목별테마(t1532) 
+class t1532(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t1532OutBlock]] = msgspec.field(default=None, name='t1532OutBlock')
+# endregion
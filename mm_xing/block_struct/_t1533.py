@@ -0,0 +1,37 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1533 - 특이테마(t1533)>
+class t1533InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    chgdate: int = 0 # 대비일자
+
+
+class t1533OutBlock(msgspec.Struct, frozen=True, gc=False):
+    bdate: str = '' # 일자
+
+
+class t1533OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    tmname: str = '' # 테마명
+    totcnt: int = 0 # 전체
+    upcnt: int = 0 # 상승
+    dncnt: int = 0 # 하락
+    uprate: float = 0.0 # 상승비율
+    diff_vol: float = 0.0 # 거래증가율
+    avgdiff: float = 0.0 # 평균등락율
+    chgdiff: float = 0.0 # 대비등락율
+    tmcode: str = '' # 테마코드
+
+
+
+# 특이테마(t1533) 
+class t1533(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1533OutBlock] = msgspec.field(default=None, name='t1533OutBlock')
+    outblock1: Optional[List[t1533OutBlock1]] = msgspec.field(default=None, name='t1533OutBlock1')
+# endregion
@@ -0,0 +1,44 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1537 - 테마종목별시세조회(t1537)>
+class t1537InBlock(msgspec.Struct, frozen=True, gc=False):
+    tmcode: str = '' # 테마코드
+
+
+class t1537OutBlock(msgspec.Struct, frozen=True, gc=False):
+    upcnt: int = 0 # 상승종목수
+    tmcnt: int = 0 # 테마종목수
+    uprate: int = 0 # 상승종목비율
+    tmname: str = '' # 테마명
+
+
+class t1537OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    jniltime: float = 0.0 # 전일동시간
+    shcode: str = '' # 종목코드
+    yeprice: int = 0 # 예상체결가
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    value: int = 0 # 누적거래대금(단위:백만)
+    marketcap: int = 0 # 시가총액(단위:백만)
+
+
+
+# 테마종목별시세조회(t1537) 
+class t1537(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1537OutBlock] = msgspec.field(default=None, name='t1537OutBlock')
+    outblock1: Optional[List[t1537OutBlock1]] = msgspec.field(default=None, name='t1537OutBlock1')
+# endregion
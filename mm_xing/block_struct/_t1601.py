@@ -0,0 +1,405 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1601 - 투자자별종합(t1601)>
+class t1601InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 주식금액수량구분1
+    gubun2: str = '' # 옵션금액수량구분2
+    gubun3: str = '' # 금액단위
+    gubun4: str = '' # 선물금액수량구분4
+
+
+class t1601OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    tjjcode_08: str = '' # 개인투자자코드
+    ms_08: int = 0 # 개인매수
+    md_08: int = 0 # 개인매도
+    rate_08: int = 0 # 개인증감
+    svolume_08: int = 0 # 개인순매수
+    jjcode_17: str = '' # 외국인투자자코드
+    ms_17: int = 0 # 외국인매수
+    md_17: int = 0 # 외국인매도
+    rate_17: int = 0 # 외국인증감
+    svolume_17: int = 0 # 외국인순매수
+    jjcode_18: str = '' # 기관계투자자코드
+    ms_18: int = 0 # 기관계매수
+    md_18: int = 0 # 기관계매도
+    rate_18: int = 0 # 기관계증감
+    svolume_18: int = 0 # 기관계순매수
+    jjcode_01: str = '' # 증권투자자코드
+    ms_01: int = 0 # 증권매수
+    md_01: int = 0 # 증권매도
+    rate_01: int = 0 # 증권증감
+    svolume_01: int = 0 # 증권순매수
+    jjcode_03: str = '' # 투신투자자코드
+    ms_03: int = 0 # 투신매수
+    md_03: int = 0 # 투신매도
+    rate_03: int = 0 # 투신증감
+    svolume_03: int = 0 # 투신순매수
+    jjcode_04: str = '' # 은행투자자코드
+    ms_04: int = 0 # 은행매수
+    md_04: int = 0 # 은행매도
+    rate_04: int = 0 # 은행증감
+    svolume_04: int = 0 # 은행순매수
+    jjcode_02: str = '' # 보험투자자코드
+    ms_02: int = 0 # 보험매수
+    md_02: int = 0 # 보험매도
+    rate_02: int = 0 # 보험증감
+    svolume_02: int = 0 # 보험순매수
+    jjcode_05: str = '' # 종금투자자코드
+    ms_05: int = 0 # 종금매수
+    md_05: int = 0 # 종금매도
+    rate_05: int = 0 # 종금증감
+    svolume_05: int = 0 # 종금순매수
+    jjcode_06: str = '' # 기금투자자코드
+    ms_06: int = 0 # 기금매수
+    md_06: int = 0 # 기금매도
+    rate_06: int = 0 # 기금증감
+    svolume_06: int = 0 # 기금순매수
+    jjcode_11: str = '' # 국가투자코드
+    ms_11: int = 0 # 국가매수
+    md_11: int = 0 # 국가매도
+    rate_11: int = 0 # 국가증감
+    svolume_11: int = 0 # 국가순매수
+    jjcode_07: str = '' # 기타투자자코드
+    ms_07: int = 0 # 기타매수
+    md_07: int = 0 # 기타매도
+    rate_07: int = 0 # 기타증감
+    svolume_07: int = 0 # 기타순매수
+    jjcode_00: str = '' # 사모펀드투자자코드
+    ms_00: int = 0 # 사모펀드매수
+    md_00: int = 0 # 사모펀드매도
+    rate_00: int = 0 # 사모펀드증감
+    svolume_00: int = 0 # 사모펀드순매수
+
+
+class t1601OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    tjjcode_08: str = '' # 개인투자자코드
+    ms_08: int = 0 # 개인매수
+    md_08: int = 0 # 개인매도
+    rate_08: int = 0 # 개인증감
+    svolume_08: int = 0 # 개인순매수
+    jjcode_17: str = '' # 외국인투자자코드
+    ms_17: int = 0 # 외국인매수
+    md_17: int = 0 # 외국인매도
+    rate_17: int = 0 # 외국인증감
+    svolume_17: int = 0 # 외국인순매수
+    jjcode_18: str = '' # 기관계투자자코드
+    ms_18: int = 0 # 기관계매수
+    md_18: int = 0 # 기관계매도
+    rate_18: int = 0 # 기관계증감
+    svolume_18: int = 0 # 기관계순매수
+    jjcode_01: str = '' # 증권투자자코드
+    ms_01: int = 0 # 증권매수
+    md_01: int = 0 # 증권매도
+    rate_01: int = 0 # 증권증감
+    svolume_01: int = 0 # 증권순매수
+    jjcode_03: str = '' # 투신투자자코드
+    ms_03: int = 0 # 투신매수
+    md_03: int = 0 # 투신매도
+    rate_03: int = 0 # 투신증감
+    svolume_03: int = 0 # 투신순매수
+    jjcode_04: str = '' # 은행투자자코드
+    ms_04: int = 0 # 은행매수
+    md_04: int = 0 # 은행매도
+    rate_04: int = 0 # 은행증감
+    svolume_04: int = 0 # 은행순매수
+    jjcode_02: str = '' # 보험투자자코드
+    ms_02: int = 0 # 보험매수
+    md_02: int = 0 # 보험매도
+    rate_02: int = 0 # 보험증감
+    svolume_02: int = 0 # 보험순매수
+    jjcode_05: str = '' # 종금투자자코드
+    ms_05: int = 0 # 종금매수
+    md_05: int = 0 # 종금매도
+    rate_05: int = 0 # 종금증감
+    svolume_05: int = 0 # 종금순매수
+    jjcode_06: str = '' # 기금투자자코드
+    ms_06: int = 0 # 기금매수
+    md_06: int = 0 # 기금매도
+    rate_06: int = 0 # 기금증감
+    svolume_06: int = 0 # 기금순매수
+    jjcode_11: str = '' # 국가투자코드
+    ms_11: int = 0 # 국가매수
+    md_11: int = 0 # 국가매도
+    rate_11: int = 0 # 국가증감
+    svolume_11: int = 0 # 국가순매수
+    jjcode_07: str = '' # 기타투자자코드
+    ms_07: int = 0 # 기타매수
+    md_07: int = 0 # 기타매도
+    rate_07: int = 0 # 기타증감
+    svolume_07: int = 0 # 기타순매수
+    jjcode_00: str = '' # 사모펀드투자자코드
+    ms_00: int = 0 # 사모펀드매수
+    md_00: int = 0 # 사모펀드매도
+    rate_00: int = 0 # 사모펀드증감
+    svolume_00: int = 0 # 사모펀드순매수
+
+
+class t1601OutBlock3(msgspec.Struct, frozen=True, gc=False):
+    tjjcode_08: str = '' # 개인투자자코드
+    ms_08: int = 0 # 개인매수
+    md_08: int = 0 # 개인매도
+    rate_08: int = 0 # 개인증감
+    svolume_08: int = 0 # 개인순매수
+    jjcode_17: str = '' # 외국인투자자코드
+    ms_17: int = 0 # 외국인매수
+    md_17: int = 0 # 외국인매도
+    rate_17: int = 0 # 외국인증감
+    svolume_17: int = 0 # 외국인순매수
+    jjcode_18: str = '' # 기관계투자자코드
+    ms_18: int = 0 # 기관계매수
+    md_18: int = 0 # 기관계매도
+    rate_18: int = 0 # 기관계증감
+    svolume_18: int = 0 # 기관계순매수
+    jjcode_01: str = '' # 증권투자자코드
+    ms_01: int = 0 # 증권매수
+    md_01: int = 0 # 증권매도
+    rate_01: int = 0 # 증권증감
+    svolume_01: int = 0 # 증권순매수
+    jjcode_03: str = '' # 투신투자자코드
+    ms_03: int = 0 # 투신매수
+    md_03: int = 0 # 투신매도
+    rate_03: int = 0 # 투신증감
+    svolume_03: int = 0 # 투신순매수
+    jjcode_04: str = '' # 은행투자자코드
+    ms_04: int = 0 # 은행매수
+    md_04: int = 0 # 은행매도
+    rate_04: int = 0 # 은행증감
+    svolume_04: int = 0 # 은행순매수
+    jjcode_02: str = '' # 보험투자자코드
+    ms_02: int = 0 # 보험매수
+    md_02: int = 0 # 보험매도
+    rate_02: int = 0 # 보험증감
+    svolume_02: int = 0 # 보험순매수
+    jjcode_05: str = '' # 종금투자자코드
+    ms_05: int = 0 # 종금매수
+    md_05: int = 0 # 종금매도
+    rate_05: int = 0 # 종금증감
+    svolume_05: int = 0 # 종금순매수
+    jjcode_06: str = '' # 기금투자자코드
+    ms_06: int = 0 # 기금매수
+    md_06: int = 0 # 기금매도
+    rate_06: int = 0 # 기금증감
+    svolume_06: int = 0 # 기금순매수
+    jjcode_11: str = '' # 국가투자코드
+    ms_11: int = 0 # 국가매수
+    md_11: int = 0 # 국가매도
+    rate_11: int = 0 # 국가증감
+    svolume_11: int = 0 # 국가순매수
+    jjcode_07: str = '' # 기타투자자코드
+    ms_07: int = 0 # 기타매수
+    md_07: int = 0 # 기타매도
+    rate_07: int = 0 # 기타증감
+    svolume_07: int = 0 # 기타순매수
+    jjcode_00: str = '' # 사모펀드투자자코드
+    ms_00: int = 0 # 사모펀드매수
+    md_00: int = 0 # 사모펀드매도
+    rate_00: int = 0 # 사모펀드증감
+    svolume_00: int = 0 # 사모펀드순매수
+
+
+class t1601OutBlock4(msgspec.Struct, frozen=True, gc=False):
+    tjjcode_08: str = '' # 개인투자자코드
+    ms_08: int = 0 # 개인매수
+    md_08: int = 0 # 개인매도
+    rate_08: int = 0 # 개인증감
+    svolume_08: int = 0 # 개인순매수
+    jjcode_17: str = '' # 외국인투자자코드
+    ms_17: int = 0 # 외국인매수
+    md_17: int = 0 # 외국인매도
+    rate_17: int = 0 # 외국인증감
+    svolume_17: int = 0 # 외국인순매수
+    jjcode_18: str = '' # 기관계투자자코드
+    ms_18: int = 0 # 기관계매수
+    md_18: int = 0 # 기관계매도
+    rate_18: int = 0 # 기관계증감
+    svolume_18: int = 0 # 기관계순매수
+    jjcode_01: str = '' # 증권투자자코드
+    ms_01: int = 0 # 증권매수
+    md_01: int = 0 # 증권매도
+    rate_01: int = 0 # 증권증감
+    svolume_01: int = 0 # 증권순매수
+    jjcode_03: str = '' # 투신투자자코드
+    ms_03: int = 0 # 투신매수
+    md_03: int = 0 # 투신매도
+    rate_03: int = 0 # 투신증감
+    svolume_03: int = 0 # 투신순매수
+    jjcode_04: str = '' # 은행투자자코드
+    ms_04: int = 0 # 은행매수
+    md_04: int = 0 # 은행매도
+    rate_04: int = 0 # 은행증감
+    svolume_04: int = 0 # 은행순매수
+    jjcode_02: str = '' # 보험투자자코드
+    ms_02: int = 0 # 보험매수
+    md_02: int = 0 # 보험매도
+    rate_02: int = 0 # 보험증감
+    svolume_02: int = 0 # 보험순매수
+    jjcode_05: str = '' # 종금투자자코드
+    ms_05: int = 0 # 종금매수
+    md_05: int = 0 # 종금매도
+    rate_05: int = 0 # 종금증감
+    svolume_05: int = 0 # 종금순매수
+    jjcode_06: str = '' # 기금투자자코드
+    ms_06: int = 0 # 기금매수
+    md_06: int = 0 # 기금매도
+    rate_06: int = 0 # 기금증감
+    svolume_06: int = 0 # 기금순매수
+    jjcode_11: str = '' # 국가투자코드
+    ms_11: int = 0 # 국가매수
+    md_11: int = 0 # 국가매도
+    rate_11: int = 0 # 국가증감
+    svolume_11: int = 0 # 국가순매수
+    jjcode_07: str = '' # 기타투자자코드
+    ms_07: int = 0 # 기타매수
+    md_07: int = 0 # 기타매도
+    rate_07: int = 0 # 기타증감
+    svolume_07: int = 0 # 기타순매수
+    jjcode_00: str = '' # 사모펀드투자자코드
+    ms_00: int = 0 # 사모펀드매수
+    md_00: int = 0 # 사모펀드매도
+    rate_00: int = 0 # 사모펀드증감
+    svolume_00: int = 0 # 사모펀드순매수
+
+
+class t1601OutBlock5(msgspec.Struct, frozen=True, gc=False):
+    tjjcode_08: str = '' # 개인투자자코드
+    ms_08: int = 0 # 개인매수
+    md_08: int = 0 # 개인매도
+    rate_08: int = 0 # 개인증감
+    svolume_08: int = 0 # 개인순매수
+    jjcode_17: str = '' # 외국인투자자코드
+    ms_17: int = 0 # 외국인매수
+    md_17: int = 0 # 외국인매도
+    rate_17: int = 0 # 외국인증감
+    svolume_17: int = 0 # 외국인순매수
+    jjcode_18: str = '' # 기관계투자자코드
+    ms_18: int = 0 # 기관계매수
+    md_18: int = 0 # 기관계매도
+    rate_18: int = 0 # 기관계증감
+    svolume_18: int = 0 # 기관계순매수
+    jjcode_01: str = '' # 증권투자자코드
+    ms_01: int = 0 # 증권매수
+    md_01: int = 0 # 증권매도
+    rate_01: int = 0 # 증권증감
+    svolume_01: int = 0 # 증권순매수
+    jjcode_03: str = '' # 투신투자자코드
+    ms_03: int = 0 # 투신매수
+    md_03: int = 0 # 투신매도
+    rate_03: int = 0 # 투신증감
+    svolume_03: int = 0 # 투신순매수
+    jjcode_04: str = '' # 은행투자자코드
+    ms_04: int = 0 # 은행매수
+    md_04: int = 0 # 은행매도
+    rate_04: int = 0 # 은행증감
+    svolume_04: int = 0 # 은행순매수
+    jjcode_02: str = '' # 보험투자자코드
+    ms_02: int = 0 # 보험매수
+    md_02: int = 0 # 보험매도
+    rate_02: int = 0 # 보험증감
+    svolume_02: int = 0 # 보험순매수
+    jjcode_05: str = '' # 종금투자자코드
+    ms_05: int = 0 # 종금매수
+    md_05: int = 0 # 종금매도
+    rate_05: int = 0 # 종금증감
+    svolume_05: int = 0 # 종금순매수
+    jjcode_06: str = '' # 기금투자자코드
+    ms_06: int = 0 # 기금매수
+    md_06: int = 0 # 기금매도
+    rate_06: int = 0 # 기금증감
+    svolume_06: int = 0 # 기금순매수
+    jjcode_11: str = '' # 국가투자코드
+    ms_11: int = 0 # 국가매수
+    md_11: int = 0 # 국가매도
+    rate_11: int = 0 # 국가증감
+    svolume_11: int = 0 # 국가순매수
+    jjcode_07: str = '' # 기타투자자코드
+    ms_07: int = 0 # 기타매수
+    md_07: int = 0 # 기타매도
+    rate_07: int = 0 # 기타증감
+    svolume_07: int = 0 # 기타순매수
+    jjcode_00: str = '' # 사모펀드투자자코드
+    ms_00: int = 0 # 사모펀드매수
+    md_00: int = 0 # 사모펀드매도
+    rate_00: int = 0 # 사모펀드증감
+    svolume_00: int = 0 # 사모펀드순매수
+
+
+class t1601OutBlock6(msgspec.Struct, frozen=True, gc=False):
+    tjjcode_08: str = '' # 개인투자자코드
+    ms_08: int = 0 # 개인매수
+    md_08: int = 0 # 개인매도
+    rate_08: int = 0 # 개인증감
+    svolume_08: int = 0 # 개인순매수
+    jjcode_17: str = '' # 외국인투자자코드
+    ms_17: int = 0 # 외국인매수
+    md_17: int = 0 # 외국인매도
+    rate_17: int = 0 # 외국인증감
+    svolume_17: int = 0 # 외국인순매수
+    jjcode_18: str = '' # 기관계투자자코드
+    ms_18: int = 0 # 기관계매수
+    md_18: int = 0 # 기관계매도
+    rate_18: int = 0 # 기관계증감
+    svolume_18: int = 0 # 기관계순매수
+    jjcode_01: str = '' # 증권투자자코드
+    ms_01: int = 0 # 증권매수
+    md_01: int = 0 # 증권매도
+    rate_01: int = 0 # 증권증감
+    svolume_01: int = 0 # 증권순매수
+    jjcode_03: str = '' # 투신투자자코드
+    ms_03: int = 0 # 투신매수
+    md_03: int = 0 # 투신매도
+    rate_03: int = 0 # 투신증감
+    svolume_03: int = 0 # 투신순매수
+    jjcode_04: str = '' # 은행투자자코드
+    ms_04: int = 0 # 은행매수
+    md_04: int = 0 # 은행매도
+    rate_04: int = 0 # 은행증감
+    svolume_04: int = 0 # 은행순매수
+    jjcode_02: str = '' # 보험투자자코드
+    ms_02: int = 0 # 보험매수
+    md_02: int = 0 # 보험매도
+    rate_02: int = 0 # 보험증감
+    svolume_02: int = 0 # 보험순매수
+    jjcode_05: str = '' # 종금투자자코드
+    ms_05: int = 0 # 종금매수
+    md_05: int = 0 # 종금매도
+    rate_05: int = 0 # 종금증감
+    svolume_05: int = 0 # 종금순매수
+    jjcode_06: str = '' # 기금투자자코드
+    ms_06: int = 0 # 기금매수
+    md_06: int = 0 # 기금매도
+    rate_06: int = 0 # 기금증감
+    svolume_06: int = 0 # 기금순매수
+    jjcode_11: str = '' # 국가투자코드
+    ms_11: int = 0 # 국가매수
+    md_11: int = 0 # 국가매도
+    rate_11: int = 0 # 국가증감
+    svolume_11: int = 0 # 국가순매수
+    jjcode_07: str = '' # 기타투자자코드
+    ms_07: int = 0 # 기타매수
+    md_07: int = 0 # 기타매도
+    rate_07: int = 0 # 기타증감
+    svolume_07: int = 0 # 기타순매수
+    jjcode_00: str = '' # 사모펀드투자자코드
+    ms_00: int = 0 # 사모펀드매수
+    md_00: int = 0 # 사모펀드매도
+    rate_00: int = 0 # 사모펀드증감
+    svolume_00: int = 0 # 사모펀드순매수
+
+
+
+# 투자자별종합(t1601) 
+class t1601(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[t1601OutBlock1] = msgspec.field(default=None, name='t1601OutBlock1')
+    outblock2: Optional[t1601OutBlock2] = msgspec.field(default=None, name='t1601OutBlock2')
+    outblock3: Optional[t1601OutBlock3] = msgspec.field(default=None, name='t1601OutBlock3')
+    outblock4: Optional[t1601OutBlock4] = msgspec.field(default=None, name='t1601OutBlock4')
+    outblock5: Optional[t1601OutBlock5] = msgspec.field(default=None, name='t1601OutBlock5')
+    outblock6: Optional[t1601OutBlock6] = msgspec.field(default=None, name='t1601OutBlock6')
+# endregion
@@ -0,0 +1,107 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1602 - 시간대별투자자매매추이(t1602)>
+class t1602InBlock(msgspec.Struct, frozen=True, gc=False):
+    market: str = '' # 시장구분
+    upcode: str = '' # 업종코드
+    gubun1: str = '' # 수량구분
+    gubun2: str = '' # 전일분구분
+    cts_time: str = '' # CTSTIME
+    cts_idx: int = 0 # CTSIDX
+    cnt: str = '' # 조회건수
+    gubun3: str = '' # 직전대비구분(C:직전대비)
+
+
+class t1602OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_time: str = '' # CTSTIME
+    tjjcode_08: str = '' # 개인투자자코드
+    ms_08: int = 0 # 개인매수
+    md_08: int = 0 # 개인매도
+    rate_08: int = 0 # 개인증감
+    svolume_08: int = 0 # 개인순매수
+    jjcode_17: str = '' # 외국인투자자코드
+    ms_17: int = 0 # 외국인매수
+    md_17: int = 0 # 외국인매도
+    rate_17: int = 0 # 외국인증감
+    svolume_17: int = 0 # 외국인순매수
+    jjcode_18: str = '' # 기관계투자자코드
+    ms_18: int = 0 # 기관계매수
+    md_18: int = 0 # 기관계매도
+    rate_18: int = 0 # 기관계증감
+    svolume_18: int = 0 # 기관계순매수
+    jjcode_01: str = '' # 증권투자자코드
+    ms_01: int = 0 # 증권매수
+    md_01: int = 0 # 증권매도
+    rate_01: int = 0 # 증권증감
+    svolume_01: int = 0 # 증권순매수
+    jjcode_03: str = '' # 투신투자자코드
+    ms_03: int = 0 # 투신매수
+    md_03: int = 0 # 투신매도
+    rate_03: int = 0 # 투신증감
+    svolume_03: int = 0 # 투신순매수
+    jjcode_04: str = '' # 은행투자자코드
+    ms_04: int = 0 # 은행매수
+    md_04: int = 0 # 은행매도
+    rate_04: int = 0 # 은행증감
+    svolume_04: int = 0 # 은행순매수
+    jjcode_02: str = '' # 보험투자자코드
+    ms_02: int = 0 # 보험매수
+    md_02: int = 0 # 보험매도
+    rate_02: int = 0 # 보험증감
+    svolume_02: int = 0 # 보험순매수
+    jjcode_05: str = '' # 종금투자자코드
+    ms_05: int = 0 # 종금매수
+    md_05: int = 0 # 종금매도
+    rate_05: int = 0 # 종금증감
+    svolume_05: int = 0 # 종금순매수
+    jjcode_06: str = '' # 기금투자자코드
+    ms_06: int = 0 # 기금매수
+    md_06: int = 0 # 기금매도
+    rate_06: int = 0 # 기금증감
+    svolume_06: int = 0 # 기금순매수
+    jjcode_07: str = '' # 기타투자자코드
+    ms_07: int = 0 # 기타매수
+    md_07: int = 0 # 기타매도
+    rate_07: int = 0 # 기타증감
+    svolume_07: int = 0 # 기타순매수
+    jjcode_11: str = '' # 국가투자자코드
+    ms_11: int = 0 # 국가매수
+    md_11: int = 0 # 국가매도
+    rate_11: int = 0 # 국가증감
+    svolume_11: int = 0 # 국가순매수
+    jjcode_00: str = '' # 사모펀드코드
+    ms_00: int = 0 # 사모펀드매수
+    md_00: int = 0 # 사모펀드매도
+    rate_00: int = 0 # 사모펀드증감
+    svolume_00: int = 0 # 사모펀드순매수
+
+
+class t1602OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 시간
+    sv_08: int = 0 # 개인순매수
+    sv_17: int = 0 # 외국인순매수
+    sv_18: int = 0 # 기관계순매수
+    sv_01: int = 0 # 증권순매수
+    sv_03: int = 0 # 투신순매수
+    sv_04: int = 0 # 은행순매수
+    sv_02: int = 0 # 보험순매수
+    sv_05: int = 0 # 종금순매수
+    sv_06: int = 0 # 기금순매수
+    sv_07: int = 0 # 기타순매수
+    sv_11: int = 0 # 국가순매수
+    sv_00: int = 0 # 사모펀드순매수
+
+
+
+# 시간대별투자자매매추이(t1602) 
+class t1602(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1602OutBlock] = msgspec.field(default=None, name='t1602OutBlock')
+    outblock1: Optional[List[t1602OutBlock1]] = msgspec.field(default=None, name='t1602OutBlock1')
+# endregion
@@ -0,0 +1,42 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1603 - 시간대별투자자매매추이상세(t1603)>
+class t1603InBlock(msgspec.Struct, frozen=True, gc=False):
+    market: str = '' # 시장구분
+    gubun1: str = '' # 투자자구분
+    gubun2: str = '' # 전일분구분
+    cts_time: str = '' # CTSTIME
+    cts_idx: int = 0 # CTSIDX
+    cnt: str = '' # 조회건수
+    upcode: str = '' # 업종코드
+
+
+class t1603OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_idx: int = 0 # CTSIDX
+    cts_time: str = '' # CTSTIME
+
+
+class t1603OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 시간
+    tjjcode: str = '' # 투자자구분
+    msvolume: int = 0 # 매수수량
+    mdvolume: int = 0 # 매도수량
+    msvalue: int = 0 # 매수금액
+    mdvalue: int = 0 # 매도금액
+    svolume: int = 0 # 순매수수량
+    svalue: int = 0 # 순매수금액
+
+
+
+# 시간대별투자자매매추이상세(t1603) 
+class t1603(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1603OutBlock] = msgspec.field(default=None, name='t1603OutBlock')
+    outblock1: Optional[List[t1603OutBlock1]] = msgspec.field(default=None, name='t1603OutBlock1')
+# endregion
@@ -0,0 +1,38 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1615 - 투자자매매종합1(t1615)>
+class t1615InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 주식구분
+    gubun2: str = '' # 옵션구분
+
+
+class t1615OutBlock(msgspec.Struct, frozen=True, gc=False):
+    dwvolume: int = 0 # 위탁매도수량
+    dwvalue: int = 0 # 위탁매도금액
+    djvolume: int = 0 # 자기매도수량
+    djvalue: int = 0 # 자기매도금액
+    sum_volume: int = 0 # 합계수량
+    sum_value: int = 0 # 합계금액
+
+
+class t1615OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 시장명
+    sv_08: int = 0 # 개인
+    sv_17: int = 0 # 외국인
+    sv_18: int = 0 # 기관계
+    sv_07: int = 0 # 증권
+
+
+
+# 투자자매매종합1(t1615) 
+class t1615(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1615OutBlock] = msgspec.field(default=None, name='t1615OutBlock')
+    outblock1: Optional[List[t1615OutBlock1]] = msgspec.field(default=None, name='t1615OutBlock1')
+# endregion
@@ -0,0 +1,50 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1617 - 투자자매매종합2(t1617)>
+class t1617InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 시장구분(1:코스피2:코스닥3:선물4:콜옵션5:풋옵션6:주식선물)
+    gubun2: str = '' # 수량금액구분(1:수량2:금액)
+    gubun3: str = '' # 일자구분(1:시간대별2:일별)
+    cts_date: str = '' # CTSDATE(연속키값-일자)
+    cts_time: str = '' # CTSTIME(연속키값-시간)
+
+
+class t1617OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_date: str = '' # CTSDATE
+    cts_time: str = '' # CTSTIME
+    ms_08: int = 0 # 개인매수
+    md_08: int = 0 # 개인매도
+    sv_08: int = 0 # 개인순매수
+    ms_17: int = 0 # 외국인매수
+    md_17: int = 0 # 외국인매도
+    sv_17: int = 0 # 외국인순매수
+    ms_18: int = 0 # 기관계매수
+    md_18: int = 0 # 기관계매도
+    sv_18: int = 0 # 기관계순매수
+    ms_01: int = 0 # 증권매수
+    md_01: int = 0 # 증권매도
+    sv_01: int = 0 # 증권순매수
+
+
+class t1617OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    time: str = '' # 시간
+    sv_08: int = 0 # 개인
+    sv_17: int = 0 # 외국인
+    sv_18: int = 0 # 기관계
+    sv_01: int = 0 # 증권
+
+
+
+# 투자자매매종합2(t1617) 
+class t1617(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1617OutBlock] = msgspec.field(default=None, name='t1617OutBlock')
+    outblock1: Optional[List[t1617OutBlock1]] = msgspec.field(default=None, name='t1617OutBlock1')
+# endregion
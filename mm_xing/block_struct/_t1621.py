@@ -0,0 +1,74 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1621 - 업종별분별투자자매매동향(챠트용)>
+class t1621InBlock(msgspec.Struct, frozen=True, gc=False):
+    upcode: str = '' # 업종코드
+    nmin: str = '' # N분
+    cnt: str = '' # 조회건수
+    bgubun: str = '' # 전일분
+
+
+class t1621OutBlock(msgspec.Struct, frozen=True, gc=False):
+    indcode: str = '' # 개인투자자코드
+    forcode: str = '' # 외국인투자자코드
+    syscode: str = '' # 기관계투자자코드
+    stocode: str = '' # 증권투자자코드
+    invcode: str = '' # 투신투자자코드
+    bancode: str = '' # 은행투자자코드
+    inscode: str = '' # 보험투자자코드
+    fincode: str = '' # 종금투자자코드
+    moncode: str = '' # 기금투자자코드
+    etccode: str = '' # 기타투자자코드
+    natcode: str = '' # 국가투자자코드
+    pefcode: str = '' # 사모펀드투자자코드
+    jisucd: str = '' # 기준지수코드
+    jisunm: str = '' # 기준지수명
+
+
+class t1621OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    time: str = '' # 시간
+    datetime: str = '' # 일자시간
+    indmsvol: int = 0 # 개인순매수거래량
+    indmsamt: float = 0.0 # 개인순매수거래대금
+    formsvol: int = 0 # 외국인순매수거래량
+    formsamt: float = 0.0 # 외국인순매수거래대금
+    sysmsvol: int = 0 # 기관계순매수거래량
+    sysmsamt: float = 0.0 # 기관계순매수거래대금
+    stomsvol: int = 0 # 증권순매수거래량
+    stomsamt: float = 0.0 # 증권순매수거래대금
+    invmsvol: int = 0 # 투신순매수거래량
+    invmsamt: float = 0.0 # 투신순매수거래대금
+    banmsvol: int = 0 # 은행순매수거래량
+    banmsamt: float = 0.0 # 은행순매수거래대금
+    insmsvol: int = 0 # 보험순매수거래량
+    insmsamt: float = 0.0 # 보험순매수거래대금
+    finmsvol: int = 0 # 종금순매수거래량
+    finmsamt: float = 0.0 # 종금순매수거래대금
+    monmsvol: int = 0 # 기금순매수거래량
+    monmsamt: float = 0.0 # 기금순매수거래대금
+    etcmsvol: int = 0 # 기타순매수거래량
+    etcmsamt: float = 0.0 # 기타순매수거래대금
+    natmsvol: int = 0 # 국가순매수거래량
+    natmsamt: float = 0.0 # 국가순매수거래대금
+    pefmsvol: int = 0 # 사모펀드순매수거래량
+    pefmsamt: float = 0.0 # 사모펀드순매수거래대금
+    upclose: float = 0.0 # 기준지수
+    upcvolume: int = 0 # 기준체결거래량
+    upvolume: float = 0.0 # 기준누적거래량
+    upvalue: float = 0.0 # 기준거래대금
+
+
+
+# 업종별분별투자자매매동향(챠트용) 
+class t1621(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1621OutBlock] = msgspec.field(default=None, name='t1621OutBlock')
+    outblock1: Optional[List[t1621OutBlock1]] = msgspec.field(default=None, name='t1621OutBlock1')
+# endregion
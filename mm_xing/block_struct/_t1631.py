@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1631 - 프로그램매매종합조회(t1631)>
+class t1631InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    dgubun: str = '' # 일자구분
+    sdate: str = '' # 시작일자
+    edate: str = '' # 종료일자
+
+
+class t1631OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cdhrem: int = 0 # 매도차익미체결잔량
+    bdhrem: int = 0 # 매도비차익미체결잔량
+    tcdrem: int = 0 # 매도차익주문수량
+    tbdrem: int = 0 # 매도비차익주문수량
+    cshrem: int = 0 # 매수차익미체결잔량
+    bshrem: int = 0 # 매수비차익미체결잔량
+    tcsrem: int = 0 # 매수차익주문수량
+    tbsrem: int = 0 # 매수비차익주문수량
+
+
+class t1631OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    offervolume: int = 0 # 매도수량
+    offervalue: int = 0 # 매도금액
+    bidvolume: int = 0 # 매수수량
+    bidvalue: int = 0 # 매수금액
+    volume: int = 0 # 순매수수량
+    value: int = 0 # 순매수금액
+
+
+
+# 프로그램매매종합조회(t1631) 
+class t1631(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1631OutBlock] = msgspec.field(default=None, name='t1631OutBlock')
+    outblock1: Optional[List[t1631OutBlock1]] = msgspec.field(default=None, name='t1631OutBlock1')
+# endregion
@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1632 - 시간대별프로그램매매추이(t1632)>
+class t1632InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    gubun1: str = '' # 금액수량구분
+    gubun2: str = '' # 직전대비증감
+    gubun3: str = '' # 전일구분
+    date: str = '' # 일자
+    time: str = '' # 시간
+
+
+class t1632OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜CTS
+    time: str = '' # 시간CTS
+    idx: int = 0 # IDX
+
+
+class t1632OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 시간
+    k200jisu: float = 0.0 # KP200
+    sign: str = '' # 대비구분
+    change: float = 0.0 # 대비
+    k200basis: float = 0.0 # BASIS
+    tot3: int = 0 # 전체순매수
+    tot1: int = 0 # 전체매수
+    tot2: int = 0 # 전체매도
+    cha3: int = 0 # 차익순매수
+    cha1: int = 0 # 차익매수
+    cha2: int = 0 # 차익매도
+    bcha3: int = 0 # 비차익순매수
+    bcha1: int = 0 # 비차익매수
+    bcha2: int = 0 # 비차익매도
+
+
+
+# 시간대별프로그램매매추이(t1632) 
+class t1632(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1632OutBlock] = msgspec.field(default=None, name='t1632OutBlock')
+    outblock1: Optional[List[t1632OutBlock1]] = msgspec.field(default=None, name='t1632OutBlock1')
+# endregion
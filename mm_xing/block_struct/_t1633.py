@@ -0,0 +1,49 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1633 - 기간별프로그램매매추이(t1633)>
+class t1633InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 시장구분
+    gubun1: str = '' # 금액수량구분
+    gubun2: str = '' # 수치누적구분
+    gubun3: str = '' # 일주월구분
+    fdate: str = '' # from일자
+    tdate: str = '' # to일자
+    gubun4: str = '' # 직전대비증감구분
+    date: str = '' # 날짜
+
+
+class t1633OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    idx: int = 0 # IDX
+
+
+class t1633OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    jisu: float = 0.0 # KP200
+    sign: str = '' # 대비구분
+    change: float = 0.0 # 대비
+    tot3: int = 0 # 전체순매수
+    tot1: int = 0 # 전체매수
+    tot2: int = 0 # 전체매도
+    cha3: int = 0 # 차익순매수
+    cha1: int = 0 # 차익매수
+    cha2: int = 0 # 차익매도
+    bcha3: int = 0 # 비차익순매수
+    bcha1: int = 0 # 비차익매수
+    bcha2: int = 0 # 비차익매도
+    volume: int = 0 # 거래량
+
+
+
+# 기간별프로그램매매추이(t1633) 
+class t1633(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1633OutBlock] = msgspec.field(default=None, name='t1633OutBlock')
+    outblock1: Optional[List[t1633OutBlock1]] = msgspec.field(default=None, name='t1633OutBlock1')
+# endregion
@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1636 - 종목별프로그램매매동향(t1636)>
+class t1636InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+    gubun1: str = '' # 금액수량구분
+    gubun2: str = '' # 정렬기준
+    shcode: str = '' # 종목코드
+    cts_idx: int = 0 # IDXCTS
+
+
+class t1636OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_idx: int = 0 # IDXCTS
+
+
+class t1636OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    rank: int = 0 # 순위
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 대비구분
+    change: int = 0 # 대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    svalue: int = 0 # 순매수금액
+    offervalue: int = 0 # 매도금액
+    stksvalue: int = 0 # 매수금액
+    svolume: int = 0 # 순매수수량
+    offervolume: int = 0 # 매도수량
+    stksvolume: int = 0 # 매수수량
+    sgta: int = 0 # 시가총액
+    rate: float = 0.0 # 비중
+    shcode: str = '' # 종목코드
+
+
+
+# 종목별프로그램매매동향(t1636) 
+class t1636(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1636OutBlock] = msgspec.field(default=None, name='t1636OutBlock')
+    outblock1: Optional[List[t1636OutBlock1]] = msgspec.field(default=None, name='t1636OutBlock1')
+# endregion
@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1637 - 종목별프로그램매매추이(t1637)>
+class t1637InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 수량금액구분(0:수량1:금액)
+    gubun2: str = '' # 시간일별구분(0:시간1:일자)
+    shcode: str = '' # 종목코드
+    date: str = '' # 일자
+    time: str = '' # 시간
+    cts_idx: int = 0 # IDXCTS(9999:차트)
+
+
+class t1637OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_idx: int = 0 # IDXCTS
+
+
+class t1637OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    time: str = '' # 시간
+    price: int = 0 # 현재가
+    sign: str = '' # 대비구분
+    change: int = 0 # 대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    svalue: int = 0 # 순매수금액
+    offervalue: int = 0 # 매도금액
+    stksvalue: int = 0 # 매수금액
+    svolume: int = 0 # 순매수수량
+    offervolume: int = 0 # 매도수량
+    stksvolume: int = 0 # 매수수량
+    shcode: str = '' # 종목코드
+
+
+
+# 종목별프로그램매매추이(t1637) 
+class t1637(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1637OutBlock] = msgspec.field(default=None, name='t1637OutBlock')
+    outblock1: Optional[List[t1637OutBlock1]] = msgspec.field(default=None, name='t1637OutBlock1')
+# endregion
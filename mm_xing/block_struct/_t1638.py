@@ -0,0 +1,38 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1638 - 종목별잔량/사전공시(t1638)>
+class t1638InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 구분
+    shcode: str = '' # 종목코드
+    gubun2: str = '' # 정렬
+
+
+class t1638OutBlock(msgspec.Struct, frozen=True, gc=False):
+    rank: int = 0 # 순위
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    sigatotrt: float = 0.0 # 시총비중
+    obuyvol: int = 0 # 순매수잔량
+    buyrem: int = 0 # 매수잔량
+    psgvolume: int = 0 # 매수공시수량
+    sellrem: int = 0 # 매도잔량
+    pdgvolume: int = 0 # 매도공시수량
+    sigatot: int = 0 # 시가총액
+    shcode: str = '' # 종목코드
+
+
+
+# 종목별잔량/사전공시(t1638) 
+class t1638(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t1638OutBlock]] = msgspec.field(default=None, name='t1638OutBlock')
+# endregion
@@ -0,0 +1,35 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1640 - 프로그램매매종합조회(미니)(t1640)>
+class t1640InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+
+
+class t1640OutBlock(msgspec.Struct, frozen=True, gc=False):
+    offervolume: int = 0 # 매도수량
+    bidvolume: int = 0 # 매수수량
+    volume: int = 0 # 순매수수량
+    offerdiff: int = 0 # 매도증감
+    biddiff: int = 0 # 매수증감
+    sundiff: int = 0 # 순매수증감
+    basis: float = 0.0 # 베이시스
+    offervalue: float = 0.0 # 매도금액
+    bidvalue: float = 0.0 # 매수금액
+    value: float = 0.0 # 순매수금액
+    offervaldiff: float = 0.0 # 매도금액증감
+    bidvaldiff: float = 0.0 # 매수금액증감
+    sunvaldiff: float = 0.0 # 순매수증감
+
+
+
+# 프로그램매매종합조회(미니)(t1640) 
+class t1640(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1640OutBlock] = msgspec.field(default=None, name='t1640OutBlock')
+# endregion
@@ -0,0 +1,40 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1664 - 투자자매매종합(챠트)>
+class t1664InBlock(msgspec.Struct, frozen=True, gc=False):
+    mgubun: str = '' # 시장구분
+    vagubun: str = '' # 금액수량구분
+    bdgubun: str = '' # 시간일별구분
+    cnt: str = '' # 조회건수
+
+
+class t1664OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    dt: str = '' # 일자시간
+    tjj01: float = 0.0 # 증권순매수
+    tjj02: float = 0.0 # 보험순매수
+    tjj03: float = 0.0 # 투신순매수
+    tjj04: float = 0.0 # 은행순매수
+    tjj05: float = 0.0 # 종금순매수
+    tjj06: float = 0.0 # 기금순매수
+    tjj07: float = 0.0 # 기타순매수
+    tjj08: float = 0.0 # 개인순매수
+    tjj17: float = 0.0 # 외국인순매수
+    tjj18: float = 0.0 # 기관순매수
+    cha: float = 0.0 # 차익순매수
+    bicha: float = 0.0 # 비차익순매수
+    totcha: float = 0.0 # 종합순매수
+    basis: float = 0.0 # 베이시스
+
+
+
+# 투자자매매종합(챠트) 
+class t1664(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t1664OutBlock1]] = msgspec.field(default=None, name='t1664OutBlock1')
+# endregion
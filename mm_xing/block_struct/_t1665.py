@@ -0,0 +1,65 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1665 - 기간별투자자매매추이(챠트)>
+class t1665InBlock(msgspec.Struct, frozen=True, gc=False):
+    market: str = '' # 시장구분(1:kospi2:kp2003:kosdaq4:선물5:풋옵션6:콜옵션)
+    upcode: str = '' # 업종코드
+    gubun2: str = '' # 수치구분(1:수치2:누적)
+    gubun3: str = '' # 단위구분(1:일2:주3:월)
+    from_date: str = '' # 시작날짜
+    to_date: str = '' # 종료날짜
+
+
+class t1665OutBlock(msgspec.Struct, frozen=True, gc=False):
+    mcode: str = '' # 시장코드
+    mname: str = '' # 시장명
+
+
+class t1665OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    sv_08: int = 0 # 개인수량
+    sv_17: int = 0 # 외인계수량(등록+미등록)
+    sv_18: int = 0 # 기관계수량
+    sv_01: int = 0 # 증권수량
+    sv_03: int = 0 # 투신수량
+    sv_04: int = 0 # 은행수량
+    sv_02: int = 0 # 보험수량
+    sv_05: int = 0 # 종금수량
+    sv_06: int = 0 # 기금수량
+    sv_07: int = 0 # 기타수량
+    sv_00: int = 0 # 사모펀드수량
+    sv_09: int = 0 # 등록외국인수량
+    sv_10: int = 0 # 미등록외국인수량
+    sv_11: int = 0 # 국가수량
+    sv_99: int = 0 # 기타계수량(기타+국가)
+    sa_08: float = 0.0 # 개인금액
+    sa_17: float = 0.0 # 외인계금액(등록+미등록)
+    sa_18: float = 0.0 # 기관계금액
+    sa_01: float = 0.0 # 증권금액
+    sa_03: float = 0.0 # 투신금액
+    sa_04: float = 0.0 # 은행금액
+    sa_02: float = 0.0 # 보험금액
+    sa_05: float = 0.0 # 종금금액
+    sa_06: float = 0.0 # 기금금액
+    sa_07: float = 0.0 # 기타금액
+    sa_00: float = 0.0 # 사모펀드금액
+    sa_09: float = 0.0 # 등록외국인금액
+    sa_10: float = 0.0 # 미등록외국인금액
+    sa_11: float = 0.0 # 국가금액
+    sa_99: float = 0.0 # 기타계금액(기타+국가)
+    jisu: float = 0.0 # 시장지수
+
+
+
+# 기간별투자자매매추이(챠트) 
+class t1665(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1665OutBlock] = msgspec.field(default=None, name='t1665OutBlock')
+    outblock1: Optional[List[t1665OutBlock1]] = msgspec.field(default=None, name='t1665OutBlock1')
+# endregion
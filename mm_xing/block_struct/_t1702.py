@@ -0,0 +1,55 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1702 - 외인기관종목별동향(t1702)>
+class t1702InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    todt: str = '' # 종료일자
+    volvalgb: str = '' # 금액수량구분(0:금액1:수량2:단가)
+    msmdgb: str = '' # 매수매도구분(0:순매수1:매수2:매도)
+    cumulgb: str = '' # 누적구분(0:일간1:누적)
+    cts_date: str = '' # CTSDATE
+    cts_idx: int = 0 # CTSIDX
+
+
+class t1702OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_idx: int = 0 # CTSIDX
+    cts_date: str = '' # CTSDATE
+
+
+class t1702OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    close: int = 0 # 종가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    amt0000: int = 0 # 사모펀드
+    amt0001: int = 0 # 증권
+    amt0002: int = 0 # 보험
+    amt0003: int = 0 # 투신
+    amt0004: int = 0 # 은행
+    amt0005: int = 0 # 종금
+    amt0006: int = 0 # 기금
+    amt0007: int = 0 # 기타법인
+    amt0008: int = 0 # 개인
+    amt0009: int = 0 # 등록외국인
+    amt0010: int = 0 # 미등록외국인
+    amt0011: int = 0 # 국가외
+    amt0018: int = 0 # 기관
+    amt0088: int = 0 # 외인계(등록+미등록)
+    amt0099: int = 0 # 기타계(기타+국가)
+
+
+
+# 외인기관종목별동향(t1702) 
+class t1702(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1702OutBlock] = msgspec.field(default=None, name='t1702OutBlock')
+    outblock1: Optional[List[t1702OutBlock1]] = msgspec.field(default=None, name='t1702OutBlock1')
+# endregion
@@ -0,0 +1,44 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1716 - 외인기관종목별동향(t1716)>
+class t1716InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    gubun: str = '' # 구분(0:일간순매수1:기간누적순매수)
+    fromdt: str = '' # 시작일자
+    todt: str = '' # 종료일자
+    prapp: int = 0 # PR감산적용율
+    prgubun: str = '' # PR적용구분(0:적용안함1:적용)
+    orggubun: str = '' # 기관적용
+    frggubun: str = '' # 외인적용
+
+
+class t1716OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    close: int = 0 # 종가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    krx_0008: int = 0 # 거래소_개인
+    krx_0018: int = 0 # 거래소_기관
+    krx_0009: int = 0 # 거래소_외국인
+    pgmvol: int = 0 # 프로그램
+    fsc_listing: int = 0 # 금감원_외인보유주식수
+    fsc_sjrate: float = 0.0 # 금감원_소진율
+    fsc_0009: int = 0 # 금감원_외국인
+    gm_volume: int = 0 # 공매도수량
+    gm_value: int = 0 # 공매도대금
+
+
+
+# 외인기관종목별동향(t1716) 
+class t1716(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t1716OutBlock]] = msgspec.field(default=None, name='t1716OutBlock')
+# endregion
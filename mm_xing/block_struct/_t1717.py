@@ -0,0 +1,61 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1717 - 외인기관종목별동향(t1717)>
+class t1717InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    gubun: str = '' # 구분(0:일간순매수1:기간누적순매수)
+    fromdt: str = '' # 시작일자(일간조회일경우는space)
+    todt: str = '' # 종료일자
+
+
+class t1717OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    close: int = 0 # 종가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    tjj0000_vol: int = 0 # 사모펀드(순매수량)
+    tjj0001_vol: int = 0 # 증권(순매수량)
+    tjj0002_vol: int = 0 # 보험(순매수량)
+    tjj0003_vol: int = 0 # 투신(순매수량)
+    tjj0004_vol: int = 0 # 은행(순매수량)
+    tjj0005_vol: int = 0 # 종금(순매수량)
+    tjj0006_vol: int = 0 # 기금(순매수량)
+    tjj0007_vol: int = 0 # 기타법인(순매수량)
+    tjj0008_vol: int = 0 # 개인(순매수량)
+    tjj0009_vol: int = 0 # 등록외국인(순매수량)
+    tjj0010_vol: int = 0 # 미등록외국인(순매수량)
+    tjj0011_vol: int = 0 # 국가외(순매수량)
+    tjj0018_vol: int = 0 # 기관(순매수량)
+    tjj0016_vol: int = 0 # 외인계(순매수량)(등록+미등록)
+    tjj0017_vol: int = 0 # 기타계(순매수량)(기타+국가)
+    tjj0000_dan: int = 0 # 사모펀드(단가)
+    tjj0001_dan: int = 0 # 증권(단가)
+    tjj0002_dan: int = 0 # 보험(단가)
+    tjj0003_dan: int = 0 # 투신(단가)
+    tjj0004_dan: int = 0 # 은행(단가)
+    tjj0005_dan: int = 0 # 종금(단가)
+    tjj0006_dan: int = 0 # 기금(단가)
+    tjj0007_dan: int = 0 # 기타법인(단가)
+    tjj0008_dan: int = 0 # 개인(단가)
+    tjj0009_dan: int = 0 # 등록외국인(단가)
+    tjj0010_dan: int = 0 # 미등록외국인(단가)
+    tjj0011_dan: int = 0 # 국가외(단가)
+    tjj0018_dan: int = 0 # 기관(단가)
+    tjj0016_dan: int = 0 # 외인계(단가)(등록+미등록)
+    tjj0017_dan: int = 0 # 기타계(단가)(기타+국가)
+
+
+
+# 외인기관종목별동향(t1717) 
+class t1717(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t1717OutBlock]] = msgspec.field(default=None, name='t1717OutBlock')
+# endregion
@@ -0,0 +1,42 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1752 - 종목별상위회원사(t1752)>
+class t1752InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    traddate1: str = '' # 조회날짜1
+    traddate2: str = '' # 조회날짜2
+    fwgubun1: str = '' # 외국계구분
+    cts_idx: int = 0 # CTSIDX
+
+
+class t1752OutBlock(msgspec.Struct, frozen=True, gc=False):
+    fwdvl: int = 0 # 외국계매도
+    fwsvl: int = 0 # 외국계매수
+    cts_idx: int = 0 # CTSIDX
+
+
+class t1752OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    tradname: str = '' # 회원사
+    tradmdvol: int = 0 # 매도수량
+    tradmsvol: int = 0 # 매수수량
+    tradmssvol: int = 0 # 순매수
+    wintrd: int = 0 # 창구거래
+    winrat: float = 0.0 # 비중
+    tradno: str = '' # 회원사코드
+    wgubun: str = '' # 외국계여부
+    swinrat: float = 0.0 # 순비중
+
+
+
+# 종목별상위회원사(t1752) 
+class t1752(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1752OutBlock] = msgspec.field(default=None, name='t1752OutBlock')
+    outblock1: Optional[List[t1752OutBlock1]] = msgspec.field(default=None, name='t1752OutBlock1')
+# endregion
@@ -0,0 +1,26 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1764 - 회원사리스트(t1764)>
+class t1764InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    gubun1: str = '' # 구분1
+
+
+class t1764OutBlock(msgspec.Struct, frozen=True, gc=False):
+    rank: int = 0 # 순위
+    tradno: str = '' # 거래원번호
+    tradname: str = '' # 거래원이름
+
+
+
+# 회원사리스트(t1764) 
+class t1764(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t1764OutBlock]] = msgspec.field(default=None, name='t1764OutBlock')
+# endregion
@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1771 - 종목별회원사추이(t1771)>
+class t1771InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    tradno: str = '' # 거래원코드
+    gubun1: str = '' # 구분1
+    traddate1: str = '' # 거래원날짜1
+    traddate2: str = '' # 거래원날짜2
+    cts_idx: int = 0 # CTSIDX
+    cnt: str = '' # 요청건수
+
+
+class t1771OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_idx: int = 0 # CTSIDX
+
+
+class t1771OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    traddate: str = '' # 날짜
+    tradtime: str = '' # 시간
+    price: int = 0 # 현재가
+    sign: str = '' # 대비구분
+    change: int = 0 # 대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    tradmdcha: int = 0 # 매도
+    tradmscha: int = 0 # 매수
+    tradmdval: int = 0 # 매도대금
+    tradmsval: int = 0 # 매수대금
+    tradmsscha: int = 0 # 순매수
+    tradmttvolume: int = 0 # 누적순매수
+    tradavg: int = 0 # 평균단가
+    tradmttavg: int = 0 # 누적평균단가
+
+
+
+# 종목별회원사추이(t1771) 
+class t1771(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1771OutBlock] = msgspec.field(default=None, name='t1771OutBlock')
+    outblock2: Optional[List[t1771OutBlock2]] = msgspec.field(default=None, name='t1771OutBlock2')
+# endregion
@@ -0,0 +1,44 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1809 - 신호조회(t1809)>
+class t1809InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 신호구분
+    jmGb: str = '' # 종목구분
+    jmcode: str = '' # 종목코드
+    cts: str = '' # NEXTKEY
+
+
+class t1809OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts: str = '' # NEXTKEY
+
+
+class t1809OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    time: str = '' # 시간
+    signal_id: str = '' # 신호ID
+    signal_desc: str = '' # 신호명
+    point: str = '' # 신호강도
+    keyword: str = '' # 뉴스신호키워드
+    seq: str = '' # 신호별구분
+    gubun: str = '' # 신호구분
+    jmcode: str = '' # 신호종목
+    price: int = 0 # 종목가격
+    sign: str = '' # 종목등락부호
+    chgrate: float = 0.0 # 대비등락율
+    volume: int = 0 # 거래량
+    datetime: str = '' # 신호일시
+
+
+
+# 신호조회(t1809) 
+class t1809(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1809OutBlock] = msgspec.field(default=None, name='t1809OutBlock')
+    outblock1: Optional[List[t1809OutBlock1]] = msgspec.field(default=None, name='t1809OutBlock1')
+# endregion
@@ -0,0 +1,37 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1825 - 종목Q클릭검색(씽큐스마트)(t1825)>
+class t1825InBlock(msgspec.Struct, frozen=True, gc=False):
+    search_cd: str = '' # 검색코드
+    gubun: str = '' # 구분(0:전체1:코스피2:코스닥)
+
+
+class t1825OutBlock(msgspec.Struct, frozen=True, gc=False):
+    JongCnt: int = 0 # 검색종목수
+
+
+class t1825OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    sign: str = '' # 전일대비구분
+    signcnt: int = 0 # 연속봉수
+    close: int = 0 # 현재가
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    volumerate: float = 0.0 # 거래량전일대비율
+
+
+
+# 종목Q클릭검색(씽큐스마트)(t1825) 
+class t1825(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1825OutBlock] = msgspec.field(default=None, name='t1825OutBlock')
+    outblock1: Optional[List[t1825OutBlock1]] = msgspec.field(default=None, name='t1825OutBlock1')
+# endregion
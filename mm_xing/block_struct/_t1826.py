@@ -0,0 +1,24 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1826 - 종목Q클릭검색리스트조회(씽큐스마트)(t1826)>
+class t1826InBlock(msgspec.Struct, frozen=True, gc=False):
+    search_gb: str = '' # 검색구분(0:핵심검색1:지표검색2:시세동향3:투자자동향)
+
+
+class t1826OutBlock(msgspec.Struct, frozen=True, gc=False):
+    search_cd: str = '' # 검색코드
+    search_nm: str = '' # 검색명
+
+
+
+# 종목Q클릭검색리스트조회(씽큐스마트)(t1826) 
+class t1826(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t1826OutBlock]] = msgspec.field(default=None, name='t1826OutBlock')
+# endregion
@@ -0,0 +1,39 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1857 - e종목검색(신버전API용)>
+class t1857InBlock(msgspec.Struct, frozen=True, gc=False):
+    sRealFlag: str = '' # 실시간구분(0:조회 1:실시간)
+    sSearchFlag: str = '' # 종목검색구분(F:파일 S:서버)
+    query_index: str = '' # 종목검색입력값
+
+
+class t1857OutBlock(msgspec.Struct, frozen=True, gc=False):
+    result_count: int = 0 # 검색종목수
+    result_time: str = '' # 포착시간
+    AlertNum: str = '' # 실시간키
+
+
+class t1857OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    JobFlag: str = '' # 종목상태(N:진입 R:재진입 O:이탈)
+
+
+
+# e종목검색(신버전API용) 
+class t1857(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1857OutBlock] = msgspec.field(default=None, name='t1857OutBlock')
+    outblock1: Optional[List[t1857OutBlock1]] = msgspec.field(default=None, name='t1857OutBlock1')
+# endregion
@@ -0,0 +1,36 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1866 - 서버저장조건리스트조회(API)(t1866)>
+class t1866InBlock(msgspec.Struct, frozen=True, gc=False):
+    user_id: str = '' # 로그인ID
+    gb: str = '' # 조회구분
+    group_name: str = '' # 그룹명
+    cont: str = '' # 연속여부
+    contkey: str = '' # 연속키
+
+
+class t1866OutBlock(msgspec.Struct, frozen=True, gc=False):
+    result_count: int = 0 # 저장조건수
+    cont: str = '' # 연속여부
+    contkey: str = '' # 연속키
+
+
+class t1866OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    query_index: str = '' # 서버저장인덱스
+    group_name: str = '' # 그룹명
+    query_name: str = '' # 조건저장명
+
+
+
+# 서버저장조건리스트조회(API)(t1866) 
+class t1866(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1866OutBlock] = msgspec.field(default=None, name='t1866OutBlock')
+    outblock1: Optional[List[t1866OutBlock1]] = msgspec.field(default=None, name='t1866OutBlock1')
+# endregion
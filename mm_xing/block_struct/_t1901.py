@@ -0,0 +1,156 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1901 - ETF현재가(시세)조회(t1901)>
+class t1901InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class t1901OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: float = 0.0 # 누적거래량
+    recprice: int = 0 # 기준가
+    avg: int = 0 # 가중평균
+    uplmtprice: int = 0 # 상한가
+    dnlmtprice: int = 0 # 하한가
+    jnilvolume: float = 0.0 # 전일거래량
+    volumediff: int = 0 # 거래량차
+    open: int = 0 # 시가
+    opentime: str = '' # 시가시간
+    high: int = 0 # 고가
+    hightime: str = '' # 고가시간
+    low: int = 0 # 저가
+    lowtime: str = '' # 저가시간
+    high52w: int = 0 # 52최고가
+    high52wdate: str = '' # 52최고가일
+    low52w: int = 0 # 52최저가
+    low52wdate: str = '' # 52최저가일
+    exhratio: float = 0.0 # 소진율
+    flmtvol: float = 0.0 # 외국인보유수량
+    per: float = 0.0 # PER
+    listing: int = 0 # 상장주식수(천)
+    jkrate: int = 0 # 증거금율
+    vol: float = 0.0 # 회전율
+    shcode: str = '' # 단축코드
+    value: int = 0 # 누적거래대금
+    highyear: int = 0 # 연중최고가
+    highyeardate: str = '' # 연중최고일자
+    lowyear: int = 0 # 연중최저가
+    lowyeardate: str = '' # 연중최저일자
+    upname: str = '' # 업종명
+    upcode: str = '' # 업종코드
+    upprice: float = 0.0 # 업종현재가
+    upsign: str = '' # 업종전일비구분
+    upchange: float = 0.0 # 업종전일대비
+    updiff: float = 0.0 # 업종등락율
+    futname: str = '' # 선물최근월물명
+    futcode: str = '' # 선물최근월물코드
+    futprice: float = 0.0 # 선물현재가
+    futsign: str = '' # 선물전일비구분
+    futchange: float = 0.0 # 선물전일대비
+    futdiff: float = 0.0 # 선물등락율
+    nav: float = 0.0 # NAV
+    navsign: str = '' # NAV전일대비구분
+    navchange: float = 0.0 # NAV전일대비
+    navdiff: float = 0.0 # NAV등락율
+    cocrate: float = 0.0 # 추적오차율
+    kasis: float = 0.0 # 괴리율
+    subprice: int = 0 # 대용가
+    offerno1: str = '' # 매도증권사코드1
+    bidno1: str = '' # 매수증권사코드1
+    dvol1: int = 0 # 총매도수량1
+    svol1: int = 0 # 총매수수량1
+    dcha1: int = 0 # 매도증감1
+    scha1: int = 0 # 매수증감1
+    ddiff1: float = 0.0 # 매도비율1
+    sdiff1: float = 0.0 # 매수비율1
+    offerno2: str = '' # 매도증권사코드2
+    bidno2: str = '' # 매수증권사코드2
+    dvol2: int = 0 # 총매도수량2
+    svol2: int = 0 # 총매수수량2
+    dcha2: int = 0 # 매도증감2
+    scha2: int = 0 # 매수증감2
+    ddiff2: float = 0.0 # 매도비율2
+    sdiff2: float = 0.0 # 매수비율2
+    offerno3: str = '' # 매도증권사코드3
+    bidno3: str = '' # 매수증권사코드3
+    dvol3: int = 0 # 총매도수량3
+    svol3: int = 0 # 총매수수량3
+    dcha3: int = 0 # 매도증감3
+    scha3: int = 0 # 매수증감3
+    ddiff3: float = 0.0 # 매도비율3
+    sdiff3: float = 0.0 # 매수비율3
+    offerno4: str = '' # 매도증권사코드4
+    bidno4: str = '' # 매수증권사코드4
+    dvol4: int = 0 # 총매도수량4
+    svol4: int = 0 # 총매수수량4
+    dcha4: int = 0 # 매도증감4
+    scha4: int = 0 # 매수증감4
+    ddiff4: float = 0.0 # 매도비율4
+    sdiff4: float = 0.0 # 매수비율4
+    offerno5: str = '' # 매도증권사코드5
+    bidno5: str = '' # 매수증권사코드5
+    dvol5: int = 0 # 총매도수량5
+    svol5: int = 0 # 총매수수량5
+    dcha5: int = 0 # 매도증감5
+    scha5: int = 0 # 매수증감5
+    ddiff5: float = 0.0 # 매도비율5
+    sdiff5: float = 0.0 # 매수비율5
+    fwdvl: int = 0 # 외국계매도합계수량
+    ftradmdcha: int = 0 # 외국계매도직전대비
+    ftradmddiff: float = 0.0 # 외국계매도비율
+    fwsvl: int = 0 # 외국계매수합계수량
+    ftradmscha: int = 0 # 외국계매수직전대비
+    ftradmsdiff: float = 0.0 # 외국계매수비율
+    upname2: str = '' # 참고지수명
+    upcode2: str = '' # 참고지수코드
+    upprice2: float = 0.0 # 참고지수현재가
+    jnilnav: float = 0.0 # 전일NAV
+    jnilnavsign: str = '' # 전일NAV전일대비구분
+    jnilnavchange: float = 0.0 # 전일NAV전일대비
+    jnilnavdiff: float = 0.0 # 전일NAV등락율
+    etftotcap: int = 0 # 순자산총액(억원)
+    spread: float = 0.0 # 스프레드
+    leverage: int = 0 # 레버리지
+    taxgubun: str = '' # 과세구분
+    opcom_nmk: str = '' # 운용사
+    lp_nm1: str = '' # LP1
+    lp_nm2: str = '' # LP2
+    lp_nm3: str = '' # LP3
+    lp_nm4: str = '' # LP4
+    lp_nm5: str = '' # LP5
+    etf_cp: str = '' # 복제방법
+    etf_kind: str = '' # 상품유형(Filler)
+    vi_gubun: str = '' # VI발동해제
+    etn_kind_cd: str = '' # ETN상품분류
+    lastymd: str = '' # ETN만기일
+    payday: str = '' # ETN지급일
+    lastdate: str = '' # ETN최종거래일
+    issuernmk: str = '' # ETN발행시장참가자
+    last_sdate: str = '' # ETN만기상환가격결정시작일
+    last_edate: str = '' # ETN만기상환가격결정종료일
+    lp_holdvol: str = '' # ETNLP보유수량
+    listdate: str = '' # 상장일
+    etp_gb: str = '' # ETP상품구분코드
+    etn_elback_yn: str = '' # ETN조기상환가능여부
+    settletype: str = '' # 최종결제
+    idx_asset_class1: str = '' # 지수자산분류코드(대분류)
+    ty_text: str = '' # ETF/ETN투자유의
+    leverage2: float = 0.0 # 추적수익률배수
+
+
+
+# ETF현재가(시세)조회(t1901) 
+class t1901(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1901OutBlock] = msgspec.field(default=None, name='t1901OutBlock')
+# endregion
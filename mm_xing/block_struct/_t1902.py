@@ -0,0 +1,43 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1902 - ETF시간별추이(t1902)>
+class t1902InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    time: str = '' # 시간
+
+
+class t1902OutBlock(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 시간
+    hname: str = '' # 종목명
+    upname: str = '' # 업종지수명
+
+
+class t1902OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 시간
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    volume: float = 0.0 # 누적거래량
+    navdiff: float = 0.0 # NAV대비
+    nav: float = 0.0 # NAV
+    navchange: float = 0.0 # 전일대비
+    crate: float = 0.0 # 추적오차
+    grate: float = 0.0 # 괴리
+    jisu: float = 0.0 # 지수
+    jichange: float = 0.0 # 전일대비
+    jirate: float = 0.0 # 전일대비율
+
+
+
+# ETF시간별추이(t1902) 
+class t1902(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1902OutBlock] = msgspec.field(default=None, name='t1902OutBlock')
+    outblock1: Optional[List[t1902OutBlock1]] = msgspec.field(default=None, name='t1902OutBlock1')
+# endregion
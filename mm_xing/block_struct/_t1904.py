@@ -0,0 +1,80 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1904 - ETF구성종목조회(t1904)>
+class t1904InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # ETF단축코드
+    date: str = '' # PDF적용일자
+    sgb: str = '' # 정렬기준(1:평가금액2:증권수)
+
+
+class t1904OutBlock(msgspec.Struct, frozen=True, gc=False):
+    chk_tday: str = '' # 당일구분
+    date: str = '' # PDF적용일자
+    price: int = 0 # ETF현재가
+    sign: str = '' # ETF전일대비구분
+    change: int = 0 # ETF전일대비
+    diff: float = 0.0 # ETF등락율
+    volume: int = 0 # ETF누적거래량
+    nav: float = 0.0 # NAV
+    navsign: str = '' # NAV전일대비구분
+    navchange: float = 0.0 # NAV전일대비
+    navdiff: float = 0.0 # NAV등락율
+    jnilnav: float = 0.0 # 전일NAV
+    jnilnavsign: str = '' # 전일NAV전일대비구분
+    jnilnavchange: float = 0.0 # 전일NAV전일대비
+    jnilnavdiff: float = 0.0 # 전일NAV등락율
+    upname: str = '' # 업종명
+    upcode: str = '' # 업종코드
+    upprice: float = 0.0 # 업종현재가
+    upsign: str = '' # 업종전일비구분
+    upchange: float = 0.0 # 업종전일대비
+    updiff: float = 0.0 # 업종등락율
+    futname: str = '' # 선물최근월물명
+    futcode: str = '' # 선물최근월물코드
+    futprice: float = 0.0 # 선물현재가
+    futsign: str = '' # 선물전일비구분
+    futchange: float = 0.0 # 선물전일대비
+    futdiff: float = 0.0 # 선물등락율
+    upname2: str = '' # 참고지수명
+    upcode2: str = '' # 참고지수코드
+    upprice2: float = 0.0 # 참고지수현재가
+    etftotcap: int = 0 # 순자산총액(단위:억)
+    etfnum: int = 0 # 구성종목수
+    etfcunum: int = 0 # CU주식수
+    cash: int = 0 # 현금
+    opcom_nmk: str = '' # 운용사명
+    tot_pval: int = 0 # 전종목평가금액합
+    tot_sigatval: int = 0 # 전종목구성시가총액합
+
+
+class t1904OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    value: int = 0 # 거래대금(백만)
+    icux: int = 0 # 단위증권수(계약수/원화현금/USD현금/창고증권)
+    parprice: int = 0 # 액면금액/설정현금액
+    pvalue: int = 0 # 평가금액
+    sigatvalue: int = 0 # 구성시가총액
+    profitdate: str = '' # PDF적용일자
+    weight: float = 0.0 # 비중(평가금액)
+    diff2: float = 0.0 # ETF종목과등락차
+
+
+
+# ETF구성종목조회(t1904) 
+class t1904(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1904OutBlock] = msgspec.field(default=None, name='t1904OutBlock')
+    outblock1: Optional[List[t1904OutBlock1]] = msgspec.field(default=None, name='t1904OutBlock1')
+# endregion
@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1921 - 신용거래동향(t1921)>
+class t1921InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    gubun: str = '' # 융자대주구분
+    date: str = '' # 날짜
+    idx: int = 0 # IDX
+
+
+class t1921OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cnt: int = 0 # CNT
+    date: str = '' # 날짜
+    idx: int = 0 # IDX
+
+
+class t1921OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    mmdate: str = '' # 날짜
+    close: int = 0 # 종가
+    sign: str = '' # 전일대비구분
+    jchange: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    nvolume: int = 0 # 신규
+    svolume: int = 0 # 상환
+    jvolume: int = 0 # 잔고
+    price: int = 0 # 금액
+    change: int = 0 # 대비
+    gyrate: float = 0.0 # 공여율
+    jkrate: float = 0.0 # 잔고율
+    shcode: str = '' # 종목코드
+
+
+
+# 신용거래동향(t1921) 
+class t1921(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1921OutBlock] = msgspec.field(default=None, name='t1921OutBlock')
+    outblock1: Optional[List[t1921OutBlock1]] = msgspec.field(default=None, name='t1921OutBlock1')
+# endregion
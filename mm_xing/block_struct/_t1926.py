@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1926 - 종목별신용정보(t1926)>
+class t1926InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+
+
+class t1926OutBlock(msgspec.Struct, frozen=True, gc=False):
+    ynvolume: int = 0 # 융자신규수량
+    ysvolume: int = 0 # 융자상환수량
+    yjvolume: int = 0 # 융자잔고수량
+    yvchange: int = 0 # 융자수량대비
+    ygrate: float = 0.0 # 융자공여율
+    yjrate: float = 0.0 # 융자잔고율
+    ynprice: int = 0 # 융자신규금액
+    ysprice: int = 0 # 융자상환금액
+    yjprice: int = 0 # 융자잔고금액
+    yachange: int = 0 # 융자금액대비
+    dnvolume: int = 0 # 대주신규수량
+    dsvolume: int = 0 # 대주상환수량
+    djvolume: int = 0 # 대주잔고수량
+    dvchange: int = 0 # 대주수량대비
+    dgrate: float = 0.0 # 대주공여율
+    djrate: float = 0.0 # 대주잔고율
+    dnprice: int = 0 # 대주신규금액
+    dsprice: int = 0 # 대주상환금액
+    djprice: int = 0 # 대주잔고금액
+    dachange: int = 0 # 대주금액대비
+    mmdate: str = '' # 결제일
+    close: int = 0 # 결제일종가
+    volume: int = 0 # 결제일거래량
+    value: int = 0 # 결제일거래대금
+    pr5days: float = 0.0 # 주가5일증가율
+    pr20days: float = 0.0 # 주가20일증가율
+    yj5days: float = 0.0 # 융자5일증가율
+    yj20days: float = 0.0 # 융자20일증가율
+    dj5days: float = 0.0 # 대주5일증가율
+    dj20days: float = 0.0 # 대주20일증가율
+
+
+
+# 종목별신용정보(t1926) 
+class t1926(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1926OutBlock] = msgspec.field(default=None, name='t1926OutBlock')
+# endregion
@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1927 - 공매도일별추이(t1927)>
+class t1927InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    date: str = '' # 일자
+    sdate: str = '' # 시작일자
+    edate: str = '' # 종료일자
+
+
+class t1927OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자CTS
+
+
+class t1927OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    value: int = 0 # 거래대금
+    gm_vo: int = 0 # 공매도수량
+    gm_va: int = 0 # 공매도대금
+    gm_per: float = 0.0 # 공매도거래비중
+    gm_avg: int = 0 # 평균공매도단가
+    gm_vo_sum: int = 0 # 누적공매도수량
+    gm_vo1: int = 0 # 업틱룰적용공매도수량
+    gm_va1: int = 0 # 업틱룰적용공매도대금
+    gm_vo2: int = 0 # 업틱룰예외공매도수량
+    gm_va2: int = 0 # 업틱룰예외공매도대금
+
+
+
+# 공매도일별추이(t1927) 
+class t1927(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1927OutBlock] = msgspec.field(default=None, name='t1927OutBlock')
+    outblock1: Optional[List[t1927OutBlock1]] = msgspec.field(default=None, name='t1927OutBlock1')
+# endregion
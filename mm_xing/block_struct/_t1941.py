@@ -0,0 +1,36 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1941 - 종목별대차거래일간추이(t1941)>
+class t1941InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    sdate: str = '' # 시작일자
+    edate: str = '' # 종료일자
+
+
+class t1941OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    price: int = 0 # 종가
+    sign: str = '' # 대비구분
+    change: int = 0 # 대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    upvolume: int = 0 # 당일체결
+    dnvolume: int = 0 # 당일상환
+    tovolume: int = 0 # 당일잔고
+    tovalue: int = 0 # 잔고금액
+    shcode: str = '' # 종목코드
+    tovoldif: int = 0 # 대차증감
+
+
+
+# 종목별대차거래일간추이(t1941) 
+class t1941(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t1941OutBlock1]] = msgspec.field(default=None, name='t1941OutBlock1')
+# endregion
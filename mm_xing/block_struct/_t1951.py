@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1951 - ELW시간대별체결조회(t1951)>
+class t1951InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    cvolume: int = 0 # 특이거래량
+    starttime: str = '' # 시작시간
+    endtime: str = '' # 종료시간
+    cts_time: str = '' # 시간CTS
+
+
+class t1951OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_time: str = '' # 시간CTS
+
+
+class t1951OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    cvolume: int = 0 # 체결수량
+    chdegree: float = 0.0 # 체결강도
+    volume: int = 0 # 거래량
+    mdvolume: int = 0 # 매도체결수량
+    mdchecnt: int = 0 # 매도체결건수
+    msvolume: int = 0 # 매수체결수량
+    mschecnt: int = 0 # 매수체결건수
+    revolume: int = 0 # 순체결량
+    rechecnt: int = 0 # 순체결건수
+
+
+
+# ELW시간대별체결조회(t1951) 
+class t1951(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1951OutBlock] = msgspec.field(default=None, name='t1951OutBlock')
+    outblock1: Optional[List[t1951OutBlock1]] = msgspec.field(default=None, name='t1951OutBlock1')
+# endregion
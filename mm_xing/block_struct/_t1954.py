@@ -0,0 +1,55 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1954 - ELW일별주가(t1954)>
+class t1954InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    date: str = '' # 날짜
+    cnt: int = 0 # 건수
+
+
+class t1954OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    bsjgubun: str = '' # 기초자산구분
+    bscode: str = '' # 기초자산코드(현물)
+    bjcode: str = '' # 기초자산코드(지수)
+
+
+class t1954OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    close: int = 0 # 종가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: float = 0.0 # 거래량
+    bsprice: int = 0 # 기초자산(현물)
+    bjprice: float = 0.0 # 기초자산(지수)
+    bsign: str = '' # 전일대비구분
+    bschange: int = 0 # 전일대비(현물)
+    bjchange: float = 0.0 # 전일대비(지수)
+    bdiff: float = 0.0 # 등락율
+    bvolume: float = 0.0 # 기초자산거래량
+    parity: float = 0.0 # 패리티
+    egearing: float = 0.0 # e.기어링
+    premium: float = 0.0 # 프리미엄
+    berate: float = 0.0 # 손익분기
+    capt: float = 0.0 # 자본지지
+    gearing: float = 0.0 # 기어링
+    mness: str = '' # Moneyness
+
+
+
+# ELW일별주가(t1954) 
+class t1954(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1954OutBlock] = msgspec.field(default=None, name='t1954OutBlock')
+    outblock1: Optional[List[t1954OutBlock1]] = msgspec.field(default=None, name='t1954OutBlock1')
+# endregion
@@ -0,0 +1,115 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1956 - ELW현재가(확정지급액)조회(t1956)>
+class t1956InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class t1956OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    chetime: str = '' # 체결시간
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    cvolume: int = 0 # 체결량
+    volume: float = 0.0 # 누적거래량
+    recprice: int = 0 # 기준가
+    avg: int = 0 # 가중평균
+    jnilvolume: float = 0.0 # 전일거래량
+    jvolume: float = 0.0 # 전일동시간거래량
+    jnilclose: int = 0 # 전일종가
+    volumechg: float = 0.0 # 거래량차
+    volumediff: float = 0.0 # 거래량차등락율
+    open: int = 0 # 시가
+    odiff: float = 0.0 # 시가등락율
+    opentime: str = '' # 시가시간
+    high: int = 0 # 고가
+    hdiff: float = 0.0 # 고가등락율
+    hightime: str = '' # 고가시간
+    low: int = 0 # 저가
+    ldiff: float = 0.0 # 저가등락율
+    lowtime: str = '' # 저가시간
+    high52w: int = 0 # 52최고가
+    high52wdiff: float = 0.0 # 52최고가등락율
+    high52wdate: str = '' # 52최고가일
+    low52w: int = 0 # 52최저가
+    low52wdiff: float = 0.0 # 52최저가등락율
+    low52wdate: str = '' # 52최저가일
+    exhratio: float = 0.0 # 소진율
+    listing: float = 0.0 # 상장주식수(천)
+    memedan: str = '' # 수량단위
+    vol: float = 0.0 # 회전율
+    parity: float = 0.0 # 패리티
+    berate: float = 0.0 # 손익분기
+    gearing: float = 0.0 # 기어링
+    elwexec: float = 0.0 # 행사가
+    issueprice: int = 0 # 발행가
+    convrate: float = 0.0 # 전환비율
+    lastdate: str = '' # 최종거래일
+    capt: float = 0.0 # 자본지지
+    egearing: float = 0.0 # e.기어링
+    premium: float = 0.0 # 프리미엄
+    spread: float = 0.0 # 스프레드
+    espread: float = 0.0 # 최대스프레드
+    theoryprice: float = 0.0 # 이론가
+    impv: float = 0.0 # 내재변동성
+    moneyness: str = '' # 상태
+    delt: float = 0.0 # 델타
+    gama: float = 0.0 # 감마
+    vega: float = 0.0 # 베가
+    ceta: float = 0.0 # 쎄타
+    rhox: float = 0.0 # 로
+    bjandatecnt: int = 0 # 잔존일수
+    mmsdate: str = '' # 행사개시일
+    mmedate: str = '' # 행사종료일
+    payday: str = '' # 지급일
+    listdate: str = '' # 발행일
+    lpmem: str = '' # LP회원사
+    lp_holdvol: float = 0.0 # LP보유수량
+    bcode: str = '' # 기초자산코드
+    bgubun: str = '' # 기초자산구분
+    bprice: int = 0 # 기초자산현재가
+    bsign: str = '' # 기초자산전일비구분
+    bchange: int = 0 # 기초자산전일비
+    bdiff: float = 0.0 # 기초자산등락율
+    bvolume: float = 0.0 # 기초자산거래량
+    info1: str = '' # 락구분
+    info2: str = '' # 관리/급등구분
+    info3: str = '' # 정지/연장구분
+    info4: str = '' # 투자/불성실구분
+    janginfo: str = '' # 장구분
+    basketgb: str = '' # 바스켓구분
+    basketcnt: int = 0 # 바스켓갯수
+    elwtype: str = '' # ELW권리행사방식
+    settletype: str = '' # ELW결제방법
+    lpord: str = '' # LP사주문가능여부
+    elwdetail: str = '' # 권리내용
+    valuation: str = '' # 만기평가가격방식
+    givemoney: float = 0.0 # 확정지급액
+
+
+class t1956OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    bskcode: str = '' # 기초자산코드
+    bskbno: int = 0 # 기초자산비율
+    bskprice: int = 0 # 기초자산현재가
+    bsksign: str = '' # 기초자산전일비구분
+    bskchange: int = 0 # 기초자산전일비
+    bskdiff: float = 0.0 # 기초자산등락율
+    bskvolume: float = 0.0 # 기초자산거래량
+    bskjnilclose: int = 0 # 기초자산전일종가
+
+
+
+# ELW현재가(확정지급액)조회(t1956) 
+class t1956(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1956OutBlock] = msgspec.field(default=None, name='t1956OutBlock')
+    outblock1: Optional[List[t1956OutBlock1]] = msgspec.field(default=None, name='t1956OutBlock1')
+# endregion
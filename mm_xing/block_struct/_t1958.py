@@ -0,0 +1,97 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1958 - ELW종목비교(t1958)>
+class t1958InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode1: str = '' # 종목코드1
+    shcode2: str = '' # 종목코드2
+
+
+class t1958OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    item1: str = '' # 기초자산
+    issuernmk: str = '' # 발행사
+    elwopt: str = '' # 콜풋구분
+    elwtype: str = '' # 행사방식
+    settletype: str = '' # 결제방법
+    elwexec: float = 0.0 # 행사가
+    convrate: float = 0.0 # 전환비율
+    listing: float = 0.0 # 발행수량
+    mmsdate: str = '' # 행사개시일
+    lastdate: str = '' # 최종거래일
+    nofdays: int = 0 # 거래잔존일수
+    payday: str = '' # 지급일
+    parity: float = 0.0 # 패리티
+    premium: float = 0.0 # 프리미엄
+    berate: float = 0.0 # 손익분기
+    capt: float = 0.0 # 자본지지
+    gearing: float = 0.0 # 기어링
+    egearing: float = 0.0 # e.기어링
+    price: int = 0 # 가격
+    volume: float = 0.0 # 거래량
+    diff: float = 0.0 # 등락율
+
+
+class t1958OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    item1: str = '' # 기초자산
+    issuernmk: str = '' # 발행사
+    elwopt: str = '' # 콜풋구분
+    elwtype: str = '' # 행사방식
+    settletype: str = '' # 결제방법
+    elwexec: float = 0.0 # 행사가
+    convrate: float = 0.0 # 전환비율
+    listing: float = 0.0 # 발행수량
+    mmsdate: str = '' # 행사개시일
+    lastdate: str = '' # 최종거래일
+    nofdays: int = 0 # 거래잔존일수
+    payday: str = '' # 지급일
+    parity: float = 0.0 # 패리티
+    premium: float = 0.0 # 프리미엄
+    berate: float = 0.0 # 손익분기
+    capt: float = 0.0 # 자본지지
+    gearing: float = 0.0 # 기어링
+    egearing: float = 0.0 # e.기어링
+    price: int = 0 # 가격
+    volume: float = 0.0 # 거래량
+    diff: float = 0.0 # 등락율
+
+
+class t1958OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    hnamecmp: str = '' # 종목명비교
+    item1cmp: str = '' # 기초자산비교
+    issuernmkcmp: str = '' # 발행사비교
+    elwoptcmp: str = '' # 콜풋구분비교
+    elwtypecmp: str = '' # 행사방식비교
+    settlecmp: str = '' # 결제방법비교
+    elwexeccmp: float = 0.0 # 행사가비교
+    convcmp: float = 0.0 # 전환비율비교
+    listingcmp: float = 0.0 # 발행수량비교
+    mmsdatecmp: str = '' # 행사개시일비교
+    lastdatecmp: str = '' # 최종거래일비교
+    nofdayscmp: str = '' # 거래잔존일수비교
+    paydaycmp: str = '' # 지급일비교
+    paritycmp: float = 0.0 # 패리티비교
+    premiumcmp: float = 0.0 # 프리미엄비교
+    beratecmp: float = 0.0 # 손익분기비교
+    captcmp: float = 0.0 # 자본지지비교
+    gearingcmp: float = 0.0 # 기어링비교
+    egearingcmp: float = 0.0 # e.기어링비교
+    pricecmp: int = 0 # 가격비교
+    volumecmp: float = 0.0 # 거래량비교
+    diffcmp: float = 0.0 # 등락율비교
+
+
+
+# ELW종목비교(t1958) 
+class t1958(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1958OutBlock] = msgspec.field(default=None, name='t1958OutBlock')
+    outblock1: Optional[t1958OutBlock1] = msgspec.field(default=None, name='t1958OutBlock1')
+    outblock2: Optional[t1958OutBlock2] = msgspec.field(default=None, name='t1958OutBlock2')
+# endregion
@@ -0,0 +1,40 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1959 - LP대상종목정보조회(t1959)>
+class t1959InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+
+
+class t1959OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    price: str = '' # 현재가
+    sign: str = '' # 부호
+    change: str = '' # 대비
+    rate: float = 0.0 # 등락율
+    volume: str = '' # 누적거래량
+    value: str = '' # 누적거래대금
+    lp_gb: str = '' # LP주문가능여부
+    lp_mem_nm1: str = '' # LP회원사명1
+    lp_mem_nm2: str = '' # LP회원사명2
+    lp_mem_nm3: str = '' # LP회원사명3
+    lp_mem_nm4: str = '' # LP회원사명4
+    lp_mem_nm5: str = '' # LP회원사명5
+    lp_min_qty: str = '' # LP최소호가수량
+    lp_st_date: str = '' # LP시작일
+    lp_end_date: str = '' # LP종료일
+    lp_spread: float = 0.0 # LP스프레드
+
+
+
+# LP대상종목정보조회(t1959) 
+class t1959(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t1959OutBlock1]] = msgspec.field(default=None, name='t1959OutBlock1')
+# endregion
@@ -0,0 +1,55 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1961 - ELW거래량상위(t1961)>
+class t1961InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 당일전일(0:당일1:전일)
+    ggubun: str = '' # 권리유형구분(00:EX01:콜02:풋:전체)
+    itemcode: str = '' # 기초자산종목
+    lastdate: str = '' # 조회만기일
+    exgubun: str = '' # 대상제외
+    sprice: int = 0 # 시작가격
+    eprice: int = 0 # 종료가격
+    volume: int = 0 # 거래량
+    sjanday: int = 0 # 잔존시작일수
+    ejanday: int = 0 # 잔존종료일수
+    idx: int = 0 # IDX
+
+
+class t1961OutBlock(msgspec.Struct, frozen=True, gc=False):
+    idx: int = 0 # IDX
+
+
+class t1961OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: float = 0.0 # 누적거래량
+    jnilvolume: float = 0.0 # 전일거래량
+    elwexec: float = 0.0 # 행사가
+    convrate: float = 0.0 # 전환비율
+    lastdate: str = '' # 만기일
+    itemcode: str = '' # 기초자산종목코드
+    itemshcode: str = '' # 기초자산단축코드
+    itemname: str = '' # 기초자산종목명
+    itemprice: str = '' # 기초자산현재가
+    itemsign: str = '' # 기초자산대비구분
+    itemchange: str = '' # 기초자산전일대비
+    itemdiff: float = 0.0 # 기초자산등락율
+    elwshcode: str = '' # ELW종목코드
+
+
+
+# ELW거래량상위(t1961) 
+class t1961(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1961OutBlock] = msgspec.field(default=None, name='t1961OutBlock')
+    outblock1: Optional[List[t1961OutBlock1]] = msgspec.field(default=None, name='t1961OutBlock1')
+# endregion
@@ -0,0 +1,69 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1964 - ELW전광판(t1964)>
+class t1964InBlock(msgspec.Struct, frozen=True, gc=False):
+    item: str = '' # 기초자산코드
+    issuercd: str = '' # 발행사
+    lastmonth: str = '' # 만기월물
+    elwopt: str = '' # 콜풋구분
+    atmgubun: str = '' # 머니구분
+    elwtype: str = '' # 권리행사방식
+    settletype: str = '' # 결제방법
+    elwexecgubun: str = '' # 행사기초자산구분
+    fromrat: str = '' # 시작비율
+    torat: str = '' # 종료비율
+    volume: str = '' # 거래량
+
+
+class t1964OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # ELW코드
+    hname: str = '' # 종목명
+    item1: str = '' # 기초자산코드
+    itemnm: str = '' # 기초자산명
+    issuernmk: str = '' # 발행사
+    elwopt: str = '' # 콜풋구분
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    elwexec: float = 0.0 # 행사가
+    jandatecnt: int = 0 # 잔존일수
+    convrate: float = 0.0 # 전환비율
+    lastdate: str = '' # 최종거래일
+    mmsdate: str = '' # 행사개시일
+    payday: str = '' # 지급일
+    listing: int = 0 # 발행수량
+    atmgbnm: str = '' # 머니구분
+    parity: float = 0.0 # 패리티
+    preminum: float = 0.0 # 프리미엄
+    spread: float = 0.0 # 스프래드
+    berate: float = 0.0 # 손익분기율
+    capt: float = 0.0 # 자본지지율
+    gearing: float = 0.0 # 기어링
+    egearing: float = 0.0 # e기어링
+    itemprice: int = 0 # 기초자산현재가
+    itemsign: str = '' # 기초자산전일대비구분
+    itemchange: int = 0 # 기초자산전일대비
+    itemdiff: float = 0.0 # 기초자산등락율
+    itemvolume: int = 0 # 기초자산거래량
+    jnilvolume: int = 0 # 전일거래량
+    theoryprice: float = 0.0 # 이론가
+    lp_rate: float = 0.0 # LP보유비율
+    impv: float = 0.0 # 내재변동성
+    delta: float = 0.0 # 델타
+    theta: float = 0.0 # 쎄타
+
+
+
+# ELW전광판(t1964) 
+class t1964(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t1964OutBlock1]] = msgspec.field(default=None, name='t1964OutBlock1')
+# endregion
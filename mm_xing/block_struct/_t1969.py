@@ -0,0 +1,114 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1969 - ELW지표검색(t1969)>
+class t1969InBlock(msgspec.Struct, frozen=True, gc=False):
+    chkitem: str = '' # 기초자산chk구분
+    cbitem: str = '' # 기초자산코드
+    chkissuer: str = '' # 발행사chk구분
+    cbissuer: str = '' # 발행사
+    chkcallput: str = '' # 권리chk구분
+    cbcallput: str = '' # 권리(call:01.put:02)
+    chkexec: str = '' # 행사가chk구분
+    cbexec: str = '' # 행사가(>=:1.<=:2)
+    chktype: str = '' # 행사방식chk구분
+    cbtype: str = '' # 행사방식
+    chksettle: str = '' # 결제방법chk구분
+    cbsettle: str = '' # 결제방법
+    chklast: str = '' # 만기chk구분
+    cblast: str = '' # 만기월별
+    chkelwexec: str = '' # 행사가격chk구분
+    elwexecs: float = 0.0 # 행사가이상
+    elwexece: float = 0.0 # 행사가이하
+    chkvolume: str = '' # 거래량chk구분
+    volumes: float = 0.0 # 거래량이상
+    volumee: float = 0.0 # 거래량이하
+    chkrate: str = '' # 등락율chk구분
+    rates: float = 0.0 # 등락율이상
+    ratee: float = 0.0 # 등락율이하
+    chkpremium: str = '' # 프리미엄chk구분
+    premiums: float = 0.0 # 프리미엄이상
+    premiume: float = 0.0 # 프리미엄이하
+    chkparity: str = '' # 패리티chk구분
+    paritys: float = 0.0 # 패리티이상
+    paritye: float = 0.0 # 패리티이하
+    chkberate: str = '' # 손익분기chk구분
+    berates: float = 0.0 # 손익분기이상
+    beratee: float = 0.0 # 손익분기이하
+    chkcapt: str = '' # 자본지지chk구분
+    capts: float = 0.0 # 자본지지이상
+    capte: float = 0.0 # 자본지지이하
+    chkegearing: str = '' # e.기어링chk구분
+    egearings: float = 0.0 # e.기어링이상
+    egearinge: float = 0.0 # e.기어링이하
+    chkgearing: str = '' # 기어링chk구분
+    gearings: float = 0.0 # 기어링이상
+    gearinge: float = 0.0 # 기어링이하
+    chkdelta: str = '' # 델타chk구분
+    deltas: float = 0.0 # 델타이상
+    deltae: float = 0.0 # 델타이하
+    chktheta: str = '' # 쎄타chk구분
+    thetas: float = 0.0 # 쎄타이상
+    thetae: float = 0.0 # 쎄타이하
+    chkduedate: str = '' # 최종거래일chk구분
+    duedates: str = '' # 최종거래일이상
+    duedatee: str = '' # 최종거래일이하
+    onetickgubun: str = '' # LP갭1틱
+    lp_liquidity: str = '' # LP유동성공급
+    chklp_code: str = '' # LPchk구분
+    lp_code: str = '' # LP회원사코드
+    chkkoba: str = '' # 조기종료chk구분
+    cbkoba: str = '' # 조기종료(0:전체1:KOBA2:KOBA제외)
+
+
+class t1969OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cnt: int = 0 # 종목갯수
+
+
+class t1969OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 종목코드
+    issuernmk: str = '' # 발행사
+    itemcode: str = '' # 기초자산코드
+    cpgubun: str = '' # 콜/풋구분
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: float = 0.0 # 거래량
+    jnilvolume: float = 0.0 # 전일거래량
+    elwexec: float = 0.0 # 행사가
+    item: str = '' # 기초자산명
+    bprice: float = 0.0 # 기초자산가
+    bsign: str = '' # 기초전일대비구분
+    bchange: float = 0.0 # 기초전일대비
+    bdiff: float = 0.0 # 기초등락율
+    premium: float = 0.0 # 프리미엄
+    parity: float = 0.0 # 패리티
+    berate: float = 0.0 # 손익분기
+    capt: float = 0.0 # 자본지지
+    egearing: float = 0.0 # e.기어링
+    gearing: float = 0.0 # 기어링
+    lastdate: str = '' # 최종거래일
+    delta: float = 0.0 # 델타
+    theta: float = 0.0 # 쎄타
+    lpname: str = '' # LP회원사
+    lphold: float = 0.0 # LP보유율
+    bjandatecnt: int = 0 # 잔존일수
+    convrate: float = 0.0 # 전환비율
+    tickvalue: float = 0.0 # 1틱환산
+    kasis: float = 0.0 # 괴리율
+
+
+
+# ELW지표검색(t1969) 
+class t1969(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1969OutBlock] = msgspec.field(default=None, name='t1969OutBlock')
+    outblock1: Optional[List[t1969OutBlock1]] = msgspec.field(default=None, name='t1969OutBlock1')
+# endregion
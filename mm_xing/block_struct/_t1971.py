@@ -0,0 +1,129 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1971 - ELW현재가호가조회(t1971)>
+class t1971InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class t1971OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: float = 0.0 # 누적거래량
+    jnilclose: int = 0 # 전일종가
+    offerho1: int = 0 # 매도호가1
+    bidho1: int = 0 # 매수호가1
+    offerrem1: int = 0 # 매도호가수량1
+    lp_offerrem1: int = 0 # LP매도호가수량1
+    bidrem1: int = 0 # 매수호가수량1
+    lp_bidrem1: int = 0 # LP매수호가수량1
+    preoffercha1: int = 0 # 직전매도대비수량1
+    prebidcha1: int = 0 # 직전매수대비수량1
+    offerho2: int = 0 # 매도호가2
+    bidho2: int = 0 # 매수호가2
+    offerrem2: int = 0 # 매도호가수량2
+    lp_offerrem2: int = 0 # LP매도호가수량2
+    bidrem2: int = 0 # 매수호가수량2
+    lp_bidrem2: int = 0 # LP매수호가수량2
+    preoffercha2: int = 0 # 직전매도대비수량2
+    prebidcha2: int = 0 # 직전매수대비수량2
+    offerho3: int = 0 # 매도호가3
+    bidho3: int = 0 # 매수호가3
+    offerrem3: int = 0 # 매도호가수량3
+    lp_offerrem3: int = 0 # LP매도호가수량3
+    bidrem3: int = 0 # 매수호가수량3
+    lp_bidrem3: int = 0 # LP매수호가수량3
+    preoffercha3: int = 0 # 직전매도대비수량3
+    prebidcha3: int = 0 # 직전매수대비수량3
+    offerho4: int = 0 # 매도호가4
+    bidho4: int = 0 # 매수호가4
+    offerrem4: int = 0 # 매도호가수량4
+    lp_offerrem4: int = 0 # LP매도호가수량4
+    bidrem4: int = 0 # 매수호가수량4
+    lp_bidrem4: int = 0 # LP매수호가수량4
+    preoffercha4: int = 0 # 직전매도대비수량4
+    prebidcha4: int = 0 # 직전매수대비수량4
+    offerho5: int = 0 # 매도호가5
+    bidho5: int = 0 # 매수호가5
+    offerrem5: int = 0 # 매도호가수량5
+    lp_offerrem5: int = 0 # LP매도호가수량5
+    bidrem5: int = 0 # 매수호가수량5
+    lp_bidrem5: int = 0 # LP매수호가수량5
+    preoffercha5: int = 0 # 직전매도대비수량5
+    prebidcha5: int = 0 # 직전매수대비수량5
+    offerho6: int = 0 # 매도호가6
+    bidho6: int = 0 # 매수호가6
+    offerrem6: int = 0 # 매도호가수량6
+    lp_offerrem6: int = 0 # LP매도호가수량6
+    bidrem6: int = 0 # 매수호가수량6
+    lp_bidrem6: int = 0 # LP매수호가수량6
+    preoffercha6: int = 0 # 직전매도대비수량6
+    prebidcha6: int = 0 # 직전매수대비수량6
+    offerho7: int = 0 # 매도호가7
+    bidho7: int = 0 # 매수호가7
+    offerrem7: int = 0 # 매도호가수량7
+    lp_offerrem7: int = 0 # LP매도호가수량7
+    bidrem7: int = 0 # 매수호가수량7
+    lp_bidrem7: int = 0 # LP매수호가수량7
+    preoffercha7: int = 0 # 직전매도대비수량7
+    prebidcha7: int = 0 # 직전매수대비수량7
+    offerho8: int = 0 # 매도호가8
+    bidho8: int = 0 # 매수호가8
+    offerrem8: int = 0 # 매도호가수량8
+    lp_offerrem8: int = 0 # LP매도호가수량8
+    bidrem8: int = 0 # 매수호가수량8
+    lp_bidrem8: int = 0 # LP매수호가수량8
+    preoffercha8: int = 0 # 직전매도대비수량8
+    prebidcha8: int = 0 # 직전매수대비수량8
+    offerho9: int = 0 # 매도호가9
+    bidho9: int = 0 # 매수호가9
+    offerrem9: int = 0 # 매도호가수량9
+    lp_offerrem9: int = 0 # LP매도호가수량9
+    bidrem9: int = 0 # 매수호가수량9
+    lp_bidrem9: int = 0 # LP매수호가수량9
+    preoffercha9: int = 0 # 직전매도대비수량9
+    prebidcha9: int = 0 # 직전매수대비수량9
+    offerho10: int = 0 # 매도호가10
+    bidho10: int = 0 # 매수호가10
+    offerrem10: int = 0 # 매도호가수량10
+    lp_offerrem10: int = 0 # LP매도호가수량10
+    bidrem10: int = 0 # 매수호가수량10
+    lp_bidrem10: int = 0 # LP매수호가수량10
+    preoffercha10: int = 0 # 직전매도대비수량10
+    prebidcha10: int = 0 # 직전매수대비수량10
+    offer: int = 0 # 매도호가수량합
+    bid: int = 0 # 매수호가수량합
+    preoffercha: int = 0 # 직전매도대비수량합
+    prebidcha: int = 0 # 직전매수대비수량합
+    hotime: str = '' # 수신시간
+    yeprice: int = 0 # 예상체결가격
+    yevolume: float = 0.0 # 예상체결수량
+    yesign: str = '' # 예상체결전일구분
+    yechange: int = 0 # 예상체결전일대비
+    yediff: float = 0.0 # 예상체결등락율
+    tmoffer: int = 0 # 시간외매도잔량
+    tmbid: int = 0 # 시간외매수잔량
+    ho_status: str = '' # 동시구분
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    invidx: str = '' # ELW권리형태(1:표준2:디지털3:조기종료)
+    koba_stdprc: float = 0.0 # KO베리어
+    koba_acc_rt: float = 0.0 # KO접근도
+    koba_yn: str = '' # KO발생여부(Y/N)
+
+
+
+# ELW현재가호가조회(t1971) 
+class t1971(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1971OutBlock] = msgspec.field(default=None, name='t1971OutBlock')
+# endregion
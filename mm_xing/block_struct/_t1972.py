@@ -0,0 +1,71 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t1972 - ELW현재가(거래원)조회(t1972)>
+class t1972InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class t1972OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    expcode: str = '' # 표준코드
+    shcode: str = '' # 단축코드
+    offerno1: str = '' # 매도증권사코드1
+    bidno1: str = '' # 매수증권사코드1
+    dvol1: int = 0 # 총매도수량1
+    svol1: int = 0 # 총매수수량1
+    dcha1: int = 0 # 매도증감1
+    scha1: int = 0 # 매수증감1
+    ddiff1: float = 0.0 # 매도비율1
+    sdiff1: float = 0.0 # 매수비율1
+    offerno2: str = '' # 매도증권사코드2
+    bidno2: str = '' # 매수증권사코드2
+    dvol2: int = 0 # 총매도수량2
+    svol2: int = 0 # 총매수수량2
+    dcha2: int = 0 # 매도증감2
+    scha2: int = 0 # 매수증감2
+    ddiff2: float = 0.0 # 매도비율2
+    sdiff2: float = 0.0 # 매수비율2
+    offerno3: str = '' # 매도증권사코드3
+    bidno3: str = '' # 매수증권사코드3
+    dvol3: int = 0 # 총매도수량3
+    svol3: int = 0 # 총매수수량3
+    dcha3: int = 0 # 매도증감3
+    scha3: int = 0 # 매수증감3
+    ddiff3: float = 0.0 # 매도비율3
+    sdiff3: float = 0.0 # 매수비율3
+    offerno4: str = '' # 매도증권사코드4
+    bidno4: str = '' # 매수증권사코드4
+    dvol4: int = 0 # 총매도수량4
+    svol4: int = 0 # 총매수수량4
+    dcha4: int = 0 # 매도증감4
+    scha4: int = 0 # 매수증감4
+    ddiff4: float = 0.0 # 매도비율4
+    sdiff4: float = 0.0 # 매수비율4
+    offerno5: str = '' # 매도증권사코드5
+    bidno5: str = '' # 매수증권사코드5
+    dvol5: int = 0 # 총매도수량5
+    svol5: int = 0 # 총매수수량5
+    dcha5: int = 0 # 매도증감5
+    scha5: int = 0 # 매수증감5
+    ddiff5: float = 0.0 # 매도비율5
+    sdiff5: float = 0.0 # 매수비율5
+    fwdvl: int = 0 # 외국계매도합계수량
+    fwsvl: int = 0 # 외국계매수합계수량
+    ftradmdcha: int = 0 # 외국계매도직전대비
+    ftradmscha: int = 0 # 외국계매수직전대비
+    fwddiff: float = 0.0 # 외국계매도합계비율
+    fwsdiff: float = 0.0 # 외국계매수합계비율
+
+
+
+# ELW현재가(거래원)조회(t1972) 
+class t1972(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1972OutBlock] = msgspec.field(default=None, name='t1972OutBlock')
+# endregion
@@ -0,0 +1,37 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1973 - ELW시간대별예상체결조회(t1973)>
+class t1973InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    cts_time: str = '' # 시간CTS
+
+
+class t1973OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_time: str = '' # 시간CTS
+
+
+class t1973OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    yeprice: int = 0 # 예상체결가격
+    yegubun: str = '' # 예상체결구분
+    jnilysign: str = '' # 전일종가대비구분
+    jnilychange: int = 0 # 전일종가대비
+    yediff: float = 0.0 # 예상체결등락율
+    yevolume: int = 0 # 예상체결량
+    ymdvolume: int = 0 # 예상매도체결량
+    ymsvolume: int = 0 # 예상매수체결량
+
+
+
+# ELW시간대별예상체결조회(t1973) 
+class t1973(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1973OutBlock] = msgspec.field(default=None, name='t1973OutBlock')
+    outblock1: Optional[List[t1973OutBlock1]] = msgspec.field(default=None, name='t1973OutBlock1')
+# endregion
@@ -0,0 +1,35 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1974 - ELW기초자산동일종목(t1974)>
+class t1974InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+
+
+class t1974OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cnt: int = 0 # 종목갯수
+
+
+class t1974OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    cpgubun: str = '' # 콜/풋구분
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: float = 0.0 # 거래량
+
+
+
+# ELW기초자산동일종목(t1974) 
+class t1974(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1974OutBlock] = msgspec.field(default=None, name='t1974OutBlock')
+    outblock1: Optional[List[t1974OutBlock1]] = msgspec.field(default=None, name='t1974OutBlock1')
+# endregion
@@ -0,0 +1,53 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t1988 - 기초자산리스트조회(t1988)>
+class t1988InBlock(msgspec.Struct, frozen=True, gc=False):
+    mkt_gb: str = '' # 시장구분(0:전체1:코스피2:코스닥)
+    chk_price: str = '' # 가격설정(0:전체1:조건설정)
+    from_price: str = '' # 가격1
+    to_price: str = '' # 가격2
+    chk_vol: str = '' # 거래량설정(0:전체1:조건설정)
+    from_vol: str = '' # 거래량1
+    to_vol: str = '' # 거래량2
+    chk_rate: str = '' # 등락율설정(0:전체1:조건설정)
+    from_rate: float = 0.0 # 등락율1
+    to_rate: float = 0.0 # 등락율2
+    chk_amt: str = '' # 거래대금설정(0:전체1:조건설정)
+    from_amt: str = '' # 거래대금1
+    to_amt: str = '' # 거래대금2
+    chk_up: str = '' # 양봉설정(0:전체1:조건설정)
+    chk_down: str = '' # 음봉설정(0:전체1:조건설정)
+
+
+class t1988OutBlock(msgspec.Struct, frozen=True, gc=False):
+    ksp_cnt: str = '' # 코스피종목건수
+    ksd_cnt: str = '' # 코스닥종목건수
+
+
+class t1988OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 표준코드
+    hname: str = '' # 종목명
+    price: str = '' # 현재가
+    sign: str = '' # 부호
+    change: str = '' # 대비
+    rate: float = 0.0 # 등락율
+    volume: str = '' # 누적거래량(주)
+    value: str = '' # 누적거래대금(백만)
+    mkt_gb: str = '' # 시장구분
+    jvolume: str = '' # 전일동시간대거래량(주)
+
+
+
+# 기초자산리스트조회(t1988) 
+class t1988(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t1988OutBlock] = msgspec.field(default=None, name='t1988OutBlock')
+    outblock1: Optional[List[t1988OutBlock1]] = msgspec.field(default=None, name='t1988OutBlock1')
+# endregion
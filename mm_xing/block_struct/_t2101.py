@@ -0,0 +1,91 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t2101 - 선물/옵션현재가(시세)조회(t2101)>
+class t2101InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 단축코드
+
+
+class t2101OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    jnilclose: float = 0.0 # 전일종가
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    value: int = 0 # 거래대금
+    mgjv: int = 0 # 미결제량
+    mgjvdiff: int = 0 # 미결제증감
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    uplmtprice: float = 0.0 # 상한가
+    dnlmtprice: float = 0.0 # 하한가
+    high52w: float = 0.0 # 52최고가
+    low52w: float = 0.0 # 52최저가
+    basis: float = 0.0 # 베이시스
+    recprice: float = 0.0 # 기준가
+    theoryprice: float = 0.0 # 이론가
+    glyl: float = 0.0 # 괴리율
+    cbhprice: float = 0.0 # CB상한가
+    cblprice: float = 0.0 # CB하한가
+    lastmonth: str = '' # 만기일
+    jandatecnt: int = 0 # 잔여일
+    pricejisu: float = 0.0 # 종합지수
+    jisusign: str = '' # 종합지수전일대비구분
+    jisuchange: float = 0.0 # 종합지수전일대비
+    jisudiff: float = 0.0 # 종합지수등락율
+    kospijisu: float = 0.0 # KOSPI200지수
+    kospisign: str = '' # KOSPI200전일대비구분
+    kospichange: float = 0.0 # KOSPI200전일대비
+    kospidiff: float = 0.0 # KOSPI200등락율
+    listhprice: float = 0.0 # 상장최고가
+    listlprice: float = 0.0 # 상장최저가
+    delt: float = 0.0 # 델타
+    gama: float = 0.0 # 감마
+    ceta: float = 0.0 # 세타
+    vega: float = 0.0 # 베가
+    rhox: float = 0.0 # 로우
+    gmprice: float = 0.0 # 근월물현재가
+    gmsign: str = '' # 근월물전일대비구분
+    gmchange: float = 0.0 # 근월물전일대비
+    gmdiff: float = 0.0 # 근월물등락율
+    theorypriceg: float = 0.0 # 이론가
+    histimpv: float = 0.0 # 역사적변동성
+    impv: float = 0.0 # 내재변동성
+    sbasis: float = 0.0 # 시장BASIS
+    ibasis: float = 0.0 # 이론BASIS
+    gmfutcode: str = '' # 근월물종목코드
+    actprice: float = 0.0 # 행사가
+    greeks_time: str = '' # 거래소민감도수신시간
+    greeks_confirm: str = '' # 거래소민감도확정여부
+    danhochk: str = '' # 단일가호가여부
+    yeprice: float = 0.0 # 예상체결가
+    jnilysign: str = '' # 예상체결가전일종가대비구분
+    jnilychange: float = 0.0 # 예상체결가전일종가대비
+    jnilydrate: float = 0.0 # 예상체결가전일종가등락율
+    alloc_gubun: str = '' # 배분구분(1:배분개시2:배분해제0:미발생)
+    bjandatecnt: int = 0 # 잔여일(영업일)
+    focode: str = '' # 종목코드
+    dy_gubun: str = '' # 실시간가격제한여부(0:대상아님1:적용중2:미적용중3:일시해제)
+    dy_uplmtprice: float = 0.0 # 실시간상한가
+    dy_dnlmtprice: float = 0.0 # 실시간하한가
+    updnstep_gubun: str = '' # 가격제한폭확대(0:미확대1:확대2:대상아님)
+    upstep: str = '' # 상한적용단계
+    dnstep: str = '' # 하한적용단계
+    uplmtprice_3rd: float = 0.0 # 3단계상한가
+    dnlmtprice_3rd: float = 0.0 # 3단계하한가
+
+
+
+# 선물/옵션현재가(시세)조회(t2101) 
+class t2101(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2101OutBlock] = msgspec.field(default=None, name='t2101OutBlock')
+# endregion
@@ -0,0 +1,66 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t2105 - 선물/옵션현재가호가조회(t2105)>
+class t2105InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class t2105OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    stimeqrt: float = 0.0 # 거래량전일동시간비율
+    jnilclose: float = 0.0 # 전일종가
+    offerho1: float = 0.0 # 매도호가1
+    bidho1: float = 0.0 # 매수호가1
+    offerrem1: int = 0 # 매도호가수량1
+    bidrem1: int = 0 # 매수호가수량1
+    dcnt1: int = 0 # 매도호가건수1
+    scnt1: int = 0 # 매수호가건수1
+    offerho2: float = 0.0 # 매도호가2
+    bidho2: float = 0.0 # 매수호가2
+    offerrem2: int = 0 # 매도호가수량2
+    bidrem2: int = 0 # 매수호가수량2
+    dcnt2: int = 0 # 매도호가건수2
+    scnt2: int = 0 # 매수호가건수2
+    offerho3: float = 0.0 # 매도호가3
+    bidho3: float = 0.0 # 매수호가3
+    offerrem3: int = 0 # 매도호가수량3
+    bidrem3: int = 0 # 매수호가수량3
+    dcnt3: int = 0 # 매도호가건수3
+    scnt3: int = 0 # 매수호가건수3
+    offerho4: float = 0.0 # 매도호가4
+    bidho4: float = 0.0 # 매수호가4
+    offerrem4: int = 0 # 매도호가수량4
+    bidrem4: int = 0 # 매수호가수량4
+    dcnt4: int = 0 # 매도호가건수4
+    scnt4: int = 0 # 매수호가건수4
+    offerho5: float = 0.0 # 매도호가5
+    bidho5: float = 0.0 # 매수호가5
+    offerrem5: int = 0 # 매도호가수량5
+    bidrem5: int = 0 # 매수호가수량5
+    dcnt5: int = 0 # 매도호가건수5
+    scnt5: int = 0 # 매수호가건수5
+    dvol: int = 0 # 매도호가총수량
+    svol: int = 0 # 매수호가총수량
+    toffernum: int = 0 # 총매도호가건수
+    tbidnum: int = 0 # 총매수호가건수
+    time: str = '' # 수신시간
+    shcode: str = '' # 단축코드
+
+
+
+# 선물/옵션현재가호가조회(t2105) 
+class t2105(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2105OutBlock] = msgspec.field(default=None, name='t2105OutBlock')
+# endregion
@@ -0,0 +1,38 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t2106 - 선물/옵션현재가시세메모(t2106)>
+class t2106InBlock(msgspec.Struct, frozen=True, gc=False):
+    code: str = '' # 종목코드
+    nrec: str = '' # 건수
+
+
+class t2106InBlock1(msgspec.Struct, frozen=True, gc=False):
+    indx: str = '' # 인덱스
+    gubn: str = '' # 조건구분
+    dat1: str = '' # 데이타1
+    dat2: str = '' # 데이타2
+
+
+class t2106OutBlock(msgspec.Struct, frozen=True, gc=False):
+    nrec: str = '' # 출력건수
+
+
+class t2106OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    indx: str = '' # 인덱스
+    gubn: str = '' # 조건구분
+    vals: str = '' # 출력값
+
+
+
+# 선물/옵션현재가시세메모(t2106) 
+class t2106(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2106OutBlock] = msgspec.field(default=None, name='t2106OutBlock')
+    outblock1: Optional[List[t2106OutBlock1]] = msgspec.field(default=None, name='t2106OutBlock1')
+# endregion
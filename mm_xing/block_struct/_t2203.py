@@ -0,0 +1,48 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t2203 - 기간별주가(t2203)>
+class t2203InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    futcheck: str = '' # 선물최근월물
+    date: str = '' # 날짜
+    cts_code: str = '' # CTS종목코드
+    lastdate: str = '' # 전종목만기일
+    cnt: str = '' # 조회요청건수
+
+
+class t2203OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    cts_code: str = '' # CTS종목코드
+    lastdate: str = '' # 전종목만기일
+    nowfutyn: str = '' # 최근월선물여부
+
+
+class t2203OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    diff_vol: float = 0.0 # 거래증가율
+    openyak: int = 0 # 미결수량
+    openyakupdn: int = 0 # 미결증감
+    value: float = 0.0 # 거래대금
+
+
+
+# 기간별주가(t2203) 
+class t2203(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2203OutBlock] = msgspec.field(default=None, name='t2203OutBlock')
+    outblock1: Optional[List[t2203OutBlock1]] = msgspec.field(default=None, name='t2203OutBlock1')
+# endregion
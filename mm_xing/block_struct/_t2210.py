@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t2210 - 선물옵션시간대별체결조회(단일출력용)>
+class t2210InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 단축코드
+    cvolume: int = 0 # 특이거래량
+    stime: str = '' # 시작시간
+    etime: str = '' # 종료시간
+
+
+class t2210OutBlock(msgspec.Struct, frozen=True, gc=False):
+    mdvolume: int = 0 # 매도체결수량
+    mdchecnt: int = 0 # 매도체결건수
+    msvolume: int = 0 # 매수체결수량
+    mschecnt: int = 0 # 매수체결건수
+
+
+
+# 선물옵션시간대별체결조회(단일출력용) 
+class t2210(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2210OutBlock] = msgspec.field(default=None, name='t2210OutBlock')
+# endregion
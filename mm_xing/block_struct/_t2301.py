@@ -0,0 +1,105 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t2301 - 옵션전광판(t2301)>
+class t2301InBlock(msgspec.Struct, frozen=True, gc=False):
+    yyyymm: str = '' # 월물
+    gubun: str = '' # 미니구분(M:미니G:정규)
+
+
+class t2301OutBlock(msgspec.Struct, frozen=True, gc=False):
+    histimpv: int = 0 # 역사적변동성
+    jandatecnt: int = 0 # 옵션잔존일
+    cimpv: float = 0.0 # 콜옵션대표IV
+    pimpv: float = 0.0 # 풋옵션대표IV
+    gmprice: float = 0.0 # 근월물현재가
+    gmsign: str = '' # 근월물전일대비구분
+    gmchange: float = 0.0 # 근월물전일대비
+    gmdiff: float = 0.0 # 근월물등락율
+    gmvolume: int = 0 # 근월물거래량
+    gmshcode: str = '' # 근월물선물코드
+
+
+class t2301OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    actprice: float = 0.0 # 행사가
+    optcode: str = '' # 콜옵션코드
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    iv: float = 0.0 # IV
+    mgjv: int = 0 # 미결제약정
+    mgjvupdn: int = 0 # 미결제약정증감
+    offerho1: float = 0.0 # 매도호가
+    bidho1: float = 0.0 # 매수호가
+    cvolume: int = 0 # 체결량
+    delt: float = 0.0 # 델타
+    gama: float = 0.0 # 감마
+    vega: float = 0.0 # 베가
+    ceta: float = 0.0 # 쎄타
+    rhox: float = 0.0 # 로우
+    theoryprice: float = 0.0 # 이론가
+    impv: float = 0.0 # 내재가치
+    timevl: float = 0.0 # 시간가치
+    jvolume: int = 0 # 잔고수량
+    parpl: int = 0 # 평가손익
+    jngo: int = 0 # 청산가능수량
+    offerrem1: int = 0 # 매도잔량
+    bidrem1: int = 0 # 매수잔량
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    atmgubun: str = '' # ATM구분
+    jisuconv: float = 0.0 # 지수환산
+    value: float = 0.0 # 거래대금
+
+
+class t2301OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    actprice: float = 0.0 # 행사가
+    optcode: str = '' # 풋옵션코드
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    iv: float = 0.0 # IV
+    mgjv: int = 0 # 미결제약정
+    mgjvupdn: int = 0 # 미결제약정증감
+    offerho1: float = 0.0 # 매도호가
+    bidho1: float = 0.0 # 매수호가
+    cvolume: int = 0 # 체결량
+    delt: float = 0.0 # 델타
+    gama: float = 0.0 # 감마
+    vega: float = 0.0 # 베가
+    ceta: float = 0.0 # 쎄타
+    rhox: float = 0.0 # 로우
+    theoryprice: float = 0.0 # 이론가
+    impv: float = 0.0 # 내재가치
+    timevl: float = 0.0 # 시간가치
+    jvolume: int = 0 # 잔고수량
+    parpl: int = 0 # 평가손익
+    jngo: int = 0 # 청산가능수량
+    offerrem1: int = 0 # 매도잔량
+    bidrem1: int = 0 # 매수잔량
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    atmgubun: str = '' # ATM구분
+    jisuconv: float = 0.0 # 지수환산
+    value: float = 0.0 # 거래대금
+
+
+
+# 옵션전광판(t2301) 
+class t2301(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2301OutBlock] = msgspec.field(default=None, name='t2301OutBlock')
+    outblock1: Optional[List[t2301OutBlock1]] = msgspec.field(default=None, name='t2301OutBlock1')
+    outblock2: Optional[List[t2301OutBlock2]] = msgspec.field(default=None, name='t2301OutBlock2')
+# endregion
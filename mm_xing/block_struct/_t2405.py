@@ -0,0 +1,57 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t2405 - 선물옵션호가잔량비율챠트(t2405)>
+class t2405InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 단축코드
+    bgubun: str = '' # 분구분
+    nmin: str = '' # N분
+    etime: str = '' # 종료시간
+    hgubun: str = '' # 호가구분
+    cnt: str = '' # 조회건수
+    cts_time: str = '' # 시간CTS
+
+
+class t2405OutBlock(msgspec.Struct, frozen=True, gc=False):
+    mdvolume: float = 0.0 # 매도체결수량
+    mdchecnt: int = 0 # 매도체결건수
+    msvolume: float = 0.0 # 매수체결수량
+    mschecnt: int = 0 # 매수체결건수
+    cts_time: str = '' # 시간CTS
+
+
+class t2405OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    time: str = '' # 시간
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    volume: float = 0.0 # 누적거래량
+    cvolume: int = 0 # 체결수량
+    offerho1: float = 0.0 # 매도1호가
+    bidho1: float = 0.0 # 매수1호가
+    offerrem: int = 0 # 매도수량
+    bidrem: int = 0 # 매수수량
+    offercnt: int = 0 # 매도건수
+    bidcnt: int = 0 # 매수건수
+    c_offerrem: int = 0 # 매도증감수량
+    c_bidrem: int = 0 # 매수증감수량
+    c_offercnt: int = 0 # 매도증감건수
+    c_bidcnt: int = 0 # 매수증감건수
+    r_bidrem: float = 0.0 # 매수수량비율
+    r_bidcnt: float = 0.0 # 매수건수비율
+    r_sign: str = '' # 매수비율구분
+    date: str = '' # 일자
+
+
+
+# 선물옵션호가잔량비율챠트(t2405) 
+class t2405(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2405OutBlock] = msgspec.field(default=None, name='t2405OutBlock')
+    outblock1: Optional[List[t2405OutBlock1]] = msgspec.field(default=None, name='t2405OutBlock1')
+# endregion
@@ -0,0 +1,47 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t2421 - 미결제약정추이(t2421)>
+class t2421InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 종목코드
+    bdgubun: str = '' # 분일구분
+    nmin: str = '' # N분
+    tcgubun: str = '' # 당일연결구분
+    cnt: str = '' # 조회건수
+
+
+class t2421OutBlock(msgspec.Struct, frozen=True, gc=False):
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    cvolume: int = 0 # 체결수량
+    volume: float = 0.0 # 누적거래량
+    openyak: int = 0 # 미결제수량
+
+
+class t2421OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    dt: str = '' # 일자시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    openopenyak: int = 0 # 미결제시량
+    highopenyak: int = 0 # 미결제고량
+    lowopenyak: int = 0 # 미결제저량
+    closeopenyak: int = 0 # 미결제종량
+    openupdn: int = 0 # 미결증감
+
+
+
+# 미결제약정추이(t2421) 
+class t2421(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2421OutBlock] = msgspec.field(default=None, name='t2421OutBlock')
+    outblock1: Optional[List[t2421OutBlock1]] = msgspec.field(default=None, name='t2421OutBlock1')
+# endregion
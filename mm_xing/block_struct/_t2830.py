@@ -0,0 +1,59 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t2830 - EUREXKOSPI200옵션선물현재가(시세)조회(t2830)>
+class t2830InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 단축코드
+
+
+class t2830OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    jnilclose: float = 0.0 # 전일종가
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    value: int = 0 # 거래대금
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    recprice: float = 0.0 # 기준가
+    theoryprice: float = 0.0 # 이론가
+    actprice: float = 0.0 # 행사가
+    impv: float = 0.0 # 내재가치
+    timevl: float = 0.0 # 시간가치
+    kospijisu: float = 0.0 # KOSPI200지수
+    kospisign: str = '' # KOSPI200전일대비구분
+    kospichange: float = 0.0 # KOSPI200전일대비
+    kospidiff: float = 0.0 # KOSPI200등락율
+    cmeprice: float = 0.0 # CME야간선물현재가
+    cmesign: str = '' # CME야간선물전일대비구분
+    cmechange: float = 0.0 # CME야간선물전일대비
+    cmediff: float = 0.0 # CME야간선물등락율
+    cmefocode: str = '' # CME야간선물종목코드
+    uplmtprice: float = 0.0 # 정규장적용상한가
+    dnlmtprice: float = 0.0 # 정규장적용하한가
+    focode: str = '' # 단축코드
+    yeprice: float = 0.0 # 예상체결가
+    ysign: str = '' # 전일대비구분
+    ychange: float = 0.0 # 전일대비
+    ydiff: float = 0.0 # 등락율
+    danhochk: str = '' # 단일가호가여부
+    jnilvolume: int = 0 # 전일거래량
+    jnilvalue: int = 0 # 전일거래대금
+    uplmtprice_3rd: float = 0.0 # 정규장3단계상한가
+    dnlmtprice_3rd: float = 0.0 # 정규장3단계하한가
+
+
+
+# EUREXKOSPI200옵션선물현재가(시세)조회(t2830) 
+class t2830(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2830OutBlock] = msgspec.field(default=None, name='t2830OutBlock')
+# endregion
@@ -0,0 +1,46 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t2832 - EUREX야간옵션선물시간대별체결조회(t2832)>
+class t2832InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 단축코드
+    cvolume: int = 0 # 특이거래량
+    stime: str = '' # 시작시간
+    etime: str = '' # 종료시간
+    cts_time: str = '' # 시간CTS
+
+
+class t2832OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_time: str = '' # 시간CTS
+
+
+class t2832OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    cvolume: int = 0 # 체결수량
+    chdegree: float = 0.0 # 체결강도
+    offerho: float = 0.0 # 매도호가
+    bidho: float = 0.0 # 매수호가
+    volume: float = 0.0 # 거래량
+    n_msvolume: float = 0.0 # 누적매수체결량
+    n_mdvolume: float = 0.0 # 누적매도체결량
+    s_msvolume: float = 0.0 # 누적순매수체결량
+    n_mschecnt: int = 0 # 누적매수체결건수
+    n_mdchecnt: int = 0 # 누적매도체결건수
+    s_mschecnt: int = 0 # 누적순매수체결건수
+
+
+
+# EUREX야간옵션선물시간대별체결조회(t2832) 
+class t2832(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2832OutBlock] = msgspec.field(default=None, name='t2832OutBlock')
+    outblock1: Optional[List[t2832OutBlock1]] = msgspec.field(default=None, name='t2832OutBlock1')
+# endregion
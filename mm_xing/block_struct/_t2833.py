@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t2833 - EUREX야간옵션선물기간별추이(t2833)>
+class t2833InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    futcheck: str = '' # 선물최근월물
+    date: str = '' # 날짜
+    cts_code: str = '' # CTS종목코드
+    lastdate: str = '' # 전종목만기일
+    cnt: str = '' # 조회요청건수
+
+
+class t2833OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    cts_code: str = '' # CTS종목코드
+    lastdate: str = '' # 전종목만기일
+    nowfutyn: str = '' # 최근월선물여부
+
+
+class t2833OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    diff_vol: float = 0.0 # 거래증가율
+
+
+
+# EUREX야간옵션선물기간별추이(t2833) 
+class t2833(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2833OutBlock] = msgspec.field(default=None, name='t2833OutBlock')
+    outblock1: Optional[List[t2833OutBlock1]] = msgspec.field(default=None, name='t2833OutBlock1')
+# endregion
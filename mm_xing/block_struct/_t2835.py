@@ -0,0 +1,75 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t2835 - EUREX옵션선물시세전광판(t2835)>
+class t2835InBlock(msgspec.Struct, frozen=True, gc=False):
+    yyyymm: str = '' # 월물(혹은주물WN)
+    gubun: str = '' # 구분(G:원지수W:위클리)
+
+
+class t2835OutBlock(msgspec.Struct, frozen=True, gc=False):
+    gmprice: float = 0.0 # 근월물현재가
+    gmsign: str = '' # 근월물전일대비구분
+    gmchange: float = 0.0 # 근월물전일대비
+    gmdiff: float = 0.0 # 근월물등락율
+    gmvolume: int = 0 # 근월물거래량
+    gmshcode: str = '' # 근월물선물코드
+
+
+class t2835OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    actprice: float = 0.0 # 행사가
+    optcode: str = '' # 콜옵션코드
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    offerho1: float = 0.0 # 매도호가
+    bidho1: float = 0.0 # 매수호가
+    cvolume: int = 0 # 체결량
+    impv: float = 0.0 # 내재가치
+    timevl: float = 0.0 # 시간가치
+    offerrem1: int = 0 # 매도잔량
+    bidrem1: int = 0 # 매수잔량
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    atmgubun: str = '' # ATM구분
+    jisuconv: float = 0.0 # 지수환산
+
+
+class t2835OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    actprice: float = 0.0 # 행사가
+    optcode: str = '' # 풋옵션코드
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    offerho1: float = 0.0 # 매도호가
+    bidho1: float = 0.0 # 매수호가
+    cvolume: int = 0 # 체결량
+    impv: float = 0.0 # 내재가치
+    timevl: float = 0.0 # 시간가치
+    offerrem1: int = 0 # 매도잔량
+    bidrem1: int = 0 # 매수잔량
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    atmgubun: str = '' # ATM구분
+    jisuconv: float = 0.0 # 지수환산
+
+
+
+# EUREX옵션선물시세전광판(t2835) 
+class t2835(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t2835OutBlock] = msgspec.field(default=None, name='t2835OutBlock')
+    outblock1: Optional[List[t2835OutBlock1]] = msgspec.field(default=None, name='t2835OutBlock1')
+    outblock2: Optional[List[t2835OutBlock2]] = msgspec.field(default=None, name='t2835OutBlock2')
+# endregion
@@ -0,0 +1,33 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t3102 - 뉴스본문(t3102)>
+class t3102InBlock(msgspec.Struct, frozen=True, gc=False):
+    sNewsno: str = '' # 뉴스번호
+
+
+class t3102OutBlock(msgspec.Struct, frozen=True, gc=False):
+    sJongcode: str = '' # 뉴스종목
+
+
+class t3102OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    sBody: str = '' # 뉴스본문
+
+
+class t3102OutBlock2(msgspec.Struct, frozen=True, gc=False):
+    sTitle: str = '' # 뉴스타이틀
+
+
+
+# 뉴스본문(t3102) 
+class t3102(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t3102OutBlock]] = msgspec.field(default=None, name='t3102OutBlock')
+    outblock1: Optional[List[t3102OutBlock1]] = msgspec.field(default=None, name='t3102OutBlock1')
+    outblock2: Optional[t3102OutBlock2] = msgspec.field(default=None, name='t3102OutBlock2')
+# endregion
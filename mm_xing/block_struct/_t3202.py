@@ -0,0 +1,30 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t3202 - 종목별증시일정(t3202)>
+class t3202InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    date: str = '' # 조회일자
+
+
+class t3202OutBlock(msgspec.Struct, frozen=True, gc=False):
+    recdt: str = '' # 기준일
+    tableid: str = '' # 테이블아이디
+    upgu: str = '' # 업무구분
+    custno: str = '' # 발행체번호
+    custnm: str = '' # 발행회사명
+    shcode: str = '' # 종목코드
+    upunm: str = '' # 업무명
+
+
+
+# 종목별증시일정(t3202) 
+class t3202(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t3202OutBlock]] = msgspec.field(default=None, name='t3202OutBlock')
+# endregion
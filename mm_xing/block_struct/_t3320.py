@@ -0,0 +1,69 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t3320 - FNG_요약(t3320)>
+class t3320InBlock(msgspec.Struct, frozen=True, gc=False):
+    gicode: str = '' # 종목코드
+
+
+class t3320OutBlock(msgspec.Struct, frozen=True, gc=False):
+    upgubunnm: str = '' # 업종구분명
+    sijangcd: str = '' # 시장구분
+    marketnm: str = '' # 시장구분명
+    company: str = '' # 한글기업명
+    baddress: str = '' # 본사주소
+    btelno: str = '' # 본사전화번호
+    gsyyyy: str = '' # 최근결산년도
+    gsmm: str = '' # 결산월
+    gsym: str = '' # 최근결산년월
+    lstprice: int = 0 # 주당액면가
+    gstock: int = 0 # 주식수
+    homeurl: str = '' # Homepage
+    grdnm: str = '' # 그룹명
+    foreignratio: float = 0.0 # 외국인
+    irtel: str = '' # 주담전화
+    capital: float = 0.0 # 자본금
+    sigavalue: float = 0.0 # 시가총액
+    cashsis: float = 0.0 # 배당금
+    cashrate: float = 0.0 # 배당수익율
+    price: int = 0 # 현재가
+    jnilclose: int = 0 # 전일종가
+    notice1: str = '' # 위험고지구분1_정리매매
+    notice2: str = '' # 위험고지구분2_투자위험
+    notice3: str = '' # 위험고지구분3_단기과열
+
+
+class t3320OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    gicode: str = '' # 기업코드
+    gsym: str = '' # 결산년월
+    gsgb: str = '' # 결산구분
+    per: float = 0.0 # PER
+    eps: float = 0.0 # EPS
+    pbr: float = 0.0 # PBR
+    roa: float = 0.0 # ROA
+    roe: float = 0.0 # ROE
+    ebitda: float = 0.0 # EBITDA
+    evebitda: float = 0.0 # EVEBITDA
+    par: float = 0.0 # 액면가
+    sps: float = 0.0 # SPS
+    cps: float = 0.0 # CPS
+    bps: float = 0.0 # BPS
+    t_per: float = 0.0 # T.PER
+    t_eps: float = 0.0 # T.EPS
+    peg: float = 0.0 # PEG
+    t_peg: float = 0.0 # T.PEG
+    t_gsym: str = '' # 최근분기년도
+
+
+
+# FNG_요약(t3320) 
+class t3320(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t3320OutBlock] = msgspec.field(default=None, name='t3320OutBlock')
+    outblock1: Optional[t3320OutBlock1] = msgspec.field(default=None, name='t3320OutBlock1')
+# endregion
@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t3341 - 재무순위종합(t3341)>
+class t3341InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 시장구분
+    gubun1: str = '' # 순위구분(1:매출액증가율2:영업이익증가율3:세전계속이익증가율4:부채비율5:유보율6:EPS7:BPS8:ROE9:PERa:PBRb:PEG)
+    gubun2: str = '' # 대비구분
+    idx: int = 0 # IDX
+
+
+class t3341OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cnt: int = 0 # CNT
+    idx: int = 0 # IDX
+
+
+class t3341OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    rank: int = 0 # 순위
+    hname: str = '' # 기업명
+    salesgrowth: int = 0 # 매출액증가율
+    operatingincomegrowt: int = 0 # 영업이익증가율
+    ordinaryincomegrowth: int = 0 # 경상이익증가율
+    liabilitytoequity: int = 0 # 부채비율
+    enterpriseratio: int = 0 # 유보율
+    eps: int = 0 # EPS
+    bps: int = 0 # BPS
+    roe: int = 0 # ROE
+    shcode: str = '' # 종목코드
+    per: float = 0.0 # PER
+    pbr: float = 0.0 # PBR
+    peg: float = 0.0 # PEG
+
+
+
+# 재무순위종합(t3341) 
+class t3341(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t3341OutBlock] = msgspec.field(default=None, name='t3341OutBlock')
+    outblock1: Optional[List[t3341OutBlock1]] = msgspec.field(default=None, name='t3341OutBlock1')
+# endregion
@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t3401 - 투자의견(t3401)>
+class t3401InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    gubun1: str = '' # 구분
+    tradno: str = '' # 회원사코드
+    cts_date: str = '' # IDXDATE
+
+
+class t3401OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_date: str = '' # IDXDATE
+    price: int = 0 # 현재가
+    sign: str = '' # 대비속성
+    change: int = 0 # 대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    value: int = 0 # 거래대금
+
+
+class t3401OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    tradno: str = '' # 회원사코드
+    date: str = '' # 의견일자
+    tradname: str = '' # 회원사명
+    bopn: str = '' # 투자의견변경후
+    nopn: str = '' # 투자의견변경전
+    boga: int = 0 # 목표가변경전
+    noga: int = 0 # 목표가변경후
+    close: int = 0 # 의견일종가
+
+
+
+# 투자의견(t3401) 
+class t3401(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t3401OutBlock] = msgspec.field(default=None, name='t3401OutBlock')
+    outblock1: Optional[List[t3401OutBlock1]] = msgspec.field(default=None, name='t3401OutBlock1')
+# endregion
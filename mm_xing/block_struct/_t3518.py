@@ -0,0 +1,53 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t3518 - 해외실시간지수(t3518)>
+class t3518InBlock(msgspec.Struct, frozen=True, gc=False):
+    kind: str = '' # 종목종류
+    symbol: str = '' # SYMBOL
+    cnt: int = 0 # 입력건수
+    jgbn: str = '' # 조회구분
+    nmin: int = 0 # N분
+    cts_date: str = '' # CTS_DATE
+    cts_time: str = '' # CTS_TIME
+
+
+class t3518OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_date: str = '' # CTS_DATE
+    cts_time: str = '' # CTS_TIME
+
+
+class t3518OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    time: str = '' # 시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    uprate: float = 0.0 # 등락율
+    volume: float = 0.0 # 누적거래량
+    bidho: float = 0.0 # 매수호가
+    offerho: float = 0.0 # 매도호가
+    bidrem: float = 0.0 # 매수잔량
+    offerrem: float = 0.0 # 매도잔량
+    kind: str = '' # 종목종류
+    symbol: str = '' # SYMBOL
+    exid: str = '' # EXID
+    kodate: str = '' # 한국일자
+    kotime: str = '' # 한국시간
+
+
+
+# 해외실시간지수(t3518) 
+class t3518(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t3518OutBlock] = msgspec.field(default=None, name='t3518OutBlock')
+    outblock1: Optional[List[t3518OutBlock1]] = msgspec.field(default=None, name='t3518OutBlock1')
+# endregion
@@ -0,0 +1,30 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t3521 - 해외지수조회(API용)(t3521)>
+class t3521InBlock(msgspec.Struct, frozen=True, gc=False):
+    kind: str = '' # 종목종류
+    symbol: str = '' # SYMBOL
+
+
+class t3521OutBlock(msgspec.Struct, frozen=True, gc=False):
+    symbol: str = '' # 심벌
+    hname: str = '' # 지수명
+    close: float = 0.0 # 지수
+    sign: str = '' # 대비구분
+    change: float = 0.0 # 대비
+    diff: float = 0.0 # 등락율
+    date: str = '' # 일자
+
+
+
+# 해외지수조회(API용)(t3521) 
+class t3521(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t3521OutBlock] = msgspec.field(default=None, name='t3521OutBlock')
+# endregion
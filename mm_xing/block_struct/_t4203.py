@@ -0,0 +1,57 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t4203 - 업종챠트(종합)(t4203)>
+class t4203InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    gubun: str = '' # 주기구분(0:틱1:분2:일3:주4:월)
+    ncnt: int = 0 # 틱개수
+    qrycnt: int = 0 # 건수
+    tdgb: str = '' # 당일구분(0:전체1:당일만)
+    sdate: str = '' # 시작일자
+    edate: str = '' # 종료일자
+    cts_date: str = '' # 연속일자
+    cts_time: str = '' # 연속시간
+    cts_daygb: str = '' # 연속당일구분(0:연속전체1:연속당일만2:연속전일만)
+
+
+class t4203OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    jisiga: float = 0.0 # 전일시가
+    jihigh: float = 0.0 # 전일고가
+    jilow: float = 0.0 # 전일저가
+    jiclose: float = 0.0 # 전일종가
+    jivolume: int = 0 # 전일거래량
+    disiga: float = 0.0 # 당일시가
+    dihigh: float = 0.0 # 당일고가
+    dilow: float = 0.0 # 당일저가
+    diclose: float = 0.0 # 당일종가
+    disvalue: int = 0 # 당일거래대금
+    cts_date: str = '' # 연속일자
+    cts_time: str = '' # 연속시간
+    cts_daygb: str = '' # 연속당일구분
+
+
+class t4203OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    time: str = '' # 시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    jdiff_vol: int = 0 # 거래량
+    value: int = 0 # 거래대금
+
+
+
+# 업종챠트(종합)(t4203) 
+class t4203(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t4203OutBlock] = msgspec.field(default=None, name='t4203OutBlock')
+    outblock1: Optional[List[t4203OutBlock1]] = msgspec.field(default=None, name='t4203OutBlock1')
+# endregion
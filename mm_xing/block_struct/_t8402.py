@@ -0,0 +1,90 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t8402 - 주식선물현재가조회(API용)(t8402)>
+class t8402InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 단축코드
+
+
+class t8402OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    jnilclose: int = 0 # 전일종가
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    stimeqrt: float = 0.0 # 거래량전일동시간비율
+    value: int = 0 # 거래대금
+    mgjv: int = 0 # 미결제량
+    mgjvdiff: int = 0 # 미결제증감
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    uplmtprice: int = 0 # 상한가
+    dnlmtprice: int = 0 # 하한가
+    high52w: int = 0 # 52최고가
+    low52w: int = 0 # 52최저가
+    basis: float = 0.0 # 베이시스
+    recprice: int = 0 # 기준가
+    theoryprice: int = 0 # 이론가
+    glyl: float = 0.0 # 괴리율
+    lastmonth: str = '' # 만기일
+    jandatecnt: int = 0 # 잔여일
+    pricejisu: float = 0.0 # 종합지수
+    jisusign: str = '' # 종합지수전일대비구분
+    jisuchange: float = 0.0 # 종합지수전일대비
+    jisudiff: float = 0.0 # 종합지수등락율
+    kospijisu: float = 0.0 # KOSPI200지수
+    kospisign: str = '' # KOSPI200전일대비구분
+    kospichange: float = 0.0 # KOSPI200전일대비
+    kospidiff: float = 0.0 # KOSPI200등락율
+    listhprice: int = 0 # 상장최고가
+    listlprice: int = 0 # 상장최저가
+    delt: float = 0.0 # 델타
+    gama: float = 0.0 # 감마
+    ceta: float = 0.0 # 세타
+    vega: float = 0.0 # 베가
+    rhox: float = 0.0 # 로우
+    gmprice: int = 0 # 근월물현재가
+    gmsign: str = '' # 근월물전일대비구분
+    gmchange: int = 0 # 근월물전일대비
+    gmdiff: float = 0.0 # 근월물등락율
+    theorypriceg: int = 0 # 이론가
+    histimpv: float = 0.0 # 역사적변동성
+    impv: float = 0.0 # 내재변동성
+    sbasis: int = 0 # 시장BASIS
+    ibasis: int = 0 # 이론BASIS
+    gmfutcode: str = '' # 근월물종목코드
+    actprice: int = 0 # 행사가
+    shcode: str = '' # 기초자산단축코드
+    basehname: str = '' # 기초자산한글명
+    baseprice: int = 0 # 기초자산현재가
+    basesign: str = '' # 기초자산현재가대비구분
+    basechange: int = 0 # 기초자산현재가전일대비
+    basediff: float = 0.0 # 기초자산등락률
+    basevol: int = 0 # 기초자산거래량
+    baseprevol: int = 0 # 기초자산전일거래량
+    basebidprc: int = 0 # 기초자산매수호가
+    baseaskprc: int = 0 # 기초자산매도호가
+    basefornetbid: int = 0 # 기초자산외국계회원사순매수
+    prodgrp: str = '' # 상품군
+    mulcnt: float = 0.0 # 승수
+    danhochk: str = '' # 단일가호가여부
+    yeprice: int = 0 # 예상체결가
+    jnilysign: str = '' # 예상체결가전일종가대비구분
+    jnilychange: int = 0 # 예상체결가전일종가대비
+    jnilydrate: float = 0.0 # 예상체결가전일종가등락율
+
+
+
+# 주식선물현재가조회(API용)(t8402) 
+class t8402(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t8402OutBlock] = msgspec.field(default=None, name='t8402OutBlock')
+# endregion
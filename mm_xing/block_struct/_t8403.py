@@ -0,0 +1,96 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import Optional
+
+import msgspec
+
+
+# region <t8403 - 주식선물호가조회(API용)(t8403)>
+class t8403InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+
+
+class t8403OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    stimeqrt: float = 0.0 # 거래량전일동시간비율
+    jnilclose: int = 0 # 전일종가
+    offerho1: int = 0 # 매도호가1
+    bidho1: int = 0 # 매수호가1
+    offerrem1: int = 0 # 매도호가수량1
+    bidrem1: int = 0 # 매수호가수량1
+    dcnt1: int = 0 # 매도호가건수1
+    scnt1: int = 0 # 매수호가건수1
+    offerho2: int = 0 # 매도호가2
+    bidho2: int = 0 # 매수호가2
+    offerrem2: int = 0 # 매도호가수량2
+    bidrem2: int = 0 # 매수호가수량2
+    dcnt2: int = 0 # 매도호가건수2
+    scnt2: int = 0 # 매수호가건수2
+    offerho3: int = 0 # 매도호가3
+    bidho3: int = 0 # 매수호가3
+    offerrem3: int = 0 # 매도호가수량3
+    bidrem3: int = 0 # 매수호가수량3
+    dcnt3: int = 0 # 매도호가건수3
+    scnt3: int = 0 # 매수호가건수3
+    offerho4: int = 0 # 매도호가4
+    bidho4: int = 0 # 매수호가4
+    offerrem4: int = 0 # 매도호가수량4
+    bidrem4: int = 0 # 매수호가수량4
+    dcnt4: int = 0 # 매도호가건수4
+    scnt4: int = 0 # 매수호가건수4
+    offerho5: int = 0 # 매도호가5
+    bidho5: int = 0 # 매수호가5
+    offerrem5: int = 0 # 매도호가수량5
+    bidrem5: int = 0 # 매수호가수량5
+    dcnt5: int = 0 # 매도호가건수5
+    scnt5: int = 0 # 매수호가건수5
+    offerho6: int = 0 # 매도호가6
+    bidho6: int = 0 # 매수호가6
+    offerrem6: int = 0 # 매도호가수량6
+    bidrem6: int = 0 # 매수호가수량6
+    dcnt6: int = 0 # 매도호가건수6
+    scnt6: int = 0 # 매수호가건수6
+    offerho7: int = 0 # 매도호가7
+    bidho7: int = 0 # 매수호가7
+    offerrem7: int = 0 # 매도호가수량7
+    bidrem7: int = 0 # 매수호가수량7
+    dcnt7: int = 0 # 매도호가건수7
+    scnt7: int = 0 # 매수호가건수7
+    offerho8: int = 0 # 매도호가8
+    bidho8: int = 0 # 매수호가8
+    offerrem8: int = 0 # 매도호가수량8
+    bidrem8: int = 0 # 매수호가수량8
+    dcnt8: int = 0 # 매도호가건수8
+    scnt8: int = 0 # 매수호가건수8
+    offerho9: int = 0 # 매도호가9
+    bidho9: int = 0 # 매수호가9
+    offerrem9: int = 0 # 매도호가수량9
+    bidrem9: int = 0 # 매수호가수량9
+    dcnt9: int = 0 # 매도호가건수9
+    scnt9: int = 0 # 매수호가건수9
+    offerho10: int = 0 # 매도호가10
+    bidho10: int = 0 # 매수호가10
+    offerrem10: int = 0 # 매도호가수량10
+    bidrem10: int = 0 # 매수호가수량10
+    dcnt10: int = 0 # 매도호가건수10
+    scnt10: int = 0 # 매수호가건수10
+    dvol: int = 0 # 매도호가총수량
+    svol: int = 0 # 매수호가총수량
+    toffernum: int = 0 # 총매도호가건수
+    tbidnum: int = 0 # 총매수호가건수
+    time: str = '' # 수신시간
+    shcode: str = '' # 단축코드
+
+
+
+# 주식선물호가조회(API용)(t8403) 
+class t8403(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t8403OutBlock] = msgspec.field(default=None, name='t8403OutBlock')
+# endregion
@@ -0,0 +1,53 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8404 - 주식선물시간대별체결조회(API용)(t8404)>
+class t8404InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 단축코드
+    cvolume: int = 0 # 특이거래량
+    stime: str = '' # 시작시간
+    etime: str = '' # 종료시간
+    cts_time: str = '' # 시간CTS
+
+
+class t8404OutBlock(msgspec.Struct, frozen=True, gc=False):
+    cts_time: str = '' # 시간CTS
+
+
+class t8404OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    cvolume: int = 0 # 체결수량
+    chdegree: float = 0.0 # 체결강도
+    offerho: int = 0 # 매도호가
+    bidho: int = 0 # 매수호가
+    volume: float = 0.0 # 거래량
+    openyak: int = 0 # 미결수량
+    jnilopenupdn: int = 0 # 미결전일증감
+    ibasis: int = 0 # 이론BASIS
+    sbasis: int = 0 # 시장BASIS
+    kasis: float = 0.0 # 괴리율
+    value: float = 0.0 # 거래대금
+    j_openupdn: int = 0 # 미결직전증감
+    n_msvolume: float = 0.0 # 누적매수체결량
+    n_mdvolume: float = 0.0 # 누적매도체결량
+    s_msvolume: float = 0.0 # 누적순매수체결량
+    n_mschecnt: int = 0 # 누적매수체결건수
+    n_mdchecnt: int = 0 # 누적매도체결건수
+    s_mschecnt: int = 0 # 누적순매수체결건수
+
+
+
+# 주식선물시간대별체결조회(API용)(t8404) 
+class t8404(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t8404OutBlock] = msgspec.field(default=None, name='t8404OutBlock')
+    outblock1: Optional[List[t8404OutBlock1]] = msgspec.field(default=None, name='t8404OutBlock1')
+# endregion
@@ -0,0 +1,45 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8407 - API용주식멀티현재가조회(t8407)>
+class t8407InBlock(msgspec.Struct, frozen=True, gc=False):
+    nrec: int = 0 # 건수
+    shcode: str = '' # 종목코드
+
+
+class t8407OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 종목코드
+    hname: str = '' # 종목명
+    price: int = 0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: int = 0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    offerho: int = 0 # 매도호가
+    bidho: int = 0 # 매수호가
+    cvolume: int = 0 # 체결수량
+    chdegree: float = 0.0 # 체결강도
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    value: int = 0 # 거래대금(백만)
+    offerrem: int = 0 # 우선매도잔량
+    bidrem: int = 0 # 우선매수잔량
+    totofferrem: int = 0 # 총매도잔량
+    totbidrem: int = 0 # 총매수잔량
+    jnilclose: int = 0 # 전일종가
+    uplmtprice: int = 0 # 상한가
+    dnlmtprice: int = 0 # 하한가
+
+
+
+# API용주식멀티현재가조회(t8407) 
+class t8407(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t8407OutBlock1]] = msgspec.field(default=None, name='t8407OutBlock1')
+# endregion
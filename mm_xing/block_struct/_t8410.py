@@ -0,0 +1,64 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8410 - API전용주식챠트(일주월년)(t8410)>
+class t8410InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    gubun: str = '' # 주기구분(2:일3:주4:월5:년)
+    qrycnt: int = 0 # 요청건수(최대-압축:2000비압축:500)
+    sdate: str = '' # 시작일자
+    edate: str = '' # 종료일자
+    cts_date: str = '' # 연속일자
+    comp_yn: str = '' # 압축여부(Y:압축N:비압축)
+    sujung: str = '' # 수정주가여부(Y:적용N:비적용)
+
+
+class t8410OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    jisiga: int = 0 # 전일시가
+    jihigh: int = 0 # 전일고가
+    jilow: int = 0 # 전일저가
+    jiclose: int = 0 # 전일종가
+    jivolume: int = 0 # 전일거래량
+    disiga: int = 0 # 당일시가
+    dihigh: int = 0 # 당일고가
+    dilow: int = 0 # 당일저가
+    diclose: int = 0 # 당일종가
+    highend: int = 0 # 상한가
+    lowend: int = 0 # 하한가
+    cts_date: str = '' # 연속일자
+    s_time: str = '' # 장시작시간(HHMMSS)
+    e_time: str = '' # 장종료시간(HHMMSS)
+    dshmin: str = '' # 동시호가처리시간(MM:분)
+    rec_count: int = 0 # 레코드카운트
+    svi_uplmtprice: int = 0 # 정적VI상한가
+    svi_dnlmtprice: int = 0 # 정적VI하한가
+
+
+class t8410OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    open: int = 0 # 시가
+    high: int = 0 # 고가
+    low: int = 0 # 저가
+    close: int = 0 # 종가
+    jdiff_vol: int = 0 # 거래량
+    value: int = 0 # 거래대금
+    jongchk: int = 0 # 수정구분
+    rate: float = 0.0 # 수정비율
+    pricechk: int = 0 # 수정주가반영항목
+    ratevalue: int = 0 # 수정비율반영거래대금
+    sign: str = '' # 종가등락구분(1:상한2:상승3:보합4:하한5:하락주식일만사용)
+
+
+
+# API전용주식챠트(일주월년)(t8410) 
+class t8410(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t8410OutBlock] = msgspec.field(default=None, name='t8410OutBlock')
+    outblock1: Optional[List[t8410OutBlock1]] = msgspec.field(default=None, name='t8410OutBlock1')
+# endregion
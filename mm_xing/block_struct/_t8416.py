@@ -0,0 +1,57 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8416 - 선물/옵션챠트(일주월)(t8416)>
+class t8416InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    gubun: str = '' # 주기구분(2:일3:주4:월)
+    qrycnt: int = 0 # 요청건수(최대-압축:2000비압축:500)
+    sdate: str = '' # 시작일자
+    edate: str = '' # 종료일자
+    cts_date: str = '' # 연속일자
+    comp_yn: str = '' # 압축여부(Y:압축N:비압축)
+
+
+class t8416OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    jisiga: float = 0.0 # 전일시가
+    jihigh: float = 0.0 # 전일고가
+    jilow: float = 0.0 # 전일저가
+    jiclose: float = 0.0 # 전일종가
+    jivolume: int = 0 # 전일거래량
+    disiga: float = 0.0 # 당일시가
+    dihigh: float = 0.0 # 당일고가
+    dilow: float = 0.0 # 당일저가
+    diclose: float = 0.0 # 당일종가
+    highend: float = 0.0 # 상한가
+    lowend: float = 0.0 # 하한가
+    cts_date: str = '' # 연속일자
+    s_time: str = '' # 장시작시간(HHMMSS)
+    e_time: str = '' # 장종료시간(HHMMSS)
+    dshmin: str = '' # 동시호가처리시간(MM:분)
+    rec_count: int = 0 # 레코드카운트
+
+
+class t8416OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    jdiff_vol: int = 0 # 누적거래량
+    value: int = 0 # 거래대금
+    openyak: int = 0 # 미결제약정
+
+
+
+# 선물/옵션챠트(일주월)(t8416) 
+class t8416(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t8416OutBlock] = msgspec.field(default=None, name='t8416OutBlock')
+    outblock1: Optional[List[t8416OutBlock1]] = msgspec.field(default=None, name='t8416OutBlock1')
+# endregion
@@ -0,0 +1,55 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8419 - 업종챠트(일주월)(t8419)>
+class t8419InBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    gubun: str = '' # 주기구분(2:일3:주4:월)
+    qrycnt: int = 0 # 요청건수(최대-압축:2000비압축:500)
+    sdate: str = '' # 시작일자
+    edate: str = '' # 종료일자
+    cts_date: str = '' # 연속일자
+    comp_yn: str = '' # 압축여부(Y:압축N:비압축)
+
+
+class t8419OutBlock(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    jisiga: float = 0.0 # 전일시가
+    jihigh: float = 0.0 # 전일고가
+    jilow: float = 0.0 # 전일저가
+    jiclose: float = 0.0 # 전일종가
+    jivolume: int = 0 # 전일거래량
+    disiga: float = 0.0 # 당일시가
+    dihigh: float = 0.0 # 당일고가
+    dilow: float = 0.0 # 당일저가
+    diclose: float = 0.0 # 당일종가
+    disvalue: int = 0 # 당일거래대금
+    cts_date: str = '' # 연속일자
+    s_time: str = '' # 업종시작시간
+    e_time: str = '' # 업종종료시간
+    dshmin: str = '' # 동시호가처리시간(MM:분)
+    rec_count: int = 0 # 레코드카운트
+
+
+class t8419OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    jdiff_vol: int = 0 # 거래량
+    value: int = 0 # 거래대금
+
+
+
+# 업종챠트(일주월)(t8419) 
+class t8419(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t8419OutBlock] = msgspec.field(default=None, name='t8419OutBlock')
+    outblock1: Optional[List[t8419OutBlock1]] = msgspec.field(default=None, name='t8419OutBlock1')
+# endregion
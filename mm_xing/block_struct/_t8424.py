@@ -0,0 +1,24 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8424 - 전체업종(t8424)>
+class t8424InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun1: str = '' # 구분1
+
+
+class t8424OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 업종명
+    upcode: str = '' # 업종코드
+
+
+
+# 전체업종(t8424) 
+class t8424(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8424OutBlock]] = msgspec.field(default=None, name='t8424OutBlock')
+# endregion
@@ -0,0 +1,24 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8425 - 전체테마(t8425)>
+class t8425InBlock(msgspec.Struct, frozen=True, gc=False):
+    dummy: str = '' # Dummy
+
+
+class t8425OutBlock(msgspec.Struct, frozen=True, gc=False):
+    tmname: str = '' # 테마명
+    tmcode: str = '' # 테마코드
+
+
+
+# 전체테마(t8425) 
+class t8425(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8425OutBlock]] = msgspec.field(default=None, name='t8425OutBlock')
+# endregion
@@ -0,0 +1,25 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8426 - 상품선물마스터조회(API용)(t8426)>
+class t8426InBlock(msgspec.Struct, frozen=True, gc=False):
+    dummy: str = '' # Dummy
+
+
+class t8426OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+
+
+
+# 상품선물마스터조회(API용)(t8426) 
+class t8426(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8426OutBlock]] = msgspec.field(default=None, name='t8426OutBlock')
+# endregion
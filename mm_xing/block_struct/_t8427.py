@@ -0,0 +1,52 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8427 - 과거데이터시간대별조회(t8427)>
+class t8427InBlock(msgspec.Struct, frozen=True, gc=False):
+    fo_gbn: str = '' # 선물옵션구분
+    yyyy: str = '' # 조회년도
+    mm: str = '' # 조회월
+    cp_gbn: str = '' # 옵션콜풋구분
+    actprice: float = 0.0 # 옵션행사가
+    focode: str = '' # 선물옵션코드
+    dt_gbn: str = '' # 일분구분
+    min_term: str = '' # 분간격
+    date: str = '' # 날짜
+    time: str = '' # 시간
+
+
+class t8427OutBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 선물옵션코드
+    date: str = '' # 날짜
+    time: str = '' # 시간
+
+
+class t8427OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜
+    time: str = '' # 시간
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    close: float = 0.0 # 종가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    diff_vol: float = 0.0 # 거래증가율
+    openyak: int = 0 # 미결수량
+    openyakupdn: int = 0 # 미결증감
+    value: float = 0.0 # 거래대금
+
+
+
+# 과거데이터시간대별조회(t8427) 
+class t8427(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t8427OutBlock] = msgspec.field(default=None, name='t8427OutBlock')
+    outblock1: Optional[List[t8427OutBlock1]] = msgspec.field(default=None, name='t8427OutBlock1')
+# endregion
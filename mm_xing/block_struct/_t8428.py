@@ -0,0 +1,51 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8428 - 증시주변자금추이(t8428)>
+class t8428InBlock(msgspec.Struct, frozen=True, gc=False):
+    fdate: str = '' # from일자
+    tdate: str = '' # to일자
+    gubun: str = '' # 구분
+    key_date: str = '' # 날짜
+    upcode: str = '' # 업종코드
+    cnt: str = '' # 조회건수
+
+
+class t8428OutBlock(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 날짜CTS
+    idx: int = 0 # IDX
+
+
+class t8428OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    date: str = '' # 일자
+    jisu: float = 0.0 # 지수
+    sign: str = '' # 대비구분
+    change: float = 0.0 # 대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 거래량
+    custmoney: int = 0 # 고객예탁금_억원
+    yecha: int = 0 # 예탁증감_억원
+    vol: float = 0.0 # 회전율
+    outmoney: int = 0 # 미수금_억원
+    trjango: int = 0 # 신용잔고_억원
+    futymoney: int = 0 # 선물예수금_억원
+    stkmoney: int = 0 # 주식형_억원
+    mstkmoney: int = 0 # 혼합형_억원(주식)
+    mbndmoney: int = 0 # 혼합형_억원(채권)
+    bndmoney: int = 0 # 채권형_억원
+    bndsmoney: int = 0 # 필러(구.단기채권)
+    mmfmoney: int = 0 # MMF_억원(주식)
+
+
+
+# 증시주변자금추이(t8428) 
+class t8428(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[t8428OutBlock] = msgspec.field(default=None, name='t8428OutBlock')
+    outblock1: Optional[List[t8428OutBlock1]] = msgspec.field(default=None, name='t8428OutBlock1')
+# endregion
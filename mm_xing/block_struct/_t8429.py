@@ -0,0 +1,42 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8429 - EUREX야간옵션선물틱분별체결조회챠트(t8429)>
+class t8429InBlock(msgspec.Struct, frozen=True, gc=False):
+    focode: str = '' # 단축코드
+    cgubun: str = '' # 챠트구분
+    bgubun: str = '' # 분구분
+    cnt: str = '' # 조회건수
+
+
+class t8429OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    chetime: str = '' # 시간
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    open: float = 0.0 # 시가
+    high: float = 0.0 # 고가
+    low: float = 0.0 # 저가
+    volume: float = 0.0 # 거래량
+    cvolume: int = 0 # 체결수량
+    s_mschecnt: int = 0 # 매수순간체결건수
+    s_mdchecnt: int = 0 # 매도순간체결건수
+    ss_mschecnt: int = 0 # 순매수순간체결건수
+    s_mschevol: float = 0.0 # 매수순간체결량
+    s_mdchevol: float = 0.0 # 매도순간체결량
+    ss_mschevol: float = 0.0 # 순매수순간체결량
+    chdegvol: float = 0.0 # 체결강도(거래량)
+    chdegcnt: float = 0.0 # 체결강도(건수)
+
+
+
+# EUREX야간옵션선물틱분별체결조회챠트(t8429) 
+class t8429(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t8429OutBlock1]] = msgspec.field(default=None, name='t8429OutBlock1')
+# endregion
@@ -0,0 +1,32 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8430 - 주식종목조회(t8430)>
+class t8430InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분(0:전체1:코스피2:코스닥)
+
+
+class t8430OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+    etfgubun: str = '' # ETF구분(1:ETF)
+    uplmtprice: int = 0 # 상한가
+    dnlmtprice: int = 0 # 하한가
+    jnilclose: int = 0 # 전일가
+    memedan: str = '' # 주문수량단위
+    recprice: int = 0 # 기준가
+    gubun: str = '' # 구분(1:코스피2:코스닥)
+
+
+
+# 주식종목조회(t8430) 
+class t8430(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8430OutBlock]] = msgspec.field(default=None, name='t8430OutBlock')
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8431 - ELW종목조회(t8431)>
+class t8431InBlock(msgspec.Struct, frozen=True, gc=False):
+    dummy: str = '' # Dummy
+
+
+class t8431OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+    uplmtprice: int = 0 # 상한가
+    dnlmtprice: int = 0 # 하한가
+    jnilclose: int = 0 # 전일종가
+    recprice: int = 0 # 기준가
+
+
+
+# ELW종목조회(t8431) 
+class t8431(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8431OutBlock]] = msgspec.field(default=None, name='t8431OutBlock')
+# endregion
@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8432 - 지수선물마스터조회API용(t8432)>
+class t8432InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+
+
+class t8432OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+    uplmtprice: float = 0.0 # 상한가
+    dnlmtprice: float = 0.0 # 하한가
+    jnilclose: float = 0.0 # 전일종가
+    jnilhigh: float = 0.0 # 전일고가
+    jnillow: float = 0.0 # 전일저가
+    recprice: float = 0.0 # 기준가
+
+
+
+# 지수선물마스터조회API용(t8432) 
+class t8432(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8432OutBlock]] = msgspec.field(default=None, name='t8432OutBlock')
+# endregion
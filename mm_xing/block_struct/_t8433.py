@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8433 - 지수옵션마스터조회API용(t8433)>
+class t8433InBlock(msgspec.Struct, frozen=True, gc=False):
+    dummy: str = '' # Dummy
+
+
+class t8433OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+    hprice: float = 0.0 # 상한가
+    lprice: float = 0.0 # 하한가
+    jnilclose: float = 0.0 # 전일종가
+    jnilhigh: float = 0.0 # 전일고가
+    jnillow: float = 0.0 # 전일저가
+    recprice: float = 0.0 # 기준가
+
+
+
+# 지수옵션마스터조회API용(t8433) 
+class t8433(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8433OutBlock]] = msgspec.field(default=None, name='t8433OutBlock')
+# endregion
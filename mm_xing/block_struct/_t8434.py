@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8434 - 선물/옵션멀티현재가조회(t8434)>
+class t8434InBlock(msgspec.Struct, frozen=True, gc=False):
+    qrycnt: int = 0 # 건수
+    focode: str = '' # 단축코드
+
+
+class t8434OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 한글명
+    price: float = 0.0 # 현재가
+    sign: str = '' # 전일대비구분
+    change: float = 0.0 # 전일대비
+    diff: float = 0.0 # 등락율
+    volume: int = 0 # 누적거래량
+    checnt: int = 0 # 체결건수
+    focode: str = '' # 단축코드
+
+
+
+# 선물/옵션멀티현재가조회(t8434) 
+class t8434(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t8434OutBlock1]] = msgspec.field(default=None, name='t8434OutBlock1')
+# endregion
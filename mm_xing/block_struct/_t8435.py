@@ -0,0 +1,31 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8435 - 파생종목마스터조회API용(t8435)>
+class t8435InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분(MF/MO)
+
+
+class t8435OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+    uplmtprice: float = 0.0 # 상한가
+    dnlmtprice: float = 0.0 # 하한가
+    jnilclose: float = 0.0 # 전일종가
+    jnilhigh: float = 0.0 # 전일고가
+    jnillow: float = 0.0 # 전일저가
+    recprice: float = 0.0 # 기준가
+
+
+
+# 파생종목마스터조회API용(t8435) 
+class t8435(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8435OutBlock]] = msgspec.field(default=None, name='t8435OutBlock')
+# endregion
@@ -0,0 +1,35 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8436 - 주식종목조회 API용(t8436)>
+class t8436InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분(0:전체1:코스피2:코스닥)
+
+
+class t8436OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+    etfgubun: str = '' # ETF구분(1:ETF2:ETN)
+    uplmtprice: int = 0 # 상한가
+    dnlmtprice: int = 0 # 하한가
+    jnilclose: int = 0 # 전일가
+    memedan: str = '' # 주문수량단위
+    recprice: int = 0 # 기준가
+    gubun: str = '' # 구분(1:코스피2:코스닥)
+    bu12gubun: str = '' # 증권그룹
+    spac_gubun: str = '' # 기업인수목적회사여부(Y/N)
+    filler: str = '' # filler(미사용)
+
+
+
+# 주식종목조회 API용(t8436) 
+class t8436(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8436OutBlock]] = msgspec.field(default=None, name='t8436OutBlock')
+# endregion
@@ -0,0 +1,27 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t8437 - CME/EUREX마스터조회(API용)(t8437)>
+class t8437InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분(NF/NC/NM/NO)
+
+
+class t8437OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 종목코드
+    expcode: str = '' # 표준코드
+    tradeunit: float = 0.0 # 거래승수
+    atmgb: str = '' # ATM구분(1:ATM2:ITM3:OTM)
+
+
+
+# CME/EUREX마스터조회(API용)(t8437) 
+class t8437(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t8437OutBlock]] = msgspec.field(default=None, name='t8437OutBlock')
+# endregion
@@ -0,0 +1,25 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t9905 - 기초자산리스트조회(t9905)>
+class t9905InBlock(msgspec.Struct, frozen=True, gc=False):
+    dummy: str = '' # DUMMY
+
+
+class t9905OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 표준코드
+    hname: str = '' # 종목명
+
+
+
+# 기초자산리스트조회(t9905) 
+class t9905(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t9905OutBlock1]] = msgspec.field(default=None, name='t9905OutBlock1')
+# endregion
@@ -0,0 +1,24 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t9907 - 만기월조회(t9907)>
+class t9907InBlock(msgspec.Struct, frozen=True, gc=False):
+    dummy: str = '' # DUMMY
+
+
+class t9907OutBlock1(msgspec.Struct, frozen=True, gc=False):
+    lastym: str = '' # 만기월
+    lastnm: str = '' # 만기월명
+
+
+
+# 만기월조회(t9907) 
+class t9907(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock1: Optional[List[t9907OutBlock1]] = msgspec.field(default=None, name='t9907OutBlock1')
+# endregion
@@ -0,0 +1,25 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t9943 - 지수선물마스터조회API용(t9943)>
+class t9943InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분
+
+
+class t9943OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+
+
+
+# 지수선물마스터조회API용(t9943) 
+class t9943(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t9943OutBlock]] = msgspec.field(default=None, name='t9943OutBlock')
+# endregion
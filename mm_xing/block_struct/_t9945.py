@@ -0,0 +1,27 @@
+# type: ignore
+# Generated by res_converter.py - create_msgspec_model_for_rest  2026-10-18T18:09:01.358355
+from typing import List, Optional
+
+import msgspec
+
+
+# region <t9945 - 주식마스터조회API용-종목명40bytes(t9945)>
+class t9945InBlock(msgspec.Struct, frozen=True, gc=False):
+    gubun: str = '' # 구분(KSP:1KSD:2)
+
+
+class t9945OutBlock(msgspec.Struct, frozen=True, gc=False):
+    hname: str = '' # 종목명
+    shcode: str = '' # 단축코드
+    expcode: str = '' # 확장코드
+    etfchk: str = '' # ETF구분
+    filler: str = '' # filler
+
+
+
+# 주식마스터조회API용-종목명40bytes(t9945) 
+class t9945(msgspec.Struct, frozen=True):
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+    outblock: Optional[List[t9945OutBlock]] = msgspec.field(default=None, name='t9945OutBlock')
+# endregion
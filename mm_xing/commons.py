@@ -0,0 +1,52 @@
+import importlib
+from collections.abc import Mapping
+from types import ModuleType
+from typing import Any, Iterator
+
+
+class LazyQueryMap(Mapping):
+    """``tr_code -> TR model`` mapping over a generated per-TR block package.
+
+    Each TR lives in its own ``<package>._<tr_code>`` module, which is imported
+    on first lookup only.
+    """
+
+    def __init__(self, package: str, query_desc: dict, block_index: dict):
+        self.package = package
+        self.query_desc = query_desc
+        self.block_index = block_index
+
+    def load_tr(self, tr_code: str) -> ModuleType:
+        """Import (once) and return the generated module holding ``tr_code``'s models."""
+        if tr_code not in self.query_desc:
+            raise KeyError(f"Unknown TR code: {tr_code}")
+        return importlib.import_module(f"{self.package}._{tr_code}")
+
+    def load_all(self) -> None:
+        """Materialize every TR module, e.g. to warm a long-running worker up front."""
+        for tr_code in self.query_desc:
+            self.load_tr(tr_code)
+
+    def resolve(self, name: str) -> Any:
+        """Return the block class ``name`` (e.g. ``t8436OutBlock``) from its TR module."""
+        tr_code = self.block_index.get(name)
+        if tr_code is None:
+            raise AttributeError(f"module {self.package!r} has no attribute {name!r}")
+        return getattr(self.load_tr(tr_code), name)
+
+    def __getitem__(self, tr_code: str) -> Any:
+        if tr_code not in self.query_desc:
+            raise KeyError(tr_code)
+        return getattr(self.load_tr(tr_code), tr_code)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.query_desc)
+
+    def __len__(self) -> int:
+        return len(self.query_desc)
+
+    def __contains__(self, tr_code: object) -> bool:
+        return tr_code in self.query_desc
+
+    def __repr__(self) -> str:
+        return f"<QUERY_MAP of {len(self)} lazily loaded TRs in {self.package}>"
@@ -8,6 +8,13 @@ from pydantic_settings import BaseSettings
 class XingSettings(BaseSettings):
     XING_APP_KEY: str
     XING_APP_SECRET: str
+    # JSON object of further app keys to spread TR calls over, e.g. '{"<app key>": "<app secret>"}'
+    XING_APP_KEYS: dict[str, str] = {}
+    # JSON objects overriding mm_xing.constant rate limits, e.g. '{"t8436": 3}'
+    XING_TR_RATE_LIMITS: dict[str, float] = {}
+    XING_PATH_RATE_LIMITS: dict[str, float] = {}
+    # JSON object overriding mm_xing.constant cache policies, e.g. '{"t8407": {"ttl_sec": 1}}'
+    XING_CACHE_POLICIES: dict[str, dict] = {}
 
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
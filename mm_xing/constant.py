@@ -1,15 +1,88 @@
 import os
 
+import pytz  # type: ignore
+
 from mm_xing.block import t9943InBlock
 
 XING_AUTH_URL = "oauth2/token"
 
-XING_REST_URL = "https://openapi.ls-sec.co.kr:8080"
+# Override to point the client at a stand-in (python -m mm_xing.standin)
+XING_REST_URL = os.getenv("XING_REST_URL", "https://openapi.ls-sec.co.kr:8080")
 XING_APP_KEY:str | None = os.getenv("XING_APP_KEY") 
 XING_APP_SECRET:str | None = os.getenv("XING_APP_SECRET")
 
+# Exchange time zone: session dates, midnights and closes are KST whatever the host's TZ
+KST = pytz.timezone('Asia/Seoul')
+
+# Shared httpx.AsyncClient of mm_xing.tasks.master
+XING_CONNECT_TIMEOUT_SEC = 5.0
+XING_REQUEST_TIMEOUT_SEC = 10.0
+XING_MAX_CONNECTIONS = 20
+XING_MAX_KEEPALIVE_CONNECTIONS = 10
+XING_KEEPALIVE_EXPIRY_SEC = 30.0
+
+# OAuth token cache shared by every process on the host (mm_xing.auth.XingTokenManager)
+XING_TOKEN_CACHE_DIR = ".cache/xing_token"
+XING_TOKEN_DEFAULT_TTL_SEC = 86400
+XING_TOKEN_REFRESH_MARGIN_SEC = 600
+# The refresh margin is capped at this fraction of a token's lifetime, so short-lived tokens get used.
+XING_TOKEN_REFRESH_MARGIN_FRACTION = 0.1
+XING_TOKEN_LOCK_TIMEOUT_SEC = 30
+XING_TOKEN_RETRY_SEC = 30
+XING_TOKEN_REJECTED_CODE = "IGW00121"  # rsp_cd of an invalid or revoked bearer token
+
+# TR response cache (mm_xing.response_cache.XingResponseCache): memory LRU + disk tier
+XING_RESPONSE_CACHE_DIR = ".cache/xing_responses"
+XING_CACHE_MEMORY_ENTRIES = 256  # decoded responses; a t8436 master is ~0.5 MB of JSON
+XING_CACHE_DISK_LIMIT_BYTES = 2**30
+# Regular session close (HHMM, exchange local time); "close" cache policies expire here
+XING_SESSION_CLOSE = "1530"
+
+# Parsed .res specs reused across res_converter runs (mm_xing.res_converter.load_res_infos)
+XING_RES_CACHE_PATH = ".cache/xing_res/specs.msgpack"
+
+# Resumable chart backfill (mm_xing.tasks.backfill)
+XING_BACKFILL_CHECKPOINT_DIR = ".cache/xing_backfill"
+XING_BACKFILL_START_DATE = "19900101"
+XING_BACKFILL_PAGE_SIZE = 500  # t8410 maximum without compression
+XING_BACKFILL_CONCURRENCY = 4
+XING_BACKFILL_MAX_RETRIES = 5
+XING_BACKFILL_RETRY_BASE_SEC = 2.0
+
+# Realtime websocket feed (mm_xing.realtime.XingRealtimeClient)
+XING_WEBSOCKET_URL = "wss://openapi.ls-sec.co.kr:9443/websocket"
+XING_WEBSOCKET_PING_INTERVAL_SEC = 20.0
+XING_WEBSOCKET_RECONNECT_MIN_SEC = 1.0
+XING_WEBSOCKET_RECONNECT_MAX_SEC = 30.0
+XING_WEBSOCKET_MAX_FRAME_BYTES = 2**20
+
+# Ticks kept per symbol by mm_xing.tick_store.TickStore (~0.8 MB per symbol)
+XING_TICK_RING_CAPACITY = 2**14
+
+# Histogram buckets (seconds) of the per-TR client metrics (mm_xing.metrics)
+XING_METRICS_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+XING_METRICS_WAIT_BUCKETS = (0.0, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# In-memory t8436 symbol master search (mm_xing.symbol_index.SymbolIndex):
+# prefixes up to this many characters/jamo have their ranked matches precomputed
+XING_SYMBOL_INDEX_HEAD_DEPTH = 4
+XING_SYMBOL_SEARCH_LIMIT = 20
+
+# Watchlist quote polling (mm_xing.watchlist.WatchlistPoller): t8407 takes up to 50
+# codes per call (shcode is char 300, 6 per code), so 1,000 symbols are 20 calls a round
+XING_T8407_MAX_SYMBOLS = 50
+XING_WATCHLIST_INTERVAL_SEC = 1.0
+
 MM_DB_PATH = "data"
+# Columnar chart bar store (mm_xing.bar_store.BarStore): <dir>/<interval>/<symbol>/[g<n>/]<column>.bin
+XING_BAR_STORE_DIR = os.path.join(MM_DB_PATH, "xing_bars")
+# Binary realtime feed log (mm_xing.tick_log): <dir>/<YYYYMMDD>/<tr_code>/<segment>.seg
+XING_TICK_LOG_DIR = os.path.join(MM_DB_PATH, "xing_ticks")
+XING_TICK_LOG_SEGMENT_BYTES = 64 * 2**20
+# Recorded REST responses served by the offline stand-in (mm_xing.standin)
+XING_STANDIN_RECORDING_DIR = os.path.join(MM_DB_PATH, "xing_recordings")
 SUBSCRIBE = "3"
+UNSUBSCRIBE = "4"
 
 T1764 = "t1764"
 T8424 = "t8424"
@@ -23,9 +96,68 @@ T9943 = "t9943"
 T9944 = "t9944"
 O3101 = "o3101"
 
+T1301 = "t1301"
+T1305 = "t1305"
+T1310 = "t1310"
+T8407 = "t8407"
+T1637 = "t1637"
+T1702 = "t1702"
+T8410 = "t8410"
+T8411 = "t8411"
+T8412 = "t8412"
+T8414 = "t8414"
+T8415 = "t8415"
+T8416 = "t8416"
+T8417 = "t8417"
+T8418 = "t8418"
+T8419 = "t8419"
+
 CODE = 'code'
 TICKER = 'ticker'
 
+# mm_xing.rate_limit.XingRateLimiter: requests/sec per TR code and per URL path.
+# Defaults follow the per-TR limits LS publishes for its openapi; override them
+# with the XING_TR_RATE_LIMITS / XING_PATH_RATE_LIMITS settings.
+XING_DEFAULT_TR_RATE_LIMIT = 1.0
+XING_TR_RATE_LIMITS: dict[str, float] = {
+    "t8436": 2.0,
+    "t8407": 2.0,
+    "t8410": 1.0,
+    "t8411": 1.0,
+    "t8412": 1.0,
+    "t8418": 1.0,
+    "t8419": 1.0,
+}
+XING_PATH_RATE_LIMITS: dict[str, float] = {}
+
+# mm_xing.response_cache.CachePolicy per TR code: fresh for ttl_sec, or until the next
+# KST midnight ("day") / session close ("close"), then served stale for stale_sec while
+# refreshed in the background. TRs not listed are not cached; override with the
+# XING_CACHE_POLICIES setting.
+_MASTER_POLICY = {"until": "day", "stale_sec": 3600}
+# Daily/period charts only change at the close; tick/minute charts (and t1637, which
+# can be by time of day) grow all session, so they stay fresh briefly.
+_CHART_POLICY = {"until": "close", "stale_sec": 600}
+_INTRADAY_CHART_POLICY = {"ttl_sec": 30, "stale_sec": 30}
+_QUOTE_POLICY = {"ttl_sec": 2, "stale_sec": 3}
+XING_CACHE_POLICIES: dict[str, dict] = {
+    **{tr_code: _MASTER_POLICY for tr_code in (
+        "t1764", "t8424", "t8425", "t8436", "t8401", "t8426", "t9943", "t9944", "o3101",
+    )},
+    **{tr_code: _CHART_POLICY for tr_code in ("t1305", "t1702", "t8410", "t8416", "t8419")},
+    **{tr_code: _INTRADAY_CHART_POLICY for tr_code in ("t1637", "t8411", "t8412", "t8414", "t8415", "t8417", "t8418")},
+    **{tr_code: _QUOTE_POLICY for tr_code in ("t1301", "t1310", "t8407")},
+}
+
+# Lower is served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+# Response decoders of mm_xing.tasks.master.get_data_config
+PYDANTIC_DECODER = 'pydantic'
+MSGSPEC_DECODER = 'msgspec'
+COLUMNAR_DECODER = 'columnar'
+
 TR_CODE_TO_TYPE = {
     T1764: CODE,
     T8424: CODE,
@@ -48,6 +180,13 @@ STOCK_ETC_PATH = "/stock/etc"
 FUTUREOPTION_MARKET_DATA_PATH = "/futureoption/market-data" 
 OVERSEAS_FUTUREOPTION_MARKET_DATA_PATH = "/overseas-futureoption/market-data"
 
+STOCK_MARKET_DATA_PATH = "/stock/market-data"
+STOCK_CHART_PATH = "/stock/chart"
+STOCK_FRGR_ITT_PATH = "/stock/frgr-itt"
+STOCK_PROGRAM_PATH = "/stock/program"
+INDTP_CHART_PATH = "/indtp/chart"
+FUTUREOPTION_CHART_PATH = "/futureoption/chart"
+
 TR_CODE_TO_URL = {
     T1764: STOCK_EXCHANGE_PATH,
     T8424: INDTP_MARKET_DATA_PATH,
@@ -58,7 +197,30 @@ TR_CODE_TO_URL = {
     T9943: FUTUREOPTION_MARKET_DATA_PATH,
     T9944: FUTUREOPTION_MARKET_DATA_PATH,
     O3101: OVERSEAS_FUTUREOPTION_MARKET_DATA_PATH,
+    T1301: STOCK_MARKET_DATA_PATH,
+    T1305: STOCK_MARKET_DATA_PATH,
+    T1310: STOCK_MARKET_DATA_PATH,
+    T8407: STOCK_MARKET_DATA_PATH,
+    T1637: STOCK_PROGRAM_PATH,
+    T1702: STOCK_FRGR_ITT_PATH,
+    T8410: STOCK_CHART_PATH,
+    T8411: STOCK_CHART_PATH,
+    T8412: STOCK_CHART_PATH,
+    T8414: FUTUREOPTION_CHART_PATH,
+    T8415: FUTUREOPTION_CHART_PATH,
+    T8416: FUTUREOPTION_CHART_PATH,
+    T8417: FUTUREOPTION_CHART_PATH,
+    T8418: INDTP_CHART_PATH,
+    T8419: INDTP_CHART_PATH,
+}
+
+# Continuation (연속조회): InBlock fields refilled from the same-named OutBlock
+# fields for the next page. TRs not listed use every InBlock field named
+# ``cts_*`` or ``idx`` that the OutBlock also returns.
+TR_CONTINUATION_FIELDS = {
+    T1305: ("date", "idx"),
 }
+CONTINUATION_FIELD_PREFIX = "cts_"
 
 from mm_xing.block import (o3101InBlock, o3101OutBlock,  # noqa: E402
                            t1764InBlock, t1764OutBlock, t8401InBlock,
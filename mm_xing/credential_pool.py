@@ -0,0 +1,132 @@
+import hashlib
+import itertools
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from httpx import AsyncClient
+
+from mm_xing.auth import XingTokenManager, XingTokenRejected
+from mm_xing.constant import PRIORITY_INTERACTIVE, XING_TOKEN_CACHE_DIR
+from mm_xing.rate_limit import XingRateLimiter
+from mm_xing.schemas import XingTrHeaders
+
+
+class XingCredential:
+    """One app key with its own bearer token and its own per-TR rate budget.
+
+    The Xing gateway counts TR calls per app key, so every key gets a
+    ``XingRateLimiter`` of its own. ``pending`` counts the calls of each TR
+    that are queued on or in flight with this key, which is what the pool
+    balances on.
+    """
+
+    def __init__(self, name: str, token_manager: XingTokenManager, rate_limiter: XingRateLimiter):
+        self.name = name
+        self.token_manager = token_manager
+        self.rate_limiter = rate_limiter
+        self.pending: Counter = Counter()
+        self.requests: Counter = Counter()
+
+    @property
+    def in_flight(self) -> int:
+        return sum(self.pending.values())
+
+    async def authorize(self, headers: XingTrHeaders) -> XingTrHeaders:
+        """Copy ``headers`` with this key's bearer token."""
+        access_token = await self.token_manager.get_access_token()
+        return headers.model_copy(update={"authorization": f"Bearer {access_token}"})
+
+
+class XingCredentialPool:
+    """Spreads TR calls over several app keys to multiply the rate budget.
+
+    Each call goes to the key with the fewest calls of the same TR queued or
+    in flight (then the fewest calls overall, then round-robin), so N keys
+    serve close to N times the per-key TR limit. A continued TR must stay on
+    the key whose token opened the sequence: ``stream_market_data`` picks a key
+    once and passes it to every ``lease`` of its pages.
+
+    Example:
+        >>> pool = XingCredentialPool.from_app_keys(get_shared_client, {"key-1": "secret-1", "key-2": "secret-2"})
+        >>> async with pool.lease(config.tr_code, config.path) as credential:
+        ...     headers = await credential.authorize(headers)
+    """
+
+    def __init__(self, credentials: List[XingCredential]):
+        if not credentials:
+            raise ValueError("at least one credential is required")
+        self.credentials = credentials
+        self._turn = itertools.count()
+
+    @classmethod
+    def from_app_keys(
+        cls,
+        client_factory: Callable[[], AsyncClient],
+        app_keys: Dict[str, str],
+        tr_limits: Optional[Dict[str, float]] = None,
+        path_limits: Optional[Dict[str, float]] = None,
+        cache_directory: str = XING_TOKEN_CACHE_DIR,
+    ) -> "XingCredentialPool":
+        """Build a pool of ``{app_key: app_secret}``, every key with the same rate limits."""
+        return cls([
+            XingCredential(
+                # Never log the app key itself.
+                name=f"key-{hashlib.sha256(app_key.encode()).hexdigest()[:8]}",
+                token_manager=XingTokenManager(client_factory, app_key, app_secret, cache_directory=cache_directory),
+                rate_limiter=XingRateLimiter(tr_limits=tr_limits, path_limits=path_limits),
+            )
+            for app_key, app_secret in app_keys.items()
+        ])
+
+    def __len__(self) -> int:
+        return len(self.credentials)
+
+    def pick(self, tr_code: str) -> XingCredential:
+        """Return the least-loaded credential for a call of ``tr_code``."""
+        count = len(self.credentials)
+        start = next(self._turn) % count
+        return min(
+            (self.credentials[(start + i) % count] for i in range(count)),
+            key=lambda credential: (credential.pending[tr_code], credential.in_flight),
+        )
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        tr_code: str,
+        path: str,
+        priority: int = PRIORITY_INTERACTIVE,
+        credential: Optional[XingCredential] = None,
+    ) -> AsyncIterator[XingCredential]:
+        """Hold a rate-limited slot of ``credential`` (the least-loaded one by default) for one call.
+
+        A call that raises ``XingTokenRejected`` drops the credential's token
+        (in this process and in the host-wide store) before re-raising, so
+        the next call issues a new one instead of reusing the revoked token.
+        """
+        credential = credential or self.pick(tr_code)
+        credential.pending[tr_code] += 1
+        try:
+            # Have the token ready before taking the slot, so that ``authorize``
+            # does not delay the call past the window the slot was granted for.
+            await credential.token_manager.get_access_token()
+            await credential.rate_limiter.acquire(tr_code, path, priority)
+            credential.requests[tr_code] += 1
+            yield credential
+        except XingTokenRejected as e:
+            await credential.token_manager.invalidate(e.authorization.removeprefix("Bearer "))
+            raise
+        finally:
+            credential.pending[tr_code] -= 1
+
+    async def close(self) -> None:
+        for credential in self.credentials:
+            await credential.token_manager.close()
+
+    def summary(self) -> List[dict]:
+        return [
+            {"credential": credential.name, "tr_code": tr_code, "requests": requests}
+            for credential in self.credentials
+            for tr_code, requests in sorted(credential.requests.items())
+        ]
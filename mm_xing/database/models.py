@@ -1,10 +1,14 @@
-from sqlalchemy import Column, DateTime, Float, Integer, String, func
+from sqlalchemy import (Column, DateTime, Float, Integer, String, UniqueConstraint,
+                        func)
 
 from mm_xing.database.base import Base
 
 
 class BaseOrm(Base):
     __abstract__ = True
+    # Columns identifying a row across daily refreshes; upserted on by
+    # mm_xing.database.writer.upsert_rows.
+    __natural_key__: tuple = ()
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     created_at = Column(DateTime(timezone=True), default=func.now(), nullable=True)
@@ -20,6 +24,8 @@ class RountineTaskOrm(BaseOrm):
     
 class t1764OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t1764_outblock'
+    __natural_key__ = ('tradno',)
+    __table_args__ = (UniqueConstraint('tradno', name='uq_xing_t1764_outblock_tradno'),)
     rank = Column(Integer, nullable=False, default=0, comment='순위')  
     tradno = Column(String, nullable=False, default='', comment='거래원번호')
     tradname = Column(String, nullable=False, default='', comment='거래원이름')
@@ -29,6 +35,8 @@ class t1764OutBlockOrm(BaseOrm):
 
 class t8424OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t8424_outblock'
+    __natural_key__ = ('upcode',)
+    __table_args__ = (UniqueConstraint('upcode', name='uq_xing_t8424_outblock_upcode'),)
     hname = Column(String, nullable=False, default='', comment='업종명')
     upcode = Column(String, nullable=False, default='', comment='업종코드')
 
@@ -37,6 +45,8 @@ class t8424OutBlockOrm(BaseOrm):
 
 class t8425OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t8425_outblock'
+    __natural_key__ = ('tmcode',)
+    __table_args__ = (UniqueConstraint('tmcode', name='uq_xing_t8425_outblock_tmcode'),)
     tmname = Column(String, nullable=False, default='', comment='테마명')
     tmcode = Column(String, nullable=False, default='', comment='테마코드')
 
@@ -45,6 +55,8 @@ class t8425OutBlockOrm(BaseOrm):
 
 class t8436OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t8436_outblock'
+    __natural_key__ = ('shcode',)
+    __table_args__ = (UniqueConstraint('shcode', name='uq_xing_t8436_outblock_shcode'),)
     hname = Column(String, nullable=False, default='', comment='종목명')
     shcode = Column(String, nullable=False, default='', comment='단축코드')
     expcode = Column(String, nullable=False, default='', comment='확장코드')
@@ -64,16 +76,20 @@ class t8436OutBlockOrm(BaseOrm):
 
 class t8401OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t8401_outblock'
+    __natural_key__ = ('shcode',)
+    __table_args__ = (UniqueConstraint('shcode', name='uq_xing_t8401_outblock_shcode'),)
     hname = Column(String, nullable=False, default='', comment='종목명')
     shcode = Column(String, nullable=False, default='', comment='단축코드')
     expcode = Column(String, nullable=False, default='', comment='확장코드')
-    BaseOrmcode = Column(String, nullable=False, default='', comment='기초자산코드')
+    basecode = Column(String, nullable=False, default='', comment='기초자산코드')
 
     def __repr__(self):
         return f"<T8401OutBlockOrm(id={self.id}, hname='{self.hname}', shcode='{self.shcode}')>"
 
 class t8426OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t8426_outblock'
+    __natural_key__ = ('shcode',)
+    __table_args__ = (UniqueConstraint('shcode', name='uq_xing_t8426_outblock_shcode'),)
     hname = Column(String, nullable=False, default='', comment='종목명')
     shcode = Column(String, nullable=False, default='', comment='단축코드')
     expcode = Column(String, nullable=False, default='', comment='확장코드')
@@ -83,6 +99,8 @@ class t8426OutBlockOrm(BaseOrm):
 
 class t9943VOutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t9943V_outblock'
+    __natural_key__ = ('shcode',)
+    __table_args__ = (UniqueConstraint('shcode', name='uq_xing_t9943V_outblock_shcode'),)
     hname = Column(String, nullable=False, default='', comment='종목명')
     shcode = Column(String, nullable=False, default='', comment='단축코드') 
     expcode = Column(String, nullable=False, default='', comment='확장코드')
@@ -92,6 +110,8 @@ class t9943VOutBlockOrm(BaseOrm):
 
 class t9943SOutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t9943S_outblock'
+    __natural_key__ = ('shcode',)
+    __table_args__ = (UniqueConstraint('shcode', name='uq_xing_t9943S_outblock_shcode'),)
     hname = Column(String, nullable=False, default='', comment='종목명')
     shcode = Column(String, nullable=False, default='', comment='단축코드') 
     expcode = Column(String, nullable=False, default='', comment='확장코드')
@@ -101,6 +121,8 @@ class t9943SOutBlockOrm(BaseOrm):
 
 class t9943OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t9943_outblock'
+    __natural_key__ = ('shcode',)
+    __table_args__ = (UniqueConstraint('shcode', name='uq_xing_t9943_outblock_shcode'),)
     hname = Column(String, nullable=False, default='', comment='종목명')
     shcode = Column(String, nullable=False, default='', comment='단축코드') 
     expcode = Column(String, nullable=False, default='', comment='확장코드')
@@ -112,6 +134,8 @@ class t9943OutBlockOrm(BaseOrm):
 
 class t9944OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t9944_outblock'
+    __natural_key__ = ('shcode',)
+    __table_args__ = (UniqueConstraint('shcode', name='uq_xing_t9944_outblock_shcode'),)
     hname = Column(String, nullable=False, default='', comment='종목명')
     shcode = Column(String, nullable=False, default='', comment='단축코드')
     expcode = Column(String, nullable=False, default='', comment='확장코드')
@@ -121,6 +145,8 @@ class t9944OutBlockOrm(BaseOrm):
 
 class o3101OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_o3101_outblock'
+    __natural_key__ = ('Symbol',)
+    __table_args__ = (UniqueConstraint('Symbol', name='uq_xing_o3101_outblock_Symbol'),)
     Symbol = Column(String, nullable=False, default='', comment='종목코드')
     SymbolNm = Column(String, nullable=False, default='', comment='종목명')
     ApplDate = Column(String, nullable=False, default='', comment='종목배치수신일(한국일자)')
@@ -150,3 +176,19 @@ class o3101OutBlockOrm(BaseOrm):
 
     def __repr__(self):
         return f"<O3101OutBlockOrm(id={self.id}, Symbol='{self.Symbol}', SymbolNm='{self.SymbolNm}')>"
+
+
+# Snapshot key (TR code, or t9943 variant) -> table of its OutBlock rows
+TR_CODE_TO_ORM = {
+    't1764': t1764OutBlockOrm,
+    't8424': t8424OutBlockOrm,
+    't8425': t8425OutBlockOrm,
+    't8436': t8436OutBlockOrm,
+    't8401': t8401OutBlockOrm,
+    't8426': t8426OutBlockOrm,
+    't9943V': t9943VOutBlockOrm,
+    't9943S': t9943SOutBlockOrm,
+    't9943': t9943OutBlockOrm,
+    't9944': t9944OutBlockOrm,
+    'o3101': o3101OutBlockOrm,
+}
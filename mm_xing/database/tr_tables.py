@@ -0,0 +1,44 @@
+# type: ignore
+# Generated by res_converter.py - create_orm_tables  2026-10-18T18:42:03.695361
+from sqlalchemy import BigInteger, Column, Float, Integer, String, UniqueConstraint
+
+from mm_xing.database.models import BaseOrm
+
+
+# t8407 - API용주식멀티현재가조회(t8407)
+class t8407OutBlock1Orm(BaseOrm):
+    __tablename__ = 'xing_t8407_outblock1'
+    __tr_code__ = 't8407'
+    __natural_key__ = ('shcode',)
+    __table_args__ = (UniqueConstraint('shcode', name='uq_xing_t8407_outblock1_shcode'),)
+    shcode = Column(String(length=6), nullable=False, default='', comment='종목코드')
+    hname = Column(String(length=40), nullable=False, default='', comment='종목명')
+    price = Column(Integer(), nullable=False, default=0, comment='현재가')
+    sign = Column(String(length=1), nullable=False, default='', comment='전일대비구분')
+    change = Column(Integer(), nullable=False, default=0, comment='전일대비')
+    diff = Column(Float(), nullable=False, default=0.0, comment='등락율')
+    volume = Column(BigInteger(), nullable=False, default=0, comment='누적거래량')
+    offerho = Column(Integer(), nullable=False, default=0, comment='매도호가')
+    bidho = Column(Integer(), nullable=False, default=0, comment='매수호가')
+    cvolume = Column(Integer(), nullable=False, default=0, comment='체결수량')
+    chdegree = Column(Float(), nullable=False, default=0.0, comment='체결강도')
+    open = Column(Integer(), nullable=False, default=0, comment='시가')
+    high = Column(Integer(), nullable=False, default=0, comment='고가')
+    low = Column(Integer(), nullable=False, default=0, comment='저가')
+    value = Column(BigInteger(), nullable=False, default=0, comment='거래대금(백만)')
+    offerrem = Column(BigInteger(), nullable=False, default=0, comment='우선매도잔량')
+    bidrem = Column(BigInteger(), nullable=False, default=0, comment='우선매수잔량')
+    totofferrem = Column(BigInteger(), nullable=False, default=0, comment='총매도잔량')
+    totbidrem = Column(BigInteger(), nullable=False, default=0, comment='총매수잔량')
+    jnilclose = Column(Integer(), nullable=False, default=0, comment='전일종가')
+    uplmtprice = Column(Integer(), nullable=False, default=0, comment='상한가')
+    dnlmtprice = Column(Integer(), nullable=False, default=0, comment='하한가')
+
+    def __repr__(self):
+        return f"<t8407OutBlock1Orm(id={self.id}, shcode={self.shcode!r})>"
+
+
+# Block name -> table of its rows
+TR_TABLES = {
+    't8407OutBlock1': t8407OutBlock1Orm,
+}
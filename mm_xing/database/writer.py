@@ -0,0 +1,173 @@
+"""Bulk upsert of xing OutBlock rows.
+
+``upsert_rows`` writes decoded rows (msgspec structs, pydantic models or dicts)
+without building ORM objects:
+
+* PostgreSQL: rows are streamed with ``COPY ... FROM STDIN`` into a temporary
+  staging table and merged with one ``INSERT ... SELECT ... ON CONFLICT
+  (natural key) DO UPDATE``.
+* SQLite (or ``method="insert"``): an executemany
+  ``INSERT ... ON CONFLICT DO UPDATE``.
+
+Both key on the table's ``__natural_key__`` (e.g. ``shcode``), keep
+``created_at`` of existing rows and bump ``updated_at``.
+"""
+import io
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from mm_xing.database.models import BaseOrm
+
+COPY = "copy"
+INSERT = "insert"
+
+AUDIT_COLUMNS = ("id", "created_at", "updated_at")
+
+
+def data_columns(orm_model: type[BaseOrm]) -> List[str]:
+    return [c.name for c in orm_model.__table__.columns if c.name not in AUDIT_COLUMNS]
+
+
+def row_getter(row: Any, columns: Sequence[str]) -> Callable[[Any], tuple]:
+    """Return a fast ``row -> tuple of column values`` for the kind of ``row``."""
+    getter = itemgetter(*columns) if isinstance(row, dict) else attrgetter(*columns)
+    if len(columns) == 1:
+        return lambda r: (getter(r),)
+    return getter
+
+
+def _copy_text(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    return str(value)
+
+
+class CopyStream(io.RawIOBase):
+    """Readable file over rows encoded lazily in COPY text format, for ``copy_expert``."""
+
+    def __init__(self, rows: Iterable[tuple]):
+        self._lines: Iterator[bytes] = (
+            ("\t".join(map(_copy_text, row)) + "\n").encode("utf-8") for row in rows
+        )
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._buffer + b"".join(self._lines)
+            self._buffer = b""
+            return data
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        for line in self._lines:
+            chunks.append(line)
+            length += len(line)
+            if length >= size:
+                break
+        data = b"".join(chunks)
+        self._buffer = data[size:]
+        return data[:size]
+
+
+def _natural_key(orm_model: type[BaseOrm]) -> tuple:
+    key = orm_model.__natural_key__
+    if not key:
+        raise ValueError(f"{orm_model.__name__} has no __natural_key__ to upsert on")
+    return key
+
+
+def upsert_rows(
+    db: Session,
+    orm_model: type[BaseOrm],
+    rows: Sequence[Any],
+    method: Optional[str] = None,
+) -> int:
+    """Upsert ``rows`` into ``orm_model``'s table on its natural key.
+
+    The caller owns the transaction (commit/rollback). Returns the number of
+    rows written.
+
+    Args:
+        db: Session whose connection the rows are written through
+        orm_model: Target table, e.g. ``t8436OutBlockOrm``
+        rows: msgspec structs, pydantic models or dicts with the table's columns
+        method: ``COPY`` or ``INSERT``; by default COPY on PostgreSQL, INSERT elsewhere
+    """
+    if not rows:
+        return 0
+    columns = data_columns(orm_model)
+    getter = row_getter(rows[0], columns)
+    dialect = db.get_bind().dialect.name
+    method = method or (COPY if dialect == "postgresql" else INSERT)
+    if method == COPY:
+        if dialect != "postgresql":
+            raise ValueError(f"COPY is not supported by {dialect}")
+        _copy_upsert(db, orm_model, columns, map(getter, rows))
+    else:
+        _insert_upsert(db, orm_model, columns, [dict(zip(columns, getter(row))) for row in rows])
+    return len(rows)
+
+
+def _insert_upsert(db: Session, orm_model: type[BaseOrm], columns: List[str], values: List[dict]) -> None:
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Upsert is not supported by {dialect}")
+    key = _natural_key(orm_model)
+    stmt = insert(orm_model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={
+            **{c: stmt.excluded[c] for c in columns if c not in key},
+            "updated_at": func.now(),
+        },
+    )
+    # executemany: SQLAlchemy batches the parameter sets into multi-row VALUES.
+    db.execute(stmt, values)
+
+
+def _copy_upsert(db: Session, orm_model: type[BaseOrm], columns: List[str], rows: Iterable[tuple]) -> None:
+    table = orm_model.__table__.name
+    staging = f"_stage_{table}"
+    key = _natural_key(orm_model)
+    quoted = ", ".join(f'"{c}"' for c in columns)
+    conflict = ", ".join(f'"{c}"' for c in key)
+    updates = "".join(f'"{c}" = EXCLUDED."{c}", ' for c in columns if c not in key)
+
+    # Raw DBAPI cursor on the session's own connection/transaction.
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(
+            f'CREATE TEMP TABLE IF NOT EXISTS "{staging}" '
+            f'(LIKE "{table}" INCLUDING DEFAULTS) ON COMMIT DELETE ROWS'
+        )
+        cursor.execute(f'TRUNCATE "{staging}"')
+        copy_sql = f'COPY "{staging}" ({quoted}) FROM STDIN'
+        if hasattr(cursor, "copy_expert"):
+            cursor.copy_expert(copy_sql, CopyStream(rows))
+        else:  # psycopg 3
+            with cursor.copy(copy_sql) as copy:
+                for row in rows:
+                    copy.write_row(row)
+        cursor.execute(
+            f'INSERT INTO "{table}" ({quoted}, created_at, updated_at) '
+            f'SELECT {quoted}, now(), now() FROM "{staging}" '
+            f'ON CONFLICT ({conflict}) DO UPDATE SET {updates}updated_at = now()'
+        )
+    finally:
+        cursor.close()
@@ -0,0 +1,207 @@
+"""Per-TR metrics of the Xing REST client.
+
+``request_xing_api`` / ``stream_market_data`` record every TR call (latency of
+the request plus decoding, payload bytes, rows, and the ``rsp_cd`` of failed
+calls) and ``XingRateLimiter.acquire`` records the time each call waited for
+a rate-limit slot, into the process-wide ``XING_METRICS``; calls served by
+another identical in-flight call (``mm_xing.single_flight``) count as coalesced
+and ``mm_xing.response_cache`` counts its hits, stale hits and misses. The backend serves
+them in the Prometheus text format at ``/metrics``; batch jobs
+(``cli.py mm-xing snapshot/backfill``) print ``summary_lines()`` when done.
+
+Recording is a few additions under the GIL, so it stays on for every call.
+Each process keeps its own counters (scrape every uvicorn worker).
+"""
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+import msgspec
+
+from mm_xing.constant import (XING_METRICS_LATENCY_BUCKETS,
+                              XING_METRICS_WAIT_BUCKETS)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense (``le`` upper bounds)."""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # the last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total = 0
+        buckets = []
+        for bound, count in zip((*map(repr, self.bounds), "+Inf"), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (``max`` past the last bound)."""
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            if total >= rank and total:
+                return min(bound, self.max)
+        return self.max
+
+
+class TrMetrics:
+    def __init__(self):
+        self.latency = Histogram(XING_METRICS_LATENCY_BUCKETS)
+        self.throttle_wait = Histogram(XING_METRICS_WAIT_BUCKETS)
+        self.response_bytes = 0
+        self.rows = 0
+        self.coalesced = 0
+        self.cache: Counter = Counter()  # hit / disk_hit / stale / miss -> lookups
+        self.errors: Counter = Counter()  # rsp_cd (or exception name) -> calls
+
+
+class _ErrorEnvelope(msgspec.Struct):
+    rsp_cd: str = ""
+
+
+_error_decoder = msgspec.json.Decoder(_ErrorEnvelope)
+
+
+def error_code(response, error: BaseException) -> str:
+    """The ``rsp_cd`` of a failed call, or the exception name when there is none."""
+    if response is not None:
+        try:
+            rsp_cd = _error_decoder.decode(response.content).rsp_cd
+        except msgspec.DecodeError:
+            rsp_cd = ""
+        if rsp_cd:
+            return rsp_cd
+        if response.status_code != 200:
+            return f"HTTP{response.status_code}"
+    return type(error).__name__
+
+
+class XingMetrics:
+    """Per-TR latency/throttle histograms and byte, row and error counters."""
+
+    def __init__(self):
+        self.trs: Dict[str, TrMetrics] = {}
+
+    def tr(self, tr_code: str) -> TrMetrics:
+        metrics = self.trs.get(tr_code)
+        if metrics is None:
+            metrics = self.trs[tr_code] = TrMetrics()
+        return metrics
+
+    def observe_call(self, tr_code: str, latency_sec: float, response_bytes: int, rows: int) -> None:
+        metrics = self.tr(tr_code)
+        metrics.latency.observe(latency_sec)
+        metrics.response_bytes += response_bytes
+        metrics.rows += rows
+
+    def observe_error(self, tr_code: str, latency_sec: float, response, error: BaseException) -> None:
+        metrics = self.tr(tr_code)
+        metrics.latency.observe(latency_sec)
+        if response is not None:
+            metrics.response_bytes += len(response.content)
+        metrics.errors[error_code(response, error)] += 1
+
+    def observe_throttle(self, tr_code: str, wait_sec: float) -> None:
+        self.tr(tr_code).throttle_wait.observe(wait_sec)
+
+    def observe_coalesced(self, tr_code: str) -> None:
+        self.tr(tr_code).coalesced += 1
+
+    def observe_cache(self, tr_code: str, result: str) -> None:
+        self.tr(tr_code).cache[result] += 1
+
+    def reset(self) -> None:
+        self.trs.clear()
+
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+
+        def histogram(name: str, help_text: str, attribute: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for tr_code, metrics in sorted(self.trs.items()):
+                values: Histogram = getattr(metrics, attribute)
+                for bound, count in values.cumulative():
+                    lines.append(f'{name}_bucket{{tr_code="{tr_code}",le="{bound}"}} {count}')
+                lines.append(f'{name}_sum{{tr_code="{tr_code}"}} {values.sum!r}')
+                lines.append(f'{name}_count{{tr_code="{tr_code}"}} {values.count}')
+
+        def counter(name: str, help_text: str, attribute: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for tr_code, metrics in sorted(self.trs.items()):
+                lines.append(f'{name}{{tr_code="{tr_code}"}} {getattr(metrics, attribute)}')
+
+        histogram("xing_tr_request_duration_seconds", "Xing TR call latency, request and decoding.", "latency")
+        histogram("xing_tr_throttle_wait_seconds", "Time Xing TR calls waited for a rate-limit slot.", "throttle_wait")
+        counter("xing_tr_response_bytes_total", "Bytes of Xing TR response bodies.", "response_bytes")
+        counter("xing_tr_rows_total", "OutBlock rows decoded from Xing TR responses.", "rows")
+        counter("xing_tr_coalesced_total", "Xing TR calls served by an identical call in flight.", "coalesced")
+        lines.append("# HELP xing_tr_errors_total Failed Xing TR calls by rsp_cd (or exception).")
+        lines.append("# TYPE xing_tr_errors_total counter")
+        for tr_code, metrics in sorted(self.trs.items()):
+            for rsp_cd, count in sorted(metrics.errors.items()):
+                lines.append(f'xing_tr_errors_total{{tr_code="{tr_code}",rsp_cd="{rsp_cd}"}} {count}')
+        lines.append("# HELP xing_tr_cache_lookups_total Xing response cache lookups by result.")
+        lines.append("# TYPE xing_tr_cache_lookups_total counter")
+        for tr_code, metrics in sorted(self.trs.items()):
+            for result, count in sorted(metrics.cache.items()):
+                lines.append(f'xing_tr_cache_lookups_total{{tr_code="{tr_code}",result="{result}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> List[dict]:
+        """Per-TR totals; the latency quantiles are histogram bucket bounds."""
+        return [
+            {
+                "tr_code": tr_code,
+                "calls": metrics.latency.count,
+                "errors": sum(metrics.errors.values()),
+                "coalesced": metrics.coalesced,
+                "cache_lookups": sum(metrics.cache.values()),
+                "cache_hit_ratio": (
+                    (sum(metrics.cache.values()) - metrics.cache["miss"]) / sum(metrics.cache.values())
+                    if metrics.cache else 0.0
+                ),
+                "p50_sec": metrics.latency.quantile(0.5),
+                "p99_sec": metrics.latency.quantile(0.99),
+                "max_sec": metrics.latency.max,
+                "throttle_sec": metrics.throttle_wait.sum,
+                "rows": metrics.rows,
+                "bytes": metrics.response_bytes,
+                "error_codes": dict(metrics.errors),
+            }
+            for tr_code, metrics in sorted(self.trs.items())
+        ]
+
+    def summary_lines(self) -> List[str]:
+        """A table of ``summary()`` for printing after a batch job."""
+        lines = [
+            f"{'tr_code':<10} {'calls':>6} {'err':>5} {'saved':>6} {'hit %':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+            f"{'throttle s':>10} {'rows':>9} {'MB':>8}  error codes"
+        ]
+        for row in self.summary():
+            codes = ", ".join(f"{code}={count}" for code, count in sorted(row["error_codes"].items()))
+            lines.append(
+                f"{row['tr_code']:<10} {row['calls']:>6} {row['errors']:>5} {row['coalesced']:>6} "
+                f"{format(row['cache_hit_ratio'] * 100, '.1f') if row['cache_lookups'] else '-':>6} "
+                f"{row['p50_sec'] * 1000:>8.1f} {row['p99_sec'] * 1000:>8.1f} {row['max_sec'] * 1000:>8.1f} "
+                f"{row['throttle_sec']:>10.2f} "
+                f"{row['rows']:>9} {row['bytes'] / 2**20:>8.2f}  {codes}"
+            )
+        return lines
+
+
+XING_METRICS = XingMetrics()
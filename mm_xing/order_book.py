@@ -0,0 +1,132 @@
+"""Array-backed order books for the realtime quote TRs (FH0/OH0/OVH/WOH).
+
+Every quote message is a full 5-level snapshot. ``OrderBook.apply`` copies
+its prices and quantities into the book's preallocated ``(4, depth)`` array
+in place (rows: ask price, bid price, ask qty, bid qty) and compares the top
+of book with the previous one; derived values (mid, spread, imbalance,
+microprice) are only computed when read. ``OrderBookEngine`` keeps one book
+per symbol and publishes a ``TopOfBook`` event only when the best bid/ask
+price or quantity actually moved.
+"""
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional
+
+import msgspec
+import numpy as np
+
+QUOTE_LEVELS = 5
+QUOTE_TRS = ("FH0", "OH0", "OVH", "WOH")
+
+ASK_PX, BID_PX, ASK_QTY, BID_QTY = range(4)
+
+# One getter per quote TR returning (ask px 1..n, bid px 1..n, ask qty 1..n, bid qty 1..n)
+QUOTE_GETTERS = {
+    tr_code: attrgetter(
+        *(f"offerho{i}" for i in range(1, QUOTE_LEVELS + 1)),
+        *(f"bidho{i}" for i in range(1, QUOTE_LEVELS + 1)),
+        *(f"offerrem{i}" for i in range(1, QUOTE_LEVELS + 1)),
+        *(f"bidrem{i}" for i in range(1, QUOTE_LEVELS + 1)),
+    )
+    for tr_code in QUOTE_TRS
+}
+
+
+class TopOfBook(msgspec.Struct, frozen=True, gc=False):
+    symbol: str
+    hotime: str
+    bid: float
+    ask: float
+    bid_qty: int
+    ask_qty: int
+
+
+class OrderBook:
+    """Book of one symbol, updated in place from full-depth quote snapshots."""
+
+    __slots__ = ("symbol", "depth", "levels", "_flat", "bid", "ask", "bid_qty", "ask_qty", "hotime", "updates")
+
+    def __init__(self, symbol: str, depth: int = QUOTE_LEVELS):
+        self.symbol = symbol
+        self.depth = depth
+        self.levels = np.zeros((4, depth), np.float64)
+        self._flat = self.levels.reshape(-1)  # view used for the in-place copy
+        self.bid = self.ask = 0.0
+        self.bid_qty = self.ask_qty = 0
+        self.hotime = ""
+        self.updates = 0
+
+    def apply(self, values: tuple, hotime: str = "") -> bool:
+        """Load a snapshot laid out as ``QUOTE_GETTERS`` returns it; True if the top moved."""
+        self._flat[:] = values
+        d = self.depth
+        ask, bid, ask_qty, bid_qty = values[0], values[d], values[2 * d], values[3 * d]
+        self.hotime = hotime
+        self.updates += 1
+        if ask == self.ask and bid == self.bid and ask_qty == self.ask_qty and bid_qty == self.bid_qty:
+            return False
+        self.ask, self.bid, self.ask_qty, self.bid_qty = ask, bid, ask_qty, bid_qty
+        return True
+
+    @property
+    def mid(self) -> float:
+        return (self.bid + self.ask) / 2
+
+    @property
+    def spread(self) -> float:
+        return self.ask - self.bid
+
+    @property
+    def microprice(self) -> float:
+        """Quantity-weighted mid: leans towards the side with less resting size."""
+        total = self.bid_qty + self.ask_qty
+        return (self.ask * self.bid_qty + self.bid * self.ask_qty) / total if total else self.mid
+
+    def imbalance(self, levels: Optional[int] = None) -> float:
+        """(bid qty - ask qty) / (bid qty + ask qty) over the top ``levels`` (all by default)."""
+        n = levels or self.depth
+        bid_qty = float(self.levels[BID_QTY, :n].sum())
+        ask_qty = float(self.levels[ASK_QTY, :n].sum())
+        total = bid_qty + ask_qty
+        return (bid_qty - ask_qty) / total if total else 0.0
+
+    def top(self) -> TopOfBook:
+        return TopOfBook(self.symbol, self.hotime, self.bid, self.ask, self.bid_qty, self.ask_qty)
+
+
+class OrderBookEngine:
+    """Order books keyed by symbol, fed from realtime quote messages.
+
+    Example:
+        >>> engine = OrderBookEngine()
+        >>> engine.subscribe(lambda top: print(top.symbol, top.bid, top.ask))
+        >>> async for message in client:  # XingRealtimeClient
+        ...     engine.apply_message(message)
+    """
+
+    def __init__(self):
+        self.books: Dict[str, OrderBook] = {}
+        self.listeners: List[Callable[[TopOfBook], None]] = []
+        self.events = 0
+
+    def subscribe(self, listener: Callable[[TopOfBook], None]) -> None:
+        self.listeners.append(listener)
+
+    def book(self, symbol: str) -> OrderBook:
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = OrderBook(symbol)
+        return book
+
+    def apply_message(self, message) -> Optional[TopOfBook]:
+        """Apply a quote ``RealtimeMessage``; returns the new top of book if it moved."""
+        getter = QUOTE_GETTERS.get(message.tr_code)
+        if getter is None:
+            return None
+        book = self.book(message.tr_key)
+        if not book.apply(getter(message.body), message.body.hotime):
+            return None
+        top = book.top()
+        self.events += 1
+        for listener in self.listeners:
+            listener(top)
+        return top
@@ -0,0 +1,172 @@
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from mm_xing.constant import (PRIORITY_INTERACTIVE, XING_DEFAULT_TR_RATE_LIMIT,
+                              XING_PATH_RATE_LIMITS, XING_TR_RATE_LIMITS)
+from mm_xing.metrics import XING_METRICS
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens/sec, holding at most ``capacity``.
+
+    The default capacity of 1 spaces calls evenly (no bursts), which keeps any
+    one-second window within the limit as the Xing gateway counts it.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay(self, now: Optional[float] = None) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        self._refill(time.monotonic() if now is None else now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+@dataclass
+class RateLimitStats:
+    """Queue wait time of the calls admitted for one (TR code, priority)."""
+    requests: int = 0
+    total_wait_sec: float = 0.0
+    max_wait_sec: float = 0.0
+
+    @property
+    def mean_wait_sec(self) -> float:
+        return self.total_wait_sec / self.requests if self.requests else 0.0
+
+    def record(self, wait_sec: float) -> None:
+        self.requests += 1
+        self.total_wait_sec += wait_sec
+        self.max_wait_sec = max(self.max_wait_sec, wait_sec)
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tr_code: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class _PathGroup:
+    """Waiters sharing one URL path, dispatched in (priority, arrival) order."""
+
+    def __init__(self, bucket: Optional[TokenBucket]):
+        self.bucket = bucket
+        self.waiters: List[_Waiter] = []
+        self.wakeup = asyncio.Event()
+        self.pump: Optional[asyncio.Task] = None
+
+
+class XingRateLimiter:
+    """Per-TR token-bucket scheduler for Xing REST calls.
+
+    Each call must take a token from its TR code's bucket and, when the URL
+    path has a limit of its own, from the path's bucket. Waiters of a path are
+    served lowest ``priority`` first (``PRIORITY_INTERACTIVE`` before
+    ``PRIORITY_BATCH``); a waiter whose TR bucket is empty does not hold up
+    waiters of other TRs behind it.
+    """
+
+    def __init__(
+        self,
+        tr_limits: Optional[Dict[str, float]] = None,
+        path_limits: Optional[Dict[str, float]] = None,
+        default_tr_limit: float = XING_DEFAULT_TR_RATE_LIMIT,
+    ):
+        self.tr_limits = {**XING_TR_RATE_LIMITS, **(tr_limits or {})}
+        self.path_limits = {**XING_PATH_RATE_LIMITS, **(path_limits or {})}
+        self.default_tr_limit = default_tr_limit
+        self.stats: Dict[Tuple[str, int], RateLimitStats] = {}
+        self._tr_buckets: Dict[str, TokenBucket] = {}
+        self._groups: Dict[str, _PathGroup] = {}
+        self._seq = itertools.count()
+
+    def tr_bucket(self, tr_code: str) -> TokenBucket:
+        bucket = self._tr_buckets.get(tr_code)
+        if bucket is None:
+            bucket = TokenBucket(self.tr_limits.get(tr_code, self.default_tr_limit))
+            self._tr_buckets[tr_code] = bucket
+        return bucket
+
+    def _group(self, path: str) -> _PathGroup:
+        group = self._groups.get(path)
+        if group is None:
+            limit = self.path_limits.get(path)
+            group = _PathGroup(TokenBucket(limit) if limit else None)
+            self._groups[path] = group
+        return group
+
+    async def acquire(self, tr_code: str, path: str, priority: int = PRIORITY_INTERACTIVE) -> float:
+        """Wait for a slot to call ``tr_code`` on ``path``; return the time spent queued."""
+        loop = asyncio.get_running_loop()
+        group = self._group(path)
+        waiter = _Waiter(priority, next(self._seq), tr_code, time.monotonic(), loop.create_future())
+        heapq.heappush(group.waiters, waiter)
+        if group.pump is None or group.pump.done():
+            group.pump = loop.create_task(self._pump(group))
+        else:
+            group.wakeup.set()
+        await waiter.future
+        wait_sec = time.monotonic() - waiter.enqueued_at
+        self.stats.setdefault((tr_code, priority), RateLimitStats()).record(wait_sec)
+        XING_METRICS.observe_throttle(tr_code, wait_sec)
+        return wait_sec
+
+    async def _pump(self, group: _PathGroup) -> None:
+        while group.waiters:
+            now = time.monotonic()
+            path_delay = group.bucket.delay(now) if group.bucket else 0.0
+            next_delay = path_delay
+            if path_delay == 0:
+                next_delay = float("inf")
+                for waiter in sorted(group.waiters):
+                    if waiter.future.done():  # cancelled while queued
+                        continue
+                    tr_delay = self.tr_bucket(waiter.tr_code).delay(now)
+                    if tr_delay == 0:
+                        self.tr_bucket(waiter.tr_code).take()
+                        if group.bucket:
+                            group.bucket.take()
+                        waiter.future.set_result(None)
+                        next_delay = 0
+                        break
+                    next_delay = min(next_delay, tr_delay)
+                group.waiters = [w for w in group.waiters if not w.future.done()]
+                heapq.heapify(group.waiters)
+                if not group.waiters:
+                    break
+            if next_delay > 0:
+                group.wakeup.clear()
+                try:
+                    await asyncio.wait_for(group.wakeup.wait(), timeout=next_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    def summary(self) -> List[dict]:
+        return [
+            {
+                "tr_code": tr_code,
+                "priority": priority,
+                "requests": stats.requests,
+                "mean_wait_sec": stats.mean_wait_sec,
+                "max_wait_sec": stats.max_wait_sec,
+            }
+            for (tr_code, priority), stats in sorted(self.stats.items())
+        ]
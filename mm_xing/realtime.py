@@ -0,0 +1,214 @@
+"""Realtime Xing websocket feed.
+
+Frames look like::
+
+    {"header": {"tr_cd": "FH0", "tr_key": "101V3000"}, "body": {"hotime": "090001", ...}}
+
+Each TR gets one prebuilt ``msgspec.json.Decoder`` of a ``{header, body}``
+frame struct whose body is the TR's ``mm_xing.block_struct`` OutBlock, so a
+frame is decoded in a single pass straight into a frozen struct. The TR code
+is found with a substring search on the raw frame rather than a second
+decode.
+"""
+import asyncio
+import logging
+import random
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Set, TextIO, Tuple, Union
+
+import msgspec
+import websockets
+
+from mm_xing.block_struct import QUERY_MAP as STRUCT_QUERY_MAP
+from mm_xing.block_struct import load_tr
+from mm_xing.constant import (SUBSCRIBE, UNSUBSCRIBE, XING_WEBSOCKET_MAX_FRAME_BYTES,
+                              XING_WEBSOCKET_PING_INTERVAL_SEC,
+                              XING_WEBSOCKET_RECONNECT_MAX_SEC,
+                              XING_WEBSOCKET_RECONNECT_MIN_SEC,
+                              XING_WEBSOCKET_URL)
+
+logger = logging.getLogger(__name__)
+
+Frame = Union[str, bytes]
+
+SUCCESS_CODES = ("00000", "00001")
+
+
+class RealtimeHeader(msgspec.Struct, frozen=True, gc=False):
+    tr_cd: str = ''
+    tr_key: str = ''
+    tr_type: str = ''
+    rsp_cd: str = ''
+    rsp_msg: str = ''
+
+
+class RealtimeMessage(msgspec.Struct, frozen=True, gc=False):
+    tr_code: str
+    tr_key: str
+    body: Any
+
+
+class _ControlFrame(msgspec.Struct, frozen=True):
+    header: RealtimeHeader = RealtimeHeader()
+
+
+_control_decoder = msgspec.json.Decoder(_ControlFrame)
+_request_encoder = msgspec.json.Encoder()
+
+
+@lru_cache(maxsize=None)
+def get_frame_decoder(tr_code: str) -> msgspec.json.Decoder:
+    """Return the (cached) decoder of ``tr_code``'s realtime frames.
+
+    Feed values arrive as strings; ``strict=False`` coerces them to the
+    OutBlock's int/float fields.
+    """
+    outblock = getattr(load_tr(tr_code), f"{tr_code}OutBlock")
+    frame = msgspec.defstruct(
+        f"{tr_code}Frame",
+        [("header", RealtimeHeader, RealtimeHeader()), ("body", Optional[outblock], None)],
+        frozen=True,
+    )
+    return msgspec.json.Decoder(frame, strict=False)
+
+
+def frame_tr_code(frame: Frame) -> str:
+    """Read ``header.tr_cd`` of a raw frame without decoding it."""
+    if isinstance(frame, str):
+        start = frame.find('"tr_cd":"')
+        if start >= 0:
+            start += 9
+            return frame[start:frame.find('"', start)]
+    else:
+        start = frame.find(b'"tr_cd":"')
+        if start >= 0:
+            start += 9
+            return frame[start:frame.find(b'"', start)].decode()
+    return _control_decoder.decode(frame).header.tr_cd
+
+
+def decode_frame(frame: Frame) -> Tuple[RealtimeHeader, Any]:
+    """Decode a raw frame into its header and typed OutBlock (``None`` for acks)."""
+    tr_code = frame_tr_code(frame)
+    if tr_code not in STRUCT_QUERY_MAP:
+        return _control_decoder.decode(frame).header, None
+    decoded = get_frame_decoder(tr_code).decode(frame)
+    return decoded.header, decoded.body
+
+
+class XingRealtimeClient:
+    """Asyncio subscriber of the Xing realtime feed.
+
+    Subscriptions are remembered and replayed after a reconnect, so consumers
+    just iterate::
+
+        client = XingRealtimeClient()
+        await client.subscribe("FH0", "101V3000")
+        async for message in client:
+            book.apply(message.body)
+
+    Args:
+        token_provider: Coroutine function returning the bearer token
+            (default: the shared ``XingTokenManager``)
+        url: Websocket endpoint
+        record: Optional text file every raw frame is appended to, one per
+            line, for replaying later (see ``mm_xing.benchmarks.realtime``)
+    """
+
+    def __init__(
+        self,
+        token_provider: Optional[Callable[[], Awaitable[str]]] = None,
+        url: str = XING_WEBSOCKET_URL,
+        record: Optional[TextIO] = None,
+    ):
+        if token_provider is None:
+            from mm_xing.tasks.master import get_token_manager
+            token_provider = get_token_manager().get_access_token
+        self.url = url
+        self.record = record
+        self.subscriptions: Set[Tuple[str, str]] = set()
+        self.received = 0
+        self.reconnects = 0
+        self._token_provider = token_provider
+        self._ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._connect_lock = asyncio.Lock()
+        self._closed = False
+
+    async def _send(self, tr_type: str, tr_code: str, tr_key: str) -> None:
+        token = await self._token_provider()
+        request = {"header": {"token": token, "tr_type": tr_type}, "body": {"tr_cd": tr_code, "tr_key": tr_key}}
+        await self._ws.send(_request_encoder.encode(request).decode())
+
+    async def connect(self) -> None:
+        """Open the connection (if needed) and (re)subscribe everything."""
+        async with self._connect_lock:
+            if self._ws is not None and self._ws.open:
+                return
+            delay = XING_WEBSOCKET_RECONNECT_MIN_SEC
+            while True:
+                try:
+                    self._ws = await websockets.connect(
+                        self.url,
+                        ping_interval=XING_WEBSOCKET_PING_INTERVAL_SEC,
+                        max_size=XING_WEBSOCKET_MAX_FRAME_BYTES,
+                        compression=None,
+                    )
+                    for tr_code, tr_key in sorted(self.subscriptions):
+                        await self._send(SUBSCRIBE, tr_code, tr_key)
+                    return
+                except (OSError, websockets.WebSocketException) as e:
+                    logger.warning("Connecting to %s failed (%s); retrying in %.0fs", self.url, e, delay)
+                    await asyncio.sleep(delay * (0.5 + random.random()))
+                    delay = min(delay * 2, XING_WEBSOCKET_RECONNECT_MAX_SEC)
+
+    async def subscribe(self, tr_code: str, tr_key: str) -> None:
+        if tr_code not in STRUCT_QUERY_MAP:
+            raise KeyError(f"Unknown realtime TR code: {tr_code}")
+        get_frame_decoder(tr_code)  # build the decoder before frames arrive
+        self.subscriptions.add((tr_code, tr_key))
+        if self._ws is None or not self._ws.open:
+            await self.connect()  # subscribes everything, including this one
+        else:
+            await self._send(SUBSCRIBE, tr_code, tr_key)
+
+    async def unsubscribe(self, tr_code: str, tr_key: str) -> None:
+        self.subscriptions.discard((tr_code, tr_key))
+        if self._ws is not None and self._ws.open:
+            await self._send(UNSUBSCRIBE, tr_code, tr_key)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+    async def frames(self) -> AsyncIterator[Frame]:
+        """Yield raw frames, reconnecting (and resubscribing) when the connection drops."""
+        while not self._closed:
+            if self._ws is None or not self._ws.open:
+                await self.connect()
+            try:
+                async for frame in self._ws:
+                    if self.record is not None:
+                        self.record.write(frame if isinstance(frame, str) else frame.decode())
+                        self.record.write("\n")
+                    yield frame
+            except websockets.ConnectionClosedError as e:
+                logger.info("Realtime connection lost (%s); reconnecting", e)
+            if self._closed:
+                return
+            self.reconnects += 1
+            self._ws = None
+
+    async def __aiter__(self) -> AsyncIterator[RealtimeMessage]:
+        """Yield decoded feed messages; acks are consumed, rejected requests are reported."""
+        async for frame in self.frames():
+            header, body = decode_frame(frame)
+            if body is None:
+                if header.rsp_cd and header.rsp_cd not in SUCCESS_CODES:
+                    logger.warning("Realtime request %s/%s rejected: %s %s", header.tr_cd, header.tr_key, header.rsp_cd, header.rsp_msg)
+                    # Do not replay a rejected subscription on reconnect.
+                    self.subscriptions.discard((header.tr_cd, header.tr_key))
+                continue
+            self.received += 1
+            yield RealtimeMessage(header.tr_cd, header.tr_key, body)
@@ -1,11 +1,20 @@
 import argparse
+import hashlib
 import os
 import sys
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-import clipboard
+import msgspec
+
+from mm_xing.constant import XING_RES_CACHE_PATH
+
+# Bump when parse_res output changes so cached specs are re-parsed.
+RES_CACHE_VERSION = 1
+# Below this many files to parse a process pool costs more than it saves.
+PARALLEL_PARSE_MIN_FILES = 32
 
 
 def readline_until_not_empty(f):
@@ -88,13 +97,21 @@ def parse_res(filepath, include_human_readable_info=True, print_as_pythonclass=F
 
             line = readline_until_not_empty(f)
             args = []
+            codes = set()
             while not case_insensitive_compare(line, "end"):
                 contents = clean_strip(line)
-                arg = {"code": contents[1]}
+                code = contents[1]
+                if code in codes:
+                    # A few blocks repeat a code (e.g. C01 mem_filler); the
+                    # field's own name in the third column tells them apart.
+                    code = contents[2] if contents[2] not in codes else f"{code}{len(codes)}"
+                codes.add(code)
+                arg = {"code": code}
                 if include_human_readable_info:
                     arg.update(
                         {
-                            "desc": contents[0],
+                            # Descriptions end up inside quoted literals of the generated code.
+                            "desc": contents[0].replace("'", "").replace('"', ""),
                             "type": contents[3],
                             "length": contents[4],
                         },
@@ -112,135 +129,413 @@ def parse_res(filepath, include_human_readable_info=True, print_as_pythonclass=F
         return ret
 
 
-def create_pydantic_model(res_infos: List[dict]):
-    statement = f"# Generated by res_converter.py - make_tr_order_model  {datetime.now().isoformat()}"
-    statement += """
-from typing import List
+def list_res_files(path: str) -> List[str]:
+    """The ``.res`` files of ``path`` the generators use (``_``-suffixed variants are skipped)."""
+    return sorted(
+        os.path.join(path, file_name)
+        for file_name in os.listdir(path)
+        if os.path.isfile(os.path.join(path, file_name)) and "_" not in file_name
+    )
+
+
+class _CachedSpec(msgspec.Struct, gc=False):
+    mtime_ns: int
+    size: int
+    sha1: str
+    res: dict
+
+
+class _SpecCache(msgspec.Struct):
+    version: int = RES_CACHE_VERSION
+    specs: Dict[str, _CachedSpec] = {}
+
+
+def _file_sha1(filepath: str) -> str:
+    with open(filepath, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def load_res_infos(
+    path: str,
+    cache_path: Optional[str] = XING_RES_CACHE_PATH,
+    workers: Optional[int] = None,
+) -> Tuple[List[dict], int]:
+    """Parse every ``.res`` file of ``path``, reusing the cached specs of unchanged files.
+
+    The cache (a msgpack index at ``cache_path``) maps each file to its
+    parsed spec together with its mtime, size and sha1: a file whose mtime
+    and size are unchanged is not read at all, one whose content hashes the
+    same is not re-parsed. Files that do need parsing are spread over a
+    process pool when there are enough of them.
+
+    Args:
+        path: Directory of the ``.res`` files
+        cache_path: Index file, ``None`` to parse everything without a cache
+        workers: Process pool size (default: ``os.cpu_count()``), 1 to parse serially
+
+    Returns:
+        The specs ordered by TR code (as ``create_res_file_mapping`` keys
+        them) and the number of files that had to be parsed.
+    """
+    cache = _SpecCache()
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            try:
+                cache = msgspec.msgpack.decode(f.read(), type=_SpecCache)
+            except msgspec.DecodeError:
+                cache = _SpecCache()
+        if cache.version != RES_CACHE_VERSION:
+            cache = _SpecCache()
+
+    specs: Dict[str, _CachedSpec] = {}
+    to_parse: List[Tuple[str, os.stat_result, str]] = []
+    for filepath in list_res_files(path):
+        stat = os.stat(filepath)
+        cached = cache.specs.get(filepath)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            specs[filepath] = cached
+            continue
+        sha1 = _file_sha1(filepath)
+        if cached is not None and cached.sha1 == sha1:
+            specs[filepath] = _CachedSpec(stat.st_mtime_ns, stat.st_size, sha1, cached.res)
+            continue
+        to_parse.append((filepath, stat, sha1))
+
+    filepaths = [filepath for filepath, _, _ in to_parse]
+    if workers != 1 and len(to_parse) >= PARALLEL_PARSE_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_res, filepaths, chunksize=16))
+    else:
+        parsed = [parse_res(filepath) for filepath in filepaths]
+    for (filepath, stat, sha1), res in zip(to_parse, parsed):
+        specs[filepath] = _CachedSpec(stat.st_mtime_ns, stat.st_size, sha1, res)
+
+    if cache_path and (to_parse or len(specs) != len(cache.specs)):
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        with open(f"{cache_path}.tmp", "wb") as f:
+            f.write(msgspec.msgpack.encode(_SpecCache(specs=specs)))
+        os.replace(f"{cache_path}.tmp", cache_path)
+
+    res_map = create_res_file_mapping([spec.res for spec in specs.values()])
+    return [res_map[tr_code] for tr_code in sorted(res_map)], len(to_parse)
+
+
+def write_module(path: str, header: str, body: str) -> bool:
+    """Write ``header + body`` to ``path`` unless it already holds ``body``.
+
+    Generated headers carry a timestamp, so only what follows them is
+    compared; unchanged modules keep their mtime (and their ``.pyc``).
+
+    Returns:
+        True if the file was written.
+    """
+    header_lines = header.count("\n")
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            existing = f.read().split("\n", header_lines)
+        if len(existing) > header_lines and existing[header_lines] == body:
+            return False
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(header + body)
+    return True
+
+
+PYDANTIC_BLOCK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "block")
+
+
+def create_pydantic_region(res: dict):
+    """Render the ``# region`` of pydantic classes for a single TR.
+
+    Returns the source text together with the class names it defines so the
+    caller can build the lazy-loading name index.
+    """
+    class_names = []
+    statement = (
+        f"# region <{res['header']['tr_code']} - {res['header']['desc']}>\n"
+    )
+    # Class 1: MMDAQ91200InBlock1
+    for block in res["block"]:
+        block_name = block["bname"]
+        if len(block["args"]) > 0:
+            if len(res["header"]["tr_code"]) == 3:
+                # SC0, HC1 같은 주문 관련 realtime tr들
+                class_name = f"{res['header']['tr_code']}{block_name}"
+            else:
+                class_name = block_name
+            class_names.append(class_name)
+            statement += f"class {class_name}(BaseModel):\n"
+            for arg in block["args"]:
+                if arg["type"] in ["float", "double"]:
+                    statement += f"    {arg['code']}: float = Field(description='{arg['desc']}', default=0.0)\n"
+                elif arg["type"] == "long":
+                    statement += f"    {arg['code']}: int = Field(description='{arg['desc']}', default=0)\n"
+                else:
+                    statement += f"    {arg['code']}: str = Field(description='{arg['desc']}', default='')\n"
+            statement += "\n\n"
+    statement += "\n"
+
+    # Class 2: MMDAQ91200
+    def create_parent_base_model(bname, bname_lower, is_occurs):
+        _statement = ""
+        if is_occurs:
+            _statement += f"    {bname_lower}: List[{bname}]"
+        else:
+            _statement += f"    {bname_lower}: {bname}"
+        _statement += f" = Field(description='{bname}') \n"
+        return _statement
+
+    class_names.append(res["header"]["tr_code"])
+    statement += f"# {res['header']['desc']} \n"
+    statement += f"class {res['header']['tr_code']}(BaseModel):\n"
+    for block in res["block"]:
+        block_name = block["bname"]
+        if len(res["header"]["tr_code"]) == 3:
+            # SC0, HC1 같은 주문 관련 realtime tr들
+            class_name = f"{res['header']['tr_code']}{block_name}"
+        else:
+            class_name = block_name
+
+        if "OutBlock3" in block["bname"]:
+            statement += create_parent_base_model(
+                class_name,
+                "outblock3",
+                block["is_occurs"],
+            )
+        elif "OutBlock2" in block["bname"]:
+            statement += create_parent_base_model(
+                class_name,
+                "outblock2",
+                block["is_occurs"],
+            )
+        elif "OutBlock1" in block["bname"]:
+            statement += create_parent_base_model(
+                class_name,
+                "outblock1",
+                block["is_occurs"],
+            )
+        elif "OutBlock" in block["bname"]:
+            statement += create_parent_base_model(
+                class_name,
+                "outblock",
+                block["is_occurs"],
+            )
+        elif "InBlock1" in block["bname"]:
+            if len(block["args"]) > 0:
+                statement += (
+                    f"    inblock1: {res['header']['tr_code']}InBlock1 = "
+                    f"Field(description='{res['header']['tr_code']}InBlock1') \n"
+                )
+        elif "InBlock" in block["bname"]:
+            if len(block["args"]) > 0:
+                statement += (
+                    f"    inblock: {res['header']['tr_code']}InBlock = "
+                    f"Field(description='{res['header']['tr_code']}InBlock') \n"
+                )
+    statement += (
+        " " * 4
+        + f"metadata: dict = Field(description='The metadata information for {res['header']['tr_code']}', \
+default_factory=lambda : dict())\n"
+    )
+    statement += "# endregion\n"
+    return statement, class_names
 
-from pydantic import Field, BaseModel
 
-"""
-    outblock_names = []
+def create_outblock_map(res_infos: List[dict]) -> dict:
     outblock_maps = defaultdict(set)
-    inblock_names = []
-
     for res in res_infos:
-        # Class 1: MMDAQ91200InBlock1
-        statement += (
-            f"# region <{res['header']['tr_code']} - {res['header']['desc']}>\n"
-        )
         for block in res["block"]:
             block_name = block["bname"]
-            if "OutBlock" in block["bname"]:
-                outblock_names.append(block_name)
-            elif "InBlock" in block["bname"]:
-                inblock_names.append(block_name)
+            if "OutBlock" not in block_name:
+                continue
+            if len(res["header"]["tr_code"]) == 3:
+                # SC0, HC1 같은 주문 관련 realtime tr들
+                outblock_maps[res["header"]["tr_code"]].add(f"{res['header']['tr_code']}{block_name}")
+            else:
+                outblock_maps[res["header"]["tr_code"]].add(block_name)
+    return dict(outblock_maps)
 
-            if len(block["args"]) > 0:
-                if len(res["header"]["tr_code"]) == 3:
-                    # SC0, HC1 같은 주문 관련 realtime tr들
-                    class_name = f"{res['header']['tr_code']}{block_name}"
-                else:
-                    class_name = block_name
-                statement += f"class {class_name}(BaseModel):\n"
-                for arg in block["args"]:
-                    if arg["type"] in ["float", "double"]:
-                        statement += f"    {arg['code']}: float = Field(description='{arg['desc']}', default=0.0)\n"
-                    elif arg["type"] == "long":
-                        statement += f"    {arg['code']}: int = Field(description='{arg['desc']}', default=0)\n"
-                    else:
-                        statement += f"    {arg['code']}: str = Field(description='{arg['desc']}', default='')\n"
-                statement += "\n\n"
-        statement += "\n"
 
-        # Class 2: MMDAQ91200
-        def create_parent_base_model(bname, bname_lower, is_occurs):
-            _statement = ""
-            if is_occurs:
-                _statement += f"    {bname_lower}: List[{bname}]"
-            else:
-                _statement += f"    {bname_lower}: {bname}"
-            _statement += f" = Field(description='{bname}') \n"
-            return _statement
+def format_outblock_map(outblock_map: dict) -> str:
+    """Source of a ``{tr_code: {outblock, ...}}`` literal with sorted sets.
 
-        statement += f"# {res['header']['desc']} \n"
-        statement += f"class {res['header']['tr_code']}(BaseModel):\n"
-        for block in res["block"]:
-            block_name = block["bname"]
+    A set's repr order varies between runs, which would make every
+    regeneration rewrite the module.
+    """
+    statement = "{\n"
+    for tr_code, outblocks in outblock_map.items():
+        statement += f"    '{tr_code}': {{{', '.join(repr(name) for name in sorted(outblocks))}}},\n"
+    statement += "}\n"
+    return statement
+
+
+def write_index_module(output_dir: str, header: str, res_infos: List[dict], block_index: dict) -> Optional[str]:
+    """Write the ``_index.py`` name index of a generated per-TR block package.
+
+    Returns:
+        Its path, or None if it was already up to date.
+    """
+    statement = "\n"
+    statement += "QUERY_DESC = {\n"
+    for res in res_infos:
+        statement += f"    '{res['header']['tr_code']}': '{res['header']['desc']}',\n"
+    statement += "}\n"
+    statement += "\n"
+    statement += "BLOCK_INDEX = {\n"
+    for class_name, tr_code in block_index.items():
+        statement += f"    '{class_name}': '{tr_code}',\n"
+    statement += "}\n"
+    statement += "\n"
+    statement += f"QUERY_OUTBLOCK_MAP = {format_outblock_map(create_outblock_map(res_infos))}"
+
+    path = os.path.join(output_dir, "_index.py")
+    return path if write_module(path, header, statement) else None
+
+
+def create_pydantic_model(res_infos: List[dict], output_dir: str = PYDANTIC_BLOCK_DIR) -> List[str]:
+    """Generate the ``mm_xing.block`` package: one ``_<tr_code>.py`` module per TR
+    plus the ``_index.py`` name index that ``mm_xing.block.__getattr__`` resolves
+    lazily against.
+
+    Only modules whose generated code changed are rewritten.
+
+    Returns:
+        The paths of the written files.
+    """
+    header = f"# type: ignore\n# Generated by res_converter.py - create_pydantic_model  {datetime.now().isoformat()}\n"
+    os.makedirs(output_dir, exist_ok=True)
+
+    written = []
+    block_index = OrderedDict()
+    for res in res_infos:
+        tr_code = res["header"]["tr_code"]
+        region, class_names = create_pydantic_region(res)
+        for class_name in class_names:
+            block_index[class_name] = tr_code
+
+        statement = ""
+        if "List[" in region:
+            statement += "from typing import List\n\n"
+        statement += "from pydantic import BaseModel, Field\n\n\n"
+        statement += region
+
+        path = os.path.join(output_dir, f"_{tr_code}.py")
+        if write_module(path, header, statement):
+            written.append(path)
+
+    index_path = write_index_module(output_dir, header, res_infos, block_index)
+    return written + [index_path] if index_path else written
+
+
+MSGSPEC_BLOCK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "block_struct")
+
+
+def create_msgspec_region(res: dict):
+    """Render the ``# region`` of msgspec structs for a single TR.
+
+    The TR-level struct mirrors the REST response envelope
+    (``{"rsp_cd": ..., "rsp_msg": ..., "t8436OutBlock": [...]}``, exposed as
+    ``outblock``/``outblock1``/... like the pydantic models) so a whole
+    response decodes in one ``msgspec.json.decode`` call. Block structs only
+    hold scalars, so they are created with ``gc=False``.
+    """
+    class_names = []
+    statement = (
+        f"# region <{res['header']['tr_code']} - {res['header']['desc']}>\n"
+    )
+    # Class 1: MMDAQ91200InBlock1
+    for block in res["block"]:
+        block_name = block["bname"]
+        if len(block["args"]) > 0:
             if len(res["header"]["tr_code"]) == 3:
                 # SC0, HC1 같은 주문 관련 realtime tr들
                 class_name = f"{res['header']['tr_code']}{block_name}"
-                if "OutBlock" in block_name:
-                    outblock_maps[res["header"]["tr_code"]].add(class_name)
             else:
                 class_name = block_name
-                if "OutBlock" in block_name:
-                    outblock_maps[res["header"]["tr_code"]].add(class_name)
-
-            if "OutBlock3" in block["bname"]:
-                statement += create_parent_base_model(
-                    class_name,
-                    "outblock3",
-                    block["is_occurs"],
-                )
-            elif "OutBlock2" in block["bname"]:
-                statement += create_parent_base_model(
-                    class_name,
-                    "outblock2",
-                    block["is_occurs"],
-                )
-            elif "OutBlock1" in block["bname"]:
-                statement += create_parent_base_model(
-                    class_name,
-                    "outblock1",
-                    block["is_occurs"],
-                )
-            elif "OutBlock" in block["bname"]:
-                statement += create_parent_base_model(
-                    class_name,
-                    "outblock",
-                    block["is_occurs"],
-                )
-            elif "InBlock1" in block["bname"]:
-                if len(block["args"]) > 0:
-                    statement += (
-                        f"    inblock1: {res['header']['tr_code']}InBlock1 = "
-                        f"Field(description='{res['header']['tr_code']}InBlock1') \n"
-                    )
-            elif "InBlock" in block["bname"]:
-                if len(block["args"]) > 0:
-                    statement += (
-                        f"    inblock: {res['header']['tr_code']}InBlock = "
-                        f"Field(description='{res['header']['tr_code']}InBlock') \n"
-                    )
-        statement += (
-            " " * 4
-            + f"metadata: dict = Field(description='The metadata information for {res['header']['tr_code']}', \
-default_factory=lambda : dict())\n"
-        )
-        statement += "# endregion\n"
-        statement += "\n"
-        statement += "\n"
+            class_names.append(class_name)
+            statement += f"class {class_name}(msgspec.Struct, frozen=True, gc=False):\n"
+            for arg in block["args"]:
+                if arg["type"] in ["float", "double"]:
+                    statement += f"    {arg['code']}: float = 0.0 # {arg['desc']}\n"
+                elif arg["type"] == "long":
+                    statement += f"    {arg['code']}: int = 0 # {arg['desc']}\n"
+                else:
+                    statement += f"    {arg['code']}: str = '' # {arg['desc']}\n"
+            statement += "\n\n"
+    statement += "\n"
 
-    statement += "QUERY_MAP = {\n"
+    # Class 2: MMDAQ91200
+    class_names.append(res["header"]["tr_code"])
+    statement += f"# {res['header']['desc']} \n"
+    statement += f"class {res['header']['tr_code']}(msgspec.Struct, frozen=True):\n"
+    statement += " " * 4 + "rsp_cd: str = ''\n"
+    statement += " " * 4 + "rsp_msg: str = ''\n"
+    for block in res["block"]:
+        block_name = block["bname"]
+        if "OutBlock" not in block_name or len(block["args"]) == 0:
+            continue
+        if len(res["header"]["tr_code"]) == 3:
+            # SC0, HC1 같은 주문 관련 realtime tr들
+            class_name = f"{res['header']['tr_code']}{block_name}"
+        else:
+            class_name = block_name
+        # e.g. outblock1 <- "t8410OutBlock1"; a field named after its own type
+        # would shadow the class inside the struct body.
+        field_name = "outblock" + block_name.split("OutBlock")[1]
+        if block["is_occurs"]:
+            statement += f"    {field_name}: Optional[List[{class_name}]] = msgspec.field(default=None, name='{class_name}')\n"
+        else:
+            statement += f"    {field_name}: Optional[{class_name}] = msgspec.field(default=None, name='{class_name}')\n"
+    statement += "# endregion\n"
+    return statement, class_names
+
+
+def create_msgspec_model_for_rest(res_infos: List[dict], output_dir: str = MSGSPEC_BLOCK_DIR) -> List[str]:
+    """Generate the ``mm_xing.block_struct`` package: msgspec counterparts of
+    ``mm_xing.block`` laid out the same way (one ``_<tr_code>.py`` per TR plus
+    ``_index.py``) for decoding REST responses straight from bytes.
+
+    Only modules whose generated code changed are rewritten.
+
+    Returns:
+        The paths of the written files.
+    """
+    header = f"# type: ignore\n# Generated by res_converter.py - create_msgspec_model_for_rest  {datetime.now().isoformat()}\n"
+    os.makedirs(output_dir, exist_ok=True)
+
+    written = []
+    block_index = OrderedDict()
     for res in res_infos:
-        statement += f"    '{res['header']['tr_code']}': {res['header']['tr_code']},  # {res['header']['desc']}\n"
-    statement += "}\n"
-    statement += "\n"
+        tr_code = res["header"]["tr_code"]
+        region, class_names = create_msgspec_region(res)
+        for class_name in class_names:
+            block_index[class_name] = tr_code
 
-    from pprint import pformat
+        statement = ""
+        typing_names = [name for name in ("List", "Optional") if f"{name}[" in region]
+        if typing_names:
+            statement += f"from typing import {', '.join(typing_names)}\n\n"
+        statement += "import msgspec\n\n\n"
+        statement += region
 
-    statement += f"QUERY_OUTBLOCK_MAP = {pformat(dict(outblock_maps))}"
-    statement += "\n"
-    statement += "\n"
+        path = os.path.join(output_dir, f"_{tr_code}.py")
+        if write_module(path, header, statement):
+            written.append(path)
+
+    index_path = write_index_module(output_dir, header, res_infos, block_index)
+    return written + [index_path] if index_path else written
 
-    clipboard.copy(statement)
 
+WEBSOCKET_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "block_websocket.py")
 
-def create_msgspec_model_for_websocket(res_infos):
-    statement = f"# Generated by res_converter.py - {sys._getframe().f_code.co_name} {datetime.now().isoformat()}"
-    statement += """
-from typing import List, Dict, Optional
+
+def create_msgspec_model_for_websocket(res_infos: List[dict], output_path: str = WEBSOCKET_MODEL_PATH) -> Optional[str]:
+    """Write every TR's msgspec structs and ``QUERY_MAP`` into a single module.
+
+    Returns:
+        ``output_path``, or None if it was already up to date.
+    """
+    header = f"# Generated by res_converter.py - {sys._getframe().f_code.co_name} {datetime.now().isoformat()}\n"
+    statement = """from typing import List, Dict, Optional
 
 import msgspec
 
@@ -338,12 +633,390 @@ import msgspec
     statement += "}\n"
     statement += "\n"
 
+    statement += f"QUERY_OUTBLOCK_MAP = {format_outblock_map(dict(outblock_maps))}"
+    statement += "\n"
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    return output_path if write_module(output_path, header, statement) else None
+
+
+
+
+def create_feed_layout(res_infos: List[dict], output_dir: str = MSGSPEC_BLOCK_DIR) -> Optional[str]:
+    """Write ``_layout.py`` of the ``mm_xing.block_struct`` package: the ``.res``
+    field types and lengths of every realtime (``.Feed``) TR's OutBlock, from
+    which ``mm_xing.tick_log`` derives its fixed-width records.
+
+    ``FEED_LAYOUT[tr_code]`` is ``{"key": <tr_key length>, "fields": [(code, type, length), ...]}``
+    with the fields in OutBlock order; ``length`` is kept as written in the
+    ``.res`` (e.g. ``"6.2"`` for floats).
+
+    Returns:
+        The path of the written file, or None if it was already up to date.
+    """
     from pprint import pformat
 
-    statement += f"QUERY_OUTBLOCK_MAP = {pformat(dict(outblock_maps))}"
-    statement += "\n"
+    layout = OrderedDict()
+    for res in res_infos:
+        if res["header"]["is_query"]:
+            continue
+        blocks = {block["bname"]: block for block in res["block"]}
+        outblock, inblock = blocks.get("OutBlock"), blocks.get("InBlock")
+        if outblock is None or not outblock["args"]:
+            continue
+        layout[res["header"]["tr_code"]] = {
+            "key": sum(int(arg["length"]) for arg in inblock["args"]) if inblock else 0,
+            "fields": [(arg["code"], arg["type"], arg["length"]) for arg in outblock["args"]],
+        }
+
+    header = f"# type: ignore\n# Generated by res_converter.py - create_feed_layout  {datetime.now().isoformat()}\n"
+    statement = f"\nFEED_LAYOUT = {pformat(dict(layout), width=120)}\n"
+
+    path = os.path.join(output_dir, "_layout.py")
+    return path if write_module(path, header, statement) else None
+
+
+ORM_TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database", "tr_tables.py")
+XING_ALEMBIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic")
+
+# A row's natural key is the first of these instrument columns its block has,
+# followed by whichever time columns it has. Blocks without one (e.g. t8412
+# bars, whose rows do not repeat the shcode) get no key unless one is given.
+NATURAL_KEY_IDENTITY = ("shcode", "Symbol", "focode", "upcode", "tmcode", "tradno")
+NATURAL_KEY_TIME = ("date", "time")
+ORM_BASE_IMPORT = "from mm_xing.database.models import BaseOrm\n"
+# Columns of BaseOrm that a .res field must not redefine.
+ORM_AUDIT_COLUMNS = ("id", "created_at", "updated_at")
+# Floats up to this many digits fit a double precision column exactly.
+FLOAT_MAX_DIGITS = 15
+
+
+def column_type(arg: dict):
+    """SQLAlchemy type of a ``.res`` field from its ``type``/``length``.
+
+    ``char(n)`` -> ``String(n)``; ``long``/``int`` -> ``Integer`` up to 9
+    digits, else ``BigInteger``; ``float``/``double`` -> ``Float`` up to
+    ``FLOAT_MAX_DIGITS`` digits, else ``Numeric(precision, scale)``.
+    """
+    from sqlalchemy import BigInteger, Float, Integer, Numeric, String
+
+    precision, _, scale = arg["length"].partition(".")
+    if arg["type"] in ("long", "int"):
+        return Integer() if int(precision) <= 9 else BigInteger()
+    if arg["type"] in ("float", "double"):
+        if int(precision) <= FLOAT_MAX_DIGITS:
+            return Float()
+        return Numeric(int(precision), int(scale or 0))
+    return String(int(precision))
+
+
+def column_default(column_type_) -> object:
+    from sqlalchemy import Float, Integer, Numeric
+
+    if isinstance(column_type_, Integer):
+        return 0
+    if isinstance(column_type_, (Float, Numeric)):
+        return 0.0
+    return ""
+
+
+def create_orm_specs(res_infos: List[dict], names: List[str], natural_keys: Optional[Dict[str, tuple]] = None) -> List[dict]:
+    """Table specs of the OutBlocks named by ``names``.
+
+    Args:
+        res_infos: Parsed ``.res`` specs
+        names: TR codes (every OutBlock of the TR) or block names (e.g. ``t8412OutBlock1``)
+        natural_keys: Block name -> natural key columns, overriding the inferred key
+    """
+    natural_keys = natural_keys or {}
+    wanted = set(names)
+    specs = []
+    for res in res_infos:
+        tr_code = res["header"]["tr_code"]
+        for block in res["block"]:
+            block_name = block["bname"]
+            if "OutBlock" not in block_name or not block["args"]:
+                continue
+            class_name = f"{tr_code}{block_name}" if len(tr_code) == 3 else block_name
+            if tr_code not in wanted and class_name not in wanted:
+                continue
+            wanted.discard(class_name)
+            codes = [arg["code"] for arg in block["args"]]
+            reserved = set(codes) & set(ORM_AUDIT_COLUMNS)
+            if reserved:
+                raise ValueError(f"{class_name} has fields named like BaseOrm columns: {sorted(reserved)}")
+
+            key = natural_keys.get(class_name)
+            if key is None:
+                identity = [code for code in NATURAL_KEY_IDENTITY if code in codes][:1]
+                key = tuple(identity + [code for code in NATURAL_KEY_TIME if code in codes]) if identity else ()
+            missing = set(key) - set(codes)
+            if missing:
+                raise ValueError(f"{class_name} has no natural key columns {sorted(missing)}")
+
+            specs.append({
+                "tr_code": tr_code,
+                "desc": res["header"]["desc"],
+                "class_name": class_name,
+                # e.g. xing_t8407_outblock1, like the hand-written xing_t8436_outblock
+                "table": f"xing_{tr_code}_outblock{block_name.split('OutBlock')[1]}",
+                "columns": [(arg["code"], column_type(arg), arg["desc"]) for arg in block["args"]],
+                "natural_key": tuple(key),
+                # Time columns of a composite key also get an index of their own
+                # for range scans across instruments.
+                "indexes": tuple(code for code in key[1:] if code in NATURAL_KEY_TIME)[:1]
+                if key and key[0] not in NATURAL_KEY_TIME else (),
+            })
+        wanted.discard(tr_code)
+    if wanted:
+        raise ValueError(f"No OutBlock of {sorted(wanted)} in the .res specs")
+    return specs
+
+
+def create_orm_region(spec: dict) -> str:
+    table, key = spec["table"], spec["natural_key"]
+    table_args = []
+    if key:
+        table_args.append(
+            f"UniqueConstraint({', '.join(repr(code) for code in key)}, name='uq_{table}_{'_'.join(key)}')"
+        )
+    for code in spec["indexes"]:
+        table_args.append(f"Index('ix_{table}_{code}', {code!r})")
+
+    statement = f"# {spec['tr_code']} - {spec['desc']}\n"
+    statement += f"class {spec['class_name']}Orm(BaseOrm):\n"
+    statement += f"    __tablename__ = '{table}'\n"
+    statement += f"    __tr_code__ = '{spec['tr_code']}'\n"
+    statement += f"    __natural_key__ = {key!r}\n"
+    if table_args:
+        statement += f"    __table_args__ = ({', '.join(table_args)},)\n"
+    for code, type_, desc in spec["columns"]:
+        statement += (
+            f"    {code} = Column({type_!r}, nullable=False, default={column_default(type_)!r}, comment='{desc}')\n"
+        )
+    shown = ", ".join(f"{code}={{self.{code}!r}}" for code in (key or [spec["columns"][0][0]]))
     statement += "\n"
+    statement += "    def __repr__(self):\n"
+    statement += f"        return f\"<{spec['class_name']}Orm(id={{self.id}}, {shown})>\"\n"
+    return statement
+
+
+def orm_audit_columns() -> list:
+    """Fresh copies of the columns every table gets from ``BaseOrm``."""
+    from sqlalchemy import Column, DateTime, Integer
+
+    return [
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("created_at", DateTime(timezone=True), nullable=True),
+        Column("updated_at", DateTime(timezone=True), nullable=True),
+    ]
+
+
+def create_orm_table(spec: dict, metadata):
+    """``Table`` that the generated ``{class_name}Orm`` maps, for diffing schemas."""
+    from sqlalchemy import Column, Index, Table, UniqueConstraint
+
+    key, table = spec["natural_key"], spec["table"]
+    args = orm_audit_columns()
+    args += [Column(code, type_, nullable=False, comment=desc) for code, type_, desc in spec["columns"]]
+    if key:
+        args.append(UniqueConstraint(*key, name=f"uq_{table}_{'_'.join(key)}"))
+    args += [Index(f"ix_{table}_{code}", code) for code in spec["indexes"]]
+    return Table(table, metadata, *args)
+
+
+def load_orm_tables(path: str) -> dict:
+    """``TR_TABLES`` of the generated ORM module at ``path`` ({} if there is none yet).
+
+    The module is executed against a detached ``BaseOrm`` so that its tables
+    neither clash with nor come from an already imported copy.
+    """
+    from sqlalchemy.orm import declarative_base
+
+    if not os.path.exists(path):
+        return {}
+
+    class BaseOrm(declarative_base()):
+        __abstract__ = True
+        __natural_key__: tuple = ()
+        id, created_at, updated_at = orm_audit_columns()
+
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read().replace(ORM_BASE_IMPORT, "")
+    namespace = {"BaseOrm": BaseOrm}
+    exec(compile(source, path, "exec"), namespace)
+    return namespace["TR_TABLES"]
+
+
+def create_orm_migration(previous: dict, tables: dict, message: str, script_location: str = XING_ALEMBIC_DIR) -> Optional[str]:
+    """Write an Alembic revision taking the tables of ``previous`` to ``tables``
+    (both ``{table name: Table}``), on top of the current head.
+
+    Tables are created or dropped whole; tables in both get their added,
+    dropped and retyped columns and their changed natural key and indexes.
+
+    Returns:
+        The path of the revision, or None if the schema did not change.
+    """
+    from alembic.autogenerate import render_python_code
+    from alembic.config import Config
+    from alembic.operations import ops
+    from alembic.script import ScriptDirectory
+    from alembic.util import rev_id
+    from sqlalchemy import Column, UniqueConstraint
+
+    def filled(column):
+        # Existing rows need a value for a NOT NULL column added (or, on
+        # downgrade, re-added) to their table.
+        return Column(
+            column.name, column.type, nullable=False,
+            server_default=str(column_default(column.type)), comment=column.comment,
+        )
 
-    clipboard.copy(statement)
-
+    def unique_constraints(table):
+        return {c.name: c for c in table.constraints if isinstance(c, UniqueConstraint)}
+
+    upgrade = []
+    for name, table in tables.items():
+        if name not in previous:
+            upgrade.append(ops.CreateTableOp.from_table(table))
+            upgrade += [ops.CreateIndexOp.from_index(index) for index in sorted(table.indexes, key=lambda i: i.name)]
+    for name, table in previous.items():
+        if name not in tables:
+            upgrade += [ops.DropIndexOp.from_index(index) for index in sorted(table.indexes, key=lambda i: i.name)]
+            upgrade.append(ops.DropTableOp.from_table(table))
+
+    for name in tables.keys() & previous.keys():
+        old, new = previous[name], tables[name]
+        changes = []
+        old_uniques, new_uniques = unique_constraints(old), unique_constraints(new)
+        old_indexes, new_indexes = {i.name: i for i in old.indexes}, {i.name: i for i in new.indexes}
+        changes += [ops.DropConstraintOp.from_constraint(c) for n, c in old_uniques.items() if n not in new_uniques]
+        changes += [ops.DropIndexOp.from_index(i) for n, i in old_indexes.items() if n not in new_indexes]
+        for column in new.columns:
+            if column.name not in old.columns:
+                changes.append(ops.AddColumnOp.from_column_and_tablename(None, name, filled(column)))
+                continue
+            before = old.columns[column.name]
+            if repr(before.type) != repr(column.type) or before.comment != column.comment:
+                changes.append(ops.AlterColumnOp(
+                    name, column.name,
+                    modify_type=column.type if repr(before.type) != repr(column.type) else None,
+                    existing_type=before.type,
+                    modify_comment=column.comment if before.comment != column.comment else False,
+                    existing_comment=before.comment,
+                    existing_nullable=before.nullable,
+                ))
+        for column in old.columns:
+            if column.name not in new.columns:
+                changes.append(ops.DropColumnOp.from_column_and_tablename(None, name, filled(column)))
+        changes += [ops.CreateUniqueConstraintOp.from_constraint(c) for n, c in new_uniques.items() if n not in old_uniques]
+        changes += [ops.CreateIndexOp.from_index(i) for n, i in new_indexes.items() if n not in old_indexes]
+        if changes:
+            upgrade.append(ops.ModifyTableOps(name, changes))
+
+    if not upgrade:
+        return None
+    upgrade_ops = ops.UpgradeOps(ops=upgrade)
+    config = Config()
+    config.set_main_option("script_location", script_location)
+    script = ScriptDirectory.from_config(config)
+    revision = script.generate_revision(
+        rev_id(), message, head="head",
+        imports="",
+        upgrades=render_python_code(upgrade_ops),
+        downgrades=render_python_code(upgrade_ops.reverse()),
+    )
+    return revision.path
+
+
+def create_orm_tables(
+    res_infos: List[dict],
+    names: Optional[List[str]] = None,
+    drop: Optional[List[str]] = None,
+    natural_keys: Optional[Dict[str, tuple]] = None,
+    output_path: str = ORM_TABLES_PATH,
+    message: Optional[str] = None,
+    script_location: Optional[str] = XING_ALEMBIC_DIR,
+) -> List[str]:
+    """Generate SQLAlchemy tables for chosen TRs' OutBlocks and the Alembic
+    revision that migrates the database to them.
+
+    The generated module (``mm_xing.database.tr_tables``) keeps the blocks it
+    already holds, with their natural keys, so each call adds to the set;
+    ``drop`` removes blocks. Columns are typed from the ``.res`` fields (see
+    ``column_type``) and rows are upserted on ``__natural_key__`` by
+    ``mm_xing.database.writer.upsert_rows``.
+
+    Args:
+        res_infos: Parsed ``.res`` specs
+        names: TR codes or block names to add
+        drop: TR codes or block names to remove
+        natural_keys: Block name -> natural key columns, overriding the inferred key
+        output_path: Generated module path
+        message: Revision message (default: lists the added/dropped blocks)
+        script_location: Alembic environment to add the revision to; None for none
+
+    Returns:
+        The paths of the written files.
+    """
+    from sqlalchemy import MetaData
+
+    from mm_xing.database.models import Base
+
+    previous_orms = load_orm_tables(output_path)
+    # Less the generated ones, in case mm_xing.database.tr_tables is imported.
+    handwritten = set(Base.metadata.tables) - {orm.__table__.name for orm in previous_orms.values()}
+    drop = set(drop or [])
+    kept = [
+        class_name for class_name, orm in previous_orms.items()
+        if class_name not in drop and orm.__tr_code__ not in drop
+    ]
+    names = [name for name in names or [] if name not in kept]
+    unknown = drop - set(previous_orms) - {orm.__tr_code__ for orm in previous_orms.values()}
+    if unknown:
+        raise ValueError(f"Not among the generated tables: {sorted(unknown)}")
+
+    keys = {class_name: previous_orms[class_name].__natural_key__ for class_name in kept}
+    keys.update(natural_keys or {})
+    specs = create_orm_specs(res_infos, kept + names, keys)
+    specs.sort(key=lambda spec: spec["class_name"])
+    clashing = sorted(spec["table"] for spec in specs if spec["table"] in handwritten)
+    if clashing:
+        raise ValueError(f"Hand-written in mm_xing.database.models: {clashing}")
+
+    header = f"# type: ignore\n# Generated by res_converter.py - create_orm_tables  {datetime.now().isoformat()}\n"
+    imports = {"Column"} | {type(type_).__name__ for spec in specs for _, type_, _ in spec["columns"]}
+    if any(spec["natural_key"] for spec in specs):
+        imports.add("UniqueConstraint")
+    if any(spec["indexes"] for spec in specs):
+        imports.add("Index")
+    statement = f"from sqlalchemy import {', '.join(sorted(imports))}\n\n"
+    statement += ORM_BASE_IMPORT + "\n\n"
+    for spec in specs:
+        statement += create_orm_region(spec)
+        statement += "\n\n"
+    statement += "# Block name -> table of its rows\n"
+    statement += "TR_TABLES = {\n"
+    for spec in specs:
+        statement += f"    '{spec['class_name']}': {spec['class_name']}Orm,\n"
+    statement += "}\n"
 
+    if not write_module(output_path, header, statement):
+        return []
+    written = [output_path]
+    if script_location is not None:
+        metadata = MetaData()
+        tables = {spec["table"]: create_orm_table(spec, metadata) for spec in specs}
+        previous = {orm.__table__.name: orm.__table__ for orm in previous_orms.values()}
+        if message is None:
+            added = sorted({spec["class_name"] for spec in specs} - set(previous_orms))
+            removed = sorted(set(previous_orms) - {spec["class_name"] for spec in specs})
+            message = " ".join(
+                part for part in (f"add {', '.join(added)}" if added else "", f"drop {', '.join(removed)}" if removed else "")
+                if part
+            ) or "update generated tables"
+        revision = create_orm_migration(previous, tables, message, script_location)
+        if revision:
+            written.append(revision)
+    return written
@@ -0,0 +1,184 @@
+"""Two-tier TTL cache of Xing TR responses with a per-TR freshness policy.
+
+``fetch_market_data`` / ``stream_market_data`` look TR calls up here before
+taking a rate-limit slot. An in-process LRU keeps the decoded rows (keyed by
+request and decoder); behind it a ``diskcache`` store shared by every process
+on the host keeps the raw response body and continuation headers, which are
+decoded again on a hit. TRs without a policy are never cached.
+
+A policy (``XING_CACHE_POLICIES``, overridable with the setting of the same
+name) says how long a response stays fresh: ``ttl_sec`` seconds, until the
+next KST midnight (``"until": "day"``, masters) or until the next KST session
+close (``"until": "close"``, daily charts), whatever the host's time zone. For ``stale_sec`` after that it is still
+served, while one background call refreshes it (stale-while-revalidate).
+Hits, stale hits and misses are counted per TR in ``XING_METRICS``.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from diskcache import Cache
+from httpx import Response
+
+from mm_xing.constant import (KST, XING_CACHE_DISK_LIMIT_BYTES,
+                              XING_CACHE_MEMORY_ENTRIES, XING_CACHE_POLICIES,
+                              XING_RESPONSE_CACHE_DIR, XING_SESSION_CLOSE)
+from mm_xing.metrics import XING_METRICS
+from mm_xing.schemas import XingDataConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_HIT = "hit"
+CACHE_DISK_HIT = "disk_hit"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+
+# Response headers a cached page must keep for continuation (stream_market_data)
+CACHED_HEADERS = ("tr_cont", "tr_cont_key")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl_sec: float = 0.0
+    until: Optional[str] = None  # "day": next KST midnight, "close": next XING_SESSION_CLOSE (KST)
+    stale_sec: float = 0.0
+
+    def expires_at(self, fetched_at: float) -> float:
+        fetched = datetime.fromtimestamp(fetched_at, KST)
+        if self.until == "day":
+            return KST.localize(datetime.combine(fetched.date() + timedelta(days=1), datetime.min.time())).timestamp()
+        if self.until == "close":
+            close_time = datetime.strptime(XING_SESSION_CLOSE, "%H%M").time()
+            close = KST.localize(datetime.combine(fetched.date(), close_time))
+            if close <= fetched:
+                close = KST.localize(datetime.combine(fetched.date() + timedelta(days=1), close_time))
+            return close.timestamp()
+        return fetched_at + self.ttl_sec
+
+
+@dataclass
+class CacheEntry:
+    response: Response
+    data: Any
+    expires_at: float
+    stale_until: float
+
+
+class XingResponseCache:
+    """Memory LRU + disk TTL cache of TR responses (see the module docstring).
+
+    Args:
+        policies: Per-TR ``CachePolicy`` keyword dicts on top of ``XING_CACHE_POLICIES``
+        directory: ``diskcache`` directory of the disk tier; None for memory only
+        memory_entries: Decoded responses kept in the LRU
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, dict]] = None,
+        directory: Optional[str] = XING_RESPONSE_CACHE_DIR,
+        memory_entries: int = XING_CACHE_MEMORY_ENTRIES,
+        disk_limit_bytes: int = XING_CACHE_DISK_LIMIT_BYTES,
+    ):
+        self.policies = {
+            tr_code: CachePolicy(**policy)
+            for tr_code, policy in {**XING_CACHE_POLICIES, **(policies or {})}.items()
+        }
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._disk = Cache(directory=directory, size_limit=disk_limit_bytes) if directory else None
+        self._revalidating: Dict[Hashable, asyncio.Task] = {}
+
+    def policy(self, config: XingDataConfig) -> Optional[CachePolicy]:
+        """The TR's policy, or None if its responses must not be cached.
+
+        Handlers without a ``decoder_key`` are not cached: the decoded rows
+        could not be told apart from another decoder's.
+        """
+        if getattr(config.cb_handler, "decoder_key", None) is None:
+            return None
+        return self.policies.get(config.tr_code)
+
+    async def fetch(
+        self,
+        config: XingDataConfig,
+        request_key: Tuple,
+        call: Callable[[], Awaitable[Tuple[Response, Any]]],
+    ) -> Tuple[Response, Any]:
+        """Return the cached ``(response, rows)`` of ``request_key``, or ``call()`` and cache it."""
+        policy = self.policy(config)
+        if policy is None:
+            return await call()
+        key = (*request_key, config.cb_handler.decoder_key)
+        now = time.time()
+        result = CACHE_HIT
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        elif self._disk is not None:
+            entry = self._load(config, request_key, key)
+            result = CACHE_DISK_HIT
+        if entry is not None and now < entry.expires_at:
+            XING_METRICS.observe_cache(config.tr_code, result)
+            return entry.response, entry.data
+        if entry is not None and now < entry.stale_until:
+            XING_METRICS.observe_cache(config.tr_code, CACHE_STALE)
+            if key not in self._revalidating:
+                task = asyncio.ensure_future(self._store(policy, request_key, key, call))
+                self._revalidating[key] = task
+                task.add_done_callback(lambda done: self._revalidated(key, done))
+            return entry.response, entry.data
+        XING_METRICS.observe_cache(config.tr_code, CACHE_MISS)
+        return await self._store(policy, request_key, key, call)
+
+    def _load(self, config: XingDataConfig, request_key: Tuple, key: Hashable) -> Optional[CacheEntry]:
+        raw = self._disk.get(request_key)
+        if raw is None:
+            return None
+        status_code, headers, content, expires_at, stale_until = raw
+        response = Response(status_code, headers=headers, content=content)
+        entry = CacheEntry(response, config.cb_handler(response, config=config), expires_at, stale_until)
+        self._remember(key, entry)
+        return entry
+
+    async def _store(self, policy: CachePolicy, request_key: Tuple, key: Hashable, call) -> Tuple[Response, Any]:
+        response, data = await call()
+        fetched_at = time.time()
+        expires_at = policy.expires_at(fetched_at)
+        stale_until = expires_at + policy.stale_sec
+        self._remember(key, CacheEntry(response, data, expires_at, stale_until))
+        if self._disk is not None:
+            headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+            self._disk.set(
+                request_key,
+                (response.status_code, headers, response.content, expires_at, stale_until),
+                expire=max(stale_until - fetched_at, 1),
+            )
+        return response, data
+
+    def _remember(self, key: Hashable, entry: CacheEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _revalidated(self, key: Hashable, task: asyncio.Task) -> None:
+        self._revalidating.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            # The stale entry keeps being served until it runs out; the next hit retries.
+            logger.warning("Revalidating a cached %s response failed: %r", key[0], task.exception())
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def close(self) -> None:
+        for task in self._revalidating.values():
+            task.cancel()
+        if self._disk is not None:
+            self._disk.close()
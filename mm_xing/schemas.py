@@ -1,3 +1,4 @@
+import time
 from typing import Callable
 
 from pydantic import BaseModel
@@ -15,6 +16,18 @@ class XingAuthParams(BaseModel):
     appsecretkey: str | None
     scope: str = "oob"
 
+class XingToken(BaseModel):
+    access_token: str
+    expires_at: float  # epoch seconds
+    issued_at: float = 0.0  # epoch seconds; 0 when unknown
+
+    @property
+    def ttl(self) -> float:
+        return self.expires_at - self.issued_at if self.issued_at else 0.0
+
+    def is_fresh(self, margin_sec: float = 0) -> bool:
+        return self.expires_at - margin_sec > time.time()
+
 class XingTrHeaders(BaseModel):
     content_type: str = "application/json; charset=utf-8"
     authorization: str
@@ -39,4 +52,6 @@ class XingDataConfig(BaseModel):
     path: str
     tr_code: str
     inblock: BaseModel
-    cb_handler: Callable = lambda x: x 
\ No newline at end of file
+    cb_handler: Callable = lambda x: x 
+    # Per-request timeout in seconds; None uses the shared client's default.
+    timeout: float | None = None
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""KST session clock of the realtime feeds.
+
+Feed messages carry the exchange's ``HHMMSS`` without a date, and ticks and
+bars are stamped in exchange wall-clock seconds (KST read as if it were UTC,
+so ``np.datetime64`` shows the exchange time). The host may run on any time
+zone (the deployment runs on UTC), so the session day and the current time
+are taken from KST, and long-running consumers move to the next day at KST
+midnight instead of keeping the day they were started on.
+"""
+import time
+from datetime import date, datetime
+from typing import Callable, Optional
+
+from mm_xing.constant import KST
+
+SECONDS_PER_DAY = 86400
+# KST has no daylight saving time, so its offset is fixed.
+KST_OFFSET_SEC = int(datetime.now(KST).utcoffset().total_seconds())
+# A time of day this far ahead of the clock was sent before midnight and read after it.
+LATE_SEC = SECONDS_PER_DAY // 2
+
+EPOCH = date(1970, 1, 1)
+
+
+def exchange_now() -> int:
+    """Current exchange wall clock, in seconds."""
+    return int(time.time()) + KST_OFFSET_SEC
+
+
+def exchange_today() -> date:
+    """The current KST day."""
+    return datetime.now(KST).date()
+
+
+def exchange_day(ts_ns: int) -> date:
+    """KST day of a real (UTC) epoch timestamp in ns, e.g. a receive time."""
+    return datetime.fromtimestamp(ts_ns / 1e9, KST).date()
+
+
+def midnight(day: date) -> int:
+    """Exchange wall-clock seconds of ``day``'s midnight."""
+    return (day - EPOCH).days * SECONDS_PER_DAY
+
+
+class SessionClock:
+    """Exchange wall-clock seconds of a feed's ``HHMMSS`` times.
+
+    With a ``session_date`` (e.g. a replay) every time falls on that day;
+    otherwise on the current KST day, which rolls over at KST midnight.
+
+    Args:
+        session_date: Day the times belong to; None for the current KST day
+        clock: Current exchange wall clock in seconds
+    """
+
+    __slots__ = ("session_date", "clock")
+
+    def __init__(self, session_date: Optional[date] = None, clock: Callable[[], int] = exchange_now):
+        self.session_date = session_date
+        self.clock = clock
+
+    def ts(self, hhmmss: str) -> int:
+        seconds = int(hhmmss[:2]) * 3600 + int(hhmmss[2:4]) * 60 + int(hhmmss[4:6])
+        if self.session_date is not None:
+            return midnight(self.session_date) + seconds
+        now = self.clock()
+        ts = now - now % SECONDS_PER_DAY + seconds
+        if ts - now > LATE_SEC:
+            ts -= SECONDS_PER_DAY
+        return ts
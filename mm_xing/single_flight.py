@@ -0,0 +1,52 @@
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+
+from mm_xing.metrics import XING_METRICS
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls into one in-flight call.
+
+    The first caller of a key starts ``call()`` as a task; callers of the same
+    key arriving before it finishes await that task instead of calling again,
+    and all of them get its result or its exception. The task is shielded, so
+    a cancelled caller does not cancel the call for the others. Results are
+    shared as they are: callers must not mutate them.
+
+    ``fetch_market_data`` / ``stream_market_data`` key TR calls on
+    ``flight_key`` (TR, InBlock, continuation key, decoder), so identical
+    calls take one rate-limit slot and one HTTP round trip between them.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Task] = {}
+        self.flights: Counter = Counter()  # name -> calls actually made
+        self.coalesced: Counter = Counter()  # name -> calls served by another's flight
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, name: str, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._flights[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.flights[name] += 1
+        else:
+            self.coalesced[name] += 1
+            XING_METRICS.observe_coalesced(name)
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            task.exception()  # retrieved even if every caller was cancelled meanwhile
+
+    def summary(self) -> List[dict]:
+        return [
+            {"name": name, "flights": self.flights[name], "coalesced": self.coalesced[name]}
+            for name in sorted(set(self.flights) | set(self.coalesced))
+        ]
@@ -0,0 +1,356 @@
+"""Offline stand-in for the LS Xing REST API (an ASGI app).
+
+Serves TR responses without openapi.ls-sec.co.kr so the client and the
+backend can be load-tested and benchmarked offline:
+
+* ``POST /oauth2/token`` issues ``standin-<n>`` bearer tokens; TR calls
+  without a token it issued are rejected.
+* TR calls (``tr_cd`` header + ``{"<tr>InBlock": {...}}`` body) are answered
+  from recordings keyed by (TR, InBlock, ``tr_cont_key``), including the
+  recorded ``tr_cont``/``tr_cont_key`` continuation headers. Unrecorded
+  requests get a synthesized envelope built from the ``mm_xing.block_struct``
+  OutBlocks, paged ``pages`` times; t8407 (multi-quote) answers one row per
+  requested code, about a tenth of the prices moving every second.
+* Calls above the per-TR limits of ``XING_TR_RATE_LIMITS`` within one second
+  are answered with a rate-limit error envelope. Like the gateway, calls are
+  counted per app key (the ``appkey`` the token was issued to).
+* Every answer is delayed by a log-normal latency per TR.
+
+With ``upstream`` set it proxies to the real API instead and records every
+successful TR response, so a session against the real endpoint can be
+replayed later::
+
+    python -m mm_xing.standin --port 8081 --upstream https://openapi.ls-sec.co.kr:8080
+    python -m mm_xing.standin --port 8081 --latency-ms 40 --latency-sigma 0.5
+
+Point the client at it with ``XING_REST_URL=http://127.0.0.1:8081``.
+"""
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+import time
+import zlib
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+import msgspec
+
+from mm_xing.block_struct import QUERY_MAP as STRUCT_QUERY_MAP
+from mm_xing.constant import (XING_AUTH_URL, XING_DEFAULT_TR_RATE_LIMIT,
+                              XING_STANDIN_RECORDING_DIR, XING_TR_RATE_LIMITS)
+
+TOKEN_PREFIX = "standin-"
+OK = ("00000", "정상적으로 조회가 완료되었습니다.")
+RATE_LIMITED = ("IGW00201", "초당 전송 가능 횟수를 초과하였습니다.")
+UNAUTHORIZED = ("IGW00121", "유효하지 않은 토큰입니다.")
+UNKNOWN_TR = ("IGW00214", "TR CD는 필수 입니다.")
+
+# Hop-by-hop and length headers the stand-in sets itself when proxying.
+PROXY_SKIP_HEADERS = {"host", "content-length", "transfer-encoding", "connection", "content-encoding"}
+
+
+class Recording(msgspec.Struct):
+    tr_code: str
+    inblock: dict
+    tr_cont_key: str
+    status: int
+    headers: Dict[str, str]  # tr_cont / tr_cont_key of the response
+    body: str
+
+
+def request_key(tr_code: str, inblock: dict, tr_cont_key: str) -> str:
+    canonical = json.dumps([tr_code, inblock, tr_cont_key], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+class RecordingStore:
+    """Recorded responses as ``<directory>/<tr_code>/<request_key>.json`` files."""
+
+    def __init__(self, directory: str = XING_STANDIN_RECORDING_DIR):
+        self.directory = directory
+        self._cache: Dict[str, Optional[Recording]] = {}
+
+    def _path(self, tr_code: str, key: str) -> str:
+        return os.path.join(self.directory, tr_code, f"{key}.json")
+
+    def get(self, tr_code: str, inblock: dict, tr_cont_key: str) -> Optional[Recording]:
+        key = request_key(tr_code, inblock, tr_cont_key)
+        if key not in self._cache:
+            path = self._path(tr_code, key)
+            recording = None
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    recording = msgspec.json.decode(f.read(), type=Recording)
+            self._cache[key] = recording
+        return self._cache[key]
+
+    def save(self, recording: Recording) -> None:
+        key = request_key(recording.tr_code, recording.inblock, recording.tr_cont_key)
+        path = self._path(recording.tr_code, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(msgspec.json.encode(recording))
+        self._cache[key] = recording
+
+
+class LatencyModel:
+    """Log-normal response latency: ``median_ms`` with a spread of ``sigma``."""
+
+    def __init__(self, median_ms: float = 30.0, sigma: float = 0.4):
+        self.median_sec = median_ms / 1000
+        self.sigma = sigma
+
+    def sample(self) -> float:
+        if self.median_sec <= 0:
+            return 0.0
+        return self.median_sec * math.exp(random.gauss(0.0, self.sigma))
+
+
+def synthesize_envelope(tr_code: str, rows: int) -> bytes:
+    """A successful response of ``tr_code`` whose occurs blocks hold ``rows`` generated rows."""
+    envelope = STRUCT_QUERY_MAP[tr_code]
+    blocks = {}
+    for block in msgspec.structs.fields(envelope):
+        if not block.name.startswith("outblock"):
+            continue
+        # Optional[List[X]] / Optional[X]
+        inner = block.type.__args__[0]
+        is_list = getattr(inner, "__origin__", None) is list
+        outblock = inner.__args__[0] if is_list else inner
+        values = [
+            outblock(**{
+                field.name: (f"{i:06d}" if field.type is str else i if field.type is int else i + 0.5)
+                for field in msgspec.structs.fields(outblock)
+            })
+            for i in range(rows if is_list else 1)
+        ]
+        blocks[block.name] = values if is_list else values[0]
+    return msgspec.json.encode(envelope(rsp_cd=OK[0], rsp_msg=OK[1], **blocks))
+
+
+def synthesize_quotes(shcodes: List[str], tick: int) -> bytes:
+    """A t8407 response quoting ``shcodes``; each code's price and volume step every 10th ``tick``."""
+    rows = []
+    for shcode in shcodes:
+        seed = zlib.crc32(shcode.encode())
+        step = (seed + tick) // 10
+        base = 1000 + seed % 9000 * 10
+        price = base + step % 20 * 10
+        rows.append({
+            "shcode": shcode, "hname": f"종목{shcode}", "price": price, "sign": "2", "change": price - base,
+            "diff": round((price - base) / base * 100, 2), "volume": step * 100, "offerho": price + 10,
+            "bidho": price, "cvolume": 10, "open": base, "high": price, "low": base, "value": step,
+            "jnilclose": base, "uplmtprice": base * 13 // 10, "dnlmtprice": base * 7 // 10,
+        })
+    return msgspec.json.encode({"rsp_cd": OK[0], "rsp_msg": OK[1], "t8407OutBlock1": rows})
+
+
+def error_body(error: Tuple[str, str]) -> bytes:
+    return json.dumps({"rsp_cd": error[0], "rsp_msg": error[1]}, ensure_ascii=False).encode()
+
+
+class StandinXingApp:
+    """ASGI stand-in of the Xing REST API (see the module docstring).
+
+    Args:
+        recordings: Store recorded responses are served from / saved to
+        upstream: Real API base URL to proxy to and record from (record mode)
+        latency: Default latency model; ``tr_latency`` overrides it per TR
+        rate_limits: Requests/sec per TR code on top of ``XING_TR_RATE_LIMITS``;
+            other TRs get ``default_rate_limit``
+        enforce_rate_limits: False to never answer with rate-limit errors
+        rows: Rows per occurs block of synthesized responses
+        pages: Pages of a synthesized response (``tr_cont=Y`` on all but the last)
+    """
+
+    def __init__(
+        self,
+        recordings: Optional[RecordingStore] = None,
+        upstream: Optional[str] = None,
+        latency: Optional[LatencyModel] = None,
+        tr_latency: Optional[Dict[str, LatencyModel]] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        default_rate_limit: float = XING_DEFAULT_TR_RATE_LIMIT,
+        enforce_rate_limits: bool = True,
+        rows: int = 100,
+        pages: int = 1,
+        token_ttl_sec: int = 86400,
+    ):
+        self.recordings = recordings or RecordingStore()
+        self.upstream = upstream
+        self.latency = latency or LatencyModel()
+        self.tr_latency = tr_latency or {}
+        self.rate_limits = {**XING_TR_RATE_LIMITS, **(rate_limits or {})}
+        self.default_rate_limit = default_rate_limit
+        self.enforce_rate_limits = enforce_rate_limits
+        self.rows = rows
+        self.pages = pages
+        self.token_ttl_sec = token_ttl_sec
+        self.tokens: Dict[str, str] = {}  # access token -> app key
+        self.stats: Counter = Counter()  # (tr_code, rsp_cd) -> responses
+        self._token_seq = itertools.count(1)
+        self._calls: Dict[Tuple[str, str], Deque[float]] = {}
+        self._synthesized: Dict[Tuple[str, int], bytes] = {}
+        self._upstream_client = None
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    if self._upstream_client is not None:
+                        await self._upstream_client.aclose()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]}
+        if scope["path"].strip("/") == XING_AUTH_URL:
+            status, response_headers, content = await self._token(scope, headers, body)
+        else:
+            status, response_headers, content = await self._tr(scope, headers, body)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json; charset=utf-8")]
+            + [(name.encode(), value.encode()) for name, value in response_headers.items()],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    def _upstream(self):
+        if self._upstream_client is None:
+            from httpx import AsyncClient
+            self._upstream_client = AsyncClient(base_url=self.upstream, verify=False, timeout=30.0)
+        return self._upstream_client
+
+    async def _proxy(self, scope, headers: dict, body: bytes):
+        response = await self._upstream().request(
+            scope["method"],
+            scope["path"],
+            params=scope["query_string"].decode(),
+            headers={name: value for name, value in headers.items() if name not in PROXY_SKIP_HEADERS},
+            content=body,
+        )
+        return response.status_code, response.headers, response.content
+
+    async def _token(self, scope, headers: dict, body: bytes):
+        if self.upstream:
+            status, response_headers, content = await self._proxy(scope, headers, body)
+            if status == 200:
+                self.tokens[json.loads(content).get("access_token", "")] = ""
+            return status, {}, content
+        params = parse_qs(scope["query_string"].decode()) or parse_qs(body.decode())
+        token = f"{TOKEN_PREFIX}{next(self._token_seq)}"
+        self.tokens[token] = params.get("appkey", [""])[0]
+        self.stats[("token", OK[0])] += 1
+        return 200, {}, json.dumps({
+            "access_token": token, "scope": "oob", "token_type": "Bearer", "expires_in": self.token_ttl_sec,
+        }).encode()
+
+    def _rate_limited(self, app_key: str, tr_code: str) -> bool:
+        if not self.enforce_rate_limits:
+            return False
+        limit = self.rate_limits.get(tr_code) or self.default_rate_limit
+        calls = self._calls.setdefault((app_key, tr_code), deque())
+        now = time.monotonic()
+        while calls and now - calls[0] >= 1.0:
+            calls.popleft()
+        if len(calls) >= limit:
+            return True
+        calls.append(now)
+        return False
+
+    async def _tr(self, scope, headers: dict, body: bytes):
+        tr_code = headers.get("tr_cd", "")
+        tr_cont_key = headers.get("tr_cont_key", "")
+        if self.upstream:
+            status, response_headers, content = await self._proxy(scope, headers, body)
+            continuation = {name: response_headers[name] for name in ("tr_cont", "tr_cont_key") if name in response_headers}
+            if status == 200 and tr_code:
+                self.recordings.save(Recording(
+                    tr_code, json.loads(body or b"{}"), tr_cont_key, status, continuation, content.decode(),
+                ))
+            return status, continuation, content
+
+        # Admission is decided on arrival, like the gateway counts calls; the
+        # latency covers the work behind it.
+        app_key = self.tokens.get(headers.get("authorization", "").removeprefix("Bearer "))
+        if app_key is None:
+            error = (401, UNAUTHORIZED)
+        elif tr_code not in STRUCT_QUERY_MAP:
+            error = (500, UNKNOWN_TR)
+        elif self._rate_limited(app_key, tr_code):
+            error = (500, RATE_LIMITED)
+        else:
+            error = None
+        await asyncio.sleep(self.tr_latency.get(tr_code, self.latency).sample())
+        if error is not None:
+            return self._error(tr_code, *error)
+
+        inblock = json.loads(body or b"{}")
+        recording = self.recordings.get(tr_code, inblock, tr_cont_key)
+        self.stats[(tr_code, OK[0])] += 1
+        if recording is not None:
+            return recording.status, recording.headers, recording.body.encode()
+        if tr_code == "t8407":
+            shcode = inblock.get("t8407InBlock", {}).get("shcode", "")
+            shcodes = [shcode[i:i + 6] for i in range(0, len(shcode), 6)]
+            return 200, {"tr_cont": "N", "tr_cont_key": ""}, synthesize_quotes(shcodes, int(time.time()))
+        page = int(tr_cont_key) if tr_cont_key.isdigit() else 0
+        more = page + 1 < self.pages
+        key = (tr_code, self.rows)
+        if key not in self._synthesized:
+            self._synthesized[key] = synthesize_envelope(tr_code, self.rows)
+        return 200, {"tr_cont": "Y" if more else "N", "tr_cont_key": str(page + 1) if more else ""}, self._synthesized[key]
+
+    def _error(self, tr_code: str, status: int, error: Tuple[str, str]):
+        self.stats[(tr_code, error[0])] += 1
+        return status, {}, error_body(error)
+
+    def summary(self) -> List[Tuple[str, str, int]]:
+        return sorted((tr_code, rsp_cd, count) for (tr_code, rsp_cd), count in self.stats.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--recordings", default=XING_STANDIN_RECORDING_DIR)
+    parser.add_argument("--upstream", default=None, help="proxy to and record from this base URL")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.4, help="log-normal spread of the latency")
+    parser.add_argument("--rows", type=int, default=100, help="rows per synthesized occurs block")
+    parser.add_argument("--pages", type=int, default=1, help="pages per synthesized response")
+    parser.add_argument("--no-rate-limit", action="store_true", help="never answer with rate-limit errors")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = StandinXingApp(
+        recordings=RecordingStore(args.recordings),
+        upstream=args.upstream,
+        latency=LatencyModel(args.latency_ms, args.latency_sigma),
+        enforce_rate_limits=not args.no_rate_limit,
+        rows=args.rows,
+        pages=args.pages,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
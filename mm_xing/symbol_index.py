@@ -0,0 +1,168 @@
+"""In-memory search index over the t8436 symbol master.
+
+Built once a day from the t8436 rows (``SymbolIndex.from_rows``), it answers
+prefix searches over:
+
+* codes: ``shcode`` and ``expcode`` (``"0059"`` -> 005930, ``"KR7005"`` -> ...)
+* names, compared jamo by jamo so an unfinished last syllable still matches
+  (``"삼성저"``, ``"삼성ㅈ"`` -> 삼성전자); spaces and letter case are ignored
+* initial consonants (chosung) of the names (``"ㅅㅅㅈㅈ"`` -> 삼성전자)
+
+optionally filtered by market (``gubun``) and ETF/ETN flag (``etfgubun``).
+Every prefix of up to ``XING_SYMBOL_INDEX_HEAD_DEPTH`` characters/jamo maps to
+its precomputed, ranked matches (the top of a trie); longer prefixes narrow a
+sorted key list by bisection. Results are ranked by name length (the closest
+completion first), then market, then code.
+
+    >>> index = SymbolIndex.from_rows(t8436_rows)
+    >>> [s.hname for s in index.search("ㅅㅅㅈ", limit=3)]
+    ['삼성전자', '삼성전자우', '삼성중공업']
+"""
+from bisect import bisect_left
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import msgspec
+
+from mm_xing.constant import XING_SYMBOL_INDEX_HEAD_DEPTH, XING_SYMBOL_SEARCH_LIMIT
+
+HANGUL_BASE = 0xAC00
+HANGUL_SYLLABLES = 11172
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+# Compound vowels and final consonants are split, so that a syllable still
+# being typed ("조" on the way to "좌") is a prefix of the finished one.
+JUNGSUNG = (
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+)
+JONGSUNG = (
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+# Hangul compatibility consonants ㄱ..ㅎ: a query of only these is a chosung search
+CONSONANTS = frozenset(chr(c) for c in range(0x3131, 0x314F))
+
+JAMO_TABLE = str.maketrans({
+    **{
+        chr(HANGUL_BASE + i): CHOSUNG[i // 588] + JUNGSUNG[i % 588 // 28] + JONGSUNG[i % 28]
+        for i in range(HANGUL_SYLLABLES)
+    },
+    **COMPOUND_JAMO,
+})
+CHOSUNG_TABLE = str.maketrans({chr(HANGUL_BASE + i): CHOSUNG[i // 588] for i in range(HANGUL_SYLLABLES)})
+
+
+def normalize(text: str) -> str:
+    return "".join(text.split()).upper()
+
+
+def to_jamo(text: str) -> str:
+    """``"삼성"`` -> ``"ㅅㅏㅁㅅㅓㅇ"``; other characters are kept."""
+    return text.translate(JAMO_TABLE)
+
+
+def to_chosung(text: str) -> str:
+    """``"삼성전자"`` -> ``"ㅅㅅㅈㅈ"``; other characters are kept."""
+    return text.translate(CHOSUNG_TABLE)
+
+
+class Symbol(msgspec.Struct, frozen=True, gc=False):
+    shcode: str
+    hname: str
+    expcode: str = ""
+    gubun: str = ""  # 1: KOSPI, 2: KOSDAQ
+    etfgubun: str = ""  # 1: ETF, 2: ETN
+    spac_gubun: str = ""
+
+
+class PrefixTable:
+    """Ranked ids of the keys starting with a prefix.
+
+    ``entries`` are ``(key, id)`` pairs; ids are ranks, so smaller is better.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, int]], head_depth: int = XING_SYMBOL_INDEX_HEAD_DEPTH):
+        pairs = sorted(set(entries))
+        self.head_depth = head_depth
+        self.keys = [key for key, _ in pairs]
+        self.ids = [i for _, i in pairs]
+        heads: Dict[str, set] = {}
+        for key, i in pairs:
+            for n in range(1, min(len(key), head_depth) + 1):
+                heads.setdefault(key[:n], set()).add(i)
+        self.heads = {prefix: tuple(sorted(ids)) for prefix, ids in heads.items()}
+
+    def match(self, prefix: str) -> Sequence[int]:
+        if len(prefix) <= self.head_depth:
+            return self.heads.get(prefix, ())
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        return sorted(set(self.ids[lo:hi]))
+
+
+class SymbolIndex:
+    """Prefix, jamo and chosung search over the symbol master (see the module docstring)."""
+
+    def __init__(self, symbols: Iterable[Symbol], built_on: Optional[date] = None):
+        self.symbols = sorted(symbols, key=lambda s: (len(normalize(s.hname)), s.gubun, s.shcode))
+        self.built_on = built_on or date.today()
+        names = [normalize(symbol.hname) for symbol in self.symbols]
+        self.codes = PrefixTable(
+            (code.upper(), i)
+            for i, symbol in enumerate(self.symbols)
+            for code in (symbol.shcode, symbol.expcode) if code
+        )
+        self.names = PrefixTable((to_jamo(name), i) for i, name in enumerate(names) if name)
+        self.chosung = PrefixTable((to_chosung(name), i) for i, name in enumerate(names) if name)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any], built_on: Optional[date] = None) -> "SymbolIndex":
+        """Index t8436 rows of any kind: ORM rows, pydantic/msgspec OutBlocks or dicts."""
+        fields = Symbol.__struct_fields__
+
+        def symbol(row):
+            if isinstance(row, dict):
+                return Symbol(**{name: str(row.get(name) or "") for name in fields})
+            return Symbol(**{name: str(getattr(row, name, "") or "") for name in fields})
+
+        return cls((symbol(row) for row in rows if row is not None), built_on=built_on)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def search(
+        self,
+        query: str,
+        limit: int = XING_SYMBOL_SEARCH_LIMIT,
+        gubun: Optional[str] = None,
+        etfgubun: Optional[str] = None,
+    ) -> List[Symbol]:
+        """Symbols whose code, name or name chosung starts with ``query``; all of them for an empty query."""
+        query = normalize(query)
+        if not query:
+            groups: List[Sequence[int]] = [range(len(self.symbols))]
+        elif all(c in CONSONANTS for c in query):
+            groups = [self.chosung.match(query)]
+        else:
+            groups = [self.codes.match(query)] if query.isascii() else []
+            groups.append(self.names.match(to_jamo(query)))
+
+        found: List[Symbol] = []
+        seen = set()
+        for ids in groups:
+            for i in ids:
+                if i in seen:
+                    continue
+                symbol = self.symbols[i]
+                if (gubun is not None and symbol.gubun != gubun) or (etfgubun is not None and symbol.etfgubun != etfgubun):
+                    continue
+                seen.add(i)
+                found.append(symbol)
+                if len(found) >= limit:
+                    return found
+        return found
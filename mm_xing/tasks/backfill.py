@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Iterable, List, Optional
+
+from diskcache import Cache
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from mm_xing.bar_store import BarStore, Bars, chart_interval
+from mm_xing.block import t8410InBlock
+from mm_xing.constant import (MSGSPEC_DECODER, PRIORITY_BATCH, T8410,
+                              XING_BACKFILL_CHECKPOINT_DIR,
+                              XING_BACKFILL_CONCURRENCY,
+                              XING_BACKFILL_MAX_RETRIES,
+                              XING_BACKFILL_PAGE_SIZE,
+                              XING_BACKFILL_RETRY_BASE_SEC,
+                              XING_BACKFILL_START_DATE)
+from mm_xing.database.models import t8436OutBlockOrm
+from mm_xing.session_clock import exchange_today
+from mm_xing.tasks.master import (close_shared_client, get_tr_config,
+                                  initialize_client, stream_market_data)
+
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+DAILY = "2"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackfillCheckpoint:
+    """Progress of one symbol, saved after every page.
+
+    t8410 pages run from ``edate`` back towards ``sdate``, so ``edate`` (the
+    oldest date stored so far) is all a restart needs to pick up where the
+    last page left off. ``until`` is the newest date the run was asked for,
+    so a later run with a newer ``edate`` extends a done symbol.
+    """
+    shcode: str
+    sdate: str
+    edate: str
+    until: str = ""
+    status: str = PENDING
+    pages: int = 0
+    bars: int = 0
+    error: Optional[str] = None
+    updated_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class BackfillStats:
+    symbols: int = 0
+    done: int = 0
+    skipped: int = 0
+    failed: int = 0
+    pages: int = 0
+    bars: int = 0
+    retries: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed_sec(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def symbols_per_min(self) -> float:
+        return self.done / self.elapsed_sec * 60 if self.elapsed_sec else 0.0
+
+    @property
+    def bars_per_sec(self) -> float:
+        return self.bars / self.elapsed_sec if self.elapsed_sec else 0.0
+
+    def line(self) -> str:
+        return (
+            f"{self.done + self.skipped + self.failed}/{self.symbols} symbols "
+            f"(done {self.done}, skipped {self.skipped}, failed {self.failed}) | "
+            f"{self.pages} pages, {self.bars} bars, {self.retries} retries | "
+            f"{self.symbols_per_min:.1f} symbols/min, {self.bars_per_sec:.0f} bars/sec"
+        )
+
+
+class CheckpointStore:
+    """Per-symbol checkpoints in a ``diskcache`` directory, one key per (TR, gubun, shcode)."""
+
+    def __init__(self, directory: str = XING_BACKFILL_CHECKPOINT_DIR, tr_code: str = T8410, gubun: str = DAILY):
+        self.cache = Cache(directory=directory)
+        self.prefix = f"{tr_code}:{gubun}:"
+
+    def get(self, shcode: str) -> Optional[BackfillCheckpoint]:
+        value = self.cache.get(self.prefix + shcode)
+        return BackfillCheckpoint(**value) if value else None
+
+    def save(self, checkpoint: BackfillCheckpoint) -> None:
+        checkpoint.updated_at = time.time()
+        self.cache.set(self.prefix + checkpoint.shcode, asdict(checkpoint))
+
+    def clear(self) -> None:
+        for key in list(self.cache.iterkeys()):
+            if key.startswith(self.prefix):
+                del self.cache[key]
+
+    def close(self) -> None:
+        self.cache.close()
+
+
+def load_symbols(session_factory: Callable[[], Session]) -> List[str]:
+    """Every ``shcode`` of the latest t8436 master snapshot."""
+    with session_factory() as db:
+        return list(db.scalars(select(t8436OutBlockOrm.shcode).order_by(t8436OutBlockOrm.shcode)))
+
+
+async def backfill_symbol(
+    client,
+    headers,
+    checkpoint: BackfillCheckpoint,
+    checkpoints: CheckpointStore,
+    bar_store: BarStore,
+    stats: BackfillStats,
+    gubun: str = DAILY,
+    max_retries: int = XING_BACKFILL_MAX_RETRIES,
+) -> BackfillCheckpoint:
+    """Page one symbol's t8410 history into ``bar_store``, checkpointing every page.
+
+    A symbol without data (a page with no rows) is done with 0 bars. A failed
+    page (transport error, rate-limit rejection, ...) is retried with
+    exponential backoff from the last checkpoint; after ``max_retries``
+    consecutive failures the symbol is marked failed and left for the next run.
+    """
+    attempt = 0
+    while True:
+        checkpoint.status = IN_PROGRESS
+        inblock = t8410InBlock(
+            shcode=checkpoint.shcode, gubun=gubun, qrycnt=XING_BACKFILL_PAGE_SIZE,
+            sdate=checkpoint.sdate, edate=checkpoint.edate, comp_yn="N", sujung="Y",
+        )
+        interval = chart_interval(T8410, inblock)
+        config = get_tr_config(T8410, inblock, decoder=MSGSPEC_DECODER)
+        try:
+            async for rows in stream_market_data(
+                client, headers, config, priority=PRIORITY_BATCH, cache=False,
+            ):
+                if not rows:
+                    break
+                bars = Bars.from_rows(rows)
+                # Partition rewrites are blocking file I/O; keep the other symbols paging.
+                await asyncio.to_thread(bar_store.append, checkpoint.shcode, interval, bars)
+                checkpoint.pages += 1
+                checkpoint.bars += len(bars)
+                checkpoint.edate = min(row.date for row in rows)
+                checkpoints.save(checkpoint)
+                stats.pages += 1
+                stats.bars += len(bars)
+                attempt = 0
+            checkpoint.status, checkpoint.error = DONE, None
+            checkpoints.save(checkpoint)
+            return checkpoint
+        except Exception as e:
+            checkpoint.error = f"{type(e).__name__}: {e}"
+            attempt += 1
+            if attempt > max_retries:
+                checkpoint.status = FAILED
+                checkpoints.save(checkpoint)
+                return checkpoint
+            checkpoints.save(checkpoint)
+            stats.retries += 1
+            await asyncio.sleep(XING_BACKFILL_RETRY_BASE_SEC * 2 ** (attempt - 1))
+
+
+async def run_backfill(
+    symbols: Optional[Iterable[str]] = None,
+    sdate: str = XING_BACKFILL_START_DATE,
+    edate: Optional[str] = None,
+    concurrency: int = XING_BACKFILL_CONCURRENCY,
+    restart: bool = False,
+    bar_store: Optional[BarStore] = None,
+    checkpoints: Optional[CheckpointStore] = None,
+    session_factory: Optional[Callable[[], Session]] = None,
+    report_every_sec: float = 30.0,
+) -> BackfillStats:
+    """Backfill t8410 daily bars of every symbol (default: all t8436 shcodes) into the bar store.
+
+    Symbols run ``concurrency`` at a time; every page still takes a batch
+    priority slot of the t8410 rate limit, so interactive calls are served
+    first. Symbols already done through ``edate`` (default: the KST today)
+    are skipped, done ones only fetch the days since their last run, and
+    interrupted ones resume from their checkpoint, unless ``restart`` clears
+    the checkpoints.
+    """
+    if symbols is None:
+        if session_factory is None:
+            from mm_xing.database.session import SessionLocal
+            session_factory = SessionLocal
+        symbols = load_symbols(session_factory)
+    symbols = list(symbols)
+    edate = edate or exchange_today().strftime("%Y%m%d")
+    bar_store = bar_store or BarStore()
+    checkpoints = checkpoints or CheckpointStore()
+    if restart:
+        checkpoints.clear()
+
+    stats = BackfillStats(symbols=len(symbols))
+    semaphore = asyncio.Semaphore(concurrency)
+    client, headers = await initialize_client()
+
+    async def run(shcode: str) -> None:
+        checkpoint = checkpoints.get(shcode)
+        if checkpoint is not None and checkpoint.status == DONE:
+            done_until = checkpoint.until or checkpoint.sdate
+            if done_until >= edate:
+                stats.skipped += 1
+                return
+            # Refetch from the last day done, whose bar may have still been forming.
+            checkpoint = BackfillCheckpoint(
+                shcode=shcode, sdate=done_until, edate=edate, until=edate,
+                pages=checkpoint.pages, bars=checkpoint.bars,
+            )
+        if checkpoint is None:
+            checkpoint = BackfillCheckpoint(shcode=shcode, sdate=sdate, edate=edate, until=edate)
+        async with semaphore:
+            checkpoint = await backfill_symbol(client, headers, checkpoint, checkpoints, bar_store, stats)
+        if checkpoint.status == DONE:
+            stats.done += 1
+        else:
+            stats.failed += 1
+            logger.warning("Backfill of %s failed: %s", shcode, checkpoint.error)
+
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(report_every_sec)
+            logger.info("Backfill progress: %s", stats.line())
+
+    reporter = asyncio.create_task(report())
+    try:
+        await asyncio.gather(*(run(shcode) for shcode in symbols))
+    finally:
+        reporter.cancel()
+        checkpoints.close()
+        await close_shared_client()
+    return stats
@@ -1,53 +1,87 @@
-import asyncio
-from typing import Any, List, Optional
+import hashlib
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
 
-from httpx import Client, Response
+import msgspec
+from httpx import (USE_CLIENT_DEFAULT, AsyncBaseTransport, AsyncClient, Limits,
+                   Response, Timeout)
 from pydantic import BaseModel
 
-from mm_xing.auth import get_access_token
-from mm_xing.block import (o3101InBlock, o3101OutBlock, t1764InBlock,
+from mm_xing.auth import XingTokenManager, XingTokenRejected
+from mm_xing.block import (load_tr, o3101InBlock, o3101OutBlock, t1764InBlock,
                            t1764OutBlock, t8401InBlock, t8401OutBlock,
                            t8424InBlock, t8424OutBlock, t8425InBlock,
                            t8425OutBlock, t8426InBlock, t8426OutBlock,
                            t8436InBlock, t8436OutBlock, t9943InBlock,
                            t9943OutBlock, t9944InBlock, t9944OutBlock)
+from mm_xing.block_struct import QUERY_MAP as STRUCT_QUERY_MAP
+from mm_xing.columnar import OutBlockColumns, to_columns
 from mm_xing.config import settings
-from mm_xing.constant import (O3101,
-                              T1764,
+from mm_xing.constant import (COLUMNAR_DECODER, CONTINUATION_FIELD_PREFIX,
+                              MSGSPEC_DECODER, O3101, PRIORITY_INTERACTIVE,
+                              PYDANTIC_DECODER, T1764,
                               T8401, T8424, T8425, T8426, T8436, T9943, T9943S,
-                              T9943V, T9944, TR_CODE_TO_URL, XING_REST_URL)
+                              T9943V, T9944, TR_CODE_TO_URL,
+                              TR_CONTINUATION_FIELDS,
+                              XING_CONNECT_TIMEOUT_SEC,
+                              XING_KEEPALIVE_EXPIRY_SEC, XING_MAX_CONNECTIONS,
+                              XING_MAX_KEEPALIVE_CONNECTIONS,
+                              XING_REQUEST_TIMEOUT_SEC, XING_REST_URL,
+                              XING_TOKEN_REJECTED_CODE)
+from mm_xing.credential_pool import XingCredentialPool
+from mm_xing.metrics import XING_METRICS, error_code
+from mm_xing.rate_limit import XingRateLimiter
+from mm_xing.response_cache import XingResponseCache
 from mm_xing.schemas import XingDataConfig, XingTrHeaders
+from mm_xing.single_flight import SingleFlight
 
 
-def get_data_config(config_type: str, tr_code: str) -> Optional[XingDataConfig]:
+def get_data_config(
+    config_type: str,
+    tr_code: str,
+    decoder: str = PYDANTIC_DECODER
+) -> Optional[XingDataConfig]:
     """Get data configuration for a given TR code and type.
     
     Args:
         config_type: Type of configuration ("code" or "ticker")
         tr_code: Trading request code
+        decoder: PYDANTIC_DECODER to build pydantic OutBlocks (default), or
+            MSGSPEC_DECODER to decode the raw response bytes into frozen
+            msgspec structs in one pass (much faster for large OutBlock arrays),
+            or COLUMNAR_DECODER to transpose those structs into an
+            ``OutBlockColumns`` of numpy arrays (``mm_xing.columnar``)
     
     Returns:
         XingDataConfig if found, None otherwise
     """
+    def outblock_handler(outblock_cls: Any):
+        if decoder == COLUMNAR_DECODER:
+            return ColumnarOutBlockHandler(outblock_cls.__name__)
+        if decoder == MSGSPEC_DECODER:
+            return StructOutBlockHandler(outblock_cls.__name__)
+        return SingleOutBlockHandler(outblock_cls)
+
     configs = {
         "code": {
             T1764: XingDataConfig(
                 path=TR_CODE_TO_URL[T1764],
                 tr_code=T1764,
                 inblock=t1764InBlock(gubun1="0"),
-                cb_handler=SingleOutBlockHandler(t1764OutBlock),
+                cb_handler=outblock_handler(t1764OutBlock),
             ),
             T8424: XingDataConfig(
                 path=TR_CODE_TO_URL[T8424], 
                 tr_code=T8424,
                 inblock=t8424InBlock(gubun1="0"),
-                cb_handler=SingleOutBlockHandler(t8424OutBlock),
+                cb_handler=outblock_handler(t8424OutBlock),
             ),
             T8425: XingDataConfig(
                 path=TR_CODE_TO_URL[T8425],
                 tr_code=T8425, 
                 inblock=t8425InBlock(dummy=""),
-                cb_handler=SingleOutBlockHandler(t8425OutBlock),
+                cb_handler=outblock_handler(t8425OutBlock),
             ),
         },
         "ticker": {
@@ -55,49 +89,49 @@ def get_data_config(config_type: str, tr_code: str) -> Optional[XingDataConfig]:
                 path=TR_CODE_TO_URL[T8436],
                 tr_code=T8436,
                 inblock=t8436InBlock(gubun="0"),
-                cb_handler=SingleOutBlockHandler(t8436OutBlock),
+                cb_handler=outblock_handler(t8436OutBlock),
             ),
             T8401: XingDataConfig(
                 path=TR_CODE_TO_URL[T8401],
                 tr_code=T8401,
                 inblock=t8401InBlock(dummy="0"),
-                cb_handler=SingleOutBlockHandler(t8401OutBlock),
+                cb_handler=outblock_handler(t8401OutBlock),
             ),
             T8426: XingDataConfig(
                 path=TR_CODE_TO_URL[T8426],
                 tr_code=T8426,
                 inblock=t8426InBlock(dummy="0"),
-                cb_handler=SingleOutBlockHandler(t8426OutBlock),
+                cb_handler=outblock_handler(t8426OutBlock),
             ),
             T9943V: XingDataConfig(
                 path=TR_CODE_TO_URL[T9943],
                 tr_code=T9943,
                 inblock=t9943InBlock(gubun="V"),
-                cb_handler=SingleOutBlockHandler(t9943OutBlock),
+                cb_handler=outblock_handler(t9943OutBlock),
             ),
             T9943S: XingDataConfig(
                 path=TR_CODE_TO_URL[T9943],
                 tr_code=T9943,
                 inblock=t9943InBlock(gubun="S"),
-                cb_handler=SingleOutBlockHandler(t9943OutBlock),
+                cb_handler=outblock_handler(t9943OutBlock),
             ),
             T9943: XingDataConfig(
                 path=TR_CODE_TO_URL[T9943],
                 tr_code=T9943,
                 inblock=t9943InBlock(gubun=""),
-                cb_handler=SingleOutBlockHandler(t9943OutBlock),
+                cb_handler=outblock_handler(t9943OutBlock),
             ),
             T9944: XingDataConfig(
                 path=TR_CODE_TO_URL[T9944],
                 tr_code=T9944,
                 inblock=t9944InBlock(dummy="0"),
-                cb_handler=SingleOutBlockHandler(t9944OutBlock),
+                cb_handler=outblock_handler(t9944OutBlock),
             ),
             O3101: XingDataConfig(
                 path=TR_CODE_TO_URL[O3101],
                 tr_code=O3101,
                 inblock=o3101InBlock(gubun="0"),
-                cb_handler=SingleOutBlockHandler(o3101OutBlock)
+                cb_handler=outblock_handler(o3101OutBlock)
             ),
         }
     }
@@ -106,6 +140,7 @@ def get_data_config(config_type: str, tr_code: str) -> Optional[XingDataConfig]:
 class SingleOutBlockHandler:
     def __init__(self, outblock_cls: Any):
         self.outblock_cls = outblock_cls
+        self.decoder_key = (PYDANTIC_DECODER, outblock_cls.__name__)
         
     def __call__(self, response: Response, config: XingDataConfig) -> List[Optional[BaseModel]]:    
         """Process the API response and convert to a list of model instances.
@@ -128,46 +163,447 @@ class SingleOutBlockHandler:
             ValueError: If response indicates an error (e.g. {'rsp_cd': 'IGW00214', 'rsp_msg': 'TR CD는 필수 입니다.'})
         """
         try:
-            data = response.json()[f"{config.tr_code}OutBlock"]
+            data = response.json()[self.outblock_cls.__name__]
         except KeyError:
             raise KeyError(f"Response does not contain expected outblock data: {response.json()}")
         return [self.outblock_cls(**x) for x in data ]
 
 
-def request_xing_api(
-    client: Client,
+@lru_cache(maxsize=None)
+def get_struct_decoder(tr_code: str) -> msgspec.json.Decoder:
+    """Return the (cached) decoder of ``tr_code``'s whole REST response envelope.
+
+    ``strict=False`` lets numeric fields sent as strings coerce the way
+    pydantic's lax mode does.
+    """
+    return msgspec.json.Decoder(STRUCT_QUERY_MAP[tr_code], strict=False)
+
+
+class StructOutBlockHandler:
+    def __init__(self, outblock_name: str):
+        self.tr_code, suffix = outblock_name.split("OutBlock")
+        # the envelope struct exposes "t8410OutBlock1" as `outblock1`
+        self.outblock_field = f"outblock{suffix}"
+        self.decoder_key = (MSGSPEC_DECODER, outblock_name)
+
+    def __call__(self, response: Response, config: XingDataConfig) -> List[msgspec.Struct]:
+        """Decode the raw response bytes straight into ``mm_xing.block_struct`` OutBlocks.
+
+        Args:
+            response (Response): The HTTP response from the Xing API
+            config (XingDataConfig): Configuration for the TR request
+        Returns:
+            List[msgspec.Struct]: e.g. [t1764OutBlock(rank=0, tradno='000', tradname='외국계회원사전체'), ...]
+                An empty list when a successful (HTTP 200) response has no
+                outblock, i.e. there is no data, e.g. a chart before listing.
+
+        Raises:
+            KeyError: If an error response does not contain expected outblock data
+        """
+        payload = get_struct_decoder(self.tr_code).decode(response.content)
+        data = getattr(payload, self.outblock_field, None)
+        if data is None:
+            if response.status_code == 200:
+                return []
+            raise KeyError(
+                "Response does not contain expected outblock data: "
+                f"{{'rsp_cd': {payload.rsp_cd!r}, 'rsp_msg': {payload.rsp_msg!r}}}"
+            )
+        return data if isinstance(data, list) else [data]
+
+
+class ColumnarOutBlockHandler(StructOutBlockHandler):
+    def __init__(self, outblock_name: str):
+        super().__init__(outblock_name)
+        self.struct_cls = getattr(STRUCT_QUERY_MAP.load_tr(self.tr_code), outblock_name)
+        self.decoder_key = (COLUMNAR_DECODER, outblock_name)
+
+    def __call__(self, response: Response, config: XingDataConfig) -> OutBlockColumns:
+        """Decode the raw response bytes into msgspec rows and transpose them in one pass.
+
+        Returns:
+            OutBlockColumns: e.g. <OutBlockColumns t8410OutBlock1 rows=2000 columns=['date', 'open', ...]>
+
+        Raises:
+            KeyError: If response does not contain expected outblock data
+        """
+        return to_columns(self.struct_cls, super().__call__(response, config))
+
+
+async def post_xing_api(
+    client: AsyncClient,
+    headers: XingTrHeaders,
+    config: XingDataConfig,
+    inblock: Optional[BaseModel] = None,
+) -> Response:
+    inblock = inblock if inblock is not None else config.inblock
+    return await client.post(
+        url=config.path,
+        json={inblock.__class__.__name__: inblock.model_dump()},
+        headers=headers.model_dump(by_alias=True),
+        timeout=config.timeout if config.timeout is not None else USE_CLIENT_DEFAULT,
+    )
+
+
+async def call_xing_api(
+    client: AsyncClient,
+    headers: XingTrHeaders,
+    config: XingDataConfig,
+    inblock: Optional[BaseModel] = None,
+) -> Tuple[Response, Any]:
+    """Post a TR call and decode it with ``config.cb_handler``, recording it in ``XING_METRICS``.
+
+    Latency covers the request and the decoding; a failed call is counted by
+    its ``rsp_cd`` (or exception name) and re-raised.
+
+    Raises:
+        XingTokenRejected: If the API refused the bearer token (HTTP 401 or
+            ``IGW00121``), so its owner can drop it
+    """
+    start = time.perf_counter()
+    response = None
+    try:
+        response = await post_xing_api(client, headers, config, inblock)
+        data = config.cb_handler(response, config=config)
+    except Exception as e:
+        XING_METRICS.observe_error(config.tr_code, time.perf_counter() - start, response, e)
+        if response is not None and (
+            response.status_code == 401 or error_code(response, e) == XING_TOKEN_REJECTED_CODE
+        ):
+            raise XingTokenRejected(headers.authorization) from e
+        raise
+    XING_METRICS.observe_call(config.tr_code, time.perf_counter() - start, len(response.content), len(data))
+    return response, data
+
+
+async def request_xing_api(
+    client: AsyncClient,
     headers: XingTrHeaders,
     config: XingDataConfig
 ) -> List[Optional[BaseModel]]:
-    return config.cb_handler(
-        client.post(
-            url=config.path,
-            json={config.inblock.__class__.__name__: config.inblock.model_dump()},
-            headers=headers.model_dump(by_alias=True),
-        ),
-        config=config
+    _, data = await call_xing_api(client, headers, config)
+    return data
+
+
+def request_key(
+    client: AsyncClient,
+    config: XingDataConfig,
+    inblock: BaseModel,
+    tr_cont_key: str = "",
+    scope: str = "",
+) -> tuple:
+    """Identity of a TR request: the same API, TR, InBlock and continuation key get the same response.
+
+    ``scope`` names the credential whose session a stream's continuation keys
+    belong to, so neither a page nor the key it returns is replayed under
+    another app key.
+    """
+    return (
+        config.tr_code, str(client.base_url), config.path,
+        type(inblock).__name__, inblock.model_dump_json(), tr_cont_key, scope,
     )
 
+
+def flight_key(
+    client: AsyncClient,
+    config: XingDataConfig,
+    inblock: BaseModel,
+    tr_cont_key: str = "",
+    scope: str = "",
+) -> tuple:
+    """Identity of a TR call for coalescing: the same request (``request_key``) and decoder.
+
+    Handlers without a ``decoder_key`` (e.g. custom callables) only match
+    calls of the same handler object.
+    """
+    handler = config.cb_handler
+    return (*request_key(client, config, inblock, tr_cont_key, scope), getattr(handler, "decoder_key", id(handler)))
+
+
+async def shared_call(
+    client: AsyncClient,
+    config: XingDataConfig,
+    inblock: BaseModel,
+    call: Callable[[], Awaitable[Tuple[Response, Any]]],
+    tr_cont_key: str = "",
+    scope: str = "",
+    coalesce: bool = True,
+    cache: bool = True,
+) -> Tuple[Response, Any]:
+    """Run ``call`` through the response cache and the single-flight coalescer."""
+    def flight():
+        if not coalesce:
+            return call()
+        return get_single_flight().do(config.tr_code, flight_key(client, config, inblock, tr_cont_key, scope), call)
+
+    if not cache:
+        return await flight()
+    return await get_response_cache().fetch(config, request_key(client, config, inblock, tr_cont_key, scope), flight)
+
+
 async def fetch_market_data(
-    client: Client,
+    client: AsyncClient,
     headers: XingTrHeaders,
     config: XingDataConfig,
-    delay_sec: float = 1
+    priority: int = PRIORITY_INTERACTIVE,
+    rate_limiter: Optional[XingRateLimiter] = None,
+    pool: Optional[XingCredentialPool] = None,
+    coalesce: bool = True,
+    cache: bool = True,
 ) -> List[Optional[BaseModel]]:
-    """Fetch market data for given configurations"""
-    headers.update_tr_code(config.tr_code)
-    result = request_xing_api(client, headers, config)
-    await asyncio.sleep(delay_sec)
-    return result
-
-
-async def initialize_client() -> tuple[Client, XingTrHeaders]:
-    """Initialize HTTP client and headers"""
-    client = Client(verify=False, base_url=XING_REST_URL)
-    access_token = get_access_token(
-        client,
-        app_key=settings.XING_APP_KEY,
-        app_secret=settings.XING_APP_SECRET,
+    """Fetch market data for given configurations
+
+    The call waits for a rate-limited slot instead of sleeping a fixed delay;
+    pass ``PRIORITY_BATCH`` for backfills so interactive requests are served
+    first. By default the slot is leased from the least-loaded app key of the
+    shared credential pool and ``headers`` get that key's token; with only a
+    ``rate_limiter`` given, the call uses it and ``headers`` as they are.
+
+    Responses of TRs with a cache policy are served from the response cache
+    while fresh (``mm_xing.response_cache``) unless ``cache=False``, and
+    concurrent calls of the same TR and InBlock (``flight_key``) share one
+    call unless ``coalesce=False``. Either way callers may get the same rows
+    object, which must not be mutated.
+    """
+    # Copy instead of mutating: the same headers are shared by concurrent calls.
+    headers = headers.model_copy(update={"tr_code": config.tr_code})
+
+    async def call():
+        if rate_limiter is not None and pool is None:
+            await rate_limiter.acquire(config.tr_code, config.path, priority)
+            return await call_xing_api(client, headers, config)
+        async with (pool or get_credential_pool()).lease(config.tr_code, config.path, priority) as credential:
+            return await call_xing_api(client, await credential.authorize(headers), config)
+
+    _, data = await shared_call(client, config, config.inblock, call, coalesce=coalesce, cache=cache)
+    return data
+
+
+def get_tr_config(
+    tr_code: str,
+    inblock: BaseModel,
+    outblock: str = "OutBlock1",
+    decoder: str = PYDANTIC_DECODER,
+) -> XingDataConfig:
+    """Build the config of any TR in ``TR_CODE_TO_URL`` whose rows are ``{tr_code}{outblock}``.
+
+    e.g. ``get_tr_config("t8410", t8410InBlock(shcode="005930", gubun="2", ...))``
+    """
+    outblock_name = f"{tr_code}{outblock}"
+    if decoder == COLUMNAR_DECODER:
+        cb_handler: Any = ColumnarOutBlockHandler(outblock_name)
+    elif decoder == MSGSPEC_DECODER:
+        cb_handler = StructOutBlockHandler(outblock_name)
+    else:
+        cb_handler = SingleOutBlockHandler(getattr(load_tr(tr_code), outblock_name))
+    return XingDataConfig(
+        path=TR_CODE_TO_URL[tr_code],
+        tr_code=tr_code,
+        inblock=inblock,
+        cb_handler=cb_handler,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_continuation_decoder(tr_code: str) -> msgspec.json.Decoder:
+    """Decode only ``{tr_code}OutBlock`` (the continuation fields) and skip the rows."""
+    envelope = msgspec.defstruct(
+        f"{tr_code}ContinuationEnvelope",
+        [("outblock", Optional[dict], msgspec.field(default=None, name=f"{tr_code}OutBlock"))],
+    )
+    return msgspec.json.Decoder(envelope)
+
+
+def get_continuation_fields(tr_code: str, inblock: BaseModel) -> tuple:
+    if tr_code in TR_CONTINUATION_FIELDS:
+        return TR_CONTINUATION_FIELDS[tr_code]
+    return tuple(
+        name for name in type(inblock).model_fields
+        if name.startswith(CONTINUATION_FIELD_PREFIX) or name == "idx"
+    )
+
+
+def next_inblock(tr_code: str, inblock: BaseModel, response: Response) -> BaseModel:
+    """Copy the continuation values of ``response``'s OutBlock into a new InBlock."""
+    outblock = get_continuation_decoder(tr_code).decode(response.content).outblock or {}
+    update = {
+        name: outblock[name]
+        for name in get_continuation_fields(tr_code, inblock)
+        if name in outblock
+    }
+    return inblock.model_copy(update=update) if update else inblock
+
+
+async def stream_market_data(
+    client: AsyncClient,
+    headers: XingTrHeaders,
+    config: XingDataConfig,
+    max_pages: Optional[int] = None,
+    priority: int = PRIORITY_INTERACTIVE,
+    rate_limiter: Optional[XingRateLimiter] = None,
+    pool: Optional[XingCredentialPool] = None,
+    coalesce: bool = True,
+    cache: bool = True,
+) -> AsyncIterator[List[Any]]:
+    """Yield the rows of every page of a TR, following continuation keys.
+
+    Each page is requested with ``tr_cont="Y"`` and the ``tr_cont_key`` the
+    previous response returned, and with the InBlock's ``cts_*``/``idx`` fields
+    refilled from the previous OutBlock. Pages are yielded as they arrive, so
+    long histories (t1305, t8410, t1702, t1637, ...) can be written out with
+    bounded memory. Every page takes its own slot from the rate limiter.
+    Like ``fetch_market_data``, the pages go through the shared credential pool
+    unless only a ``rate_limiter`` is given; the whole sequence stays on the
+    app key picked for its first page, whose token the continuation key
+    belongs to. Pages are cached and coalesced like ``fetch_market_data``
+    calls, keyed by their continuation keys and that app key (or, with only a
+    ``rate_limiter``, the token of ``headers``), so they are shared only among
+    streams of the same session.
+
+    Example:
+        >>> config = get_tr_config(T8410, t8410InBlock(shcode="005930", gubun="2", qrycnt=2000,
+        ...                                            sdate="20000101", edate="99999999", comp_yn="N", sujung="Y"))
+        >>> async for rows in stream_market_data(client, headers, config):
+        ...     store.append(rows)
+    """
+    if rate_limiter is None or pool is not None:
+        pool = pool or get_credential_pool()
+        credential = pool.pick(config.tr_code)
+        scope = credential.name
+    else:
+        scope = "token:" + hashlib.sha256(headers.authorization.encode()).hexdigest()[:16]
+    headers = headers.model_copy(update={"tr_code": config.tr_code, "tr_cont": "N", "tr_cont_key": ""})
+    inblock = config.inblock
+    page = 0
+    while True:
+        async def call():
+            if pool is not None:
+                async with pool.lease(config.tr_code, config.path, priority, credential):
+                    return await call_xing_api(client, await credential.authorize(headers), config, inblock)
+            await rate_limiter.acquire(config.tr_code, config.path, priority)
+            return await call_xing_api(client, headers, config, inblock)
+
+        response, data = await shared_call(
+            client, config, inblock, call, tr_cont_key=headers.tr_cont_key, scope=scope, coalesce=coalesce, cache=cache,
+        )
+        yield data
+        page += 1
+
+        if response.headers.get("tr_cont", "N") != "Y" or (max_pages is not None and page >= max_pages):
+            return
+        cont_key = response.headers.get("tr_cont_key", "")
+        following = next_inblock(config.tr_code, inblock, response)
+        if following == inblock and cont_key == headers.tr_cont_key:
+            # Nothing would change in the next request; stop rather than loop forever.
+            return
+        inblock = following
+        headers = headers.model_copy(update={"tr_cont": "Y", "tr_cont_key": cont_key})
+
+
+def is_http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_async_client(base_url: str = XING_REST_URL, transport: Optional[AsyncBaseTransport] = None) -> AsyncClient:
+    """Create a keep-alive pooled client for the Xing REST API (HTTP/2 if ``h2`` is installed).
+
+    ``transport`` replaces the network, e.g. ``httpx.ASGITransport`` of the
+    offline stand-in (``mm_xing.standin``).
+    """
+    return AsyncClient(
+        verify=False,
+        base_url=base_url,
+        transport=transport,
+        http2=is_http2_available(),
+        limits=Limits(
+            max_connections=XING_MAX_CONNECTIONS,
+            max_keepalive_connections=XING_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=XING_KEEPALIVE_EXPIRY_SEC,
+        ),
+        timeout=Timeout(XING_REQUEST_TIMEOUT_SEC, connect=XING_CONNECT_TIMEOUT_SEC),
     )
+
+
+_shared_client: Optional[AsyncClient] = None
+_credential_pool: Optional[XingCredentialPool] = None
+_single_flight: Optional[SingleFlight] = None
+_response_cache: Optional[XingResponseCache] = None
+
+
+def get_shared_client() -> AsyncClient:
+    """Return the process-wide client so concurrent TR calls share one connection pool."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_async_client()
+    return _shared_client
+
+
+def get_credential_pool() -> XingCredentialPool:
+    """Return the process-wide pool of ``XING_APP_KEY`` and the ``XING_APP_KEYS``, which TR calls are spread over."""
+    global _credential_pool
+    if _credential_pool is None:
+        _credential_pool = XingCredentialPool.from_app_keys(
+            get_shared_client,
+            {settings.XING_APP_KEY: settings.XING_APP_SECRET, **settings.XING_APP_KEYS},
+            tr_limits=settings.XING_TR_RATE_LIMITS,
+            path_limits=settings.XING_PATH_RATE_LIMITS,
+        )
+    return _credential_pool
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide coalescer of identical concurrent TR calls."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+def get_response_cache() -> XingResponseCache:
+    """Return the process-wide TR response cache (policies from ``XING_CACHE_POLICIES``)."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = XingResponseCache(policies=settings.XING_CACHE_POLICIES)
+    return _response_cache
+
+
+def get_token_manager() -> XingTokenManager:
+    """Return the process-wide token manager of ``XING_APP_KEY``."""
+    return get_credential_pool().credentials[0].token_manager
+
+
+def get_rate_limiter() -> XingRateLimiter:
+    """Return the process-wide rate limiter of ``XING_APP_KEY``."""
+    return get_credential_pool().credentials[0].rate_limiter
+
+
+async def close_shared_client() -> None:
+    """Close the shared client and the response cache, and stop the token managers' background refresh."""
+    global _shared_client, _credential_pool, _response_cache
+    if _credential_pool is not None:
+        await _credential_pool.close()
+        _credential_pool = None
+    if _response_cache is not None:
+        _response_cache.close()
+        _response_cache = None
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+async def initialize_client() -> tuple[AsyncClient, XingTrHeaders]:
+    """Initialize HTTP client and headers
+
+    The returned client is the shared instance; callers must not close it
+    (see ``close_shared_client``). The bearer token comes from the shared
+    token cache, so this only reaches the OAuth endpoint when no process on
+    the host holds a fresh token.
+    """
+    client = get_shared_client()
+    access_token = await get_token_manager().get_access_token()
     headers = XingTrHeaders.update_access_token(access_token)
-    return client, headers
\ No newline at end of file
+    return client, headers
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from mm_xing.constant import MSGSPEC_DECODER, PRIORITY_BATCH, TR_CODE_TO_TYPE
+from mm_xing.database.models import TR_CODE_TO_ORM, RountineTaskOrm
+from mm_xing.database.writer import upsert_rows
+from mm_xing.tasks.master import (close_shared_client, fetch_market_data,
+                                  get_data_config, initialize_client)
+
+
+@dataclass
+class SnapshotResult:
+    tr_code: str
+    rows: int = 0
+    fetch_sec: float = 0.0
+    persist_sec: float = 0.0
+    error: Optional[str] = None
+
+
+def persist_snapshot(db: Session, tr_code: str, rows: List[Any]) -> None:
+    """Upsert ``rows`` into ``tr_code``'s table and mark its routine task done.
+
+    Rows are merged on the table's natural key (``upsert_rows``), so re-running
+    the snapshot refreshes existing rows instead of duplicating them.
+    """
+    upsert_rows(db, TR_CODE_TO_ORM[tr_code], rows)
+    db.add(RountineTaskOrm(task_name=tr_code, status="done"))
+    db.commit()
+
+
+async def snapshot_tr(
+    client,
+    headers,
+    tr_code: str,
+    session_factory: Optional[Callable[[], Session]],
+) -> SnapshotResult:
+    result = SnapshotResult(tr_code=tr_code)
+    try:
+        config = get_data_config(TR_CODE_TO_TYPE[tr_code], tr_code, decoder=MSGSPEC_DECODER)
+        start = time.perf_counter()
+        # The snapshot is what refreshes the masters: always call the API.
+        rows = await fetch_market_data(client, headers, config, priority=PRIORITY_BATCH, cache=False)
+        result.fetch_sec = time.perf_counter() - start
+        result.rows = len(rows)
+
+        if session_factory is not None:
+            def persist():
+                with session_factory() as db:
+                    try:
+                        persist_snapshot(db, tr_code, rows)
+                    except Exception:
+                        db.rollback()
+                        raise
+
+            start = time.perf_counter()
+            # Session I/O is blocking; keep the other TR fetches running meanwhile.
+            await asyncio.to_thread(persist)
+            result.persist_sec = time.perf_counter() - start
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+async def run_snapshot(
+    tr_codes: Optional[Iterable[str]] = None,
+    session_factory: Optional[Callable[[], Session]] = None,
+    persist: bool = True,
+) -> List[SnapshotResult]:
+    """Fetch every master TR (``TR_CODE_TO_TYPE``) concurrently and persist the results.
+
+    Calls run concurrently but each takes a slot from the shared rate limiter,
+    at batch priority. A failed TR is reported in its result and does not stop
+    the others.
+    """
+    if persist and session_factory is None:
+        from mm_xing.database.session import SessionLocal
+        session_factory = SessionLocal
+
+    client, headers = await initialize_client()
+    try:
+        return list(await asyncio.gather(*(
+            snapshot_tr(client, headers, tr_code, session_factory if persist else None)
+            for tr_code in (tr_codes or TR_CODE_TO_TYPE)
+        )))
+    finally:
+        await close_shared_client()
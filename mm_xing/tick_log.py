@@ -0,0 +1,336 @@
+"""Append-only binary log of realtime feed messages, replayable through mmap.
+
+Every feed TR gets a fixed-width record derived from its ``.res`` OutBlock
+(``mm_xing.block_struct._layout``, written by
+``res_converter.create_feed_layout``): ``char`` fields keep their ``.res``
+byte length (cp949), ``long`` fields become int32/int64 depending on their
+digits and ``float``/``double`` fields float64. Each record starts with a
+global sequence number, the receive time (ns since epoch) and the ``tr_key``.
+
+Records go to ``<root>/<YYYYMMDD>/<tr_code>/<segment>.seg`` of the KST day
+they were received on; a segment is a
+32-byte header followed by records and is rotated once it reaches
+``segment_bytes``. ``TickLogReader`` maps segments as numpy structured arrays
+and ``TickLogReplay`` merges a day's TRs back into ``RealtimeMessage`` objects
+in sequence order, as fast as possible or paced at ``speed`` times real time,
+so the handlers of the live ``XingRealtimeClient`` (``TickStore``,
+``OrderBookEngine``, ``BarAggregator``, ...) run unchanged on a replay.
+"""
+import asyncio
+import heapq
+import os
+import struct
+import time
+import zlib
+from datetime import date, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from mm_xing.block_struct import load_tr
+from mm_xing.block_struct._layout import FEED_LAYOUT
+from mm_xing.constant import XING_TICK_LOG_DIR, XING_TICK_LOG_SEGMENT_BYTES
+from mm_xing.realtime import RealtimeMessage
+from mm_xing.session_clock import KST_OFFSET_SEC, exchange_day, midnight
+
+MAGIC = b"MMXTLOG1"
+SEGMENT_HEADER = struct.Struct("<8sII16x")  # magic, record size, layout checksum
+SEGMENT_SUFFIX = ".seg"
+ENCODING = "cp949"
+DECODE_CHUNK = 4096
+
+SEQ, TS, KEY = "_seq", "_ts", "_key"
+
+NS_PER_SEC = 1_000_000_000
+
+
+class RecordLayout:
+    """Fixed-width record of one feed TR, both as ``struct`` packer and numpy dtype."""
+
+    def __init__(self, tr_code: str):
+        layout = FEED_LAYOUT[tr_code]
+        self.tr_code = tr_code
+        self.outblock = getattr(load_tr(tr_code), f"{tr_code}OutBlock")
+        names = self.outblock.__struct_fields__
+        if len(names) != len(layout["fields"]):
+            raise ValueError(f"{tr_code}OutBlock does not match its .res layout; regenerate block_struct")
+        fields = [(SEQ, "Q"), (TS, "q"), (KEY, f"{max(layout['key'], 1)}s")]
+        # Both follow the .res field order.
+        for name, (_, res_type, length) in zip(names, layout["fields"]):
+            if res_type == "char":
+                fields.append((name, f"{int(length)}s"))
+            elif res_type == "long":
+                fields.append((name, "i" if int(length) <= 9 else "q"))
+            else:
+                fields.append((name, "d"))
+        self.packer = struct.Struct("<" + "".join(code for _, code in fields))
+        self.dtype = np.dtype([(name, "<" + code if code[-1] != "s" else f"S{code[:-1]}") for name, code in fields])
+        assert self.dtype.itemsize == self.packer.size
+        self.record_size = self.packer.size
+        self.checksum = zlib.crc32(repr(fields).encode())
+        self.getter = attrgetter(*self.outblock.__struct_fields__)
+        self.text_fields = [i for i, (_, code) in enumerate(fields[3:]) if code[-1] == "s"]
+        self.text_columns = [name for name, code in fields if code[-1] == "s"]
+
+    def pack(self, seq: int, ts: int, tr_key: str, body: Any) -> bytes:
+        values = list(self.getter(body))
+        for i in self.text_fields:
+            values[i] = values[i].encode(ENCODING, "replace")
+        return self.packer.pack(seq, ts, tr_key.encode(ENCODING, "replace"), *values)
+
+    def decode(self, records: np.ndarray) -> Iterator[Tuple[int, int, RealtimeMessage]]:
+        """Turn a slice of records back into ``(seq, ts, RealtimeMessage)`` tuples."""
+        columns = []
+        for name in self.dtype.names:
+            column = records[name]
+            if name in self.text_columns:
+                column = np.char.decode(column, ENCODING, "replace")
+            columns.append(column.tolist())
+        tr_code, outblock = self.tr_code, self.outblock
+        for seq, ts, tr_key, *values in zip(*columns):
+            yield seq, ts, RealtimeMessage(tr_code, tr_key, outblock(*values))
+
+
+@lru_cache(maxsize=None)
+def get_layout(tr_code: str) -> RecordLayout:
+    if tr_code not in FEED_LAYOUT:
+        raise KeyError(f"No feed layout for TR code: {tr_code}")
+    return RecordLayout(tr_code)
+
+
+def segment_paths(directory: str) -> List[str]:
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(SEGMENT_SUFFIX)
+    )
+
+
+def read_segment(path: str, layout: RecordLayout) -> np.ndarray:
+    """Map the complete records of a segment (a trailing partial record is ignored)."""
+    with open(path, "rb") as f:
+        header = f.read(SEGMENT_HEADER.size)
+    if len(header) < SEGMENT_HEADER.size:
+        return np.empty(0, layout.dtype)
+    magic, record_size, checksum = SEGMENT_HEADER.unpack(header)
+    if magic != MAGIC or record_size != layout.record_size or checksum != layout.checksum:
+        raise ValueError(f"{path} was not written with the current {layout.tr_code} layout")
+    count = (os.path.getsize(path) - SEGMENT_HEADER.size) // record_size
+    if count == 0:
+        return np.empty(0, layout.dtype)
+    return np.memmap(path, layout.dtype, mode="r", offset=SEGMENT_HEADER.size, shape=(count,))
+
+
+class _Segment:
+    __slots__ = ("file", "size")
+
+    def __init__(self, path: str, layout: RecordLayout):
+        self.file = open(path, "xb")
+        self.file.write(SEGMENT_HEADER.pack(MAGIC, layout.record_size, layout.checksum))
+        self.size = SEGMENT_HEADER.size
+
+
+class TickLogWriter:
+    """Appends realtime messages of one session day to the tick log.
+
+    Every writer starts fresh segments, so restarting a recorder mid-session
+    never touches data already on disk; sequence numbers continue after the
+    highest one logged that day. Without a ``session_date`` the day is the
+    KST day of the receive time, and the writer moves to the next day's
+    directory at KST midnight.
+
+    Example:
+        >>> with TickLogWriter() as log:
+        ...     async for message in client:  # XingRealtimeClient
+        ...         log.append_message(message)
+        ...         engine.apply_message(message)
+    """
+
+    def __init__(
+        self,
+        root: str = XING_TICK_LOG_DIR,
+        session_date: Optional[date] = None,
+        segment_bytes: int = XING_TICK_LOG_SEGMENT_BYTES,
+        clock: Callable[[], int] = time.time_ns,
+    ):
+        self.root = root
+        self.session_date = session_date
+        self.segment_bytes = segment_bytes
+        self.clock = clock
+        self.segments: Dict[str, _Segment] = {}
+        self.written = 0
+        self._start_day(session_date or exchange_day(clock()))
+
+    def _start_day(self, day: date) -> None:
+        self.close()
+        self.day = day
+        self.directory = os.path.join(self.root, day.strftime("%Y%m%d"))
+        # Receive time (ns since epoch) at which the next KST day starts; a fixed session_date never ends.
+        next_day = midnight(day + timedelta(days=1)) - KST_OFFSET_SEC
+        self._day_end = None if self.session_date is not None else next_day * NS_PER_SEC
+        self.seq = self._last_seq() + 1
+
+    def _last_seq(self) -> int:
+        last = -1
+        if not os.path.isdir(self.directory):
+            return last
+        for tr_code in os.listdir(self.directory):
+            paths = segment_paths(os.path.join(self.directory, tr_code))
+            if tr_code not in FEED_LAYOUT or not paths:
+                continue
+            for path in reversed(paths):
+                records = read_segment(path, get_layout(tr_code))
+                if len(records):
+                    last = max(last, int(records[SEQ][-1]))
+                    break
+        return last
+
+    def _open(self, tr_code: str, layout: RecordLayout) -> _Segment:
+        directory = os.path.join(self.directory, tr_code)
+        os.makedirs(directory, exist_ok=True)
+        paths = segment_paths(directory)
+        index = int(os.path.basename(paths[-1])[:-len(SEGMENT_SUFFIX)]) + 1 if paths else 0
+        segment = self.segments[tr_code] = _Segment(os.path.join(directory, f"{index:06d}{SEGMENT_SUFFIX}"), layout)
+        return segment
+
+    def append(self, tr_code: str, tr_key: str, body: Any, ts: Optional[int] = None) -> None:
+        ts = self.clock() if ts is None else ts
+        if self._day_end is not None and ts >= self._day_end:
+            self._start_day(exchange_day(ts))
+        layout = get_layout(tr_code)
+        segment = self.segments.get(tr_code)
+        if segment is None or segment.size + layout.record_size > self.segment_bytes:
+            if segment is not None:
+                segment.file.close()
+            segment = self._open(tr_code, layout)
+        segment.file.write(layout.pack(self.seq, ts, tr_key, body))
+        segment.size += layout.record_size
+        self.seq += 1
+        self.written += 1
+
+    def append_message(self, message: RealtimeMessage, ts: Optional[int] = None) -> bool:
+        """Log a feed message; returns False for TRs without a feed layout."""
+        if message.tr_code not in FEED_LAYOUT:
+            return False
+        self.append(message.tr_code, message.tr_key, message.body, ts)
+        return True
+
+    def flush(self) -> None:
+        for segment in self.segments.values():
+            segment.file.flush()
+
+    def close(self) -> None:
+        for segment in self.segments.values():
+            segment.file.close()
+        self.segments.clear()
+
+    def __enter__(self) -> "TickLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class TickLogReader:
+    """Read side of the tick log: days, TRs and memory-mapped records."""
+
+    def __init__(self, root: str = XING_TICK_LOG_DIR):
+        self.root = root
+
+    def days(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root) if name.isdigit())
+
+    def tr_codes(self, day: str) -> List[str]:
+        directory = os.path.join(self.root, day)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name for name in os.listdir(directory) if name in FEED_LAYOUT)
+
+    def records(self, day: str, tr_code: str) -> List[np.ndarray]:
+        """Per-segment structured arrays (memmap views) of ``tr_code`` on ``day``."""
+        layout = get_layout(tr_code)
+        return [read_segment(path, layout) for path in segment_paths(os.path.join(self.root, day, tr_code))]
+
+    def count(self, day: str, tr_codes: Optional[Iterable[str]] = None) -> int:
+        return sum(len(records) for tr_code in tr_codes or self.tr_codes(day) for records in self.records(day, tr_code))
+
+    def _tr_messages(self, day: str, tr_code: str, tr_keys: Optional[set]) -> Iterator[Tuple[int, int, RealtimeMessage]]:
+        layout = get_layout(tr_code)
+        for records in self.records(day, tr_code):
+            if tr_keys is not None:
+                wanted = np.array(sorted(key.encode(ENCODING) for key in tr_keys), records.dtype[KEY])
+                records = records[np.isin(records[KEY], wanted)]
+            for start in range(0, len(records), DECODE_CHUNK):
+                yield from layout.decode(records[start:start + DECODE_CHUNK])
+
+    def messages(
+        self, day: str, tr_codes: Optional[Iterable[str]] = None, tr_keys: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[int, RealtimeMessage]]:
+        """Yield ``(receive ts ns, message)`` of ``day`` in the order they were logged."""
+        tr_keys = set(tr_keys) if tr_keys else None
+        streams = [self._tr_messages(day, tr_code, tr_keys) for tr_code in tr_codes or self.tr_codes(day)]
+        for _, ts, message in heapq.merge(*streams):
+            yield ts, message
+
+
+class TickLogReplay:
+    """Async iterator of a logged day, interchangeable with ``XingRealtimeClient``.
+
+    Args:
+        day: ``YYYYMMDD`` of the session to replay
+        speed: Multiple of real time (``None``: as fast as possible)
+        tr_codes / tr_keys: Optional filters
+        reader: ``TickLogReader`` (default: the default log directory)
+    """
+
+    def __init__(
+        self,
+        day: str,
+        speed: Optional[float] = None,
+        tr_codes: Optional[Iterable[str]] = None,
+        tr_keys: Optional[Iterable[str]] = None,
+        reader: Optional[TickLogReader] = None,
+    ):
+        self.day = day
+        self.speed = speed
+        self.tr_codes = list(tr_codes) if tr_codes else None
+        self.tr_keys = list(tr_keys) if tr_keys else None
+        self.reader = reader or TickLogReader()
+        self.received = 0
+
+    def __iter__(self) -> Iterator[RealtimeMessage]:
+        for _, message in self.reader.messages(self.day, self.tr_codes, self.tr_keys):
+            self.received += 1
+            yield message
+
+    async def __aiter__(self) -> AsyncIterator[RealtimeMessage]:
+        start = first_ts = None
+        for ts, message in self.reader.messages(self.day, self.tr_codes, self.tr_keys):
+            if self.speed:
+                if start is None:
+                    start, first_ts = time.perf_counter(), ts
+                ahead = (ts - first_ts) / 1e9 / self.speed - (time.perf_counter() - start)
+                if ahead > 0.001:
+                    await asyncio.sleep(ahead)
+            elif self.received % DECODE_CHUNK == 0:
+                await asyncio.sleep(0)  # let other tasks run during a full-speed replay
+            self.received += 1
+            yield message
+
+
+async def run_backtest(source: AsyncIterator[RealtimeMessage], handlers: Sequence[Callable[[RealtimeMessage], Any]]) -> int:
+    """Feed every message of ``source`` (a ``TickLogReplay`` or a live client) to ``handlers``.
+
+    Returns:
+        The number of messages fed.
+    """
+    count = 0
+    async for message in source:
+        for handler in handlers:
+            handler(message)
+        count += 1
+    return count
@@ -0,0 +1,162 @@
+"""Per-symbol numpy ring buffers of realtime trade ticks.
+
+Each symbol keeps a fixed-capacity struct-of-arrays ring (``ts``, ``price``,
+``volume``, ``side``). Every column is allocated at twice the capacity and
+each tick is written at ``i`` and ``i + capacity``, so the most recent ``n``
+ticks are always one contiguous slice: ``last(n)`` returns numpy views, never
+copies, at the cost of a second store per append.
+
+Views alias the ring: they stay valid for ``capacity - n`` further appends of
+that symbol. Copy them (``np.array(view)``) to keep them longer.
+
+Tick times are exchange wall clock (KST) in ns on the current KST session
+day, which rolls over at KST midnight (``mm_xing.session_clock``).
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Optional
+
+import numpy as np
+
+from mm_xing.constant import XING_TICK_RING_CAPACITY
+from mm_xing.session_clock import SessionClock
+
+# Trade TR -> OutBlock fields holding (time HHMMSS, price, traded volume, side '+'/'-')
+TRADE_FIELDS = {
+    "FC0": ("chetime", "price", "cvolume", "cgubun"),
+    "OC0": ("chetime", "price", "cvolume", "cgubun"),
+    "JC0": ("chetime", "price", "cvolume", "cgubun"),
+    "EC0": ("chetime", "price", "cvolume", "cgubun"),
+    "OVC": ("kortm", "curpr", "trdq", "cgubun"),
+}
+
+SIDES = {"+": 1, "-": -1}
+
+NS_PER_SEC = 1_000_000_000
+
+
+@dataclass(eq=False)
+class Ticks:
+    """Column views of a window of ticks, oldest first."""
+    ts: np.ndarray      # int64 ns since epoch (exchange wall clock)
+    price: np.ndarray   # float64
+    volume: np.ndarray  # int64
+    side: np.ndarray    # int8: 1 buy, -1 sell, 0 unknown
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def datetimes(self) -> np.ndarray:
+        return self.ts.view("datetime64[ns]")
+
+
+class TickRing:
+    """Fixed-capacity ring of one symbol's ticks with O(1) append."""
+
+    __slots__ = ("capacity", "count", "_ts", "_price", "_volume", "_side")
+
+    def __init__(self, capacity: int = XING_TICK_RING_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.count = 0  # ticks appended so far, including overwritten ones
+        self._ts = np.zeros(2 * capacity, np.int64)
+        self._price = np.zeros(2 * capacity, np.float64)
+        self._volume = np.zeros(2 * capacity, np.int64)
+        self._side = np.zeros(2 * capacity, np.int8)
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, ts: int, price: float, volume: int, side: int = 0) -> None:
+        i = self.count % self.capacity
+        j = i + self.capacity
+        self._ts[i] = self._ts[j] = ts
+        self._price[i] = self._price[j] = price
+        self._volume[i] = self._volume[j] = volume
+        self._side[i] = self._side[j] = side
+        self.count += 1
+
+    def extend(self, ts: np.ndarray, price: np.ndarray, volume: np.ndarray, side: Optional[np.ndarray] = None) -> None:
+        """Append a batch of ticks (e.g. a replayed log) with vectorized writes."""
+        n = len(ts)
+        side = np.zeros(n, np.int8) if side is None else side
+        if n > self.capacity:  # only the newest ``capacity`` survive anyway
+            self.count += n - self.capacity
+            ts, price, volume, side = ts[-self.capacity:], price[-self.capacity:], volume[-self.capacity:], side[-self.capacity:]
+            n = self.capacity
+        start = self.count % self.capacity
+        first = min(n, self.capacity - start)
+        for column, values in ((self._ts, ts), (self._price, price), (self._volume, volume), (self._side, side)):
+            for offset in (0, self.capacity):
+                column[offset + start:offset + start + first] = values[:first]
+                column[offset:offset + n - first] = values[first:]
+        self.count += n
+
+    def last(self, n: Optional[int] = None) -> Ticks:
+        """The newest ``n`` ticks (all retained ticks by default) as zero-copy views."""
+        n = len(self) if n is None else min(n, len(self))
+        end = self.count % self.capacity + self.capacity
+        if self.count < self.capacity:
+            end = self.count
+        window = slice(end - n, end)
+        return Ticks(self._ts[window], self._price[window], self._volume[window], self._side[window])
+
+
+class TickStore:
+    """Tick rings keyed by symbol, fed from realtime trade messages.
+
+    Example:
+        >>> store = TickStore()
+        >>> async for message in client:  # XingRealtimeClient
+        ...     store.append_message(message)
+        >>> store.last("101V3000", 500).price.mean()
+
+    Args:
+        capacity: Ticks kept per symbol
+        session_date: Day the feed's ``HHMMSS`` times belong to (default: the
+            current KST day, rolling over at KST midnight)
+    """
+
+    def __init__(self, capacity: int = XING_TICK_RING_CAPACITY, session_date: Optional[date] = None):
+        self.capacity = capacity
+        self.rings: Dict[str, TickRing] = {}
+        self.clock = SessionClock(session_date)
+
+    def ring(self, symbol: str) -> TickRing:
+        ring = self.rings.get(symbol)
+        if ring is None:
+            ring = self.rings[symbol] = TickRing(self.capacity)
+        return ring
+
+    def session_ts(self, hhmmss: str) -> int:
+        """``HHMMSS`` of the session day as ns since epoch (exchange wall clock)."""
+        return self.clock.ts(hhmmss) * NS_PER_SEC
+
+    def append(self, symbol: str, ts: int, price: float, volume: int, side: int = 0) -> None:
+        self.ring(symbol).append(ts, price, volume, side)
+
+    def append_message(self, message) -> bool:
+        """Append a trade ``RealtimeMessage``; returns False for TRs that are not trades."""
+        fields = TRADE_FIELDS.get(message.tr_code)
+        if fields is None:
+            return False
+        body = message.body
+        time_field, price_field, volume_field, side_field = fields
+        self.ring(message.tr_key).append(
+            self.session_ts(getattr(body, time_field)),
+            getattr(body, price_field),
+            getattr(body, volume_field),
+            SIDES.get(getattr(body, side_field), 0),
+        )
+        return True
+
+    def last(self, symbol: str, n: Optional[int] = None) -> Ticks:
+        return self.ring(symbol).last(n)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.rings
+
+    def __len__(self) -> int:
+        return len(self.rings)
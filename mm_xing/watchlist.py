@@ -0,0 +1,236 @@
+"""Watchlist quotes polled with t8407 (API용주식멀티현재가조회) into a columnar snapshot.
+
+t8407 quotes up to ``XING_T8407_MAX_SYMBOLS`` (50) codes per call, so
+``WatchlistPoller`` packs the watchlist into full batches and each refresh
+round issues all of them at once: the credential pool's rate limiters pace
+the calls (2/s per app key) and spread them over the app keys, so a
+1,000-symbol watchlist is 20 calls a round, ~10 s on one app key and ~2.5 s
+on four, instead of a call per symbol. A round starts every ``interval_sec``,
+or right after the previous one when that took longer.
+
+Responses are decoded into columns (COLUMNAR_DECODER) and land in a
+``QuoteSnapshot``: one numpy array per t8407 column, indexed by the symbol's
+position in the watchlist, with each symbol's last received
+time (``updated_at``) and the round its quote last changed in (``changed_in``).
+Changes are found by comparing every column of a batch with ``!=`` before
+writing it, so a round reports exactly the symbols whose quote moved. A batch
+that fails keeps its previous quotes; ``updated_at`` tells how old they are.
+
+    >>> poller = WatchlistPoller(client, headers, shcodes)
+    >>> async for changed in poller.rounds():
+    ...     publish(poller.snapshot.quotes(changed))
+"""
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import numpy as np
+from httpx import AsyncClient
+
+from mm_xing.block import t8407InBlock
+from mm_xing.columnar import OutBlockColumns
+from mm_xing.constant import (COLUMNAR_DECODER, PRIORITY_BATCH, T8407,
+                              XING_T8407_MAX_SYMBOLS,
+                              XING_WATCHLIST_INTERVAL_SEC)
+from mm_xing.credential_pool import XingCredentialPool
+from mm_xing.rate_limit import XingRateLimiter
+from mm_xing.schemas import XingTrHeaders
+from mm_xing.tasks.master import fetch_market_data, get_tr_config
+
+logger = logging.getLogger(__name__)
+
+# t8407OutBlock1 columns kept per symbol (all but shcode/hname) and their dtypes
+QUOTE_COLUMNS = {
+    "price": np.int32,
+    "sign": "S1",
+    "change": np.int32,
+    "diff": np.float64,
+    "volume": np.int64,
+    "offerho": np.int32,
+    "bidho": np.int32,
+    "cvolume": np.int32,
+    "chdegree": np.float64,
+    "open": np.int32,
+    "high": np.int32,
+    "low": np.int32,
+    "value": np.int64,
+    "offerrem": np.int64,
+    "bidrem": np.int64,
+    "totofferrem": np.int64,
+    "totbidrem": np.int64,
+    "jnilclose": np.int32,
+    "uplmtprice": np.int32,
+    "dnlmtprice": np.int32,
+}
+
+
+class QuoteSnapshot:
+    """Latest t8407 quote of every watched symbol, one array per column.
+
+    ``round`` is the refresh round being written; it starts at 1, so a
+    ``changed_in`` of 0 means the symbol was never quoted.
+    """
+
+    def __init__(self, shcodes: Sequence[str]):
+        self.shcodes: List[str] = list(dict.fromkeys(shcodes))
+        self.index: Dict[str, int] = {shcode: i for i, shcode in enumerate(self.shcodes)}
+        self.hname: List[str] = [""] * len(self.shcodes)
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.zeros(len(self.shcodes), dtype) for name, dtype in QUOTE_COLUMNS.items()
+        }
+        self.changed_in = np.zeros(len(self.shcodes), np.int64)
+        self.updated_at = np.zeros(len(self.shcodes), np.float64)  # epoch seconds; 0: never quoted
+        self.round = 1
+
+    def __len__(self) -> int:
+        return len(self.shcodes)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values()) + self.changed_in.nbytes + self.updated_at.nbytes
+
+    def positions(self, shcodes: Sequence[str]) -> np.ndarray:
+        """Positions of ``shcodes``; -1 for codes not watched."""
+        return np.fromiter((self.index.get(shcode, -1) for shcode in shcodes), np.int64, len(shcodes))
+
+    def update(self, quotes: OutBlockColumns, received_at: Optional[float] = None) -> np.ndarray:
+        """Write one t8407 response and return the positions whose quote changed.
+
+        A symbol's first quote counts as a change; codes not watched are ignored.
+        """
+        if not len(quotes):
+            return np.empty(0, np.int64)
+        positions = self.positions(quotes["shcode"])
+        watched = positions >= 0
+        every = bool(watched.all())
+        hnames = quotes["hname"]
+        if not every:
+            positions = positions[watched]
+            hnames = [hname for hname, keep in zip(hnames, watched) if keep]
+        changed = self.changed_in[positions] == 0
+        for i in np.flatnonzero(changed):
+            self.hname[positions[i]] = hnames[i]
+        for name, column in self.columns.items():
+            values = np.asarray(quotes[name], column.dtype)
+            if not every:
+                values = values[watched]
+            changed |= column[positions] != values
+            column[positions] = values
+        self.updated_at[positions] = time.time() if received_at is None else received_at
+        moved = positions[changed]
+        self.changed_in[moved] = self.round
+        return moved
+
+    def changed_since(self, since: int) -> np.ndarray:
+        """Positions whose quote changed after round ``since`` (e.g. the last one a consumer saw)."""
+        return np.flatnonzero(self.changed_in > since)
+
+    def quotes(self, positions: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Columns of the symbols at ``positions`` (every symbol by default)."""
+        if positions is None:
+            positions = np.arange(len(self.shcodes))
+        return {
+            "shcode": [self.shcodes[i] for i in positions],
+            "hname": [self.hname[i] for i in positions],
+            **{name: column[positions] for name, column in self.columns.items()},
+            "updated_at": self.updated_at[positions],
+        }
+
+    def to_pandas(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.quotes(), copy=False).set_index("shcode")
+
+
+class WatchlistPoller:
+    """Refreshes a ``QuoteSnapshot`` of ``shcodes`` round after round (see the module docstring).
+
+    Args:
+        client, headers: As for ``fetch_market_data``
+        shcodes: Watched codes; duplicates are dropped
+        pool: Credential pool the calls are spread over; the shared one by default
+        rate_limiter: A single rate limiter to use instead of a pool
+        interval_sec: Time between round starts
+        batch_size: Codes per t8407 call, at most ``XING_T8407_MAX_SYMBOLS``
+        priority: Rate-limit priority; batch by default, so interactive calls go first
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        headers: XingTrHeaders,
+        shcodes: Sequence[str],
+        pool: Optional[XingCredentialPool] = None,
+        rate_limiter: Optional[XingRateLimiter] = None,
+        interval_sec: float = XING_WATCHLIST_INTERVAL_SEC,
+        batch_size: int = XING_T8407_MAX_SYMBOLS,
+        priority: int = PRIORITY_BATCH,
+    ):
+        if not 0 < batch_size <= XING_T8407_MAX_SYMBOLS:
+            raise ValueError(f"batch_size must be between 1 and {XING_T8407_MAX_SYMBOLS}")
+        self.client = client
+        self.headers = headers
+        self.pool = pool
+        self.rate_limiter = rate_limiter
+        self.interval_sec = interval_sec
+        self.priority = priority
+        self.snapshot = QuoteSnapshot(shcodes)
+        codes = self.snapshot.shcodes
+        self.configs = [
+            get_tr_config(
+                T8407,
+                t8407InBlock(nrec=len(batch), shcode="".join(batch)),
+                decoder=COLUMNAR_DECODER,
+            )
+            for batch in (codes[i:i + batch_size] for i in range(0, len(codes), batch_size))
+        ]
+        self.failures = 0  # batches that failed, over all rounds
+        self.last_round_sec = 0.0
+
+    async def _refresh(self, config) -> np.ndarray:
+        # Quotes must be current: bypass the response cache, but still share calls in flight.
+        quotes = await fetch_market_data(
+            self.client, self.headers, config, self.priority,
+            rate_limiter=self.rate_limiter, pool=self.pool, cache=False,
+        )
+        return self.snapshot.update(quotes)
+
+    async def poll(self) -> np.ndarray:
+        """Run one round, every batch at once, and return the positions whose quote changed."""
+        start = time.perf_counter()
+        results = await asyncio.gather(*(self._refresh(config) for config in self.configs), return_exceptions=True)
+        changed = []
+        for config, result in zip(self.configs, results):
+            if isinstance(result, Exception):
+                self.failures += 1
+                logger.warning("t8407 batch of %d codes failed, keeping its quotes: %r", config.inblock.nrec, result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                changed.append(result)
+        self.snapshot.round += 1
+        self.last_round_sec = time.perf_counter() - start
+        return np.concatenate(changed) if changed else np.empty(0, np.int64)
+
+    async def rounds(self, max_rounds: Optional[int] = None) -> AsyncIterator[np.ndarray]:
+        """Yield the changed positions of every round, starting one every ``interval_sec``.
+
+        A round that overruns the interval is followed at once by the next;
+        missed starts are not made up with a burst.
+        """
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+        done = 0
+        while max_rounds is None or done < max_rounds:
+            yield await self.poll()
+            done += 1
+            next_start += self.interval_sec
+            delay = next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_start = loop.time()